@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Benchmark client domain methods end to end against a local stub server.
+"""
+
+import asyncio
+import copy
+import json
+import statistics
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Annotated
+
+import typer
+from gpp_client import GPPClient
+from gpp_client.cli import output
+from gpp_client.generated import GetGOATSObservations, SchedulerObservationsUpdates
+from gpp_client.testing import StubGPPServer, build_payload, generate_catalog
+
+BASELINE_PATH = Path(__file__).resolve().parent / "benchmark_client_baseline.json"
+
+app = typer.Typer(
+    help="Benchmark client domain methods against a local stub GPP server.",
+    add_completion=False,
+)
+
+Scenario = Callable[[StubGPPServer, GPPClient, Path, float], Callable[[], Awaitable]]
+
+
+def _scaled(count: int, scale: float) -> int:
+    """
+    Scale a dataset size, keeping at least one item.
+    """
+    return max(1, round(count * scale))
+
+
+def _scheduler_get_all(
+    server: StubGPPServer, client: GPPClient, tmp: Path, scale: float
+) -> Callable[[], Awaitable]:
+    """
+    A synthetic catalog of programs with nested groups, as ``get_all`` consumes it.
+    """
+    catalog = generate_catalog(programs=_scaled(10, scale), observations_per_program=50)
+    catalog.serve(server)
+    return client.scheduler.get_all
+
+
+def _goats_observations(
+    server: StubGPPServer, client: GPPClient, tmp: Path, scale: float
+) -> Callable[[], Awaitable]:
+    """
+    One program with many observations, as fetched by GOATS.
+    """
+    payload = build_payload(GetGOATSObservations)
+    observation = payload["observations"]["matches"][0]
+    payload["observations"]["matches"] = [
+        {**copy.deepcopy(observation), "id": f"o-{index}"}
+        for index in range(_scaled(500, scale))
+    ]
+    server.graphql["GetGOATSObservations"] = payload
+
+    async def run() -> None:
+        await client.goats.get_observations_by_program_id(program_id="p-1")
+
+    return run
+
+
+def _attachment_download(
+    server: StubGPPServer, client: GPPClient, tmp: Path, scale: float
+) -> Callable[[], Awaitable]:
+    """
+    Several attachments downloaded in parallel.
+    """
+    body = bytes(range(256)) * 1024
+    attachment_ids = []
+    for index in range(_scaled(16, scale)):
+        attachment_id = f"a-{index}"
+        server.attachments[attachment_id] = (f"file-{index}.fits", body)
+        attachment_ids.append(attachment_id)
+
+    async def run() -> None:
+        results = await client.attachment.download_many(
+            attachment_ids, save_to=tmp, overwrite=True
+        )
+        failed = [result for result in results if not result.ok]
+        if failed:
+            raise RuntimeError(f"Downloads failed: {failed}")
+
+    return run
+
+
+def _visibility_changes(
+    server: StubGPPServer, client: GPPClient, tmp: Path, scale: float
+) -> Callable[[], Awaitable]:
+    """
+    A large ``/scheduler/visibility-changes`` response.
+    """
+    server.visibility_changes = "\n".join(
+        f"o-{index}\t2026-01-01T00:00:{index % 60:02d}Z"
+        for index in range(_scaled(10_000, scale))
+    )
+    since = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    async def run() -> None:
+        await client.scheduler.get_visibility_changes(since)
+
+    return run
+
+
+def _subscription(
+    server: StubGPPServer, client: GPPClient, tmp: Path, scale: float
+) -> Callable[[], Awaitable]:
+    """
+    A stream of calculation updates consumed to completion.
+    """
+    event = build_payload(SchedulerObservationsUpdates)
+    server.subscriptions["SchedulerObservationsUpdates"] = [
+        event for _ in range(_scaled(1_000, scale))
+    ]
+
+    async def run() -> None:
+        async for _ in client.scheduler.subscribe_to_calculation_updates():
+            pass
+
+    return run
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "scheduler_get_all": _scheduler_get_all,
+    "goats_observations": _goats_observations,
+    "attachment_download": _attachment_download,
+    "visibility_changes": _visibility_changes,
+    "subscription": _subscription,
+}
+
+
+async def _measure(
+    name: str, scale: float, latency: float, repeat: int
+) -> dict[str, float]:
+    """
+    Time one scenario against a fresh server and client.
+    """
+    async with StubGPPServer(latency=latency) as server:
+        async with GPPClient(token="stub", base_url=server.base_url) as client:
+            with tempfile.TemporaryDirectory() as tmp:
+                run = SCENARIOS[name](server, client, Path(tmp), scale)
+                # The first run opens connections and warms the caches.
+                await run()
+                timings = []
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    await run()
+                    timings.append(time.perf_counter() - start)
+    return {
+        "median_s": round(statistics.median(timings), 4),
+        "min_s": round(min(timings), 4),
+    }
+
+
+def benchmark(
+    scenarios: list[str] | None = None,
+    *,
+    scale: float = 1.0,
+    latency: float = 0.0,
+    repeat: int = 5,
+) -> dict[str, dict[str, float]]:
+    """
+    Time client domain methods end to end against a stub server.
+
+    Parameters
+    ----------
+    scenarios : list[str] | None, optional
+        Scenarios to run. Defaults to all of :data:`SCENARIOS`.
+    scale : float, default=1.0
+        Multiplier for the dataset sizes.
+    latency : float, default=0.0
+        Seconds the stub server delays every response.
+    repeat : int, default=5
+        Timed runs per scenario, after one warm-up run.
+
+    Returns
+    -------
+    dict[str, dict[str, float]]
+        Median and fastest run time per scenario, in seconds.
+    """
+    return {
+        name: asyncio.run(_measure(name, scale, latency, repeat))
+        for name in scenarios or SCENARIOS
+    }
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float,
+) -> dict[str, float]:
+    """
+    Find scenarios whose median time regressed beyond the tolerance.
+
+    Parameters
+    ----------
+    results : dict[str, dict[str, float]]
+        Fresh results from :func:`benchmark`.
+    baseline : dict[str, dict[str, float]]
+        Stored results to compare against.
+    tolerance : float
+        Allowed slowdown as a fraction, e.g. ``0.25`` for 25%.
+
+    Returns
+    -------
+    dict[str, float]
+        Slowdown factor of each regressed scenario.
+    """
+    regressions = {}
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        expected = baseline[name]["median_s"]
+        if expected and result["median_s"] > expected * (1 + tolerance):
+            regressions[name] = round(result["median_s"] / expected, 2)
+    return regressions
+
+
+@app.command()
+def main(
+    scenario: Annotated[
+        list[str] | None,
+        typer.Option(help=f"Scenario to run: {', '.join(SCENARIOS)}. Repeatable."),
+    ] = None,
+    scale: Annotated[
+        float, typer.Option(help="Multiplier for dataset sizes.", min=0)
+    ] = 1.0,
+    latency: Annotated[
+        float, typer.Option(help="Seconds of delay per response.", min=0)
+    ] = 0.0,
+    repeat: Annotated[int, typer.Option(help="Timed runs per scenario.", min=1)] = 5,
+    baseline: Annotated[
+        Path, typer.Option(help="Stored baseline file.")
+    ] = BASELINE_PATH,
+    save_baseline: Annotated[
+        bool, typer.Option(help="Store the results as the new baseline.")
+    ] = False,
+    tolerance: Annotated[
+        float, typer.Option(help="Allowed slowdown against the baseline.", min=0)
+    ] = 0.25,
+) -> None:
+    """
+    Run the scenarios and compare them with the stored baseline.
+    """
+    unknown = set(scenario or ()) - set(SCENARIOS)
+    if unknown:
+        output.fail(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+        raise typer.Exit(code=2)
+
+    results = benchmark(scenario, scale=scale, latency=latency, repeat=repeat)
+    output.json(results)
+
+    settings = {"scale": scale, "latency": latency}
+    if save_baseline:
+        stored = {**settings, "results": results}
+        baseline.write_text(json.dumps(stored, indent=2) + "\n")
+        output.success(f"Baseline saved to {baseline}")
+        return
+    if not baseline.is_file():
+        output.warning(f"No baseline at {baseline}; nothing to compare.")
+        return
+
+    stored = json.loads(baseline.read_text())
+    if {key: stored.get(key) for key in settings} != settings:
+        output.warning(
+            "The baseline was recorded with different settings; nothing to compare."
+        )
+        return
+    regressions = compare(results, stored["results"], tolerance)
+    if regressions:
+        output.fail(f"Slower than the baseline: {regressions}")
+        raise typer.Exit(code=1)
+    output.success("No regressions against the baseline.")
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Benchmark the client's pure-Python hot paths at growing input sizes.
+"""
+
+import copy
+import gc
+import json
+import math
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Annotated, Any
+
+import httpx
+import typer
+from gpp_client.cli import output
+from gpp_client.domains.scheduler import SchedulerDomain
+from gpp_client.generated import (
+    GetGOATSObservations,
+    GetObservations,
+    GraphQLClient,
+    WhereObservation,
+    WhereOrderObservationId,
+)
+from gpp_client.rest.models import parse_visibility_changes
+from gpp_client.testing import build_payload
+
+THRESHOLDS_PATH = (
+    Path(__file__).resolve().parent / "benchmark_hot_paths_thresholds.json"
+)
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+app = typer.Typer(
+    help="Benchmark the client's pure-Python hot paths.",
+    add_completion=False,
+)
+
+# A benchmark builds inputs of a given size and returns a function preparing the
+# call to time; the preparation, e.g. copying inputs the call mutates, is untimed.
+Benchmark = Callable[[int], Callable[[], Callable[[], Any]]]
+
+
+def _visibility_changes(size: int) -> Callable[[], Callable[[], Any]]:
+    """
+    ``parse_visibility_changes`` on a body of ``size`` lines.
+    """
+    body = "\n".join(
+        f"{'o' if index % 4 else 't'}-{index:x}\t2026-01-01T00:{index % 60:02d}:00Z"
+        for index in range(size)
+    )
+    return lambda: lambda: parse_visibility_changes(body)
+
+
+def _atom_digest(size: int) -> Callable[[], Callable[[], Any]]:
+    """
+    ``SchedulerDomain._parse_atom_digest`` on ``size`` rows.
+    """
+    rows = [
+        f"o-{index // 5:x}\t{index % 5}\ta-{index:x}\tSCIENCE\t60\tSCIENCE\tNONE\t0\t1"
+        for index in range(size)
+    ]
+    return lambda: lambda: SchedulerDomain._parse_atom_digest(rows)
+
+
+def _flat_programs(size: int) -> list[dict[str, Any]]:
+    """
+    Dumped programs holding ``size`` observations in groups nested two deep.
+    """
+    programs = []
+    per_program, per_group = 100, 10
+    for program_index in range(max(1, size // per_program)):
+        elements = []
+        for group_index in range(per_program // per_group):
+            outer = f"g-{program_index}-{group_index}"
+            inner = f"{outer}-inner"
+            elements.append(
+                {"parent_group_id": None, "group": {"id": outer}, "observation": None}
+            )
+            elements.append(
+                {"parent_group_id": outer, "group": {"id": inner}, "observation": None}
+            )
+            for obs_index in range(per_group):
+                obs_id = f"o-{program_index}-{group_index}-{obs_index}"
+                elements.append(
+                    {
+                        "parent_group_id": inner,
+                        "group": None,
+                        "observation": {"id": obs_id},
+                    }
+                )
+        programs.append({"id": f"p-{program_index}", "all_group_elements": elements})
+    return programs
+
+
+def _group_trees(size: int) -> Callable[[], Callable[[], Any]]:
+    """
+    The tree assembly of ``SchedulerDomain.get_all`` for ``size`` observations.
+    """
+    programs = _flat_programs(size)
+
+    def prepare() -> Callable[[], Any]:
+        fresh = copy.deepcopy(programs)
+        return lambda: SchedulerDomain._build_group_trees(fresh)
+
+    return prepare
+
+
+def _traverse(size: int) -> Callable[[], Callable[[], Any]]:
+    """
+    ``SchedulerDomain._traverse_for_observation`` over ``size`` observations.
+
+    One observation in ten is missing from the ODB response and is trimmed.
+    """
+    programs = _flat_programs(size)
+    observations = SchedulerDomain._build_group_trees(programs)
+    obs_map = {
+        obs_id: {"id": obs_id}
+        for index, obs_id in enumerate(observations)
+        if index % 10
+    }
+    obs_sequence = {obs_id: [] for obs_id in obs_map}
+    domain = object.__new__(SchedulerDomain)
+
+    def prepare() -> Callable[[], Any]:
+        fresh = copy.deepcopy(programs)
+        fresh_map = copy.deepcopy(obs_map)
+
+        def run() -> None:
+            for program in fresh:
+                domain._traverse_for_observation(
+                    program["root"], fresh_map, obs_sequence
+                )
+
+        return run
+
+    return prepare
+
+
+def _variables(size: int) -> Callable[[], Callable[[], Any]]:
+    """
+    Variable serialization of a ``getObservations`` call filtering ``size`` IDs.
+    """
+    client = GraphQLClient(url="http://localhost/odb")
+    variables = {
+        "WHERE": WhereObservation(
+            id=WhereOrderObservationId(in_=[f"o-{index:x}" for index in range(size)])
+        ),
+        "includeDeleted": False,
+    }
+
+    def run() -> None:
+        serializable = client._convert_dict_to_json_serializable(variables)
+        client._get_files_from_variables(serializable)
+
+    return lambda: run
+
+
+def _observations_payload(model: Any, size: int) -> dict[str, Any]:
+    """
+    A ``model`` response payload with ``size`` minimal observations.
+    """
+    payload = build_payload(model, fill_optional=False, list_size=0)
+    match = build_payload(model, fill_optional=False)["observations"]["matches"][0]
+    payload["observations"]["matches"] = [
+        {**match, "id": f"o-{index:x}"} for index in range(size)
+    ]
+    return payload
+
+
+def _validate(model: Any, size: int) -> Callable[[], Callable[[], Any]]:
+    """
+    ``model_validate`` of a response with ``size`` minimal observations.
+    """
+    payload = _observations_payload(model, size)
+    return lambda: lambda: model.model_validate(payload)
+
+
+def _decode(model: Any, size: int, backend: str) -> Callable[[], Callable[[], Any]]:
+    """
+    Decoding a response body with ``size`` minimal observations into results.
+
+    Both backends decode the same bytes the way their clients do: the Pydantic
+    client parses the JSON and validates the data, the msgspec client decodes
+    straight into structs. The msgspec backend needs the optional msgspec.
+    """
+    content = json.dumps({"data": _observations_payload(model, size)}).encode()
+    response = httpx.Response(200, content=content)
+    if backend == "msgspec":
+        from gpp_client.generated import structs
+
+        struct = getattr(structs, model.__name__)
+        client = structs.StructGraphQLClient(url="http://localhost/odb")
+        return lambda: lambda: client.get_struct(response, struct)
+
+    client = GraphQLClient(url="http://localhost/odb")
+    return lambda: lambda: model.model_validate(client.get_data(response))
+
+
+BENCHMARKS: dict[str, Benchmark] = {
+    "parse_visibility_changes": _visibility_changes,
+    "parse_atom_digest": _atom_digest,
+    "build_group_trees": _group_trees,
+    "traverse_for_observation": _traverse,
+    "serialize_variables": _variables,
+    "validate_get_observations": lambda size: _validate(GetObservations, size),
+    "validate_goats_observations": lambda size: _validate(GetGOATSObservations, size),
+    "decode_get_observations_pydantic": lambda size: _decode(
+        GetObservations, size, "pydantic"
+    ),
+    "decode_get_observations_msgspec": lambda size: _decode(
+        GetObservations, size, "msgspec"
+    ),
+    "decode_goats_observations_pydantic": lambda size: _decode(
+        GetGOATSObservations, size, "pydantic"
+    ),
+    "decode_goats_observations_msgspec": lambda size: _decode(
+        GetGOATSObservations, size, "msgspec"
+    ),
+}
+
+
+def _best_time(prepare: Callable[[], Callable[[], Any]], repeat: int) -> float:
+    """
+    Return the fastest of ``repeat`` timed calls, in seconds.
+
+    Like ``timeit``, garbage collection is disabled while a call is timed.
+    """
+    timings = []
+    for _ in range(repeat):
+        call = prepare()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            call()
+            timings.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return min(timings)
+
+
+def benchmark(
+    names: list[str] | None = None,
+    *,
+    sizes: tuple[int, ...] = DEFAULT_SIZES,
+    repeat: int = 3,
+) -> dict[str, dict[str, Any]]:
+    """
+    Time each hot path at every input size.
+
+    Parameters
+    ----------
+    names : list[str] | None, optional
+        Benchmarks to run. Defaults to all of :data:`BENCHMARKS`.
+    sizes : tuple[int, ...], default=(1000, 10000, 100000)
+        Input sizes, in items.
+    repeat : int, default=3
+        Timed calls per size; the fastest is kept.
+
+    Returns
+    -------
+    dict[str, dict[str, Any]]
+        Per benchmark, the seconds per size, the microseconds per item at the
+        largest size and the growth exponent between the smallest and largest
+        size. An exponent of 1 means linear scaling.
+    """
+    sizes = tuple(sorted(sizes))
+    results = {}
+    for name in names or BENCHMARKS:
+        seconds = {}
+        for size in sizes:
+            prepare = BENCHMARKS[name](size)
+            # Warm caches, e.g. pydantic's first-use setup, outside the timing.
+            prepare()()
+            seconds[size] = _best_time(prepare, repeat)
+        small, large = sizes[0], sizes[-1]
+        exponent = 1.0
+        if large > small and seconds[small] > 0:
+            exponent = math.log(seconds[large] / seconds[small]) / math.log(
+                large / small
+            )
+        results[name] = {
+            "seconds": {str(size): round(seconds[size], 6) for size in sizes},
+            "us_per_item": round(seconds[large] / large * 1e6, 3),
+            "exponent": round(exponent, 2),
+        }
+    return results
+
+
+def check(
+    results: dict[str, dict[str, Any]], thresholds: dict[str, dict[str, float]]
+) -> list[str]:
+    """
+    List the benchmarks that exceed their checked-in thresholds.
+
+    Parameters
+    ----------
+    results : dict[str, dict[str, Any]]
+        Results from :func:`benchmark`.
+    thresholds : dict[str, dict[str, float]]
+        ``max_exponent`` and ``max_us_per_item`` per benchmark.
+
+    Returns
+    -------
+    list[str]
+        One message per exceeded threshold.
+    """
+    failures = []
+    for name, result in results.items():
+        limits = thresholds.get(name, {})
+        if result["exponent"] > limits.get("max_exponent", math.inf):
+            failures.append(
+                f"{name}: scales with exponent {result['exponent']}"
+                f" (max {limits['max_exponent']})"
+            )
+        if result["us_per_item"] > limits.get("max_us_per_item", math.inf):
+            failures.append(
+                f"{name}: {result['us_per_item']} us per item"
+                f" (max {limits['max_us_per_item']})"
+            )
+    return failures
+
+
+@app.command()
+def main(
+    name: Annotated[
+        list[str] | None,
+        typer.Option(help=f"Benchmark to run: {', '.join(BENCHMARKS)}. Repeatable."),
+    ] = None,
+    size: Annotated[
+        list[int] | None,
+        typer.Option(help="Input size in items. Repeatable.", min=1),
+    ] = None,
+    repeat: Annotated[int, typer.Option(help="Timed calls per size.", min=1)] = 3,
+    thresholds: Annotated[
+        Path, typer.Option(help="Checked-in thresholds file.")
+    ] = THRESHOLDS_PATH,
+) -> None:
+    """
+    Time the hot paths and check them against the thresholds.
+    """
+    unknown = set(name or ()) - set(BENCHMARKS)
+    if unknown:
+        output.fail(f"Unknown benchmarks: {', '.join(sorted(unknown))}")
+        raise typer.Exit(code=2)
+
+    results = benchmark(name, sizes=tuple(size or DEFAULT_SIZES), repeat=repeat)
+    output.json(results)
+
+    failures = check(results, json.loads(thresholds.read_text()))
+    if failures:
+        for failure in failures:
+            output.fail(failure)
+        raise typer.Exit(code=1)
+    output.success("All hot paths are within their thresholds.")
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark the site status HTML parsers on recorded pages.
+"""
+
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+from typing import Annotated, Any
+
+import typer
+from gpp_client.cli import output
+from gpp_client.domains import site_status
+
+PAGES_DIR = Path(__file__).resolve().parent.parent / "tests" / "data" / "site_status"
+
+# Recorded page -> (targeted scanner, BeautifulSoup fallback).
+PARSERS: dict[str, tuple[Callable[[str], Any], Callable[[str], Any]]] = {
+    "north_status.html": (
+        site_status._parse_gemini_north_webpage,
+        site_status._soup_parse_gemini_north_webpage,
+    ),
+    "gmos_config.html": (
+        site_status._parse_gmos_config_page,
+        site_status._soup_parse_gmos_config_page,
+    ),
+}
+
+app = typer.Typer(
+    help="Benchmark the site status HTML parsers.",
+    add_completion=False,
+)
+
+
+def _time_per_call(parser: Callable[[str], Any], html: str, number: int) -> float:
+    """
+    Return the best mean time of one parser call, in microseconds.
+
+    Parameters
+    ----------
+    parser : Callable[[str], Any]
+        Parser to time.
+    html : str
+        Page to parse.
+    number : int
+        Calls per timing run.
+
+    Returns
+    -------
+    float
+        Best mean call time over five runs, in microseconds.
+    """
+    runs = timeit.repeat(lambda: parser(html), number=number, repeat=5)
+    return min(runs) / number * 1e6
+
+
+def benchmark(pages_dir: Path = PAGES_DIR, number: int = 200) -> dict[str, Any]:
+    """
+    Time both parsers on every recorded page and check that they agree.
+
+    Parameters
+    ----------
+    pages_dir : Path, default=PAGES_DIR
+        Directory holding the recorded pages.
+    number : int, default=200
+        Calls per timing run.
+
+    Returns
+    -------
+    dict[str, Any]
+        Per page: scanner and BeautifulSoup times in microseconds, the speedup,
+        and whether both parsers returned the same result.
+    """
+    results: dict[str, Any] = {}
+    for name, (fast, soup) in PARSERS.items():
+        html = (pages_dir / name).read_text(encoding="utf-8")
+        fast_us = _time_per_call(fast, html, number)
+        soup_us = _time_per_call(soup, html, number)
+        results[name] = {
+            "scanner_us": round(fast_us, 1),
+            "soup_us": round(soup_us, 1),
+            "speedup": round(soup_us / fast_us, 2),
+            "same_result": fast(html) == soup(html),
+        }
+    return results
+
+
+@app.command()
+def main(
+    number: Annotated[
+        int,
+        typer.Option(help="Calls per timing run.", min=1),
+    ] = 200,
+) -> None:
+    """
+    Compare the targeted scanner with BeautifulSoup on the recorded pages.
+    """
+    output.info(f"BeautifulSoup features: {site_status._SOUP_FEATURES}")
+    results = benchmark(number=number)
+    output.json(results)
+
+    if not all(result["same_result"] for result in results.values()):
+        output.fail("Parsers disagree on at least one recorded page.")
+        raise typer.Exit(code=1)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Benchmark event loop latency while attachment files are written and checked.
+"""
+
+import asyncio
+import contextlib
+import tempfile
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from functools import partial
+from pathlib import Path
+from typing import Annotated, Any
+
+import typer
+from gpp_client.cli import output
+from gpp_client.domains.base import BaseDomain
+from gpp_client.rest.transfer import AsyncFileWriter
+
+app = typer.Typer(
+    help="Benchmark event loop latency during attachment file I/O.",
+    add_completion=False,
+)
+
+
+class _SlowFile:
+    """
+    File wrapper that sleeps on every write, like a slow network filesystem.
+    """
+
+    def __init__(self, fh: Any, latency: float) -> None:
+        self._fh = fh
+        self._latency = latency
+
+    def write(self, data: bytes) -> int:
+        time.sleep(self._latency)
+        return self._fh.write(data)
+
+    def close(self) -> None:
+        self._fh.close()
+
+
+@contextlib.contextmanager
+def _slow_stat(latency: float) -> Iterator[None]:
+    """
+    Delay every ``Path.stat``, like metadata lookups on a slow network filesystem.
+
+    ``exists``, ``is_file`` and ``is_dir`` all go through it.
+    """
+    original = Path.stat
+
+    def stat(self: Path, *args: Any, **kwargs: Any) -> Any:
+        time.sleep(latency)
+        return original(self, *args, **kwargs)
+
+    Path.stat = stat  # type: ignore[method-assign]
+    try:
+        yield
+    finally:
+        Path.stat = original  # type: ignore[method-assign]
+
+
+async def _measure_loop_lag(done: asyncio.Event, tick: float) -> list[float]:
+    """
+    Record how late each ``tick``-second sleep wakes up until ``done`` is set.
+
+    Parameters
+    ----------
+    done : asyncio.Event
+        Set when the transfer finished.
+    tick : float
+        Sleep interval in seconds.
+
+    Returns
+    -------
+    list[float]
+        Wake-up delays in seconds.
+    """
+    lags: list[float] = []
+    while not done.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(tick)
+        lags.append(time.perf_counter() - start - tick)
+    return lags
+
+
+async def _chunks(count: int, size: int) -> Any:
+    """
+    Yield ``count`` chunks, pausing briefly like a network stream.
+    """
+    chunk = b"\0" * size
+    for _ in range(count):
+        await asyncio.sleep(0)
+        yield chunk
+
+
+async def _blocking_write(path: Path, count: int, size: int, latency: float) -> None:
+    """
+    Write chunks with ``fh.write`` on the event loop, as downloads used to.
+    """
+    fh = _SlowFile(path.open("wb"), latency)
+    try:
+        async for chunk in _chunks(count, size):
+            fh.write(chunk)
+    finally:
+        fh.close()
+
+
+async def _threaded_write(path: Path, count: int, size: int, latency: float) -> None:
+    """
+    Write chunks through ``AsyncFileWriter``.
+    """
+    async with AsyncFileWriter(path) as writer:
+        writer._fh = _SlowFile(writer._fh, latency)
+        async for chunk in _chunks(count, size):
+            await writer.write(chunk)
+
+
+async def _blocking_checks(path: Path, count: int) -> None:
+    """
+    Check and size an upload source on the event loop, as uploads used to.
+    """
+    for _ in range(count):
+        await asyncio.sleep(0)
+        if path.exists() and path.is_file():
+            path.stat()
+
+
+async def _threaded_checks(path: Path, count: int) -> None:
+    """
+    Check and size an upload source with ``BaseDomain.resolve_upload_body``.
+    """
+    domain = BaseDomain(graphql=None, rest=None, settings=None)  # type: ignore[arg-type]
+    for _ in range(count):
+        await domain.resolve_upload_body(file_path=path, content=None)
+
+
+async def _run(
+    operation: Callable[[], Awaitable[None]], tick: float
+) -> dict[str, float]:
+    """
+    Run one operation alongside the lag probe and summarise the lag.
+    """
+    done = asyncio.Event()
+    probe = asyncio.create_task(_measure_loop_lag(done, tick))
+    start = time.perf_counter()
+    await operation()
+    elapsed = time.perf_counter() - start
+    done.set()
+    lags = sorted(await probe) or [0.0]
+    return {
+        "elapsed_s": round(elapsed, 3),
+        "max_lag_ms": round(lags[-1] * 1e3, 2),
+        "p95_lag_ms": round(lags[int(0.95 * (len(lags) - 1))] * 1e3, 2),
+    }
+
+
+def benchmark(
+    megabytes: int = 64,
+    chunk_kb: int = 1024,
+    write_latency: float = 0.005,
+    checks: int = 100,
+    stat_latency: float = 0.005,
+    tick: float = 0.001,
+) -> dict[str, dict[str, float]]:
+    """
+    Compare loop lag for blocking and threaded file writes and metadata checks.
+
+    Parameters
+    ----------
+    megabytes : int, default=64
+        Size of the simulated download.
+    chunk_kb : int, default=1024
+        Chunk size in KiB.
+    write_latency : float, default=0.005
+        Seconds each write is delayed, emulating a slow filesystem.
+    checks : int, default=100
+        Number of upload sources checked and sized.
+    stat_latency : float, default=0.005
+        Seconds each metadata lookup is delayed, emulating a slow filesystem.
+    tick : float, default=0.001
+        Interval of the lag probe in seconds.
+
+    Returns
+    -------
+    dict[str, dict[str, float]]
+        Elapsed time and loop lag per strategy.
+    """
+    size = chunk_kb * 1024
+    count = max(1, megabytes * 1024 // chunk_kb)
+    results: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, write in (
+            ("blocking", _blocking_write),
+            ("threaded", _threaded_write),
+        ):
+            operation = partial(write, Path(tmp) / name, count, size, write_latency)
+            results[name] = asyncio.run(_run(operation, tick))
+
+        source = Path(tmp) / "source"
+        source.write_bytes(b"\0")
+        with _slow_stat(stat_latency):
+            for name, check in (
+                ("blocking_checks", _blocking_checks),
+                ("threaded_checks", _threaded_checks),
+            ):
+                results[name] = asyncio.run(_run(partial(check, source, checks), tick))
+    return results
+
+
+@app.command()
+def main(
+    megabytes: Annotated[int, typer.Option(help="Size of the download.", min=1)] = 64,
+    chunk_kb: Annotated[int, typer.Option(help="Chunk size in KiB.", min=1)] = 1024,
+    write_latency: Annotated[
+        float, typer.Option(help="Seconds of delay per write.", min=0)
+    ] = 0.005,
+    checks: Annotated[
+        int, typer.Option(help="Upload sources to check and size.", min=1)
+    ] = 100,
+    stat_latency: Annotated[
+        float, typer.Option(help="Seconds of delay per metadata lookup.", min=0)
+    ] = 0.005,
+) -> None:
+    """
+    Show how much each strategy delays other coroutines.
+    """
+    output.json(
+        benchmark(
+            megabytes=megabytes,
+            chunk_kb=chunk_kb,
+            write_latency=write_latency,
+            checks=checks,
+            stat_latency=stat_latency,
+        )
+    )
+
+
+if __name__ == "__main__":
+    app()
@@ -3,14 +3,18 @@
 Run Ariadne code generation for a specific GPP environment.
 """
 
+import ast
+import copy
 import shutil
 import subprocess
+import textwrap
 import tomllib
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Annotated, Any
 
 import typer
+from ariadne_codegen.utils import ast_to_str
 
 from gpp_client.cli import output
 from gpp_client.environment import GPPEnvironment
@@ -20,6 +24,176 @@ from graphql.language.printer import print_ast
 
 app = typer.Typer(add_completion=False)
 
+STRUCTS_PACKAGE_NAME = "structs"
+OPERATIONS_PACKAGE_NAME = "operations"
+
+# Written as is into the struct package. ``model_dump`` mirrors the subset of
+# the Pydantic API the domains and the CLI call on results.
+_BASE_STRUCT_MODULE = """from enum import Enum
+from typing import Any, Literal
+
+import msgspec
+
+
+class BaseStruct(msgspec.Struct, kw_only=True):
+    def model_dump(
+        self, *, mode: Literal["python", "json"] = "python", by_alias: bool = False
+    ) -> dict[str, Any]:
+        return _dump(self, mode, by_alias)
+
+
+class TaggedStruct(BaseStruct, kw_only=True):
+    @property
+    def typename__(self) -> str:
+        return self.__struct_config__.tag
+
+
+def _dump(value: Any, mode: str, by_alias: bool) -> Any:
+    if isinstance(value, msgspec.Struct):
+        data = {}
+        tag = value.__struct_config__.tag
+        if tag is not None:
+            data["__typename" if by_alias else "typename__"] = tag
+        names = value.__struct_encode_fields__ if by_alias else value.__struct_fields__
+        for name, key in zip(value.__struct_fields__, names):
+            data[key] = _dump(getattr(value, name), mode, by_alias)
+        return data
+    if isinstance(value, list):
+        return [_dump(item, mode, by_alias) for item in value]
+    if mode == "json" and isinstance(value, Enum):
+        return value.value
+    return value
+"""
+
+# Added to the struct client. Successful responses are decoded straight into
+# the result struct; anything else goes through ``get_data`` for its errors.
+_STRUCT_CLIENT_SUPPORT = """
+T = TypeVar("T")
+
+_decoders: dict[Any, msgspec.json.Decoder] = {}
+
+
+class _Response(msgspec.Struct, Generic[T]):
+    data: Optional[T] = None
+    errors: Optional[list[Any]] = None
+"""
+
+_STRUCT_CLIENT_METHODS = """
+def get_struct(self, response: httpx.Response, type_: type[T]) -> T:
+    if response.is_success:
+        decoder = _decoders.get(type_)
+        if decoder is None:
+            decoder = _decoders[type_] = msgspec.json.Decoder(_Response[type_])
+        try:
+            result = decoder.decode(response.content)
+        except msgspec.DecodeError:
+            result = None
+        if result is not None and result.data is not None and not result.errors:
+            return result.data
+    return self.convert_struct(self.get_data(response), type_)
+
+
+def convert_struct(self, data: dict[str, Any], type_: type[T]) -> T:
+    return msgspec.convert(data, type_)
+"""
+
+
+# Written as is to the operations package of a split client.
+_OPERATIONS_PACKAGE = """\"\"\"
+Operation methods of the generated client, grouped by domain.
+
+The client refers to them with :class:`LazyOperation`, so a domain module, and
+the result models its operations validate into, is only imported when one of
+its operations is first used.
+\"\"\"
+
+import importlib
+from collections.abc import Callable
+from typing import Any, Optional
+
+Wrapper = Callable[[Callable[..., Any]], Callable[..., Any]]
+
+
+class LazyOperation:
+    \"\"\"
+    Client method imported from its domain module on first access.
+
+    Parameters
+    ----------
+    domain : str
+        Module of this package defining the method.
+    subscription : bool, default=False
+        Whether the method is a subscription, i.e. an async generator.
+    wrapper : Wrapper, optional
+        Applied to the method once it is imported.
+    \"\"\"
+
+    def __init__(
+        self,
+        domain: str,
+        *,
+        subscription: bool = False,
+        wrapper: Optional[Wrapper] = None,
+    ) -> None:
+        self.domain = domain
+        self.subscription = subscription
+        self.wrapper = wrapper
+        self.owner: Optional[type] = None
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.owner = owner
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        method = self.load()
+        return method if instance is None else method.__get__(instance, owner)
+
+    def load(self) -> Callable[..., Any]:
+        \"\"\"
+        Import the method and replace this descriptor with it on its class.
+        \"\"\"
+        module = importlib.import_module(f"{__name__}.{self.domain}")
+        method = vars(getattr(module, _class_name(self.domain)))[self.name]
+        if self.wrapper is not None:
+            method = self.wrapper(method)
+        setattr(self.owner, self.name, method)
+        return method
+
+    def wrap(self, owner: type, wrapper: Wrapper) -> "LazyOperation":
+        \"\"\"
+        Return a copy for ``owner`` that wraps the method once it is imported.
+        \"\"\"
+        lazy = LazyOperation(
+            self.domain, subscription=self.subscription, wrapper=wrapper
+        )
+        lazy.__set_name__(owner, self.name)
+        return lazy
+
+
+def _class_name(domain: str) -> str:
+    \"\"\"
+    Return the name of the class holding a domain's operation methods.
+    \"\"\"
+    return "".join(part.title() for part in domain.split("_")) + "Operations"
+"""
+
+
+# Module functions of a lazily loading package ``__init__``.
+_LAZY_GETATTR = """
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+"""
+
 
 class CodegenError(RuntimeError):
     """
@@ -667,6 +841,736 @@ def _run_codegen(toml_path: Path) -> None:
             raise CodegenError(exc.stderr) from exc
 
 
+def _structs_enabled(config: dict[str, Any]) -> bool:
+    """
+    Return whether msgspec structs should be generated.
+
+    Parameters
+    ----------
+    config : dict[str, Any]
+        Parsed TOML configuration.
+
+    Returns
+    -------
+    bool
+        The ``msgspec_structs`` flag of the ``[tool.gpp-codegen]`` section.
+    """
+    return bool(config.get("tool", {}).get("gpp-codegen", {}).get("msgspec_structs"))
+
+
+def _result_modules(client_module: ast.Module) -> list[str]:
+    """
+    Return the generated modules holding operation result models.
+
+    Parameters
+    ----------
+    client_module : ast.Module
+        Parsed generated client module.
+
+    Returns
+    -------
+    list[str]
+        Module names, ``fragments`` first and the others in import order.
+    """
+    validated = {
+        node.func.value.id
+        for node in ast.walk(client_module)
+        if isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == "model_validate"
+        and isinstance(node.func.value, ast.Name)
+    }
+    modules = ["fragments"]
+    for node in client_module.body:
+        if (
+            isinstance(node, ast.ImportFrom)
+            and node.level == 1
+            and any(alias.name in validated for alias in node.names)
+        ):
+            modules.append(node.module)
+    return modules
+
+
+def _model_classes(
+    modules: dict[str, ast.Module],
+) -> dict[str, ast.ClassDef]:
+    """
+    Index the model classes of the parsed result modules by name.
+
+    Parameters
+    ----------
+    modules : dict[str, ast.Module]
+        Parsed result modules by module name.
+
+    Returns
+    -------
+    dict[str, ast.ClassDef]
+        Class definitions by class name, unique across the generated package.
+    """
+    return {
+        node.name: node
+        for module in modules.values()
+        for node in module.body
+        if isinstance(node, ast.ClassDef)
+    }
+
+
+def _is_field_call(node: ast.AST | None) -> bool:
+    """
+    Return whether a node is a call to Pydantic's ``Field``.
+    """
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id == "Field"
+    )
+
+
+def _union_tags(classes: dict[str, ast.ClassDef]) -> dict[str, str]:
+    """
+    Return the ``__typename`` tag of every member of a discriminated union.
+
+    msgspec tells union members apart by a tag fixed per struct, so each
+    member must select exactly one ``__typename``.
+
+    Parameters
+    ----------
+    classes : dict[str, ast.ClassDef]
+        Model classes by name.
+
+    Returns
+    -------
+    dict[str, str]
+        Tags by class name.
+
+    Raises
+    ------
+    CodegenError
+        Raised if a union member does not have a single ``__typename``.
+    """
+    tags: dict[str, str] = {}
+    for node in ast.walk(ast.Module(body=list(classes.values()), type_ignores=[])):
+        if not (
+            isinstance(node, ast.Subscript)
+            and isinstance(node.value, ast.Name)
+            and node.value.id == "Annotated"
+            and isinstance(node.slice, ast.Tuple)
+            and any(_is_field_call(item) for item in node.slice.elts[1:])
+            and isinstance(node.slice.elts[0], ast.Subscript)
+        ):
+            continue
+        members = node.slice.elts[0].slice
+        for member in members.elts if isinstance(members, ast.Tuple) else [members]:
+            name = member.value if isinstance(member, ast.Constant) else member.id
+            tags[name] = _typename_literal(name, classes[name])
+    return tags
+
+
+def _typename_literal(name: str, node: ast.ClassDef) -> str:
+    """
+    Return the single ``__typename`` a union member class selects.
+    """
+    for statement in node.body:
+        if (
+            isinstance(statement, ast.AnnAssign)
+            and isinstance(statement.target, ast.Name)
+            and statement.target.id == "typename__"
+            and isinstance(statement.annotation, ast.Subscript)
+            and isinstance(statement.annotation.slice, ast.Constant)
+        ):
+            return statement.annotation.slice.value
+    raise CodegenError(f"Union member {name} does not select a single __typename.")
+
+
+def _struct_fields(
+    name: str, classes: dict[str, ast.ClassDef]
+) -> dict[str, ast.AnnAssign]:
+    """
+    Return the fields of a model class including those of its base models.
+
+    msgspec structs cannot inherit fields from more than one base, so the
+    fields of every base fragment are copied into the struct instead.
+
+    Parameters
+    ----------
+    name : str
+        Model class name.
+    classes : dict[str, ast.ClassDef]
+        Model classes by name.
+
+    Returns
+    -------
+    dict[str, ast.AnnAssign]
+        Field declarations by field name, in Pydantic's order.
+    """
+    node = classes[name]
+    fields: dict[str, ast.AnnAssign] = {}
+    for base in node.bases:
+        if isinstance(base, ast.Name) and base.id in classes:
+            for field_name, field in _struct_fields(base.id, classes).items():
+                fields.setdefault(field_name, field)
+    for statement in node.body:
+        if isinstance(statement, ast.AnnAssign) and isinstance(
+            statement.target, ast.Name
+        ):
+            fields[statement.target.id] = statement
+    return fields
+
+
+class _StripFieldAnnotations(ast.NodeTransformer):
+    """
+    Replace ``Annotated[T, Field(...)]`` with ``T``.
+    """
+
+    def visit_Subscript(self, node: ast.Subscript) -> ast.AST:
+        node = self.generic_visit(node)
+        if (
+            isinstance(node.value, ast.Name)
+            and node.value.id == "Annotated"
+            and isinstance(node.slice, ast.Tuple)
+            and all(_is_field_call(item) for item in node.slice.elts[1:])
+        ):
+            return node.slice.elts[0]
+        return node
+
+
+def _struct_field(field: ast.AnnAssign) -> ast.AnnAssign:
+    """
+    Convert a Pydantic field declaration into a msgspec one.
+    """
+    annotation = _StripFieldAnnotations().visit(copy.deepcopy(field.annotation))
+    value = field.value
+    if _is_field_call(value):
+        keywords = [
+            ast.keyword(
+                arg="name" if keyword.arg == "alias" else "default", value=keyword.value
+            )
+            for keyword in value.keywords
+            if keyword.arg in ("alias", "default")
+        ]
+        value = (
+            ast.Call(func=ast.Name(id="field"), args=[], keywords=keywords)
+            if keywords
+            else None
+        )
+    return ast.AnnAssign(
+        target=ast.Name(id=field.target.id),
+        annotation=annotation,
+        value=value,
+        simple=1,
+    )
+
+
+def _struct_class(
+    name: str, classes: dict[str, ast.ClassDef], tags: dict[str, str]
+) -> ast.ClassDef:
+    """
+    Build the msgspec struct equivalent of a model class.
+    """
+    fields = _struct_fields(name, classes)
+    keywords = []
+    base = "BaseStruct"
+    if name in tags:
+        # The tag replaces the field; ``TaggedStruct`` exposes it under its name.
+        fields.pop("typename__", None)
+        base = "TaggedStruct"
+        keywords = [
+            ast.keyword(arg="tag_field", value=ast.Constant("__typename")),
+            ast.keyword(arg="tag", value=ast.Constant(tags[name])),
+        ]
+    body = [_struct_field(field) for field in fields.values()] or [ast.Pass()]
+    return ast.ClassDef(
+        name=name,
+        bases=[ast.Name(id=base)],
+        keywords=keywords,
+        body=body,
+        decorator_list=[],
+        type_params=[],
+    )
+
+
+def _import(module: str | None, names: list[str], level: int) -> ast.ImportFrom:
+    """
+    Build a ``from module import names`` statement.
+    """
+    return ast.ImportFrom(
+        module=module, names=[ast.alias(name=name) for name in names], level=level
+    )
+
+
+def _struct_module(
+    names: list[str],
+    *,
+    classes: dict[str, ast.ClassDef],
+    tags: dict[str, str],
+    imports: list[ast.ImportFrom],
+) -> str:
+    """
+    Render a struct module holding the equivalents of the named model classes.
+
+    Every struct, enum and typing name that could be referenced is imported;
+    the unused imports are removed when the code is formatted.
+    """
+    body: list[ast.stmt] = [
+        *imports,
+        _import("msgspec", ["field"], 0),
+        _import("base_struct", ["BaseStruct", "TaggedStruct"], 1),
+        *(_struct_class(name, classes, tags) for name in names),
+    ]
+    return ast_to_str(ast.Module(body=body, type_ignores=[]))
+
+
+class _SplitQueries(ast.NodeTransformer):
+    """
+    Split ``gql`` query strings back into lines as ariadne does.
+
+    The formatter then renders them as the same multiline strings.
+    """
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        if (
+            isinstance(node.func, ast.Name)
+            and node.func.id == "gql"
+            and isinstance(node.args[0], ast.Constant)
+        ):
+            lines = textwrap.dedent(node.args[0].value).strip("\n").splitlines()
+            node.args = [[ast.Constant(line + "\n") for line in lines]]
+        return self.generic_visit(node)
+
+
+class _DecodeIntoStructs(_SplitQueries):
+    """
+    Make the generated operation methods return structs.
+    """
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> ast.AST:
+        body = []
+        for statement in node.body:
+            result = _validated_class(statement, "return")
+            if result is not None and body and _is_get_data(body[-1]):
+                body[-1] = ast.Return(
+                    value=_self_call("get_struct", "response", result)
+                )
+                continue
+            body.append(statement)
+        node.body = body
+        return self.generic_visit(node)
+
+    def visit_Expr(self, node: ast.Expr) -> ast.AST:
+        result = _validated_class(node, "yield")
+        if result is None:
+            return node
+        return ast.Expr(
+            value=ast.Yield(value=_self_call("convert_struct", "data", result))
+        )
+
+
+def _validated_class(statement: ast.AST, kind: str) -> str | None:
+    """
+    Return ``X`` if a statement is ``return`` or ``yield X.model_validate(data)``.
+    """
+    if kind == "return" and isinstance(statement, ast.Return):
+        call = statement.value
+    elif (
+        kind == "yield"
+        and isinstance(statement, ast.Expr)
+        and isinstance(statement.value, ast.Yield)
+    ):
+        call = statement.value.value
+    else:
+        return None
+    if (
+        isinstance(call, ast.Call)
+        and isinstance(call.func, ast.Attribute)
+        and call.func.attr == "model_validate"
+        and isinstance(call.func.value, ast.Name)
+    ):
+        return call.func.value.id
+    return None
+
+
+def _is_get_data(statement: ast.stmt) -> bool:
+    """
+    Return whether a statement is ``data = self.get_data(response)``.
+    """
+    return (
+        isinstance(statement, ast.Assign)
+        and isinstance(statement.value, ast.Call)
+        and isinstance(statement.value.func, ast.Attribute)
+        and statement.value.func.attr == "get_data"
+    )
+
+
+def _self_call(method: str, argument: str, result: str) -> ast.Call:
+    """
+    Build ``self.method(argument, result)``.
+    """
+    return ast.Call(
+        func=ast.Attribute(value=ast.Name(id="self"), attr=method),
+        args=[ast.Name(id=argument), ast.Name(id=result)],
+        keywords=[],
+    )
+
+
+def _struct_client_module(client_module: ast.Module, result_modules: list[str]) -> str:
+    """
+    Render a client subclass whose operations decode into the structs.
+
+    Parameters
+    ----------
+    client_module : ast.Module
+        Parsed generated client module.
+    result_modules : list[str]
+        Modules holding result models; their imports now point at the structs.
+
+    Returns
+    -------
+    str
+        Source of the struct client module.
+    """
+    body: list[ast.stmt] = [
+        ast.Import(names=[ast.alias(name="httpx"), ast.alias(name="msgspec")]),
+        _import("typing", ["Any", "Generic", "Optional", "TypeVar"], 0),
+    ]
+    client_class = None
+    for node in client_module.body:
+        if isinstance(node, ast.ImportFrom):
+            node = copy.deepcopy(node)
+            if node.level == 1 and node.module not in result_modules:
+                node.level = 2
+            body.append(node)
+        elif isinstance(node, ast.ClassDef):
+            client_class = node
+        else:
+            body.append(node)
+    body.append(_import("client", [client_class.name], 2))
+    body.extend(ast.parse(_STRUCT_CLIENT_SUPPORT).body)
+
+    methods = ast.parse(_STRUCT_CLIENT_METHODS).body
+    for node in client_class.body:
+        if isinstance(node, ast.AsyncFunctionDef) and any(
+            _validated_class(child, kind) is not None
+            for child in ast.walk(node)
+            for kind in ("return", "yield")
+        ):
+            methods.append(_DecodeIntoStructs().visit(copy.deepcopy(node)))
+    body.append(
+        ast.ClassDef(
+            name=f"Struct{client_class.name}",
+            bases=[ast.Name(id=client_class.name)],
+            keywords=[],
+            body=methods,
+            decorator_list=[],
+            type_params=[],
+        )
+    )
+    return ast_to_str(ast.Module(body=body, type_ignores=[]), multiline_strings=True)
+
+
+def _write_struct_package(package_dir: Path) -> None:
+    """
+    Write msgspec struct equivalents of the generated result models.
+
+    The structs have the models' names, field names and aliases, and live in
+    the ``structs`` subpackage with a client that decodes responses into them.
+
+    Parameters
+    ----------
+    package_dir : Path
+        Path to the generated package directory.
+
+    Raises
+    ------
+    CodegenError
+        Raised if the generated client is missing.
+    """
+    client_path = package_dir / "client.py"
+    if not client_path.exists():
+        raise CodegenError(f"Generated client not found at {client_path}")
+
+    client_module = ast.parse(client_path.read_text(encoding="utf-8"))
+    result_modules = _result_modules(client_module)
+    modules = {
+        name: ast.parse((package_dir / f"{name}.py").read_text(encoding="utf-8"))
+        for name in result_modules
+    }
+    classes = _model_classes(modules)
+    tags = _union_tags(classes)
+
+    enums = ast.parse((package_dir / "enums.py").read_text(encoding="utf-8"))
+    typing_names = sorted(
+        {
+            alias.name
+            for module in modules.values()
+            for node in module.body
+            if isinstance(node, ast.ImportFrom) and node.module == "typing"
+            for alias in node.names
+        }
+    )
+    fragment_names = [
+        node.name
+        for node in modules["fragments"].body
+        if isinstance(node, ast.ClassDef)
+    ]
+
+    struct_dir = package_dir / STRUCTS_PACKAGE_NAME
+    struct_dir.mkdir(exist_ok=True)
+    (struct_dir / "base_struct.py").write_text(_BASE_STRUCT_MODULE, encoding="utf-8")
+
+    exports: dict[str, list[str]] = {
+        "base_struct": ["BaseStruct", "TaggedStruct"],
+        "client": [f"Struct{_client_class_name(client_module)}"],
+    }
+    for name, module in modules.items():
+        imports = [
+            _import("typing", typing_names, 0),
+            _import(
+                "enums",
+                [node.name for node in enums.body if isinstance(node, ast.ClassDef)],
+                2,
+            ),
+        ]
+        if name != "fragments":
+            imports.append(_import("fragments", fragment_names, 1))
+        local = [node.name for node in module.body if isinstance(node, ast.ClassDef)]
+        code = _struct_module(local, classes=classes, tags=tags, imports=imports)
+        (struct_dir / f"{name}.py").write_text(code, encoding="utf-8")
+        exports[name] = local
+
+    (struct_dir / "client.py").write_text(
+        _struct_client_module(client_module, result_modules), encoding="utf-8"
+    )
+
+    init_body: list[ast.stmt] = [
+        _import(module, names, 1) for module, names in sorted(exports.items())
+    ]
+    init_body.append(
+        ast.Assign(
+            targets=[ast.Name(id="__all__")],
+            value=ast.List(
+                elts=[
+                    ast.Constant(name)
+                    for name in sorted(
+                        name for names in exports.values() for name in names
+                    )
+                ]
+            ),
+            lineno=0,
+        )
+    )
+    (struct_dir / "__init__.py").write_text(
+        ast_to_str(ast.Module(body=init_body, type_ignores=[]), False),
+        encoding="utf-8",
+    )
+    output.info(f"Wrote msgspec structs to {struct_dir}")
+
+
+def _client_class_name(client_module: ast.Module) -> str:
+    """
+    Return the name of the generated client class.
+    """
+    return next(
+        node.name for node in client_module.body if isinstance(node, ast.ClassDef)
+    )
+
+
+def _lazy_loading_enabled(config: dict[str, Any]) -> bool:
+    """
+    Return whether the generated package should load its modules lazily.
+
+    Parameters
+    ----------
+    config : dict[str, Any]
+        Parsed TOML configuration.
+
+    Returns
+    -------
+    bool
+        The ``lazy_loading`` flag of the ``[tool.gpp-codegen]`` section.
+    """
+    return bool(config.get("tool", {}).get("gpp-codegen", {}).get("lazy_loading"))
+
+
+def _operation_domains(operations_dir: Path) -> dict[str, str]:
+    """
+    Map each GraphQL operation to the domain it is defined in.
+
+    Operations under ``domains/<domain>/`` belong to that domain, the others
+    to a domain named after their file.
+
+    Parameters
+    ----------
+    operations_dir : Path
+        Assembled operations directory.
+
+    Returns
+    -------
+    dict[str, str]
+        Domain per operation name.
+    """
+    domains = {}
+    for path in _iter_graphql_files(operations_dir):
+        parts = path.relative_to(operations_dir).parts
+        domain = parts[1] if parts[0] == "domains" and len(parts) > 2 else path.stem
+        for definition in _parse_graphql_file(path).definitions:
+            if isinstance(definition, OperationDefinitionNode) and definition.name:
+                domains[definition.name.value] = domain
+    return domains
+
+
+def _operations_class_name(domain: str) -> str:
+    """
+    Return the name of the class holding a domain's operation methods.
+    """
+    return "".join(part.title() for part in domain.split("_")) + "Operations"
+
+
+def _operation_name(method: ast.stmt) -> str | None:
+    """
+    Return the GraphQL operation a generated client method sends, if any.
+    """
+    if not isinstance(method, ast.AsyncFunctionDef):
+        return None
+    for node in ast.walk(method):
+        if isinstance(node, ast.keyword) and node.arg == "operation_name":
+            if isinstance(node.value, ast.Constant):
+                return node.value.value
+    return None
+
+
+def _split_client(package_dir: Path, domains: dict[str, str]) -> None:
+    """
+    Move the generated client's operation methods into per-domain modules.
+
+    The methods are written to the ``operations`` subpackage, one class per
+    domain, and replaced on the client by descriptors importing them on first
+    use. Importing the client then no longer imports every result model.
+
+    Parameters
+    ----------
+    package_dir : Path
+        Path to the generated package directory.
+    domains : dict[str, str]
+        Domain per GraphQL operation name, from :func:`_operation_domains`.
+
+    Raises
+    ------
+    CodegenError
+        Raised if the generated client is missing.
+    """
+    client_path = package_dir / "client.py"
+    if not client_path.exists():
+        raise CodegenError(f"Generated client not found at {client_path}")
+
+    client_module = ast.parse(client_path.read_text(encoding="utf-8"))
+    imports: list[ast.stmt] = []
+    helpers: list[ast.stmt] = []
+    client_class = None
+    for node in client_module.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            imports.append(node)
+        elif isinstance(node, ast.ClassDef):
+            client_class = node
+        else:
+            helpers.append(node)
+
+    methods: dict[str, list[ast.stmt]] = {}
+    client_body: list[ast.stmt] = []
+    for node in client_class.body:
+        domain = domains.get(_operation_name(node))
+        if domain is None:
+            client_body.append(node)
+            continue
+        methods.setdefault(domain, []).append(_SplitQueries().visit(node))
+        keywords = []
+        if any(isinstance(child, ast.Yield) for child in ast.walk(node)):
+            keywords.append(ast.keyword(arg="subscription", value=ast.Constant(True)))
+        client_body.append(
+            ast.Assign(
+                targets=[ast.Name(id=node.name)],
+                value=ast.Call(
+                    func=ast.Name(id="LazyOperation"),
+                    args=[ast.Constant(domain)],
+                    keywords=keywords,
+                ),
+                lineno=0,
+            )
+        )
+
+    operations_dir = package_dir / OPERATIONS_PACKAGE_NAME
+    operations_dir.mkdir(exist_ok=True)
+    (operations_dir / "__init__.py").write_text(_OPERATIONS_PACKAGE, encoding="utf-8")
+    domain_imports = []
+    for node in imports:
+        node = copy.deepcopy(node)
+        if isinstance(node, ast.ImportFrom) and node.level == 1:
+            node.level = 2
+        domain_imports.append(node)
+    for domain, domain_methods in sorted(methods.items()):
+        module = ast.Module(
+            body=[
+                *domain_imports,
+                *copy.deepcopy(helpers),
+                ast.ClassDef(
+                    name=_operations_class_name(domain),
+                    bases=copy.deepcopy(client_class.bases),
+                    keywords=[],
+                    body=domain_methods,
+                    decorator_list=[],
+                    type_params=[],
+                ),
+            ],
+            type_ignores=[],
+        )
+        (operations_dir / f"{domain}.py").write_text(
+            ast_to_str(module, multiline_strings=True), encoding="utf-8"
+        )
+
+    client_class.body = client_body
+    module = ast.Module(
+        body=[
+            *imports,
+            _import(OPERATIONS_PACKAGE_NAME, ["LazyOperation"], 1),
+            client_class,
+        ],
+        type_ignores=[],
+    )
+    client_path.write_text(ast_to_str(module), encoding="utf-8")
+    output.info(f"Split the generated client into {operations_dir}")
+
+
+def _write_lazy_init(package_dir: Path) -> None:
+    """
+    Make a generated package import the names it exports on first access.
+
+    The ``__init__`` keeps its ``__all__`` and imports them for type checkers
+    only; a module ``__getattr__`` imports each name from its module when it
+    is first used.
+
+    Parameters
+    ----------
+    package_dir : Path
+        Path to the package directory.
+    """
+    init_path = package_dir / "__init__.py"
+    init_module = ast.parse(init_path.read_text(encoding="utf-8"))
+    imports = [node for node in init_module.body if isinstance(node, ast.ImportFrom)]
+    exported = [node for node in init_module.body if node not in imports]
+    modules = {alias.name: node.module for node in imports for alias in node.names}
+
+    code = "\n\n".join(
+        [
+            "import importlib\nfrom typing import TYPE_CHECKING, Any",
+            "if TYPE_CHECKING:\n"
+            + textwrap.indent("\n".join(ast.unparse(node) for node in imports), "    "),
+            "\n".join(ast.unparse(node) for node in exported),
+            f"_MODULES = {modules!r}",
+            _LAZY_GETATTR,
+        ]
+    )
+    init_path.write_text(ast_to_str(ast.parse(code), False), encoding="utf-8")
+
+
 def _run(env: GPPEnvironment) -> None:
     """
     Execute the full codegen workflow for an environment.
@@ -695,10 +1599,17 @@ def _run(env: GPPEnvironment) -> None:
         _validate_development_only_is_additive(paths)
 
     _remove_dir(paths.build_dir, label="build directory")
-    _assemble_operations(paths, env)
+    assembled_dir = _assemble_operations(paths, env)
     _remove_dir(package_dir, label="generated package")
     _run_codegen(toml_path)
     _write_package_environment(package_dir, env)
+    if _structs_enabled(config):
+        _write_struct_package(package_dir)
+    if _lazy_loading_enabled(config):
+        _split_client(package_dir, _operation_domains(assembled_dir))
+        _write_lazy_init(package_dir)
+        if _structs_enabled(config):
+            _write_lazy_init(package_dir / STRUCTS_PACKAGE_NAME)
 
 
 @app.command()
@@ -4,7 +4,10 @@ CLI entry point for GPP Client.
 
 __all__ = ["app"]
 
+import json
 from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
 from typing import Annotated
 
 import typer
@@ -22,6 +25,9 @@ from gpp_client.cli.commands import (
     workflow_state_app,
 )
 from gpp_client.cli.utils import async_command
+from gpp_client.metrics import ClientMetrics
+from gpp_client.profiling import ProfileReport
+from gpp_client.settings import GPPSettings
 from gpp_client.settings import get_config_path as _get_config_path
 
 
@@ -34,6 +40,15 @@ class CLIState:
     debug: bool = False
 
 
+class StatsFormat(str, Enum):
+    """
+    Output formats of ``gpp stats``.
+    """
+
+    JSON = "json"
+    PROMETHEUS = "prometheus"
+
+
 app = typer.Typer(
     name="GPP Client", no_args_is_help=False, help="Client to communicate with GPP."
 )
@@ -98,6 +113,61 @@ def get_config_path() -> None:
     output.info(f"{config_path.resolve()}")
 
 
+@app.command("stats")
+def stats(
+    path: Annotated[
+        Path | None,
+        typer.Argument(
+            help="Metrics snapshot to show. Defaults to the 'metrics_file' setting.",
+        ),
+    ] = None,
+    output_format: Annotated[
+        StatsFormat,
+        typer.Option("--format", help="Output format."),
+    ] = StatsFormat.JSON,
+) -> None:
+    """Show the metrics snapshot saved by the client on close."""
+    path = path or GPPSettings().metrics_file
+    if path is None:
+        output.fail("No metrics file given. Pass a path or set 'GPP_METRICS_FILE'.")
+        raise typer.Exit(code=1)
+    if not path.is_file():
+        output.fail(f"Metrics file not found: {path}")
+        raise typer.Exit(code=1)
+
+    metrics = ClientMetrics.from_dict(json.loads(path.read_text()))
+    if output_format is StatsFormat.PROMETHEUS:
+        output.plain(metrics.to_prometheus())
+    else:
+        output.json(metrics.to_dict())
+
+
+@app.command("profile")
+def profile(
+    path: Annotated[
+        Path | None,
+        typer.Argument(
+            help="Response profile to show. Defaults to the 'profile_file' setting.",
+        ),
+    ] = None,
+    top: Annotated[
+        int,
+        typer.Option("--top", min=1, help="Fields shown per operation."),
+    ] = 20,
+) -> None:
+    """Show the largest fields of the response profile saved by the client."""
+    path = path or GPPSettings().profile_file
+    if path is None:
+        output.fail("No profile file given. Pass a path or set 'GPP_PROFILE_FILE'.")
+        raise typer.Exit(code=1)
+    if not path.is_file():
+        output.fail(f"Profile file not found: {path}")
+        raise typer.Exit(code=1)
+
+    report = ProfileReport.from_dict(json.loads(path.read_text()))
+    output.plain(report.to_text(top=top))
+
+
 app.add_typer(observation_app)
 app.add_typer(program_app)
 app.add_typer(attachment_app)
@@ -83,13 +83,25 @@ async def list_observations(
             help="Maximum number of observations to return.",
         ),
     ] = None,
+    full: Annotated[
+        bool,
+        typer.Option(
+            "--full",
+            help="Fetch full observation details instead of summaries.",
+        ),
+    ] = False,
 ) -> None:
     """
     List observations.
     """
     with output.status("Fetching observations..."):
         async with GPPClient() as client:
-            result = await client.observation.get_all(
+            fetch = (
+                client.observation.get_all
+                if full
+                else client.observation.list_summaries
+            )
+            result = await fetch(
                 include_deleted=include_deleted,
                 offset=offset,
                 limit=limit,
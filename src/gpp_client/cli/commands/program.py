@@ -102,13 +102,21 @@ async def list_programs(
             help="Maximum number of programs to return.",
         ),
     ] = None,
+    full: Annotated[
+        bool,
+        typer.Option(
+            "--full",
+            help="Fetch full program details instead of summaries.",
+        ),
+    ] = False,
 ) -> None:
     """
     List programs.
     """
     with output.status("Fetching programs..."):
         async with GPPClient() as client:
-            result = await client.program.get_all(
+            fetch = client.program.get_all if full else client.program.list_summaries
+            result = await fetch(
                 include_deleted=include_deleted,
                 offset=offset,
                 limit=limit,
@@ -79,13 +79,21 @@ async def list_targets(
             help="Maximum number of targets to return.",
         ),
     ] = None,
+    full: Annotated[
+        bool,
+        typer.Option(
+            "--full",
+            help="Fetch full target details instead of summaries.",
+        ),
+    ] = False,
 ) -> None:
     """
     List targets.
     """
     with output.status("Fetching targets..."):
         async with GPPClient() as client:
-            result = await client.target.get_all(
+            fetch = client.target.get_all if full else client.target.list_summaries
+            result = await fetch(
                 include_deleted=include_deleted,
                 offset=offset,
                 limit=limit,
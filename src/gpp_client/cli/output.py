@@ -5,6 +5,7 @@ Rich-based output utilities for the GPP Client CLI.
 __all__ = [
     "section",
     "info",
+    "plain",
     "success",
     "warning",
     "fail",
@@ -75,6 +76,18 @@ def info(msg: str) -> None:
     console.print(f"{msg}", style="white")
 
 
+def plain(msg: str) -> None:
+    """
+    Print text exactly as given, without markup, highlighting or wrapping.
+
+    Parameters
+    ----------
+    msg : str
+        The text to print.
+    """
+    console.print(msg, markup=False, highlight=False, soft_wrap=True, end="")
+
+
 def dim_info(msg: RenderableType) -> None:
     """
     Print a dimmed informational message.
@@ -4,8 +4,10 @@ This module provides the main entry point for interacting with GPP.
 
 __all__ = ["GPPClient"]
 
+import json
 import logging
 from typing import Any, Optional
+from urllib.parse import urlsplit
 
 import httpx
 from typing_extensions import Self
@@ -22,10 +24,16 @@ from gpp_client.domains import (
     WorkflowStateDomain,
 )
 from gpp_client.environment import GPPEnvironment
+from gpp_client.exceptions import GPPClientError
 from gpp_client.generated.client import GraphQLClient
 from gpp_client.logging_utils import _enable_dev_console_logging
-from gpp_client.rest import RESTClient
+from gpp_client.metrics import CacheMetrics, ClientMetrics, MetricsCollector
+from gpp_client.profiling import ResponseProfiler
+from gpp_client.rest import AtomDigestCache, RESTClient, RESTConnectorOptions
 from gpp_client.settings import GPPSettings, _get_packaged_environment
+from gpp_client.traced_client import TracedGraphQLClient
+from gpp_client.tracing import Tracer
+from gpp_client.transport import HTTPTransport
 from gpp_client.urls import get_graphql_url, get_ws_url
 
 logger = logging.getLogger(__name__)
@@ -48,6 +56,9 @@ class GPPClient:
     debug : bool, optional
         Whether to enable debug logging for the client. If not provided, defaults to
         ``False``.
+    base_url : str, optional
+        URL of the service to talk to instead of the environment's, such as a
+        local :class:`~gpp_client.testing.StubGPPServer`.
     """
 
     scheduler: SchedulerDomain
@@ -82,13 +93,27 @@ class GPPClient:
         *,
         token: str | None = None,
         debug: bool | None = None,
+        base_url: str | None = None,
     ) -> None:
-        self._settings = self._build_settings(token=token, debug=debug)
+        self._settings = self._build_settings(
+            token=token, debug=debug, base_url=base_url
+        )
         if self._settings.debug:
             self._enable_dev_logging()
 
         logger.debug("GPPClient initialized with settings: %s", self._settings)
 
+        self._tracer = Tracer()
+        self._metrics: MetricsCollector | None = None
+        # Spans only measure while a hook is registered, so collect on request.
+        if self._settings.collect_metrics or self._settings.metrics_file is not None:
+            self._metrics = MetricsCollector()
+            self._tracer.add_hook(self._metrics)
+        self._profiler: ResponseProfiler | None = None
+        if self._settings.profile_file is not None:
+            self._profiler = ResponseProfiler()
+            self._tracer.add_hook(self._profiler)
+        self._transport = self._build_transport()
         self._graphql = self._build_graphql_client()
         self._rest = self._build_rest_client()
         self._init_domains()
@@ -98,6 +123,7 @@ class GPPClient:
         *,
         token: str | None = None,
         debug: bool | None = None,
+        base_url: str | None = None,
     ) -> GPPSettings:
         """
         Build the effective runtime settings.
@@ -108,6 +134,8 @@ class GPPClient:
             Explicit token override.
         debug : bool | None, optional
             Explicit debug override.
+        base_url : str | None, optional
+            Explicit service URL override.
 
         Returns
         -------
@@ -123,9 +151,27 @@ class GPPClient:
                 settings_kwargs["token"] = token
         if debug is not None:
             settings_kwargs["debug"] = debug
+        if base_url is not None:
+            settings_kwargs["base_url_override"] = base_url
 
         return GPPSettings(**settings_kwargs)
 
+    def _build_transport(self) -> HTTPTransport:
+        """
+        Build the HTTP transport shared by the GraphQL client and the domains.
+
+        Returns
+        -------
+        HTTPTransport
+            Transport that sends the token only to the GPP host.
+        """
+        graphql_url = get_graphql_url(self._settings.base_url)
+        return HTTPTransport(
+            timeout=_HTTP_TIMEOUT,
+            auth_token=self._settings.resolved_token,
+            auth_host=urlsplit(graphql_url).hostname,
+        )
+
     def _build_graphql_client(self) -> GraphQLClient:
         """
         Build the GraphQL client.
@@ -133,25 +179,32 @@ class GPPClient:
         Returns
         -------
         GraphQLClient
-            Configured GraphQL client instance.
+            Configured GraphQL client instance, reporting to :attr:`tracer`. With
+            the ``msgspec`` model backend, operations return the generated msgspec
+            structs instead of Pydantic models.
         """
         headers = {
             "Authorization": f"Bearer {self._settings.resolved_token}",
         }
-        ws_url = get_ws_url(self._settings.environment)
-        graphql_url = get_graphql_url(self._settings.environment)
+        ws_url = get_ws_url(self._settings.base_url)
+        graphql_url = get_graphql_url(self._settings.base_url)
 
         logger.debug("Initializing GraphQL client for %s", graphql_url)
 
-        return GraphQLClient(
+        client_class = TracedGraphQLClient
+        if self._settings.model_backend == "msgspec":
+            client_class = _struct_client_class()
+
+        return client_class(
             url=graphql_url,
             headers=headers,
             # The generated client only applies `headers` when it builds its own
-            # http client, so they must be set on the custom one as well.
-            http_client=httpx.AsyncClient(headers=headers, timeout=_HTTP_TIMEOUT),
+            # http client; the shared transport adds the token for the GPP host.
+            http_client=self._transport.http_client,
             ws_url=ws_url,
             ws_headers=headers,
             ws_connection_init_payload=headers,
+            tracer=self._tracer,
         )
 
     def _build_rest_client(self) -> RESTClient:
@@ -165,11 +218,23 @@ class GPPClient:
         """
         logger.debug(
             "Initializing REST client for %s",
-            self._settings.environment.base_url,
+            self._settings.base_url,
         )
+        settings = self._settings
+        cache_size = settings.atom_digest_cache_size
         return RESTClient(
-            base_url=self._settings.environment.base_url,
-            gpp_token=self._settings.resolved_token,
+            base_url=settings.base_url,
+            gpp_token=settings.resolved_token,
+            atom_digest_cache=AtomDigestCache(cache_size) if cache_size else None,
+            connect_timeout=_HTTP_TIMEOUT.connect,
+            trace_configs=[self._transport.trace_config()],
+            tracer=self._tracer,
+            connector_options=RESTConnectorOptions(
+                limit=settings.rest_connection_limit,
+                limit_per_host=settings.rest_connection_limit_per_host,
+                ttl_dns_cache=settings.rest_dns_cache_ttl,
+                keepalive_timeout=settings.rest_keepalive_timeout,
+            ),
         )
 
     def _build_domain_kwargs(self) -> dict[str, Any]:
@@ -198,7 +263,7 @@ class GPPClient:
         self.workflow_state = WorkflowStateDomain(**domain_kwargs)
         self.observation = ObservationDomain(**domain_kwargs)
         self.program = ProgramDomain(**domain_kwargs)
-        self.site_status = SiteStatusDomain()
+        self.site_status = SiteStatusDomain(transport=self._transport)
         self.goats = GOATSDomain(**domain_kwargs)
         self.atom = AtomDomain(**domain_kwargs)
         self.attachment = AttachmentDomain(**domain_kwargs)
@@ -227,6 +292,33 @@ class GPPClient:
         """
         return self._rest
 
+    @property
+    def transport(self) -> HTTPTransport:
+        """
+        Access the HTTP transport shared by the GraphQL client and the domains.
+
+        Returns
+        -------
+        HTTPTransport
+            The shared transport instance.
+        """
+        return self._transport
+
+    @property
+    def tracer(self) -> Tracer:
+        """
+        Access the tracer receiving a span for every GraphQL and REST operation.
+
+        Register hooks on it to observe the client, for example an
+        :class:`~gpp_client.tracing.InMemoryCollector`.
+
+        Returns
+        -------
+        Tracer
+            The tracer shared by the GraphQL and REST clients.
+        """
+        return self._tracer
+
     @property
     def settings(self) -> GPPSettings:
         """
@@ -246,12 +338,93 @@ class GPPClient:
         _enable_dev_console_logging()
         logger.debug("Logging enabled for GPPClient")
 
+    def metrics(self) -> ClientMetrics:
+        """
+        Snapshot the client's performance counters.
+
+        Operation latencies, bytes and retries are aggregated from the tracer
+        spans since the client was created, or since :meth:`reset_metrics`. They
+        are empty unless the ``collect_metrics`` or ``metrics_file`` setting is set.
+
+        Returns
+        -------
+        ClientMetrics
+            Per-operation, subscription, cache, connection and transport counters.
+        """
+        operations, subscriptions = {}, {}
+        if self._metrics is not None:
+            operations, subscriptions = self._metrics.snapshot()
+
+        caches = {}
+        if self._rest.atom_digest_cache is not None:
+            stats = self._rest.atom_digest_cache.stats
+            caches["atom_digests"] = CacheMetrics(
+                hits=stats.hits, misses=stats.misses, size=stats.size
+            )
+        stats = self.attachment.download_urls.stats
+        caches["download_urls"] = CacheMetrics(
+            hits=stats.hits, misses=stats.misses, size=stats.size
+        )
+
+        pool = self._rest.pool_stats()
+        return ClientMetrics(
+            operations=operations,
+            subscriptions=subscriptions,
+            caches=caches,
+            connections={
+                "graphql": self._transport.open_connections(),
+                "rest": pool.acquired + pool.idle,
+                "websocket": sum(sub.active for sub in subscriptions.values()),
+            },
+            transport=self._transport.stats(),
+        )
+
+    def reset_metrics(self) -> None:
+        """
+        Forget the operation metrics collected so far.
+        """
+        if self._metrics is not None:
+            self._metrics.reset()
+
+    def _write_metrics_file(self) -> None:
+        """
+        Save the metrics snapshot to the ``metrics_file`` setting, if set.
+        """
+        path = self._settings.metrics_file
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(self.metrics().to_dict(), indent=2))
+        except OSError:
+            logger.warning("Could not write metrics to %s", path, exc_info=True)
+
+    def _write_profile_file(self) -> None:
+        """
+        Save the response profile to the ``profile_file`` setting, if set.
+        """
+        path = self._settings.profile_file
+        if path is None or self._profiler is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(self._profiler.report().to_dict(), indent=2))
+        except OSError:
+            logger.warning("Could not write the profile to %s", path, exc_info=True)
+
     async def close(self) -> None:
         """
         Close any underlying connections held by the client.
+
+        When the ``metrics_file`` or ``profile_file`` settings are set, the
+        metrics snapshot and the response profile are written there first.
         """
         logger.debug("Closing GPPClient connections")
+        self._write_metrics_file()
+        self._write_profile_file()
+        await self.site_status.close()
         await self._rest.close()
+        await self._transport.close()
 
     async def __aenter__(self) -> Self:
         """
@@ -289,3 +462,19 @@ class GPPClient:
         except Exception as exc:
             logger.error("Ping to GPP GraphQL endpoint failed: %s", exc)
             return False, str(exc)
+
+
+def _struct_client_class() -> type[TracedGraphQLClient]:
+    """
+    Import the struct-decoding client, which needs the optional msgspec.
+    """
+    try:
+        from gpp_client.struct_client import TracedStructGraphQLClient
+    except ModuleNotFoundError as exc:
+        if exc.name != "msgspec":
+            raise
+        raise GPPClientError(
+            "The 'msgspec' model backend requires msgspec. Install it with"
+            " 'pip install gpp-client[msgspec]'."
+        ) from exc
+    return TracedStructGraphQLClient
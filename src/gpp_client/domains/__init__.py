@@ -8,12 +8,12 @@ responses.
 """
 
 from .atom import AtomDomain
-from .attachment import AttachmentDomain
+from .attachment import AttachmentDomain, DownloadResult, SyncReport, UploadResult
 from .goats import GOATSDomain
 from .observation import ObservationDomain
 from .program import ProgramDomain
 from .scheduler import SchedulerDomain
-from .site_status import SiteStatusDomain
+from .site_status import SiteStatusChange, SiteStatusDomain
 from .target import TargetDomain
 from .workflow_state import WorkflowStateDomain
 
@@ -25,6 +25,10 @@ __all__ = [
     "ObservationDomain",
     "ProgramDomain",
     "SchedulerDomain",
+    "SiteStatusChange",
     "SiteStatusDomain",
     "AttachmentDomain",
+    "DownloadResult",
+    "SyncReport",
+    "UploadResult",
 ]
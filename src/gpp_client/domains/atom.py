@@ -7,6 +7,7 @@ __all__ = ["AtomDomain"]
 import logging
 
 from gpp_client.domains.base import BaseDomain
+from gpp_client.rest.cache import AtomDigestCacheStats
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +18,12 @@ class AtomDomain(BaseDomain):
     """
 
     async def get_digests(
-        self, *, observation_ids: list[str], accept_gzip: bool = True
+        self,
+        *,
+        observation_ids: list[str],
+        accept_gzip: bool = True,
+        chunk_size: int | None = None,
+        max_concurrency: int | None = None,
     ) -> str:
         """
         Request atom digests for the given observation IDs.
@@ -28,6 +34,12 @@ class AtomDomain(BaseDomain):
              List of observation ID strings.
         accept_gzip : bool, default=True
             Whether to accept gzip compression.
+        chunk_size : int | None, optional
+            Maximum number of observation IDs per request. Defaults to the REST
+            client's chunk size.
+        max_concurrency : int | None, optional
+            Maximum number of chunk requests in flight. Defaults to the REST
+            client's limit.
 
         Returns
         -------
@@ -41,6 +53,40 @@ class AtomDomain(BaseDomain):
         ValueError
             For invalid observation IDs.
         """
-        return await self._rest._get_atom_digest(
-            observation_ids=observation_ids, accept_gzip=accept_gzip
+        options = {}
+        if chunk_size is not None:
+            options["chunk_size"] = chunk_size
+        if max_concurrency is not None:
+            options["max_concurrency"] = max_concurrency
+
+        return await self._rest.get_atom_digests(
+            observation_ids, accept_gzip=accept_gzip, **options
         )
+
+    def invalidate_digests(self, *, observation_ids: list[str]) -> None:
+        """
+        Drop cached atom digests for the given observation IDs.
+
+        Use this when an observation's calculation is known to have changed
+        through a channel other than the client's own subscriptions. Does
+        nothing when the atom digest cache is disabled.
+
+        Parameters
+        ----------
+        observation_ids : list[str]
+            List of observation ID strings.
+        """
+        self._rest.invalidate_atom_digests(observation_ids)
+
+    def get_cache_stats(self) -> AtomDigestCacheStats | None:
+        """
+        Get the atom digest cache counters.
+
+        Returns
+        -------
+        AtomDigestCacheStats | None
+            Hits, misses, evictions and size, or ``None`` when caching is
+            disabled.
+        """
+        cache = self._rest.atom_digest_cache
+        return cache.stats if cache is not None else None
@@ -2,32 +2,67 @@
 Module for attachment-related domain functionality.
 """
 
-__all__ = ["AttachmentDomain"]
+from __future__ import annotations
 
+__all__ = ["AttachmentDomain", "DownloadResult", "SyncReport", "UploadResult"]
+
+import asyncio
+import functools
+import glob
+import hashlib
+import json
 import logging
+import os
+import time
+from collections.abc import AsyncIterator, Callable, Iterable
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
-from aiohttp import ClientHandlerType, ClientRequest, ClientResponse
+from aiohttp import (
+    ClientConnectionError,
+    ClientError,
+    ClientHandlerType,
+    ClientRequest,
+    ClientResponse,
+)
 
 from gpp_client.domains.base import BaseDomain
-from gpp_client.exceptions import GPPClientError, GPPResponseError
-from gpp_client.generated.enums import AttachmentType
-from gpp_client.generated.get_observation_attachments_by_id import (
-    GetObservationAttachmentsById,
-)
-from gpp_client.generated.get_observation_attachments_by_reference import (
-    GetObservationAttachmentsByReference,
+from gpp_client.exceptions import (
+    GPPClientError,
+    GPPError,
+    GPPResponseError,
+    GPPValidationError,
 )
-from gpp_client.generated.get_program_attachments_by_id import (
-    GetProgramAttachmentsById,
-)
-from gpp_client.generated.get_program_attachments_by_proposal_reference import (
-    GetProgramAttachmentsByProposalReference,
-)
-from gpp_client.generated.get_program_attachments_by_reference import (
-    GetProgramAttachmentsByReference,
+from gpp_client.generated.enums import AttachmentType
+from gpp_client.rest.cache import PresignedURLCache
+from gpp_client.rest.client import RESTClient
+from gpp_client.rest.transfer import (
+    DEFAULT_CHUNK_SIZE,
+    AsyncFileWriter,
+    ProgressCallback,
 )
+from gpp_client.settings import GPPSettings
+from gpp_client.tracing import SpanAttribute, current_span
+
+if TYPE_CHECKING:
+    from gpp_client.generated.client import GraphQLClient
+    from gpp_client.generated.get_observation_attachments_by_id import (
+        GetObservationAttachmentsById,
+    )
+    from gpp_client.generated.get_observation_attachments_by_reference import (
+        GetObservationAttachmentsByReference,
+    )
+    from gpp_client.generated.get_program_attachments_by_id import (
+        GetProgramAttachmentsById,
+    )
+    from gpp_client.generated.get_program_attachments_by_proposal_reference import (
+        GetProgramAttachmentsByProposalReference,
+    )
+    from gpp_client.generated.get_program_attachments_by_reference import (
+        GetProgramAttachmentsByReference,
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -35,13 +70,192 @@ DEFAULT_OK: set[int] = {200}
 UPLOAD_OK: set[int] = {200, 201}
 UPDATE_OK: set[int] = {200, 201}
 DELETE_OK: set[int] = {200, 204}
+DOWNLOAD_OK: set[int] = {200, 206}
+
+MANIFEST_NAME = ".gpp-attachments.json"
+# Statuses worth retrying an upload for, besides 5xx.
+RETRYABLE_UPLOAD_STATUSES: set[int] = {408, 429}
+_UPLOAD_RETRY_BACKOFF = 0.5  # Seconds, doubled on each retry.
+
+
+@dataclass(frozen=True)
+class DownloadResult:
+    """
+    Outcome of one attachment download.
+
+    Attributes
+    ----------
+    attachment_id : str
+        The ID of the attachment.
+    path : Path | None
+        Where the file was saved, or ``None`` if the download failed.
+    bytes_received : int
+        Bytes transferred by this download.
+    resumed_from : int
+        Bytes of an earlier partial download that were kept.
+    elapsed : float
+        Wall-clock seconds spent on the download, including the URL lookup.
+    error : str | None
+        Why the download failed, or ``None`` on success.
+    """
+
+    attachment_id: str
+    path: Path | None
+    bytes_received: int = 0
+    resumed_from: int = 0
+    elapsed: float = 0.0
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the download succeeded.
+
+        Returns
+        -------
+        bool
+            ``True`` if the file was saved.
+        """
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class SyncReport:
+    """
+    Outcome of :meth:`AttachmentDomain.sync`.
+
+    Attributes
+    ----------
+    downloaded : list[DownloadResult]
+        Attachments that were new or changed and are now mirrored.
+    unchanged : list[str]
+        IDs of attachments whose mirrored copy was already current.
+    pruned : list[str]
+        IDs of attachments that no longer exist and were removed locally.
+    failed : list[DownloadResult]
+        Downloads that failed; they are retried on the next sync.
+    """
+
+    downloaded: list[DownloadResult] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    pruned: list[str] = field(default_factory=list)
+    failed: list[DownloadResult] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether every attachment was mirrored.
+
+        Returns
+        -------
+        bool
+            ``True`` if no download failed.
+        """
+        return not self.failed
+
+
+@dataclass(frozen=True)
+class UploadResult:
+    """
+    Outcome of one upload of :meth:`AttachmentDomain.upload_many`.
+
+    Attributes
+    ----------
+    path : Path
+        The uploaded file.
+    attachment_id : str | None
+        The created attachment ID, or ``None`` if the upload failed.
+    bytes_sent : int
+        Size of the uploaded file in bytes.
+    attempts : int
+        Number of attempts made, including retries.
+    elapsed : float
+        Wall-clock seconds spent on the upload, including retries.
+    error : str | None
+        Why the last attempt failed, or ``None`` on success.
+    """
+
+    path: Path
+    attachment_id: str | None = None
+    bytes_sent: int = 0
+    attempts: int = 0
+    elapsed: float = 0.0
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the upload succeeded.
+
+        Returns
+        -------
+        bool
+            ``True`` if the attachment was created.
+        """
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class _UploadEntry:
+    """
+    One file of a batch upload and the attachment to create from it.
+    """
+
+    path: Path
+    file_name: str
+    attachment_type: AttachmentType
+    description: str | None
+
+
+def _traced(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Run a transfer method inside a REST span called ``name``.
+
+    Request and response bytes are counted on the span like those of
+    :class:`~gpp_client.rest.client.RESTClient` requests.
+    """
+
+    def decorate(method: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(method)
+        async def traced(self: AttachmentDomain, *args: Any, **kwargs: Any) -> Any:
+            with self._rest.tracer.span(name, kind="rest"):
+                return await method(self, *args, **kwargs)
+
+        return traced
+
+    return decorate
 
 
 class AttachmentDomain(BaseDomain):
     """
     Domain class for attachment-related operations.
+
+    Presigned download URLs are cached per attachment until shortly before
+    their signature expires, so repeated downloads skip the URL lookup.
+
+    Parameters
+    ----------
+    graphql : GraphQLClient
+        The GraphQL client instance for making API requests.
+    rest : RESTClient
+        The REST client instance for making API requests.
+    settings : GPPSettings
+        The settings instance containing configuration options.
+    url_expiry_margin : float, default=60.0
+        Seconds before expiry at which a cached download URL is refreshed.
     """
 
+    def __init__(
+        self,
+        *,
+        graphql: GraphQLClient,
+        rest: RESTClient,
+        settings: GPPSettings,
+        url_expiry_margin: float = 60.0,
+    ) -> None:
+        super().__init__(graphql=graphql, rest=rest, settings=settings)
+        self.download_urls = PresignedURLCache(margin=url_expiry_margin)
+
     async def upload(
         self,
         program_id: str,
@@ -51,6 +265,8 @@ class AttachmentDomain(BaseDomain):
         description: str | None = None,
         file_path: str | Path | None = None,
         content: bytes | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: ProgressCallback | None = None,
     ) -> str:
         """
         Upload a new attachment for a program.
@@ -69,6 +285,10 @@ class AttachmentDomain(BaseDomain):
             Path to a file whose contents will be uploaded. Mutually exclusive with ``content``.
         content : bytes | None, optional
             Raw bytes to upload. Mutually exclusive with ``file_path``.
+        chunk_size : int, default=1 MB
+            The chunk size for streaming ``file_path`` in bytes.
+        progress : ProgressCallback | None, optional
+            Called as ``progress(sent, total)`` while ``file_path`` is streamed.
 
         Returns
         -------
@@ -89,7 +309,13 @@ class AttachmentDomain(BaseDomain):
             file_name,
         )
 
-        body = self.resolve_content(file_path=file_path, content=content)
+        # Stream files from disk instead of reading them into memory.
+        body, size = await self.resolve_upload_body(
+            file_path=file_path,
+            content=content,
+            chunk_size=chunk_size,
+            progress=progress,
+        )
 
         params = _build_upload_params(
             program_id=program_id,
@@ -98,28 +324,117 @@ class AttachmentDomain(BaseDomain):
             description=description,
         )
 
-        session = await self._rest.get_session()
-        url = "/attachment"
-
         try:
-            async with session.post(url, params=params, data=body) as response:
-                await self.raise_for_status(response, ok_statuses=UPLOAD_OK)
-                text = await response.text()
-
-                attachment_id = text.strip()
-                if not attachment_id:
-                    raise GPPClientError(
-                        "Upload attachment returned an empty attachment id."
-                    )
-
-                logger.debug("Uploaded attachment id=%s", attachment_id)
-                return attachment_id
-
+            return await self._post_upload(params, body, size)
         except GPPResponseError:
             raise
         except Exception as exc:
             self.raise_error(GPPClientError, exc)
 
+    async def upload_many(
+        self,
+        program_id: str,
+        paths: str | Path | Iterable[str | Path] | None = None,
+        *,
+        attachment_type: AttachmentType,
+        description: str | None = None,
+        manifest: str | Path | None = None,
+        concurrency: int = 4,
+        retries: int = 2,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> list[UploadResult]:
+        """
+        Upload several files as attachments of a program in parallel.
+
+        Each file is streamed from disk like :meth:`upload` and stored under its
+        own name. Uploads failing with a transient error (connection failure,
+        timeout, 408, 429 or 5xx) are retried with exponential backoff. A failed
+        upload does not stop the others; its error is reported in its result.
+
+        Parameters
+        ----------
+        program_id : str
+            The program ID to associate the attachments with.
+        paths : str | Path | Iterable[str | Path] | None, optional
+            The files to upload: a directory (its files are uploaded), a glob
+            pattern such as ``"data/**/*.fits"``, or an iterable of file paths.
+            Mutually exclusive with ``manifest``.
+        attachment_type : AttachmentType
+            The attachment type, unless a manifest entry sets its own.
+        description : str | None, optional
+            Description for every attachment, unless a manifest entry sets its
+            own.
+        manifest : str | Path | None, optional
+            A file listing the uploads. A ``.json`` manifest holds a list of
+            paths or of objects with ``path`` and optional ``file_name``,
+            ``attachment_type`` and ``description``; any other file lists one
+            path per line. Relative paths are resolved against the manifest's
+            directory. Mutually exclusive with ``paths``.
+        concurrency : int, default=4
+            Maximum number of uploads in flight at once.
+        retries : int, default=2
+            Number of extra attempts for an upload that fails with a transient
+            error.
+        chunk_size : int, default=1 MB
+            The chunk size for streaming each file in bytes.
+
+        Returns
+        -------
+        list[UploadResult]
+            One result per file, in input order, with the created attachment IDs.
+
+        Raises
+        ------
+        GPPValidationError
+            If both or neither of ``paths`` and ``manifest`` are given, the
+            manifest is invalid, or ``concurrency`` or ``retries`` is out of range.
+        """
+        try:
+            if (paths is None) == (manifest is None):
+                raise ValueError("Provide exactly one of 'paths' or 'manifest'.")
+            if concurrency < 1:
+                raise ValueError("concurrency must be a positive integer.")
+            if retries < 0:
+                raise ValueError("retries must not be negative.")
+
+            if manifest is not None:
+                entries = await asyncio.to_thread(_read_upload_manifest, Path(manifest))
+            else:
+                entries = [
+                    {"path": path}
+                    for path in await asyncio.to_thread(_expand_upload_paths, paths)
+                ]
+            uploads = [
+                _UploadEntry(
+                    path=entry["path"],
+                    file_name=entry.get("file_name") or entry["path"].name,
+                    attachment_type=AttachmentType(
+                        entry.get("attachment_type", attachment_type)
+                    ),
+                    description=entry.get("description", description),
+                )
+                for entry in entries
+            ]
+        except (ValueError, TypeError, KeyError, OSError) as exc:
+            self.raise_error(GPPValidationError, exc)
+
+        logger.debug(
+            "Uploading %d attachments for program %s (concurrency=%d)",
+            len(uploads),
+            program_id,
+            concurrency,
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def upload(entry: _UploadEntry) -> UploadResult:
+            async with semaphore:
+                return await self._upload_with_retry(
+                    program_id, entry, retries=retries, chunk_size=chunk_size
+                )
+
+        return list(await asyncio.gather(*(upload(entry) for entry in uploads)))
+
+    @_traced("delete_attachment")
     async def delete_by_id(self, attachment_id: str) -> None:
         """
         Delete an attachment by its ID.
@@ -141,6 +456,7 @@ class AttachmentDomain(BaseDomain):
         try:
             async with session.delete(url) as response:
                 await self.raise_for_status(response, ok_statuses=DELETE_OK)
+                self.download_urls.invalidate([attachment_id])
 
                 logger.debug(
                     "Deleted attachment %s",
@@ -151,6 +467,7 @@ class AttachmentDomain(BaseDomain):
         except Exception as exc:
             self.raise_error(GPPClientError, exc)
 
+    @_traced("update_attachment")
     async def update_by_id(
         self,
         attachment_id: str,
@@ -159,6 +476,8 @@ class AttachmentDomain(BaseDomain):
         description: str | None = None,
         file_path: str | Path | None = None,
         content: bytes | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: ProgressCallback | None = None,
     ) -> None:
         """
         Update an attachment by its ID.
@@ -175,6 +494,10 @@ class AttachmentDomain(BaseDomain):
             The path to the new file content for the attachment.
         content : bytes | None, optional
             The new file content as bytes.
+        chunk_size : int, default=1 MB
+            The chunk size for streaming ``file_path`` in bytes.
+        progress : ProgressCallback | None, optional
+            Called as ``progress(sent, total)`` while ``file_path`` is streamed.
 
         Raises
         ------
@@ -184,7 +507,12 @@ class AttachmentDomain(BaseDomain):
             If a validation error occurs.
         """
         logger.debug("Updating attachment %s", attachment_id)
-        body = self.resolve_content(file_path=file_path, content=content)
+        body, size = await self.resolve_upload_body(
+            file_path=file_path,
+            content=content,
+            chunk_size=chunk_size,
+            progress=progress,
+        )
         # File name is required.
         params = _build_update_params(file_name=file_name, description=description)
 
@@ -192,8 +520,11 @@ class AttachmentDomain(BaseDomain):
         url = f"/attachment/{attachment_id}"
 
         try:
-            async with session.put(url, params=params, data=body) as response:
+            async with session.put(
+                url, params=params, data=body, headers=_content_length(size)
+            ) as response:
                 await self.raise_for_status(response, ok_statuses=UPDATE_OK)
+                self.download_urls.invalidate([attachment_id])
 
                 logger.debug(
                     "Updated attachment %s",
@@ -204,10 +535,39 @@ class AttachmentDomain(BaseDomain):
         except Exception as exc:
             self.raise_error(GPPClientError, exc)
 
-    async def get_download_url_by_id(self, attachment_id: str) -> str:
+    async def get_download_url_by_id(
+        self, attachment_id: str, *, use_cache: bool = True
+    ) -> str:
         """
         Get the download URL for an attachment by its ID.
 
+        Parameters
+        ----------
+        attachment_id : str
+            The ID of the attachment.
+        use_cache : bool, default=True
+            Whether a cached URL that has not expired may be returned.
+
+        Returns
+        -------
+        str
+            The download URL for the attachment.
+        """
+        if use_cache:
+            cached = self.download_urls.get(attachment_id)
+            if cached is not None:
+                logger.debug("Using cached download URL for %s", attachment_id)
+                return cached
+
+        download_url = await self._fetch_download_url(attachment_id)
+        self.download_urls.store(attachment_id, download_url)
+        return download_url
+
+    @_traced("get_attachment_download_url")
+    async def _fetch_download_url(self, attachment_id: str) -> str:
+        """
+        Request the presigned download URL of an attachment.
+
         Parameters
         ----------
         attachment_id : str
@@ -225,24 +585,71 @@ class AttachmentDomain(BaseDomain):
         try:
             async with session.get(url) as response:
                 await self.raise_for_status(response, ok_statuses=DEFAULT_OK)
-                download_url = await response.text()
+                return await response.text()
         except GPPResponseError:
             raise
         except Exception as exc:
             self.raise_error(GPPClientError, exc)
 
-        return download_url
+    async def prefetch_download_urls(
+        self, attachment_ids: Iterable[str], *, concurrency: int = 16
+    ) -> None:
+        """
+        Look up and cache the download URLs of several attachments up front.
+
+        Attachments whose URL is already cached are skipped. Failed lookups are
+        logged and left for the download itself to retry and report.
+
+        Parameters
+        ----------
+        attachment_ids : Iterable[str]
+            The IDs of the attachments.
+        concurrency : int, default=16
+            Maximum number of lookups in flight at once.
+
+        Raises
+        ------
+        GPPValidationError
+            If ``concurrency`` is not positive.
+        """
+        if concurrency < 1:
+            self.raise_error(
+                GPPValidationError,
+                ValueError("concurrency must be a positive integer."),
+            )
+
+        missing = [
+            attachment_id
+            for attachment_id in dict.fromkeys(attachment_ids)
+            if self.download_urls.get(attachment_id) is None
+        ]
+        logger.debug("Prefetching %d download URLs", len(missing))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(attachment_id: str) -> None:
+            async with semaphore:
+                try:
+                    await self.get_download_url_by_id(attachment_id, use_cache=False)
+                except (GPPError, ClientError, asyncio.TimeoutError, OSError) as exc:
+                    logger.debug("Prefetch of %s failed: %s", attachment_id, exc)
+
+        await asyncio.gather(*(fetch(attachment_id) for attachment_id in missing))
 
     async def download_by_id(
         self,
         attachment_id: str,
         save_to: str | Path | None = None,
         overwrite: bool = False,
-        chunk_size: int = 1024 * 1024,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
     ) -> Path:
         """
         Download an attachment by its ID.
 
+        The file is written next to its destination with a ``.part`` suffix and
+        renamed into place once complete. An interrupted download leaves the
+        ``.part`` file behind and the next attempt resumes it with a ``Range``
+        request, unless the attachment changed in the meantime.
+
         Parameters
         ----------
         attachment_id : str
@@ -259,50 +666,591 @@ class AttachmentDomain(BaseDomain):
         Path
             The path to the downloaded file.
         """
+        result = await self._download(
+            attachment_id,
+            save_to=save_to,
+            overwrite=overwrite,
+            chunk_size=chunk_size,
+        )
+        return result.path  # type: ignore[return-value]
+
+    async def download_many(
+        self,
+        attachment_ids: Iterable[str],
+        save_to: str | Path | None = None,
+        *,
+        concurrency: int = 4,
+        overwrite: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> list[DownloadResult]:
+        """
+        Download several attachments in parallel.
+
+        Each download behaves like :meth:`download_by_id`. A failed download does
+        not stop the others; its error is reported in its result.
+
+        Parameters
+        ----------
+        attachment_ids : Iterable[str]
+            The IDs of the attachments. Duplicates are downloaded once.
+        save_to : str | Path | None, optional
+            The directory to save the attachments to. If ``None``, defaults to home directory.
+        concurrency : int, default=4
+            Maximum number of downloads in flight at once.
+        overwrite : bool, default=False
+            Whether to overwrite files that already exist.
+        chunk_size : int, default=1 MB
+            The chunk size for downloading each file in bytes.
+
+        Returns
+        -------
+        list[DownloadResult]
+            One result per attachment, in input order.
+
+        Raises
+        ------
+        GPPValidationError
+            If ``concurrency`` is not positive.
+        """
+        ids = list(dict.fromkeys(attachment_ids))
+        return await self._download_batch(
+            {attachment_id: save_to for attachment_id in ids},
+            concurrency=concurrency,
+            overwrite=overwrite,
+            chunk_size=chunk_size,
+        )
+
+    async def sync(
+        self,
+        dest_dir: str | Path,
+        *,
+        program_id: str | None = None,
+        observation_id: str | None = None,
+        concurrency: int = 4,
+        prune: bool = True,
+        verify_checksums: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> SyncReport:
+        """
+        Mirror the attachments of a program or observation into a directory.
+
+        A manifest in ``dest_dir`` records the ID, file name, update time, size
+        and SHA-256 checksum of every mirrored attachment. Only attachments that
+        are new, whose file name, update time or size changed, or whose local
+        file is missing or altered are downloaded. Each attachment is saved as
+        ``<dest_dir>/<attachment id>/<file name>``, and the file of a renamed
+        attachment is replaced.
+
+        Parameters
+        ----------
+        dest_dir : str | Path
+            The mirror directory.
+        program_id : str | None, optional
+            Mirror the attachments of this program. Mutually exclusive with
+            ``observation_id``.
+        observation_id : str | None, optional
+            Mirror the attachments of this observation. Mutually exclusive with
+            ``program_id``.
+        concurrency : int, default=4
+            Maximum number of downloads in flight at once.
+        prune : bool, default=True
+            Whether to delete mirrored files of attachments that no longer exist.
+        verify_checksums : bool, default=False
+            Whether to hash unchanged local files and re-download any whose
+            checksum no longer matches the manifest. Otherwise only their size is
+            checked.
+        chunk_size : int, default=1 MB
+            The chunk size for downloading each file in bytes.
+
+        Returns
+        -------
+        SyncReport
+            What was downloaded, left unchanged, pruned or failed.
+
+        Raises
+        ------
+        GPPValidationError
+            If both or neither of ``program_id`` and ``observation_id`` are given,
+            or ``concurrency`` is not positive.
+        GPPClientError
+            If the program or observation does not exist or the manifest is
+            unreadable.
+        """
+        if (program_id is None) == (observation_id is None):
+            self.raise_error(
+                GPPValidationError,
+                ValueError("Provide exactly one of 'program_id' or 'observation_id'."),
+            )
+
+        if program_id is not None:
+            result = await self.get_all_by_program_id(program_id)
+            owner = result.program
+        else:
+            result = await self.get_all_by_observation_id(observation_id)
+            owner = result.observation
+        if owner is None:
+            kind = "Program" if program_id is not None else "Observation"
+            raise GPPClientError(f"{kind} {program_id or observation_id} not found.")
+
+        root = Path(dest_dir).expanduser()
+        manifest_path = root / MANIFEST_NAME
+        manifest = await asyncio.to_thread(_read_manifest, manifest_path)
+        remote = {str(attachment.id): attachment for attachment in owner.attachments}
+
+        stale: list[str] = []
+        unchanged: list[str] = []
+        for attachment_id, attachment in remote.items():
+            entry = manifest.get(attachment_id)
+            if entry is None or not _entry_matches(entry, attachment):
+                stale.append(attachment_id)
+            elif await asyncio.to_thread(
+                _local_file_matches, root, entry, verify_checksums
+            ):
+                unchanged.append(attachment_id)
+            else:
+                logger.debug("Local copy of %s changed, downloading", attachment_id)
+                stale.append(attachment_id)
+
+        logger.debug(
+            "Attachment sync: %d to download, %d unchanged", len(stale), len(unchanged)
+        )
+        results = await self._download_batch(
+            {attachment_id: root / attachment_id for attachment_id in stale},
+            concurrency=concurrency,
+            overwrite=True,
+            chunk_size=chunk_size,
+        )
+
+        downloaded: list[DownloadResult] = []
+        failed: list[DownloadResult] = []
+        for download in results:
+            if not download.ok:
+                failed.append(download)
+                continue
+            downloaded.append(download)
+            attachment = remote[download.attachment_id]
+            previous = manifest.get(download.attachment_id)
+            if previous is not None and root / previous["path"] != download.path:
+                # Renamed upstream: the old file no longer mirrors anything.
+                await asyncio.to_thread(_remove_mirrored_file, root, previous)
+            manifest[download.attachment_id] = {
+                "path": download.path.relative_to(root).as_posix(),  # type: ignore[union-attr]
+                "file_name": str(attachment.file_name),
+                "updated_at": str(attachment.updated_at),
+                "size": int(attachment.file_size),
+                "sha256": await asyncio.to_thread(_sha256, download.path),
+            }
+
+        pruned: list[str] = []
+        if prune:
+            for attachment_id in [a_id for a_id in manifest if a_id not in remote]:
+                entry = manifest.pop(attachment_id)
+                await asyncio.to_thread(_remove_mirrored_file, root, entry)
+                pruned.append(attachment_id)
+
+        await asyncio.to_thread(_write_manifest, manifest_path, manifest)
+        return SyncReport(
+            downloaded=downloaded,
+            unchanged=unchanged,
+            pruned=pruned,
+            failed=failed,
+        )
+
+    @_traced("upload_attachment")
+    async def _post_upload(
+        self,
+        params: dict[str, str],
+        body: bytes | AsyncIterator[bytes],
+        size: int,
+    ) -> str:
+        """
+        Post an attachment body to ``/attachment``.
+
+        Parameters
+        ----------
+        params : dict[str, str]
+            The upload query parameters.
+        body : bytes | AsyncIterator[bytes]
+            The file content, in memory or streamed.
+        size : int
+            The content size in bytes.
+
+        Returns
+        -------
+        str
+            The created attachment ID.
+
+        Raises
+        ------
+        GPPResponseError
+            If the service rejects the upload.
+        GPPClientError
+            If the response holds no attachment ID.
+        """
+        session = await self._rest.get_session()
+        async with session.post(
+            "/attachment", params=params, data=body, headers=_content_length(size)
+        ) as response:
+            await self.raise_for_status(response, ok_statuses=UPLOAD_OK)
+            text = await response.text()
+
+        attachment_id = text.strip()
+        if not attachment_id:
+            raise GPPClientError("Upload attachment returned an empty attachment id.")
+
+        logger.debug("Uploaded attachment id=%s", attachment_id)
+        return attachment_id
+
+    async def _upload_with_retry(
+        self,
+        program_id: str,
+        entry: _UploadEntry,
+        *,
+        retries: int,
+        chunk_size: int,
+    ) -> UploadResult:
+        """
+        Upload one file of a batch, retrying transient failures.
+
+        Parameters
+        ----------
+        program_id : str
+            The program ID to associate the attachment with.
+        entry : _UploadEntry
+            The file and its attachment metadata.
+        retries : int
+            Number of extra attempts after the first failure.
+        chunk_size : int
+            The chunk size for streaming the file in bytes.
+
+        Returns
+        -------
+        UploadResult
+            The created attachment ID, or the error of the last attempt.
+        """
+        params = _build_upload_params(
+            program_id=program_id,
+            attachment_type=entry.attachment_type,
+            file_name=entry.file_name,
+            description=entry.description,
+        )
+        started = time.perf_counter()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                # The stream is consumed by each attempt; open the file anew.
+                body, size = await self.resolve_upload_body(
+                    file_path=entry.path, content=None, chunk_size=chunk_size
+                )
+                attachment_id = await self._post_upload(params, body, size)
+                return UploadResult(
+                    path=entry.path,
+                    attachment_id=attachment_id,
+                    bytes_sent=size,
+                    attempts=attempt,
+                    elapsed=time.perf_counter() - started,
+                )
+            except (GPPError, ClientError, asyncio.TimeoutError, OSError) as exc:
+                if attempt > retries or not _is_transient_upload_error(exc):
+                    logger.warning("Upload of %s failed: %s", entry.path, exc)
+                    return UploadResult(
+                        path=entry.path,
+                        attempts=attempt,
+                        elapsed=time.perf_counter() - started,
+                        error=str(exc) or type(exc).__name__,
+                    )
+                delay = _UPLOAD_RETRY_BACKOFF * 2 ** (attempt - 1)
+                logger.warning(
+                    "Upload of %s failed (%s), retry %d/%d in %.1fs",
+                    entry.path,
+                    exc,
+                    attempt,
+                    retries,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+
+    async def _download_batch(
+        self,
+        targets: dict[str, str | Path | None],
+        *,
+        concurrency: int,
+        overwrite: bool,
+        chunk_size: int,
+    ) -> list[DownloadResult]:
+        """
+        Download attachments in parallel, each into its own directory.
+
+        Parameters
+        ----------
+        targets : dict[str, str | Path | None]
+            Destination directory keyed by attachment ID.
+        concurrency : int
+            Maximum number of downloads in flight at once.
+        overwrite : bool
+            Whether to overwrite files that already exist.
+        chunk_size : int
+            The chunk size for downloading each file in bytes.
+
+        Returns
+        -------
+        list[DownloadResult]
+            One result per attachment, in the order of ``targets``.
+        """
+        if concurrency < 1:
+            self.raise_error(
+                GPPValidationError,
+                ValueError("concurrency must be a positive integer."),
+            )
+
+        logger.debug(
+            "Downloading %d attachments (concurrency=%d)", len(targets), concurrency
+        )
+        # URL lookups are cheap; resolve them all before the transfers start.
+        await self.prefetch_download_urls(targets)
+        semaphore = asyncio.Semaphore(concurrency)
+        # Attachments resolving to the same file name must not share a .part file.
+        claimed: set[Path] = set()
+
+        async def download(attachment_id: str) -> DownloadResult:
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    return await self._download(
+                        attachment_id,
+                        save_to=targets[attachment_id],
+                        overwrite=overwrite,
+                        chunk_size=chunk_size,
+                        claimed=claimed,
+                    )
+                except (
+                    GPPError,
+                    ValueError,
+                    ClientError,
+                    asyncio.TimeoutError,
+                    OSError,
+                ) as exc:
+                    logger.warning(
+                        "Download of attachment %s failed: %s", attachment_id, exc
+                    )
+                    return DownloadResult(
+                        attachment_id=attachment_id,
+                        path=None,
+                        elapsed=time.perf_counter() - started,
+                        error=str(exc) or type(exc).__name__,
+                    )
+
+        return list(await asyncio.gather(*(download(a_id) for a_id in targets)))
+
+    @_traced("download_attachment")
+    async def _download(
+        self,
+        attachment_id: str,
+        *,
+        save_to: str | Path | None,
+        overwrite: bool,
+        chunk_size: int,
+        claimed: set[Path] | None = None,
+    ) -> DownloadResult:
+        """
+        Download one attachment and report what was transferred.
+
+        Parameters
+        ----------
+        attachment_id : str
+            The ID of the attachment.
+        save_to : str | Path | None
+            The directory to save the attachment to.
+        overwrite : bool
+            Whether to overwrite the file if it already exists.
+        chunk_size : int
+            The chunk size for downloading the file in bytes.
+        claimed : set[Path] | None, optional
+            Destination paths already used by other downloads of the same batch.
+
+        Returns
+        -------
+        DownloadResult
+            The saved path, byte counts and timing.
+        """
         logger.debug("Downloading attachment %s", attachment_id)
+        started = time.perf_counter()
         session = await self._rest.get_session()
         download_url = await self.get_download_url_by_id(attachment_id)
 
         # Get the filename and resolve the destination directory.
+        # The filesystem calls run in worker threads, like the file writes, since
+        # they can block for long on network filesystems.
         filename = _filename_from_presigned_url(download_url)
-        dest_dir = _resolve_download_dir(save_to)
+        dest_dir = await asyncio.to_thread(_resolve_download_dir, save_to)
         logger.debug("Resolved download directory: %s", dest_dir)
         path = dest_dir / filename
 
         # Create the destination directory if it doesn't exist.
-        dest_dir.mkdir(parents=True, exist_ok=True)
+        await asyncio.to_thread(dest_dir.mkdir, parents=True, exist_ok=True)
 
-        # Check if the file exists and handle overwrite option.
-        if path.exists():
+        if claimed is not None:
+            if path in claimed:
+                raise GPPClientError(
+                    f"Another attachment in this batch is also saved as {path}."
+                )
+            claimed.add(path)
+
+        # Check if the file exists and handle overwrite option. An existing file
+        # is replaced only once the new one is complete.
+        if await asyncio.to_thread(path.exists):
             if not overwrite:
                 raise GPPClientError(
                     f"File {path} already exists and overwrite is set to False."
                 )
             logger.debug("File %s exists, overwriting.", path)
-            path.unlink()
 
         # Use the presigned URL to download the attachment content.
         try:
-            async with session.get(
-                download_url,
-                middlewares=(_remove_headers_middleware,),
-            ) as response:
-                await self.raise_for_status(response, ok_statuses=DEFAULT_OK)
-
-                # Download the file in chunks to avoid loading it all into memory.
-                with path.open("wb") as fh:
-                    async for chunk in response.content.iter_chunked(chunk_size):
-                        fh.write(chunk)
-
-                logger.info("Downloaded %s", path)
-
-            return path
-
+            try:
+                received, resumed_from = await self._fetch_to_file(
+                    session, download_url, path, chunk_size=chunk_size
+                )
+            except GPPResponseError as exc:
+                if exc.status_code != 403:
+                    raise
+                # The URL was rejected, most likely expired: retry with a new one.
+                logger.debug("Download URL for %s rejected, refreshing", attachment_id)
+                self.download_urls.invalidate([attachment_id])
+                download_url = await self.get_download_url_by_id(
+                    attachment_id, use_cache=False
+                )
+                received, resumed_from = await self._fetch_to_file(
+                    session, download_url, path, chunk_size=chunk_size
+                )
         except GPPResponseError:
             raise
         except Exception as exc:
             self.raise_error(GPPClientError, exc, include_traceback=True)
 
+        logger.info("Downloaded %s", path)
+        return DownloadResult(
+            attachment_id=attachment_id,
+            path=path,
+            bytes_received=received,
+            resumed_from=resumed_from,
+            elapsed=time.perf_counter() - started,
+        )
+
+    async def _fetch_to_file(
+        self,
+        session,
+        download_url: str,
+        path: Path,
+        *,
+        chunk_size: int,
+        resume: bool = True,
+    ) -> tuple[int, int]:
+        """
+        Fetch a presigned URL into ``path``, resuming a partial download.
+
+        A partial download is resumed only with an ``If-Range`` validator saved
+        when it started, and only if the server answers with the expected
+        ``Content-Range``. Otherwise it is discarded and fetched from the start,
+        so bytes of two versions of a file are never joined.
+
+        Parameters
+        ----------
+        session : aiohttp.ClientSession
+            The REST session.
+        download_url : str
+            The presigned download URL.
+        path : Path
+            The final file path.
+        chunk_size : int
+            The chunk size for downloading the file in bytes.
+        resume : bool, default=True
+            Whether to resume a leftover ``.part`` file.
+
+        Returns
+        -------
+        int
+            Bytes received in this call.
+        int
+            Bytes already on disk that the download resumed from.
+
+        Raises
+        ------
+        GPPClientError
+            If a response to a request without ``Range`` is partial.
+        """
+        part = _partial_path(path)
+        offset = await asyncio.to_thread(_file_size, part) if resume else 0
+        state = await asyncio.to_thread(_read_partial_state, part) if offset else {}
+        if offset and not state.get("validator"):
+            # Without a validator the partial content cannot be matched to the
+            # remote file.
+            logger.debug("No validator for %s, restarting download", part)
+            offset = 0
+        headers = (
+            {"Range": f"bytes={offset}-", "If-Range": state["validator"]}
+            if offset
+            else None
+        )
+        received = 0
+
+        async with session.get(
+            download_url,
+            headers=headers,
+            middlewares=(_remove_headers_middleware,),
+        ) as response:
+            if offset and response.status == 416:
+                # Nothing left to fetch, unless the remote file changed size.
+                total = _content_range_total(response.headers.get("Content-Range"))
+                stale = total != offset
+            else:
+                await self.raise_for_status(response, ok_statuses=DOWNLOAD_OK)
+                if response.status == 206:
+                    stale = not _content_range_resumes(
+                        response.headers.get("Content-Range"),
+                        offset,
+                        state.get("size"),
+                    )
+                else:
+                    # A full response, because nothing was resumed, the server
+                    # ignored the range or the validator no longer matches.
+                    stale = False
+                    offset = 0
+                    state = _download_validators(response.headers)
+                    await asyncio.to_thread(_write_partial_state, part, state)
+
+                if not stale:
+                    # Download the file in chunks to avoid loading it all into
+                    # memory, writing from a worker thread to keep disk I/O off
+                    # the loop.
+                    span = current_span()
+                    mode = "ab" if offset else "wb"
+                    async with AsyncFileWriter(part, mode) as writer:
+                        async for chunk in response.content.iter_chunked(chunk_size):
+                            await writer.write(chunk)
+                            received += len(chunk)
+                            if span is not None:
+                                # Streamed bodies are not counted by the session.
+                                span.add(SpanAttribute.RESPONSE_BYTES, len(chunk))
+
+        if stale:
+            if not offset:
+                raise GPPClientError(
+                    f"Unexpected partial response for {path.name} without a range."
+                )
+            logger.debug("Discarding stale partial download %s", part)
+            await asyncio.to_thread(_discard_partial, part)
+            return await self._fetch_to_file(
+                session, download_url, path, chunk_size=chunk_size, resume=False
+            )
+
+        if offset:
+            logger.debug("Resumed %s from byte %d", path, offset)
+        await asyncio.to_thread(os.replace, part, path)
+        await asyncio.to_thread(_discard_partial, part)
+        return received, offset
+
     async def get_all_by_observation_id(
         self,
         observation_id: str,
@@ -435,6 +1383,430 @@ async def _remove_headers_middleware(
     return await handler(req)
 
 
+def _content_length(size: int) -> dict[str, str]:
+    """
+    Build the ``Content-Length`` header for an upload body.
+
+    Streamed bodies have no known length, and ``aiohttp`` would otherwise fall
+    back to chunked transfer encoding, which not every server or proxy accepts.
+
+    Parameters
+    ----------
+    size : int
+        The body size in bytes.
+
+    Returns
+    -------
+    dict[str, str]
+        The request headers.
+    """
+    return {"Content-Length": str(size)}
+
+
+def _partial_path(path: Path) -> Path:
+    """
+    Return the temporary path a download is written to before the rename.
+
+    Parameters
+    ----------
+    path : Path
+        The final file path.
+
+    Returns
+    -------
+    Path
+        The same path with a ``.part`` suffix appended.
+    """
+    return path.with_name(path.name + ".part")
+
+
+def _partial_state_path(part: Path) -> Path:
+    """
+    Return the file recording the validator and size of a partial download.
+
+    Parameters
+    ----------
+    part : Path
+        The ``.part`` file.
+
+    Returns
+    -------
+    Path
+        The same path with a ``.json`` suffix appended.
+    """
+    return part.with_name(part.name + ".json")
+
+
+def _read_partial_state(part: Path) -> dict[str, Any]:
+    """
+    Read the validator and size saved for a partial download.
+
+    Parameters
+    ----------
+    part : Path
+        The ``.part`` file.
+
+    Returns
+    -------
+    dict[str, Any]
+        The saved ``validator`` and ``size``, or an empty dict if there is no
+        readable state.
+    """
+    try:
+        state = json.loads(_partial_state_path(part).read_text())
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def _write_partial_state(part: Path, state: dict[str, Any]) -> None:
+    """
+    Save the validator and size of a partial download next to it.
+
+    Parameters
+    ----------
+    part : Path
+        The ``.part`` file.
+    state : dict[str, Any]
+        The ``validator`` and ``size`` from :func:`_download_validators`.
+    """
+    _partial_state_path(part).write_text(json.dumps(state))
+
+
+def _discard_partial(part: Path) -> None:
+    """
+    Delete a partial download and its saved state, if present.
+
+    Parameters
+    ----------
+    part : Path
+        The ``.part`` file.
+    """
+    part.unlink(missing_ok=True)
+    _partial_state_path(part).unlink(missing_ok=True)
+
+
+def _download_validators(headers: Any) -> dict[str, Any]:
+    """
+    Extract what identifies the downloaded version of a file from its headers.
+
+    Parameters
+    ----------
+    headers : Mapping[str, str]
+        Headers of a complete (``200``) download response.
+
+    Returns
+    -------
+    dict[str, Any]
+        The ``If-Range`` ``validator``, a strong ``ETag`` or else
+        ``Last-Modified`` (``None`` if neither is sent), and the file ``size``
+        (``None`` if unknown).
+    """
+    etag = headers.get("ETag")
+    if not etag or etag.startswith("W/"):
+        # Weak entity tags cannot be used with If-Range.
+        etag = None
+    length = headers.get("Content-Length")
+    return {
+        "validator": etag or headers.get("Last-Modified"),
+        "size": int(length) if length and length.isdigit() else None,
+    }
+
+
+def _is_transient_upload_error(exc: BaseException) -> bool:
+    """
+    Return whether an upload failure is worth retrying.
+
+    Parameters
+    ----------
+    exc : BaseException
+        The error of the failed attempt.
+
+    Returns
+    -------
+    bool
+        ``True`` for connection failures, timeouts and retryable statuses.
+    """
+    if isinstance(exc, GPPResponseError):
+        return exc.status_code >= 500 or exc.status_code in RETRYABLE_UPLOAD_STATUSES
+    return isinstance(exc, (ClientConnectionError, asyncio.TimeoutError))
+
+
+def _expand_upload_paths(paths: str | Path | Iterable[str | Path]) -> list[Path]:
+    """
+    Expand a directory, glob pattern or list of paths into files to upload.
+
+    Parameters
+    ----------
+    paths : str | Path | Iterable[str | Path]
+        A directory, a glob pattern or an iterable of file paths.
+
+    Returns
+    -------
+    list[Path]
+        The files, without duplicates. Directories and patterns are expanded in
+        sorted order; an explicit list keeps its order.
+    """
+    if isinstance(paths, (str, Path)):
+        path = Path(paths).expanduser()
+        if path.is_dir():
+            return sorted(child for child in path.iterdir() if child.is_file())
+        if glob.has_magic(str(paths)):
+            matches = glob.glob(str(path), recursive=True)
+            return sorted(Path(match) for match in matches if Path(match).is_file())
+        paths = [path]
+    return list(dict.fromkeys(Path(path).expanduser() for path in paths))
+
+
+def _read_upload_manifest(path: Path) -> list[dict[str, Any]]:
+    """
+    Read the files to upload and their metadata from a manifest.
+
+    Parameters
+    ----------
+    path : Path
+        A ``.json`` manifest holding a list of paths or objects with ``path``,
+        or a text file with one path per line.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        One entry per file, with ``path`` resolved against the manifest's
+        directory.
+
+    Raises
+    ------
+    ValueError
+        If the manifest is malformed.
+    """
+    text = path.read_text(encoding="utf-8")
+    if path.suffix.lower() == ".json":
+        raw = json.loads(text)
+        if not isinstance(raw, list):
+            raise ValueError(f"Upload manifest {path} must hold a JSON list.")
+    else:
+        raw = [
+            line.strip()
+            for line in text.splitlines()
+            if line.strip() and not line.lstrip().startswith("#")
+        ]
+
+    entries: list[dict[str, Any]] = []
+    for item in raw:
+        entry = {"path": item} if isinstance(item, str) else dict(item)
+        if not isinstance(entry.get("path"), str):
+            raise ValueError(f"Upload manifest {path} has an entry without a path.")
+        entry["path"] = path.parent / Path(entry["path"]).expanduser()
+        entries.append(entry)
+    return entries
+
+
+def _read_manifest(path: Path) -> dict[str, dict[str, Any]]:
+    """
+    Read a mirror manifest, or return an empty one if it does not exist.
+
+    Parameters
+    ----------
+    path : Path
+        The manifest file.
+
+    Returns
+    -------
+    dict[str, dict[str, Any]]
+        Manifest entries keyed by attachment ID.
+
+    Raises
+    ------
+    GPPClientError
+        If the manifest cannot be read or parsed.
+    """
+    if not path.is_file():
+        return {}
+    try:
+        return dict(json.loads(path.read_text())["attachments"])
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        raise GPPClientError(f"Invalid attachment manifest {path}: {exc}") from exc
+
+
+def _write_manifest(path: Path, entries: dict[str, dict[str, Any]]) -> None:
+    """
+    Write a mirror manifest atomically.
+
+    Parameters
+    ----------
+    path : Path
+        The manifest file.
+    entries : dict[str, dict[str, Any]]
+        Manifest entries keyed by attachment ID.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(
+        json.dumps({"version": 1, "attachments": entries}, indent=2, sort_keys=True)
+    )
+    os.replace(tmp_path, path)
+
+
+def _entry_matches(entry: dict[str, Any], attachment: Any) -> bool:
+    """
+    Return whether a manifest entry describes the current remote attachment.
+
+    Parameters
+    ----------
+    entry : dict[str, Any]
+        The manifest entry.
+    attachment : AttachmentDetails
+        The attachment as listed by GraphQL.
+
+    Returns
+    -------
+    bool
+        ``True`` if the file name, update time and size are unchanged. Entries
+        written before file names were recorded match any name.
+    """
+    return (
+        entry.get("file_name", str(attachment.file_name)) == str(attachment.file_name)
+        and entry.get("updated_at") == str(attachment.updated_at)
+        and entry.get("size") == int(attachment.file_size)
+    )
+
+
+def _local_file_matches(root: Path, entry: dict[str, Any], verify: bool) -> bool:
+    """
+    Return whether the mirrored file still matches its manifest entry.
+
+    Parameters
+    ----------
+    root : Path
+        The mirror directory.
+    entry : dict[str, Any]
+        The manifest entry.
+    verify : bool
+        Whether to compare the SHA-256 checksum as well as the size.
+
+    Returns
+    -------
+    bool
+        ``True`` if the file exists and matches.
+    """
+    path = root / entry["path"]
+    if not path.is_file() or path.stat().st_size != entry.get("size"):
+        return False
+    return not verify or _sha256(path) == entry.get("sha256")
+
+
+def _remove_mirrored_file(root: Path, entry: dict[str, Any]) -> None:
+    """
+    Delete a mirrored file and its attachment directory if that is now empty.
+
+    Parameters
+    ----------
+    root : Path
+        The mirror directory.
+    entry : dict[str, Any]
+        The manifest entry of the pruned attachment.
+    """
+    path = root / entry["path"]
+    path.unlink(missing_ok=True)
+    try:
+        if path.parent != root:
+            path.parent.rmdir()
+    except OSError:
+        # Not empty or already gone: leave it.
+        pass
+
+
+def _sha256(path: Path) -> str:
+    """
+    Hash a file in 1 MB blocks.
+
+    Parameters
+    ----------
+    path : Path
+        The file to hash.
+
+    Returns
+    -------
+    str
+        The hex SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        while block := fh.read(DEFAULT_CHUNK_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _file_size(path: Path) -> int:
+    """
+    Return the size of a file, or ``0`` if it does not exist.
+
+    Parameters
+    ----------
+    path : Path
+        The file to inspect.
+
+    Returns
+    -------
+    int
+        The size in bytes.
+    """
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def _content_range_total(content_range: str | None) -> int | None:
+    """
+    Extract the complete length from a ``Content-Range`` header.
+
+    Parameters
+    ----------
+    content_range : str | None
+        Header value such as ``bytes */1234`` or ``bytes 0-99/1234``.
+
+    Returns
+    -------
+    int | None
+        The complete length, or ``None`` if it is missing or unknown.
+    """
+    if not content_range:
+        return None
+    _, _, total = content_range.rpartition("/")
+    return int(total) if total.strip().isdigit() else None
+
+
+def _content_range_resumes(
+    content_range: str | None, offset: int, size: int | None
+) -> bool:
+    """
+    Return whether a ``206`` response continues a partial download.
+
+    Parameters
+    ----------
+    content_range : str | None
+        The response's ``Content-Range`` header, such as ``bytes 100-199/200``.
+    offset : int
+        Bytes already on disk.
+    size : int | None
+        The complete length when the download started, if known.
+
+    Returns
+    -------
+    bool
+        Whether the range starts at ``offset`` and the complete length is
+        unchanged.
+    """
+    if not content_range:
+        return False
+    unit, _, spec = content_range.strip().partition(" ")
+    start, _, _ = spec.partition("-")
+    if unit != "bytes" or not start.isdigit() or int(start) != offset:
+        return False
+    return size is None or _content_range_total(content_range) == size
+
+
 def _filename_from_presigned_url(download_url: str) -> str:
     """
     Extract filename from a presigned S3 URL.
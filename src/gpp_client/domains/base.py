@@ -2,11 +2,15 @@
 Module for base domain functionality and utilities.
 """
 
+from __future__ import annotations
+
 __all__ = ["BaseDomain"]
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
 from pathlib import Path
-from typing import NoReturn
+from typing import TYPE_CHECKING, NoReturn
 
 from gpp_client.exceptions import (
     GPPClientError,
@@ -14,10 +18,13 @@ from gpp_client.exceptions import (
     GPPResponseError,
     GPPValidationError,
 )
-from gpp_client.generated.client import GraphQLClient
 from gpp_client.rest.client import RESTClient
+from gpp_client.rest.transfer import DEFAULT_CHUNK_SIZE, ProgressCallback, iter_file
 from gpp_client.settings import GPPSettings
 
+if TYPE_CHECKING:
+    from gpp_client.generated.client import GraphQLClient
+
 logger = logging.getLogger(__name__)
 
 
@@ -133,6 +140,102 @@ class BaseDomain:
         GPPClientError
             If reading the file fails due to an unexpected I/O error.
         """
+        path = self._resolve_source_path(file_path=file_path, content=content)
+        if path is None:
+            return content  # type: ignore[return-value]
+
+        try:
+            # Read the file bytes into memory.
+            return path.read_bytes()
+        except OSError as exc:
+            self.raise_error(GPPClientError, exc)
+
+    async def resolve_upload_body(
+        self,
+        *,
+        file_path: str | Path | None,
+        content: bytes | None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: ProgressCallback | None = None,
+    ) -> tuple[bytes | AsyncIterator[bytes], int]:
+        """
+        Resolve an upload body from exactly one source without reading files.
+
+        Files are streamed in chunks while the request is sent, so their
+        contents are never held in memory at once. The file is checked and sized
+        in a worker thread, since that can block on network filesystems.
+
+        Parameters
+        ----------
+        file_path : str | Path | None
+            Path to a local file. If provided, it must exist and be a file.
+        content : bytes | None
+            Raw bytes content.
+        chunk_size : int, default=1 MB
+            Maximum number of bytes read from the file per chunk.
+        progress : ProgressCallback | None, optional
+            Called with the bytes sent so far and the total size after each
+            chunk of a file.
+
+        Returns
+        -------
+        bytes | AsyncIterator[bytes]
+            The content bytes, or an iterator over the file's chunks.
+        int
+            The body size in bytes, for the ``Content-Length`` header.
+
+        Raises
+        ------
+        GPPValidationError
+            If both or neither of ``file_path`` and ``content`` are provided, if
+            ``file_path`` is invalid, or if ``chunk_size`` is not positive.
+        GPPClientError
+            If the file size cannot be read.
+        """
+        if chunk_size < 1:
+            self.raise_error(
+                GPPValidationError, ValueError("chunk_size must be a positive integer.")
+            )
+
+        path = await asyncio.to_thread(
+            self._resolve_source_path, file_path=file_path, content=content
+        )
+        if path is None:
+            return content, len(content)  # type: ignore[arg-type, return-value]
+
+        try:
+            size = (await asyncio.to_thread(path.stat)).st_size
+        except OSError as exc:
+            self.raise_error(GPPClientError, exc)
+        return iter_file(path, chunk_size=chunk_size, progress=progress), size
+
+    def _resolve_source_path(
+        self,
+        *,
+        file_path: str | Path | None,
+        content: bytes | None,
+    ) -> Path | None:
+        """
+        Validate that exactly one content source is given.
+
+        Parameters
+        ----------
+        file_path : str | Path | None
+            Path to a local file.
+        content : bytes | None
+            Raw bytes content.
+
+        Returns
+        -------
+        Path | None
+            The validated file path, or ``None`` when ``content`` was given.
+
+        Raises
+        ------
+        GPPValidationError
+            If both or neither sources are provided, or if ``file_path`` is
+            invalid.
+        """
         try:
             has_file_path = file_path is not None
             has_content = content is not None
@@ -144,7 +247,7 @@ class BaseDomain:
                 )
 
             if content is not None:
-                return content
+                return None
 
             path = Path(file_path).expanduser()  # type: ignore[arg-type]
 
@@ -157,8 +260,4 @@ class BaseDomain:
         except (ValueError, FileNotFoundError, TypeError) as exc:
             self.raise_error(GPPValidationError, exc)
 
-        try:
-            # Read the file bytes into memory.
-            return path.read_bytes()
-        except OSError as exc:
-            self.raise_error(GPPClientError, exc)
+        return path
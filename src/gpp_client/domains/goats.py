@@ -2,11 +2,17 @@
 Module for GOATS-related operations.
 """
 
+from __future__ import annotations
+
 __all__ = ["GOATSDomain"]
 
+from typing import TYPE_CHECKING
+
 from gpp_client.domains.base import BaseDomain
-from gpp_client.generated.get_goats_observations import GetGOATSObservations
-from gpp_client.generated.get_goats_programs import GetGOATSPrograms
+
+if TYPE_CHECKING:
+    from gpp_client.generated.get_goats_observations import GetGOATSObservations
+    from gpp_client.generated.get_goats_programs import GetGOATSPrograms
 
 
 class GOATSDomain(BaseDomain):
@@ -2,38 +2,44 @@
 Module for observation-related operations.
 """
 
+from __future__ import annotations
+
 __all__ = ["ObservationDomain"]
 
 import logging
 from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
 
 from gpp_client.domains.base import BaseDomain
-from gpp_client.generated.clone_observation import CloneObservation
-from gpp_client.generated.create_observation import CreateObservation
-from gpp_client.generated.delete_observation_by_id import DeleteObservationById
-from gpp_client.generated.delete_observation_by_reference import (
-    DeleteObservationByReference,
-)
-from gpp_client.generated.get_observation import GetObservation
-from gpp_client.generated.get_observations import GetObservations
-from gpp_client.generated.input_types import (
-    CloneObservationInput,
-    CreateObservationInput,
-    ObservationPropertiesInput,
-    UpdateObservationsInput,
-    WhereObservation,
-)
-from gpp_client.generated.obs_calculation_update import ObsCalculationUpdate
-from gpp_client.generated.observation_edit import ObservationEdit
-from gpp_client.generated.restore_observation_by_id import RestoreObservationById
-from gpp_client.generated.restore_observation_by_reference import (
-    RestoreObservationByReference,
-)
-from gpp_client.generated.update_observation_by_id import UpdateObservationById
-from gpp_client.generated.update_observation_by_reference import (
-    UpdateObservationByReference,
-)
-from gpp_client.generated.update_observations import UpdateObservations
+
+if TYPE_CHECKING:
+    from gpp_client.generated.clone_observation import CloneObservation
+    from gpp_client.generated.create_observation import CreateObservation
+    from gpp_client.generated.delete_observation_by_id import DeleteObservationById
+    from gpp_client.generated.delete_observation_by_reference import (
+        DeleteObservationByReference,
+    )
+    from gpp_client.generated.get_observation import GetObservation
+    from gpp_client.generated.get_observations import GetObservations
+    from gpp_client.generated.get_observation_summaries import GetObservationSummaries
+    from gpp_client.generated.input_types import (
+        CloneObservationInput,
+        CreateObservationInput,
+        ObservationPropertiesInput,
+        UpdateObservationsInput,
+        WhereObservation,
+    )
+    from gpp_client.generated.obs_calculation_update import ObsCalculationUpdate
+    from gpp_client.generated.observation_edit import ObservationEdit
+    from gpp_client.generated.restore_observation_by_id import RestoreObservationById
+    from gpp_client.generated.restore_observation_by_reference import (
+        RestoreObservationByReference,
+    )
+    from gpp_client.generated.update_observation_by_id import UpdateObservationById
+    from gpp_client.generated.update_observation_by_reference import (
+        UpdateObservationByReference,
+    )
+    from gpp_client.generated.update_observations import UpdateObservations
 
 logger = logging.getLogger(__name__)
 
@@ -313,6 +319,44 @@ class ObservationDomain(BaseDomain):
             limit=limit,
         )
 
+    async def list_summaries(
+        self,
+        *,
+        include_deleted: bool = False,
+        where: WhereObservation | None = None,
+        offset: str | None = None,
+        limit: int | None = None,
+    ) -> GetObservationSummaries:
+        """
+        Get slim summaries of observations matching the provided filters.
+
+        Only the ID, reference, title, instrument, program ID and workflow state
+        are selected, which keeps listings of many observations cheap to fetch
+        and validate. Use ``get_all`` for full details.
+
+        Parameters
+        ----------
+        include_deleted : bool, default=False
+            Whether to include deleted observations.
+        where : WhereObservation | None, optional
+            Optional observation filter.
+        offset : str | None, optional
+            Optional pagination offset.
+        limit : int | None, optional
+            Optional page size limit.
+
+        Returns
+        -------
+        GetObservationSummaries
+            The generated GraphQL response model.
+        """
+        return await self._graphql.get_observation_summaries(
+            include_deleted=include_deleted,
+            where=where,
+            offset=offset,
+            limit=limit,
+        )
+
     async def subscribe_to_edits(
         self,
         *,
@@ -342,6 +386,9 @@ class ObservationDomain(BaseDomain):
         """
         Subscribe to observation calculation update events.
 
+        Cached atom digests of each updated observation are invalidated before the
+        event is yielded.
+
         Parameters
         ----------
         program_id : str | None, optional
@@ -353,4 +400,5 @@ class ObservationDomain(BaseDomain):
             Observation calculation update events.
         """
         async for event in self._graphql.obs_calculation_update(program_id=program_id):
+            self._rest.invalidate_atom_digests([event.obscalc_update.observation_id])
             yield event
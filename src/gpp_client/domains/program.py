@@ -2,25 +2,31 @@
 Module for retrieving and managing program information.
 """
 
+from __future__ import annotations
+
 __all__ = ["ProgramDomain"]
 
 import logging
 from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
 
 from gpp_client.domains.base import BaseDomain
-from gpp_client.generated.create_program import CreateProgram
-from gpp_client.generated.delete_program_by_id import DeleteProgramById
-from gpp_client.generated.get_program_by_id import GetProgramById
-from gpp_client.generated.get_program_by_proposal_reference import (
-    GetProgramByProposalReference,
-)
-from gpp_client.generated.get_program_by_reference import GetProgramByReference
-from gpp_client.generated.get_programs import GetPrograms
-from gpp_client.generated.input_types import ProgramPropertiesInput, WhereProgram
-from gpp_client.generated.program_edit import ProgramEdit
-from gpp_client.generated.restore_program_by_id import RestoreProgramById
-from gpp_client.generated.update_program_by_id import UpdateProgramById
-from gpp_client.generated.update_programs import UpdatePrograms
+
+if TYPE_CHECKING:
+    from gpp_client.generated.create_program import CreateProgram
+    from gpp_client.generated.delete_program_by_id import DeleteProgramById
+    from gpp_client.generated.get_program_by_id import GetProgramById
+    from gpp_client.generated.get_program_by_proposal_reference import (
+        GetProgramByProposalReference,
+    )
+    from gpp_client.generated.get_program_by_reference import GetProgramByReference
+    from gpp_client.generated.get_programs import GetPrograms
+    from gpp_client.generated.get_program_summaries import GetProgramSummaries
+    from gpp_client.generated.input_types import ProgramPropertiesInput, WhereProgram
+    from gpp_client.generated.program_edit import ProgramEdit
+    from gpp_client.generated.restore_program_by_id import RestoreProgramById
+    from gpp_client.generated.update_program_by_id import UpdateProgramById
+    from gpp_client.generated.update_programs import UpdatePrograms
 
 logger = logging.getLogger(__name__)
 
@@ -270,6 +276,44 @@ class ProgramDomain(BaseDomain):
             limit=limit,
         )
 
+    async def list_summaries(
+        self,
+        *,
+        include_deleted: bool = False,
+        where: WhereProgram | None = None,
+        offset: str | None = None,
+        limit: int | None = None,
+    ) -> GetProgramSummaries:
+        """
+        Get slim summaries of programs matching the provided filters.
+
+        Only the ID, name, description, type, reference and proposal status are
+        selected, which keeps listings of many programs cheap to fetch and
+        validate. Use ``get_all`` for full details.
+
+        Parameters
+        ----------
+        include_deleted : bool, default=False
+            Whether deleted programs should be included.
+        where : WhereProgram | None, optional
+            Optional program filter.
+        offset : str | None, optional
+            Optional pagination offset.
+        limit : int | None, optional
+            Optional page size limit.
+
+        Returns
+        -------
+        GetProgramSummaries
+            The generated GraphQL response model.
+        """
+        return await self._graphql.get_program_summaries(
+            include_deleted=include_deleted,
+            where=where,
+            offset=offset,
+            limit=limit,
+        )
+
     async def subscribe_to_edits(
         self,
         *,
@@ -2,28 +2,27 @@
 Module for retrieving scheduler information.
 """
 
+from __future__ import annotations
+
 __all__ = ["SchedulerDomain"]
 
+import logging
 from datetime import datetime
-from typing import Any, AsyncIterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, AsyncIterator
 
 from gpp_client.domains.base import BaseDomain
 from gpp_client.rest.models import VisibilityChanges, parse_visibility_changes
-from gpp_client.generated import (
-    SchedulerObservationsUpdates,
-    WhereOptionEqObservingModeType,
-)
-from gpp_client.generated.get_scheduler_all_programs_id import (
-    GetSchedulerAllProgramsId,
-)
-from gpp_client.generated.get_scheduler_programs import GetSchedulerPrograms
-from gpp_client.generated.input_types import (
-    ObservationWorkflowState,
-    WhereCalculatedObservationWorkflow,
-    WhereObservation,
-    WhereOrderObservationId,
-    WhereOrderObservationWorkflowState,
-)
+from gpp_client.rest.tracker import VisibilityChangeTracker
+
+if TYPE_CHECKING:
+    from gpp_client.generated import SchedulerObservationsUpdates
+    from gpp_client.generated.get_scheduler_all_programs_id import (
+        GetSchedulerAllProgramsId,
+    )
+    from gpp_client.generated.get_scheduler_programs import GetSchedulerPrograms
+
+logger = logging.getLogger(__name__)
 
 
 class SchedulerDomain(BaseDomain):
@@ -175,32 +174,22 @@ class SchedulerDomain(BaseDomain):
         ]
         return bool(node["elements"])
 
-    async def get_all(
-        self,
-        programs_list: list | None = None,
-    ) -> list[dict[str, Any]]:
+    @staticmethod
+    def _build_group_trees(programs: list[dict[str, Any]]) -> list[str]:
         """
-        Fetch all programs with a complete group tree and observations.
+        Nest each program's flat group elements into a tree under ``root``.
 
         Parameters
         ----------
-        programs_list : list, optional
-            Optional filtering clause.
+        programs : list[dict[str, Any]]
+            Dumped programs with their ``all_group_elements``. A ``root`` entry
+            is added to each.
 
         Returns
         -------
-        list[dict[str, Any]]
-            A list of dictionaries representing the programs and their elements.
+        list[str]
+            IDs of every observation in the trees.
         """
-
-        if not programs_list:
-            programs_list = [
-                p.id for p in (await self.get_program_ids()).programs.matches
-            ]
-
-        response = await self.get_programs(programs_list=programs_list)
-        response = response.model_dump()
-        programs = response["programs"].get("matches", [])
         observations = []
         for program in programs:
             # Create root group.
@@ -239,11 +228,51 @@ class SchedulerDomain(BaseDomain):
                     groups_elements_mapping[parent_id]["group"]["elements"] = children
 
                 else:
-                    print(f"Parent {parent_id} not found in mapping")
                     # Ignore orphans for now, but check for this use case in the ODB.
-                    pass
+                    logger.warning("Parent %s not found in mapping", parent_id)
             program["root"] = root
 
+        return observations
+
+    async def get_all(
+        self,
+        programs_list: list | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch all programs with a complete group tree and observations.
+
+        Parameters
+        ----------
+        programs_list : list, optional
+            Optional filtering clause.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            A list of dictionaries representing the programs and their elements.
+        """
+
+        if not programs_list:
+            programs_list = [
+                p.id for p in (await self.get_program_ids()).programs.matches
+            ]
+
+        response = await self.get_programs(programs_list=programs_list)
+        response = response.model_dump()
+        programs = response["programs"].get("matches", [])
+        observations = self._build_group_trees(programs)
+
+        # Imported here so that importing the domain does not build the input
+        # models.
+        from gpp_client.generated.input_types import (
+            ObservationWorkflowState,
+            WhereCalculatedObservationWorkflow,
+            WhereObservation,
+            WhereOptionEqObservingModeType,
+            WhereOrderObservationId,
+            WhereOrderObservationWorkflowState,
+        )
+
         # If is in the list and status is Ready or OnGoing.
         where_observation = WhereObservation(
             id=WhereOrderObservationId(in_=observations),
@@ -324,7 +353,8 @@ class SchedulerDomain(BaseDomain):
         -------
         VisibilityChanges
             Changed observation and target GIDs plus the latest change
-            timestamp reported by the endpoint.
+            timestamp reported by the endpoint. Cached atom digests of the changed
+            observations are invalidated.
 
         Raises
         ------
@@ -332,7 +362,44 @@ class SchedulerDomain(BaseDomain):
             For HTTP errors, connection failures, or timeouts.
         """
         body = await self._rest.get_visibility_changes(since)
-        return parse_visibility_changes(body)
+        changes = parse_visibility_changes(body)
+        self._rest.invalidate_atom_digests(changes.observation_ids)
+        return changes
+
+    def track_visibility_changes(
+        self,
+        checkpoint_path: str | Path,
+        *,
+        interval: float = 60.0,
+        start: datetime | None = None,
+        batch_size: int = 1000,
+    ) -> VisibilityChangeTracker:
+        """
+        Create a tracker that polls visibility changes from a persisted cursor.
+
+        Parameters
+        ----------
+        checkpoint_path : str | Path
+            File holding the cursor between runs.
+        interval : float, default=60.0
+            Seconds to wait between polls in ``VisibilityChangeTracker.watch``.
+        start : datetime | None, optional
+            Cursor to use when no checkpoint exists yet. Defaults to now.
+        batch_size : int, default=1000
+            Maximum number of response lines per yielded batch.
+
+        Returns
+        -------
+        VisibilityChangeTracker
+            Tracker sharing this domain's REST client.
+        """
+        return VisibilityChangeTracker(
+            self._rest,
+            checkpoint_path,
+            interval=interval,
+            start=start,
+            batch_size=batch_size,
+        )
 
     async def subscribe_to_calculation_updates(
         self,
@@ -341,6 +408,9 @@ class SchedulerDomain(BaseDomain):
         Subscribe to observation calculation update events with the
         execution flag set to true so only executed events are sent.
 
+        Cached atom digests of each updated observation are invalidated before the
+        event is yielded.
+
         Yields
         ------
         SchedulerObservationsUpdates
@@ -349,4 +419,7 @@ class SchedulerDomain(BaseDomain):
         async for event in self._graphql.scheduler_observations_updates(
             executable_only=True
         ):
+            value = event.obscalc_update.value
+            if value is not None:
+                self._rest.invalidate_atom_digests([value.id])
             yield event
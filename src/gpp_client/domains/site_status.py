@@ -2,15 +2,36 @@
 Module for retrieving current Gemini site status information.
 """
 
-__all__ = ["SiteStatusDomain"]
+__all__ = ["SiteStatusChange", "SiteStatusDomain"]
 
+import asyncio
+import copy
+import hashlib
+import json
+import logging
 import re
+import time
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass, field
 from enum import Enum
+from html.parser import HTMLParser
 from typing import Any, Literal, Optional
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from httpx import AsyncClient
 
+from gpp_client.transport import HTTPTransport
+
+logger = logging.getLogger(__name__)
+
+try:
+    import lxml  # noqa: F401
+except ImportError:  # pragma: no cover - depends on the environment
+    _SOUP_FEATURES = "html.parser"
+else:  # pragma: no cover - depends on the environment
+    # The BeautifulSoup fallback is faster on lxml when it is installed.
+    _SOUP_FEATURES = "lxml"
+
 
 class Site(str, Enum):
     SOUTH = "south"
@@ -35,12 +56,143 @@ SITE_CONFIG = {
 }
 
 
+# Payload fields compared by ``watch``. Timestamps that move on every page
+# refresh are left out so they do not count as changes.
+_WATCHED_FIELDS: dict[str, tuple[str, ...]] = {
+    "available": ("available",),
+    "comment": ("comment",),
+    "shutter": ("shutter", "state"),
+    "instruments": ("instruments", "available"),
+    "gmos_gratings": ("gmos_config", "gratings"),
+    "gmos_slits": ("gmos_config", "slits"),
+}
+
+
+@dataclass(frozen=True)
+class SiteStatusChange:
+    """
+    A change in a site's status reported by :meth:`SiteStatusDomain.watch`.
+
+    Attributes
+    ----------
+    site : str
+        The site name (``"north"`` or ``"south"``).
+    status : dict[str, Any]
+        The full payload after the change.
+    changes : dict[str, tuple[Any, Any]]
+        ``(old, new)`` values keyed by watched field: ``available``, ``comment``,
+        ``shutter``, ``instruments``, ``gmos_gratings`` and ``gmos_slits``. On
+        the first report every field is listed with ``None`` as the old value.
+    fingerprint : str
+        Hash of the watched fields.
+    initial : bool
+        Whether this is the first report of the watch.
+    """
+
+    site: str
+    status: dict[str, Any]
+    changes: dict[str, tuple[Any, Any]] = field(default_factory=dict)
+    fingerprint: str = ""
+    initial: bool = False
+
+    def added(self, name: str) -> list[str]:
+        """
+        List the items added to a list field, such as ``instruments``.
+
+        Parameters
+        ----------
+        name : str
+            The watched field.
+
+        Returns
+        -------
+        list[str]
+            Items in the new value but not the old one; empty if the field did not
+            change.
+        """
+        old, new = self.changes.get(name, (None, None))
+        return [item for item in new or [] if item not in (old or [])]
+
+    def removed(self, name: str) -> list[str]:
+        """
+        List the items removed from a list field, such as ``instruments``.
+
+        Parameters
+        ----------
+        name : str
+            The watched field.
+
+        Returns
+        -------
+        list[str]
+            Items in the old value but not the new one; empty if the field did not
+            change.
+        """
+        old, new = self.changes.get(name, (None, None))
+        return [item for item in old or [] if item not in (new or [])]
+
+
+@dataclass
+class _CachedStatus:
+    """
+    A site status payload and when it was fetched.
+    """
+
+    payload: dict[str, Any]
+    fetched_at: float
+
+
+@dataclass
+class _CachedPage:
+    """
+    A page body with the validators for conditional requests.
+    """
+
+    text: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
 class SiteStatusDomain:
     """
     Domain for retrieving current Gemini site status information.
+
+    Payloads are cached per site. Within ``ttl`` seconds a cached payload is
+    returned as is; for another ``stale_ttl`` seconds it is still returned, but a
+    background refresh is started. Older payloads are fetched before returning.
+    Page requests carry ``If-None-Match`` / ``If-Modified-Since`` so an unchanged
+    page costs a ``304`` instead of a full download.
+
+    Parameters
+    ----------
+    transport : HTTPTransport | None, optional
+        Shared transport whose connection pool is reused across calls. Without
+        one, each fetch opens and closes its own client.
+    ttl : float, default=60.0
+        Seconds a payload is considered fresh. ``0`` disables caching.
+    stale_ttl : float, default=300.0
+        Seconds after ``ttl`` during which a stale payload is served while it is
+        refreshed in the background.
     """
 
-    async def get_by_id(self, site_id: Literal["south", "north"]) -> dict[str, Any]:
+    def __init__(
+        self,
+        *,
+        transport: HTTPTransport | None = None,
+        ttl: float = 60.0,
+        stale_ttl: float = 300.0,
+    ) -> None:
+        self._transport = transport
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+
+        self._statuses: dict[Site, _CachedStatus] = {}
+        self._pages: dict[str, _CachedPage] = {}
+        self._refreshing: dict[Site, asyncio.Task[dict[str, Any]]] = {}
+
+    async def get_by_id(
+        self, site_id: Literal["south", "north"], *, refresh: bool = False
+    ) -> dict[str, Any]:
         """
         Get the current site status payload for Gemini North or South.
 
@@ -48,6 +200,8 @@ class SiteStatusDomain:
         ----------
         site_id : Literal["south", "north"]
             The observatory site name (case-insensitive).
+        refresh : bool, default=False
+            Whether to bypass the cached payload and fetch it now.
 
         Returns
         -------
@@ -58,25 +212,174 @@ class SiteStatusDomain:
         site_key = site_id.strip().lower()
         site = Site(site_key)
 
-        config = SITE_CONFIG[site]
+        cached = self._statuses.get(site)
+        if cached is not None and not refresh:
+            age = time.monotonic() - cached.fetched_at
+            if age < self.ttl:
+                return copy.deepcopy(cached.payload)
+            if age < self.ttl + self.stale_ttl:
+                self._refresh_in_background(site)
+                return copy.deepcopy(cached.payload)
 
-        async with AsyncClient(follow_redirects=True) as client:
-            if site == Site.NORTH:
-                status_html = await self._fetch_webpage(client, config["src_url"])
-                status_data = _parse_gemini_north_webpage(status_html)
-                # Add site manually to match Gemini South payload.
-                status_data["Site"] = "Gemini North"
-            else:
-                status_data = await self._fetch_json(client, config["src_url"])
-            gmos_html = await self._fetch_webpage(client, config["gmos_url"])
-            gmos_payload = _parse_gmos_config_page(gmos_html)
+        payload = await asyncio.shield(self._refresh(site))
+        return copy.deepcopy(payload)
 
+    async def get_all(self, *, refresh: bool = False) -> dict[str, dict[str, Any]]:
+        """
+        Get the current site status payloads for every site concurrently.
+
+        Parameters
+        ----------
+        refresh : bool, default=False
+            Whether to bypass the cached payloads and fetch them now.
+
+        Returns
+        -------
+        dict[str, dict[str, Any]]
+            Site status payloads keyed by site name (``"north"``, ``"south"``).
+        """
+        sites = list(Site)
+        payloads = await asyncio.gather(
+            *(self.get_by_id(site.value, refresh=refresh) for site in sites)
+        )
+        return {site.value: payload for site, payload in zip(sites, payloads)}
+
+    async def watch(
+        self, site_id: Literal["south", "north"], interval: float = 60.0
+    ) -> AsyncIterator[SiteStatusChange]:
+        """
+        Poll a site forever and yield only when its status really changes.
+
+        The first poll is always reported. After that a poll is reported only
+        if one of the watched fields differs; payloads whose only difference is
+        a refreshed timestamp are skipped.
+
+        Parameters
+        ----------
+        site_id : Literal["south", "north"]
+            The observatory site name (case-insensitive).
+        interval : float, default=60.0
+            Seconds to wait between polls.
+
+        Yields
+        ------
+        SiteStatusChange
+            The new payload and the watched fields that changed.
+
+        Raises
+        ------
+        ValueError
+            If ``interval`` is not positive or the site is unknown.
+        httpx.HTTPError
+            If a status page cannot be fetched.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive.")
+        site = Site(site_id.strip().lower())
+
+        previous: Optional[dict[str, Any]] = None
+        previous_fingerprint: Optional[str] = None
+        while True:
+            status = await self.get_by_id(site.value, refresh=True)
+            watched = _watched_values(status)
+            fingerprint = _fingerprint(watched)
+
+            if fingerprint != previous_fingerprint:
+                old = previous or {}
+                yield SiteStatusChange(
+                    site=site.value,
+                    status=status,
+                    changes={
+                        name: (old.get(name), value)
+                        for name, value in watched.items()
+                        if previous is None or old.get(name) != value
+                    },
+                    fingerprint=fingerprint,
+                    initial=previous is None,
+                )
+                previous, previous_fingerprint = watched, fingerprint
+
+            await asyncio.sleep(interval)
+
+    async def close(self) -> None:
+        """
+        Cancel background refreshes still in flight.
+        """
+        tasks = list(self._refreshing.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _refresh(self, site: Site) -> asyncio.Task[dict[str, Any]]:
+        """
+        Start fetching a site, or join the fetch already in flight.
+
+        Parameters
+        ----------
+        site : Site
+            The site to fetch.
+
+        Returns
+        -------
+        asyncio.Task[dict[str, Any]]
+            Task resolving to the fresh payload.
+        """
+        task = self._refreshing.get(site)
+        if task is None:
+            task = asyncio.create_task(self._load(site))
+            self._refreshing[site] = task
+            task.add_done_callback(lambda _: self._refreshing.pop(site, None))
+        return task
+
+    def _refresh_in_background(self, site: Site) -> None:
+        """
+        Refresh a site without waiting, logging any failure.
+
+        Parameters
+        ----------
+        site : Site
+            The site to refresh.
+        """
+
+        def log_failure(task: asyncio.Task[dict[str, Any]]) -> None:
+            if not task.cancelled() and task.exception() is not None:
+                logger.warning(
+                    "Background refresh of %s site status failed: %s",
+                    site.value,
+                    task.exception(),
+                )
+
+        self._refresh(site).add_done_callback(log_failure)
+
+    async def _load(self, site: Site) -> dict[str, Any]:
+        """
+        Fetch a site's pages, build its payload and cache it.
+
+        Parameters
+        ----------
+        site : Site
+            The site to fetch.
+
+        Returns
+        -------
+        dict[str, Any]
+            The fresh site status payload.
+        """
+        if self._transport is not None:
+            status_data, gmos_payload = await self._fetch_site(
+                self._transport.http_client, site
+            )
+        else:
+            async with AsyncClient() as client:
+                status_data, gmos_payload = await self._fetch_site(client, site)
+
+        config = SITE_CONFIG[site]
         shutter_payload = _parse_shutter(status_data.get(config["shutter_keyword"]))
         instruments_payload = _parse_instruments(
             status_data.get(config["instrument_keyword"])
         )
 
-        return {
+        payload = {
             "site": status_data.get("Site"),
             "validity": status_data.get(config["validity_keyword"]),
             "available": status_data.get("avail", ""),
@@ -85,6 +388,47 @@ class SiteStatusDomain:
             "shutter": shutter_payload,
             "gmos_config": gmos_payload,
         }
+        if self.ttl > 0:
+            self._statuses[site] = _CachedStatus(payload, time.monotonic())
+        return payload
+
+    async def _fetch_site(
+        self, client: AsyncClient, site: Site
+    ) -> tuple[dict[str, Any], Optional[dict[str, Any]]]:
+        """
+        Fetch and parse the status and GMOS configuration pages of a site.
+
+        Both pages are requested concurrently.
+
+        Parameters
+        ----------
+        client : AsyncClient
+            An HTTP client instance.
+        site : Site
+            The site to fetch.
+
+        Returns
+        -------
+        dict[str, Any]
+            Raw status values keyed by the site's keywords.
+        dict[str, Any], optional
+            Parsed GMOS configuration.
+        """
+        config = SITE_CONFIG[site]
+        if site == Site.NORTH:
+            status_html, gmos_html = await asyncio.gather(
+                self._fetch_webpage(client, config["src_url"]),
+                self._fetch_webpage(client, config["gmos_url"]),
+            )
+            status_data = _parse_gemini_north_webpage(status_html)
+            # Add site manually to match Gemini South payload.
+            status_data["Site"] = "Gemini North"
+        else:
+            status_data, gmos_html = await asyncio.gather(
+                self._fetch_json(client, config["src_url"]),
+                self._fetch_webpage(client, config["gmos_url"]),
+            )
+        return status_data, _parse_gmos_config_page(gmos_html)
 
     async def _fetch_json(self, client: AsyncClient, url: str) -> dict[str, Any]:
         """
@@ -102,9 +446,7 @@ class SiteStatusDomain:
         dict[str, Any]
             Parsed JSON content.
         """
-        response = await client.get(url)
-        response.raise_for_status()
-        return response.json()
+        return json.loads(await self._fetch_text(client, url))
 
     async def _fetch_webpage(self, client: AsyncClient, url: str) -> str:
         """
@@ -122,15 +464,218 @@ class SiteStatusDomain:
         str
             The returned html.
         """
-        response = await client.get(url)
+        return await self._fetch_text(client, url)
+
+    async def _fetch_text(self, client: AsyncClient, url: str) -> str:
+        """
+        Fetch a page body, revalidating a previously seen copy when possible.
+
+        Parameters
+        ----------
+        client : AsyncClient
+            An HTTP client instance.
+        url : str
+            The url to fetch.
+
+        Returns
+        -------
+        str
+            The page body, from the server or from the revalidated copy.
+        """
+        headers: dict[str, str] = {}
+        cached = self._pages.get(url)
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        response = await client.get(url, headers=headers, follow_redirects=True)
+        if response.status_code == 304 and cached is not None:
+            logger.debug("Site status page not modified: %s", url)
+            return cached.text
         response.raise_for_status()
-        return response.text
+
+        text = response.text
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._pages[url] = _CachedPage(text, etag, last_modified)
+        return text
+
+
+def _watched_values(status: dict[str, Any]) -> dict[str, Any]:
+    """
+    Pick the watched fields out of a site status payload.
+
+    Parameters
+    ----------
+    status : dict[str, Any]
+        A payload returned by ``get_by_id``.
+
+    Returns
+    -------
+    dict[str, Any]
+        Values keyed by watched field; missing parts are ``None``.
+    """
+    values: dict[str, Any] = {}
+    for name, path in _WATCHED_FIELDS.items():
+        value: Any = status
+        for key in path:
+            value = value.get(key) if isinstance(value, dict) else None
+        values[name] = value
+    return values
+
+
+def _fingerprint(values: dict[str, Any]) -> str:
+    """
+    Hash watched values so unchanged polls are cheap to recognise.
+
+    Parameters
+    ----------
+    values : dict[str, Any]
+        Values returned by ``_watched_values``.
+
+    Returns
+    -------
+    str
+        Hex digest of the values.
+    """
+    encoded = json.dumps(values, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+_NORTH_STATUS_IDS = ("update", "avail", "inst", "comment", "shutter")
+
+# Elements without an end tag.
+_VOID_ELEMENTS = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "param",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+
+
+class _TargetedHTMLScanner(HTMLParser):
+    """
+    Streaming scanner that keeps the text of selected elements only.
+
+    No tree is built: the scanner tracks the open elements and accumulates text
+    for elements whose ``id`` is in ``ids`` or whose tag is in ``tags``. Text is
+    joined the way ``Tag.get_text(strip=True)`` joins it, so results match the
+    BeautifulSoup parsers.
+
+    Parameters
+    ----------
+    ids : Iterable[str], optional
+        Element IDs to capture. Only the first element with each ID is kept.
+    tags : Iterable[str], optional
+        Tag names to capture, in document order with their parent element.
+    """
+
+    def __init__(self, *, ids: Iterable[str] = (), tags: Iterable[str] = ()) -> None:
+        super().__init__(convert_charrefs=True)
+        self._ids = frozenset(ids)
+        self._tags = frozenset(tags)
+        self._stack: list[tuple[str, int]] = []
+        self._node_count = 0
+        self._claimed_ids: set[str] = set()
+        # Captured node -> (result slot, text chunks).
+        self._capturing: dict[int, tuple[Any, list[str]]] = {}
+
+        self.by_id: dict[str, str] = {}
+        # (tag, parent node, text) in document order.
+        self.elements: list[list[Any]] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        parent = self._stack[-1][1] if self._stack else -1
+        self._node_count += 1
+        node = self._node_count
+
+        element_id = dict(attrs).get("id")
+        if element_id in self._ids and element_id not in self._claimed_ids:
+            self._claimed_ids.add(element_id)
+            self._capturing[node] = (element_id, [])
+        if tag in self._tags:
+            element = [tag, parent, ""]
+            self.elements.append(element)
+            self._capturing.setdefault(node, (element, []))
+
+        if tag in _VOID_ELEMENTS:
+            self._finish(node)
+        else:
+            self._stack.append((tag, node))
+
+    def handle_endtag(self, tag: str) -> None:
+        # Like BeautifulSoup, close the most recent matching element and
+        # everything opened inside it; stray end tags are ignored.
+        if not any(name == tag for name, _ in self._stack):
+            return
+        while self._stack:
+            name, node = self._stack.pop()
+            self._finish(node)
+            if name == tag:
+                break
+
+    def handle_data(self, data: str) -> None:
+        if not self._capturing:
+            return
+        if self._stack and self._stack[-1][0] in ("script", "style"):
+            return
+        text = data.strip()
+        if text:
+            for _, chunks in self._capturing.values():
+                chunks.append(text)
+
+    def close(self) -> None:
+        super().close()
+        while self._stack:
+            self._finish(self._stack.pop()[1])
+
+    def _finish(self, node: int) -> None:
+        """
+        Store the text of a captured element once it is closed.
+        """
+        captured = self._capturing.pop(node, None)
+        if captured is None:
+            return
+        slot, chunks = captured
+        text = "".join(chunks)
+        if isinstance(slot, str):
+            self.by_id[slot] = text
+        else:
+            slot[2] = text
+
+
+def _scan(html: str, **selectors: Iterable[str]) -> _TargetedHTMLScanner:
+    """
+    Run a targeted scan over a whole document.
+    """
+    scanner = _TargetedHTMLScanner(**selectors)
+    scanner.feed(html)
+    scanner.close()
+    return scanner
 
 
 def _parse_gemini_north_webpage(html: str) -> dict[str, Any]:
     """
     Parse the Gemini North status HTML page to extract status values by ID.
 
+    Only the wanted elements are scanned; BeautifulSoup is used if the scan
+    fails on malformed markup.
+
     Parameters
     ----------
     html : str
@@ -141,27 +686,104 @@ def _parse_gemini_north_webpage(html: str) -> dict[str, Any]:
     dict[str, Any]
         Dictionary of extracted values keyed by known element IDs.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    try:
+        scanner = _scan(html, ids=_NORTH_STATUS_IDS)
+    except (AssertionError, ValueError) as exc:
+        logger.debug("Falling back to BeautifulSoup for the status page: %s", exc)
+        return _soup_parse_gemini_north_webpage(html)
+    return {
+        element_id: scanner.by_id.get(element_id) for element_id in _NORTH_STATUS_IDS
+    }
+
+
+def _parse_gmos_config_page(html: str) -> Optional[dict[str, Any]]:
+    """
+    Parse the GMOS configuration HTML page.
+
+    Only the ``h1``, ``h3`` and ``h5`` headings are scanned; BeautifulSoup is used
+    if the scan fails on malformed markup.
+
+    Parameters
+    ----------
+    html : str
+        Raw HTML content.
+
+    Returns
+    -------
+    dict[str, Any], optional
+        Contains timestamp, gratings, and slits.
+    """
+    if not html or not html.strip():
+        return None
+
+    try:
+        scanner = _scan(html, tags=("h1", "h3", "h5"))
+    except (AssertionError, ValueError) as exc:
+        logger.debug("Falling back to BeautifulSoup for the GMOS page: %s", exc)
+        return _soup_parse_gmos_config_page(html)
+
+    timestamp = None
+    h1 = next((text for tag, _, text in scanner.elements if tag == "h1"), None)
+    if h1:
+        parts = h1.split(" at ")
+        if len(parts) == 2:
+            timestamp = parts[1].strip()
+
+    def collect_h5_until_next_h3(index: int) -> list[str]:
+        parent = scanner.elements[index][1]
+        values: list[str] = []
+        for tag, sibling_parent, text in scanner.elements[index + 1 :]:
+            # Only siblings of the heading count, as in ``find_next_siblings``.
+            if sibling_parent != parent:
+                continue
+            if tag == "h3":
+                break
+            if tag == "h5":
+                values.append(text)
+        return values
+
+    h3_indexes = [i for i, (tag, _, _) in enumerate(scanner.elements) if tag == "h3"]
+    gratings: list[str] = []
+    slits: list[str] = []
+    if len(h3_indexes) >= 2:
+        gratings = collect_h5_until_next_h3(h3_indexes[0])
+        slits = collect_h5_until_next_h3(h3_indexes[1])
+
+    return {
+        "local_timestamp": timestamp,
+        "gratings": gratings,
+        "slits": slits,
+    }
+
+
+def _soup_parse_gemini_north_webpage(html: str) -> dict[str, Any]:
+    """
+    Parse the Gemini North status HTML page with BeautifulSoup.
 
-    ids_to_extract = [
-        "update",
-        "avail",
-        "inst",
-        "comment",
-        "shutter",
-    ]
+    Parameters
+    ----------
+    html : str
+        Raw HTML content from the Gemini North status page.
+
+    Returns
+    -------
+    dict[str, Any]
+        Dictionary of extracted values keyed by known element IDs.
+    """
+    only_ids = SoupStrainer(id=lambda value: value in _NORTH_STATUS_IDS)
+    soup = BeautifulSoup(html, _SOUP_FEATURES, parse_only=only_ids)
 
     data: dict[str, Any] = {}
-    for element_id in ids_to_extract:
+    for element_id in _NORTH_STATUS_IDS:
         tag = soup.find(id=element_id)
         data[element_id] = tag.get_text(strip=True) if tag else None
 
     return data
 
 
-def _parse_gmos_config_page(html: str) -> Optional[dict[str, Any]]:
+def _soup_parse_gmos_config_page(html: str) -> Optional[dict[str, Any]]:
     """
-    Parse the GMOS configuration HTML page.
+    Parse the GMOS configuration HTML page with BeautifulSoup.
 
     Parameters
     ----------
@@ -176,7 +798,7 @@ def _parse_gmos_config_page(html: str) -> Optional[dict[str, Any]]:
     if not html or not html.strip():
         return None
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, _SOUP_FEATURES)
     h3_tags = soup.find_all("h3")
 
     timestamp = None
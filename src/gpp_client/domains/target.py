@@ -1,25 +1,31 @@
+from __future__ import annotations
+
 __all__ = ["TargetDomain"]
 
 import logging
 from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
 
 from gpp_client.domains.base import BaseDomain
-from gpp_client.generated.clone_target import CloneTarget
-from gpp_client.generated.create_target_by_program_id import CreateTargetByProgramId
-from gpp_client.generated.create_target_by_program_reference import (
-    CreateTargetByProgramReference,
-)
-from gpp_client.generated.create_target_by_proposal_reference import (
-    CreateTargetByProposalReference,
-)
-from gpp_client.generated.delete_target_by_id import DeleteTargetById
-from gpp_client.generated.get_target_by_id import GetTargetById
-from gpp_client.generated.get_targets import GetTargets
-from gpp_client.generated.input_types import TargetPropertiesInput, WhereTarget
-from gpp_client.generated.restore_target_by_id import RestoreTargetById
-from gpp_client.generated.target_edit import TargetEdit
-from gpp_client.generated.update_target_by_id import UpdateTargetById
-from gpp_client.generated.update_targets import UpdateTargets
+
+if TYPE_CHECKING:
+    from gpp_client.generated.clone_target import CloneTarget
+    from gpp_client.generated.create_target_by_program_id import CreateTargetByProgramId
+    from gpp_client.generated.create_target_by_program_reference import (
+        CreateTargetByProgramReference,
+    )
+    from gpp_client.generated.create_target_by_proposal_reference import (
+        CreateTargetByProposalReference,
+    )
+    from gpp_client.generated.delete_target_by_id import DeleteTargetById
+    from gpp_client.generated.get_target_by_id import GetTargetById
+    from gpp_client.generated.get_targets import GetTargets
+    from gpp_client.generated.get_target_summaries import GetTargetSummaries
+    from gpp_client.generated.input_types import TargetPropertiesInput, WhereTarget
+    from gpp_client.generated.restore_target_by_id import RestoreTargetById
+    from gpp_client.generated.target_edit import TargetEdit
+    from gpp_client.generated.update_target_by_id import UpdateTargetById
+    from gpp_client.generated.update_targets import UpdateTargets
 
 logger = logging.getLogger(__name__)
 
@@ -311,6 +317,44 @@ class TargetDomain(BaseDomain):
             limit=limit,
         )
 
+    async def list_summaries(
+        self,
+        *,
+        include_deleted: bool = False,
+        where: WhereTarget | None = None,
+        offset: str | None = None,
+        limit: int | None = None,
+    ) -> GetTargetSummaries:
+        """
+        Get slim summaries of targets matching the provided filters.
+
+        Only the ID, name, calibration role and program ID are selected, which
+        keeps listings of many targets cheap to fetch and validate. Use
+        ``get_all`` for full details.
+
+        Parameters
+        ----------
+        include_deleted : bool, default=False
+            Whether deleted targets should be included.
+        where : WhereTarget | None, optional
+            Optional target filter.
+        offset : str | None, optional
+            Optional pagination offset.
+        limit : int | None, optional
+            Optional page size limit.
+
+        Returns
+        -------
+        GetTargetSummaries
+            The generated GraphQL response model.
+        """
+        return await self._graphql.get_target_summaries(
+            include_deleted=include_deleted,
+            where=where,
+            offset=offset,
+            limit=limit,
+        )
+
     async def subscribe_edits(
         self,
         *,
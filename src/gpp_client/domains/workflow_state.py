@@ -2,24 +2,31 @@
 Module for managing observation workflow states in the GPP client.
 """
 
+from __future__ import annotations
+
 __all__ = ["WorkflowStateDomain"]
 
 import asyncio
 import logging
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
 
 from gpp_client.domains.base import BaseDomain
 from gpp_client.exceptions import GPPClientError, GPPRetryableError, GPPValidationError
 from gpp_client.generated.enums import CalculationState, ObservationWorkflowState
-from gpp_client.generated.get_observation_workflow_state_by_id import (
-    GetObservationWorkflowStateById,
-    GetObservationWorkflowStateByIdObservationWorkflow,
-)
-from gpp_client.generated.get_observation_workflow_state_by_reference import (
-    GetObservationWorkflowStateByReference,
-)
-from gpp_client.generated.set_observation_workflow_state import (
-    SetObservationWorkflowStateSetObservationWorkflowState,
-)
+
+if TYPE_CHECKING:
+    from gpp_client.generated.get_observation_workflow_state_by_id import (
+        GetObservationWorkflowStateById,
+        GetObservationWorkflowStateByIdObservationWorkflow,
+    )
+    from gpp_client.generated.get_observation_workflow_state_by_reference import (
+        GetObservationWorkflowStateByReference,
+    )
+    from gpp_client.generated.set_observation_workflow_state import (
+        SetObservationWorkflowStateSetObservationWorkflowState,
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -132,11 +139,7 @@ class WorkflowStateDomain(BaseDomain):
                 observation_id,
                 workflow_state.value,
             )
-            return (
-                SetObservationWorkflowStateSetObservationWorkflowState.model_validate(
-                    workflow.value.model_dump(by_alias=True)
-                )
-            )
+            return self._as_mutation_result(workflow.value)
         # Validate the requested workflow state against 'validTransitions'.
         try:
             _check_valid_transition(workflow, workflow_state)
@@ -154,6 +157,44 @@ class WorkflowStateDomain(BaseDomain):
             )
         return payload
 
+    def _as_mutation_result(
+        self, value: Any
+    ) -> SetObservationWorkflowStateSetObservationWorkflowState:
+        """
+        Rebuild a queried workflow as the mutation response of the same backend.
+
+        Parameters
+        ----------
+        value : Any
+            The workflow details, a Pydantic model or, with the ``msgspec``
+            model backend, a struct.
+
+        Returns
+        -------
+        SetObservationWorkflowStateSetObservationWorkflowState
+            The workflow as the model or struct the mutation returns.
+        """
+        data = value.model_dump(by_alias=True)
+        # Imported here so that importing the domain does not build the models.
+        if isinstance(value, BaseModel):
+            from gpp_client.generated.set_observation_workflow_state import (
+                SetObservationWorkflowStateSetObservationWorkflowState,
+            )
+
+            return (
+                SetObservationWorkflowStateSetObservationWorkflowState.model_validate(
+                    data
+                )
+            )
+
+        from gpp_client.generated.structs import (
+            SetObservationWorkflowStateSetObservationWorkflowState,
+        )
+
+        return self._graphql.convert_struct(
+            data, SetObservationWorkflowStateSetObservationWorkflowState
+        )
+
     async def update_by_id_with_retry(
         self,
         observation_id: str,
@@ -1,1424 +1,1453 @@
-from .async_base_client import AsyncBaseClient
-from .base_model import BaseModel, Upload
-from .client import GraphQLClient
-from .clone_observation import (
-    CloneObservation,
-    CloneObservationCloneObservation,
-    CloneObservationCloneObservationNewObservation,
-)
-from .clone_target import (
-    CloneTarget,
-    CloneTargetCloneTarget,
-    CloneTargetCloneTargetNewTarget,
-)
-from .create_call_for_proposals import (
-    CreateCallForProposals,
-    CreateCallForProposalsCreateCallForProposals,
-    CreateCallForProposalsCreateCallForProposalsCallForProposals,
-)
-from .create_observation import (
-    CreateObservation,
-    CreateObservationCreateObservation,
-    CreateObservationCreateObservationObservation,
-)
-from .create_program import (
-    CreateProgram,
-    CreateProgramCreateProgram,
-    CreateProgramCreateProgramProgram,
-)
-from .create_target_by_program_id import (
-    CreateTargetByProgramId,
-    CreateTargetByProgramIdCreateTarget,
-    CreateTargetByProgramIdCreateTargetTarget,
-)
-from .create_target_by_program_reference import (
-    CreateTargetByProgramReference,
-    CreateTargetByProgramReferenceCreateTarget,
-    CreateTargetByProgramReferenceCreateTargetTarget,
-)
-from .create_target_by_proposal_reference import (
-    CreateTargetByProposalReference,
-    CreateTargetByProposalReferenceCreateTarget,
-    CreateTargetByProposalReferenceCreateTargetTarget,
-)
-from .delete_call_for_proposals_by_id import (
-    DeleteCallForProposalsById,
-    DeleteCallForProposalsByIdUpdateCallsForProposals,
-    DeleteCallForProposalsByIdUpdateCallsForProposalsCallsForProposals,
-)
-from .delete_observation_by_id import (
-    DeleteObservationById,
-    DeleteObservationByIdUpdateObservations,
-    DeleteObservationByIdUpdateObservationsObservations,
-)
-from .delete_observation_by_reference import (
-    DeleteObservationByReference,
-    DeleteObservationByReferenceUpdateObservations,
-    DeleteObservationByReferenceUpdateObservationsObservations,
-)
-from .delete_program_by_id import (
-    DeleteProgramById,
-    DeleteProgramByIdUpdatePrograms,
-    DeleteProgramByIdUpdateProgramsPrograms,
-    DeleteProgramByIdUpdateProgramsProgramsAllGroupElements,
-    DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsGroup,
-    DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMaximumInterval,
-    DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMinimumInterval,
-    DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsObservation,
-)
-from .delete_target_by_id import (
-    DeleteTargetById,
-    DeleteTargetByIdUpdateTargets,
-    DeleteTargetByIdUpdateTargetsTargets,
-    DeleteTargetByIdUpdateTargetsTargetsProgram,
-)
-from .enums import (
-    ArchiveDuplicationState,
-    ArcType,
-    AtomExecutionState,
-    AtomStage,
-    AttachmentType,
-    Band,
-    BasePositionType,
-    BlindOffsetType,
-    Breakpoint,
-    BrightnessIntegratedUnits,
-    BrightnessSurfaceUnits,
-    CalculationState,
-    CalibrationRole,
-    CassRotator,
-    CatalogName,
-    ChargeClass,
-    CloudExtinctionPreset,
-    ConditionsExpectationType,
-    ConditionsMeasurementSource,
-    ConfigurationRequestStatus,
-    ConsiderForBand3,
-    CoolStarTemperature,
-    DatabaseOperation,
-    DatasetQaState,
-    DatasetStage,
-    EditType,
-    EducationalStatus,
-    EmailStatus,
-    EphemerisKeyType,
-    ExchangeObservingModeType,
-    ExchangePartner,
-    ExecutionEventType,
-    ExecutionState,
-    Existence,
-    Flamingos2CustomSlitWidth,
-    Flamingos2Decker,
-    Flamingos2Disperser,
-    Flamingos2Filter,
-    Flamingos2Fpu,
-    Flamingos2LyotWheel,
-    Flamingos2ReadMode,
-    Flamingos2ReadoutMode,
-    Flamingos2Reads,
-    FluxDensityContinuumIntegratedUnits,
-    FluxDensityContinuumSurfaceUnits,
-    FocalPlane,
-    GalaxySpectrum,
-    GcalArc,
-    GcalContinuum,
-    GcalDiffuser,
-    GcalFilter,
-    GcalShutter,
-    GeminiCallForProposalsType,
-    Gender,
-    GhostBinning,
-    GhostIfu1FiberAgitator,
-    GhostIfu2FiberAgitator,
-    GhostIfuMappingType,
-    GhostReadMode,
-    GhostResolutionMode,
-    GmosAmpCount,
-    GmosAmpGain,
-    GmosAmpReadMode,
-    GmosBinning,
-    GmosCustomSlitWidth,
-    GmosDtax,
-    GmosEOffsetting,
-    GmosGratingOrder,
-    GmosLongSlitAcquisitionRoi,
-    GmosMosAcquisitionType,
-    GmosNorthBuiltinFpu,
-    GmosNorthDetector,
-    GmosNorthFilter,
-    GmosNorthGrating,
-    GmosNorthStageMode,
-    GmosRoi,
-    GmosSouthBuiltinFpu,
-    GmosSouthDetector,
-    GmosSouthFilter,
-    GmosSouthGrating,
-    GmosSouthStageMode,
-    GnirsAcquisitionType,
-    GnirsCamera,
-    GnirsDecker,
-    GnirsFilter,
-    GnirsFpuIfu,
-    GnirsFpuOther,
-    GnirsFpuSlit,
-    GnirsGrating,
-    GnirsPrism,
-    GnirsReadMode,
-    GnirsWellDepth,
-    GuideProbe,
-    GuideState,
-    HiiRegionSpectrum,
-    Ignore,
-    ImageQualityPreset,
-    ImagingCapability,
-    ImagingVariantType,
-    Instrument,
-    ItcType,
-    KeckInstrument,
-    LineFluxIntegratedUnits,
-    LineFluxSurfaceUnits,
-    MosPreImaging,
-    ObsActiveStatus,
-    ObservationValidationCode,
-    ObservationWorkflowState,
-    Observatory,
-    ObserveClass,
-    ObservingModeType,
-    ObsStatus,
-    Partner,
-    PartnerLinkType,
-    PlanetaryNebulaSpectrum,
-    PlanetSpectrum,
-    PortDisposition,
-    PosAngleConstraintMode,
-    ProgramType,
-    ProgramUserRole,
-    ProgramUserSupportRoleType,
-    ProposalStatus,
-    QuasarSpectrum,
-    SchedulingMode,
-    ScienceBand,
-    ScienceMode,
-    ScienceSubtype,
-    SeeingTrend,
-    SequenceCommand,
-    SequenceType,
-    Site,
-    SkyBackground,
-    SlewStage,
-    SlitOffsetMode,
-    SmartGcalType,
-    SpectroscopyCapability,
-    StellarLibrarySpectrum,
-    StepExecutionState,
-    StepStage,
-    StepType,
-    SubaruCallForProposalsType,
-    SubaruInstrument,
-    TacCategory,
-    TargetDisposition,
-    TelescopeConfigGeneratorType,
-    TelluricTag,
-    TimeAccountingCategory,
-    TimeChargeCorrectionOp,
-    TimingWindowInclusion,
-    TooActivation,
-    TooTriggerStatus,
-    UserInvitationStatus,
-    UserType,
-    VisitorObservingModeType,
-    WaterVapor,
-    WavelengthOrder,
-)
-from .exceptions import (
-    GraphQLClientError,
-    GraphQLClientGraphQLError,
-    GraphQLClientGraphQLMultiError,
-    GraphQLClientHttpError,
-    GraphQLClientInvalidResponseError,
-)
-from .fragments import (
-    AttachmentDetails,
-    CallForProposalsCore,
-    CallForProposalsCoreGemini,
-    CallForProposalsCoreKeck,
-    CallForProposalsCoreSubaru,
-    CallForProposalsDetails,
-    CallForProposalsDetailsActive,
-    ConstraintSetDetails,
-    ConstraintSetDetailsElevationRange,
-    ConstraintSetDetailsElevationRangeAirMass,
-    ConstraintSetDetailsElevationRangeHourAngle,
-    Flamingos2ImagingDetails,
-    Flamingos2ImagingDetailsFilters,
-    Flamingos2ImagingDetailsFiltersExposureTimeMode,
-    Flamingos2ImagingDetailsFiltersExposureTimeModeSignalToNoise,
-    Flamingos2ImagingDetailsFiltersExposureTimeModeSignalToNoiseAt,
-    Flamingos2ImagingDetailsFiltersExposureTimeModeTimeAndCount,
-    Flamingos2ImagingDetailsFiltersExposureTimeModeTimeAndCountTime,
-    Flamingos2ImagingDetailsInitialFilters,
-    Flamingos2ImagingDetailsInitialFiltersExposureTimeMode,
-    Flamingos2ImagingDetailsInitialFiltersExposureTimeModeSignalToNoise,
-    Flamingos2ImagingDetailsInitialFiltersExposureTimeModeSignalToNoiseAt,
-    Flamingos2ImagingDetailsInitialFiltersExposureTimeModeTimeAndCount,
-    Flamingos2ImagingDetailsInitialFiltersExposureTimeModeTimeAndCountAt,
-    Flamingos2ImagingDetailsInitialFiltersExposureTimeModeTimeAndCountTime,
-    Flamingos2LongSlitDetails,
-    Flamingos2LongSlitDetailsAcquisition,
-    Flamingos2LongSlitDetailsAcquisitionExposureTimeMode,
-    Flamingos2LongSlitDetailsAcquisitionExposureTimeModeSignalToNoise,
-    Flamingos2LongSlitDetailsAcquisitionExposureTimeModeSignalToNoiseAt,
-    Flamingos2LongSlitDetailsAcquisitionExposureTimeModeTimeAndCount,
-    Flamingos2LongSlitDetailsAcquisitionExposureTimeModeTimeAndCountAt,
-    Flamingos2LongSlitDetailsAcquisitionExposureTimeModeTimeAndCountTime,
-    Flamingos2LongSlitDetailsExposureTimeMode,
-    Flamingos2LongSlitDetailsExposureTimeModeSignalToNoise,
-    Flamingos2LongSlitDetailsExposureTimeModeSignalToNoiseAt,
-    Flamingos2LongSlitDetailsExposureTimeModeTimeAndCount,
-    Flamingos2LongSlitDetailsExposureTimeModeTimeAndCountAt,
-    Flamingos2LongSlitDetailsExposureTimeModeTimeAndCountTime,
-    Flamingos2LongSlitDetailsTelluricType,
-    GhostDetectorConfigDetails,
-    GhostDetectorConfigDetailsExposureTimeMode,
-    GhostDetectorConfigDetailsExposureTimeModeSignalToNoise,
-    GhostDetectorConfigDetailsExposureTimeModeSignalToNoiseAt,
-    GhostDetectorConfigDetailsExposureTimeModeTimeAndCount,
-    GhostDetectorConfigDetailsExposureTimeModeTimeAndCountAt,
-    GhostDetectorConfigDetailsExposureTimeModeTimeAndCountTime,
-    GhostIfuDetails,
-    GhostIfuDetailsBlue,
-    GhostIfuDetailsRed,
-    GhostIfuDetailsSkyPosition,
-    GhostIfuDetailsSkyPositionDec,
-    GhostIfuDetailsSkyPositionRa,
-    GhostIfuDetailsSlitViewingCameraExposureTime,
-    GmosNorthImagingDetails,
-    GmosNorthImagingDetailsFilters,
-    GmosNorthLongSlitDetails,
-    GmosNorthLongSlitDetailsCentralWavelength,
-    GmosNorthLongSlitDetailsOffsets,
-    GmosSouthImagingDetails,
-    GmosSouthImagingDetailsFilters,
-    GmosSouthLongSlitDetails,
-    GmosSouthLongSlitDetailsCentralWavelength,
-    GmosSouthLongSlitDetailsOffsets,
-    GnirsDetails,
-    GnirsDetailsGnirsImaging,
-    GnirsDetailsGnirsSpectroscopy,
-    GnirsImagingDetails,
-    GnirsImagingDetailsFilters,
-    GnirsImagingDetailsFiltersExposureTimeMode,
-    GnirsImagingDetailsFiltersExposureTimeModeSignalToNoise,
-    GnirsImagingDetailsFiltersExposureTimeModeSignalToNoiseAt,
-    GnirsImagingDetailsFiltersExposureTimeModeTimeAndCount,
-    GnirsImagingDetailsFiltersExposureTimeModeTimeAndCountAt,
-    GnirsImagingDetailsFiltersExposureTimeModeTimeAndCountTime,
-    GnirsImagingDetailsInitialFilters,
-    GnirsImagingDetailsInitialFiltersExposureTimeMode,
-    GnirsImagingDetailsInitialFiltersExposureTimeModeSignalToNoise,
-    GnirsImagingDetailsInitialFiltersExposureTimeModeSignalToNoiseAt,
-    GnirsImagingDetailsInitialFiltersExposureTimeModeTimeAndCount,
-    GnirsImagingDetailsInitialFiltersExposureTimeModeTimeAndCountAt,
-    GnirsImagingDetailsInitialFiltersExposureTimeModeTimeAndCountTime,
-    GnirsSpectroscopyDetails,
-    GnirsSpectroscopyDetailsAcquisition,
-    GnirsSpectroscopyDetailsAcquisitionExposureTimeMode,
-    GnirsSpectroscopyDetailsAcquisitionExposureTimeModeSignalToNoise,
-    GnirsSpectroscopyDetailsAcquisitionExposureTimeModeSignalToNoiseAt,
-    GnirsSpectroscopyDetailsAcquisitionExposureTimeModeTimeAndCount,
-    GnirsSpectroscopyDetailsAcquisitionExposureTimeModeTimeAndCountAt,
-    GnirsSpectroscopyDetailsAcquisitionExposureTimeModeTimeAndCountTime,
-    GnirsSpectroscopyDetailsAcquisitionSkyOffset,
-    GnirsSpectroscopyDetailsAcquisitionSkyOffsetP,
-    GnirsSpectroscopyDetailsAcquisitionSkyOffsetQ,
-    GnirsSpectroscopyDetailsCentralWavelengths,
-    GnirsSpectroscopyDetailsCentralWavelengthsCentralWavelength,
-    GnirsSpectroscopyDetailsIfu,
-    GnirsSpectroscopyDetailsIfuTelescopeConfigs,
-    GnirsSpectroscopyDetailsIfuTelescopeConfigsOffset,
-    GnirsSpectroscopyDetailsIfuTelescopeConfigsOffsetP,
-    GnirsSpectroscopyDetailsIfuTelescopeConfigsOffsetQ,
-    GnirsSpectroscopyDetailsSlit,
-    GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigs,
-    GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsAlongSlit,
-    GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsAlongSlitQ,
-    GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSky,
-    GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSkyOffset,
-    GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSkyOffsetP,
-    GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSkyOffsetQ,
-    GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigs,
-    GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsAlongSlit,
-    GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsAlongSlitQ,
-    GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSky,
-    GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSkyOffset,
-    GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSkyOffsetP,
-    GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSkyOffsetQ,
-    GnirsSpectroscopyDetailsSlitTelescopeConfigs,
-    GnirsSpectroscopyDetailsSlitTelescopeConfigsAlongSlit,
-    GnirsSpectroscopyDetailsSlitTelescopeConfigsAlongSlitQ,
-    GnirsSpectroscopyDetailsSlitTelescopeConfigsToSky,
-    GnirsSpectroscopyDetailsSlitTelescopeConfigsToSkyOffset,
-    GnirsSpectroscopyDetailsSlitTelescopeConfigsToSkyOffsetP,
-    GnirsSpectroscopyDetailsSlitTelescopeConfigsToSkyOffsetQ,
-    GnirsSpectroscopyDetailsTelluricType,
-    Igrins2LongSlitDetails,
-    Igrins2LongSlitDetailsExposureTimeMode,
-    Igrins2LongSlitDetailsExposureTimeModeSignalToNoise,
-    Igrins2LongSlitDetailsExposureTimeModeSignalToNoiseAt,
-    Igrins2LongSlitDetailsExposureTimeModeTimeAndCount,
-    Igrins2LongSlitDetailsExposureTimeModeTimeAndCountAt,
-    Igrins2LongSlitDetailsExposureTimeModeTimeAndCountTime,
-    Igrins2LongSlitDetailsTelluricType,
-    NonsiderealTargetDetails,
-    ObservationCore,
-    ObservationCoreReference,
-    ObservationDetails,
-    ObservationDetailsConstraintSet,
-    ObservationDetailsExecution,
-    ObservationDetailsExecutionDigest,
-    ObservationDetailsExecutionDigestValue,
-    ObservationDetailsExecutionDigestValueAcquisition,
-    ObservationDetailsExecutionDigestValueAcquisitionTimeEstimate,
-    ObservationDetailsExecutionDigestValueAcquisitionTimeEstimateNonCharged,
-    ObservationDetailsExecutionDigestValueAcquisitionTimeEstimateProgram,
-    ObservationDetailsExecutionDigestValueAcquisitionTimeEstimateTotal,
-    ObservationDetailsExecutionDigestValueSetup,
-    ObservationDetailsExecutionDigestValueSetupFull,
-    ObservationDetailsExecutionDigestValueSetupReacquisition,
-    ObservationDetailsObservingMode,
-    ObservationDetailsProgram,
-    ObservationDetailsScienceRequirements,
-    ObservationDetailsTargetEnvironment,
-    ObservationDetailsTimingWindows,
-    ObservationDetailsWorkflow,
-    ObservationWorkflowCore,
-    ObservationWorkflowDetails,
-    ObservationWorkflowDetailsValidationErrors,
-    ObservingModeDetails,
-    ObservingModeDetailsFlamingos2Imaging,
-    ObservingModeDetailsFlamingos2LongSlit,
-    ObservingModeDetailsGhostIfu,
-    ObservingModeDetailsGmosNorthImaging,
-    ObservingModeDetailsGmosNorthLongSlit,
-    ObservingModeDetailsGmosSouthImaging,
-    ObservingModeDetailsGmosSouthLongSlit,
-    ObservingModeDetailsGnirsImaging,
-    ObservingModeDetailsGnirsSpectroscopy,
-    ObservingModeDetailsIgrins2LongSlit,
-    ObservingModeDetailsVisitor,
-    OpportunityTargetDetails,
-    OpportunityTargetDetailsRegion,
-    OpportunityTargetDetailsRegionDeclinationArc,
-    OpportunityTargetDetailsRegionDeclinationArcEnd,
-    OpportunityTargetDetailsRegionDeclinationArcStart,
-    OpportunityTargetDetailsRegionRightAscensionArc,
-    OpportunityTargetDetailsRegionRightAscensionArcEnd,
-    OpportunityTargetDetailsRegionRightAscensionArcStart,
-    ProgramCore,
-    ProgramDetail,
-    ProgramDetailActive,
-    ProgramDetailPi,
-    ProgramDetailProposal,
-    ProgramDetailProposalCall,
-    ProgramDetailProposalCallActive,
-    ProgramDetailProposalCallGemini,
-    ProgramDetailProposalCallKeck,
-    ProgramDetailProposalCallSubaru,
-    ProgramDetailProposalGemini,
-    ProgramGroupElements,
-    ProgramGroupElementsAllGroupElements,
-    ProgramGroupElementsAllGroupElementsGroup,
-    ProgramGroupElementsAllGroupElementsGroupMaximumInterval,
-    ProgramGroupElementsAllGroupElementsGroupMinimumInterval,
-    ProgramGroupElementsAllGroupElementsObservation,
-    SchedulerProposal,
-    SchedulerProposalCall,
-    SchedulerProposalCallActive,
-    SchedulerProposalCallGemini,
-    SchedulerProposalCallKeck,
-    SchedulerProposalCallSubaru,
-    SchedulerProposalGemini,
-    ScienceRequirementsDetails,
-    SiderealTargetDetails,
-    SiderealTargetDetailsDec,
-    SiderealTargetDetailsRa,
-    TargetCore,
-    TargetDetails,
-    TargetDetailsNonsidereal,
-    TargetDetailsOpportunity,
-    TargetDetailsSidereal,
-    TargetEnvironmentDetails,
-    TargetEnvironmentDetailsAsterism,
-    TargetEnvironmentDetailsAsterismNonsidereal,
-    TargetEnvironmentDetailsAsterismSidereal,
-    TargetEnvironmentDetailsExplicitBase,
-    TargetEnvironmentDetailsExplicitBaseDec,
-    TargetEnvironmentDetailsExplicitBaseRa,
-    TargetProgramSummary,
-    TargetProgramSummaryProgram,
-    TimingWindowDetails,
-    TimingWindowDetailsEndTimingWindowEndAfter,
-    TimingWindowDetailsEndTimingWindowEndAfterAfter,
-    TimingWindowDetailsEndTimingWindowEndAfterRepeat,
-    TimingWindowDetailsEndTimingWindowEndAfterRepeatPeriod,
-    TimingWindowDetailsEndTimingWindowEndAt,
-    VisitorDetails,
-    VisitorDetailsAgsDiameter,
-    VisitorDetailsCentralWavelength,
-    VisitorDetailsTotalRequestTime,
-    WorkflowCore,
-    WorkflowDetails,
-    WorkflowDetailsValue,
-    WorkflowDetailsValueValidationErrors,
-)
-from .get_call_for_proposals import (
-    GetCallForProposals,
-    GetCallForProposalsCallForProposals,
-)
-from .get_calls_for_proposals import (
-    GetCallsForProposals,
-    GetCallsForProposalsCallsForProposals,
-    GetCallsForProposalsCallsForProposalsMatches,
-)
-from .get_goats_observations import (
-    GetGOATSObservations,
-    GetGOATSObservationsObservations,
-    GetGOATSObservationsObservationsMatches,
-    GetGOATSObservationsObservationsMatchesAttachments,
-    GetGOATSObservationsObservationsMatchesConstraintSet,
-    GetGOATSObservationsObservationsMatchesConstraintSetElevationRange,
-    GetGOATSObservationsObservationsMatchesConstraintSetElevationRangeAirMass,
-    GetGOATSObservationsObservationsMatchesConstraintSetElevationRangeHourAngle,
-    GetGOATSObservationsObservationsMatchesObservationDuration,
-    GetGOATSObservationsObservationsMatchesObservingMode,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImaging,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFilters,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeMode,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeSignalToNoise,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeSignalToNoiseAt,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeTimeAndCount,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeTimeAndCountAt,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeTimeAndCountTime,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariant,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGrouped,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsets,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumerated,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValues,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValuesOffset,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValuesOffsetP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValuesOffsetQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandom,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomCenter,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomCenterP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomCenterQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomSize,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiral,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralCenter,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralCenterP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralCenterQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralSize,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniform,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerA,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerAP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerAQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerB,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerBP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerBQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsets,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumerated,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValues,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffset,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandom,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomCenter,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomCenterP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomCenterQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomSize,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiral,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralCenter,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralCenterP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralCenterQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralSize,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniform,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerA,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerAP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerAQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerB,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerBP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerBQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleaved,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsets,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumerated,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValues,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValuesOffset,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandom,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomCenter,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomCenterP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomCenterQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomSize,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiral,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralCenter,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralCenterP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralCenterQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralSize,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniform,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerA,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerAP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerAQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerB,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerBP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerBQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsets,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumerated,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValues,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffset,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandom,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomCenter,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomCenterP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomCenterQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomSize,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiral,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralCenter,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralCenterP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralCenterQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralSize,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniform,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerA,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerAP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerAQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerB,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerBP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerBQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImaging,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset1,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset1P,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset1Q,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset2,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset2P,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset2Q,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset3,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset3P,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset3Q,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset4,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset4P,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset4Q,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlit,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitCentralWavelength,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeMode,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeSignalToNoise,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeSignalToNoiseAt,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeTimeAndCount,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeTimeAndCountAt,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeTimeAndCountTime,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitOffsets,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitWavelengthDithers,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImaging,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFilters,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeMode,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeSignalToNoise,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeSignalToNoiseAt,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeTimeAndCount,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeTimeAndCountAt,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeTimeAndCountTime,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariant,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGrouped,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsets,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumerated,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValues,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValuesOffset,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValuesOffsetP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValuesOffsetQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandom,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomCenter,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomCenterP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomCenterQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomSize,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiral,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralCenter,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralCenterP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralCenterQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralSize,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniform,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerA,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerAP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerAQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerB,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerBP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerBQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsets,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumerated,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValues,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffset,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandom,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomCenter,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomCenterP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomCenterQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomSize,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiral,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralCenter,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralCenterP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralCenterQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralSize,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniform,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerA,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerAP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerAQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerB,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerBP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerBQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleaved,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsets,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumerated,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValues,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValuesOffset,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandom,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomCenter,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomCenterP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomCenterQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomSize,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiral,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralCenter,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralCenterP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralCenterQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralSize,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniform,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerA,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerAP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerAQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerB,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerBP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerBQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsets,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumerated,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValues,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffset,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandom,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomCenter,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomCenterP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomCenterQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomSize,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiral,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralCenter,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralCenterP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralCenterQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralSize,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniform,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerA,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerAP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerAQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerB,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerBP,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerBQ,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImaging,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset1,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset1P,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset1Q,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset2,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset2P,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset2Q,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset3,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset3P,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset3Q,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset4,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset4P,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset4Q,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlit,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitCentralWavelength,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeMode,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeSignalToNoise,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeSignalToNoiseAt,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeTimeAndCount,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeTimeAndCountAt,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeTimeAndCountTime,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitOffsets,
-    GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitWavelengthDithers,
-    GetGOATSObservationsObservationsMatchesPosAngleConstraint,
-    GetGOATSObservationsObservationsMatchesPosAngleConstraintAngle,
-    GetGOATSObservationsObservationsMatchesProgram,
-    GetGOATSObservationsObservationsMatchesProgramAllocations,
-    GetGOATSObservationsObservationsMatchesProgramAllocationsDuration,
-    GetGOATSObservationsObservationsMatchesProgramTimeCharge,
-    GetGOATSObservationsObservationsMatchesProgramTimeChargeTime,
-    GetGOATSObservationsObservationsMatchesProgramTimeChargeTimeProgram,
-    GetGOATSObservationsObservationsMatchesReference,
-    GetGOATSObservationsObservationsMatchesScienceRequirements,
-    GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeMode,
-    GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeSignalToNoise,
-    GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeSignalToNoiseAt,
-    GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeTimeAndCount,
-    GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeTimeAndCountAt,
-    GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeTimeAndCountTime,
-    GetGOATSObservationsObservationsMatchesScienceRequirementsSpectroscopy,
-    GetGOATSObservationsObservationsMatchesScienceRequirementsSpectroscopyWavelength,
-    GetGOATSObservationsObservationsMatchesTargetEnvironment,
-    GetGOATSObservationsObservationsMatchesTargetEnvironmentAsterism,
-    GetGOATSObservationsObservationsMatchesTargetEnvironmentAsterismOpportunity,
-    GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTarget,
-    GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetOpportunity,
-    GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSidereal,
-    GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealDec,
-    GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealParallax,
-    GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealProperMotion,
-    GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealProperMotionDec,
-    GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealProperMotionRa,
-    GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealRa,
-    GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealRadialVelocity,
-    GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfile,
-    GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePoint,
-    GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalized,
-    GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedBrightnesses,
-    GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedSed,
-    GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedSedFluxDensities,
-    GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedSedFluxDensitiesWavelength,
-    GetGOATSObservationsObservationsMatchesTimingWindows,
-    GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfter,
-    GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfterAfter,
-    GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfterRepeat,
-    GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfterRepeatPeriod,
-    GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAt,
-    GetGOATSObservationsObservationsMatchesWorkflow,
-    GetGOATSObservationsObservationsMatchesWorkflowValue,
-    GetGOATSObservationsObservationsMatchesWorkflowValueValidationErrors,
-)
-from .get_goats_programs import (
-    GetGOATSPrograms,
-    GetGOATSProgramsPrograms,
-    GetGOATSProgramsProgramsMatches,
-    GetGOATSProgramsProgramsMatchesReference,
-)
-from .get_observation import GetObservation, GetObservationObservation
-from .get_observation_attachments_by_id import (
-    GetObservationAttachmentsById,
-    GetObservationAttachmentsByIdObservation,
-    GetObservationAttachmentsByIdObservationAttachments,
-)
-from .get_observation_attachments_by_reference import (
-    GetObservationAttachmentsByReference,
-    GetObservationAttachmentsByReferenceObservation,
-    GetObservationAttachmentsByReferenceObservationAttachments,
-)
-from .get_observation_workflow_state_by_id import (
-    GetObservationWorkflowStateById,
-    GetObservationWorkflowStateByIdObservation,
-    GetObservationWorkflowStateByIdObservationProgram,
-    GetObservationWorkflowStateByIdObservationWorkflow,
-)
-from .get_observation_workflow_state_by_reference import (
-    GetObservationWorkflowStateByReference,
-    GetObservationWorkflowStateByReferenceObservation,
-    GetObservationWorkflowStateByReferenceObservationProgram,
-    GetObservationWorkflowStateByReferenceObservationWorkflow,
-)
-from .get_observations import (
-    GetObservations,
-    GetObservationsObservations,
-    GetObservationsObservationsMatches,
-)
-from .get_program_attachments_by_id import (
-    GetProgramAttachmentsById,
-    GetProgramAttachmentsByIdProgram,
-    GetProgramAttachmentsByIdProgramAttachments,
-)
-from .get_program_attachments_by_proposal_reference import (
-    GetProgramAttachmentsByProposalReference,
-    GetProgramAttachmentsByProposalReferenceProgram,
-    GetProgramAttachmentsByProposalReferenceProgramAttachments,
-)
-from .get_program_attachments_by_reference import (
-    GetProgramAttachmentsByReference,
-    GetProgramAttachmentsByReferenceProgram,
-    GetProgramAttachmentsByReferenceProgramAttachments,
-)
-from .get_program_by_id import GetProgramById, GetProgramByIdProgram
-from .get_program_by_proposal_reference import (
-    GetProgramByProposalReference,
-    GetProgramByProposalReferenceProgram,
-)
-from .get_program_by_reference import (
-    GetProgramByReference,
-    GetProgramByReferenceProgram,
-)
-from .get_programs import GetPrograms, GetProgramsPrograms, GetProgramsProgramsMatches
-from .get_scheduler_all_programs_id import (
-    GetSchedulerAllProgramsId,
-    GetSchedulerAllProgramsIdPrograms,
-    GetSchedulerAllProgramsIdProgramsMatches,
-    GetSchedulerAllProgramsIdProgramsMatchesReference,
-)
-from .get_scheduler_programs import (
-    GetSchedulerPrograms,
-    GetSchedulerProgramsPrograms,
-    GetSchedulerProgramsProgramsMatches,
-    GetSchedulerProgramsProgramsMatchesActive,
-    GetSchedulerProgramsProgramsMatchesAllGroupElements,
-    GetSchedulerProgramsProgramsMatchesAllGroupElementsGroup,
-    GetSchedulerProgramsProgramsMatchesAllGroupElementsGroupMaximumInterval,
-    GetSchedulerProgramsProgramsMatchesAllGroupElementsGroupMinimumInterval,
-    GetSchedulerProgramsProgramsMatchesAllGroupElementsObservation,
-    GetSchedulerProgramsProgramsMatchesAllocations,
-    GetSchedulerProgramsProgramsMatchesAllocationsDuration,
-    GetSchedulerProgramsProgramsMatchesProposal,
-    GetSchedulerProgramsProgramsMatchesReference,
-    GetSchedulerProgramsProgramsMatchesTimeCharge,
-    GetSchedulerProgramsProgramsMatchesTimeChargeTime,
-    GetSchedulerProgramsProgramsMatchesTimeChargeTimeNonCharged,
-    GetSchedulerProgramsProgramsMatchesTimeChargeTimeProgram,
-    GetSchedulerProgramsProgramsMatchesTimeChargeTimeTotal,
-)
-from .get_target_by_id import GetTargetById, GetTargetByIdTarget
-from .get_targets import GetTargets, GetTargetsTargets, GetTargetsTargetsMatches
-from .input_types import (
-    AddDatasetEventInput,
-    AddEventBatchEntryInput,
-    AddEventBatchInput,
-    AddProgramUserInput,
-    AddSequenceEventInput,
-    AddSlewEventInput,
-    AddStepEventInput,
-    AddTimeChargeCorrectionInput,
-    AirMassRangeInput,
-    AllocationInput,
-    AngleInput,
-    AttachmentPropertiesInput,
-    BandBrightnessIntegratedInput,
-    BandBrightnessSurfaceInput,
-    BandNormalizedIntegratedInput,
-    BandNormalizedSurfaceInput,
-    CallForProposalsExchangePartnerInput,
-    CallForProposalsPartnerInput,
-    CallForProposalsPropertiesInput,
-    CatalogInfoInput,
-    ChangePrincipalInvestigatorInput,
-    ChangeProgramUserRoleInput,
-    ClassicalInput,
-    CloneGroupInput,
-    CloneObservationInput,
-    CloneTargetInput,
-    ConditionsEntryInput,
-    ConditionsExpectationInput,
-    ConditionsIntuitionInput,
-    ConditionsMeasurementInput,
-    ConfigurationRequestEditInput,
-    ConfigurationRequestProperties,
-    ConstraintSetInput,
-    CoordinateLimitsInput,
-    CoordinatesInput,
-    CreateCallForProposalsInput,
-    CreateConfigurationRequestInput,
-    CreateGroupInput,
-    CreateObservationInput,
-    CreateProgramInput,
-    CreateProgramNoteInput,
-    CreateProposalInput,
-    CreateTargetInput,
-    CreateUserInvitationInput,
-    DatasetEditInput,
-    DatasetPropertiesInput,
-    DeclinationArcInput,
-    DeclinationInput,
-    DeclineTooTriggerInput,
-    DeleteProgramUserInput,
-    DeleteProposalInput,
-    DeleteSequenceInput,
-    DemoScienceInput,
-    DirectorsTimeInput,
-    EditAsterismsPatchInput,
-    ElevationRangeInput,
-    EmissionLineIntegratedInput,
-    EmissionLinesIntegratedInput,
-    EmissionLinesSurfaceInput,
-    EmissionLineSurfaceInput,
-    EnumeratedTelescopeConfigGeneratorInput,
-    ExchangeInput,
-    ExecutionEventAddedInput,
-    ExposureTimeModeInput,
-    FastTurnaroundInput,
-    Flamingos2AtomInput,
-    Flamingos2CustomMaskInput,
-    Flamingos2DynamicInput,
-    Flamingos2FpuMaskInput,
-    Flamingos2ImagingFilterInput,
-    Flamingos2ImagingInput,
-    Flamingos2LongSlitAcquisitionInput,
-    Flamingos2LongSlitInput,
-    Flamingos2MosAcquisitionInput,
-    Flamingos2MosInput,
-    Flamingos2StaticInput,
-    Flamingos2StepInput,
-    FluxDensity,
-    FluxDensityContinuumIntegratedInput,
-    FluxDensityContinuumSurfaceInput,
-    GaussianInput,
-    GeminiCallPropertiesInput,
-    GeminiProposalTypeInput,
-    GhostAtomInput,
-    GhostDetectorConfigInput,
-    GhostDetectorInput,
-    GhostDynamicInput,
-    GhostIfuInput,
-    GhostStepInput,
-    GmosCcdModeInput,
-    GmosCustomMaskInput,
-    GmosNodAndShuffleInput,
-    GmosNorthAtomInput,
-    GmosNorthDynamicInput,
-    GmosNorthFpuInput,
-    GmosNorthGratingConfigInput,
-    GmosNorthImagingFilterInput,
-    GmosNorthImagingInput,
-    GmosNorthLongSlitAcquisitionInput,
-    GmosNorthLongSlitInput,
-    GmosNorthMosAcquisitionInput,
-    GmosNorthMosInput,
-    GmosNorthStaticInput,
-    GmosNorthStepInput,
-    GmosSouthAtomInput,
-    GmosSouthDynamicInput,
-    GmosSouthFpuInput,
-    GmosSouthGratingConfigInput,
-    GmosSouthImagingFilterInput,
-    GmosSouthImagingInput,
-    GmosSouthLongSlitAcquisitionInput,
-    GmosSouthLongSlitInput,
-    GmosSouthMosAcquisitionInput,
-    GmosSouthMosInput,
-    GmosSouthStaticInput,
-    GmosSouthStepInput,
-    GnirsAcquisitionMirrorOutInput,
-    GnirsAtomInput,
-    GnirsCentralWavelengthConfigInput,
-    GnirsDynamicInput,
-    GnirsIfuInput,
-    GnirsImagingAcquisitionInput,
-    GnirsImagingFilterInput,
-    GnirsImagingInput,
-    GnirsSlitInput,
-    GnirsSpectroscopyAcquisitionInput,
-    GnirsSpectroscopyInput,
-    GnirsStepInput,
-    GoaPropertiesInput,
-    GroupedImagingVariantInput,
-    GroupEditInput,
-    GroupElementInput,
-    GroupPropertiesInput,
-    HourAngleRangeInput,
-    Igrins2AtomInput,
-    Igrins2DynamicInput,
-    Igrins2LongSlitInput,
-    Igrins2StaticInput,
-    Igrins2StepInput,
-    Igrins2SvcInput,
-    ImagingScienceRequirementsInput,
-    ImagingVariantInput,
-    InterleavedImagingVariantInput,
-    KeckCallPropertiesInput,
-    KeckProposalTypeInput,
-    LargeProgramInput,
-    LineFluxIntegratedInput,
-    LineFluxSurfaceInput,
-    LinkUserInput,
-    NonsiderealInput,
-    ObscalcUpdateInput,
-    ObservationEditInput,
-    ObservationPropertiesInput,
-    ObservationTimesInput,
-    ObservingModeInput,
-    OffsetComponentInput,
-    OffsetInput,
-    OpportunityInput,
-    ParallaxInput,
-    PartnerLinkInput,
-    PartnerSplitInput,
-    PoorWeatherInput,
-    PosAngleConstraintInput,
-    PreImagingVariantInput,
-    ProgramEditInput,
-    ProgramNotePropertiesInput,
-    ProgramPropertiesInput,
-    ProgramReferencePropertiesCalibrationInput,
-    ProgramReferencePropertiesCommissioningInput,
-    ProgramReferencePropertiesEngineeringInput,
-    ProgramReferencePropertiesExampleInput,
-    ProgramReferencePropertiesInput,
-    ProgramReferencePropertiesKeckInput,
-    ProgramReferencePropertiesLibraryInput,
-    ProgramReferencePropertiesMonitoringInput,
-    ProgramReferencePropertiesScienceInput,
-    ProgramReferencePropertiesSubaruInput,
-    ProgramReferencePropertiesSystemInput,
-    ProgramUserPropertiesInput,
-    ProperMotionComponentInput,
-    ProperMotionInput,
-    ProposalPropertiesInput,
-    QueueInput,
-    RadialVelocityInput,
-    RandomTelescopeConfigGeneratorInput,
-    RecordDatasetInput,
-    RecordFlamingos2VisitInput,
-    RecordGmosNorthVisitInput,
-    RecordGmosSouthVisitInput,
-    RecordIgrins2VisitInput,
-    RecordVisitInput,
-    RedeemUserInvitationInput,
-    RefreshArchiveDuplicationInput,
-    RegionInput,
-    ReplaceFlamingos2SequenceInput,
-    ReplaceGhostSequenceInput,
-    ReplaceGmosNorthSequenceInput,
-    ReplaceGmosSouthSequenceInput,
-    ReplaceGnirsSequenceInput,
-    ReplaceIgrins2SequenceInput,
-    ResetAcquisitionInput,
-    RevokeUserInvitationInput,
-    RightAscensionArcInput,
-    RightAscensionInput,
-    SchedulingConstraintsInput,
-    ScienceRequirementsInput,
-    SetAllocationsInput,
-    SetGuideTargetNameInput,
-    SetObservationWorkflowStateInput,
-    SetProgramReferenceInput,
-    SetProgramResourceLimitInput,
-    SetProposalStatusInput,
-    SiderealInput,
-    SignalToNoiseExposureTimeModeInput,
-    SiteCoordinateLimitsInput,
-    SlitTelescopeConfigsInput,
-    SourceProfileInput,
-    SpectralDefinitionIntegratedInput,
-    SpectralDefinitionSurfaceInput,
-    SpectroscopyScienceRequirementsInput,
-    SpiralTelescopeConfigGeneratorInput,
-    StepConfigGcalInput,
-    StepConfigInput,
-    StepConfigSmartGcalInput,
-    SubaruCallPropertiesInput,
-    SubaruProposalTypeInput,
-    SystemVerificationInput,
-    TargetEditInput,
-    TargetEnvironmentInput,
-    TargetPropertiesInput,
-    TargetResolutionInput,
-    TelescopeConfigAlongSlitInput,
-    TelescopeConfigGeneratorInput,
-    TelescopeConfigInput,
-    TelluricTypeInput,
-    TimeAndCountExposureTimeModeInput,
-    TimeChargeCorrectionInput,
-    TimeSpanInput,
-    TimingWindowEndInput,
-    TimingWindowInput,
-    TimingWindowRepeatInput,
-    TooTriggerEditInput,
-    UniformTelescopeConfigGeneratorInput,
-    UnlinkUserInput,
-    UnnormalizedSedInput,
-    UpdateAsterismsInput,
-    UpdateAttachmentsInput,
-    UpdateCallsForProposalsInput,
-    UpdateConfigurationRequestsInput,
-    UpdateDatasetsInput,
-    UpdateGroupsInput,
-    UpdateObservationsInput,
-    UpdateObservationsTimesInput,
-    UpdateProgramNotesInput,
-    UpdateProgramsInput,
-    UpdateProgramUsersInput,
-    UpdateProposalInput,
-    UpdateTargetsInput,
-    UserProfileInput,
-    UserSuppliedEphemeris,
-    UserSuppliedEphemerisElement,
-    VisitorInput,
-    WavelengthDitherInput,
-    WavelengthInput,
-    WhereAngle,
-    WhereAttachment,
-    WhereAttachmentType,
-    WhereBoolean,
-    WhereCalculatedObservationWorkflow,
-    WhereCallForProposals,
-    WhereCone,
-    WhereConfigurationRequest,
-    WhereDataset,
-    WhereDatasetChronicleEntry,
-    WhereDatasetReference,
-    WhereEqDatabaseOperation,
-    WhereEqExecutionEventType,
-    WhereEqFocalPlane,
-    WhereEqGeminiCallForProposalsType,
-    WhereEqInstrument,
-    WhereEqPartner,
-    WhereEqPartnerLinkType,
-    WhereEqProgramType,
-    WhereEqProgramUserRole,
-    WhereEqProposalStatus,
-    WhereEqScienceSubtype,
-    WhereEqSite,
-    WhereEqStepId,
-    WhereEqTargetDisposition,
-    WhereEqTooActivation,
-    WhereEqUserType,
-    WhereEqVisitId,
-    WhereExecutionEvent,
-    WhereGeminiCallProperties,
-    WhereGroup,
-    WhereImagingConfigOption,
-    WhereObservation,
-    WhereObservationReference,
-    WhereObservatoryEq,
-    WhereOptionBoolean,
-    WhereOptionEqCalculationState,
-    WhereOptionEqCalibrationRole,
-    WhereOptionEqEducationalStatus,
-    WhereOptionEqExchangePartner,
-    WhereOptionEqGender,
-    WhereOptionEqImagingCapability,
-    WhereOptionEqInstrument,
-    WhereOptionEqObservingModeType,
-    WhereOptionEqPartner,
-    WhereOptionEqQaState,
-    WhereOptionEqSite,
-    WhereOptionEqSpectroscopyCapability,
-    WhereOptionEqTacCategory,
-    WhereOptionOrderScienceBand,
-    WhereOptionOrderTimestamp,
-    WhereOptionString,
-    WhereOrderAttachmentId,
-    WhereOrderBigDecimal,
-    WhereOrderCalculationState,
-    WhereOrderCallForProposalsId,
-    WhereOrderChronicleId,
-    WhereOrderConfigurationRequestId,
-    WhereOrderConfigurationRequestStatus,
-    WhereOrderDatasetId,
-    WhereOrderDatasetStage,
-    WhereOrderDate,
-    WhereOrderExecutionEventId,
-    WhereOrderGroupId,
-    WhereOrderInt,
-    WhereOrderLong,
-    WhereOrderObservationId,
-    WhereOrderObservationWorkflowState,
-    WhereOrderPosBigDecimal,
-    WhereOrderPosInt,
-    WhereOrderProgramId,
-    WhereOrderProgramNoteId,
-    WhereOrderProgramUserId,
-    WhereOrderSemester,
-    WhereOrderSequenceCommand,
-    WhereOrderSequenceType,
-    WhereOrderSlewStage,
-    WhereOrderStepStage,
-    WhereOrderTargetId,
-    WhereOrderTimestamp,
-    WhereOrderTooTriggerId,
-    WhereOrderTooTriggerStatus,
-    WhereOrderUserId,
-    WherePartnerLink,
-    WhereProgram,
-    WhereProgramNote,
-    WhereProgramReference,
-    WhereProgramUser,
-    WhereProposal,
-    WhereProposalPartnerEntry,
-    WhereProposalPartners,
-    WhereProposalReference,
-    WhereSpectroscopyConfigOption,
-    WhereString,
-    WhereTarget,
-    WhereTooTrigger,
-    WhereTooTriggerChronicleEntry,
-    WhereUser,
-    WhereUserProfile,
-    WhereWavelength,
-)
-from .obs_calculation_update import (
-    ObsCalculationUpdate,
-    ObsCalculationUpdateObscalcUpdate,
-    ObsCalculationUpdateObscalcUpdateValue,
-    ObsCalculationUpdateObscalcUpdateValueExecution,
-    ObsCalculationUpdateObscalcUpdateValueExecutionVisits,
-    ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatches,
-    ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatchesAtomRecords,
-    ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatchesAtomRecordsMatches,
-    ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatchesObservation,
-)
-from .observation_edit import (
-    ObservationEdit,
-    ObservationEditObservationEdit,
-    ObservationEditObservationEditValue,
-    ObservationEditObservationEditValueConstraintSet,
-    ObservationEditObservationEditValueConstraintSetElevationRange,
-    ObservationEditObservationEditValueConstraintSetElevationRangeAirMass,
-    ObservationEditObservationEditValueConstraintSetElevationRangeHourAngle,
-    ObservationEditObservationEditValueObservingMode,
-    ObservationEditObservationEditValueObservingModeGmosNorthLongSlit,
-    ObservationEditObservationEditValueObservingModeGmosNorthLongSlitCentralWavelength,
-    ObservationEditObservationEditValueObservingModeGmosSouthLongSlit,
-    ObservationEditObservationEditValueObservingModeGmosSouthLongSlitCentralWavelength,
-    ObservationEditObservationEditValueReference,
-    ObservationEditObservationEditValueScienceRequirements,
-    ObservationEditObservationEditValueTargetEnvironment,
-    ObservationEditObservationEditValueTargetEnvironmentAsterism,
-    ObservationEditObservationEditValueTargetEnvironmentAsterismNonsidereal,
-    ObservationEditObservationEditValueTargetEnvironmentAsterismSidereal,
-    ObservationEditObservationEditValueTargetEnvironmentAsterismSiderealDec,
-    ObservationEditObservationEditValueTargetEnvironmentAsterismSiderealRa,
-    ObservationEditObservationEditValueTargetEnvironmentExplicitBase,
-    ObservationEditObservationEditValueTargetEnvironmentExplicitBaseDec,
-    ObservationEditObservationEditValueTargetEnvironmentExplicitBaseRa,
-    ObservationEditObservationEditValueTimingWindows,
-    ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfter,
-    ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfterAfter,
-    ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfterRepeat,
-    ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfterRepeatPeriod,
-    ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAt,
-)
-from .ping import Ping, PingPrograms, PingProgramsMatches
-from .program_edit import (
-    ProgramEdit,
-    ProgramEditProgramEdit,
-    ProgramEditProgramEditValue,
-    ProgramEditProgramEditValueAllGroupElements,
-    ProgramEditProgramEditValueAllGroupElementsGroup,
-    ProgramEditProgramEditValueAllGroupElementsObservation,
-)
-from .restore_call_for_proposals_by_id import (
-    RestoreCallForProposalsById,
-    RestoreCallForProposalsByIdUpdateCallsForProposals,
-    RestoreCallForProposalsByIdUpdateCallsForProposalsCallsForProposals,
-)
-from .restore_observation_by_id import (
-    RestoreObservationById,
-    RestoreObservationByIdUpdateObservations,
-    RestoreObservationByIdUpdateObservationsObservations,
-)
-from .restore_observation_by_reference import (
-    RestoreObservationByReference,
-    RestoreObservationByReferenceUpdateObservations,
-    RestoreObservationByReferenceUpdateObservationsObservations,
-)
-from .restore_program_by_id import (
-    RestoreProgramById,
-    RestoreProgramByIdUpdatePrograms,
-    RestoreProgramByIdUpdateProgramsPrograms,
-    RestoreProgramByIdUpdateProgramsProgramsAllGroupElements,
-    RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsGroup,
-    RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMaximumInterval,
-    RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMinimumInterval,
-    RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsObservation,
-)
-from .restore_target_by_id import (
-    RestoreTargetById,
-    RestoreTargetByIdUpdateTargets,
-    RestoreTargetByIdUpdateTargetsTargets,
-    RestoreTargetByIdUpdateTargetsTargetsProgram,
-)
-from .scheduler_observations_updates import (
-    SchedulerObservationsUpdates,
-    SchedulerObservationsUpdatesObscalcUpdate,
-    SchedulerObservationsUpdatesObscalcUpdateValue,
-    SchedulerObservationsUpdatesObscalcUpdateValueConstraintSet,
-    SchedulerObservationsUpdatesObscalcUpdateValueConstraintSetElevationRange,
-    SchedulerObservationsUpdatesObscalcUpdateValueConstraintSetElevationRangeAirMass,
-    SchedulerObservationsUpdatesObscalcUpdateValueConstraintSetElevationRangeHourAngle,
-    SchedulerObservationsUpdatesObscalcUpdateValueExecution,
-    SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisits,
-    SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatches,
-    SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatchesAtomRecords,
-    SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatchesAtomRecordsMatches,
-    SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatchesObservation,
-    SchedulerObservationsUpdatesObscalcUpdateValueProgram,
-    SchedulerObservationsUpdatesObscalcUpdateValueProgramActive,
-    SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironment,
-    SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterism,
-    SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismNonsidereal,
-    SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismSidereal,
-    SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismSiderealDec,
-    SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismSiderealRa,
-    SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentExplicitBase,
-    SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentExplicitBaseDec,
-    SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentExplicitBaseRa,
-    SchedulerObservationsUpdatesObscalcUpdateValueTimingWindows,
-    SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfter,
-    SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfterAfter,
-    SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfterRepeat,
-    SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfterRepeatPeriod,
-    SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAt,
-    SchedulerObservationsUpdatesObscalcUpdateValueWorkflow,
-    SchedulerObservationsUpdatesObscalcUpdateValueWorkflowValue,
-)
-from .set_observation_workflow_state import (
-    SetObservationWorkflowState,
-    SetObservationWorkflowStateSetObservationWorkflowState,
-)
-from .target_edit import (
-    TargetEdit,
-    TargetEditTargetEdit,
-    TargetEditTargetEditValue,
-    TargetEditTargetEditValueNonsidereal,
-    TargetEditTargetEditValueSidereal,
-    TargetEditTargetEditValueSiderealDec,
-    TargetEditTargetEditValueSiderealRa,
-)
-from .update_call_for_proposals_by_id import (
-    UpdateCallForProposalsById,
-    UpdateCallForProposalsByIdUpdateCallsForProposals,
-    UpdateCallForProposalsByIdUpdateCallsForProposalsCallsForProposals,
-)
-from .update_calls_for_proposals import (
-    UpdateCallsForProposals,
-    UpdateCallsForProposalsUpdateCallsForProposals,
-    UpdateCallsForProposalsUpdateCallsForProposalsCallsForProposals,
-)
-from .update_observation_by_id import (
-    UpdateObservationById,
-    UpdateObservationByIdUpdateObservations,
-    UpdateObservationByIdUpdateObservationsObservations,
-)
-from .update_observation_by_reference import (
-    UpdateObservationByReference,
-    UpdateObservationByReferenceUpdateObservations,
-    UpdateObservationByReferenceUpdateObservationsObservations,
-)
-from .update_observations import (
-    UpdateObservations,
-    UpdateObservationsUpdateObservations,
-    UpdateObservationsUpdateObservationsObservations,
-)
-from .update_program_by_id import (
-    UpdateProgramById,
-    UpdateProgramByIdUpdatePrograms,
-    UpdateProgramByIdUpdateProgramsPrograms,
-)
-from .update_programs import (
-    UpdatePrograms,
-    UpdateProgramsUpdatePrograms,
-    UpdateProgramsUpdateProgramsPrograms,
-)
-from .update_target_by_id import (
-    UpdateTargetById,
-    UpdateTargetByIdUpdateTargets,
-    UpdateTargetByIdUpdateTargetsTargets,
-)
-from .update_targets import (
-    UpdateTargets,
-    UpdateTargetsUpdateTargets,
-    UpdateTargetsUpdateTargetsTargets,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
 
+if TYPE_CHECKING:
+    from .async_base_client import AsyncBaseClient
+    from .base_model import BaseModel, Upload
+    from .client import GraphQLClient
+    from .clone_observation import (
+        CloneObservation,
+        CloneObservationCloneObservation,
+        CloneObservationCloneObservationNewObservation,
+    )
+    from .clone_target import (
+        CloneTarget,
+        CloneTargetCloneTarget,
+        CloneTargetCloneTargetNewTarget,
+    )
+    from .create_call_for_proposals import (
+        CreateCallForProposals,
+        CreateCallForProposalsCreateCallForProposals,
+        CreateCallForProposalsCreateCallForProposalsCallForProposals,
+    )
+    from .create_observation import (
+        CreateObservation,
+        CreateObservationCreateObservation,
+        CreateObservationCreateObservationObservation,
+    )
+    from .create_program import (
+        CreateProgram,
+        CreateProgramCreateProgram,
+        CreateProgramCreateProgramProgram,
+    )
+    from .create_target_by_program_id import (
+        CreateTargetByProgramId,
+        CreateTargetByProgramIdCreateTarget,
+        CreateTargetByProgramIdCreateTargetTarget,
+    )
+    from .create_target_by_program_reference import (
+        CreateTargetByProgramReference,
+        CreateTargetByProgramReferenceCreateTarget,
+        CreateTargetByProgramReferenceCreateTargetTarget,
+    )
+    from .create_target_by_proposal_reference import (
+        CreateTargetByProposalReference,
+        CreateTargetByProposalReferenceCreateTarget,
+        CreateTargetByProposalReferenceCreateTargetTarget,
+    )
+    from .delete_call_for_proposals_by_id import (
+        DeleteCallForProposalsById,
+        DeleteCallForProposalsByIdUpdateCallsForProposals,
+        DeleteCallForProposalsByIdUpdateCallsForProposalsCallsForProposals,
+    )
+    from .delete_observation_by_id import (
+        DeleteObservationById,
+        DeleteObservationByIdUpdateObservations,
+        DeleteObservationByIdUpdateObservationsObservations,
+    )
+    from .delete_observation_by_reference import (
+        DeleteObservationByReference,
+        DeleteObservationByReferenceUpdateObservations,
+        DeleteObservationByReferenceUpdateObservationsObservations,
+    )
+    from .delete_program_by_id import (
+        DeleteProgramById,
+        DeleteProgramByIdUpdatePrograms,
+        DeleteProgramByIdUpdateProgramsPrograms,
+        DeleteProgramByIdUpdateProgramsProgramsAllGroupElements,
+        DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsGroup,
+        DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMaximumInterval,
+        DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMinimumInterval,
+        DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsObservation,
+    )
+    from .delete_target_by_id import (
+        DeleteTargetById,
+        DeleteTargetByIdUpdateTargets,
+        DeleteTargetByIdUpdateTargetsTargets,
+        DeleteTargetByIdUpdateTargetsTargetsProgram,
+    )
+    from .enums import (
+        ArchiveDuplicationState,
+        ArcType,
+        AtomExecutionState,
+        AtomStage,
+        AttachmentType,
+        Band,
+        BasePositionType,
+        BlindOffsetType,
+        Breakpoint,
+        BrightnessIntegratedUnits,
+        BrightnessSurfaceUnits,
+        CalculationState,
+        CalibrationRole,
+        CassRotator,
+        CatalogName,
+        ChargeClass,
+        CloudExtinctionPreset,
+        ConditionsExpectationType,
+        ConditionsMeasurementSource,
+        ConfigurationRequestStatus,
+        ConsiderForBand3,
+        CoolStarTemperature,
+        DatabaseOperation,
+        DatasetQaState,
+        DatasetStage,
+        EditType,
+        EducationalStatus,
+        EmailStatus,
+        EphemerisKeyType,
+        ExchangeObservingModeType,
+        ExchangePartner,
+        ExecutionEventType,
+        ExecutionState,
+        Existence,
+        Flamingos2CustomSlitWidth,
+        Flamingos2Decker,
+        Flamingos2Disperser,
+        Flamingos2Filter,
+        Flamingos2Fpu,
+        Flamingos2LyotWheel,
+        Flamingos2ReadMode,
+        Flamingos2ReadoutMode,
+        Flamingos2Reads,
+        FluxDensityContinuumIntegratedUnits,
+        FluxDensityContinuumSurfaceUnits,
+        FocalPlane,
+        GalaxySpectrum,
+        GcalArc,
+        GcalContinuum,
+        GcalDiffuser,
+        GcalFilter,
+        GcalShutter,
+        GeminiCallForProposalsType,
+        Gender,
+        GhostBinning,
+        GhostIfu1FiberAgitator,
+        GhostIfu2FiberAgitator,
+        GhostIfuMappingType,
+        GhostReadMode,
+        GhostResolutionMode,
+        GmosAmpCount,
+        GmosAmpGain,
+        GmosAmpReadMode,
+        GmosBinning,
+        GmosCustomSlitWidth,
+        GmosDtax,
+        GmosEOffsetting,
+        GmosGratingOrder,
+        GmosLongSlitAcquisitionRoi,
+        GmosMosAcquisitionType,
+        GmosNorthBuiltinFpu,
+        GmosNorthDetector,
+        GmosNorthFilter,
+        GmosNorthGrating,
+        GmosNorthStageMode,
+        GmosRoi,
+        GmosSouthBuiltinFpu,
+        GmosSouthDetector,
+        GmosSouthFilter,
+        GmosSouthGrating,
+        GmosSouthStageMode,
+        GnirsAcquisitionType,
+        GnirsCamera,
+        GnirsDecker,
+        GnirsFilter,
+        GnirsFpuIfu,
+        GnirsFpuOther,
+        GnirsFpuSlit,
+        GnirsGrating,
+        GnirsPrism,
+        GnirsReadMode,
+        GnirsWellDepth,
+        GuideProbe,
+        GuideState,
+        HiiRegionSpectrum,
+        Ignore,
+        ImageQualityPreset,
+        ImagingCapability,
+        ImagingVariantType,
+        Instrument,
+        ItcType,
+        KeckInstrument,
+        LineFluxIntegratedUnits,
+        LineFluxSurfaceUnits,
+        MosPreImaging,
+        ObsActiveStatus,
+        ObservationValidationCode,
+        ObservationWorkflowState,
+        Observatory,
+        ObserveClass,
+        ObservingModeType,
+        ObsStatus,
+        Partner,
+        PartnerLinkType,
+        PlanetaryNebulaSpectrum,
+        PlanetSpectrum,
+        PortDisposition,
+        PosAngleConstraintMode,
+        ProgramType,
+        ProgramUserRole,
+        ProgramUserSupportRoleType,
+        ProposalStatus,
+        QuasarSpectrum,
+        SchedulingMode,
+        ScienceBand,
+        ScienceMode,
+        ScienceSubtype,
+        SeeingTrend,
+        SequenceCommand,
+        SequenceType,
+        Site,
+        SkyBackground,
+        SlewStage,
+        SlitOffsetMode,
+        SmartGcalType,
+        SpectroscopyCapability,
+        StellarLibrarySpectrum,
+        StepExecutionState,
+        StepStage,
+        StepType,
+        SubaruCallForProposalsType,
+        SubaruInstrument,
+        TacCategory,
+        TargetDisposition,
+        TelescopeConfigGeneratorType,
+        TelluricTag,
+        TimeAccountingCategory,
+        TimeChargeCorrectionOp,
+        TimingWindowInclusion,
+        TooActivation,
+        TooTriggerStatus,
+        UserInvitationStatus,
+        UserType,
+        VisitorObservingModeType,
+        WaterVapor,
+        WavelengthOrder,
+    )
+    from .exceptions import (
+        GraphQLClientError,
+        GraphQLClientGraphQLError,
+        GraphQLClientGraphQLMultiError,
+        GraphQLClientHttpError,
+        GraphQLClientInvalidResponseError,
+    )
+    from .fragments import (
+        AttachmentDetails,
+        CallForProposalsCore,
+        CallForProposalsCoreGemini,
+        CallForProposalsCoreKeck,
+        CallForProposalsCoreSubaru,
+        CallForProposalsDetails,
+        CallForProposalsDetailsActive,
+        ConstraintSetDetails,
+        ConstraintSetDetailsElevationRange,
+        ConstraintSetDetailsElevationRangeAirMass,
+        ConstraintSetDetailsElevationRangeHourAngle,
+        Flamingos2ImagingDetails,
+        Flamingos2ImagingDetailsFilters,
+        Flamingos2ImagingDetailsFiltersExposureTimeMode,
+        Flamingos2ImagingDetailsFiltersExposureTimeModeSignalToNoise,
+        Flamingos2ImagingDetailsFiltersExposureTimeModeSignalToNoiseAt,
+        Flamingos2ImagingDetailsFiltersExposureTimeModeTimeAndCount,
+        Flamingos2ImagingDetailsFiltersExposureTimeModeTimeAndCountTime,
+        Flamingos2ImagingDetailsInitialFilters,
+        Flamingos2ImagingDetailsInitialFiltersExposureTimeMode,
+        Flamingos2ImagingDetailsInitialFiltersExposureTimeModeSignalToNoise,
+        Flamingos2ImagingDetailsInitialFiltersExposureTimeModeSignalToNoiseAt,
+        Flamingos2ImagingDetailsInitialFiltersExposureTimeModeTimeAndCount,
+        Flamingos2ImagingDetailsInitialFiltersExposureTimeModeTimeAndCountAt,
+        Flamingos2ImagingDetailsInitialFiltersExposureTimeModeTimeAndCountTime,
+        Flamingos2LongSlitDetails,
+        Flamingos2LongSlitDetailsAcquisition,
+        Flamingos2LongSlitDetailsAcquisitionExposureTimeMode,
+        Flamingos2LongSlitDetailsAcquisitionExposureTimeModeSignalToNoise,
+        Flamingos2LongSlitDetailsAcquisitionExposureTimeModeSignalToNoiseAt,
+        Flamingos2LongSlitDetailsAcquisitionExposureTimeModeTimeAndCount,
+        Flamingos2LongSlitDetailsAcquisitionExposureTimeModeTimeAndCountAt,
+        Flamingos2LongSlitDetailsAcquisitionExposureTimeModeTimeAndCountTime,
+        Flamingos2LongSlitDetailsExposureTimeMode,
+        Flamingos2LongSlitDetailsExposureTimeModeSignalToNoise,
+        Flamingos2LongSlitDetailsExposureTimeModeSignalToNoiseAt,
+        Flamingos2LongSlitDetailsExposureTimeModeTimeAndCount,
+        Flamingos2LongSlitDetailsExposureTimeModeTimeAndCountAt,
+        Flamingos2LongSlitDetailsExposureTimeModeTimeAndCountTime,
+        Flamingos2LongSlitDetailsTelluricType,
+        GhostDetectorConfigDetails,
+        GhostDetectorConfigDetailsExposureTimeMode,
+        GhostDetectorConfigDetailsExposureTimeModeSignalToNoise,
+        GhostDetectorConfigDetailsExposureTimeModeSignalToNoiseAt,
+        GhostDetectorConfigDetailsExposureTimeModeTimeAndCount,
+        GhostDetectorConfigDetailsExposureTimeModeTimeAndCountAt,
+        GhostDetectorConfigDetailsExposureTimeModeTimeAndCountTime,
+        GhostIfuDetails,
+        GhostIfuDetailsBlue,
+        GhostIfuDetailsRed,
+        GhostIfuDetailsSkyPosition,
+        GhostIfuDetailsSkyPositionDec,
+        GhostIfuDetailsSkyPositionRa,
+        GhostIfuDetailsSlitViewingCameraExposureTime,
+        GmosNorthImagingDetails,
+        GmosNorthImagingDetailsFilters,
+        GmosNorthLongSlitDetails,
+        GmosNorthLongSlitDetailsCentralWavelength,
+        GmosNorthLongSlitDetailsOffsets,
+        GmosSouthImagingDetails,
+        GmosSouthImagingDetailsFilters,
+        GmosSouthLongSlitDetails,
+        GmosSouthLongSlitDetailsCentralWavelength,
+        GmosSouthLongSlitDetailsOffsets,
+        GnirsDetails,
+        GnirsDetailsGnirsImaging,
+        GnirsDetailsGnirsSpectroscopy,
+        GnirsImagingDetails,
+        GnirsImagingDetailsFilters,
+        GnirsImagingDetailsFiltersExposureTimeMode,
+        GnirsImagingDetailsFiltersExposureTimeModeSignalToNoise,
+        GnirsImagingDetailsFiltersExposureTimeModeSignalToNoiseAt,
+        GnirsImagingDetailsFiltersExposureTimeModeTimeAndCount,
+        GnirsImagingDetailsFiltersExposureTimeModeTimeAndCountAt,
+        GnirsImagingDetailsFiltersExposureTimeModeTimeAndCountTime,
+        GnirsImagingDetailsInitialFilters,
+        GnirsImagingDetailsInitialFiltersExposureTimeMode,
+        GnirsImagingDetailsInitialFiltersExposureTimeModeSignalToNoise,
+        GnirsImagingDetailsInitialFiltersExposureTimeModeSignalToNoiseAt,
+        GnirsImagingDetailsInitialFiltersExposureTimeModeTimeAndCount,
+        GnirsImagingDetailsInitialFiltersExposureTimeModeTimeAndCountAt,
+        GnirsImagingDetailsInitialFiltersExposureTimeModeTimeAndCountTime,
+        GnirsSpectroscopyDetails,
+        GnirsSpectroscopyDetailsAcquisition,
+        GnirsSpectroscopyDetailsAcquisitionExposureTimeMode,
+        GnirsSpectroscopyDetailsAcquisitionExposureTimeModeSignalToNoise,
+        GnirsSpectroscopyDetailsAcquisitionExposureTimeModeSignalToNoiseAt,
+        GnirsSpectroscopyDetailsAcquisitionExposureTimeModeTimeAndCount,
+        GnirsSpectroscopyDetailsAcquisitionExposureTimeModeTimeAndCountAt,
+        GnirsSpectroscopyDetailsAcquisitionExposureTimeModeTimeAndCountTime,
+        GnirsSpectroscopyDetailsAcquisitionSkyOffset,
+        GnirsSpectroscopyDetailsAcquisitionSkyOffsetP,
+        GnirsSpectroscopyDetailsAcquisitionSkyOffsetQ,
+        GnirsSpectroscopyDetailsCentralWavelengths,
+        GnirsSpectroscopyDetailsCentralWavelengthsCentralWavelength,
+        GnirsSpectroscopyDetailsIfu,
+        GnirsSpectroscopyDetailsIfuTelescopeConfigs,
+        GnirsSpectroscopyDetailsIfuTelescopeConfigsOffset,
+        GnirsSpectroscopyDetailsIfuTelescopeConfigsOffsetP,
+        GnirsSpectroscopyDetailsIfuTelescopeConfigsOffsetQ,
+        GnirsSpectroscopyDetailsSlit,
+        GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigs,
+        GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsAlongSlit,
+        GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsAlongSlitQ,
+        GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSky,
+        GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSkyOffset,
+        GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSkyOffsetP,
+        GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSkyOffsetQ,
+        GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigs,
+        GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsAlongSlit,
+        GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsAlongSlitQ,
+        GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSky,
+        GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSkyOffset,
+        GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSkyOffsetP,
+        GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSkyOffsetQ,
+        GnirsSpectroscopyDetailsSlitTelescopeConfigs,
+        GnirsSpectroscopyDetailsSlitTelescopeConfigsAlongSlit,
+        GnirsSpectroscopyDetailsSlitTelescopeConfigsAlongSlitQ,
+        GnirsSpectroscopyDetailsSlitTelescopeConfigsToSky,
+        GnirsSpectroscopyDetailsSlitTelescopeConfigsToSkyOffset,
+        GnirsSpectroscopyDetailsSlitTelescopeConfigsToSkyOffsetP,
+        GnirsSpectroscopyDetailsSlitTelescopeConfigsToSkyOffsetQ,
+        GnirsSpectroscopyDetailsTelluricType,
+        Igrins2LongSlitDetails,
+        Igrins2LongSlitDetailsExposureTimeMode,
+        Igrins2LongSlitDetailsExposureTimeModeSignalToNoise,
+        Igrins2LongSlitDetailsExposureTimeModeSignalToNoiseAt,
+        Igrins2LongSlitDetailsExposureTimeModeTimeAndCount,
+        Igrins2LongSlitDetailsExposureTimeModeTimeAndCountAt,
+        Igrins2LongSlitDetailsExposureTimeModeTimeAndCountTime,
+        Igrins2LongSlitDetailsTelluricType,
+        NonsiderealTargetDetails,
+        ObservationCore,
+        ObservationCoreReference,
+        ObservationDetails,
+        ObservationDetailsConstraintSet,
+        ObservationDetailsExecution,
+        ObservationDetailsExecutionDigest,
+        ObservationDetailsExecutionDigestValue,
+        ObservationDetailsExecutionDigestValueAcquisition,
+        ObservationDetailsExecutionDigestValueAcquisitionTimeEstimate,
+        ObservationDetailsExecutionDigestValueAcquisitionTimeEstimateNonCharged,
+        ObservationDetailsExecutionDigestValueAcquisitionTimeEstimateProgram,
+        ObservationDetailsExecutionDigestValueAcquisitionTimeEstimateTotal,
+        ObservationDetailsExecutionDigestValueSetup,
+        ObservationDetailsExecutionDigestValueSetupFull,
+        ObservationDetailsExecutionDigestValueSetupReacquisition,
+        ObservationDetailsObservingMode,
+        ObservationDetailsProgram,
+        ObservationDetailsScienceRequirements,
+        ObservationDetailsTargetEnvironment,
+        ObservationDetailsTimingWindows,
+        ObservationDetailsWorkflow,
+        ObservationSummary,
+        ObservationSummaryProgram,
+        ObservationSummaryWorkflow,
+        ObservationWorkflowCore,
+        ObservationWorkflowDetails,
+        ObservationWorkflowDetailsValidationErrors,
+        ObservingModeDetails,
+        ObservingModeDetailsFlamingos2Imaging,
+        ObservingModeDetailsFlamingos2LongSlit,
+        ObservingModeDetailsGhostIfu,
+        ObservingModeDetailsGmosNorthImaging,
+        ObservingModeDetailsGmosNorthLongSlit,
+        ObservingModeDetailsGmosSouthImaging,
+        ObservingModeDetailsGmosSouthLongSlit,
+        ObservingModeDetailsGnirsImaging,
+        ObservingModeDetailsGnirsSpectroscopy,
+        ObservingModeDetailsIgrins2LongSlit,
+        ObservingModeDetailsVisitor,
+        OpportunityTargetDetails,
+        OpportunityTargetDetailsRegion,
+        OpportunityTargetDetailsRegionDeclinationArc,
+        OpportunityTargetDetailsRegionDeclinationArcEnd,
+        OpportunityTargetDetailsRegionDeclinationArcStart,
+        OpportunityTargetDetailsRegionRightAscensionArc,
+        OpportunityTargetDetailsRegionRightAscensionArcEnd,
+        OpportunityTargetDetailsRegionRightAscensionArcStart,
+        ProgramCore,
+        ProgramDetail,
+        ProgramDetailActive,
+        ProgramDetailPi,
+        ProgramDetailProposal,
+        ProgramDetailProposalCall,
+        ProgramDetailProposalCallActive,
+        ProgramDetailProposalCallGemini,
+        ProgramDetailProposalCallKeck,
+        ProgramDetailProposalCallSubaru,
+        ProgramDetailProposalGemini,
+        ProgramGroupElements,
+        ProgramGroupElementsAllGroupElements,
+        ProgramGroupElementsAllGroupElementsGroup,
+        ProgramGroupElementsAllGroupElementsGroupMaximumInterval,
+        ProgramGroupElementsAllGroupElementsGroupMinimumInterval,
+        ProgramGroupElementsAllGroupElementsObservation,
+        ProgramSummary,
+        ProgramSummaryReference,
+        SchedulerProposal,
+        SchedulerProposalCall,
+        SchedulerProposalCallActive,
+        SchedulerProposalCallGemini,
+        SchedulerProposalCallKeck,
+        SchedulerProposalCallSubaru,
+        SchedulerProposalGemini,
+        ScienceRequirementsDetails,
+        SiderealTargetDetails,
+        SiderealTargetDetailsDec,
+        SiderealTargetDetailsRa,
+        TargetCore,
+        TargetDetails,
+        TargetDetailsNonsidereal,
+        TargetDetailsOpportunity,
+        TargetDetailsSidereal,
+        TargetEnvironmentDetails,
+        TargetEnvironmentDetailsAsterism,
+        TargetEnvironmentDetailsAsterismNonsidereal,
+        TargetEnvironmentDetailsAsterismSidereal,
+        TargetEnvironmentDetailsExplicitBase,
+        TargetEnvironmentDetailsExplicitBaseDec,
+        TargetEnvironmentDetailsExplicitBaseRa,
+        TargetProgramSummary,
+        TargetProgramSummaryProgram,
+        TargetSummary,
+        TargetSummaryProgram,
+        TimingWindowDetails,
+        TimingWindowDetailsEndTimingWindowEndAfter,
+        TimingWindowDetailsEndTimingWindowEndAfterAfter,
+        TimingWindowDetailsEndTimingWindowEndAfterRepeat,
+        TimingWindowDetailsEndTimingWindowEndAfterRepeatPeriod,
+        TimingWindowDetailsEndTimingWindowEndAt,
+        VisitorDetails,
+        VisitorDetailsAgsDiameter,
+        VisitorDetailsCentralWavelength,
+        VisitorDetailsTotalRequestTime,
+        WorkflowCore,
+        WorkflowDetails,
+        WorkflowDetailsValue,
+        WorkflowDetailsValueValidationErrors,
+    )
+    from .get_call_for_proposals import (
+        GetCallForProposals,
+        GetCallForProposalsCallForProposals,
+    )
+    from .get_calls_for_proposals import (
+        GetCallsForProposals,
+        GetCallsForProposalsCallsForProposals,
+        GetCallsForProposalsCallsForProposalsMatches,
+    )
+    from .get_goats_observations import (
+        GetGOATSObservations,
+        GetGOATSObservationsObservations,
+        GetGOATSObservationsObservationsMatches,
+        GetGOATSObservationsObservationsMatchesAttachments,
+        GetGOATSObservationsObservationsMatchesConstraintSet,
+        GetGOATSObservationsObservationsMatchesConstraintSetElevationRange,
+        GetGOATSObservationsObservationsMatchesConstraintSetElevationRangeAirMass,
+        GetGOATSObservationsObservationsMatchesConstraintSetElevationRangeHourAngle,
+        GetGOATSObservationsObservationsMatchesObservationDuration,
+        GetGOATSObservationsObservationsMatchesObservingMode,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImaging,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFilters,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeMode,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeSignalToNoise,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeSignalToNoiseAt,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeTimeAndCount,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeTimeAndCountAt,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeTimeAndCountTime,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariant,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGrouped,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsets,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumerated,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValues,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValuesOffset,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValuesOffsetP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValuesOffsetQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandom,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiral,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniform,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerA,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerAP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerAQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerB,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerBP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerBQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsets,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumerated,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValues,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffset,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandom,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiral,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniform,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerA,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerAP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerAQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerB,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerBP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerBQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleaved,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsets,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumerated,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValues,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValuesOffset,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandom,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiral,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniform,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerA,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerAP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerAQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerB,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerBP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerBQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsets,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumerated,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValues,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffset,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandom,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiral,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniform,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerA,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerAP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerAQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerB,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerBP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerBQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImaging,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset1,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset1P,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset1Q,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset2,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset2P,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset2Q,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset3,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset3P,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset3Q,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset4,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset4P,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset4Q,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlit,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitCentralWavelength,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeMode,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeSignalToNoise,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeSignalToNoiseAt,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeTimeAndCount,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeTimeAndCountAt,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeTimeAndCountTime,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitOffsets,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitWavelengthDithers,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImaging,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFilters,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeMode,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeSignalToNoise,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeSignalToNoiseAt,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeTimeAndCount,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeTimeAndCountAt,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeTimeAndCountTime,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariant,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGrouped,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsets,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumerated,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValues,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValuesOffset,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValuesOffsetP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValuesOffsetQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandom,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiral,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniform,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerA,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerAP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerAQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerB,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerBP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerBQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsets,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumerated,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValues,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffset,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandom,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiral,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniform,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerA,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerAP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerAQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerB,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerBP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerBQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleaved,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsets,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumerated,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValues,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValuesOffset,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandom,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiral,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniform,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerA,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerAP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerAQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerB,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerBP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerBQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsets,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumerated,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValues,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffset,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandom,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiral,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniform,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerA,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerAP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerAQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerB,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerBP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerBQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImaging,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset1,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset1P,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset1Q,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset2,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset2P,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset2Q,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset3,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset3P,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset3Q,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset4,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset4P,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset4Q,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlit,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitCentralWavelength,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeMode,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeSignalToNoise,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeSignalToNoiseAt,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeTimeAndCount,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeTimeAndCountAt,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeTimeAndCountTime,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitOffsets,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitWavelengthDithers,
+        GetGOATSObservationsObservationsMatchesPosAngleConstraint,
+        GetGOATSObservationsObservationsMatchesPosAngleConstraintAngle,
+        GetGOATSObservationsObservationsMatchesProgram,
+        GetGOATSObservationsObservationsMatchesProgramAllocations,
+        GetGOATSObservationsObservationsMatchesProgramAllocationsDuration,
+        GetGOATSObservationsObservationsMatchesProgramTimeCharge,
+        GetGOATSObservationsObservationsMatchesProgramTimeChargeTime,
+        GetGOATSObservationsObservationsMatchesProgramTimeChargeTimeProgram,
+        GetGOATSObservationsObservationsMatchesReference,
+        GetGOATSObservationsObservationsMatchesScienceRequirements,
+        GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeMode,
+        GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeSignalToNoise,
+        GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeSignalToNoiseAt,
+        GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeTimeAndCount,
+        GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeTimeAndCountAt,
+        GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeTimeAndCountTime,
+        GetGOATSObservationsObservationsMatchesScienceRequirementsSpectroscopy,
+        GetGOATSObservationsObservationsMatchesScienceRequirementsSpectroscopyWavelength,
+        GetGOATSObservationsObservationsMatchesTargetEnvironment,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentAsterism,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentAsterismOpportunity,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTarget,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetOpportunity,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSidereal,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealDec,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealParallax,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealProperMotion,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealProperMotionDec,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealProperMotionRa,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealRa,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealRadialVelocity,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfile,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePoint,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalized,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedBrightnesses,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedSed,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedSedFluxDensities,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedSedFluxDensitiesWavelength,
+        GetGOATSObservationsObservationsMatchesTimingWindows,
+        GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfter,
+        GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfterAfter,
+        GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfterRepeat,
+        GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfterRepeatPeriod,
+        GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAt,
+        GetGOATSObservationsObservationsMatchesWorkflow,
+        GetGOATSObservationsObservationsMatchesWorkflowValue,
+        GetGOATSObservationsObservationsMatchesWorkflowValueValidationErrors,
+    )
+    from .get_goats_programs import (
+        GetGOATSPrograms,
+        GetGOATSProgramsPrograms,
+        GetGOATSProgramsProgramsMatches,
+        GetGOATSProgramsProgramsMatchesReference,
+    )
+    from .get_observation import GetObservation, GetObservationObservation
+    from .get_observation_attachments_by_id import (
+        GetObservationAttachmentsById,
+        GetObservationAttachmentsByIdObservation,
+        GetObservationAttachmentsByIdObservationAttachments,
+    )
+    from .get_observation_attachments_by_reference import (
+        GetObservationAttachmentsByReference,
+        GetObservationAttachmentsByReferenceObservation,
+        GetObservationAttachmentsByReferenceObservationAttachments,
+    )
+    from .get_observation_summaries import (
+        GetObservationSummaries,
+        GetObservationSummariesObservations,
+        GetObservationSummariesObservationsMatches,
+    )
+    from .get_observation_workflow_state_by_id import (
+        GetObservationWorkflowStateById,
+        GetObservationWorkflowStateByIdObservation,
+        GetObservationWorkflowStateByIdObservationProgram,
+        GetObservationWorkflowStateByIdObservationWorkflow,
+    )
+    from .get_observation_workflow_state_by_reference import (
+        GetObservationWorkflowStateByReference,
+        GetObservationWorkflowStateByReferenceObservation,
+        GetObservationWorkflowStateByReferenceObservationProgram,
+        GetObservationWorkflowStateByReferenceObservationWorkflow,
+    )
+    from .get_observations import (
+        GetObservations,
+        GetObservationsObservations,
+        GetObservationsObservationsMatches,
+    )
+    from .get_program_attachments_by_id import (
+        GetProgramAttachmentsById,
+        GetProgramAttachmentsByIdProgram,
+        GetProgramAttachmentsByIdProgramAttachments,
+    )
+    from .get_program_attachments_by_proposal_reference import (
+        GetProgramAttachmentsByProposalReference,
+        GetProgramAttachmentsByProposalReferenceProgram,
+        GetProgramAttachmentsByProposalReferenceProgramAttachments,
+    )
+    from .get_program_attachments_by_reference import (
+        GetProgramAttachmentsByReference,
+        GetProgramAttachmentsByReferenceProgram,
+        GetProgramAttachmentsByReferenceProgramAttachments,
+    )
+    from .get_program_by_id import GetProgramById, GetProgramByIdProgram
+    from .get_program_by_proposal_reference import (
+        GetProgramByProposalReference,
+        GetProgramByProposalReferenceProgram,
+    )
+    from .get_program_by_reference import (
+        GetProgramByReference,
+        GetProgramByReferenceProgram,
+    )
+    from .get_program_summaries import (
+        GetProgramSummaries,
+        GetProgramSummariesPrograms,
+        GetProgramSummariesProgramsMatches,
+    )
+    from .get_programs import (
+        GetPrograms,
+        GetProgramsPrograms,
+        GetProgramsProgramsMatches,
+    )
+    from .get_scheduler_all_programs_id import (
+        GetSchedulerAllProgramsId,
+        GetSchedulerAllProgramsIdPrograms,
+        GetSchedulerAllProgramsIdProgramsMatches,
+        GetSchedulerAllProgramsIdProgramsMatchesReference,
+    )
+    from .get_scheduler_programs import (
+        GetSchedulerPrograms,
+        GetSchedulerProgramsPrograms,
+        GetSchedulerProgramsProgramsMatches,
+        GetSchedulerProgramsProgramsMatchesActive,
+        GetSchedulerProgramsProgramsMatchesAllGroupElements,
+        GetSchedulerProgramsProgramsMatchesAllGroupElementsGroup,
+        GetSchedulerProgramsProgramsMatchesAllGroupElementsGroupMaximumInterval,
+        GetSchedulerProgramsProgramsMatchesAllGroupElementsGroupMinimumInterval,
+        GetSchedulerProgramsProgramsMatchesAllGroupElementsObservation,
+        GetSchedulerProgramsProgramsMatchesAllocations,
+        GetSchedulerProgramsProgramsMatchesAllocationsDuration,
+        GetSchedulerProgramsProgramsMatchesProposal,
+        GetSchedulerProgramsProgramsMatchesReference,
+        GetSchedulerProgramsProgramsMatchesTimeCharge,
+        GetSchedulerProgramsProgramsMatchesTimeChargeTime,
+        GetSchedulerProgramsProgramsMatchesTimeChargeTimeNonCharged,
+        GetSchedulerProgramsProgramsMatchesTimeChargeTimeProgram,
+        GetSchedulerProgramsProgramsMatchesTimeChargeTimeTotal,
+    )
+    from .get_target_by_id import GetTargetById, GetTargetByIdTarget
+    from .get_target_summaries import (
+        GetTargetSummaries,
+        GetTargetSummariesTargets,
+        GetTargetSummariesTargetsMatches,
+    )
+    from .get_targets import GetTargets, GetTargetsTargets, GetTargetsTargetsMatches
+    from .input_types import (
+        AddDatasetEventInput,
+        AddEventBatchEntryInput,
+        AddEventBatchInput,
+        AddProgramUserInput,
+        AddSequenceEventInput,
+        AddSlewEventInput,
+        AddStepEventInput,
+        AddTimeChargeCorrectionInput,
+        AirMassRangeInput,
+        AllocationInput,
+        AngleInput,
+        AttachmentPropertiesInput,
+        BandBrightnessIntegratedInput,
+        BandBrightnessSurfaceInput,
+        BandNormalizedIntegratedInput,
+        BandNormalizedSurfaceInput,
+        CallForProposalsExchangePartnerInput,
+        CallForProposalsPartnerInput,
+        CallForProposalsPropertiesInput,
+        CatalogInfoInput,
+        ChangePrincipalInvestigatorInput,
+        ChangeProgramUserRoleInput,
+        ClassicalInput,
+        CloneGroupInput,
+        CloneObservationInput,
+        CloneTargetInput,
+        ConditionsEntryInput,
+        ConditionsExpectationInput,
+        ConditionsIntuitionInput,
+        ConditionsMeasurementInput,
+        ConfigurationRequestEditInput,
+        ConfigurationRequestProperties,
+        ConstraintSetInput,
+        CoordinateLimitsInput,
+        CoordinatesInput,
+        CreateCallForProposalsInput,
+        CreateConfigurationRequestInput,
+        CreateGroupInput,
+        CreateObservationInput,
+        CreateProgramInput,
+        CreateProgramNoteInput,
+        CreateProposalInput,
+        CreateTargetInput,
+        CreateUserInvitationInput,
+        DatasetEditInput,
+        DatasetPropertiesInput,
+        DeclinationArcInput,
+        DeclinationInput,
+        DeclineTooTriggerInput,
+        DeleteProgramUserInput,
+        DeleteProposalInput,
+        DeleteSequenceInput,
+        DemoScienceInput,
+        DirectorsTimeInput,
+        EditAsterismsPatchInput,
+        ElevationRangeInput,
+        EmissionLineIntegratedInput,
+        EmissionLinesIntegratedInput,
+        EmissionLinesSurfaceInput,
+        EmissionLineSurfaceInput,
+        EnumeratedTelescopeConfigGeneratorInput,
+        ExchangeInput,
+        ExecutionEventAddedInput,
+        ExposureTimeModeInput,
+        FastTurnaroundInput,
+        Flamingos2AtomInput,
+        Flamingos2CustomMaskInput,
+        Flamingos2DynamicInput,
+        Flamingos2FpuMaskInput,
+        Flamingos2ImagingFilterInput,
+        Flamingos2ImagingInput,
+        Flamingos2LongSlitAcquisitionInput,
+        Flamingos2LongSlitInput,
+        Flamingos2MosAcquisitionInput,
+        Flamingos2MosInput,
+        Flamingos2StaticInput,
+        Flamingos2StepInput,
+        FluxDensity,
+        FluxDensityContinuumIntegratedInput,
+        FluxDensityContinuumSurfaceInput,
+        GaussianInput,
+        GeminiCallPropertiesInput,
+        GeminiProposalTypeInput,
+        GhostAtomInput,
+        GhostDetectorConfigInput,
+        GhostDetectorInput,
+        GhostDynamicInput,
+        GhostIfuInput,
+        GhostStepInput,
+        GmosCcdModeInput,
+        GmosCustomMaskInput,
+        GmosNodAndShuffleInput,
+        GmosNorthAtomInput,
+        GmosNorthDynamicInput,
+        GmosNorthFpuInput,
+        GmosNorthGratingConfigInput,
+        GmosNorthImagingFilterInput,
+        GmosNorthImagingInput,
+        GmosNorthLongSlitAcquisitionInput,
+        GmosNorthLongSlitInput,
+        GmosNorthMosAcquisitionInput,
+        GmosNorthMosInput,
+        GmosNorthStaticInput,
+        GmosNorthStepInput,
+        GmosSouthAtomInput,
+        GmosSouthDynamicInput,
+        GmosSouthFpuInput,
+        GmosSouthGratingConfigInput,
+        GmosSouthImagingFilterInput,
+        GmosSouthImagingInput,
+        GmosSouthLongSlitAcquisitionInput,
+        GmosSouthLongSlitInput,
+        GmosSouthMosAcquisitionInput,
+        GmosSouthMosInput,
+        GmosSouthStaticInput,
+        GmosSouthStepInput,
+        GnirsAcquisitionMirrorOutInput,
+        GnirsAtomInput,
+        GnirsCentralWavelengthConfigInput,
+        GnirsDynamicInput,
+        GnirsIfuInput,
+        GnirsImagingAcquisitionInput,
+        GnirsImagingFilterInput,
+        GnirsImagingInput,
+        GnirsSlitInput,
+        GnirsSpectroscopyAcquisitionInput,
+        GnirsSpectroscopyInput,
+        GnirsStepInput,
+        GoaPropertiesInput,
+        GroupedImagingVariantInput,
+        GroupEditInput,
+        GroupElementInput,
+        GroupPropertiesInput,
+        HourAngleRangeInput,
+        Igrins2AtomInput,
+        Igrins2DynamicInput,
+        Igrins2LongSlitInput,
+        Igrins2StaticInput,
+        Igrins2StepInput,
+        Igrins2SvcInput,
+        ImagingScienceRequirementsInput,
+        ImagingVariantInput,
+        InterleavedImagingVariantInput,
+        KeckCallPropertiesInput,
+        KeckProposalTypeInput,
+        LargeProgramInput,
+        LineFluxIntegratedInput,
+        LineFluxSurfaceInput,
+        LinkUserInput,
+        NonsiderealInput,
+        ObscalcUpdateInput,
+        ObservationEditInput,
+        ObservationPropertiesInput,
+        ObservationTimesInput,
+        ObservingModeInput,
+        OffsetComponentInput,
+        OffsetInput,
+        OpportunityInput,
+        ParallaxInput,
+        PartnerLinkInput,
+        PartnerSplitInput,
+        PoorWeatherInput,
+        PosAngleConstraintInput,
+        PreImagingVariantInput,
+        ProgramEditInput,
+        ProgramNotePropertiesInput,
+        ProgramPropertiesInput,
+        ProgramReferencePropertiesCalibrationInput,
+        ProgramReferencePropertiesCommissioningInput,
+        ProgramReferencePropertiesEngineeringInput,
+        ProgramReferencePropertiesExampleInput,
+        ProgramReferencePropertiesInput,
+        ProgramReferencePropertiesKeckInput,
+        ProgramReferencePropertiesLibraryInput,
+        ProgramReferencePropertiesMonitoringInput,
+        ProgramReferencePropertiesScienceInput,
+        ProgramReferencePropertiesSubaruInput,
+        ProgramReferencePropertiesSystemInput,
+        ProgramUserPropertiesInput,
+        ProperMotionComponentInput,
+        ProperMotionInput,
+        ProposalPropertiesInput,
+        QueueInput,
+        RadialVelocityInput,
+        RandomTelescopeConfigGeneratorInput,
+        RecordDatasetInput,
+        RecordFlamingos2VisitInput,
+        RecordGmosNorthVisitInput,
+        RecordGmosSouthVisitInput,
+        RecordIgrins2VisitInput,
+        RecordVisitInput,
+        RedeemUserInvitationInput,
+        RefreshArchiveDuplicationInput,
+        RegionInput,
+        ReplaceFlamingos2SequenceInput,
+        ReplaceGhostSequenceInput,
+        ReplaceGmosNorthSequenceInput,
+        ReplaceGmosSouthSequenceInput,
+        ReplaceGnirsSequenceInput,
+        ReplaceIgrins2SequenceInput,
+        ResetAcquisitionInput,
+        RevokeUserInvitationInput,
+        RightAscensionArcInput,
+        RightAscensionInput,
+        SchedulingConstraintsInput,
+        ScienceRequirementsInput,
+        SetAllocationsInput,
+        SetGuideTargetNameInput,
+        SetObservationWorkflowStateInput,
+        SetProgramReferenceInput,
+        SetProgramResourceLimitInput,
+        SetProposalStatusInput,
+        SiderealInput,
+        SignalToNoiseExposureTimeModeInput,
+        SiteCoordinateLimitsInput,
+        SlitTelescopeConfigsInput,
+        SourceProfileInput,
+        SpectralDefinitionIntegratedInput,
+        SpectralDefinitionSurfaceInput,
+        SpectroscopyScienceRequirementsInput,
+        SpiralTelescopeConfigGeneratorInput,
+        StepConfigGcalInput,
+        StepConfigInput,
+        StepConfigSmartGcalInput,
+        SubaruCallPropertiesInput,
+        SubaruProposalTypeInput,
+        SystemVerificationInput,
+        TargetEditInput,
+        TargetEnvironmentInput,
+        TargetPropertiesInput,
+        TargetResolutionInput,
+        TelescopeConfigAlongSlitInput,
+        TelescopeConfigGeneratorInput,
+        TelescopeConfigInput,
+        TelluricTypeInput,
+        TimeAndCountExposureTimeModeInput,
+        TimeChargeCorrectionInput,
+        TimeSpanInput,
+        TimingWindowEndInput,
+        TimingWindowInput,
+        TimingWindowRepeatInput,
+        TooTriggerEditInput,
+        UniformTelescopeConfigGeneratorInput,
+        UnlinkUserInput,
+        UnnormalizedSedInput,
+        UpdateAsterismsInput,
+        UpdateAttachmentsInput,
+        UpdateCallsForProposalsInput,
+        UpdateConfigurationRequestsInput,
+        UpdateDatasetsInput,
+        UpdateGroupsInput,
+        UpdateObservationsInput,
+        UpdateObservationsTimesInput,
+        UpdateProgramNotesInput,
+        UpdateProgramsInput,
+        UpdateProgramUsersInput,
+        UpdateProposalInput,
+        UpdateTargetsInput,
+        UserProfileInput,
+        UserSuppliedEphemeris,
+        UserSuppliedEphemerisElement,
+        VisitorInput,
+        WavelengthDitherInput,
+        WavelengthInput,
+        WhereAngle,
+        WhereAttachment,
+        WhereAttachmentType,
+        WhereBoolean,
+        WhereCalculatedObservationWorkflow,
+        WhereCallForProposals,
+        WhereCone,
+        WhereConfigurationRequest,
+        WhereDataset,
+        WhereDatasetChronicleEntry,
+        WhereDatasetReference,
+        WhereEqDatabaseOperation,
+        WhereEqExecutionEventType,
+        WhereEqFocalPlane,
+        WhereEqGeminiCallForProposalsType,
+        WhereEqInstrument,
+        WhereEqPartner,
+        WhereEqPartnerLinkType,
+        WhereEqProgramType,
+        WhereEqProgramUserRole,
+        WhereEqProposalStatus,
+        WhereEqScienceSubtype,
+        WhereEqSite,
+        WhereEqStepId,
+        WhereEqTargetDisposition,
+        WhereEqTooActivation,
+        WhereEqUserType,
+        WhereEqVisitId,
+        WhereExecutionEvent,
+        WhereGeminiCallProperties,
+        WhereGroup,
+        WhereImagingConfigOption,
+        WhereObservation,
+        WhereObservationReference,
+        WhereObservatoryEq,
+        WhereOptionBoolean,
+        WhereOptionEqCalculationState,
+        WhereOptionEqCalibrationRole,
+        WhereOptionEqEducationalStatus,
+        WhereOptionEqExchangePartner,
+        WhereOptionEqGender,
+        WhereOptionEqImagingCapability,
+        WhereOptionEqInstrument,
+        WhereOptionEqObservingModeType,
+        WhereOptionEqPartner,
+        WhereOptionEqQaState,
+        WhereOptionEqSite,
+        WhereOptionEqSpectroscopyCapability,
+        WhereOptionEqTacCategory,
+        WhereOptionOrderScienceBand,
+        WhereOptionOrderTimestamp,
+        WhereOptionString,
+        WhereOrderAttachmentId,
+        WhereOrderBigDecimal,
+        WhereOrderCalculationState,
+        WhereOrderCallForProposalsId,
+        WhereOrderChronicleId,
+        WhereOrderConfigurationRequestId,
+        WhereOrderConfigurationRequestStatus,
+        WhereOrderDatasetId,
+        WhereOrderDatasetStage,
+        WhereOrderDate,
+        WhereOrderExecutionEventId,
+        WhereOrderGroupId,
+        WhereOrderInt,
+        WhereOrderLong,
+        WhereOrderObservationId,
+        WhereOrderObservationWorkflowState,
+        WhereOrderPosBigDecimal,
+        WhereOrderPosInt,
+        WhereOrderProgramId,
+        WhereOrderProgramNoteId,
+        WhereOrderProgramUserId,
+        WhereOrderSemester,
+        WhereOrderSequenceCommand,
+        WhereOrderSequenceType,
+        WhereOrderSlewStage,
+        WhereOrderStepStage,
+        WhereOrderTargetId,
+        WhereOrderTimestamp,
+        WhereOrderTooTriggerId,
+        WhereOrderTooTriggerStatus,
+        WhereOrderUserId,
+        WherePartnerLink,
+        WhereProgram,
+        WhereProgramNote,
+        WhereProgramReference,
+        WhereProgramUser,
+        WhereProposal,
+        WhereProposalPartnerEntry,
+        WhereProposalPartners,
+        WhereProposalReference,
+        WhereSpectroscopyConfigOption,
+        WhereString,
+        WhereTarget,
+        WhereTooTrigger,
+        WhereTooTriggerChronicleEntry,
+        WhereUser,
+        WhereUserProfile,
+        WhereWavelength,
+    )
+    from .obs_calculation_update import (
+        ObsCalculationUpdate,
+        ObsCalculationUpdateObscalcUpdate,
+        ObsCalculationUpdateObscalcUpdateValue,
+        ObsCalculationUpdateObscalcUpdateValueExecution,
+        ObsCalculationUpdateObscalcUpdateValueExecutionVisits,
+        ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatches,
+        ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatchesAtomRecords,
+        ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatchesAtomRecordsMatches,
+        ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatchesObservation,
+    )
+    from .observation_edit import (
+        ObservationEdit,
+        ObservationEditObservationEdit,
+        ObservationEditObservationEditValue,
+        ObservationEditObservationEditValueConstraintSet,
+        ObservationEditObservationEditValueConstraintSetElevationRange,
+        ObservationEditObservationEditValueConstraintSetElevationRangeAirMass,
+        ObservationEditObservationEditValueConstraintSetElevationRangeHourAngle,
+        ObservationEditObservationEditValueObservingMode,
+        ObservationEditObservationEditValueObservingModeGmosNorthLongSlit,
+        ObservationEditObservationEditValueObservingModeGmosNorthLongSlitCentralWavelength,
+        ObservationEditObservationEditValueObservingModeGmosSouthLongSlit,
+        ObservationEditObservationEditValueObservingModeGmosSouthLongSlitCentralWavelength,
+        ObservationEditObservationEditValueReference,
+        ObservationEditObservationEditValueScienceRequirements,
+        ObservationEditObservationEditValueTargetEnvironment,
+        ObservationEditObservationEditValueTargetEnvironmentAsterism,
+        ObservationEditObservationEditValueTargetEnvironmentAsterismNonsidereal,
+        ObservationEditObservationEditValueTargetEnvironmentAsterismSidereal,
+        ObservationEditObservationEditValueTargetEnvironmentAsterismSiderealDec,
+        ObservationEditObservationEditValueTargetEnvironmentAsterismSiderealRa,
+        ObservationEditObservationEditValueTargetEnvironmentExplicitBase,
+        ObservationEditObservationEditValueTargetEnvironmentExplicitBaseDec,
+        ObservationEditObservationEditValueTargetEnvironmentExplicitBaseRa,
+        ObservationEditObservationEditValueTimingWindows,
+        ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfter,
+        ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfterAfter,
+        ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfterRepeat,
+        ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfterRepeatPeriod,
+        ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAt,
+    )
+    from .ping import Ping, PingPrograms, PingProgramsMatches
+    from .program_edit import (
+        ProgramEdit,
+        ProgramEditProgramEdit,
+        ProgramEditProgramEditValue,
+        ProgramEditProgramEditValueAllGroupElements,
+        ProgramEditProgramEditValueAllGroupElementsGroup,
+        ProgramEditProgramEditValueAllGroupElementsObservation,
+    )
+    from .restore_call_for_proposals_by_id import (
+        RestoreCallForProposalsById,
+        RestoreCallForProposalsByIdUpdateCallsForProposals,
+        RestoreCallForProposalsByIdUpdateCallsForProposalsCallsForProposals,
+    )
+    from .restore_observation_by_id import (
+        RestoreObservationById,
+        RestoreObservationByIdUpdateObservations,
+        RestoreObservationByIdUpdateObservationsObservations,
+    )
+    from .restore_observation_by_reference import (
+        RestoreObservationByReference,
+        RestoreObservationByReferenceUpdateObservations,
+        RestoreObservationByReferenceUpdateObservationsObservations,
+    )
+    from .restore_program_by_id import (
+        RestoreProgramById,
+        RestoreProgramByIdUpdatePrograms,
+        RestoreProgramByIdUpdateProgramsPrograms,
+        RestoreProgramByIdUpdateProgramsProgramsAllGroupElements,
+        RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsGroup,
+        RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMaximumInterval,
+        RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMinimumInterval,
+        RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsObservation,
+    )
+    from .restore_target_by_id import (
+        RestoreTargetById,
+        RestoreTargetByIdUpdateTargets,
+        RestoreTargetByIdUpdateTargetsTargets,
+        RestoreTargetByIdUpdateTargetsTargetsProgram,
+    )
+    from .scheduler_observations_updates import (
+        SchedulerObservationsUpdates,
+        SchedulerObservationsUpdatesObscalcUpdate,
+        SchedulerObservationsUpdatesObscalcUpdateValue,
+        SchedulerObservationsUpdatesObscalcUpdateValueConstraintSet,
+        SchedulerObservationsUpdatesObscalcUpdateValueConstraintSetElevationRange,
+        SchedulerObservationsUpdatesObscalcUpdateValueConstraintSetElevationRangeAirMass,
+        SchedulerObservationsUpdatesObscalcUpdateValueConstraintSetElevationRangeHourAngle,
+        SchedulerObservationsUpdatesObscalcUpdateValueExecution,
+        SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisits,
+        SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatches,
+        SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatchesAtomRecords,
+        SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatchesAtomRecordsMatches,
+        SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatchesObservation,
+        SchedulerObservationsUpdatesObscalcUpdateValueProgram,
+        SchedulerObservationsUpdatesObscalcUpdateValueProgramActive,
+        SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironment,
+        SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterism,
+        SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismNonsidereal,
+        SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismSidereal,
+        SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismSiderealDec,
+        SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismSiderealRa,
+        SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentExplicitBase,
+        SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentExplicitBaseDec,
+        SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentExplicitBaseRa,
+        SchedulerObservationsUpdatesObscalcUpdateValueTimingWindows,
+        SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfter,
+        SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfterAfter,
+        SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfterRepeat,
+        SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfterRepeatPeriod,
+        SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAt,
+        SchedulerObservationsUpdatesObscalcUpdateValueWorkflow,
+        SchedulerObservationsUpdatesObscalcUpdateValueWorkflowValue,
+    )
+    from .set_observation_workflow_state import (
+        SetObservationWorkflowState,
+        SetObservationWorkflowStateSetObservationWorkflowState,
+    )
+    from .target_edit import (
+        TargetEdit,
+        TargetEditTargetEdit,
+        TargetEditTargetEditValue,
+        TargetEditTargetEditValueNonsidereal,
+        TargetEditTargetEditValueSidereal,
+        TargetEditTargetEditValueSiderealDec,
+        TargetEditTargetEditValueSiderealRa,
+    )
+    from .update_call_for_proposals_by_id import (
+        UpdateCallForProposalsById,
+        UpdateCallForProposalsByIdUpdateCallsForProposals,
+        UpdateCallForProposalsByIdUpdateCallsForProposalsCallsForProposals,
+    )
+    from .update_calls_for_proposals import (
+        UpdateCallsForProposals,
+        UpdateCallsForProposalsUpdateCallsForProposals,
+        UpdateCallsForProposalsUpdateCallsForProposalsCallsForProposals,
+    )
+    from .update_observation_by_id import (
+        UpdateObservationById,
+        UpdateObservationByIdUpdateObservations,
+        UpdateObservationByIdUpdateObservationsObservations,
+    )
+    from .update_observation_by_reference import (
+        UpdateObservationByReference,
+        UpdateObservationByReferenceUpdateObservations,
+        UpdateObservationByReferenceUpdateObservationsObservations,
+    )
+    from .update_observations import (
+        UpdateObservations,
+        UpdateObservationsUpdateObservations,
+        UpdateObservationsUpdateObservationsObservations,
+    )
+    from .update_program_by_id import (
+        UpdateProgramById,
+        UpdateProgramByIdUpdatePrograms,
+        UpdateProgramByIdUpdateProgramsPrograms,
+    )
+    from .update_programs import (
+        UpdatePrograms,
+        UpdateProgramsUpdatePrograms,
+        UpdateProgramsUpdateProgramsPrograms,
+    )
+    from .update_target_by_id import (
+        UpdateTargetById,
+        UpdateTargetByIdUpdateTargets,
+        UpdateTargetByIdUpdateTargetsTargets,
+    )
+    from .update_targets import (
+        UpdateTargets,
+        UpdateTargetsUpdateTargets,
+        UpdateTargetsUpdateTargetsTargets,
+    )
 __all__ = [
     "AddDatasetEventInput",
     "AddEventBatchEntryInput",
@@ -1970,6 +1999,9 @@ __all__ = [
     "GetObservationAttachmentsByReferenceObservation",
     "GetObservationAttachmentsByReferenceObservationAttachments",
     "GetObservationObservation",
+    "GetObservationSummaries",
+    "GetObservationSummariesObservations",
+    "GetObservationSummariesObservationsMatches",
     "GetObservationWorkflowStateById",
     "GetObservationWorkflowStateByIdObservation",
     "GetObservationWorkflowStateByIdObservationProgram",
@@ -1996,6 +2028,9 @@ __all__ = [
     "GetProgramByProposalReferenceProgram",
     "GetProgramByReference",
     "GetProgramByReferenceProgram",
+    "GetProgramSummaries",
+    "GetProgramSummariesPrograms",
+    "GetProgramSummariesProgramsMatches",
     "GetPrograms",
     "GetProgramsPrograms",
     "GetProgramsProgramsMatches",
@@ -2023,6 +2058,9 @@ __all__ = [
     "GetSchedulerProgramsProgramsMatchesTimeChargeTimeTotal",
     "GetTargetById",
     "GetTargetByIdTarget",
+    "GetTargetSummaries",
+    "GetTargetSummariesTargets",
+    "GetTargetSummariesTargetsMatches",
     "GetTargets",
     "GetTargetsTargets",
     "GetTargetsTargetsMatches",
@@ -2306,6 +2344,9 @@ __all__ = [
     "ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfterRepeatPeriod",
     "ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAt",
     "ObservationPropertiesInput",
+    "ObservationSummary",
+    "ObservationSummaryProgram",
+    "ObservationSummaryWorkflow",
     "ObservationTimesInput",
     "ObservationValidationCode",
     "ObservationWorkflowCore",
@@ -2391,6 +2432,8 @@ __all__ = [
     "ProgramReferencePropertiesScienceInput",
     "ProgramReferencePropertiesSubaruInput",
     "ProgramReferencePropertiesSystemInput",
+    "ProgramSummary",
+    "ProgramSummaryReference",
     "ProgramType",
     "ProgramUserPropertiesInput",
     "ProgramUserRole",
@@ -2557,6 +2600,8 @@ __all__ = [
     "TargetProgramSummaryProgram",
     "TargetPropertiesInput",
     "TargetResolutionInput",
+    "TargetSummary",
+    "TargetSummaryProgram",
     "TelescopeConfigAlongSlitInput",
     "TelescopeConfigGeneratorInput",
     "TelescopeConfigGeneratorType",
@@ -2745,3 +2790,1358 @@ __all__ = [
     "WorkflowDetailsValue",
     "WorkflowDetailsValueValidationErrors",
 ]
+_MODULES = {
+    "AsyncBaseClient": "async_base_client",
+    "BaseModel": "base_model",
+    "Upload": "base_model",
+    "GraphQLClient": "client",
+    "CloneObservation": "clone_observation",
+    "CloneObservationCloneObservation": "clone_observation",
+    "CloneObservationCloneObservationNewObservation": "clone_observation",
+    "CloneTarget": "clone_target",
+    "CloneTargetCloneTarget": "clone_target",
+    "CloneTargetCloneTargetNewTarget": "clone_target",
+    "CreateCallForProposals": "create_call_for_proposals",
+    "CreateCallForProposalsCreateCallForProposals": "create_call_for_proposals",
+    "CreateCallForProposalsCreateCallForProposalsCallForProposals": "create_call_for_proposals",
+    "CreateObservation": "create_observation",
+    "CreateObservationCreateObservation": "create_observation",
+    "CreateObservationCreateObservationObservation": "create_observation",
+    "CreateProgram": "create_program",
+    "CreateProgramCreateProgram": "create_program",
+    "CreateProgramCreateProgramProgram": "create_program",
+    "CreateTargetByProgramId": "create_target_by_program_id",
+    "CreateTargetByProgramIdCreateTarget": "create_target_by_program_id",
+    "CreateTargetByProgramIdCreateTargetTarget": "create_target_by_program_id",
+    "CreateTargetByProgramReference": "create_target_by_program_reference",
+    "CreateTargetByProgramReferenceCreateTarget": "create_target_by_program_reference",
+    "CreateTargetByProgramReferenceCreateTargetTarget": "create_target_by_program_reference",
+    "CreateTargetByProposalReference": "create_target_by_proposal_reference",
+    "CreateTargetByProposalReferenceCreateTarget": "create_target_by_proposal_reference",
+    "CreateTargetByProposalReferenceCreateTargetTarget": "create_target_by_proposal_reference",
+    "DeleteCallForProposalsById": "delete_call_for_proposals_by_id",
+    "DeleteCallForProposalsByIdUpdateCallsForProposals": "delete_call_for_proposals_by_id",
+    "DeleteCallForProposalsByIdUpdateCallsForProposalsCallsForProposals": "delete_call_for_proposals_by_id",
+    "DeleteObservationById": "delete_observation_by_id",
+    "DeleteObservationByIdUpdateObservations": "delete_observation_by_id",
+    "DeleteObservationByIdUpdateObservationsObservations": "delete_observation_by_id",
+    "DeleteObservationByReference": "delete_observation_by_reference",
+    "DeleteObservationByReferenceUpdateObservations": "delete_observation_by_reference",
+    "DeleteObservationByReferenceUpdateObservationsObservations": "delete_observation_by_reference",
+    "DeleteProgramById": "delete_program_by_id",
+    "DeleteProgramByIdUpdatePrograms": "delete_program_by_id",
+    "DeleteProgramByIdUpdateProgramsPrograms": "delete_program_by_id",
+    "DeleteProgramByIdUpdateProgramsProgramsAllGroupElements": "delete_program_by_id",
+    "DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsGroup": "delete_program_by_id",
+    "DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMaximumInterval": "delete_program_by_id",
+    "DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMinimumInterval": "delete_program_by_id",
+    "DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsObservation": "delete_program_by_id",
+    "DeleteTargetById": "delete_target_by_id",
+    "DeleteTargetByIdUpdateTargets": "delete_target_by_id",
+    "DeleteTargetByIdUpdateTargetsTargets": "delete_target_by_id",
+    "DeleteTargetByIdUpdateTargetsTargetsProgram": "delete_target_by_id",
+    "ArchiveDuplicationState": "enums",
+    "ArcType": "enums",
+    "AtomExecutionState": "enums",
+    "AtomStage": "enums",
+    "AttachmentType": "enums",
+    "Band": "enums",
+    "BasePositionType": "enums",
+    "BlindOffsetType": "enums",
+    "Breakpoint": "enums",
+    "BrightnessIntegratedUnits": "enums",
+    "BrightnessSurfaceUnits": "enums",
+    "CalculationState": "enums",
+    "CalibrationRole": "enums",
+    "CassRotator": "enums",
+    "CatalogName": "enums",
+    "ChargeClass": "enums",
+    "CloudExtinctionPreset": "enums",
+    "ConditionsExpectationType": "enums",
+    "ConditionsMeasurementSource": "enums",
+    "ConfigurationRequestStatus": "enums",
+    "ConsiderForBand3": "enums",
+    "CoolStarTemperature": "enums",
+    "DatabaseOperation": "enums",
+    "DatasetQaState": "enums",
+    "DatasetStage": "enums",
+    "EditType": "enums",
+    "EducationalStatus": "enums",
+    "EmailStatus": "enums",
+    "EphemerisKeyType": "enums",
+    "ExchangeObservingModeType": "enums",
+    "ExchangePartner": "enums",
+    "ExecutionEventType": "enums",
+    "ExecutionState": "enums",
+    "Existence": "enums",
+    "Flamingos2CustomSlitWidth": "enums",
+    "Flamingos2Decker": "enums",
+    "Flamingos2Disperser": "enums",
+    "Flamingos2Filter": "enums",
+    "Flamingos2Fpu": "enums",
+    "Flamingos2LyotWheel": "enums",
+    "Flamingos2ReadMode": "enums",
+    "Flamingos2ReadoutMode": "enums",
+    "Flamingos2Reads": "enums",
+    "FluxDensityContinuumIntegratedUnits": "enums",
+    "FluxDensityContinuumSurfaceUnits": "enums",
+    "FocalPlane": "enums",
+    "GalaxySpectrum": "enums",
+    "GcalArc": "enums",
+    "GcalContinuum": "enums",
+    "GcalDiffuser": "enums",
+    "GcalFilter": "enums",
+    "GcalShutter": "enums",
+    "GeminiCallForProposalsType": "enums",
+    "Gender": "enums",
+    "GhostBinning": "enums",
+    "GhostIfu1FiberAgitator": "enums",
+    "GhostIfu2FiberAgitator": "enums",
+    "GhostIfuMappingType": "enums",
+    "GhostReadMode": "enums",
+    "GhostResolutionMode": "enums",
+    "GmosAmpCount": "enums",
+    "GmosAmpGain": "enums",
+    "GmosAmpReadMode": "enums",
+    "GmosBinning": "enums",
+    "GmosCustomSlitWidth": "enums",
+    "GmosDtax": "enums",
+    "GmosEOffsetting": "enums",
+    "GmosGratingOrder": "enums",
+    "GmosLongSlitAcquisitionRoi": "enums",
+    "GmosMosAcquisitionType": "enums",
+    "GmosNorthBuiltinFpu": "enums",
+    "GmosNorthDetector": "enums",
+    "GmosNorthFilter": "enums",
+    "GmosNorthGrating": "enums",
+    "GmosNorthStageMode": "enums",
+    "GmosRoi": "enums",
+    "GmosSouthBuiltinFpu": "enums",
+    "GmosSouthDetector": "enums",
+    "GmosSouthFilter": "enums",
+    "GmosSouthGrating": "enums",
+    "GmosSouthStageMode": "enums",
+    "GnirsAcquisitionType": "enums",
+    "GnirsCamera": "enums",
+    "GnirsDecker": "enums",
+    "GnirsFilter": "enums",
+    "GnirsFpuIfu": "enums",
+    "GnirsFpuOther": "enums",
+    "GnirsFpuSlit": "enums",
+    "GnirsGrating": "enums",
+    "GnirsPrism": "enums",
+    "GnirsReadMode": "enums",
+    "GnirsWellDepth": "enums",
+    "GuideProbe": "enums",
+    "GuideState": "enums",
+    "HiiRegionSpectrum": "enums",
+    "Ignore": "enums",
+    "ImageQualityPreset": "enums",
+    "ImagingCapability": "enums",
+    "ImagingVariantType": "enums",
+    "Instrument": "enums",
+    "ItcType": "enums",
+    "KeckInstrument": "enums",
+    "LineFluxIntegratedUnits": "enums",
+    "LineFluxSurfaceUnits": "enums",
+    "MosPreImaging": "enums",
+    "ObsActiveStatus": "enums",
+    "ObservationValidationCode": "enums",
+    "ObservationWorkflowState": "enums",
+    "Observatory": "enums",
+    "ObserveClass": "enums",
+    "ObservingModeType": "enums",
+    "ObsStatus": "enums",
+    "Partner": "enums",
+    "PartnerLinkType": "enums",
+    "PlanetaryNebulaSpectrum": "enums",
+    "PlanetSpectrum": "enums",
+    "PortDisposition": "enums",
+    "PosAngleConstraintMode": "enums",
+    "ProgramType": "enums",
+    "ProgramUserRole": "enums",
+    "ProgramUserSupportRoleType": "enums",
+    "ProposalStatus": "enums",
+    "QuasarSpectrum": "enums",
+    "SchedulingMode": "enums",
+    "ScienceBand": "enums",
+    "ScienceMode": "enums",
+    "ScienceSubtype": "enums",
+    "SeeingTrend": "enums",
+    "SequenceCommand": "enums",
+    "SequenceType": "enums",
+    "Site": "enums",
+    "SkyBackground": "enums",
+    "SlewStage": "enums",
+    "SlitOffsetMode": "enums",
+    "SmartGcalType": "enums",
+    "SpectroscopyCapability": "enums",
+    "StellarLibrarySpectrum": "enums",
+    "StepExecutionState": "enums",
+    "StepStage": "enums",
+    "StepType": "enums",
+    "SubaruCallForProposalsType": "enums",
+    "SubaruInstrument": "enums",
+    "TacCategory": "enums",
+    "TargetDisposition": "enums",
+    "TelescopeConfigGeneratorType": "enums",
+    "TelluricTag": "enums",
+    "TimeAccountingCategory": "enums",
+    "TimeChargeCorrectionOp": "enums",
+    "TimingWindowInclusion": "enums",
+    "TooActivation": "enums",
+    "TooTriggerStatus": "enums",
+    "UserInvitationStatus": "enums",
+    "UserType": "enums",
+    "VisitorObservingModeType": "enums",
+    "WaterVapor": "enums",
+    "WavelengthOrder": "enums",
+    "GraphQLClientError": "exceptions",
+    "GraphQLClientGraphQLError": "exceptions",
+    "GraphQLClientGraphQLMultiError": "exceptions",
+    "GraphQLClientHttpError": "exceptions",
+    "GraphQLClientInvalidResponseError": "exceptions",
+    "AttachmentDetails": "fragments",
+    "CallForProposalsCore": "fragments",
+    "CallForProposalsCoreGemini": "fragments",
+    "CallForProposalsCoreKeck": "fragments",
+    "CallForProposalsCoreSubaru": "fragments",
+    "CallForProposalsDetails": "fragments",
+    "CallForProposalsDetailsActive": "fragments",
+    "ConstraintSetDetails": "fragments",
+    "ConstraintSetDetailsElevationRange": "fragments",
+    "ConstraintSetDetailsElevationRangeAirMass": "fragments",
+    "ConstraintSetDetailsElevationRangeHourAngle": "fragments",
+    "Flamingos2ImagingDetails": "fragments",
+    "Flamingos2ImagingDetailsFilters": "fragments",
+    "Flamingos2ImagingDetailsFiltersExposureTimeMode": "fragments",
+    "Flamingos2ImagingDetailsFiltersExposureTimeModeSignalToNoise": "fragments",
+    "Flamingos2ImagingDetailsFiltersExposureTimeModeSignalToNoiseAt": "fragments",
+    "Flamingos2ImagingDetailsFiltersExposureTimeModeTimeAndCount": "fragments",
+    "Flamingos2ImagingDetailsFiltersExposureTimeModeTimeAndCountTime": "fragments",
+    "Flamingos2ImagingDetailsInitialFilters": "fragments",
+    "Flamingos2ImagingDetailsInitialFiltersExposureTimeMode": "fragments",
+    "Flamingos2ImagingDetailsInitialFiltersExposureTimeModeSignalToNoise": "fragments",
+    "Flamingos2ImagingDetailsInitialFiltersExposureTimeModeSignalToNoiseAt": "fragments",
+    "Flamingos2ImagingDetailsInitialFiltersExposureTimeModeTimeAndCount": "fragments",
+    "Flamingos2ImagingDetailsInitialFiltersExposureTimeModeTimeAndCountAt": "fragments",
+    "Flamingos2ImagingDetailsInitialFiltersExposureTimeModeTimeAndCountTime": "fragments",
+    "Flamingos2LongSlitDetails": "fragments",
+    "Flamingos2LongSlitDetailsAcquisition": "fragments",
+    "Flamingos2LongSlitDetailsAcquisitionExposureTimeMode": "fragments",
+    "Flamingos2LongSlitDetailsAcquisitionExposureTimeModeSignalToNoise": "fragments",
+    "Flamingos2LongSlitDetailsAcquisitionExposureTimeModeSignalToNoiseAt": "fragments",
+    "Flamingos2LongSlitDetailsAcquisitionExposureTimeModeTimeAndCount": "fragments",
+    "Flamingos2LongSlitDetailsAcquisitionExposureTimeModeTimeAndCountAt": "fragments",
+    "Flamingos2LongSlitDetailsAcquisitionExposureTimeModeTimeAndCountTime": "fragments",
+    "Flamingos2LongSlitDetailsExposureTimeMode": "fragments",
+    "Flamingos2LongSlitDetailsExposureTimeModeSignalToNoise": "fragments",
+    "Flamingos2LongSlitDetailsExposureTimeModeSignalToNoiseAt": "fragments",
+    "Flamingos2LongSlitDetailsExposureTimeModeTimeAndCount": "fragments",
+    "Flamingos2LongSlitDetailsExposureTimeModeTimeAndCountAt": "fragments",
+    "Flamingos2LongSlitDetailsExposureTimeModeTimeAndCountTime": "fragments",
+    "Flamingos2LongSlitDetailsTelluricType": "fragments",
+    "GhostDetectorConfigDetails": "fragments",
+    "GhostDetectorConfigDetailsExposureTimeMode": "fragments",
+    "GhostDetectorConfigDetailsExposureTimeModeSignalToNoise": "fragments",
+    "GhostDetectorConfigDetailsExposureTimeModeSignalToNoiseAt": "fragments",
+    "GhostDetectorConfigDetailsExposureTimeModeTimeAndCount": "fragments",
+    "GhostDetectorConfigDetailsExposureTimeModeTimeAndCountAt": "fragments",
+    "GhostDetectorConfigDetailsExposureTimeModeTimeAndCountTime": "fragments",
+    "GhostIfuDetails": "fragments",
+    "GhostIfuDetailsBlue": "fragments",
+    "GhostIfuDetailsRed": "fragments",
+    "GhostIfuDetailsSkyPosition": "fragments",
+    "GhostIfuDetailsSkyPositionDec": "fragments",
+    "GhostIfuDetailsSkyPositionRa": "fragments",
+    "GhostIfuDetailsSlitViewingCameraExposureTime": "fragments",
+    "GmosNorthImagingDetails": "fragments",
+    "GmosNorthImagingDetailsFilters": "fragments",
+    "GmosNorthLongSlitDetails": "fragments",
+    "GmosNorthLongSlitDetailsCentralWavelength": "fragments",
+    "GmosNorthLongSlitDetailsOffsets": "fragments",
+    "GmosSouthImagingDetails": "fragments",
+    "GmosSouthImagingDetailsFilters": "fragments",
+    "GmosSouthLongSlitDetails": "fragments",
+    "GmosSouthLongSlitDetailsCentralWavelength": "fragments",
+    "GmosSouthLongSlitDetailsOffsets": "fragments",
+    "GnirsDetails": "fragments",
+    "GnirsDetailsGnirsImaging": "fragments",
+    "GnirsDetailsGnirsSpectroscopy": "fragments",
+    "GnirsImagingDetails": "fragments",
+    "GnirsImagingDetailsFilters": "fragments",
+    "GnirsImagingDetailsFiltersExposureTimeMode": "fragments",
+    "GnirsImagingDetailsFiltersExposureTimeModeSignalToNoise": "fragments",
+    "GnirsImagingDetailsFiltersExposureTimeModeSignalToNoiseAt": "fragments",
+    "GnirsImagingDetailsFiltersExposureTimeModeTimeAndCount": "fragments",
+    "GnirsImagingDetailsFiltersExposureTimeModeTimeAndCountAt": "fragments",
+    "GnirsImagingDetailsFiltersExposureTimeModeTimeAndCountTime": "fragments",
+    "GnirsImagingDetailsInitialFilters": "fragments",
+    "GnirsImagingDetailsInitialFiltersExposureTimeMode": "fragments",
+    "GnirsImagingDetailsInitialFiltersExposureTimeModeSignalToNoise": "fragments",
+    "GnirsImagingDetailsInitialFiltersExposureTimeModeSignalToNoiseAt": "fragments",
+    "GnirsImagingDetailsInitialFiltersExposureTimeModeTimeAndCount": "fragments",
+    "GnirsImagingDetailsInitialFiltersExposureTimeModeTimeAndCountAt": "fragments",
+    "GnirsImagingDetailsInitialFiltersExposureTimeModeTimeAndCountTime": "fragments",
+    "GnirsSpectroscopyDetails": "fragments",
+    "GnirsSpectroscopyDetailsAcquisition": "fragments",
+    "GnirsSpectroscopyDetailsAcquisitionExposureTimeMode": "fragments",
+    "GnirsSpectroscopyDetailsAcquisitionExposureTimeModeSignalToNoise": "fragments",
+    "GnirsSpectroscopyDetailsAcquisitionExposureTimeModeSignalToNoiseAt": "fragments",
+    "GnirsSpectroscopyDetailsAcquisitionExposureTimeModeTimeAndCount": "fragments",
+    "GnirsSpectroscopyDetailsAcquisitionExposureTimeModeTimeAndCountAt": "fragments",
+    "GnirsSpectroscopyDetailsAcquisitionExposureTimeModeTimeAndCountTime": "fragments",
+    "GnirsSpectroscopyDetailsAcquisitionSkyOffset": "fragments",
+    "GnirsSpectroscopyDetailsAcquisitionSkyOffsetP": "fragments",
+    "GnirsSpectroscopyDetailsAcquisitionSkyOffsetQ": "fragments",
+    "GnirsSpectroscopyDetailsCentralWavelengths": "fragments",
+    "GnirsSpectroscopyDetailsCentralWavelengthsCentralWavelength": "fragments",
+    "GnirsSpectroscopyDetailsIfu": "fragments",
+    "GnirsSpectroscopyDetailsIfuTelescopeConfigs": "fragments",
+    "GnirsSpectroscopyDetailsIfuTelescopeConfigsOffset": "fragments",
+    "GnirsSpectroscopyDetailsIfuTelescopeConfigsOffsetP": "fragments",
+    "GnirsSpectroscopyDetailsIfuTelescopeConfigsOffsetQ": "fragments",
+    "GnirsSpectroscopyDetailsSlit": "fragments",
+    "GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigs": "fragments",
+    "GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsAlongSlit": "fragments",
+    "GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsAlongSlitQ": "fragments",
+    "GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSky": "fragments",
+    "GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSkyOffset": "fragments",
+    "GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSkyOffsetP": "fragments",
+    "GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSkyOffsetQ": "fragments",
+    "GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigs": "fragments",
+    "GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsAlongSlit": "fragments",
+    "GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsAlongSlitQ": "fragments",
+    "GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSky": "fragments",
+    "GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSkyOffset": "fragments",
+    "GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSkyOffsetP": "fragments",
+    "GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSkyOffsetQ": "fragments",
+    "GnirsSpectroscopyDetailsSlitTelescopeConfigs": "fragments",
+    "GnirsSpectroscopyDetailsSlitTelescopeConfigsAlongSlit": "fragments",
+    "GnirsSpectroscopyDetailsSlitTelescopeConfigsAlongSlitQ": "fragments",
+    "GnirsSpectroscopyDetailsSlitTelescopeConfigsToSky": "fragments",
+    "GnirsSpectroscopyDetailsSlitTelescopeConfigsToSkyOffset": "fragments",
+    "GnirsSpectroscopyDetailsSlitTelescopeConfigsToSkyOffsetP": "fragments",
+    "GnirsSpectroscopyDetailsSlitTelescopeConfigsToSkyOffsetQ": "fragments",
+    "GnirsSpectroscopyDetailsTelluricType": "fragments",
+    "Igrins2LongSlitDetails": "fragments",
+    "Igrins2LongSlitDetailsExposureTimeMode": "fragments",
+    "Igrins2LongSlitDetailsExposureTimeModeSignalToNoise": "fragments",
+    "Igrins2LongSlitDetailsExposureTimeModeSignalToNoiseAt": "fragments",
+    "Igrins2LongSlitDetailsExposureTimeModeTimeAndCount": "fragments",
+    "Igrins2LongSlitDetailsExposureTimeModeTimeAndCountAt": "fragments",
+    "Igrins2LongSlitDetailsExposureTimeModeTimeAndCountTime": "fragments",
+    "Igrins2LongSlitDetailsTelluricType": "fragments",
+    "NonsiderealTargetDetails": "fragments",
+    "ObservationCore": "fragments",
+    "ObservationCoreReference": "fragments",
+    "ObservationDetails": "fragments",
+    "ObservationDetailsConstraintSet": "fragments",
+    "ObservationDetailsExecution": "fragments",
+    "ObservationDetailsExecutionDigest": "fragments",
+    "ObservationDetailsExecutionDigestValue": "fragments",
+    "ObservationDetailsExecutionDigestValueAcquisition": "fragments",
+    "ObservationDetailsExecutionDigestValueAcquisitionTimeEstimate": "fragments",
+    "ObservationDetailsExecutionDigestValueAcquisitionTimeEstimateNonCharged": "fragments",
+    "ObservationDetailsExecutionDigestValueAcquisitionTimeEstimateProgram": "fragments",
+    "ObservationDetailsExecutionDigestValueAcquisitionTimeEstimateTotal": "fragments",
+    "ObservationDetailsExecutionDigestValueSetup": "fragments",
+    "ObservationDetailsExecutionDigestValueSetupFull": "fragments",
+    "ObservationDetailsExecutionDigestValueSetupReacquisition": "fragments",
+    "ObservationDetailsObservingMode": "fragments",
+    "ObservationDetailsProgram": "fragments",
+    "ObservationDetailsScienceRequirements": "fragments",
+    "ObservationDetailsTargetEnvironment": "fragments",
+    "ObservationDetailsTimingWindows": "fragments",
+    "ObservationDetailsWorkflow": "fragments",
+    "ObservationSummary": "fragments",
+    "ObservationSummaryProgram": "fragments",
+    "ObservationSummaryWorkflow": "fragments",
+    "ObservationWorkflowCore": "fragments",
+    "ObservationWorkflowDetails": "fragments",
+    "ObservationWorkflowDetailsValidationErrors": "fragments",
+    "ObservingModeDetails": "fragments",
+    "ObservingModeDetailsFlamingos2Imaging": "fragments",
+    "ObservingModeDetailsFlamingos2LongSlit": "fragments",
+    "ObservingModeDetailsGhostIfu": "fragments",
+    "ObservingModeDetailsGmosNorthImaging": "fragments",
+    "ObservingModeDetailsGmosNorthLongSlit": "fragments",
+    "ObservingModeDetailsGmosSouthImaging": "fragments",
+    "ObservingModeDetailsGmosSouthLongSlit": "fragments",
+    "ObservingModeDetailsGnirsImaging": "fragments",
+    "ObservingModeDetailsGnirsSpectroscopy": "fragments",
+    "ObservingModeDetailsIgrins2LongSlit": "fragments",
+    "ObservingModeDetailsVisitor": "fragments",
+    "OpportunityTargetDetails": "fragments",
+    "OpportunityTargetDetailsRegion": "fragments",
+    "OpportunityTargetDetailsRegionDeclinationArc": "fragments",
+    "OpportunityTargetDetailsRegionDeclinationArcEnd": "fragments",
+    "OpportunityTargetDetailsRegionDeclinationArcStart": "fragments",
+    "OpportunityTargetDetailsRegionRightAscensionArc": "fragments",
+    "OpportunityTargetDetailsRegionRightAscensionArcEnd": "fragments",
+    "OpportunityTargetDetailsRegionRightAscensionArcStart": "fragments",
+    "ProgramCore": "fragments",
+    "ProgramDetail": "fragments",
+    "ProgramDetailActive": "fragments",
+    "ProgramDetailPi": "fragments",
+    "ProgramDetailProposal": "fragments",
+    "ProgramDetailProposalCall": "fragments",
+    "ProgramDetailProposalCallActive": "fragments",
+    "ProgramDetailProposalCallGemini": "fragments",
+    "ProgramDetailProposalCallKeck": "fragments",
+    "ProgramDetailProposalCallSubaru": "fragments",
+    "ProgramDetailProposalGemini": "fragments",
+    "ProgramGroupElements": "fragments",
+    "ProgramGroupElementsAllGroupElements": "fragments",
+    "ProgramGroupElementsAllGroupElementsGroup": "fragments",
+    "ProgramGroupElementsAllGroupElementsGroupMaximumInterval": "fragments",
+    "ProgramGroupElementsAllGroupElementsGroupMinimumInterval": "fragments",
+    "ProgramGroupElementsAllGroupElementsObservation": "fragments",
+    "ProgramSummary": "fragments",
+    "ProgramSummaryReference": "fragments",
+    "SchedulerProposal": "fragments",
+    "SchedulerProposalCall": "fragments",
+    "SchedulerProposalCallActive": "fragments",
+    "SchedulerProposalCallGemini": "fragments",
+    "SchedulerProposalCallKeck": "fragments",
+    "SchedulerProposalCallSubaru": "fragments",
+    "SchedulerProposalGemini": "fragments",
+    "ScienceRequirementsDetails": "fragments",
+    "SiderealTargetDetails": "fragments",
+    "SiderealTargetDetailsDec": "fragments",
+    "SiderealTargetDetailsRa": "fragments",
+    "TargetCore": "fragments",
+    "TargetDetails": "fragments",
+    "TargetDetailsNonsidereal": "fragments",
+    "TargetDetailsOpportunity": "fragments",
+    "TargetDetailsSidereal": "fragments",
+    "TargetEnvironmentDetails": "fragments",
+    "TargetEnvironmentDetailsAsterism": "fragments",
+    "TargetEnvironmentDetailsAsterismNonsidereal": "fragments",
+    "TargetEnvironmentDetailsAsterismSidereal": "fragments",
+    "TargetEnvironmentDetailsExplicitBase": "fragments",
+    "TargetEnvironmentDetailsExplicitBaseDec": "fragments",
+    "TargetEnvironmentDetailsExplicitBaseRa": "fragments",
+    "TargetProgramSummary": "fragments",
+    "TargetProgramSummaryProgram": "fragments",
+    "TargetSummary": "fragments",
+    "TargetSummaryProgram": "fragments",
+    "TimingWindowDetails": "fragments",
+    "TimingWindowDetailsEndTimingWindowEndAfter": "fragments",
+    "TimingWindowDetailsEndTimingWindowEndAfterAfter": "fragments",
+    "TimingWindowDetailsEndTimingWindowEndAfterRepeat": "fragments",
+    "TimingWindowDetailsEndTimingWindowEndAfterRepeatPeriod": "fragments",
+    "TimingWindowDetailsEndTimingWindowEndAt": "fragments",
+    "VisitorDetails": "fragments",
+    "VisitorDetailsAgsDiameter": "fragments",
+    "VisitorDetailsCentralWavelength": "fragments",
+    "VisitorDetailsTotalRequestTime": "fragments",
+    "WorkflowCore": "fragments",
+    "WorkflowDetails": "fragments",
+    "WorkflowDetailsValue": "fragments",
+    "WorkflowDetailsValueValidationErrors": "fragments",
+    "GetCallForProposals": "get_call_for_proposals",
+    "GetCallForProposalsCallForProposals": "get_call_for_proposals",
+    "GetCallsForProposals": "get_calls_for_proposals",
+    "GetCallsForProposalsCallsForProposals": "get_calls_for_proposals",
+    "GetCallsForProposalsCallsForProposalsMatches": "get_calls_for_proposals",
+    "GetGOATSObservations": "get_goats_observations",
+    "GetGOATSObservationsObservations": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatches": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesAttachments": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesConstraintSet": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesConstraintSetElevationRange": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesConstraintSetElevationRangeAirMass": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesConstraintSetElevationRangeHourAngle": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservationDuration": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingMode": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImaging": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFilters": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeMode": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeSignalToNoise": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeSignalToNoiseAt": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeTimeAndCount": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeTimeAndCountAt": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeTimeAndCountTime": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariant": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGrouped": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsets": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumerated": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValues": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValuesOffset": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValuesOffsetP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValuesOffsetQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandom": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiral": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniform": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerA": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerAP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerAQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerB": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerBP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerBQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsets": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumerated": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValues": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffset": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandom": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiral": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniform": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerA": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerAP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerAQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerB": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerBP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerBQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleaved": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsets": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumerated": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValues": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValuesOffset": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandom": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiral": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniform": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerA": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerAP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerAQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerB": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerBP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerBQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsets": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumerated": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValues": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffset": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandom": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiral": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniform": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerA": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerAP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerAQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerB": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerBP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerBQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImaging": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset1": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset1P": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset1Q": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset2": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset2P": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset2Q": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset3": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset3P": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset3Q": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset4": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset4P": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset4Q": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlit": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitCentralWavelength": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeMode": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeSignalToNoise": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeSignalToNoiseAt": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeTimeAndCount": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeTimeAndCountAt": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeTimeAndCountTime": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitOffsets": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitWavelengthDithers": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImaging": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFilters": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeMode": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeSignalToNoise": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeSignalToNoiseAt": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeTimeAndCount": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeTimeAndCountAt": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeTimeAndCountTime": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariant": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGrouped": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsets": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumerated": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValues": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValuesOffset": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValuesOffsetP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValuesOffsetQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandom": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiral": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniform": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerA": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerAP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerAQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerB": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerBP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerBQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsets": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumerated": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValues": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffset": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandom": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiral": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniform": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerA": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerAP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerAQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerB": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerBP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerBQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleaved": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsets": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumerated": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValues": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValuesOffset": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandom": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiral": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniform": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerA": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerAP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerAQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerB": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerBP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerBQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsets": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumerated": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValues": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffset": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandom": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiral": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniform": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerA": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerAP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerAQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerB": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerBP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerBQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImaging": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset1": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset1P": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset1Q": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset2": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset2P": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset2Q": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset3": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset3P": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset3Q": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset4": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset4P": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset4Q": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlit": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitCentralWavelength": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeMode": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeSignalToNoise": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeSignalToNoiseAt": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeTimeAndCount": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeTimeAndCountAt": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeTimeAndCountTime": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitOffsets": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitWavelengthDithers": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesPosAngleConstraint": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesPosAngleConstraintAngle": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesProgram": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesProgramAllocations": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesProgramAllocationsDuration": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesProgramTimeCharge": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesProgramTimeChargeTime": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesProgramTimeChargeTimeProgram": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesReference": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesScienceRequirements": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeMode": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeSignalToNoise": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeSignalToNoiseAt": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeTimeAndCount": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeTimeAndCountAt": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeTimeAndCountTime": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesScienceRequirementsSpectroscopy": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesScienceRequirementsSpectroscopyWavelength": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironment": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentAsterism": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentAsterismOpportunity": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTarget": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetOpportunity": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSidereal": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealDec": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealParallax": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealProperMotion": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealProperMotionDec": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealProperMotionRa": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealRa": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealRadialVelocity": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfile": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePoint": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalized": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedBrightnesses": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedSed": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedSedFluxDensities": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedSedFluxDensitiesWavelength": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTimingWindows": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfterAfter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfterRepeat": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfterRepeatPeriod": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAt": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesWorkflow": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesWorkflowValue": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesWorkflowValueValidationErrors": "get_goats_observations",
+    "GetGOATSPrograms": "get_goats_programs",
+    "GetGOATSProgramsPrograms": "get_goats_programs",
+    "GetGOATSProgramsProgramsMatches": "get_goats_programs",
+    "GetGOATSProgramsProgramsMatchesReference": "get_goats_programs",
+    "GetObservation": "get_observation",
+    "GetObservationObservation": "get_observation",
+    "GetObservationAttachmentsById": "get_observation_attachments_by_id",
+    "GetObservationAttachmentsByIdObservation": "get_observation_attachments_by_id",
+    "GetObservationAttachmentsByIdObservationAttachments": "get_observation_attachments_by_id",
+    "GetObservationAttachmentsByReference": "get_observation_attachments_by_reference",
+    "GetObservationAttachmentsByReferenceObservation": "get_observation_attachments_by_reference",
+    "GetObservationAttachmentsByReferenceObservationAttachments": "get_observation_attachments_by_reference",
+    "GetObservationSummaries": "get_observation_summaries",
+    "GetObservationSummariesObservations": "get_observation_summaries",
+    "GetObservationSummariesObservationsMatches": "get_observation_summaries",
+    "GetObservationWorkflowStateById": "get_observation_workflow_state_by_id",
+    "GetObservationWorkflowStateByIdObservation": "get_observation_workflow_state_by_id",
+    "GetObservationWorkflowStateByIdObservationProgram": "get_observation_workflow_state_by_id",
+    "GetObservationWorkflowStateByIdObservationWorkflow": "get_observation_workflow_state_by_id",
+    "GetObservationWorkflowStateByReference": "get_observation_workflow_state_by_reference",
+    "GetObservationWorkflowStateByReferenceObservation": "get_observation_workflow_state_by_reference",
+    "GetObservationWorkflowStateByReferenceObservationProgram": "get_observation_workflow_state_by_reference",
+    "GetObservationWorkflowStateByReferenceObservationWorkflow": "get_observation_workflow_state_by_reference",
+    "GetObservations": "get_observations",
+    "GetObservationsObservations": "get_observations",
+    "GetObservationsObservationsMatches": "get_observations",
+    "GetProgramAttachmentsById": "get_program_attachments_by_id",
+    "GetProgramAttachmentsByIdProgram": "get_program_attachments_by_id",
+    "GetProgramAttachmentsByIdProgramAttachments": "get_program_attachments_by_id",
+    "GetProgramAttachmentsByProposalReference": "get_program_attachments_by_proposal_reference",
+    "GetProgramAttachmentsByProposalReferenceProgram": "get_program_attachments_by_proposal_reference",
+    "GetProgramAttachmentsByProposalReferenceProgramAttachments": "get_program_attachments_by_proposal_reference",
+    "GetProgramAttachmentsByReference": "get_program_attachments_by_reference",
+    "GetProgramAttachmentsByReferenceProgram": "get_program_attachments_by_reference",
+    "GetProgramAttachmentsByReferenceProgramAttachments": "get_program_attachments_by_reference",
+    "GetProgramById": "get_program_by_id",
+    "GetProgramByIdProgram": "get_program_by_id",
+    "GetProgramByProposalReference": "get_program_by_proposal_reference",
+    "GetProgramByProposalReferenceProgram": "get_program_by_proposal_reference",
+    "GetProgramByReference": "get_program_by_reference",
+    "GetProgramByReferenceProgram": "get_program_by_reference",
+    "GetProgramSummaries": "get_program_summaries",
+    "GetProgramSummariesPrograms": "get_program_summaries",
+    "GetProgramSummariesProgramsMatches": "get_program_summaries",
+    "GetPrograms": "get_programs",
+    "GetProgramsPrograms": "get_programs",
+    "GetProgramsProgramsMatches": "get_programs",
+    "GetSchedulerAllProgramsId": "get_scheduler_all_programs_id",
+    "GetSchedulerAllProgramsIdPrograms": "get_scheduler_all_programs_id",
+    "GetSchedulerAllProgramsIdProgramsMatches": "get_scheduler_all_programs_id",
+    "GetSchedulerAllProgramsIdProgramsMatchesReference": "get_scheduler_all_programs_id",
+    "GetSchedulerPrograms": "get_scheduler_programs",
+    "GetSchedulerProgramsPrograms": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatches": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesActive": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesAllGroupElements": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesAllGroupElementsGroup": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesAllGroupElementsGroupMaximumInterval": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesAllGroupElementsGroupMinimumInterval": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesAllGroupElementsObservation": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesAllocations": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesAllocationsDuration": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesProposal": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesReference": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesTimeCharge": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesTimeChargeTime": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesTimeChargeTimeNonCharged": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesTimeChargeTimeProgram": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesTimeChargeTimeTotal": "get_scheduler_programs",
+    "GetTargetById": "get_target_by_id",
+    "GetTargetByIdTarget": "get_target_by_id",
+    "GetTargetSummaries": "get_target_summaries",
+    "GetTargetSummariesTargets": "get_target_summaries",
+    "GetTargetSummariesTargetsMatches": "get_target_summaries",
+    "GetTargets": "get_targets",
+    "GetTargetsTargets": "get_targets",
+    "GetTargetsTargetsMatches": "get_targets",
+    "AddDatasetEventInput": "input_types",
+    "AddEventBatchEntryInput": "input_types",
+    "AddEventBatchInput": "input_types",
+    "AddProgramUserInput": "input_types",
+    "AddSequenceEventInput": "input_types",
+    "AddSlewEventInput": "input_types",
+    "AddStepEventInput": "input_types",
+    "AddTimeChargeCorrectionInput": "input_types",
+    "AirMassRangeInput": "input_types",
+    "AllocationInput": "input_types",
+    "AngleInput": "input_types",
+    "AttachmentPropertiesInput": "input_types",
+    "BandBrightnessIntegratedInput": "input_types",
+    "BandBrightnessSurfaceInput": "input_types",
+    "BandNormalizedIntegratedInput": "input_types",
+    "BandNormalizedSurfaceInput": "input_types",
+    "CallForProposalsExchangePartnerInput": "input_types",
+    "CallForProposalsPartnerInput": "input_types",
+    "CallForProposalsPropertiesInput": "input_types",
+    "CatalogInfoInput": "input_types",
+    "ChangePrincipalInvestigatorInput": "input_types",
+    "ChangeProgramUserRoleInput": "input_types",
+    "ClassicalInput": "input_types",
+    "CloneGroupInput": "input_types",
+    "CloneObservationInput": "input_types",
+    "CloneTargetInput": "input_types",
+    "ConditionsEntryInput": "input_types",
+    "ConditionsExpectationInput": "input_types",
+    "ConditionsIntuitionInput": "input_types",
+    "ConditionsMeasurementInput": "input_types",
+    "ConfigurationRequestEditInput": "input_types",
+    "ConfigurationRequestProperties": "input_types",
+    "ConstraintSetInput": "input_types",
+    "CoordinateLimitsInput": "input_types",
+    "CoordinatesInput": "input_types",
+    "CreateCallForProposalsInput": "input_types",
+    "CreateConfigurationRequestInput": "input_types",
+    "CreateGroupInput": "input_types",
+    "CreateObservationInput": "input_types",
+    "CreateProgramInput": "input_types",
+    "CreateProgramNoteInput": "input_types",
+    "CreateProposalInput": "input_types",
+    "CreateTargetInput": "input_types",
+    "CreateUserInvitationInput": "input_types",
+    "DatasetEditInput": "input_types",
+    "DatasetPropertiesInput": "input_types",
+    "DeclinationArcInput": "input_types",
+    "DeclinationInput": "input_types",
+    "DeclineTooTriggerInput": "input_types",
+    "DeleteProgramUserInput": "input_types",
+    "DeleteProposalInput": "input_types",
+    "DeleteSequenceInput": "input_types",
+    "DemoScienceInput": "input_types",
+    "DirectorsTimeInput": "input_types",
+    "EditAsterismsPatchInput": "input_types",
+    "ElevationRangeInput": "input_types",
+    "EmissionLineIntegratedInput": "input_types",
+    "EmissionLinesIntegratedInput": "input_types",
+    "EmissionLinesSurfaceInput": "input_types",
+    "EmissionLineSurfaceInput": "input_types",
+    "EnumeratedTelescopeConfigGeneratorInput": "input_types",
+    "ExchangeInput": "input_types",
+    "ExecutionEventAddedInput": "input_types",
+    "ExposureTimeModeInput": "input_types",
+    "FastTurnaroundInput": "input_types",
+    "Flamingos2AtomInput": "input_types",
+    "Flamingos2CustomMaskInput": "input_types",
+    "Flamingos2DynamicInput": "input_types",
+    "Flamingos2FpuMaskInput": "input_types",
+    "Flamingos2ImagingFilterInput": "input_types",
+    "Flamingos2ImagingInput": "input_types",
+    "Flamingos2LongSlitAcquisitionInput": "input_types",
+    "Flamingos2LongSlitInput": "input_types",
+    "Flamingos2MosAcquisitionInput": "input_types",
+    "Flamingos2MosInput": "input_types",
+    "Flamingos2StaticInput": "input_types",
+    "Flamingos2StepInput": "input_types",
+    "FluxDensity": "input_types",
+    "FluxDensityContinuumIntegratedInput": "input_types",
+    "FluxDensityContinuumSurfaceInput": "input_types",
+    "GaussianInput": "input_types",
+    "GeminiCallPropertiesInput": "input_types",
+    "GeminiProposalTypeInput": "input_types",
+    "GhostAtomInput": "input_types",
+    "GhostDetectorConfigInput": "input_types",
+    "GhostDetectorInput": "input_types",
+    "GhostDynamicInput": "input_types",
+    "GhostIfuInput": "input_types",
+    "GhostStepInput": "input_types",
+    "GmosCcdModeInput": "input_types",
+    "GmosCustomMaskInput": "input_types",
+    "GmosNodAndShuffleInput": "input_types",
+    "GmosNorthAtomInput": "input_types",
+    "GmosNorthDynamicInput": "input_types",
+    "GmosNorthFpuInput": "input_types",
+    "GmosNorthGratingConfigInput": "input_types",
+    "GmosNorthImagingFilterInput": "input_types",
+    "GmosNorthImagingInput": "input_types",
+    "GmosNorthLongSlitAcquisitionInput": "input_types",
+    "GmosNorthLongSlitInput": "input_types",
+    "GmosNorthMosAcquisitionInput": "input_types",
+    "GmosNorthMosInput": "input_types",
+    "GmosNorthStaticInput": "input_types",
+    "GmosNorthStepInput": "input_types",
+    "GmosSouthAtomInput": "input_types",
+    "GmosSouthDynamicInput": "input_types",
+    "GmosSouthFpuInput": "input_types",
+    "GmosSouthGratingConfigInput": "input_types",
+    "GmosSouthImagingFilterInput": "input_types",
+    "GmosSouthImagingInput": "input_types",
+    "GmosSouthLongSlitAcquisitionInput": "input_types",
+    "GmosSouthLongSlitInput": "input_types",
+    "GmosSouthMosAcquisitionInput": "input_types",
+    "GmosSouthMosInput": "input_types",
+    "GmosSouthStaticInput": "input_types",
+    "GmosSouthStepInput": "input_types",
+    "GnirsAcquisitionMirrorOutInput": "input_types",
+    "GnirsAtomInput": "input_types",
+    "GnirsCentralWavelengthConfigInput": "input_types",
+    "GnirsDynamicInput": "input_types",
+    "GnirsIfuInput": "input_types",
+    "GnirsImagingAcquisitionInput": "input_types",
+    "GnirsImagingFilterInput": "input_types",
+    "GnirsImagingInput": "input_types",
+    "GnirsSlitInput": "input_types",
+    "GnirsSpectroscopyAcquisitionInput": "input_types",
+    "GnirsSpectroscopyInput": "input_types",
+    "GnirsStepInput": "input_types",
+    "GoaPropertiesInput": "input_types",
+    "GroupedImagingVariantInput": "input_types",
+    "GroupEditInput": "input_types",
+    "GroupElementInput": "input_types",
+    "GroupPropertiesInput": "input_types",
+    "HourAngleRangeInput": "input_types",
+    "Igrins2AtomInput": "input_types",
+    "Igrins2DynamicInput": "input_types",
+    "Igrins2LongSlitInput": "input_types",
+    "Igrins2StaticInput": "input_types",
+    "Igrins2StepInput": "input_types",
+    "Igrins2SvcInput": "input_types",
+    "ImagingScienceRequirementsInput": "input_types",
+    "ImagingVariantInput": "input_types",
+    "InterleavedImagingVariantInput": "input_types",
+    "KeckCallPropertiesInput": "input_types",
+    "KeckProposalTypeInput": "input_types",
+    "LargeProgramInput": "input_types",
+    "LineFluxIntegratedInput": "input_types",
+    "LineFluxSurfaceInput": "input_types",
+    "LinkUserInput": "input_types",
+    "NonsiderealInput": "input_types",
+    "ObscalcUpdateInput": "input_types",
+    "ObservationEditInput": "input_types",
+    "ObservationPropertiesInput": "input_types",
+    "ObservationTimesInput": "input_types",
+    "ObservingModeInput": "input_types",
+    "OffsetComponentInput": "input_types",
+    "OffsetInput": "input_types",
+    "OpportunityInput": "input_types",
+    "ParallaxInput": "input_types",
+    "PartnerLinkInput": "input_types",
+    "PartnerSplitInput": "input_types",
+    "PoorWeatherInput": "input_types",
+    "PosAngleConstraintInput": "input_types",
+    "PreImagingVariantInput": "input_types",
+    "ProgramEditInput": "input_types",
+    "ProgramNotePropertiesInput": "input_types",
+    "ProgramPropertiesInput": "input_types",
+    "ProgramReferencePropertiesCalibrationInput": "input_types",
+    "ProgramReferencePropertiesCommissioningInput": "input_types",
+    "ProgramReferencePropertiesEngineeringInput": "input_types",
+    "ProgramReferencePropertiesExampleInput": "input_types",
+    "ProgramReferencePropertiesInput": "input_types",
+    "ProgramReferencePropertiesKeckInput": "input_types",
+    "ProgramReferencePropertiesLibraryInput": "input_types",
+    "ProgramReferencePropertiesMonitoringInput": "input_types",
+    "ProgramReferencePropertiesScienceInput": "input_types",
+    "ProgramReferencePropertiesSubaruInput": "input_types",
+    "ProgramReferencePropertiesSystemInput": "input_types",
+    "ProgramUserPropertiesInput": "input_types",
+    "ProperMotionComponentInput": "input_types",
+    "ProperMotionInput": "input_types",
+    "ProposalPropertiesInput": "input_types",
+    "QueueInput": "input_types",
+    "RadialVelocityInput": "input_types",
+    "RandomTelescopeConfigGeneratorInput": "input_types",
+    "RecordDatasetInput": "input_types",
+    "RecordFlamingos2VisitInput": "input_types",
+    "RecordGmosNorthVisitInput": "input_types",
+    "RecordGmosSouthVisitInput": "input_types",
+    "RecordIgrins2VisitInput": "input_types",
+    "RecordVisitInput": "input_types",
+    "RedeemUserInvitationInput": "input_types",
+    "RefreshArchiveDuplicationInput": "input_types",
+    "RegionInput": "input_types",
+    "ReplaceFlamingos2SequenceInput": "input_types",
+    "ReplaceGhostSequenceInput": "input_types",
+    "ReplaceGmosNorthSequenceInput": "input_types",
+    "ReplaceGmosSouthSequenceInput": "input_types",
+    "ReplaceGnirsSequenceInput": "input_types",
+    "ReplaceIgrins2SequenceInput": "input_types",
+    "ResetAcquisitionInput": "input_types",
+    "RevokeUserInvitationInput": "input_types",
+    "RightAscensionArcInput": "input_types",
+    "RightAscensionInput": "input_types",
+    "SchedulingConstraintsInput": "input_types",
+    "ScienceRequirementsInput": "input_types",
+    "SetAllocationsInput": "input_types",
+    "SetGuideTargetNameInput": "input_types",
+    "SetObservationWorkflowStateInput": "input_types",
+    "SetProgramReferenceInput": "input_types",
+    "SetProgramResourceLimitInput": "input_types",
+    "SetProposalStatusInput": "input_types",
+    "SiderealInput": "input_types",
+    "SignalToNoiseExposureTimeModeInput": "input_types",
+    "SiteCoordinateLimitsInput": "input_types",
+    "SlitTelescopeConfigsInput": "input_types",
+    "SourceProfileInput": "input_types",
+    "SpectralDefinitionIntegratedInput": "input_types",
+    "SpectralDefinitionSurfaceInput": "input_types",
+    "SpectroscopyScienceRequirementsInput": "input_types",
+    "SpiralTelescopeConfigGeneratorInput": "input_types",
+    "StepConfigGcalInput": "input_types",
+    "StepConfigInput": "input_types",
+    "StepConfigSmartGcalInput": "input_types",
+    "SubaruCallPropertiesInput": "input_types",
+    "SubaruProposalTypeInput": "input_types",
+    "SystemVerificationInput": "input_types",
+    "TargetEditInput": "input_types",
+    "TargetEnvironmentInput": "input_types",
+    "TargetPropertiesInput": "input_types",
+    "TargetResolutionInput": "input_types",
+    "TelescopeConfigAlongSlitInput": "input_types",
+    "TelescopeConfigGeneratorInput": "input_types",
+    "TelescopeConfigInput": "input_types",
+    "TelluricTypeInput": "input_types",
+    "TimeAndCountExposureTimeModeInput": "input_types",
+    "TimeChargeCorrectionInput": "input_types",
+    "TimeSpanInput": "input_types",
+    "TimingWindowEndInput": "input_types",
+    "TimingWindowInput": "input_types",
+    "TimingWindowRepeatInput": "input_types",
+    "TooTriggerEditInput": "input_types",
+    "UniformTelescopeConfigGeneratorInput": "input_types",
+    "UnlinkUserInput": "input_types",
+    "UnnormalizedSedInput": "input_types",
+    "UpdateAsterismsInput": "input_types",
+    "UpdateAttachmentsInput": "input_types",
+    "UpdateCallsForProposalsInput": "input_types",
+    "UpdateConfigurationRequestsInput": "input_types",
+    "UpdateDatasetsInput": "input_types",
+    "UpdateGroupsInput": "input_types",
+    "UpdateObservationsInput": "input_types",
+    "UpdateObservationsTimesInput": "input_types",
+    "UpdateProgramNotesInput": "input_types",
+    "UpdateProgramsInput": "input_types",
+    "UpdateProgramUsersInput": "input_types",
+    "UpdateProposalInput": "input_types",
+    "UpdateTargetsInput": "input_types",
+    "UserProfileInput": "input_types",
+    "UserSuppliedEphemeris": "input_types",
+    "UserSuppliedEphemerisElement": "input_types",
+    "VisitorInput": "input_types",
+    "WavelengthDitherInput": "input_types",
+    "WavelengthInput": "input_types",
+    "WhereAngle": "input_types",
+    "WhereAttachment": "input_types",
+    "WhereAttachmentType": "input_types",
+    "WhereBoolean": "input_types",
+    "WhereCalculatedObservationWorkflow": "input_types",
+    "WhereCallForProposals": "input_types",
+    "WhereCone": "input_types",
+    "WhereConfigurationRequest": "input_types",
+    "WhereDataset": "input_types",
+    "WhereDatasetChronicleEntry": "input_types",
+    "WhereDatasetReference": "input_types",
+    "WhereEqDatabaseOperation": "input_types",
+    "WhereEqExecutionEventType": "input_types",
+    "WhereEqFocalPlane": "input_types",
+    "WhereEqGeminiCallForProposalsType": "input_types",
+    "WhereEqInstrument": "input_types",
+    "WhereEqPartner": "input_types",
+    "WhereEqPartnerLinkType": "input_types",
+    "WhereEqProgramType": "input_types",
+    "WhereEqProgramUserRole": "input_types",
+    "WhereEqProposalStatus": "input_types",
+    "WhereEqScienceSubtype": "input_types",
+    "WhereEqSite": "input_types",
+    "WhereEqStepId": "input_types",
+    "WhereEqTargetDisposition": "input_types",
+    "WhereEqTooActivation": "input_types",
+    "WhereEqUserType": "input_types",
+    "WhereEqVisitId": "input_types",
+    "WhereExecutionEvent": "input_types",
+    "WhereGeminiCallProperties": "input_types",
+    "WhereGroup": "input_types",
+    "WhereImagingConfigOption": "input_types",
+    "WhereObservation": "input_types",
+    "WhereObservationReference": "input_types",
+    "WhereObservatoryEq": "input_types",
+    "WhereOptionBoolean": "input_types",
+    "WhereOptionEqCalculationState": "input_types",
+    "WhereOptionEqCalibrationRole": "input_types",
+    "WhereOptionEqEducationalStatus": "input_types",
+    "WhereOptionEqExchangePartner": "input_types",
+    "WhereOptionEqGender": "input_types",
+    "WhereOptionEqImagingCapability": "input_types",
+    "WhereOptionEqInstrument": "input_types",
+    "WhereOptionEqObservingModeType": "input_types",
+    "WhereOptionEqPartner": "input_types",
+    "WhereOptionEqQaState": "input_types",
+    "WhereOptionEqSite": "input_types",
+    "WhereOptionEqSpectroscopyCapability": "input_types",
+    "WhereOptionEqTacCategory": "input_types",
+    "WhereOptionOrderScienceBand": "input_types",
+    "WhereOptionOrderTimestamp": "input_types",
+    "WhereOptionString": "input_types",
+    "WhereOrderAttachmentId": "input_types",
+    "WhereOrderBigDecimal": "input_types",
+    "WhereOrderCalculationState": "input_types",
+    "WhereOrderCallForProposalsId": "input_types",
+    "WhereOrderChronicleId": "input_types",
+    "WhereOrderConfigurationRequestId": "input_types",
+    "WhereOrderConfigurationRequestStatus": "input_types",
+    "WhereOrderDatasetId": "input_types",
+    "WhereOrderDatasetStage": "input_types",
+    "WhereOrderDate": "input_types",
+    "WhereOrderExecutionEventId": "input_types",
+    "WhereOrderGroupId": "input_types",
+    "WhereOrderInt": "input_types",
+    "WhereOrderLong": "input_types",
+    "WhereOrderObservationId": "input_types",
+    "WhereOrderObservationWorkflowState": "input_types",
+    "WhereOrderPosBigDecimal": "input_types",
+    "WhereOrderPosInt": "input_types",
+    "WhereOrderProgramId": "input_types",
+    "WhereOrderProgramNoteId": "input_types",
+    "WhereOrderProgramUserId": "input_types",
+    "WhereOrderSemester": "input_types",
+    "WhereOrderSequenceCommand": "input_types",
+    "WhereOrderSequenceType": "input_types",
+    "WhereOrderSlewStage": "input_types",
+    "WhereOrderStepStage": "input_types",
+    "WhereOrderTargetId": "input_types",
+    "WhereOrderTimestamp": "input_types",
+    "WhereOrderTooTriggerId": "input_types",
+    "WhereOrderTooTriggerStatus": "input_types",
+    "WhereOrderUserId": "input_types",
+    "WherePartnerLink": "input_types",
+    "WhereProgram": "input_types",
+    "WhereProgramNote": "input_types",
+    "WhereProgramReference": "input_types",
+    "WhereProgramUser": "input_types",
+    "WhereProposal": "input_types",
+    "WhereProposalPartnerEntry": "input_types",
+    "WhereProposalPartners": "input_types",
+    "WhereProposalReference": "input_types",
+    "WhereSpectroscopyConfigOption": "input_types",
+    "WhereString": "input_types",
+    "WhereTarget": "input_types",
+    "WhereTooTrigger": "input_types",
+    "WhereTooTriggerChronicleEntry": "input_types",
+    "WhereUser": "input_types",
+    "WhereUserProfile": "input_types",
+    "WhereWavelength": "input_types",
+    "ObsCalculationUpdate": "obs_calculation_update",
+    "ObsCalculationUpdateObscalcUpdate": "obs_calculation_update",
+    "ObsCalculationUpdateObscalcUpdateValue": "obs_calculation_update",
+    "ObsCalculationUpdateObscalcUpdateValueExecution": "obs_calculation_update",
+    "ObsCalculationUpdateObscalcUpdateValueExecutionVisits": "obs_calculation_update",
+    "ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatches": "obs_calculation_update",
+    "ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatchesAtomRecords": "obs_calculation_update",
+    "ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatchesAtomRecordsMatches": "obs_calculation_update",
+    "ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatchesObservation": "obs_calculation_update",
+    "ObservationEdit": "observation_edit",
+    "ObservationEditObservationEdit": "observation_edit",
+    "ObservationEditObservationEditValue": "observation_edit",
+    "ObservationEditObservationEditValueConstraintSet": "observation_edit",
+    "ObservationEditObservationEditValueConstraintSetElevationRange": "observation_edit",
+    "ObservationEditObservationEditValueConstraintSetElevationRangeAirMass": "observation_edit",
+    "ObservationEditObservationEditValueConstraintSetElevationRangeHourAngle": "observation_edit",
+    "ObservationEditObservationEditValueObservingMode": "observation_edit",
+    "ObservationEditObservationEditValueObservingModeGmosNorthLongSlit": "observation_edit",
+    "ObservationEditObservationEditValueObservingModeGmosNorthLongSlitCentralWavelength": "observation_edit",
+    "ObservationEditObservationEditValueObservingModeGmosSouthLongSlit": "observation_edit",
+    "ObservationEditObservationEditValueObservingModeGmosSouthLongSlitCentralWavelength": "observation_edit",
+    "ObservationEditObservationEditValueReference": "observation_edit",
+    "ObservationEditObservationEditValueScienceRequirements": "observation_edit",
+    "ObservationEditObservationEditValueTargetEnvironment": "observation_edit",
+    "ObservationEditObservationEditValueTargetEnvironmentAsterism": "observation_edit",
+    "ObservationEditObservationEditValueTargetEnvironmentAsterismNonsidereal": "observation_edit",
+    "ObservationEditObservationEditValueTargetEnvironmentAsterismSidereal": "observation_edit",
+    "ObservationEditObservationEditValueTargetEnvironmentAsterismSiderealDec": "observation_edit",
+    "ObservationEditObservationEditValueTargetEnvironmentAsterismSiderealRa": "observation_edit",
+    "ObservationEditObservationEditValueTargetEnvironmentExplicitBase": "observation_edit",
+    "ObservationEditObservationEditValueTargetEnvironmentExplicitBaseDec": "observation_edit",
+    "ObservationEditObservationEditValueTargetEnvironmentExplicitBaseRa": "observation_edit",
+    "ObservationEditObservationEditValueTimingWindows": "observation_edit",
+    "ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfter": "observation_edit",
+    "ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfterAfter": "observation_edit",
+    "ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfterRepeat": "observation_edit",
+    "ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfterRepeatPeriod": "observation_edit",
+    "ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAt": "observation_edit",
+    "Ping": "ping",
+    "PingPrograms": "ping",
+    "PingProgramsMatches": "ping",
+    "ProgramEdit": "program_edit",
+    "ProgramEditProgramEdit": "program_edit",
+    "ProgramEditProgramEditValue": "program_edit",
+    "ProgramEditProgramEditValueAllGroupElements": "program_edit",
+    "ProgramEditProgramEditValueAllGroupElementsGroup": "program_edit",
+    "ProgramEditProgramEditValueAllGroupElementsObservation": "program_edit",
+    "RestoreCallForProposalsById": "restore_call_for_proposals_by_id",
+    "RestoreCallForProposalsByIdUpdateCallsForProposals": "restore_call_for_proposals_by_id",
+    "RestoreCallForProposalsByIdUpdateCallsForProposalsCallsForProposals": "restore_call_for_proposals_by_id",
+    "RestoreObservationById": "restore_observation_by_id",
+    "RestoreObservationByIdUpdateObservations": "restore_observation_by_id",
+    "RestoreObservationByIdUpdateObservationsObservations": "restore_observation_by_id",
+    "RestoreObservationByReference": "restore_observation_by_reference",
+    "RestoreObservationByReferenceUpdateObservations": "restore_observation_by_reference",
+    "RestoreObservationByReferenceUpdateObservationsObservations": "restore_observation_by_reference",
+    "RestoreProgramById": "restore_program_by_id",
+    "RestoreProgramByIdUpdatePrograms": "restore_program_by_id",
+    "RestoreProgramByIdUpdateProgramsPrograms": "restore_program_by_id",
+    "RestoreProgramByIdUpdateProgramsProgramsAllGroupElements": "restore_program_by_id",
+    "RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsGroup": "restore_program_by_id",
+    "RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMaximumInterval": "restore_program_by_id",
+    "RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMinimumInterval": "restore_program_by_id",
+    "RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsObservation": "restore_program_by_id",
+    "RestoreTargetById": "restore_target_by_id",
+    "RestoreTargetByIdUpdateTargets": "restore_target_by_id",
+    "RestoreTargetByIdUpdateTargetsTargets": "restore_target_by_id",
+    "RestoreTargetByIdUpdateTargetsTargetsProgram": "restore_target_by_id",
+    "SchedulerObservationsUpdates": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdate": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValue": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueConstraintSet": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueConstraintSetElevationRange": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueConstraintSetElevationRangeAirMass": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueConstraintSetElevationRangeHourAngle": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueExecution": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisits": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatches": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatchesAtomRecords": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatchesAtomRecordsMatches": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatchesObservation": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueProgram": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueProgramActive": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironment": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterism": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismNonsidereal": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismSidereal": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismSiderealDec": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismSiderealRa": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentExplicitBase": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentExplicitBaseDec": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentExplicitBaseRa": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTimingWindows": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfter": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfterAfter": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfterRepeat": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfterRepeatPeriod": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAt": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueWorkflow": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueWorkflowValue": "scheduler_observations_updates",
+    "SetObservationWorkflowState": "set_observation_workflow_state",
+    "SetObservationWorkflowStateSetObservationWorkflowState": "set_observation_workflow_state",
+    "TargetEdit": "target_edit",
+    "TargetEditTargetEdit": "target_edit",
+    "TargetEditTargetEditValue": "target_edit",
+    "TargetEditTargetEditValueNonsidereal": "target_edit",
+    "TargetEditTargetEditValueSidereal": "target_edit",
+    "TargetEditTargetEditValueSiderealDec": "target_edit",
+    "TargetEditTargetEditValueSiderealRa": "target_edit",
+    "UpdateCallForProposalsById": "update_call_for_proposals_by_id",
+    "UpdateCallForProposalsByIdUpdateCallsForProposals": "update_call_for_proposals_by_id",
+    "UpdateCallForProposalsByIdUpdateCallsForProposalsCallsForProposals": "update_call_for_proposals_by_id",
+    "UpdateCallsForProposals": "update_calls_for_proposals",
+    "UpdateCallsForProposalsUpdateCallsForProposals": "update_calls_for_proposals",
+    "UpdateCallsForProposalsUpdateCallsForProposalsCallsForProposals": "update_calls_for_proposals",
+    "UpdateObservationById": "update_observation_by_id",
+    "UpdateObservationByIdUpdateObservations": "update_observation_by_id",
+    "UpdateObservationByIdUpdateObservationsObservations": "update_observation_by_id",
+    "UpdateObservationByReference": "update_observation_by_reference",
+    "UpdateObservationByReferenceUpdateObservations": "update_observation_by_reference",
+    "UpdateObservationByReferenceUpdateObservationsObservations": "update_observation_by_reference",
+    "UpdateObservations": "update_observations",
+    "UpdateObservationsUpdateObservations": "update_observations",
+    "UpdateObservationsUpdateObservationsObservations": "update_observations",
+    "UpdateProgramById": "update_program_by_id",
+    "UpdateProgramByIdUpdatePrograms": "update_program_by_id",
+    "UpdateProgramByIdUpdateProgramsPrograms": "update_program_by_id",
+    "UpdatePrograms": "update_programs",
+    "UpdateProgramsUpdatePrograms": "update_programs",
+    "UpdateProgramsUpdateProgramsPrograms": "update_programs",
+    "UpdateTargetById": "update_target_by_id",
+    "UpdateTargetByIdUpdateTargets": "update_target_by_id",
+    "UpdateTargetByIdUpdateTargetsTargets": "update_target_by_id",
+    "UpdateTargets": "update_targets",
+    "UpdateTargetsUpdateTargets": "update_targets",
+    "UpdateTargetsUpdateTargetsTargets": "update_targets",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
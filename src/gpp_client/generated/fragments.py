@@ -1223,6 +1223,19 @@ class ObservationDetailsExecutionDigestValueSetupReacquisition(BaseModel):
     seconds: Any
 
 
+class ObservationSummary(ObservationCore):
+    program: "ObservationSummaryProgram"
+    workflow: Optional["ObservationSummaryWorkflow"]
+
+
+class ObservationSummaryProgram(BaseModel):
+    id: Any
+
+
+class ObservationSummaryWorkflow(WorkflowCore):
+    pass
+
+
 class ObservationWorkflowCore(BaseModel):
     state: ObservationWorkflowState
 
@@ -1384,6 +1397,29 @@ class ProgramGroupElementsAllGroupElementsGroupMaximumInterval(BaseModel):
     seconds: Any
 
 
+class ProgramSummary(ProgramCore):
+    type_: ProgramType = Field(alias="type")
+    reference: Optional["ProgramSummaryReference"]
+    proposal_status: ProposalStatus = Field(alias="proposalStatus")
+
+
+class ProgramSummaryReference(BaseModel):
+    typename__: Literal[
+        "CalibrationProgramReference",
+        "CommissioningProgramReference",
+        "EngineeringProgramReference",
+        "ExampleProgramReference",
+        "KeckProgramReference",
+        "LibraryProgramReference",
+        "MonitoringProgramReference",
+        "ProgramReference",
+        "ScienceProgramReference",
+        "SubaruProgramReference",
+        "SystemProgramReference",
+    ] = Field(alias="__typename")
+    label: Any
+
+
 class SchedulerProposal(BaseModel):
     call: Optional["SchedulerProposalCall"]
     gemini: Optional["SchedulerProposalGemini"]
@@ -1465,6 +1501,14 @@ class TargetProgramSummaryProgram(ProgramCore):
     pass
 
 
+class TargetSummary(TargetCore):
+    program: "TargetSummaryProgram"
+
+
+class TargetSummaryProgram(BaseModel):
+    id: Any
+
+
 AttachmentDetails.model_rebuild()
 CallForProposalsCore.model_rebuild()
 CallForProposalsDetails.model_rebuild()
@@ -1493,12 +1537,15 @@ TimingWindowDetails.model_rebuild()
 WorkflowCore.model_rebuild()
 WorkflowDetails.model_rebuild()
 ObservationDetails.model_rebuild()
+ObservationSummary.model_rebuild()
 ObservationWorkflowCore.model_rebuild()
 ObservationWorkflowDetails.model_rebuild()
 OpportunityTargetDetails.model_rebuild()
 ProgramDetail.model_rebuild()
 ProgramGroupElements.model_rebuild()
+ProgramSummary.model_rebuild()
 SchedulerProposal.model_rebuild()
 TargetCore.model_rebuild()
 TargetDetails.model_rebuild()
 TargetProgramSummary.model_rebuild()
+TargetSummary.model_rebuild()
@@ -0,0 +1,21 @@
+from pydantic import Field
+
+from .base_model import BaseModel
+from .fragments import ObservationSummary
+
+
+class GetObservationSummaries(BaseModel):
+    observations: "GetObservationSummariesObservations"
+
+
+class GetObservationSummariesObservations(BaseModel):
+    has_more: bool = Field(alias="hasMore")
+    matches: list["GetObservationSummariesObservationsMatches"]
+
+
+class GetObservationSummariesObservationsMatches(ObservationSummary):
+    pass
+
+
+GetObservationSummaries.model_rebuild()
+GetObservationSummariesObservations.model_rebuild()
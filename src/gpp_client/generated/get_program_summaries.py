@@ -0,0 +1,21 @@
+from pydantic import Field
+
+from .base_model import BaseModel
+from .fragments import ProgramSummary
+
+
+class GetProgramSummaries(BaseModel):
+    programs: "GetProgramSummariesPrograms"
+
+
+class GetProgramSummariesPrograms(BaseModel):
+    has_more: bool = Field(alias="hasMore")
+    matches: list["GetProgramSummariesProgramsMatches"]
+
+
+class GetProgramSummariesProgramsMatches(ProgramSummary):
+    pass
+
+
+GetProgramSummaries.model_rebuild()
+GetProgramSummariesPrograms.model_rebuild()
@@ -0,0 +1,21 @@
+from pydantic import Field
+
+from .base_model import BaseModel
+from .fragments import TargetSummary
+
+
+class GetTargetSummaries(BaseModel):
+    targets: "GetTargetSummariesTargets"
+
+
+class GetTargetSummariesTargets(BaseModel):
+    has_more: bool = Field(alias="hasMore")
+    matches: list["GetTargetSummariesTargetsMatches"]
+
+
+class GetTargetSummariesTargetsMatches(TargetSummary):
+    pass
+
+
+GetTargetSummaries.model_rebuild()
+GetTargetSummariesTargets.model_rebuild()
@@ -0,0 +1,77 @@
+"""
+Operation methods of the generated client, grouped by domain.
+
+The client refers to them with :class:`LazyOperation`, so a domain module, and
+the result models its operations validate into, is only imported when one of
+its operations is first used.
+"""
+
+import importlib
+from collections.abc import Callable
+from typing import Any, Optional
+
+Wrapper = Callable[[Callable[..., Any]], Callable[..., Any]]
+
+
+class LazyOperation:
+    """
+    Client method imported from its domain module on first access.
+
+    Parameters
+    ----------
+    domain : str
+        Module of this package defining the method.
+    subscription : bool, default=False
+        Whether the method is a subscription, i.e. an async generator.
+    wrapper : Wrapper, optional
+        Applied to the method once it is imported.
+    """
+
+    def __init__(
+        self,
+        domain: str,
+        *,
+        subscription: bool = False,
+        wrapper: Optional[Wrapper] = None,
+    ) -> None:
+        self.domain = domain
+        self.subscription = subscription
+        self.wrapper = wrapper
+        self.owner: Optional[type] = None
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.owner = owner
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        method = self.load()
+        return method if instance is None else method.__get__(instance, owner)
+
+    def load(self) -> Callable[..., Any]:
+        """
+        Import the method and replace this descriptor with it on its class.
+        """
+        module = importlib.import_module(f"{__name__}.{self.domain}")
+        method = vars(getattr(module, _class_name(self.domain)))[self.name]
+        if self.wrapper is not None:
+            method = self.wrapper(method)
+        setattr(self.owner, self.name, method)
+        return method
+
+    def wrap(self, owner: type, wrapper: Wrapper) -> "LazyOperation":
+        """
+        Return a copy for ``owner`` that wraps the method once it is imported.
+        """
+        lazy = LazyOperation(
+            self.domain, subscription=self.subscription, wrapper=wrapper
+        )
+        lazy.__set_name__(owner, self.name)
+        return lazy
+
+
+def _class_name(domain: str) -> str:
+    """
+    Return the name of the class holding a domain's operation methods.
+    """
+    return "".join(part.title() for part in domain.split("_")) + "Operations"
@@ -0,0 +1,178 @@
+from typing import Any
+
+from ..async_base_client import AsyncBaseClient
+from ..get_observation_attachments_by_id import GetObservationAttachmentsById
+from ..get_observation_attachments_by_reference import (
+    GetObservationAttachmentsByReference,
+)
+from ..get_program_attachments_by_id import GetProgramAttachmentsById
+from ..get_program_attachments_by_proposal_reference import (
+    GetProgramAttachmentsByProposalReference,
+)
+from ..get_program_attachments_by_reference import GetProgramAttachmentsByReference
+
+
+def gql(q: str) -> str:
+    return q
+
+
+class AttachmentOperations(AsyncBaseClient):
+    async def get_observation_attachments_by_id(
+        self, observation_id: Any, **kwargs: Any
+    ) -> GetObservationAttachmentsById:
+        query = gql("""
+            query GetObservationAttachmentsById($observationId: ObservationId!) {
+              observation(observationId: $observationId) {
+                attachments {
+                  ...AttachmentDetails
+                }
+              }
+            }
+
+            fragment AttachmentDetails on Attachment {
+              id
+              fileName
+              attachmentType
+              fileSize
+              checked
+              description
+              updatedAt
+            }
+            """)
+        variables: dict[str, object] = {"observationId": observation_id}
+        response = await self.execute(
+            query=query,
+            operation_name="GetObservationAttachmentsById",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return GetObservationAttachmentsById.model_validate(data)
+
+    async def get_observation_attachments_by_reference(
+        self, observation_reference: Any, **kwargs: Any
+    ) -> GetObservationAttachmentsByReference:
+        query = gql("""
+            query GetObservationAttachmentsByReference($observationReference: ObservationReferenceLabel!) {
+              observation(observationReference: $observationReference) {
+                attachments {
+                  ...AttachmentDetails
+                }
+              }
+            }
+
+            fragment AttachmentDetails on Attachment {
+              id
+              fileName
+              attachmentType
+              fileSize
+              checked
+              description
+              updatedAt
+            }
+            """)
+        variables: dict[str, object] = {"observationReference": observation_reference}
+        response = await self.execute(
+            query=query,
+            operation_name="GetObservationAttachmentsByReference",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return GetObservationAttachmentsByReference.model_validate(data)
+
+    async def get_program_attachments_by_id(
+        self, program_id: Any, **kwargs: Any
+    ) -> GetProgramAttachmentsById:
+        query = gql("""
+            query GetProgramAttachmentsById($programId: ProgramId!) {
+              program(programId: $programId) {
+                attachments {
+                  ...AttachmentDetails
+                }
+              }
+            }
+
+            fragment AttachmentDetails on Attachment {
+              id
+              fileName
+              attachmentType
+              fileSize
+              checked
+              description
+              updatedAt
+            }
+            """)
+        variables: dict[str, object] = {"programId": program_id}
+        response = await self.execute(
+            query=query,
+            operation_name="GetProgramAttachmentsById",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return GetProgramAttachmentsById.model_validate(data)
+
+    async def get_program_attachments_by_reference(
+        self, program_reference: Any, **kwargs: Any
+    ) -> GetProgramAttachmentsByReference:
+        query = gql("""
+            query GetProgramAttachmentsByReference($programReference: ProgramReferenceLabel!) {
+              program(programReference: $programReference) {
+                attachments {
+                  ...AttachmentDetails
+                }
+              }
+            }
+
+            fragment AttachmentDetails on Attachment {
+              id
+              fileName
+              attachmentType
+              fileSize
+              checked
+              description
+              updatedAt
+            }
+            """)
+        variables: dict[str, object] = {"programReference": program_reference}
+        response = await self.execute(
+            query=query,
+            operation_name="GetProgramAttachmentsByReference",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return GetProgramAttachmentsByReference.model_validate(data)
+
+    async def get_program_attachments_by_proposal_reference(
+        self, proposal_reference: Any, **kwargs: Any
+    ) -> GetProgramAttachmentsByProposalReference:
+        query = gql("""
+            query GetProgramAttachmentsByProposalReference($proposalReference: ProposalReferenceLabel!) {
+              program(proposalReference: $proposalReference) {
+                attachments {
+                  ...AttachmentDetails
+                }
+              }
+            }
+
+            fragment AttachmentDetails on Attachment {
+              id
+              fileName
+              attachmentType
+              fileSize
+              checked
+              description
+              updatedAt
+            }
+            """)
+        variables: dict[str, object] = {"proposalReference": proposal_reference}
+        response = await self.execute(
+            query=query,
+            operation_name="GetProgramAttachmentsByProposalReference",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return GetProgramAttachmentsByProposalReference.model_validate(data)
@@ -0,0 +1,414 @@
+from typing import Any, Optional, Union
+
+from ..async_base_client import AsyncBaseClient
+from ..base_model import UNSET, UnsetType
+from ..create_call_for_proposals import CreateCallForProposals
+from ..delete_call_for_proposals_by_id import DeleteCallForProposalsById
+from ..get_call_for_proposals import GetCallForProposals
+from ..get_calls_for_proposals import GetCallsForProposals
+from ..input_types import CallForProposalsPropertiesInput, WhereCallForProposals
+from ..restore_call_for_proposals_by_id import RestoreCallForProposalsById
+from ..update_call_for_proposals_by_id import UpdateCallForProposalsById
+from ..update_calls_for_proposals import UpdateCallsForProposals
+
+
+def gql(q: str) -> str:
+    return q
+
+
+class CallForProposalsOperations(AsyncBaseClient):
+    async def create_call_for_proposals(
+        self,
+        properties: Union[Optional[CallForProposalsPropertiesInput], UnsetType] = UNSET,
+        **kwargs: Any,
+    ) -> CreateCallForProposals:
+        query = gql("""
+            mutation createCallForProposals($properties: CallForProposalsPropertiesInput) {
+              createCallForProposals(input: {SET: $properties}) {
+                callForProposals {
+                  ...CallForProposalsDetails
+                }
+              }
+            }
+
+            fragment CallForProposalsCore on CallForProposals {
+              id
+              title
+              observatory
+              gemini {
+                type
+                instruments
+              }
+              keck {
+                instruments
+              }
+              subaru {
+                type
+                instruments
+              }
+            }
+
+            fragment CallForProposalsDetails on CallForProposals {
+              ...CallForProposalsCore
+              semester
+              active {
+                start
+                end
+              }
+              submissionDeadlineDefault
+              existence
+            }
+            """)
+        variables: dict[str, object] = {"properties": properties}
+        response = await self.execute(
+            query=query,
+            operation_name="createCallForProposals",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return CreateCallForProposals.model_validate(data)
+
+    async def update_calls_for_proposals(
+        self,
+        properties: CallForProposalsPropertiesInput,
+        include_deleted: bool,
+        where: Union[Optional[WhereCallForProposals], UnsetType] = UNSET,
+        limit: Union[Optional[Any], UnsetType] = UNSET,
+        **kwargs: Any,
+    ) -> UpdateCallsForProposals:
+        query = gql("""
+            mutation updateCallsForProposals($properties: CallForProposalsPropertiesInput!, $where: WhereCallForProposals, $limit: NonNegInt, $includeDeleted: Boolean! = false) {
+              updateCallsForProposals(
+                input: {SET: $properties, WHERE: $where, LIMIT: $limit, includeDeleted: $includeDeleted}
+              ) {
+                hasMore
+                callsForProposals {
+                  ...CallForProposalsDetails
+                }
+              }
+            }
+
+            fragment CallForProposalsCore on CallForProposals {
+              id
+              title
+              observatory
+              gemini {
+                type
+                instruments
+              }
+              keck {
+                instruments
+              }
+              subaru {
+                type
+                instruments
+              }
+            }
+
+            fragment CallForProposalsDetails on CallForProposals {
+              ...CallForProposalsCore
+              semester
+              active {
+                start
+                end
+              }
+              submissionDeadlineDefault
+              existence
+            }
+            """)
+        variables: dict[str, object] = {
+            "properties": properties,
+            "where": where,
+            "limit": limit,
+            "includeDeleted": include_deleted,
+        }
+        response = await self.execute(
+            query=query,
+            operation_name="updateCallsForProposals",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return UpdateCallsForProposals.model_validate(data)
+
+    async def update_call_for_proposals_by_id(
+        self,
+        call_for_proposals_id: Any,
+        properties: CallForProposalsPropertiesInput,
+        include_deleted: bool,
+        **kwargs: Any,
+    ) -> UpdateCallForProposalsById:
+        query = gql("""
+            mutation updateCallForProposalsById($callForProposalsId: CallForProposalsId!, $properties: CallForProposalsPropertiesInput!, $includeDeleted: Boolean! = false) {
+              updateCallsForProposals(
+                input: {SET: $properties, WHERE: {id: {EQ: $callForProposalsId}}, LIMIT: 1, includeDeleted: $includeDeleted}
+              ) {
+                hasMore
+                callsForProposals {
+                  ...CallForProposalsDetails
+                }
+              }
+            }
+
+            fragment CallForProposalsCore on CallForProposals {
+              id
+              title
+              observatory
+              gemini {
+                type
+                instruments
+              }
+              keck {
+                instruments
+              }
+              subaru {
+                type
+                instruments
+              }
+            }
+
+            fragment CallForProposalsDetails on CallForProposals {
+              ...CallForProposalsCore
+              semester
+              active {
+                start
+                end
+              }
+              submissionDeadlineDefault
+              existence
+            }
+            """)
+        variables: dict[str, object] = {
+            "callForProposalsId": call_for_proposals_id,
+            "properties": properties,
+            "includeDeleted": include_deleted,
+        }
+        response = await self.execute(
+            query=query,
+            operation_name="updateCallForProposalsById",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return UpdateCallForProposalsById.model_validate(data)
+
+    async def restore_call_for_proposals_by_id(
+        self, call_for_proposals_id: Any, **kwargs: Any
+    ) -> RestoreCallForProposalsById:
+        query = gql("""
+            mutation restoreCallForProposalsById($callForProposalsId: CallForProposalsId!) {
+              updateCallsForProposals(
+                input: {SET: {existence: PRESENT}, WHERE: {id: {EQ: $callForProposalsId}}, LIMIT: 1, includeDeleted: true}
+              ) {
+                hasMore
+                callsForProposals {
+                  ...CallForProposalsDetails
+                }
+              }
+            }
+
+            fragment CallForProposalsCore on CallForProposals {
+              id
+              title
+              observatory
+              gemini {
+                type
+                instruments
+              }
+              keck {
+                instruments
+              }
+              subaru {
+                type
+                instruments
+              }
+            }
+
+            fragment CallForProposalsDetails on CallForProposals {
+              ...CallForProposalsCore
+              semester
+              active {
+                start
+                end
+              }
+              submissionDeadlineDefault
+              existence
+            }
+            """)
+        variables: dict[str, object] = {"callForProposalsId": call_for_proposals_id}
+        response = await self.execute(
+            query=query,
+            operation_name="restoreCallForProposalsById",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return RestoreCallForProposalsById.model_validate(data)
+
+    async def delete_call_for_proposals_by_id(
+        self, call_for_proposals_id: Any, **kwargs: Any
+    ) -> DeleteCallForProposalsById:
+        query = gql("""
+            mutation deleteCallForProposalsById($callForProposalsId: CallForProposalsId!) {
+              updateCallsForProposals(
+                input: {SET: {existence: DELETED}, WHERE: {id: {EQ: $callForProposalsId}}, LIMIT: 1, includeDeleted: false}
+              ) {
+                hasMore
+                callsForProposals {
+                  ...CallForProposalsDetails
+                }
+              }
+            }
+
+            fragment CallForProposalsCore on CallForProposals {
+              id
+              title
+              observatory
+              gemini {
+                type
+                instruments
+              }
+              keck {
+                instruments
+              }
+              subaru {
+                type
+                instruments
+              }
+            }
+
+            fragment CallForProposalsDetails on CallForProposals {
+              ...CallForProposalsCore
+              semester
+              active {
+                start
+                end
+              }
+              submissionDeadlineDefault
+              existence
+            }
+            """)
+        variables: dict[str, object] = {"callForProposalsId": call_for_proposals_id}
+        response = await self.execute(
+            query=query,
+            operation_name="deleteCallForProposalsById",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return DeleteCallForProposalsById.model_validate(data)
+
+    async def get_call_for_proposals(
+        self, call_for_proposals_id: Any, **kwargs: Any
+    ) -> GetCallForProposals:
+        query = gql("""
+            query getCallForProposals($callForProposalsId: CallForProposalsId!) {
+              callForProposals(callForProposalsId: $callForProposalsId) {
+                ...CallForProposalsDetails
+              }
+            }
+
+            fragment CallForProposalsCore on CallForProposals {
+              id
+              title
+              observatory
+              gemini {
+                type
+                instruments
+              }
+              keck {
+                instruments
+              }
+              subaru {
+                type
+                instruments
+              }
+            }
+
+            fragment CallForProposalsDetails on CallForProposals {
+              ...CallForProposalsCore
+              semester
+              active {
+                start
+                end
+              }
+              submissionDeadlineDefault
+              existence
+            }
+            """)
+        variables: dict[str, object] = {"callForProposalsId": call_for_proposals_id}
+        response = await self.execute(
+            query=query,
+            operation_name="getCallForProposals",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return GetCallForProposals.model_validate(data)
+
+    async def get_calls_for_proposals(
+        self,
+        include_deleted: bool,
+        where: Union[Optional[WhereCallForProposals], UnsetType] = UNSET,
+        offset: Union[Optional[Any], UnsetType] = UNSET,
+        limit: Union[Optional[Any], UnsetType] = UNSET,
+        **kwargs: Any,
+    ) -> GetCallsForProposals:
+        query = gql("""
+            query getCallsForProposals($where: WhereCallForProposals, $offset: CallForProposalsId, $limit: NonNegInt, $includeDeleted: Boolean! = false) {
+              callsForProposals(
+                WHERE: $where
+                OFFSET: $offset
+                LIMIT: $limit
+                includeDeleted: $includeDeleted
+              ) {
+                hasMore
+                matches {
+                  ...CallForProposalsDetails
+                }
+              }
+            }
+
+            fragment CallForProposalsCore on CallForProposals {
+              id
+              title
+              observatory
+              gemini {
+                type
+                instruments
+              }
+              keck {
+                instruments
+              }
+              subaru {
+                type
+                instruments
+              }
+            }
+
+            fragment CallForProposalsDetails on CallForProposals {
+              ...CallForProposalsCore
+              semester
+              active {
+                start
+                end
+              }
+              submissionDeadlineDefault
+              existence
+            }
+            """)
+        variables: dict[str, object] = {
+            "where": where,
+            "offset": offset,
+            "limit": limit,
+            "includeDeleted": include_deleted,
+        }
+        response = await self.execute(
+            query=query,
+            operation_name="getCallsForProposals",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return GetCallsForProposals.model_validate(data)
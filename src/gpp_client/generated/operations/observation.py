@@ -0,0 +1,7520 @@
+from collections.abc import AsyncIterator
+from typing import Any, Optional, Union
+
+from ..async_base_client import AsyncBaseClient
+from ..base_model import UNSET, UnsetType
+from ..clone_observation import CloneObservation
+from ..create_observation import CreateObservation
+from ..delete_observation_by_id import DeleteObservationById
+from ..delete_observation_by_reference import DeleteObservationByReference
+from ..get_observation import GetObservation
+from ..get_observation_summaries import GetObservationSummaries
+from ..get_observations import GetObservations
+from ..input_types import (
+    CloneObservationInput,
+    CreateObservationInput,
+    ObservationPropertiesInput,
+    UpdateObservationsInput,
+    WhereObservation,
+)
+from ..obs_calculation_update import ObsCalculationUpdate
+from ..observation_edit import ObservationEdit
+from ..restore_observation_by_id import RestoreObservationById
+from ..restore_observation_by_reference import RestoreObservationByReference
+from ..update_observation_by_id import UpdateObservationById
+from ..update_observation_by_reference import UpdateObservationByReference
+from ..update_observations import UpdateObservations
+
+
+def gql(q: str) -> str:
+    return q
+
+
+class ObservationOperations(AsyncBaseClient):
+    async def create_observation(
+        self, input: CreateObservationInput, **kwargs: Any
+    ) -> CreateObservation:
+        query = gql("""
+            mutation createObservation($input: CreateObservationInput!) {
+              createObservation(input: $input) {
+                observation {
+                  ...ObservationDetails
+                }
+              }
+            }
+
+            fragment ConstraintSetDetails on ConstraintSet {
+              imageQuality
+              cloudExtinction
+              skyBackground
+              waterVapor
+              elevationRange {
+                airMass {
+                  min
+                  max
+                }
+                hourAngle {
+                  minHours
+                  maxHours
+                }
+              }
+            }
+
+            fragment Flamingos2ImagingDetails on Flamingos2Imaging {
+              filters {
+                filter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    time {
+                      seconds
+                    }
+                    count
+                  }
+                }
+              }
+              initialFilters {
+                filter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+              }
+              defaultReadMode
+              explicitReadMode
+              defaultReads
+              explicitReads
+              defaultDecker
+              explicitDecker
+              readoutMode
+              defaultReadoutMode
+              explicitReadoutMode
+            }
+
+            fragment Flamingos2LongSlitDetails on Flamingos2LongSlit {
+              decker
+              defaultDecker
+              disperser
+              filter
+              fpu
+              telluricType {
+                tag
+                starTypes
+              }
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  time {
+                    seconds
+                  }
+                  count
+                  at {
+                    nanometers
+                  }
+                }
+              }
+              explicitReadMode
+              explicitReads
+              explicitDecker
+              readoutMode
+              defaultReadoutMode
+              acquisition {
+                exposureTimeMode {
+                  signalToNoise {
+                    value
+                    at {
+                      nanometers
+                    }
+                  }
+                  timeAndCount {
+                    time {
+                      seconds
+                    }
+                    count
+                    at {
+                      nanometers
+                    }
+                  }
+                }
+              }
+              initialDisperser
+              initialFilter
+              initialFpu
+            }
+
+            fragment GmosNorthImagingDetails on GmosNorthImaging {
+              filters {
+                filter
+              }
+              bin
+            }
+
+            fragment GmosNorthLongSlitDetails on GmosNorthLongSlit {
+              grating
+              filter
+              fpu
+              centralWavelength {
+                nanometers
+              }
+              offsets {
+                arcseconds
+              }
+              xBin
+              yBin
+            }
+
+            fragment GmosSouthImagingDetails on GmosSouthImaging {
+              filters {
+                filter
+              }
+              bin
+            }
+
+            fragment GmosSouthLongSlitDetails on GmosSouthLongSlit {
+              grating
+              filter
+              fpu
+              centralWavelength {
+                nanometers
+              }
+              offsets {
+                arcseconds
+              }
+              xBin
+              yBin
+            }
+
+            fragment GnirsImagingDetails on GnirsImaging {
+              camera
+              defaultWellDepth
+              explicitReadMode
+              explicitWellDepth
+              filters {
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                filter
+              }
+              initialFilters {
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                filter
+              }
+              wellDepth
+            }
+
+            fragment GnirsSpectroscopyDetails on GnirsSpectroscopy {
+              acquisition {
+                explicitAcquisitionType
+                explicitFilter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                skyOffset {
+                  p {
+                    arcseconds
+                  }
+                  q {
+                    arcseconds
+                  }
+                }
+              }
+              camera
+              centralWavelengths {
+                centralWavelength {
+                  nanometers
+                }
+              }
+              decker
+              defaultDecker
+              defaultWellDepth
+              explicitDecker
+              explicitFocusMotorSteps
+              explicitGrating
+              explicitPrism
+              explicitReadMode
+              explicitWellDepth
+              filter
+              grating
+              ifu {
+                fpu
+                initialFpu
+                telescopeConfigs {
+                  guiding
+                  offset {
+                    p {
+                      arcseconds
+                    }
+                    q {
+                      arcseconds
+                    }
+                  }
+                }
+              }
+              initialCamera
+              initialFilter
+              initialGrating
+              initialPrism
+              prism
+              telluricType {
+                starTypes
+                tag
+              }
+              wellDepth
+              slit {
+                fpu
+                initialFpu
+                defaultTelescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+                explicitTelescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+                telescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+              }
+            }
+
+            fragment Igrins2LongSlitDetails on Igrins2LongSlit {
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  time {
+                    seconds
+                  }
+                  count
+                  at {
+                    nanometers
+                  }
+                }
+              }
+              telluricType {
+                tag
+                starTypes
+              }
+            }
+
+            fragment NonsiderealTargetDetails on Nonsidereal {
+              des
+              keyType
+              key
+            }
+
+            fragment ObservationCore on Observation {
+              id
+              existence
+              reference {
+                label
+              }
+              title
+              instrument
+              calibrationRole
+            }
+
+            fragment ObservationDetails on Observation {
+              ...ObservationCore
+              observerNotes
+              subtitle
+              program {
+                ...ProgramCore
+              }
+              scienceRequirements {
+                ...ScienceRequirementsDetails
+              }
+              scienceBand
+              workflow {
+                ...WorkflowDetails
+              }
+              observingMode {
+                ...ObservingModeDetails
+              }
+              constraintSet {
+                ...ConstraintSetDetails
+              }
+              timingWindows {
+                ...TimingWindowDetails
+              }
+              targetEnvironment {
+                ...TargetEnvironmentDetails
+              }
+              execution {
+                digest {
+                  value {
+                    acquisition {
+                      timeEstimate {
+                        total {
+                          seconds
+                        }
+                        program {
+                          seconds
+                        }
+                        nonCharged {
+                          seconds
+                        }
+                      }
+                    }
+                    setup {
+                      full {
+                        seconds
+                      }
+                      reacquisition {
+                        seconds
+                      }
+                    }
+                  }
+                }
+              }
+            }
+
+            fragment ObservingModeDetails on ObservingMode {
+              instrument
+              mode
+              gmosNorthLongSlit {
+                ...GmosNorthLongSlitDetails
+              }
+              gmosSouthLongSlit {
+                ...GmosSouthLongSlitDetails
+              }
+              gmosNorthImaging {
+                ...GmosNorthImagingDetails
+              }
+              gmosSouthImaging {
+                ...GmosSouthImagingDetails
+              }
+              flamingos2LongSlit {
+                ...Flamingos2LongSlitDetails
+              }
+              flamingos2Imaging {
+                ...Flamingos2ImagingDetails
+              }
+              igrins2LongSlit {
+                ...Igrins2LongSlitDetails
+              }
+              visitor {
+                ...VisitorDetails
+              }
+              ghostIfu {
+                ...ghostIfuDetails
+              }
+              gnirsSpectroscopy {
+                ...GnirsSpectroscopyDetails
+              }
+              gnirsImaging {
+                ...GnirsImagingDetails
+              }
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment ScienceRequirementsDetails on ScienceRequirements {
+              mode
+            }
+
+            fragment SiderealTargetDetails on Sidereal {
+              ra {
+                hours
+                hms
+                degrees
+              }
+              dec {
+                degrees
+                dms
+              }
+              epoch
+            }
+
+            fragment TargetEnvironmentDetails on TargetEnvironment {
+              asterism {
+                name
+                sidereal {
+                  ...SiderealTargetDetails
+                }
+                nonsidereal {
+                  ...NonsiderealTargetDetails
+                }
+              }
+              explicitBase {
+                ra {
+                  hms
+                }
+                dec {
+                  dms
+                }
+              }
+            }
+
+            fragment TimingWindowDetails on TimingWindow {
+              inclusion
+              startUtc
+              end {
+                __typename
+                ... on TimingWindowEndAt {
+                  atUtc
+                }
+                ... on TimingWindowEndAfter {
+                  after {
+                    seconds
+                  }
+                  repeat {
+                    period {
+                      seconds
+                    }
+                    times
+                  }
+                }
+              }
+            }
+
+            fragment VisitorDetails on Visitor {
+              mode
+              name
+              centralWavelength {
+                nanometers
+              }
+              totalRequestTime {
+                seconds
+              }
+              agsDiameter {
+                dms
+                hms
+              }
+            }
+
+            fragment WorkflowCore on CalculatedObservationWorkflow {
+              state
+            }
+
+            fragment WorkflowDetails on CalculatedObservationWorkflow {
+              ...WorkflowCore
+              value {
+                state
+                validTransitions
+                validationErrors {
+                  code
+                  messages
+                }
+              }
+            }
+
+            fragment ghostDetectorConfigDetails on GhostDetectorConfig {
+              binning
+              defaultBinning
+              defaultReadMode
+              explicitBinning
+              explicitReadMode
+              readMode
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  at {
+                    nanometers
+                  }
+                  time {
+                    seconds
+                  }
+                  count
+                }
+              }
+            }
+
+            fragment ghostIfuDetails on GhostIfu {
+              defaultIfu1Agitator
+              defaultIfu2Agitator
+              explicitIfu1Agitator
+              explicitIfu2Agitator
+              ifu1Agitator
+              ifu2Agitator
+              resolutionMode
+              stepCount
+              blue {
+                ...ghostDetectorConfigDetails
+              }
+              red {
+                ...ghostDetectorConfigDetails
+              }
+              skyPosition {
+                dec {
+                  degrees
+                }
+                ra {
+                  degrees
+                }
+              }
+              slitViewingCameraExposureTime {
+                seconds
+              }
+            }
+            """)
+        variables: dict[str, object] = {"input": input}
+        response = await self.execute(
+            query=query,
+            operation_name="createObservation",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return CreateObservation.model_validate(data)
+
+    async def clone_observation(
+        self, input: CloneObservationInput, **kwargs: Any
+    ) -> CloneObservation:
+        query = gql("""
+            mutation cloneObservation($input: CloneObservationInput!) {
+              cloneObservation(input: $input) {
+                newObservation {
+                  ...ObservationDetails
+                }
+              }
+            }
+
+            fragment ConstraintSetDetails on ConstraintSet {
+              imageQuality
+              cloudExtinction
+              skyBackground
+              waterVapor
+              elevationRange {
+                airMass {
+                  min
+                  max
+                }
+                hourAngle {
+                  minHours
+                  maxHours
+                }
+              }
+            }
+
+            fragment Flamingos2ImagingDetails on Flamingos2Imaging {
+              filters {
+                filter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    time {
+                      seconds
+                    }
+                    count
+                  }
+                }
+              }
+              initialFilters {
+                filter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+              }
+              defaultReadMode
+              explicitReadMode
+              defaultReads
+              explicitReads
+              defaultDecker
+              explicitDecker
+              readoutMode
+              defaultReadoutMode
+              explicitReadoutMode
+            }
+
+            fragment Flamingos2LongSlitDetails on Flamingos2LongSlit {
+              decker
+              defaultDecker
+              disperser
+              filter
+              fpu
+              telluricType {
+                tag
+                starTypes
+              }
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  time {
+                    seconds
+                  }
+                  count
+                  at {
+                    nanometers
+                  }
+                }
+              }
+              explicitReadMode
+              explicitReads
+              explicitDecker
+              readoutMode
+              defaultReadoutMode
+              acquisition {
+                exposureTimeMode {
+                  signalToNoise {
+                    value
+                    at {
+                      nanometers
+                    }
+                  }
+                  timeAndCount {
+                    time {
+                      seconds
+                    }
+                    count
+                    at {
+                      nanometers
+                    }
+                  }
+                }
+              }
+              initialDisperser
+              initialFilter
+              initialFpu
+            }
+
+            fragment GmosNorthImagingDetails on GmosNorthImaging {
+              filters {
+                filter
+              }
+              bin
+            }
+
+            fragment GmosNorthLongSlitDetails on GmosNorthLongSlit {
+              grating
+              filter
+              fpu
+              centralWavelength {
+                nanometers
+              }
+              offsets {
+                arcseconds
+              }
+              xBin
+              yBin
+            }
+
+            fragment GmosSouthImagingDetails on GmosSouthImaging {
+              filters {
+                filter
+              }
+              bin
+            }
+
+            fragment GmosSouthLongSlitDetails on GmosSouthLongSlit {
+              grating
+              filter
+              fpu
+              centralWavelength {
+                nanometers
+              }
+              offsets {
+                arcseconds
+              }
+              xBin
+              yBin
+            }
+
+            fragment GnirsImagingDetails on GnirsImaging {
+              camera
+              defaultWellDepth
+              explicitReadMode
+              explicitWellDepth
+              filters {
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                filter
+              }
+              initialFilters {
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                filter
+              }
+              wellDepth
+            }
+
+            fragment GnirsSpectroscopyDetails on GnirsSpectroscopy {
+              acquisition {
+                explicitAcquisitionType
+                explicitFilter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                skyOffset {
+                  p {
+                    arcseconds
+                  }
+                  q {
+                    arcseconds
+                  }
+                }
+              }
+              camera
+              centralWavelengths {
+                centralWavelength {
+                  nanometers
+                }
+              }
+              decker
+              defaultDecker
+              defaultWellDepth
+              explicitDecker
+              explicitFocusMotorSteps
+              explicitGrating
+              explicitPrism
+              explicitReadMode
+              explicitWellDepth
+              filter
+              grating
+              ifu {
+                fpu
+                initialFpu
+                telescopeConfigs {
+                  guiding
+                  offset {
+                    p {
+                      arcseconds
+                    }
+                    q {
+                      arcseconds
+                    }
+                  }
+                }
+              }
+              initialCamera
+              initialFilter
+              initialGrating
+              initialPrism
+              prism
+              telluricType {
+                starTypes
+                tag
+              }
+              wellDepth
+              slit {
+                fpu
+                initialFpu
+                defaultTelescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+                explicitTelescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+                telescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+              }
+            }
+
+            fragment Igrins2LongSlitDetails on Igrins2LongSlit {
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  time {
+                    seconds
+                  }
+                  count
+                  at {
+                    nanometers
+                  }
+                }
+              }
+              telluricType {
+                tag
+                starTypes
+              }
+            }
+
+            fragment NonsiderealTargetDetails on Nonsidereal {
+              des
+              keyType
+              key
+            }
+
+            fragment ObservationCore on Observation {
+              id
+              existence
+              reference {
+                label
+              }
+              title
+              instrument
+              calibrationRole
+            }
+
+            fragment ObservationDetails on Observation {
+              ...ObservationCore
+              observerNotes
+              subtitle
+              program {
+                ...ProgramCore
+              }
+              scienceRequirements {
+                ...ScienceRequirementsDetails
+              }
+              scienceBand
+              workflow {
+                ...WorkflowDetails
+              }
+              observingMode {
+                ...ObservingModeDetails
+              }
+              constraintSet {
+                ...ConstraintSetDetails
+              }
+              timingWindows {
+                ...TimingWindowDetails
+              }
+              targetEnvironment {
+                ...TargetEnvironmentDetails
+              }
+              execution {
+                digest {
+                  value {
+                    acquisition {
+                      timeEstimate {
+                        total {
+                          seconds
+                        }
+                        program {
+                          seconds
+                        }
+                        nonCharged {
+                          seconds
+                        }
+                      }
+                    }
+                    setup {
+                      full {
+                        seconds
+                      }
+                      reacquisition {
+                        seconds
+                      }
+                    }
+                  }
+                }
+              }
+            }
+
+            fragment ObservingModeDetails on ObservingMode {
+              instrument
+              mode
+              gmosNorthLongSlit {
+                ...GmosNorthLongSlitDetails
+              }
+              gmosSouthLongSlit {
+                ...GmosSouthLongSlitDetails
+              }
+              gmosNorthImaging {
+                ...GmosNorthImagingDetails
+              }
+              gmosSouthImaging {
+                ...GmosSouthImagingDetails
+              }
+              flamingos2LongSlit {
+                ...Flamingos2LongSlitDetails
+              }
+              flamingos2Imaging {
+                ...Flamingos2ImagingDetails
+              }
+              igrins2LongSlit {
+                ...Igrins2LongSlitDetails
+              }
+              visitor {
+                ...VisitorDetails
+              }
+              ghostIfu {
+                ...ghostIfuDetails
+              }
+              gnirsSpectroscopy {
+                ...GnirsSpectroscopyDetails
+              }
+              gnirsImaging {
+                ...GnirsImagingDetails
+              }
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment ScienceRequirementsDetails on ScienceRequirements {
+              mode
+            }
+
+            fragment SiderealTargetDetails on Sidereal {
+              ra {
+                hours
+                hms
+                degrees
+              }
+              dec {
+                degrees
+                dms
+              }
+              epoch
+            }
+
+            fragment TargetEnvironmentDetails on TargetEnvironment {
+              asterism {
+                name
+                sidereal {
+                  ...SiderealTargetDetails
+                }
+                nonsidereal {
+                  ...NonsiderealTargetDetails
+                }
+              }
+              explicitBase {
+                ra {
+                  hms
+                }
+                dec {
+                  dms
+                }
+              }
+            }
+
+            fragment TimingWindowDetails on TimingWindow {
+              inclusion
+              startUtc
+              end {
+                __typename
+                ... on TimingWindowEndAt {
+                  atUtc
+                }
+                ... on TimingWindowEndAfter {
+                  after {
+                    seconds
+                  }
+                  repeat {
+                    period {
+                      seconds
+                    }
+                    times
+                  }
+                }
+              }
+            }
+
+            fragment VisitorDetails on Visitor {
+              mode
+              name
+              centralWavelength {
+                nanometers
+              }
+              totalRequestTime {
+                seconds
+              }
+              agsDiameter {
+                dms
+                hms
+              }
+            }
+
+            fragment WorkflowCore on CalculatedObservationWorkflow {
+              state
+            }
+
+            fragment WorkflowDetails on CalculatedObservationWorkflow {
+              ...WorkflowCore
+              value {
+                state
+                validTransitions
+                validationErrors {
+                  code
+                  messages
+                }
+              }
+            }
+
+            fragment ghostDetectorConfigDetails on GhostDetectorConfig {
+              binning
+              defaultBinning
+              defaultReadMode
+              explicitBinning
+              explicitReadMode
+              readMode
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  at {
+                    nanometers
+                  }
+                  time {
+                    seconds
+                  }
+                  count
+                }
+              }
+            }
+
+            fragment ghostIfuDetails on GhostIfu {
+              defaultIfu1Agitator
+              defaultIfu2Agitator
+              explicitIfu1Agitator
+              explicitIfu2Agitator
+              ifu1Agitator
+              ifu2Agitator
+              resolutionMode
+              stepCount
+              blue {
+                ...ghostDetectorConfigDetails
+              }
+              red {
+                ...ghostDetectorConfigDetails
+              }
+              skyPosition {
+                dec {
+                  degrees
+                }
+                ra {
+                  degrees
+                }
+              }
+              slitViewingCameraExposureTime {
+                seconds
+              }
+            }
+            """)
+        variables: dict[str, object] = {"input": input}
+        response = await self.execute(
+            query=query,
+            operation_name="cloneObservation",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return CloneObservation.model_validate(data)
+
+    async def update_observations(
+        self, input: UpdateObservationsInput, **kwargs: Any
+    ) -> UpdateObservations:
+        query = gql("""
+            mutation updateObservations($input: UpdateObservationsInput!) {
+              updateObservations(input: $input) {
+                hasMore
+                observations {
+                  ...ObservationDetails
+                }
+              }
+            }
+
+            fragment ConstraintSetDetails on ConstraintSet {
+              imageQuality
+              cloudExtinction
+              skyBackground
+              waterVapor
+              elevationRange {
+                airMass {
+                  min
+                  max
+                }
+                hourAngle {
+                  minHours
+                  maxHours
+                }
+              }
+            }
+
+            fragment Flamingos2ImagingDetails on Flamingos2Imaging {
+              filters {
+                filter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    time {
+                      seconds
+                    }
+                    count
+                  }
+                }
+              }
+              initialFilters {
+                filter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+              }
+              defaultReadMode
+              explicitReadMode
+              defaultReads
+              explicitReads
+              defaultDecker
+              explicitDecker
+              readoutMode
+              defaultReadoutMode
+              explicitReadoutMode
+            }
+
+            fragment Flamingos2LongSlitDetails on Flamingos2LongSlit {
+              decker
+              defaultDecker
+              disperser
+              filter
+              fpu
+              telluricType {
+                tag
+                starTypes
+              }
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  time {
+                    seconds
+                  }
+                  count
+                  at {
+                    nanometers
+                  }
+                }
+              }
+              explicitReadMode
+              explicitReads
+              explicitDecker
+              readoutMode
+              defaultReadoutMode
+              acquisition {
+                exposureTimeMode {
+                  signalToNoise {
+                    value
+                    at {
+                      nanometers
+                    }
+                  }
+                  timeAndCount {
+                    time {
+                      seconds
+                    }
+                    count
+                    at {
+                      nanometers
+                    }
+                  }
+                }
+              }
+              initialDisperser
+              initialFilter
+              initialFpu
+            }
+
+            fragment GmosNorthImagingDetails on GmosNorthImaging {
+              filters {
+                filter
+              }
+              bin
+            }
+
+            fragment GmosNorthLongSlitDetails on GmosNorthLongSlit {
+              grating
+              filter
+              fpu
+              centralWavelength {
+                nanometers
+              }
+              offsets {
+                arcseconds
+              }
+              xBin
+              yBin
+            }
+
+            fragment GmosSouthImagingDetails on GmosSouthImaging {
+              filters {
+                filter
+              }
+              bin
+            }
+
+            fragment GmosSouthLongSlitDetails on GmosSouthLongSlit {
+              grating
+              filter
+              fpu
+              centralWavelength {
+                nanometers
+              }
+              offsets {
+                arcseconds
+              }
+              xBin
+              yBin
+            }
+
+            fragment GnirsImagingDetails on GnirsImaging {
+              camera
+              defaultWellDepth
+              explicitReadMode
+              explicitWellDepth
+              filters {
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                filter
+              }
+              initialFilters {
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                filter
+              }
+              wellDepth
+            }
+
+            fragment GnirsSpectroscopyDetails on GnirsSpectroscopy {
+              acquisition {
+                explicitAcquisitionType
+                explicitFilter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                skyOffset {
+                  p {
+                    arcseconds
+                  }
+                  q {
+                    arcseconds
+                  }
+                }
+              }
+              camera
+              centralWavelengths {
+                centralWavelength {
+                  nanometers
+                }
+              }
+              decker
+              defaultDecker
+              defaultWellDepth
+              explicitDecker
+              explicitFocusMotorSteps
+              explicitGrating
+              explicitPrism
+              explicitReadMode
+              explicitWellDepth
+              filter
+              grating
+              ifu {
+                fpu
+                initialFpu
+                telescopeConfigs {
+                  guiding
+                  offset {
+                    p {
+                      arcseconds
+                    }
+                    q {
+                      arcseconds
+                    }
+                  }
+                }
+              }
+              initialCamera
+              initialFilter
+              initialGrating
+              initialPrism
+              prism
+              telluricType {
+                starTypes
+                tag
+              }
+              wellDepth
+              slit {
+                fpu
+                initialFpu
+                defaultTelescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+                explicitTelescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+                telescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+              }
+            }
+
+            fragment Igrins2LongSlitDetails on Igrins2LongSlit {
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  time {
+                    seconds
+                  }
+                  count
+                  at {
+                    nanometers
+                  }
+                }
+              }
+              telluricType {
+                tag
+                starTypes
+              }
+            }
+
+            fragment NonsiderealTargetDetails on Nonsidereal {
+              des
+              keyType
+              key
+            }
+
+            fragment ObservationCore on Observation {
+              id
+              existence
+              reference {
+                label
+              }
+              title
+              instrument
+              calibrationRole
+            }
+
+            fragment ObservationDetails on Observation {
+              ...ObservationCore
+              observerNotes
+              subtitle
+              program {
+                ...ProgramCore
+              }
+              scienceRequirements {
+                ...ScienceRequirementsDetails
+              }
+              scienceBand
+              workflow {
+                ...WorkflowDetails
+              }
+              observingMode {
+                ...ObservingModeDetails
+              }
+              constraintSet {
+                ...ConstraintSetDetails
+              }
+              timingWindows {
+                ...TimingWindowDetails
+              }
+              targetEnvironment {
+                ...TargetEnvironmentDetails
+              }
+              execution {
+                digest {
+                  value {
+                    acquisition {
+                      timeEstimate {
+                        total {
+                          seconds
+                        }
+                        program {
+                          seconds
+                        }
+                        nonCharged {
+                          seconds
+                        }
+                      }
+                    }
+                    setup {
+                      full {
+                        seconds
+                      }
+                      reacquisition {
+                        seconds
+                      }
+                    }
+                  }
+                }
+              }
+            }
+
+            fragment ObservingModeDetails on ObservingMode {
+              instrument
+              mode
+              gmosNorthLongSlit {
+                ...GmosNorthLongSlitDetails
+              }
+              gmosSouthLongSlit {
+                ...GmosSouthLongSlitDetails
+              }
+              gmosNorthImaging {
+                ...GmosNorthImagingDetails
+              }
+              gmosSouthImaging {
+                ...GmosSouthImagingDetails
+              }
+              flamingos2LongSlit {
+                ...Flamingos2LongSlitDetails
+              }
+              flamingos2Imaging {
+                ...Flamingos2ImagingDetails
+              }
+              igrins2LongSlit {
+                ...Igrins2LongSlitDetails
+              }
+              visitor {
+                ...VisitorDetails
+              }
+              ghostIfu {
+                ...ghostIfuDetails
+              }
+              gnirsSpectroscopy {
+                ...GnirsSpectroscopyDetails
+              }
+              gnirsImaging {
+                ...GnirsImagingDetails
+              }
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment ScienceRequirementsDetails on ScienceRequirements {
+              mode
+            }
+
+            fragment SiderealTargetDetails on Sidereal {
+              ra {
+                hours
+                hms
+                degrees
+              }
+              dec {
+                degrees
+                dms
+              }
+              epoch
+            }
+
+            fragment TargetEnvironmentDetails on TargetEnvironment {
+              asterism {
+                name
+                sidereal {
+                  ...SiderealTargetDetails
+                }
+                nonsidereal {
+                  ...NonsiderealTargetDetails
+                }
+              }
+              explicitBase {
+                ra {
+                  hms
+                }
+                dec {
+                  dms
+                }
+              }
+            }
+
+            fragment TimingWindowDetails on TimingWindow {
+              inclusion
+              startUtc
+              end {
+                __typename
+                ... on TimingWindowEndAt {
+                  atUtc
+                }
+                ... on TimingWindowEndAfter {
+                  after {
+                    seconds
+                  }
+                  repeat {
+                    period {
+                      seconds
+                    }
+                    times
+                  }
+                }
+              }
+            }
+
+            fragment VisitorDetails on Visitor {
+              mode
+              name
+              centralWavelength {
+                nanometers
+              }
+              totalRequestTime {
+                seconds
+              }
+              agsDiameter {
+                dms
+                hms
+              }
+            }
+
+            fragment WorkflowCore on CalculatedObservationWorkflow {
+              state
+            }
+
+            fragment WorkflowDetails on CalculatedObservationWorkflow {
+              ...WorkflowCore
+              value {
+                state
+                validTransitions
+                validationErrors {
+                  code
+                  messages
+                }
+              }
+            }
+
+            fragment ghostDetectorConfigDetails on GhostDetectorConfig {
+              binning
+              defaultBinning
+              defaultReadMode
+              explicitBinning
+              explicitReadMode
+              readMode
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  at {
+                    nanometers
+                  }
+                  time {
+                    seconds
+                  }
+                  count
+                }
+              }
+            }
+
+            fragment ghostIfuDetails on GhostIfu {
+              defaultIfu1Agitator
+              defaultIfu2Agitator
+              explicitIfu1Agitator
+              explicitIfu2Agitator
+              ifu1Agitator
+              ifu2Agitator
+              resolutionMode
+              stepCount
+              blue {
+                ...ghostDetectorConfigDetails
+              }
+              red {
+                ...ghostDetectorConfigDetails
+              }
+              skyPosition {
+                dec {
+                  degrees
+                }
+                ra {
+                  degrees
+                }
+              }
+              slitViewingCameraExposureTime {
+                seconds
+              }
+            }
+            """)
+        variables: dict[str, object] = {"input": input}
+        response = await self.execute(
+            query=query,
+            operation_name="updateObservations",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return UpdateObservations.model_validate(data)
+
+    async def update_observation_by_id(
+        self, observation_id: Any, set_: ObservationPropertiesInput, **kwargs: Any
+    ) -> UpdateObservationById:
+        query = gql("""
+            mutation updateObservationById($observationId: ObservationId!, $SET: ObservationPropertiesInput!) {
+              updateObservations(
+                input: {SET: $SET, WHERE: {id: {EQ: $observationId}}, LIMIT: 1}
+              ) {
+                hasMore
+                observations {
+                  ...ObservationDetails
+                }
+              }
+            }
+
+            fragment ConstraintSetDetails on ConstraintSet {
+              imageQuality
+              cloudExtinction
+              skyBackground
+              waterVapor
+              elevationRange {
+                airMass {
+                  min
+                  max
+                }
+                hourAngle {
+                  minHours
+                  maxHours
+                }
+              }
+            }
+
+            fragment Flamingos2ImagingDetails on Flamingos2Imaging {
+              filters {
+                filter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    time {
+                      seconds
+                    }
+                    count
+                  }
+                }
+              }
+              initialFilters {
+                filter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+              }
+              defaultReadMode
+              explicitReadMode
+              defaultReads
+              explicitReads
+              defaultDecker
+              explicitDecker
+              readoutMode
+              defaultReadoutMode
+              explicitReadoutMode
+            }
+
+            fragment Flamingos2LongSlitDetails on Flamingos2LongSlit {
+              decker
+              defaultDecker
+              disperser
+              filter
+              fpu
+              telluricType {
+                tag
+                starTypes
+              }
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  time {
+                    seconds
+                  }
+                  count
+                  at {
+                    nanometers
+                  }
+                }
+              }
+              explicitReadMode
+              explicitReads
+              explicitDecker
+              readoutMode
+              defaultReadoutMode
+              acquisition {
+                exposureTimeMode {
+                  signalToNoise {
+                    value
+                    at {
+                      nanometers
+                    }
+                  }
+                  timeAndCount {
+                    time {
+                      seconds
+                    }
+                    count
+                    at {
+                      nanometers
+                    }
+                  }
+                }
+              }
+              initialDisperser
+              initialFilter
+              initialFpu
+            }
+
+            fragment GmosNorthImagingDetails on GmosNorthImaging {
+              filters {
+                filter
+              }
+              bin
+            }
+
+            fragment GmosNorthLongSlitDetails on GmosNorthLongSlit {
+              grating
+              filter
+              fpu
+              centralWavelength {
+                nanometers
+              }
+              offsets {
+                arcseconds
+              }
+              xBin
+              yBin
+            }
+
+            fragment GmosSouthImagingDetails on GmosSouthImaging {
+              filters {
+                filter
+              }
+              bin
+            }
+
+            fragment GmosSouthLongSlitDetails on GmosSouthLongSlit {
+              grating
+              filter
+              fpu
+              centralWavelength {
+                nanometers
+              }
+              offsets {
+                arcseconds
+              }
+              xBin
+              yBin
+            }
+
+            fragment GnirsImagingDetails on GnirsImaging {
+              camera
+              defaultWellDepth
+              explicitReadMode
+              explicitWellDepth
+              filters {
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                filter
+              }
+              initialFilters {
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                filter
+              }
+              wellDepth
+            }
+
+            fragment GnirsSpectroscopyDetails on GnirsSpectroscopy {
+              acquisition {
+                explicitAcquisitionType
+                explicitFilter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                skyOffset {
+                  p {
+                    arcseconds
+                  }
+                  q {
+                    arcseconds
+                  }
+                }
+              }
+              camera
+              centralWavelengths {
+                centralWavelength {
+                  nanometers
+                }
+              }
+              decker
+              defaultDecker
+              defaultWellDepth
+              explicitDecker
+              explicitFocusMotorSteps
+              explicitGrating
+              explicitPrism
+              explicitReadMode
+              explicitWellDepth
+              filter
+              grating
+              ifu {
+                fpu
+                initialFpu
+                telescopeConfigs {
+                  guiding
+                  offset {
+                    p {
+                      arcseconds
+                    }
+                    q {
+                      arcseconds
+                    }
+                  }
+                }
+              }
+              initialCamera
+              initialFilter
+              initialGrating
+              initialPrism
+              prism
+              telluricType {
+                starTypes
+                tag
+              }
+              wellDepth
+              slit {
+                fpu
+                initialFpu
+                defaultTelescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+                explicitTelescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+                telescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+              }
+            }
+
+            fragment Igrins2LongSlitDetails on Igrins2LongSlit {
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  time {
+                    seconds
+                  }
+                  count
+                  at {
+                    nanometers
+                  }
+                }
+              }
+              telluricType {
+                tag
+                starTypes
+              }
+            }
+
+            fragment NonsiderealTargetDetails on Nonsidereal {
+              des
+              keyType
+              key
+            }
+
+            fragment ObservationCore on Observation {
+              id
+              existence
+              reference {
+                label
+              }
+              title
+              instrument
+              calibrationRole
+            }
+
+            fragment ObservationDetails on Observation {
+              ...ObservationCore
+              observerNotes
+              subtitle
+              program {
+                ...ProgramCore
+              }
+              scienceRequirements {
+                ...ScienceRequirementsDetails
+              }
+              scienceBand
+              workflow {
+                ...WorkflowDetails
+              }
+              observingMode {
+                ...ObservingModeDetails
+              }
+              constraintSet {
+                ...ConstraintSetDetails
+              }
+              timingWindows {
+                ...TimingWindowDetails
+              }
+              targetEnvironment {
+                ...TargetEnvironmentDetails
+              }
+              execution {
+                digest {
+                  value {
+                    acquisition {
+                      timeEstimate {
+                        total {
+                          seconds
+                        }
+                        program {
+                          seconds
+                        }
+                        nonCharged {
+                          seconds
+                        }
+                      }
+                    }
+                    setup {
+                      full {
+                        seconds
+                      }
+                      reacquisition {
+                        seconds
+                      }
+                    }
+                  }
+                }
+              }
+            }
+
+            fragment ObservingModeDetails on ObservingMode {
+              instrument
+              mode
+              gmosNorthLongSlit {
+                ...GmosNorthLongSlitDetails
+              }
+              gmosSouthLongSlit {
+                ...GmosSouthLongSlitDetails
+              }
+              gmosNorthImaging {
+                ...GmosNorthImagingDetails
+              }
+              gmosSouthImaging {
+                ...GmosSouthImagingDetails
+              }
+              flamingos2LongSlit {
+                ...Flamingos2LongSlitDetails
+              }
+              flamingos2Imaging {
+                ...Flamingos2ImagingDetails
+              }
+              igrins2LongSlit {
+                ...Igrins2LongSlitDetails
+              }
+              visitor {
+                ...VisitorDetails
+              }
+              ghostIfu {
+                ...ghostIfuDetails
+              }
+              gnirsSpectroscopy {
+                ...GnirsSpectroscopyDetails
+              }
+              gnirsImaging {
+                ...GnirsImagingDetails
+              }
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment ScienceRequirementsDetails on ScienceRequirements {
+              mode
+            }
+
+            fragment SiderealTargetDetails on Sidereal {
+              ra {
+                hours
+                hms
+                degrees
+              }
+              dec {
+                degrees
+                dms
+              }
+              epoch
+            }
+
+            fragment TargetEnvironmentDetails on TargetEnvironment {
+              asterism {
+                name
+                sidereal {
+                  ...SiderealTargetDetails
+                }
+                nonsidereal {
+                  ...NonsiderealTargetDetails
+                }
+              }
+              explicitBase {
+                ra {
+                  hms
+                }
+                dec {
+                  dms
+                }
+              }
+            }
+
+            fragment TimingWindowDetails on TimingWindow {
+              inclusion
+              startUtc
+              end {
+                __typename
+                ... on TimingWindowEndAt {
+                  atUtc
+                }
+                ... on TimingWindowEndAfter {
+                  after {
+                    seconds
+                  }
+                  repeat {
+                    period {
+                      seconds
+                    }
+                    times
+                  }
+                }
+              }
+            }
+
+            fragment VisitorDetails on Visitor {
+              mode
+              name
+              centralWavelength {
+                nanometers
+              }
+              totalRequestTime {
+                seconds
+              }
+              agsDiameter {
+                dms
+                hms
+              }
+            }
+
+            fragment WorkflowCore on CalculatedObservationWorkflow {
+              state
+            }
+
+            fragment WorkflowDetails on CalculatedObservationWorkflow {
+              ...WorkflowCore
+              value {
+                state
+                validTransitions
+                validationErrors {
+                  code
+                  messages
+                }
+              }
+            }
+
+            fragment ghostDetectorConfigDetails on GhostDetectorConfig {
+              binning
+              defaultBinning
+              defaultReadMode
+              explicitBinning
+              explicitReadMode
+              readMode
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  at {
+                    nanometers
+                  }
+                  time {
+                    seconds
+                  }
+                  count
+                }
+              }
+            }
+
+            fragment ghostIfuDetails on GhostIfu {
+              defaultIfu1Agitator
+              defaultIfu2Agitator
+              explicitIfu1Agitator
+              explicitIfu2Agitator
+              ifu1Agitator
+              ifu2Agitator
+              resolutionMode
+              stepCount
+              blue {
+                ...ghostDetectorConfigDetails
+              }
+              red {
+                ...ghostDetectorConfigDetails
+              }
+              skyPosition {
+                dec {
+                  degrees
+                }
+                ra {
+                  degrees
+                }
+              }
+              slitViewingCameraExposureTime {
+                seconds
+              }
+            }
+            """)
+        variables: dict[str, object] = {"observationId": observation_id, "SET": set_}
+        response = await self.execute(
+            query=query,
+            operation_name="updateObservationById",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return UpdateObservationById.model_validate(data)
+
+    async def update_observation_by_reference(
+        self,
+        observation_reference: Any,
+        set_: ObservationPropertiesInput,
+        **kwargs: Any,
+    ) -> UpdateObservationByReference:
+        query = gql("""
+            mutation updateObservationByReference($observationReference: NonEmptyString!, $SET: ObservationPropertiesInput!) {
+              updateObservations(
+                input: {SET: $SET, WHERE: {reference: {label: {EQ: $observationReference}}}, LIMIT: 1}
+              ) {
+                hasMore
+                observations {
+                  ...ObservationDetails
+                }
+              }
+            }
+
+            fragment ConstraintSetDetails on ConstraintSet {
+              imageQuality
+              cloudExtinction
+              skyBackground
+              waterVapor
+              elevationRange {
+                airMass {
+                  min
+                  max
+                }
+                hourAngle {
+                  minHours
+                  maxHours
+                }
+              }
+            }
+
+            fragment Flamingos2ImagingDetails on Flamingos2Imaging {
+              filters {
+                filter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    time {
+                      seconds
+                    }
+                    count
+                  }
+                }
+              }
+              initialFilters {
+                filter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+              }
+              defaultReadMode
+              explicitReadMode
+              defaultReads
+              explicitReads
+              defaultDecker
+              explicitDecker
+              readoutMode
+              defaultReadoutMode
+              explicitReadoutMode
+            }
+
+            fragment Flamingos2LongSlitDetails on Flamingos2LongSlit {
+              decker
+              defaultDecker
+              disperser
+              filter
+              fpu
+              telluricType {
+                tag
+                starTypes
+              }
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  time {
+                    seconds
+                  }
+                  count
+                  at {
+                    nanometers
+                  }
+                }
+              }
+              explicitReadMode
+              explicitReads
+              explicitDecker
+              readoutMode
+              defaultReadoutMode
+              acquisition {
+                exposureTimeMode {
+                  signalToNoise {
+                    value
+                    at {
+                      nanometers
+                    }
+                  }
+                  timeAndCount {
+                    time {
+                      seconds
+                    }
+                    count
+                    at {
+                      nanometers
+                    }
+                  }
+                }
+              }
+              initialDisperser
+              initialFilter
+              initialFpu
+            }
+
+            fragment GmosNorthImagingDetails on GmosNorthImaging {
+              filters {
+                filter
+              }
+              bin
+            }
+
+            fragment GmosNorthLongSlitDetails on GmosNorthLongSlit {
+              grating
+              filter
+              fpu
+              centralWavelength {
+                nanometers
+              }
+              offsets {
+                arcseconds
+              }
+              xBin
+              yBin
+            }
+
+            fragment GmosSouthImagingDetails on GmosSouthImaging {
+              filters {
+                filter
+              }
+              bin
+            }
+
+            fragment GmosSouthLongSlitDetails on GmosSouthLongSlit {
+              grating
+              filter
+              fpu
+              centralWavelength {
+                nanometers
+              }
+              offsets {
+                arcseconds
+              }
+              xBin
+              yBin
+            }
+
+            fragment GnirsImagingDetails on GnirsImaging {
+              camera
+              defaultWellDepth
+              explicitReadMode
+              explicitWellDepth
+              filters {
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                filter
+              }
+              initialFilters {
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                filter
+              }
+              wellDepth
+            }
+
+            fragment GnirsSpectroscopyDetails on GnirsSpectroscopy {
+              acquisition {
+                explicitAcquisitionType
+                explicitFilter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                skyOffset {
+                  p {
+                    arcseconds
+                  }
+                  q {
+                    arcseconds
+                  }
+                }
+              }
+              camera
+              centralWavelengths {
+                centralWavelength {
+                  nanometers
+                }
+              }
+              decker
+              defaultDecker
+              defaultWellDepth
+              explicitDecker
+              explicitFocusMotorSteps
+              explicitGrating
+              explicitPrism
+              explicitReadMode
+              explicitWellDepth
+              filter
+              grating
+              ifu {
+                fpu
+                initialFpu
+                telescopeConfigs {
+                  guiding
+                  offset {
+                    p {
+                      arcseconds
+                    }
+                    q {
+                      arcseconds
+                    }
+                  }
+                }
+              }
+              initialCamera
+              initialFilter
+              initialGrating
+              initialPrism
+              prism
+              telluricType {
+                starTypes
+                tag
+              }
+              wellDepth
+              slit {
+                fpu
+                initialFpu
+                defaultTelescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+                explicitTelescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+                telescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+              }
+            }
+
+            fragment Igrins2LongSlitDetails on Igrins2LongSlit {
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  time {
+                    seconds
+                  }
+                  count
+                  at {
+                    nanometers
+                  }
+                }
+              }
+              telluricType {
+                tag
+                starTypes
+              }
+            }
+
+            fragment NonsiderealTargetDetails on Nonsidereal {
+              des
+              keyType
+              key
+            }
+
+            fragment ObservationCore on Observation {
+              id
+              existence
+              reference {
+                label
+              }
+              title
+              instrument
+              calibrationRole
+            }
+
+            fragment ObservationDetails on Observation {
+              ...ObservationCore
+              observerNotes
+              subtitle
+              program {
+                ...ProgramCore
+              }
+              scienceRequirements {
+                ...ScienceRequirementsDetails
+              }
+              scienceBand
+              workflow {
+                ...WorkflowDetails
+              }
+              observingMode {
+                ...ObservingModeDetails
+              }
+              constraintSet {
+                ...ConstraintSetDetails
+              }
+              timingWindows {
+                ...TimingWindowDetails
+              }
+              targetEnvironment {
+                ...TargetEnvironmentDetails
+              }
+              execution {
+                digest {
+                  value {
+                    acquisition {
+                      timeEstimate {
+                        total {
+                          seconds
+                        }
+                        program {
+                          seconds
+                        }
+                        nonCharged {
+                          seconds
+                        }
+                      }
+                    }
+                    setup {
+                      full {
+                        seconds
+                      }
+                      reacquisition {
+                        seconds
+                      }
+                    }
+                  }
+                }
+              }
+            }
+
+            fragment ObservingModeDetails on ObservingMode {
+              instrument
+              mode
+              gmosNorthLongSlit {
+                ...GmosNorthLongSlitDetails
+              }
+              gmosSouthLongSlit {
+                ...GmosSouthLongSlitDetails
+              }
+              gmosNorthImaging {
+                ...GmosNorthImagingDetails
+              }
+              gmosSouthImaging {
+                ...GmosSouthImagingDetails
+              }
+              flamingos2LongSlit {
+                ...Flamingos2LongSlitDetails
+              }
+              flamingos2Imaging {
+                ...Flamingos2ImagingDetails
+              }
+              igrins2LongSlit {
+                ...Igrins2LongSlitDetails
+              }
+              visitor {
+                ...VisitorDetails
+              }
+              ghostIfu {
+                ...ghostIfuDetails
+              }
+              gnirsSpectroscopy {
+                ...GnirsSpectroscopyDetails
+              }
+              gnirsImaging {
+                ...GnirsImagingDetails
+              }
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment ScienceRequirementsDetails on ScienceRequirements {
+              mode
+            }
+
+            fragment SiderealTargetDetails on Sidereal {
+              ra {
+                hours
+                hms
+                degrees
+              }
+              dec {
+                degrees
+                dms
+              }
+              epoch
+            }
+
+            fragment TargetEnvironmentDetails on TargetEnvironment {
+              asterism {
+                name
+                sidereal {
+                  ...SiderealTargetDetails
+                }
+                nonsidereal {
+                  ...NonsiderealTargetDetails
+                }
+              }
+              explicitBase {
+                ra {
+                  hms
+                }
+                dec {
+                  dms
+                }
+              }
+            }
+
+            fragment TimingWindowDetails on TimingWindow {
+              inclusion
+              startUtc
+              end {
+                __typename
+                ... on TimingWindowEndAt {
+                  atUtc
+                }
+                ... on TimingWindowEndAfter {
+                  after {
+                    seconds
+                  }
+                  repeat {
+                    period {
+                      seconds
+                    }
+                    times
+                  }
+                }
+              }
+            }
+
+            fragment VisitorDetails on Visitor {
+              mode
+              name
+              centralWavelength {
+                nanometers
+              }
+              totalRequestTime {
+                seconds
+              }
+              agsDiameter {
+                dms
+                hms
+              }
+            }
+
+            fragment WorkflowCore on CalculatedObservationWorkflow {
+              state
+            }
+
+            fragment WorkflowDetails on CalculatedObservationWorkflow {
+              ...WorkflowCore
+              value {
+                state
+                validTransitions
+                validationErrors {
+                  code
+                  messages
+                }
+              }
+            }
+
+            fragment ghostDetectorConfigDetails on GhostDetectorConfig {
+              binning
+              defaultBinning
+              defaultReadMode
+              explicitBinning
+              explicitReadMode
+              readMode
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  at {
+                    nanometers
+                  }
+                  time {
+                    seconds
+                  }
+                  count
+                }
+              }
+            }
+
+            fragment ghostIfuDetails on GhostIfu {
+              defaultIfu1Agitator
+              defaultIfu2Agitator
+              explicitIfu1Agitator
+              explicitIfu2Agitator
+              ifu1Agitator
+              ifu2Agitator
+              resolutionMode
+              stepCount
+              blue {
+                ...ghostDetectorConfigDetails
+              }
+              red {
+                ...ghostDetectorConfigDetails
+              }
+              skyPosition {
+                dec {
+                  degrees
+                }
+                ra {
+                  degrees
+                }
+              }
+              slitViewingCameraExposureTime {
+                seconds
+              }
+            }
+            """)
+        variables: dict[str, object] = {
+            "observationReference": observation_reference,
+            "SET": set_,
+        }
+        response = await self.execute(
+            query=query,
+            operation_name="updateObservationByReference",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return UpdateObservationByReference.model_validate(data)
+
+    async def restore_observation_by_id(
+        self, observation_id: Any, **kwargs: Any
+    ) -> RestoreObservationById:
+        query = gql("""
+            mutation restoreObservationById($observationId: ObservationId!) {
+              updateObservations(
+                input: {SET: {existence: PRESENT}, WHERE: {id: {EQ: $observationId}}, LIMIT: 1, includeDeleted: true}
+              ) {
+                hasMore
+                observations {
+                  ...ObservationDetails
+                }
+              }
+            }
+
+            fragment ConstraintSetDetails on ConstraintSet {
+              imageQuality
+              cloudExtinction
+              skyBackground
+              waterVapor
+              elevationRange {
+                airMass {
+                  min
+                  max
+                }
+                hourAngle {
+                  minHours
+                  maxHours
+                }
+              }
+            }
+
+            fragment Flamingos2ImagingDetails on Flamingos2Imaging {
+              filters {
+                filter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    time {
+                      seconds
+                    }
+                    count
+                  }
+                }
+              }
+              initialFilters {
+                filter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+              }
+              defaultReadMode
+              explicitReadMode
+              defaultReads
+              explicitReads
+              defaultDecker
+              explicitDecker
+              readoutMode
+              defaultReadoutMode
+              explicitReadoutMode
+            }
+
+            fragment Flamingos2LongSlitDetails on Flamingos2LongSlit {
+              decker
+              defaultDecker
+              disperser
+              filter
+              fpu
+              telluricType {
+                tag
+                starTypes
+              }
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  time {
+                    seconds
+                  }
+                  count
+                  at {
+                    nanometers
+                  }
+                }
+              }
+              explicitReadMode
+              explicitReads
+              explicitDecker
+              readoutMode
+              defaultReadoutMode
+              acquisition {
+                exposureTimeMode {
+                  signalToNoise {
+                    value
+                    at {
+                      nanometers
+                    }
+                  }
+                  timeAndCount {
+                    time {
+                      seconds
+                    }
+                    count
+                    at {
+                      nanometers
+                    }
+                  }
+                }
+              }
+              initialDisperser
+              initialFilter
+              initialFpu
+            }
+
+            fragment GmosNorthImagingDetails on GmosNorthImaging {
+              filters {
+                filter
+              }
+              bin
+            }
+
+            fragment GmosNorthLongSlitDetails on GmosNorthLongSlit {
+              grating
+              filter
+              fpu
+              centralWavelength {
+                nanometers
+              }
+              offsets {
+                arcseconds
+              }
+              xBin
+              yBin
+            }
+
+            fragment GmosSouthImagingDetails on GmosSouthImaging {
+              filters {
+                filter
+              }
+              bin
+            }
+
+            fragment GmosSouthLongSlitDetails on GmosSouthLongSlit {
+              grating
+              filter
+              fpu
+              centralWavelength {
+                nanometers
+              }
+              offsets {
+                arcseconds
+              }
+              xBin
+              yBin
+            }
+
+            fragment GnirsImagingDetails on GnirsImaging {
+              camera
+              defaultWellDepth
+              explicitReadMode
+              explicitWellDepth
+              filters {
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                filter
+              }
+              initialFilters {
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                filter
+              }
+              wellDepth
+            }
+
+            fragment GnirsSpectroscopyDetails on GnirsSpectroscopy {
+              acquisition {
+                explicitAcquisitionType
+                explicitFilter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                skyOffset {
+                  p {
+                    arcseconds
+                  }
+                  q {
+                    arcseconds
+                  }
+                }
+              }
+              camera
+              centralWavelengths {
+                centralWavelength {
+                  nanometers
+                }
+              }
+              decker
+              defaultDecker
+              defaultWellDepth
+              explicitDecker
+              explicitFocusMotorSteps
+              explicitGrating
+              explicitPrism
+              explicitReadMode
+              explicitWellDepth
+              filter
+              grating
+              ifu {
+                fpu
+                initialFpu
+                telescopeConfigs {
+                  guiding
+                  offset {
+                    p {
+                      arcseconds
+                    }
+                    q {
+                      arcseconds
+                    }
+                  }
+                }
+              }
+              initialCamera
+              initialFilter
+              initialGrating
+              initialPrism
+              prism
+              telluricType {
+                starTypes
+                tag
+              }
+              wellDepth
+              slit {
+                fpu
+                initialFpu
+                defaultTelescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+                explicitTelescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+                telescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+              }
+            }
+
+            fragment Igrins2LongSlitDetails on Igrins2LongSlit {
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  time {
+                    seconds
+                  }
+                  count
+                  at {
+                    nanometers
+                  }
+                }
+              }
+              telluricType {
+                tag
+                starTypes
+              }
+            }
+
+            fragment NonsiderealTargetDetails on Nonsidereal {
+              des
+              keyType
+              key
+            }
+
+            fragment ObservationCore on Observation {
+              id
+              existence
+              reference {
+                label
+              }
+              title
+              instrument
+              calibrationRole
+            }
+
+            fragment ObservationDetails on Observation {
+              ...ObservationCore
+              observerNotes
+              subtitle
+              program {
+                ...ProgramCore
+              }
+              scienceRequirements {
+                ...ScienceRequirementsDetails
+              }
+              scienceBand
+              workflow {
+                ...WorkflowDetails
+              }
+              observingMode {
+                ...ObservingModeDetails
+              }
+              constraintSet {
+                ...ConstraintSetDetails
+              }
+              timingWindows {
+                ...TimingWindowDetails
+              }
+              targetEnvironment {
+                ...TargetEnvironmentDetails
+              }
+              execution {
+                digest {
+                  value {
+                    acquisition {
+                      timeEstimate {
+                        total {
+                          seconds
+                        }
+                        program {
+                          seconds
+                        }
+                        nonCharged {
+                          seconds
+                        }
+                      }
+                    }
+                    setup {
+                      full {
+                        seconds
+                      }
+                      reacquisition {
+                        seconds
+                      }
+                    }
+                  }
+                }
+              }
+            }
+
+            fragment ObservingModeDetails on ObservingMode {
+              instrument
+              mode
+              gmosNorthLongSlit {
+                ...GmosNorthLongSlitDetails
+              }
+              gmosSouthLongSlit {
+                ...GmosSouthLongSlitDetails
+              }
+              gmosNorthImaging {
+                ...GmosNorthImagingDetails
+              }
+              gmosSouthImaging {
+                ...GmosSouthImagingDetails
+              }
+              flamingos2LongSlit {
+                ...Flamingos2LongSlitDetails
+              }
+              flamingos2Imaging {
+                ...Flamingos2ImagingDetails
+              }
+              igrins2LongSlit {
+                ...Igrins2LongSlitDetails
+              }
+              visitor {
+                ...VisitorDetails
+              }
+              ghostIfu {
+                ...ghostIfuDetails
+              }
+              gnirsSpectroscopy {
+                ...GnirsSpectroscopyDetails
+              }
+              gnirsImaging {
+                ...GnirsImagingDetails
+              }
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment ScienceRequirementsDetails on ScienceRequirements {
+              mode
+            }
+
+            fragment SiderealTargetDetails on Sidereal {
+              ra {
+                hours
+                hms
+                degrees
+              }
+              dec {
+                degrees
+                dms
+              }
+              epoch
+            }
+
+            fragment TargetEnvironmentDetails on TargetEnvironment {
+              asterism {
+                name
+                sidereal {
+                  ...SiderealTargetDetails
+                }
+                nonsidereal {
+                  ...NonsiderealTargetDetails
+                }
+              }
+              explicitBase {
+                ra {
+                  hms
+                }
+                dec {
+                  dms
+                }
+              }
+            }
+
+            fragment TimingWindowDetails on TimingWindow {
+              inclusion
+              startUtc
+              end {
+                __typename
+                ... on TimingWindowEndAt {
+                  atUtc
+                }
+                ... on TimingWindowEndAfter {
+                  after {
+                    seconds
+                  }
+                  repeat {
+                    period {
+                      seconds
+                    }
+                    times
+                  }
+                }
+              }
+            }
+
+            fragment VisitorDetails on Visitor {
+              mode
+              name
+              centralWavelength {
+                nanometers
+              }
+              totalRequestTime {
+                seconds
+              }
+              agsDiameter {
+                dms
+                hms
+              }
+            }
+
+            fragment WorkflowCore on CalculatedObservationWorkflow {
+              state
+            }
+
+            fragment WorkflowDetails on CalculatedObservationWorkflow {
+              ...WorkflowCore
+              value {
+                state
+                validTransitions
+                validationErrors {
+                  code
+                  messages
+                }
+              }
+            }
+
+            fragment ghostDetectorConfigDetails on GhostDetectorConfig {
+              binning
+              defaultBinning
+              defaultReadMode
+              explicitBinning
+              explicitReadMode
+              readMode
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  at {
+                    nanometers
+                  }
+                  time {
+                    seconds
+                  }
+                  count
+                }
+              }
+            }
+
+            fragment ghostIfuDetails on GhostIfu {
+              defaultIfu1Agitator
+              defaultIfu2Agitator
+              explicitIfu1Agitator
+              explicitIfu2Agitator
+              ifu1Agitator
+              ifu2Agitator
+              resolutionMode
+              stepCount
+              blue {
+                ...ghostDetectorConfigDetails
+              }
+              red {
+                ...ghostDetectorConfigDetails
+              }
+              skyPosition {
+                dec {
+                  degrees
+                }
+                ra {
+                  degrees
+                }
+              }
+              slitViewingCameraExposureTime {
+                seconds
+              }
+            }
+            """)
+        variables: dict[str, object] = {"observationId": observation_id}
+        response = await self.execute(
+            query=query,
+            operation_name="restoreObservationById",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return RestoreObservationById.model_validate(data)
+
+    async def restore_observation_by_reference(
+        self, observation_reference: Any, **kwargs: Any
+    ) -> RestoreObservationByReference:
+        query = gql("""
+            mutation restoreObservationByReference($observationReference: NonEmptyString!) {
+              updateObservations(
+                input: {SET: {existence: PRESENT}, WHERE: {reference: {label: {EQ: $observationReference}}}, LIMIT: 1, includeDeleted: true}
+              ) {
+                hasMore
+                observations {
+                  ...ObservationDetails
+                }
+              }
+            }
+
+            fragment ConstraintSetDetails on ConstraintSet {
+              imageQuality
+              cloudExtinction
+              skyBackground
+              waterVapor
+              elevationRange {
+                airMass {
+                  min
+                  max
+                }
+                hourAngle {
+                  minHours
+                  maxHours
+                }
+              }
+            }
+
+            fragment Flamingos2ImagingDetails on Flamingos2Imaging {
+              filters {
+                filter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    time {
+                      seconds
+                    }
+                    count
+                  }
+                }
+              }
+              initialFilters {
+                filter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+              }
+              defaultReadMode
+              explicitReadMode
+              defaultReads
+              explicitReads
+              defaultDecker
+              explicitDecker
+              readoutMode
+              defaultReadoutMode
+              explicitReadoutMode
+            }
+
+            fragment Flamingos2LongSlitDetails on Flamingos2LongSlit {
+              decker
+              defaultDecker
+              disperser
+              filter
+              fpu
+              telluricType {
+                tag
+                starTypes
+              }
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  time {
+                    seconds
+                  }
+                  count
+                  at {
+                    nanometers
+                  }
+                }
+              }
+              explicitReadMode
+              explicitReads
+              explicitDecker
+              readoutMode
+              defaultReadoutMode
+              acquisition {
+                exposureTimeMode {
+                  signalToNoise {
+                    value
+                    at {
+                      nanometers
+                    }
+                  }
+                  timeAndCount {
+                    time {
+                      seconds
+                    }
+                    count
+                    at {
+                      nanometers
+                    }
+                  }
+                }
+              }
+              initialDisperser
+              initialFilter
+              initialFpu
+            }
+
+            fragment GmosNorthImagingDetails on GmosNorthImaging {
+              filters {
+                filter
+              }
+              bin
+            }
+
+            fragment GmosNorthLongSlitDetails on GmosNorthLongSlit {
+              grating
+              filter
+              fpu
+              centralWavelength {
+                nanometers
+              }
+              offsets {
+                arcseconds
+              }
+              xBin
+              yBin
+            }
+
+            fragment GmosSouthImagingDetails on GmosSouthImaging {
+              filters {
+                filter
+              }
+              bin
+            }
+
+            fragment GmosSouthLongSlitDetails on GmosSouthLongSlit {
+              grating
+              filter
+              fpu
+              centralWavelength {
+                nanometers
+              }
+              offsets {
+                arcseconds
+              }
+              xBin
+              yBin
+            }
+
+            fragment GnirsImagingDetails on GnirsImaging {
+              camera
+              defaultWellDepth
+              explicitReadMode
+              explicitWellDepth
+              filters {
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                filter
+              }
+              initialFilters {
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                filter
+              }
+              wellDepth
+            }
+
+            fragment GnirsSpectroscopyDetails on GnirsSpectroscopy {
+              acquisition {
+                explicitAcquisitionType
+                explicitFilter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                skyOffset {
+                  p {
+                    arcseconds
+                  }
+                  q {
+                    arcseconds
+                  }
+                }
+              }
+              camera
+              centralWavelengths {
+                centralWavelength {
+                  nanometers
+                }
+              }
+              decker
+              defaultDecker
+              defaultWellDepth
+              explicitDecker
+              explicitFocusMotorSteps
+              explicitGrating
+              explicitPrism
+              explicitReadMode
+              explicitWellDepth
+              filter
+              grating
+              ifu {
+                fpu
+                initialFpu
+                telescopeConfigs {
+                  guiding
+                  offset {
+                    p {
+                      arcseconds
+                    }
+                    q {
+                      arcseconds
+                    }
+                  }
+                }
+              }
+              initialCamera
+              initialFilter
+              initialGrating
+              initialPrism
+              prism
+              telluricType {
+                starTypes
+                tag
+              }
+              wellDepth
+              slit {
+                fpu
+                initialFpu
+                defaultTelescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+                explicitTelescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+                telescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+              }
+            }
+
+            fragment Igrins2LongSlitDetails on Igrins2LongSlit {
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  time {
+                    seconds
+                  }
+                  count
+                  at {
+                    nanometers
+                  }
+                }
+              }
+              telluricType {
+                tag
+                starTypes
+              }
+            }
+
+            fragment NonsiderealTargetDetails on Nonsidereal {
+              des
+              keyType
+              key
+            }
+
+            fragment ObservationCore on Observation {
+              id
+              existence
+              reference {
+                label
+              }
+              title
+              instrument
+              calibrationRole
+            }
+
+            fragment ObservationDetails on Observation {
+              ...ObservationCore
+              observerNotes
+              subtitle
+              program {
+                ...ProgramCore
+              }
+              scienceRequirements {
+                ...ScienceRequirementsDetails
+              }
+              scienceBand
+              workflow {
+                ...WorkflowDetails
+              }
+              observingMode {
+                ...ObservingModeDetails
+              }
+              constraintSet {
+                ...ConstraintSetDetails
+              }
+              timingWindows {
+                ...TimingWindowDetails
+              }
+              targetEnvironment {
+                ...TargetEnvironmentDetails
+              }
+              execution {
+                digest {
+                  value {
+                    acquisition {
+                      timeEstimate {
+                        total {
+                          seconds
+                        }
+                        program {
+                          seconds
+                        }
+                        nonCharged {
+                          seconds
+                        }
+                      }
+                    }
+                    setup {
+                      full {
+                        seconds
+                      }
+                      reacquisition {
+                        seconds
+                      }
+                    }
+                  }
+                }
+              }
+            }
+
+            fragment ObservingModeDetails on ObservingMode {
+              instrument
+              mode
+              gmosNorthLongSlit {
+                ...GmosNorthLongSlitDetails
+              }
+              gmosSouthLongSlit {
+                ...GmosSouthLongSlitDetails
+              }
+              gmosNorthImaging {
+                ...GmosNorthImagingDetails
+              }
+              gmosSouthImaging {
+                ...GmosSouthImagingDetails
+              }
+              flamingos2LongSlit {
+                ...Flamingos2LongSlitDetails
+              }
+              flamingos2Imaging {
+                ...Flamingos2ImagingDetails
+              }
+              igrins2LongSlit {
+                ...Igrins2LongSlitDetails
+              }
+              visitor {
+                ...VisitorDetails
+              }
+              ghostIfu {
+                ...ghostIfuDetails
+              }
+              gnirsSpectroscopy {
+                ...GnirsSpectroscopyDetails
+              }
+              gnirsImaging {
+                ...GnirsImagingDetails
+              }
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment ScienceRequirementsDetails on ScienceRequirements {
+              mode
+            }
+
+            fragment SiderealTargetDetails on Sidereal {
+              ra {
+                hours
+                hms
+                degrees
+              }
+              dec {
+                degrees
+                dms
+              }
+              epoch
+            }
+
+            fragment TargetEnvironmentDetails on TargetEnvironment {
+              asterism {
+                name
+                sidereal {
+                  ...SiderealTargetDetails
+                }
+                nonsidereal {
+                  ...NonsiderealTargetDetails
+                }
+              }
+              explicitBase {
+                ra {
+                  hms
+                }
+                dec {
+                  dms
+                }
+              }
+            }
+
+            fragment TimingWindowDetails on TimingWindow {
+              inclusion
+              startUtc
+              end {
+                __typename
+                ... on TimingWindowEndAt {
+                  atUtc
+                }
+                ... on TimingWindowEndAfter {
+                  after {
+                    seconds
+                  }
+                  repeat {
+                    period {
+                      seconds
+                    }
+                    times
+                  }
+                }
+              }
+            }
+
+            fragment VisitorDetails on Visitor {
+              mode
+              name
+              centralWavelength {
+                nanometers
+              }
+              totalRequestTime {
+                seconds
+              }
+              agsDiameter {
+                dms
+                hms
+              }
+            }
+
+            fragment WorkflowCore on CalculatedObservationWorkflow {
+              state
+            }
+
+            fragment WorkflowDetails on CalculatedObservationWorkflow {
+              ...WorkflowCore
+              value {
+                state
+                validTransitions
+                validationErrors {
+                  code
+                  messages
+                }
+              }
+            }
+
+            fragment ghostDetectorConfigDetails on GhostDetectorConfig {
+              binning
+              defaultBinning
+              defaultReadMode
+              explicitBinning
+              explicitReadMode
+              readMode
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  at {
+                    nanometers
+                  }
+                  time {
+                    seconds
+                  }
+                  count
+                }
+              }
+            }
+
+            fragment ghostIfuDetails on GhostIfu {
+              defaultIfu1Agitator
+              defaultIfu2Agitator
+              explicitIfu1Agitator
+              explicitIfu2Agitator
+              ifu1Agitator
+              ifu2Agitator
+              resolutionMode
+              stepCount
+              blue {
+                ...ghostDetectorConfigDetails
+              }
+              red {
+                ...ghostDetectorConfigDetails
+              }
+              skyPosition {
+                dec {
+                  degrees
+                }
+                ra {
+                  degrees
+                }
+              }
+              slitViewingCameraExposureTime {
+                seconds
+              }
+            }
+            """)
+        variables: dict[str, object] = {"observationReference": observation_reference}
+        response = await self.execute(
+            query=query,
+            operation_name="restoreObservationByReference",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return RestoreObservationByReference.model_validate(data)
+
+    async def delete_observation_by_id(
+        self, observation_id: Any, **kwargs: Any
+    ) -> DeleteObservationById:
+        query = gql("""
+            mutation deleteObservationById($observationId: ObservationId!) {
+              updateObservations(
+                input: {SET: {existence: DELETED}, WHERE: {id: {EQ: $observationId}}, LIMIT: 1}
+              ) {
+                hasMore
+                observations {
+                  ...ObservationDetails
+                }
+              }
+            }
+
+            fragment ConstraintSetDetails on ConstraintSet {
+              imageQuality
+              cloudExtinction
+              skyBackground
+              waterVapor
+              elevationRange {
+                airMass {
+                  min
+                  max
+                }
+                hourAngle {
+                  minHours
+                  maxHours
+                }
+              }
+            }
+
+            fragment Flamingos2ImagingDetails on Flamingos2Imaging {
+              filters {
+                filter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    time {
+                      seconds
+                    }
+                    count
+                  }
+                }
+              }
+              initialFilters {
+                filter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+              }
+              defaultReadMode
+              explicitReadMode
+              defaultReads
+              explicitReads
+              defaultDecker
+              explicitDecker
+              readoutMode
+              defaultReadoutMode
+              explicitReadoutMode
+            }
+
+            fragment Flamingos2LongSlitDetails on Flamingos2LongSlit {
+              decker
+              defaultDecker
+              disperser
+              filter
+              fpu
+              telluricType {
+                tag
+                starTypes
+              }
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  time {
+                    seconds
+                  }
+                  count
+                  at {
+                    nanometers
+                  }
+                }
+              }
+              explicitReadMode
+              explicitReads
+              explicitDecker
+              readoutMode
+              defaultReadoutMode
+              acquisition {
+                exposureTimeMode {
+                  signalToNoise {
+                    value
+                    at {
+                      nanometers
+                    }
+                  }
+                  timeAndCount {
+                    time {
+                      seconds
+                    }
+                    count
+                    at {
+                      nanometers
+                    }
+                  }
+                }
+              }
+              initialDisperser
+              initialFilter
+              initialFpu
+            }
+
+            fragment GmosNorthImagingDetails on GmosNorthImaging {
+              filters {
+                filter
+              }
+              bin
+            }
+
+            fragment GmosNorthLongSlitDetails on GmosNorthLongSlit {
+              grating
+              filter
+              fpu
+              centralWavelength {
+                nanometers
+              }
+              offsets {
+                arcseconds
+              }
+              xBin
+              yBin
+            }
+
+            fragment GmosSouthImagingDetails on GmosSouthImaging {
+              filters {
+                filter
+              }
+              bin
+            }
+
+            fragment GmosSouthLongSlitDetails on GmosSouthLongSlit {
+              grating
+              filter
+              fpu
+              centralWavelength {
+                nanometers
+              }
+              offsets {
+                arcseconds
+              }
+              xBin
+              yBin
+            }
+
+            fragment GnirsImagingDetails on GnirsImaging {
+              camera
+              defaultWellDepth
+              explicitReadMode
+              explicitWellDepth
+              filters {
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                filter
+              }
+              initialFilters {
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                filter
+              }
+              wellDepth
+            }
+
+            fragment GnirsSpectroscopyDetails on GnirsSpectroscopy {
+              acquisition {
+                explicitAcquisitionType
+                explicitFilter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                skyOffset {
+                  p {
+                    arcseconds
+                  }
+                  q {
+                    arcseconds
+                  }
+                }
+              }
+              camera
+              centralWavelengths {
+                centralWavelength {
+                  nanometers
+                }
+              }
+              decker
+              defaultDecker
+              defaultWellDepth
+              explicitDecker
+              explicitFocusMotorSteps
+              explicitGrating
+              explicitPrism
+              explicitReadMode
+              explicitWellDepth
+              filter
+              grating
+              ifu {
+                fpu
+                initialFpu
+                telescopeConfigs {
+                  guiding
+                  offset {
+                    p {
+                      arcseconds
+                    }
+                    q {
+                      arcseconds
+                    }
+                  }
+                }
+              }
+              initialCamera
+              initialFilter
+              initialGrating
+              initialPrism
+              prism
+              telluricType {
+                starTypes
+                tag
+              }
+              wellDepth
+              slit {
+                fpu
+                initialFpu
+                defaultTelescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+                explicitTelescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+                telescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+              }
+            }
+
+            fragment Igrins2LongSlitDetails on Igrins2LongSlit {
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  time {
+                    seconds
+                  }
+                  count
+                  at {
+                    nanometers
+                  }
+                }
+              }
+              telluricType {
+                tag
+                starTypes
+              }
+            }
+
+            fragment NonsiderealTargetDetails on Nonsidereal {
+              des
+              keyType
+              key
+            }
+
+            fragment ObservationCore on Observation {
+              id
+              existence
+              reference {
+                label
+              }
+              title
+              instrument
+              calibrationRole
+            }
+
+            fragment ObservationDetails on Observation {
+              ...ObservationCore
+              observerNotes
+              subtitle
+              program {
+                ...ProgramCore
+              }
+              scienceRequirements {
+                ...ScienceRequirementsDetails
+              }
+              scienceBand
+              workflow {
+                ...WorkflowDetails
+              }
+              observingMode {
+                ...ObservingModeDetails
+              }
+              constraintSet {
+                ...ConstraintSetDetails
+              }
+              timingWindows {
+                ...TimingWindowDetails
+              }
+              targetEnvironment {
+                ...TargetEnvironmentDetails
+              }
+              execution {
+                digest {
+                  value {
+                    acquisition {
+                      timeEstimate {
+                        total {
+                          seconds
+                        }
+                        program {
+                          seconds
+                        }
+                        nonCharged {
+                          seconds
+                        }
+                      }
+                    }
+                    setup {
+                      full {
+                        seconds
+                      }
+                      reacquisition {
+                        seconds
+                      }
+                    }
+                  }
+                }
+              }
+            }
+
+            fragment ObservingModeDetails on ObservingMode {
+              instrument
+              mode
+              gmosNorthLongSlit {
+                ...GmosNorthLongSlitDetails
+              }
+              gmosSouthLongSlit {
+                ...GmosSouthLongSlitDetails
+              }
+              gmosNorthImaging {
+                ...GmosNorthImagingDetails
+              }
+              gmosSouthImaging {
+                ...GmosSouthImagingDetails
+              }
+              flamingos2LongSlit {
+                ...Flamingos2LongSlitDetails
+              }
+              flamingos2Imaging {
+                ...Flamingos2ImagingDetails
+              }
+              igrins2LongSlit {
+                ...Igrins2LongSlitDetails
+              }
+              visitor {
+                ...VisitorDetails
+              }
+              ghostIfu {
+                ...ghostIfuDetails
+              }
+              gnirsSpectroscopy {
+                ...GnirsSpectroscopyDetails
+              }
+              gnirsImaging {
+                ...GnirsImagingDetails
+              }
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment ScienceRequirementsDetails on ScienceRequirements {
+              mode
+            }
+
+            fragment SiderealTargetDetails on Sidereal {
+              ra {
+                hours
+                hms
+                degrees
+              }
+              dec {
+                degrees
+                dms
+              }
+              epoch
+            }
+
+            fragment TargetEnvironmentDetails on TargetEnvironment {
+              asterism {
+                name
+                sidereal {
+                  ...SiderealTargetDetails
+                }
+                nonsidereal {
+                  ...NonsiderealTargetDetails
+                }
+              }
+              explicitBase {
+                ra {
+                  hms
+                }
+                dec {
+                  dms
+                }
+              }
+            }
+
+            fragment TimingWindowDetails on TimingWindow {
+              inclusion
+              startUtc
+              end {
+                __typename
+                ... on TimingWindowEndAt {
+                  atUtc
+                }
+                ... on TimingWindowEndAfter {
+                  after {
+                    seconds
+                  }
+                  repeat {
+                    period {
+                      seconds
+                    }
+                    times
+                  }
+                }
+              }
+            }
+
+            fragment VisitorDetails on Visitor {
+              mode
+              name
+              centralWavelength {
+                nanometers
+              }
+              totalRequestTime {
+                seconds
+              }
+              agsDiameter {
+                dms
+                hms
+              }
+            }
+
+            fragment WorkflowCore on CalculatedObservationWorkflow {
+              state
+            }
+
+            fragment WorkflowDetails on CalculatedObservationWorkflow {
+              ...WorkflowCore
+              value {
+                state
+                validTransitions
+                validationErrors {
+                  code
+                  messages
+                }
+              }
+            }
+
+            fragment ghostDetectorConfigDetails on GhostDetectorConfig {
+              binning
+              defaultBinning
+              defaultReadMode
+              explicitBinning
+              explicitReadMode
+              readMode
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  at {
+                    nanometers
+                  }
+                  time {
+                    seconds
+                  }
+                  count
+                }
+              }
+            }
+
+            fragment ghostIfuDetails on GhostIfu {
+              defaultIfu1Agitator
+              defaultIfu2Agitator
+              explicitIfu1Agitator
+              explicitIfu2Agitator
+              ifu1Agitator
+              ifu2Agitator
+              resolutionMode
+              stepCount
+              blue {
+                ...ghostDetectorConfigDetails
+              }
+              red {
+                ...ghostDetectorConfigDetails
+              }
+              skyPosition {
+                dec {
+                  degrees
+                }
+                ra {
+                  degrees
+                }
+              }
+              slitViewingCameraExposureTime {
+                seconds
+              }
+            }
+            """)
+        variables: dict[str, object] = {"observationId": observation_id}
+        response = await self.execute(
+            query=query,
+            operation_name="deleteObservationById",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return DeleteObservationById.model_validate(data)
+
+    async def delete_observation_by_reference(
+        self, observation_reference: Any, **kwargs: Any
+    ) -> DeleteObservationByReference:
+        query = gql("""
+            mutation deleteObservationByReference($observationReference: NonEmptyString!) {
+              updateObservations(
+                input: {SET: {existence: DELETED}, WHERE: {reference: {label: {EQ: $observationReference}}}, LIMIT: 1}
+              ) {
+                hasMore
+                observations {
+                  ...ObservationDetails
+                }
+              }
+            }
+
+            fragment ConstraintSetDetails on ConstraintSet {
+              imageQuality
+              cloudExtinction
+              skyBackground
+              waterVapor
+              elevationRange {
+                airMass {
+                  min
+                  max
+                }
+                hourAngle {
+                  minHours
+                  maxHours
+                }
+              }
+            }
+
+            fragment Flamingos2ImagingDetails on Flamingos2Imaging {
+              filters {
+                filter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    time {
+                      seconds
+                    }
+                    count
+                  }
+                }
+              }
+              initialFilters {
+                filter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+              }
+              defaultReadMode
+              explicitReadMode
+              defaultReads
+              explicitReads
+              defaultDecker
+              explicitDecker
+              readoutMode
+              defaultReadoutMode
+              explicitReadoutMode
+            }
+
+            fragment Flamingos2LongSlitDetails on Flamingos2LongSlit {
+              decker
+              defaultDecker
+              disperser
+              filter
+              fpu
+              telluricType {
+                tag
+                starTypes
+              }
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  time {
+                    seconds
+                  }
+                  count
+                  at {
+                    nanometers
+                  }
+                }
+              }
+              explicitReadMode
+              explicitReads
+              explicitDecker
+              readoutMode
+              defaultReadoutMode
+              acquisition {
+                exposureTimeMode {
+                  signalToNoise {
+                    value
+                    at {
+                      nanometers
+                    }
+                  }
+                  timeAndCount {
+                    time {
+                      seconds
+                    }
+                    count
+                    at {
+                      nanometers
+                    }
+                  }
+                }
+              }
+              initialDisperser
+              initialFilter
+              initialFpu
+            }
+
+            fragment GmosNorthImagingDetails on GmosNorthImaging {
+              filters {
+                filter
+              }
+              bin
+            }
+
+            fragment GmosNorthLongSlitDetails on GmosNorthLongSlit {
+              grating
+              filter
+              fpu
+              centralWavelength {
+                nanometers
+              }
+              offsets {
+                arcseconds
+              }
+              xBin
+              yBin
+            }
+
+            fragment GmosSouthImagingDetails on GmosSouthImaging {
+              filters {
+                filter
+              }
+              bin
+            }
+
+            fragment GmosSouthLongSlitDetails on GmosSouthLongSlit {
+              grating
+              filter
+              fpu
+              centralWavelength {
+                nanometers
+              }
+              offsets {
+                arcseconds
+              }
+              xBin
+              yBin
+            }
+
+            fragment GnirsImagingDetails on GnirsImaging {
+              camera
+              defaultWellDepth
+              explicitReadMode
+              explicitWellDepth
+              filters {
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                filter
+              }
+              initialFilters {
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                filter
+              }
+              wellDepth
+            }
+
+            fragment GnirsSpectroscopyDetails on GnirsSpectroscopy {
+              acquisition {
+                explicitAcquisitionType
+                explicitFilter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                skyOffset {
+                  p {
+                    arcseconds
+                  }
+                  q {
+                    arcseconds
+                  }
+                }
+              }
+              camera
+              centralWavelengths {
+                centralWavelength {
+                  nanometers
+                }
+              }
+              decker
+              defaultDecker
+              defaultWellDepth
+              explicitDecker
+              explicitFocusMotorSteps
+              explicitGrating
+              explicitPrism
+              explicitReadMode
+              explicitWellDepth
+              filter
+              grating
+              ifu {
+                fpu
+                initialFpu
+                telescopeConfigs {
+                  guiding
+                  offset {
+                    p {
+                      arcseconds
+                    }
+                    q {
+                      arcseconds
+                    }
+                  }
+                }
+              }
+              initialCamera
+              initialFilter
+              initialGrating
+              initialPrism
+              prism
+              telluricType {
+                starTypes
+                tag
+              }
+              wellDepth
+              slit {
+                fpu
+                initialFpu
+                defaultTelescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+                explicitTelescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+                telescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+              }
+            }
+
+            fragment Igrins2LongSlitDetails on Igrins2LongSlit {
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  time {
+                    seconds
+                  }
+                  count
+                  at {
+                    nanometers
+                  }
+                }
+              }
+              telluricType {
+                tag
+                starTypes
+              }
+            }
+
+            fragment NonsiderealTargetDetails on Nonsidereal {
+              des
+              keyType
+              key
+            }
+
+            fragment ObservationCore on Observation {
+              id
+              existence
+              reference {
+                label
+              }
+              title
+              instrument
+              calibrationRole
+            }
+
+            fragment ObservationDetails on Observation {
+              ...ObservationCore
+              observerNotes
+              subtitle
+              program {
+                ...ProgramCore
+              }
+              scienceRequirements {
+                ...ScienceRequirementsDetails
+              }
+              scienceBand
+              workflow {
+                ...WorkflowDetails
+              }
+              observingMode {
+                ...ObservingModeDetails
+              }
+              constraintSet {
+                ...ConstraintSetDetails
+              }
+              timingWindows {
+                ...TimingWindowDetails
+              }
+              targetEnvironment {
+                ...TargetEnvironmentDetails
+              }
+              execution {
+                digest {
+                  value {
+                    acquisition {
+                      timeEstimate {
+                        total {
+                          seconds
+                        }
+                        program {
+                          seconds
+                        }
+                        nonCharged {
+                          seconds
+                        }
+                      }
+                    }
+                    setup {
+                      full {
+                        seconds
+                      }
+                      reacquisition {
+                        seconds
+                      }
+                    }
+                  }
+                }
+              }
+            }
+
+            fragment ObservingModeDetails on ObservingMode {
+              instrument
+              mode
+              gmosNorthLongSlit {
+                ...GmosNorthLongSlitDetails
+              }
+              gmosSouthLongSlit {
+                ...GmosSouthLongSlitDetails
+              }
+              gmosNorthImaging {
+                ...GmosNorthImagingDetails
+              }
+              gmosSouthImaging {
+                ...GmosSouthImagingDetails
+              }
+              flamingos2LongSlit {
+                ...Flamingos2LongSlitDetails
+              }
+              flamingos2Imaging {
+                ...Flamingos2ImagingDetails
+              }
+              igrins2LongSlit {
+                ...Igrins2LongSlitDetails
+              }
+              visitor {
+                ...VisitorDetails
+              }
+              ghostIfu {
+                ...ghostIfuDetails
+              }
+              gnirsSpectroscopy {
+                ...GnirsSpectroscopyDetails
+              }
+              gnirsImaging {
+                ...GnirsImagingDetails
+              }
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment ScienceRequirementsDetails on ScienceRequirements {
+              mode
+            }
+
+            fragment SiderealTargetDetails on Sidereal {
+              ra {
+                hours
+                hms
+                degrees
+              }
+              dec {
+                degrees
+                dms
+              }
+              epoch
+            }
+
+            fragment TargetEnvironmentDetails on TargetEnvironment {
+              asterism {
+                name
+                sidereal {
+                  ...SiderealTargetDetails
+                }
+                nonsidereal {
+                  ...NonsiderealTargetDetails
+                }
+              }
+              explicitBase {
+                ra {
+                  hms
+                }
+                dec {
+                  dms
+                }
+              }
+            }
+
+            fragment TimingWindowDetails on TimingWindow {
+              inclusion
+              startUtc
+              end {
+                __typename
+                ... on TimingWindowEndAt {
+                  atUtc
+                }
+                ... on TimingWindowEndAfter {
+                  after {
+                    seconds
+                  }
+                  repeat {
+                    period {
+                      seconds
+                    }
+                    times
+                  }
+                }
+              }
+            }
+
+            fragment VisitorDetails on Visitor {
+              mode
+              name
+              centralWavelength {
+                nanometers
+              }
+              totalRequestTime {
+                seconds
+              }
+              agsDiameter {
+                dms
+                hms
+              }
+            }
+
+            fragment WorkflowCore on CalculatedObservationWorkflow {
+              state
+            }
+
+            fragment WorkflowDetails on CalculatedObservationWorkflow {
+              ...WorkflowCore
+              value {
+                state
+                validTransitions
+                validationErrors {
+                  code
+                  messages
+                }
+              }
+            }
+
+            fragment ghostDetectorConfigDetails on GhostDetectorConfig {
+              binning
+              defaultBinning
+              defaultReadMode
+              explicitBinning
+              explicitReadMode
+              readMode
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  at {
+                    nanometers
+                  }
+                  time {
+                    seconds
+                  }
+                  count
+                }
+              }
+            }
+
+            fragment ghostIfuDetails on GhostIfu {
+              defaultIfu1Agitator
+              defaultIfu2Agitator
+              explicitIfu1Agitator
+              explicitIfu2Agitator
+              ifu1Agitator
+              ifu2Agitator
+              resolutionMode
+              stepCount
+              blue {
+                ...ghostDetectorConfigDetails
+              }
+              red {
+                ...ghostDetectorConfigDetails
+              }
+              skyPosition {
+                dec {
+                  degrees
+                }
+                ra {
+                  degrees
+                }
+              }
+              slitViewingCameraExposureTime {
+                seconds
+              }
+            }
+            """)
+        variables: dict[str, object] = {"observationReference": observation_reference}
+        response = await self.execute(
+            query=query,
+            operation_name="deleteObservationByReference",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return DeleteObservationByReference.model_validate(data)
+
+    async def get_observation(
+        self,
+        observation_id: Union[Optional[Any], UnsetType] = UNSET,
+        observation_reference: Union[Optional[Any], UnsetType] = UNSET,
+        **kwargs: Any,
+    ) -> GetObservation:
+        query = gql("""
+            query getObservation($observationId: ObservationId, $observationReference: ObservationReferenceLabel) {
+              observation(
+                observationId: $observationId
+                observationReference: $observationReference
+              ) {
+                ...ObservationDetails
+              }
+            }
+
+            fragment ConstraintSetDetails on ConstraintSet {
+              imageQuality
+              cloudExtinction
+              skyBackground
+              waterVapor
+              elevationRange {
+                airMass {
+                  min
+                  max
+                }
+                hourAngle {
+                  minHours
+                  maxHours
+                }
+              }
+            }
+
+            fragment Flamingos2ImagingDetails on Flamingos2Imaging {
+              filters {
+                filter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    time {
+                      seconds
+                    }
+                    count
+                  }
+                }
+              }
+              initialFilters {
+                filter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+              }
+              defaultReadMode
+              explicitReadMode
+              defaultReads
+              explicitReads
+              defaultDecker
+              explicitDecker
+              readoutMode
+              defaultReadoutMode
+              explicitReadoutMode
+            }
+
+            fragment Flamingos2LongSlitDetails on Flamingos2LongSlit {
+              decker
+              defaultDecker
+              disperser
+              filter
+              fpu
+              telluricType {
+                tag
+                starTypes
+              }
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  time {
+                    seconds
+                  }
+                  count
+                  at {
+                    nanometers
+                  }
+                }
+              }
+              explicitReadMode
+              explicitReads
+              explicitDecker
+              readoutMode
+              defaultReadoutMode
+              acquisition {
+                exposureTimeMode {
+                  signalToNoise {
+                    value
+                    at {
+                      nanometers
+                    }
+                  }
+                  timeAndCount {
+                    time {
+                      seconds
+                    }
+                    count
+                    at {
+                      nanometers
+                    }
+                  }
+                }
+              }
+              initialDisperser
+              initialFilter
+              initialFpu
+            }
+
+            fragment GmosNorthImagingDetails on GmosNorthImaging {
+              filters {
+                filter
+              }
+              bin
+            }
+
+            fragment GmosNorthLongSlitDetails on GmosNorthLongSlit {
+              grating
+              filter
+              fpu
+              centralWavelength {
+                nanometers
+              }
+              offsets {
+                arcseconds
+              }
+              xBin
+              yBin
+            }
+
+            fragment GmosSouthImagingDetails on GmosSouthImaging {
+              filters {
+                filter
+              }
+              bin
+            }
+
+            fragment GmosSouthLongSlitDetails on GmosSouthLongSlit {
+              grating
+              filter
+              fpu
+              centralWavelength {
+                nanometers
+              }
+              offsets {
+                arcseconds
+              }
+              xBin
+              yBin
+            }
+
+            fragment GnirsImagingDetails on GnirsImaging {
+              camera
+              defaultWellDepth
+              explicitReadMode
+              explicitWellDepth
+              filters {
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                filter
+              }
+              initialFilters {
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                filter
+              }
+              wellDepth
+            }
+
+            fragment GnirsSpectroscopyDetails on GnirsSpectroscopy {
+              acquisition {
+                explicitAcquisitionType
+                explicitFilter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                skyOffset {
+                  p {
+                    arcseconds
+                  }
+                  q {
+                    arcseconds
+                  }
+                }
+              }
+              camera
+              centralWavelengths {
+                centralWavelength {
+                  nanometers
+                }
+              }
+              decker
+              defaultDecker
+              defaultWellDepth
+              explicitDecker
+              explicitFocusMotorSteps
+              explicitGrating
+              explicitPrism
+              explicitReadMode
+              explicitWellDepth
+              filter
+              grating
+              ifu {
+                fpu
+                initialFpu
+                telescopeConfigs {
+                  guiding
+                  offset {
+                    p {
+                      arcseconds
+                    }
+                    q {
+                      arcseconds
+                    }
+                  }
+                }
+              }
+              initialCamera
+              initialFilter
+              initialGrating
+              initialPrism
+              prism
+              telluricType {
+                starTypes
+                tag
+              }
+              wellDepth
+              slit {
+                fpu
+                initialFpu
+                defaultTelescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+                explicitTelescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+                telescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+              }
+            }
+
+            fragment Igrins2LongSlitDetails on Igrins2LongSlit {
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  time {
+                    seconds
+                  }
+                  count
+                  at {
+                    nanometers
+                  }
+                }
+              }
+              telluricType {
+                tag
+                starTypes
+              }
+            }
+
+            fragment NonsiderealTargetDetails on Nonsidereal {
+              des
+              keyType
+              key
+            }
+
+            fragment ObservationCore on Observation {
+              id
+              existence
+              reference {
+                label
+              }
+              title
+              instrument
+              calibrationRole
+            }
+
+            fragment ObservationDetails on Observation {
+              ...ObservationCore
+              observerNotes
+              subtitle
+              program {
+                ...ProgramCore
+              }
+              scienceRequirements {
+                ...ScienceRequirementsDetails
+              }
+              scienceBand
+              workflow {
+                ...WorkflowDetails
+              }
+              observingMode {
+                ...ObservingModeDetails
+              }
+              constraintSet {
+                ...ConstraintSetDetails
+              }
+              timingWindows {
+                ...TimingWindowDetails
+              }
+              targetEnvironment {
+                ...TargetEnvironmentDetails
+              }
+              execution {
+                digest {
+                  value {
+                    acquisition {
+                      timeEstimate {
+                        total {
+                          seconds
+                        }
+                        program {
+                          seconds
+                        }
+                        nonCharged {
+                          seconds
+                        }
+                      }
+                    }
+                    setup {
+                      full {
+                        seconds
+                      }
+                      reacquisition {
+                        seconds
+                      }
+                    }
+                  }
+                }
+              }
+            }
+
+            fragment ObservingModeDetails on ObservingMode {
+              instrument
+              mode
+              gmosNorthLongSlit {
+                ...GmosNorthLongSlitDetails
+              }
+              gmosSouthLongSlit {
+                ...GmosSouthLongSlitDetails
+              }
+              gmosNorthImaging {
+                ...GmosNorthImagingDetails
+              }
+              gmosSouthImaging {
+                ...GmosSouthImagingDetails
+              }
+              flamingos2LongSlit {
+                ...Flamingos2LongSlitDetails
+              }
+              flamingos2Imaging {
+                ...Flamingos2ImagingDetails
+              }
+              igrins2LongSlit {
+                ...Igrins2LongSlitDetails
+              }
+              visitor {
+                ...VisitorDetails
+              }
+              ghostIfu {
+                ...ghostIfuDetails
+              }
+              gnirsSpectroscopy {
+                ...GnirsSpectroscopyDetails
+              }
+              gnirsImaging {
+                ...GnirsImagingDetails
+              }
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment ScienceRequirementsDetails on ScienceRequirements {
+              mode
+            }
+
+            fragment SiderealTargetDetails on Sidereal {
+              ra {
+                hours
+                hms
+                degrees
+              }
+              dec {
+                degrees
+                dms
+              }
+              epoch
+            }
+
+            fragment TargetEnvironmentDetails on TargetEnvironment {
+              asterism {
+                name
+                sidereal {
+                  ...SiderealTargetDetails
+                }
+                nonsidereal {
+                  ...NonsiderealTargetDetails
+                }
+              }
+              explicitBase {
+                ra {
+                  hms
+                }
+                dec {
+                  dms
+                }
+              }
+            }
+
+            fragment TimingWindowDetails on TimingWindow {
+              inclusion
+              startUtc
+              end {
+                __typename
+                ... on TimingWindowEndAt {
+                  atUtc
+                }
+                ... on TimingWindowEndAfter {
+                  after {
+                    seconds
+                  }
+                  repeat {
+                    period {
+                      seconds
+                    }
+                    times
+                  }
+                }
+              }
+            }
+
+            fragment VisitorDetails on Visitor {
+              mode
+              name
+              centralWavelength {
+                nanometers
+              }
+              totalRequestTime {
+                seconds
+              }
+              agsDiameter {
+                dms
+                hms
+              }
+            }
+
+            fragment WorkflowCore on CalculatedObservationWorkflow {
+              state
+            }
+
+            fragment WorkflowDetails on CalculatedObservationWorkflow {
+              ...WorkflowCore
+              value {
+                state
+                validTransitions
+                validationErrors {
+                  code
+                  messages
+                }
+              }
+            }
+
+            fragment ghostDetectorConfigDetails on GhostDetectorConfig {
+              binning
+              defaultBinning
+              defaultReadMode
+              explicitBinning
+              explicitReadMode
+              readMode
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  at {
+                    nanometers
+                  }
+                  time {
+                    seconds
+                  }
+                  count
+                }
+              }
+            }
+
+            fragment ghostIfuDetails on GhostIfu {
+              defaultIfu1Agitator
+              defaultIfu2Agitator
+              explicitIfu1Agitator
+              explicitIfu2Agitator
+              ifu1Agitator
+              ifu2Agitator
+              resolutionMode
+              stepCount
+              blue {
+                ...ghostDetectorConfigDetails
+              }
+              red {
+                ...ghostDetectorConfigDetails
+              }
+              skyPosition {
+                dec {
+                  degrees
+                }
+                ra {
+                  degrees
+                }
+              }
+              slitViewingCameraExposureTime {
+                seconds
+              }
+            }
+            """)
+        variables: dict[str, object] = {
+            "observationId": observation_id,
+            "observationReference": observation_reference,
+        }
+        response = await self.execute(
+            query=query, operation_name="getObservation", variables=variables, **kwargs
+        )
+        data = self.get_data(response)
+        return GetObservation.model_validate(data)
+
+    async def get_observations(
+        self,
+        include_deleted: bool,
+        where: Union[Optional[WhereObservation], UnsetType] = UNSET,
+        offset: Union[Optional[Any], UnsetType] = UNSET,
+        limit: Union[Optional[Any], UnsetType] = UNSET,
+        **kwargs: Any,
+    ) -> GetObservations:
+        query = gql("""
+            query getObservations($WHERE: WhereObservation, $OFFSET: ObservationId, $LIMIT: NonNegInt, $includeDeleted: Boolean! = false) {
+              observations(
+                WHERE: $WHERE
+                OFFSET: $OFFSET
+                LIMIT: $LIMIT
+                includeDeleted: $includeDeleted
+              ) {
+                hasMore
+                matches {
+                  ...ObservationDetails
+                }
+              }
+            }
+
+            fragment ConstraintSetDetails on ConstraintSet {
+              imageQuality
+              cloudExtinction
+              skyBackground
+              waterVapor
+              elevationRange {
+                airMass {
+                  min
+                  max
+                }
+                hourAngle {
+                  minHours
+                  maxHours
+                }
+              }
+            }
+
+            fragment Flamingos2ImagingDetails on Flamingos2Imaging {
+              filters {
+                filter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    time {
+                      seconds
+                    }
+                    count
+                  }
+                }
+              }
+              initialFilters {
+                filter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+              }
+              defaultReadMode
+              explicitReadMode
+              defaultReads
+              explicitReads
+              defaultDecker
+              explicitDecker
+              readoutMode
+              defaultReadoutMode
+              explicitReadoutMode
+            }
+
+            fragment Flamingos2LongSlitDetails on Flamingos2LongSlit {
+              decker
+              defaultDecker
+              disperser
+              filter
+              fpu
+              telluricType {
+                tag
+                starTypes
+              }
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  time {
+                    seconds
+                  }
+                  count
+                  at {
+                    nanometers
+                  }
+                }
+              }
+              explicitReadMode
+              explicitReads
+              explicitDecker
+              readoutMode
+              defaultReadoutMode
+              acquisition {
+                exposureTimeMode {
+                  signalToNoise {
+                    value
+                    at {
+                      nanometers
+                    }
+                  }
+                  timeAndCount {
+                    time {
+                      seconds
+                    }
+                    count
+                    at {
+                      nanometers
+                    }
+                  }
+                }
+              }
+              initialDisperser
+              initialFilter
+              initialFpu
+            }
+
+            fragment GmosNorthImagingDetails on GmosNorthImaging {
+              filters {
+                filter
+              }
+              bin
+            }
+
+            fragment GmosNorthLongSlitDetails on GmosNorthLongSlit {
+              grating
+              filter
+              fpu
+              centralWavelength {
+                nanometers
+              }
+              offsets {
+                arcseconds
+              }
+              xBin
+              yBin
+            }
+
+            fragment GmosSouthImagingDetails on GmosSouthImaging {
+              filters {
+                filter
+              }
+              bin
+            }
+
+            fragment GmosSouthLongSlitDetails on GmosSouthLongSlit {
+              grating
+              filter
+              fpu
+              centralWavelength {
+                nanometers
+              }
+              offsets {
+                arcseconds
+              }
+              xBin
+              yBin
+            }
+
+            fragment GnirsImagingDetails on GnirsImaging {
+              camera
+              defaultWellDepth
+              explicitReadMode
+              explicitWellDepth
+              filters {
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                filter
+              }
+              initialFilters {
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                filter
+              }
+              wellDepth
+            }
+
+            fragment GnirsSpectroscopyDetails on GnirsSpectroscopy {
+              acquisition {
+                explicitAcquisitionType
+                explicitFilter
+                exposureTimeMode {
+                  signalToNoise {
+                    at {
+                      nanometers
+                    }
+                    value
+                  }
+                  timeAndCount {
+                    at {
+                      nanometers
+                    }
+                    count
+                    time {
+                      seconds
+                    }
+                  }
+                }
+                skyOffset {
+                  p {
+                    arcseconds
+                  }
+                  q {
+                    arcseconds
+                  }
+                }
+              }
+              camera
+              centralWavelengths {
+                centralWavelength {
+                  nanometers
+                }
+              }
+              decker
+              defaultDecker
+              defaultWellDepth
+              explicitDecker
+              explicitFocusMotorSteps
+              explicitGrating
+              explicitPrism
+              explicitReadMode
+              explicitWellDepth
+              filter
+              grating
+              ifu {
+                fpu
+                initialFpu
+                telescopeConfigs {
+                  guiding
+                  offset {
+                    p {
+                      arcseconds
+                    }
+                    q {
+                      arcseconds
+                    }
+                  }
+                }
+              }
+              initialCamera
+              initialFilter
+              initialGrating
+              initialPrism
+              prism
+              telluricType {
+                starTypes
+                tag
+              }
+              wellDepth
+              slit {
+                fpu
+                initialFpu
+                defaultTelescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+                explicitTelescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+                telescopeConfigs {
+                  alongSlit {
+                    guiding
+                    q {
+                      arcseconds
+                    }
+                  }
+                  offsetMode
+                  toSky {
+                    guiding
+                    offset {
+                      p {
+                        arcseconds
+                      }
+                      q {
+                        arcseconds
+                      }
+                    }
+                  }
+                }
+              }
+            }
+
+            fragment Igrins2LongSlitDetails on Igrins2LongSlit {
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  time {
+                    seconds
+                  }
+                  count
+                  at {
+                    nanometers
+                  }
+                }
+              }
+              telluricType {
+                tag
+                starTypes
+              }
+            }
+
+            fragment NonsiderealTargetDetails on Nonsidereal {
+              des
+              keyType
+              key
+            }
+
+            fragment ObservationCore on Observation {
+              id
+              existence
+              reference {
+                label
+              }
+              title
+              instrument
+              calibrationRole
+            }
+
+            fragment ObservationDetails on Observation {
+              ...ObservationCore
+              observerNotes
+              subtitle
+              program {
+                ...ProgramCore
+              }
+              scienceRequirements {
+                ...ScienceRequirementsDetails
+              }
+              scienceBand
+              workflow {
+                ...WorkflowDetails
+              }
+              observingMode {
+                ...ObservingModeDetails
+              }
+              constraintSet {
+                ...ConstraintSetDetails
+              }
+              timingWindows {
+                ...TimingWindowDetails
+              }
+              targetEnvironment {
+                ...TargetEnvironmentDetails
+              }
+              execution {
+                digest {
+                  value {
+                    acquisition {
+                      timeEstimate {
+                        total {
+                          seconds
+                        }
+                        program {
+                          seconds
+                        }
+                        nonCharged {
+                          seconds
+                        }
+                      }
+                    }
+                    setup {
+                      full {
+                        seconds
+                      }
+                      reacquisition {
+                        seconds
+                      }
+                    }
+                  }
+                }
+              }
+            }
+
+            fragment ObservingModeDetails on ObservingMode {
+              instrument
+              mode
+              gmosNorthLongSlit {
+                ...GmosNorthLongSlitDetails
+              }
+              gmosSouthLongSlit {
+                ...GmosSouthLongSlitDetails
+              }
+              gmosNorthImaging {
+                ...GmosNorthImagingDetails
+              }
+              gmosSouthImaging {
+                ...GmosSouthImagingDetails
+              }
+              flamingos2LongSlit {
+                ...Flamingos2LongSlitDetails
+              }
+              flamingos2Imaging {
+                ...Flamingos2ImagingDetails
+              }
+              igrins2LongSlit {
+                ...Igrins2LongSlitDetails
+              }
+              visitor {
+                ...VisitorDetails
+              }
+              ghostIfu {
+                ...ghostIfuDetails
+              }
+              gnirsSpectroscopy {
+                ...GnirsSpectroscopyDetails
+              }
+              gnirsImaging {
+                ...GnirsImagingDetails
+              }
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment ScienceRequirementsDetails on ScienceRequirements {
+              mode
+            }
+
+            fragment SiderealTargetDetails on Sidereal {
+              ra {
+                hours
+                hms
+                degrees
+              }
+              dec {
+                degrees
+                dms
+              }
+              epoch
+            }
+
+            fragment TargetEnvironmentDetails on TargetEnvironment {
+              asterism {
+                name
+                sidereal {
+                  ...SiderealTargetDetails
+                }
+                nonsidereal {
+                  ...NonsiderealTargetDetails
+                }
+              }
+              explicitBase {
+                ra {
+                  hms
+                }
+                dec {
+                  dms
+                }
+              }
+            }
+
+            fragment TimingWindowDetails on TimingWindow {
+              inclusion
+              startUtc
+              end {
+                __typename
+                ... on TimingWindowEndAt {
+                  atUtc
+                }
+                ... on TimingWindowEndAfter {
+                  after {
+                    seconds
+                  }
+                  repeat {
+                    period {
+                      seconds
+                    }
+                    times
+                  }
+                }
+              }
+            }
+
+            fragment VisitorDetails on Visitor {
+              mode
+              name
+              centralWavelength {
+                nanometers
+              }
+              totalRequestTime {
+                seconds
+              }
+              agsDiameter {
+                dms
+                hms
+              }
+            }
+
+            fragment WorkflowCore on CalculatedObservationWorkflow {
+              state
+            }
+
+            fragment WorkflowDetails on CalculatedObservationWorkflow {
+              ...WorkflowCore
+              value {
+                state
+                validTransitions
+                validationErrors {
+                  code
+                  messages
+                }
+              }
+            }
+
+            fragment ghostDetectorConfigDetails on GhostDetectorConfig {
+              binning
+              defaultBinning
+              defaultReadMode
+              explicitBinning
+              explicitReadMode
+              readMode
+              exposureTimeMode {
+                signalToNoise {
+                  value
+                  at {
+                    nanometers
+                  }
+                }
+                timeAndCount {
+                  at {
+                    nanometers
+                  }
+                  time {
+                    seconds
+                  }
+                  count
+                }
+              }
+            }
+
+            fragment ghostIfuDetails on GhostIfu {
+              defaultIfu1Agitator
+              defaultIfu2Agitator
+              explicitIfu1Agitator
+              explicitIfu2Agitator
+              ifu1Agitator
+              ifu2Agitator
+              resolutionMode
+              stepCount
+              blue {
+                ...ghostDetectorConfigDetails
+              }
+              red {
+                ...ghostDetectorConfigDetails
+              }
+              skyPosition {
+                dec {
+                  degrees
+                }
+                ra {
+                  degrees
+                }
+              }
+              slitViewingCameraExposureTime {
+                seconds
+              }
+            }
+            """)
+        variables: dict[str, object] = {
+            "WHERE": where,
+            "OFFSET": offset,
+            "LIMIT": limit,
+            "includeDeleted": include_deleted,
+        }
+        response = await self.execute(
+            query=query, operation_name="getObservations", variables=variables, **kwargs
+        )
+        data = self.get_data(response)
+        return GetObservations.model_validate(data)
+
+    async def get_observation_summaries(
+        self,
+        include_deleted: bool,
+        where: Union[Optional[WhereObservation], UnsetType] = UNSET,
+        offset: Union[Optional[Any], UnsetType] = UNSET,
+        limit: Union[Optional[Any], UnsetType] = UNSET,
+        **kwargs: Any,
+    ) -> GetObservationSummaries:
+        query = gql("""
+            query getObservationSummaries($WHERE: WhereObservation, $OFFSET: ObservationId, $LIMIT: NonNegInt, $includeDeleted: Boolean! = false) {
+              observations(
+                WHERE: $WHERE
+                OFFSET: $OFFSET
+                LIMIT: $LIMIT
+                includeDeleted: $includeDeleted
+              ) {
+                hasMore
+                matches {
+                  ...ObservationSummary
+                }
+              }
+            }
+
+            fragment ObservationCore on Observation {
+              id
+              existence
+              reference {
+                label
+              }
+              title
+              instrument
+              calibrationRole
+            }
+
+            fragment ObservationSummary on Observation {
+              ...ObservationCore
+              program {
+                id
+              }
+              workflow {
+                ...WorkflowCore
+              }
+            }
+
+            fragment WorkflowCore on CalculatedObservationWorkflow {
+              state
+            }
+            """)
+        variables: dict[str, object] = {
+            "WHERE": where,
+            "OFFSET": offset,
+            "LIMIT": limit,
+            "includeDeleted": include_deleted,
+        }
+        response = await self.execute(
+            query=query,
+            operation_name="getObservationSummaries",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return GetObservationSummaries.model_validate(data)
+
+    async def observation_edit(
+        self, program_id: Union[Optional[Any], UnsetType] = UNSET, **kwargs: Any
+    ) -> AsyncIterator[ObservationEdit]:
+        query = gql("""
+            subscription ObservationEdit($programId: ProgramId) {
+              observationEdit(input: {programId: $programId}) {
+                editType
+                observationId
+                value {
+                  id
+                  existence
+                  reference {
+                    label
+                  }
+                  calibrationRole
+                  instrument
+                  index
+                  title
+                  subtitle
+                  scienceRequirements {
+                    mode
+                  }
+                  scienceBand
+                  observingMode {
+                    instrument
+                    mode
+                    gmosNorthLongSlit {
+                      grating
+                      filter
+                      fpu
+                      centralWavelength {
+                        nanometers
+                      }
+                    }
+                    gmosSouthLongSlit {
+                      grating
+                      filter
+                      fpu
+                      centralWavelength {
+                        nanometers
+                      }
+                    }
+                  }
+                  constraintSet {
+                    imageQuality
+                    cloudExtinction
+                    skyBackground
+                    waterVapor
+                    elevationRange {
+                      airMass {
+                        min
+                        max
+                      }
+                      hourAngle {
+                        minHours
+                        maxHours
+                      }
+                    }
+                  }
+                  timingWindows {
+                    inclusion
+                    startUtc
+                    end {
+                      __typename
+                      ... on TimingWindowEndAt {
+                        atUtc
+                      }
+                      ... on TimingWindowEndAfter {
+                        after {
+                          seconds
+                        }
+                        repeat {
+                          period {
+                            seconds
+                          }
+                          times
+                        }
+                      }
+                    }
+                  }
+                  targetEnvironment {
+                    asterism {
+                      sidereal {
+                        ra {
+                          hms
+                        }
+                        dec {
+                          dms
+                        }
+                        epoch
+                      }
+                      nonsidereal {
+                        des
+                      }
+                      name
+                    }
+                    explicitBase {
+                      ra {
+                        hms
+                      }
+                      dec {
+                        dms
+                      }
+                    }
+                  }
+                }
+              }
+            }
+            """)
+        variables: dict[str, object] = {"programId": program_id}
+        async for data in self.execute_ws(
+            query=query, operation_name="ObservationEdit", variables=variables, **kwargs
+        ):
+            yield ObservationEdit.model_validate(data)
+
+    async def obs_calculation_update(
+        self, program_id: Union[Optional[Any], UnsetType] = UNSET, **kwargs: Any
+    ) -> AsyncIterator[ObsCalculationUpdate]:
+        query = gql("""
+            subscription ObsCalculationUpdate($programId: ProgramId) {
+              obscalcUpdate(input: {programId: $programId}) {
+                editType
+                newCalculationState
+                observationId
+                oldCalculationState
+                value {
+                  id
+                  observationTime
+                  execution {
+                    visits {
+                      matches {
+                        observation {
+                          id
+                        }
+                        atomRecords {
+                          matches {
+                            executionState
+                            id
+                          }
+                        }
+                      }
+                    }
+                  }
+                }
+              }
+            }
+            """)
+        variables: dict[str, object] = {"programId": program_id}
+        async for data in self.execute_ws(
+            query=query,
+            operation_name="ObsCalculationUpdate",
+            variables=variables,
+            **kwargs,
+        ):
+            yield ObsCalculationUpdate.model_validate(data)
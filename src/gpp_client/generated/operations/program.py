@@ -0,0 +1,982 @@
+from collections.abc import AsyncIterator
+from typing import Any, Optional, Union
+
+from ..async_base_client import AsyncBaseClient
+from ..base_model import UNSET, UnsetType
+from ..create_program import CreateProgram
+from ..delete_program_by_id import DeleteProgramById
+from ..get_program_by_id import GetProgramById
+from ..get_program_by_proposal_reference import GetProgramByProposalReference
+from ..get_program_by_reference import GetProgramByReference
+from ..get_program_summaries import GetProgramSummaries
+from ..get_programs import GetPrograms
+from ..input_types import (
+    ProgramPropertiesInput,
+    WhereProgram,
+)
+from ..program_edit import ProgramEdit
+from ..restore_program_by_id import RestoreProgramById
+from ..update_program_by_id import UpdateProgramById
+from ..update_programs import UpdatePrograms
+
+
+def gql(q: str) -> str:
+    return q
+
+
+class ProgramOperations(AsyncBaseClient):
+    async def create_program(
+        self,
+        include_deleted: bool,
+        properties: Union[Optional[ProgramPropertiesInput], UnsetType] = UNSET,
+        **kwargs: Any,
+    ) -> CreateProgram:
+        query = gql("""
+            mutation createProgram($properties: ProgramPropertiesInput, $includeDeleted: Boolean! = false) {
+              createProgram(input: {SET: $properties}) {
+                program {
+                  ...ProgramDetail
+                  ...ProgramGroupElements
+                }
+              }
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment ProgramDetail on Program {
+              ...ProgramCore
+              type
+              active {
+                start
+                end
+              }
+              proposalStatus
+              proposal {
+                call {
+                  semester
+                  active {
+                    start
+                    end
+                  }
+                  observatory
+                  gemini {
+                    type
+                    instruments
+                  }
+                  keck {
+                    instruments
+                  }
+                  subaru {
+                    type
+                    instruments
+                  }
+                }
+                gemini {
+                  __typename
+                  scienceSubtype
+                }
+              }
+              pi {
+                id
+              }
+            }
+
+            fragment ProgramGroupElements on Program {
+              allGroupElements(includeDeleted: $includeDeleted) {
+                parentGroupId
+                observation {
+                  id
+                  groupId
+                }
+                group {
+                  id
+                  name
+                  minimumRequired
+                  ordered
+                  parentId
+                  parentIndex
+                  minimumInterval {
+                    seconds
+                  }
+                  maximumInterval {
+                    seconds
+                  }
+                  system
+                }
+              }
+            }
+            """)
+        variables: dict[str, object] = {
+            "properties": properties,
+            "includeDeleted": include_deleted,
+        }
+        response = await self.execute(
+            query=query, operation_name="createProgram", variables=variables, **kwargs
+        )
+        data = self.get_data(response)
+        return CreateProgram.model_validate(data)
+
+    async def update_programs(
+        self,
+        properties: ProgramPropertiesInput,
+        include_deleted: bool,
+        where: Union[Optional[WhereProgram], UnsetType] = UNSET,
+        limit: Union[Optional[Any], UnsetType] = UNSET,
+        **kwargs: Any,
+    ) -> UpdatePrograms:
+        query = gql("""
+            mutation updatePrograms($properties: ProgramPropertiesInput!, $where: WhereProgram, $limit: NonNegInt, $includeDeleted: Boolean! = false) {
+              updatePrograms(
+                input: {SET: $properties, WHERE: $where, LIMIT: $limit, includeDeleted: $includeDeleted}
+              ) {
+                hasMore
+                programs {
+                  ...ProgramDetail
+                  ...ProgramGroupElements
+                }
+              }
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment ProgramDetail on Program {
+              ...ProgramCore
+              type
+              active {
+                start
+                end
+              }
+              proposalStatus
+              proposal {
+                call {
+                  semester
+                  active {
+                    start
+                    end
+                  }
+                  observatory
+                  gemini {
+                    type
+                    instruments
+                  }
+                  keck {
+                    instruments
+                  }
+                  subaru {
+                    type
+                    instruments
+                  }
+                }
+                gemini {
+                  __typename
+                  scienceSubtype
+                }
+              }
+              pi {
+                id
+              }
+            }
+
+            fragment ProgramGroupElements on Program {
+              allGroupElements(includeDeleted: $includeDeleted) {
+                parentGroupId
+                observation {
+                  id
+                  groupId
+                }
+                group {
+                  id
+                  name
+                  minimumRequired
+                  ordered
+                  parentId
+                  parentIndex
+                  minimumInterval {
+                    seconds
+                  }
+                  maximumInterval {
+                    seconds
+                  }
+                  system
+                }
+              }
+            }
+            """)
+        variables: dict[str, object] = {
+            "properties": properties,
+            "where": where,
+            "limit": limit,
+            "includeDeleted": include_deleted,
+        }
+        response = await self.execute(
+            query=query, operation_name="updatePrograms", variables=variables, **kwargs
+        )
+        data = self.get_data(response)
+        return UpdatePrograms.model_validate(data)
+
+    async def update_program_by_id(
+        self,
+        program_id: Any,
+        properties: ProgramPropertiesInput,
+        include_deleted: bool,
+        **kwargs: Any,
+    ) -> UpdateProgramById:
+        query = gql("""
+            mutation updateProgramById($programId: ProgramId!, $properties: ProgramPropertiesInput!, $includeDeleted: Boolean! = false) {
+              updatePrograms(
+                input: {SET: $properties, WHERE: {id: {EQ: $programId}}, LIMIT: 1, includeDeleted: $includeDeleted}
+              ) {
+                hasMore
+                programs {
+                  ...ProgramDetail
+                  ...ProgramGroupElements
+                }
+              }
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment ProgramDetail on Program {
+              ...ProgramCore
+              type
+              active {
+                start
+                end
+              }
+              proposalStatus
+              proposal {
+                call {
+                  semester
+                  active {
+                    start
+                    end
+                  }
+                  observatory
+                  gemini {
+                    type
+                    instruments
+                  }
+                  keck {
+                    instruments
+                  }
+                  subaru {
+                    type
+                    instruments
+                  }
+                }
+                gemini {
+                  __typename
+                  scienceSubtype
+                }
+              }
+              pi {
+                id
+              }
+            }
+
+            fragment ProgramGroupElements on Program {
+              allGroupElements(includeDeleted: $includeDeleted) {
+                parentGroupId
+                observation {
+                  id
+                  groupId
+                }
+                group {
+                  id
+                  name
+                  minimumRequired
+                  ordered
+                  parentId
+                  parentIndex
+                  minimumInterval {
+                    seconds
+                  }
+                  maximumInterval {
+                    seconds
+                  }
+                  system
+                }
+              }
+            }
+            """)
+        variables: dict[str, object] = {
+            "programId": program_id,
+            "properties": properties,
+            "includeDeleted": include_deleted,
+        }
+        response = await self.execute(
+            query=query,
+            operation_name="updateProgramById",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return UpdateProgramById.model_validate(data)
+
+    async def restore_program_by_id(
+        self, program_id: Any, **kwargs: Any
+    ) -> RestoreProgramById:
+        query = gql("""
+            mutation restoreProgramById($programId: ProgramId!) {
+              updatePrograms(
+                input: {SET: {existence: PRESENT}, WHERE: {id: {EQ: $programId}}, LIMIT: 1, includeDeleted: true}
+              ) {
+                hasMore
+                programs {
+                  ...ProgramDetail
+                  allGroupElements(includeDeleted: true) {
+                    parentGroupId
+                    observation {
+                      id
+                      groupId
+                    }
+                    group {
+                      id
+                      name
+                      minimumRequired
+                      ordered
+                      parentId
+                      parentIndex
+                      minimumInterval {
+                        seconds
+                      }
+                      maximumInterval {
+                        seconds
+                      }
+                      system
+                    }
+                  }
+                }
+              }
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment ProgramDetail on Program {
+              ...ProgramCore
+              type
+              active {
+                start
+                end
+              }
+              proposalStatus
+              proposal {
+                call {
+                  semester
+                  active {
+                    start
+                    end
+                  }
+                  observatory
+                  gemini {
+                    type
+                    instruments
+                  }
+                  keck {
+                    instruments
+                  }
+                  subaru {
+                    type
+                    instruments
+                  }
+                }
+                gemini {
+                  __typename
+                  scienceSubtype
+                }
+              }
+              pi {
+                id
+              }
+            }
+            """)
+        variables: dict[str, object] = {"programId": program_id}
+        response = await self.execute(
+            query=query,
+            operation_name="restoreProgramById",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return RestoreProgramById.model_validate(data)
+
+    async def delete_program_by_id(
+        self, program_id: Any, **kwargs: Any
+    ) -> DeleteProgramById:
+        query = gql("""
+            mutation deleteProgramById($programId: ProgramId!) {
+              updatePrograms(
+                input: {SET: {existence: DELETED}, WHERE: {id: {EQ: $programId}}, LIMIT: 1, includeDeleted: false}
+              ) {
+                hasMore
+                programs {
+                  ...ProgramDetail
+                  allGroupElements(includeDeleted: false) {
+                    parentGroupId
+                    observation {
+                      id
+                      groupId
+                    }
+                    group {
+                      id
+                      name
+                      minimumRequired
+                      ordered
+                      parentId
+                      parentIndex
+                      minimumInterval {
+                        seconds
+                      }
+                      maximumInterval {
+                        seconds
+                      }
+                      system
+                    }
+                  }
+                }
+              }
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment ProgramDetail on Program {
+              ...ProgramCore
+              type
+              active {
+                start
+                end
+              }
+              proposalStatus
+              proposal {
+                call {
+                  semester
+                  active {
+                    start
+                    end
+                  }
+                  observatory
+                  gemini {
+                    type
+                    instruments
+                  }
+                  keck {
+                    instruments
+                  }
+                  subaru {
+                    type
+                    instruments
+                  }
+                }
+                gemini {
+                  __typename
+                  scienceSubtype
+                }
+              }
+              pi {
+                id
+              }
+            }
+            """)
+        variables: dict[str, object] = {"programId": program_id}
+        response = await self.execute(
+            query=query,
+            operation_name="deleteProgramById",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return DeleteProgramById.model_validate(data)
+
+    async def get_program_by_id(
+        self, program_id: Any, include_deleted: bool, **kwargs: Any
+    ) -> GetProgramById:
+        query = gql("""
+            query getProgramById($programId: ProgramId!, $includeDeleted: Boolean! = false) {
+              program(programId: $programId) {
+                ...ProgramDetail
+                ...ProgramGroupElements
+              }
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment ProgramDetail on Program {
+              ...ProgramCore
+              type
+              active {
+                start
+                end
+              }
+              proposalStatus
+              proposal {
+                call {
+                  semester
+                  active {
+                    start
+                    end
+                  }
+                  observatory
+                  gemini {
+                    type
+                    instruments
+                  }
+                  keck {
+                    instruments
+                  }
+                  subaru {
+                    type
+                    instruments
+                  }
+                }
+                gemini {
+                  __typename
+                  scienceSubtype
+                }
+              }
+              pi {
+                id
+              }
+            }
+
+            fragment ProgramGroupElements on Program {
+              allGroupElements(includeDeleted: $includeDeleted) {
+                parentGroupId
+                observation {
+                  id
+                  groupId
+                }
+                group {
+                  id
+                  name
+                  minimumRequired
+                  ordered
+                  parentId
+                  parentIndex
+                  minimumInterval {
+                    seconds
+                  }
+                  maximumInterval {
+                    seconds
+                  }
+                  system
+                }
+              }
+            }
+            """)
+        variables: dict[str, object] = {
+            "programId": program_id,
+            "includeDeleted": include_deleted,
+        }
+        response = await self.execute(
+            query=query, operation_name="getProgramById", variables=variables, **kwargs
+        )
+        data = self.get_data(response)
+        return GetProgramById.model_validate(data)
+
+    async def get_program_by_reference(
+        self, program_reference: Any, include_deleted: bool, **kwargs: Any
+    ) -> GetProgramByReference:
+        query = gql("""
+            query getProgramByReference($programReference: ProgramReferenceLabel!, $includeDeleted: Boolean! = false) {
+              program(programReference: $programReference) {
+                ...ProgramDetail
+                ...ProgramGroupElements
+              }
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment ProgramDetail on Program {
+              ...ProgramCore
+              type
+              active {
+                start
+                end
+              }
+              proposalStatus
+              proposal {
+                call {
+                  semester
+                  active {
+                    start
+                    end
+                  }
+                  observatory
+                  gemini {
+                    type
+                    instruments
+                  }
+                  keck {
+                    instruments
+                  }
+                  subaru {
+                    type
+                    instruments
+                  }
+                }
+                gemini {
+                  __typename
+                  scienceSubtype
+                }
+              }
+              pi {
+                id
+              }
+            }
+
+            fragment ProgramGroupElements on Program {
+              allGroupElements(includeDeleted: $includeDeleted) {
+                parentGroupId
+                observation {
+                  id
+                  groupId
+                }
+                group {
+                  id
+                  name
+                  minimumRequired
+                  ordered
+                  parentId
+                  parentIndex
+                  minimumInterval {
+                    seconds
+                  }
+                  maximumInterval {
+                    seconds
+                  }
+                  system
+                }
+              }
+            }
+            """)
+        variables: dict[str, object] = {
+            "programReference": program_reference,
+            "includeDeleted": include_deleted,
+        }
+        response = await self.execute(
+            query=query,
+            operation_name="getProgramByReference",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return GetProgramByReference.model_validate(data)
+
+    async def get_program_by_proposal_reference(
+        self, proposal_reference: Any, include_deleted: bool, **kwargs: Any
+    ) -> GetProgramByProposalReference:
+        query = gql("""
+            query getProgramByProposalReference($proposalReference: ProposalReferenceLabel!, $includeDeleted: Boolean! = false) {
+              program(proposalReference: $proposalReference) {
+                ...ProgramDetail
+                ...ProgramGroupElements
+              }
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment ProgramDetail on Program {
+              ...ProgramCore
+              type
+              active {
+                start
+                end
+              }
+              proposalStatus
+              proposal {
+                call {
+                  semester
+                  active {
+                    start
+                    end
+                  }
+                  observatory
+                  gemini {
+                    type
+                    instruments
+                  }
+                  keck {
+                    instruments
+                  }
+                  subaru {
+                    type
+                    instruments
+                  }
+                }
+                gemini {
+                  __typename
+                  scienceSubtype
+                }
+              }
+              pi {
+                id
+              }
+            }
+
+            fragment ProgramGroupElements on Program {
+              allGroupElements(includeDeleted: $includeDeleted) {
+                parentGroupId
+                observation {
+                  id
+                  groupId
+                }
+                group {
+                  id
+                  name
+                  minimumRequired
+                  ordered
+                  parentId
+                  parentIndex
+                  minimumInterval {
+                    seconds
+                  }
+                  maximumInterval {
+                    seconds
+                  }
+                  system
+                }
+              }
+            }
+            """)
+        variables: dict[str, object] = {
+            "proposalReference": proposal_reference,
+            "includeDeleted": include_deleted,
+        }
+        response = await self.execute(
+            query=query,
+            operation_name="getProgramByProposalReference",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return GetProgramByProposalReference.model_validate(data)
+
+    async def get_programs(
+        self,
+        include_deleted: bool,
+        where: Union[Optional[WhereProgram], UnsetType] = UNSET,
+        offset: Union[Optional[Any], UnsetType] = UNSET,
+        limit: Union[Optional[Any], UnsetType] = UNSET,
+        **kwargs: Any,
+    ) -> GetPrograms:
+        query = gql("""
+            query getPrograms($where: WhereProgram, $offset: ProgramId, $limit: NonNegInt, $includeDeleted: Boolean! = false) {
+              programs(
+                WHERE: $where
+                OFFSET: $offset
+                LIMIT: $limit
+                includeDeleted: $includeDeleted
+              ) {
+                hasMore
+                matches {
+                  ...ProgramDetail
+                  ...ProgramGroupElements
+                }
+              }
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment ProgramDetail on Program {
+              ...ProgramCore
+              type
+              active {
+                start
+                end
+              }
+              proposalStatus
+              proposal {
+                call {
+                  semester
+                  active {
+                    start
+                    end
+                  }
+                  observatory
+                  gemini {
+                    type
+                    instruments
+                  }
+                  keck {
+                    instruments
+                  }
+                  subaru {
+                    type
+                    instruments
+                  }
+                }
+                gemini {
+                  __typename
+                  scienceSubtype
+                }
+              }
+              pi {
+                id
+              }
+            }
+
+            fragment ProgramGroupElements on Program {
+              allGroupElements(includeDeleted: $includeDeleted) {
+                parentGroupId
+                observation {
+                  id
+                  groupId
+                }
+                group {
+                  id
+                  name
+                  minimumRequired
+                  ordered
+                  parentId
+                  parentIndex
+                  minimumInterval {
+                    seconds
+                  }
+                  maximumInterval {
+                    seconds
+                  }
+                  system
+                }
+              }
+            }
+            """)
+        variables: dict[str, object] = {
+            "where": where,
+            "offset": offset,
+            "limit": limit,
+            "includeDeleted": include_deleted,
+        }
+        response = await self.execute(
+            query=query, operation_name="getPrograms", variables=variables, **kwargs
+        )
+        data = self.get_data(response)
+        return GetPrograms.model_validate(data)
+
+    async def get_program_summaries(
+        self,
+        include_deleted: bool,
+        where: Union[Optional[WhereProgram], UnsetType] = UNSET,
+        offset: Union[Optional[Any], UnsetType] = UNSET,
+        limit: Union[Optional[Any], UnsetType] = UNSET,
+        **kwargs: Any,
+    ) -> GetProgramSummaries:
+        query = gql("""
+            query getProgramSummaries($where: WhereProgram, $offset: ProgramId, $limit: NonNegInt, $includeDeleted: Boolean! = false) {
+              programs(
+                WHERE: $where
+                OFFSET: $offset
+                LIMIT: $limit
+                includeDeleted: $includeDeleted
+              ) {
+                hasMore
+                matches {
+                  ...ProgramSummary
+                }
+              }
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment ProgramSummary on Program {
+              ...ProgramCore
+              type
+              reference {
+                label
+              }
+              proposalStatus
+            }
+            """)
+        variables: dict[str, object] = {
+            "where": where,
+            "offset": offset,
+            "limit": limit,
+            "includeDeleted": include_deleted,
+        }
+        response = await self.execute(
+            query=query,
+            operation_name="getProgramSummaries",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return GetProgramSummaries.model_validate(data)
+
+    async def program_edit(
+        self, program_id: Union[Optional[Any], UnsetType] = UNSET, **kwargs: Any
+    ) -> AsyncIterator[ProgramEdit]:
+        query = gql("""
+            subscription ProgramEdit($programId: ProgramId) {
+              programEdit(input: {programId: $programId}) {
+                editType
+                value {
+                  description
+                  existence
+                  name
+                  id
+                  allGroupElements {
+                    observation {
+                      id
+                    }
+                    group {
+                      id
+                    }
+                  }
+                }
+              }
+            }
+            """)
+        variables: dict[str, object] = {"programId": program_id}
+        async for data in self.execute_ws(
+            query=query, operation_name="ProgramEdit", variables=variables, **kwargs
+        ):
+            yield ProgramEdit.model_validate(data)
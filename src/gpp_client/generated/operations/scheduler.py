@@ -0,0 +1,273 @@
+from collections.abc import AsyncIterator
+from typing import Any, Optional, Union
+
+from ..async_base_client import AsyncBaseClient
+from ..base_model import UNSET, UnsetType
+from ..get_scheduler_all_programs_id import GetSchedulerAllProgramsId
+from ..get_scheduler_programs import GetSchedulerPrograms
+from ..scheduler_observations_updates import SchedulerObservationsUpdates
+
+
+def gql(q: str) -> str:
+    return q
+
+
+class SchedulerOperations(AsyncBaseClient):
+    async def get_scheduler_programs(
+        self,
+        programs_list: Union[Optional[list[Any]], UnsetType] = UNSET,
+        **kwargs: Any,
+    ) -> GetSchedulerPrograms:
+        query = gql("""
+            query GetSchedulerPrograms($programsList: [ProgramId!]) {
+              programs(WHERE: {id: {IN: $programsList}}) {
+                matches {
+                  id
+                  name
+                  description
+                  existence
+                  type
+                  reference {
+                    __typename
+                    label
+                    type
+                  }
+                  active {
+                    start
+                    end
+                  }
+                  proposalStatus
+                  proposal {
+                    ...SchedulerProposal
+                  }
+                  allocations {
+                    category
+                    duration {
+                      hours
+                    }
+                    scienceBand
+                  }
+                  timeCharge {
+                    band
+                    time {
+                      program {
+                        hours
+                      }
+                      total {
+                        hours
+                      }
+                      nonCharged {
+                        hours
+                      }
+                    }
+                  }
+                  allGroupElements {
+                    parentGroupId
+                    group {
+                      id
+                      name
+                      minimumRequired
+                      ordered
+                      parentId
+                      parentIndex
+                      minimumInterval {
+                        seconds
+                      }
+                      maximumInterval {
+                        seconds
+                      }
+                      system
+                    }
+                    observation {
+                      id
+                      groupId
+                    }
+                  }
+                }
+              }
+            }
+
+            fragment SchedulerProposal on Proposal {
+              call {
+                semester
+                active {
+                  start
+                  end
+                }
+                observatory
+                gemini {
+                  type
+                  instruments
+                }
+                keck {
+                  instruments
+                }
+                subaru {
+                  type
+                  instruments
+                }
+              }
+              gemini {
+                __typename
+                scienceSubtype
+              }
+            }
+            """)
+        variables: dict[str, object] = {"programsList": programs_list}
+        response = await self.execute(
+            query=query,
+            operation_name="GetSchedulerPrograms",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return GetSchedulerPrograms.model_validate(data)
+
+    async def get_scheduler_all_programs_id(
+        self, today: Union[Optional[Any], UnsetType] = UNSET, **kwargs: Any
+    ) -> GetSchedulerAllProgramsId:
+        query = gql("""
+            query GetSchedulerAllProgramsId($today: Date) {
+              programs(
+                WHERE: {activeEnd: {GTE: $today}, activeStart: {LT: $today}, OR: [{proposalStatus: {EQ: ACCEPTED}}, {type: {IN: [CALIBRATION, ENGINEERING]}}]}
+              ) {
+                matches {
+                  reference {
+                    __typename
+                    label
+                  }
+                  id
+                }
+              }
+            }
+            """)
+        variables: dict[str, object] = {"today": today}
+        response = await self.execute(
+            query=query,
+            operation_name="GetSchedulerAllProgramsId",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return GetSchedulerAllProgramsId.model_validate(data)
+
+    async def scheduler_observations_updates(
+        self, executable_only: Union[Optional[bool], UnsetType] = UNSET, **kwargs: Any
+    ) -> AsyncIterator[SchedulerObservationsUpdates]:
+        query = gql("""
+            subscription SchedulerObservationsUpdates($executableOnly: Boolean) {
+              obscalcUpdate(
+                input: {executableOnly: $executableOnly, newCalculationState: {EQ: READY}}
+              ) {
+                oldCalculationState
+                newCalculationState
+                editType
+                value {
+                  id
+                  observationTime
+                  program {
+                    active {
+                      end
+                      start
+                    }
+                  }
+                  workflow {
+                    value {
+                      state
+                    }
+                  }
+                  execution {
+                    visits {
+                      matches {
+                        observation {
+                          id
+                        }
+                        atomRecords {
+                          matches {
+                            executionState
+                            id
+                          }
+                        }
+                      }
+                    }
+                  }
+                  targetEnvironment {
+                    asterism {
+                      name
+                      sidereal {
+                        ra {
+                          hours
+                          hms
+                          degrees
+                        }
+                        dec {
+                          degrees
+                          dms
+                        }
+                        epoch
+                      }
+                      nonsidereal {
+                        des
+                        keyType
+                        key
+                      }
+                    }
+                    explicitBase {
+                      ra {
+                        hms
+                      }
+                      dec {
+                        dms
+                      }
+                    }
+                  }
+                  constraintSet {
+                    imageQuality
+                    cloudExtinction
+                    skyBackground
+                    waterVapor
+                    elevationRange {
+                      airMass {
+                        min
+                        max
+                      }
+                      hourAngle {
+                        minHours
+                        maxHours
+                      }
+                    }
+                  }
+                  timingWindows {
+                    inclusion
+                    startUtc
+                    end {
+                      __typename
+                      ... on TimingWindowEndAt {
+                        atUtc
+                      }
+                      ... on TimingWindowEndAfter {
+                        after {
+                          seconds
+                        }
+                        repeat {
+                          period {
+                            seconds
+                          }
+                          times
+                        }
+                      }
+                    }
+                  }
+                  instrument
+                }
+              }
+            }
+            """)
+        variables: dict[str, object] = {"executableOnly": executable_only}
+        async for data in self.execute_ws(
+            query=query,
+            operation_name="SchedulerObservationsUpdates",
+            variables=variables,
+            **kwargs,
+        ):
+            yield SchedulerObservationsUpdates.model_validate(data)
@@ -0,0 +1,1127 @@
+from collections.abc import AsyncIterator
+from typing import Any, Optional, Union
+
+from ..async_base_client import AsyncBaseClient
+from ..base_model import UNSET, UnsetType
+from ..clone_target import CloneTarget
+from ..create_target_by_program_id import CreateTargetByProgramId
+from ..create_target_by_program_reference import CreateTargetByProgramReference
+from ..create_target_by_proposal_reference import CreateTargetByProposalReference
+from ..delete_target_by_id import DeleteTargetById
+from ..get_target_by_id import GetTargetById
+from ..get_target_summaries import GetTargetSummaries
+from ..get_targets import GetTargets
+from ..input_types import (
+    TargetPropertiesInput,
+    WhereTarget,
+)
+from ..restore_target_by_id import RestoreTargetById
+from ..target_edit import TargetEdit
+from ..update_target_by_id import UpdateTargetById
+from ..update_targets import UpdateTargets
+
+
+def gql(q: str) -> str:
+    return q
+
+
+class TargetOperations(AsyncBaseClient):
+    async def clone_target(
+        self,
+        target_id: Any,
+        include_deleted: bool,
+        properties: Union[Optional[TargetPropertiesInput], UnsetType] = UNSET,
+        replace_in: Union[Optional[list[Any]], UnsetType] = UNSET,
+        **kwargs: Any,
+    ) -> CloneTarget:
+        query = gql("""
+            mutation cloneTarget($targetId: TargetId!, $properties: TargetPropertiesInput, $replaceIn: [ObservationId!], $includeDeleted: Boolean! = false) {
+              cloneTarget(
+                input: {targetId: $targetId, SET: $properties, REPLACE_IN: $replaceIn}
+              ) {
+                newTarget {
+                  ...TargetDetails
+                  ...TargetProgramSummary
+                }
+              }
+            }
+
+            fragment NonsiderealTargetDetails on Nonsidereal {
+              des
+              keyType
+              key
+            }
+
+            fragment OpportunityTargetDetails on Opportunity {
+              region {
+                rightAscensionArc {
+                  start {
+                    degrees
+                  }
+                  end {
+                    degrees
+                  }
+                }
+                declinationArc {
+                  start {
+                    degrees
+                  }
+                  end {
+                    degrees
+                  }
+                }
+              }
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment SiderealTargetDetails on Sidereal {
+              ra {
+                hours
+                hms
+                degrees
+              }
+              dec {
+                degrees
+                dms
+              }
+              epoch
+            }
+
+            fragment TargetCore on Target {
+              id
+              existence
+              name
+              calibrationRole
+            }
+
+            fragment TargetDetails on Target {
+              ...TargetCore
+              opportunity {
+                ...OpportunityTargetDetails
+              }
+              sidereal {
+                ...SiderealTargetDetails
+              }
+              nonsidereal {
+                ...NonsiderealTargetDetails
+              }
+            }
+
+            fragment TargetProgramSummary on Target {
+              program(includeDeleted: $includeDeleted) {
+                ...ProgramCore
+              }
+            }
+            """)
+        variables: dict[str, object] = {
+            "targetId": target_id,
+            "properties": properties,
+            "replaceIn": replace_in,
+            "includeDeleted": include_deleted,
+        }
+        response = await self.execute(
+            query=query, operation_name="cloneTarget", variables=variables, **kwargs
+        )
+        data = self.get_data(response)
+        return CloneTarget.model_validate(data)
+
+    async def create_target_by_program_id(
+        self,
+        program_id: Any,
+        properties: TargetPropertiesInput,
+        include_deleted: bool,
+        **kwargs: Any,
+    ) -> CreateTargetByProgramId:
+        query = gql("""
+            mutation createTargetByProgramId($programId: ProgramId!, $properties: TargetPropertiesInput!, $includeDeleted: Boolean! = false) {
+              createTarget(input: {programId: $programId, SET: $properties}) {
+                target {
+                  ...TargetDetails
+                  ...TargetProgramSummary
+                }
+              }
+            }
+
+            fragment NonsiderealTargetDetails on Nonsidereal {
+              des
+              keyType
+              key
+            }
+
+            fragment OpportunityTargetDetails on Opportunity {
+              region {
+                rightAscensionArc {
+                  start {
+                    degrees
+                  }
+                  end {
+                    degrees
+                  }
+                }
+                declinationArc {
+                  start {
+                    degrees
+                  }
+                  end {
+                    degrees
+                  }
+                }
+              }
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment SiderealTargetDetails on Sidereal {
+              ra {
+                hours
+                hms
+                degrees
+              }
+              dec {
+                degrees
+                dms
+              }
+              epoch
+            }
+
+            fragment TargetCore on Target {
+              id
+              existence
+              name
+              calibrationRole
+            }
+
+            fragment TargetDetails on Target {
+              ...TargetCore
+              opportunity {
+                ...OpportunityTargetDetails
+              }
+              sidereal {
+                ...SiderealTargetDetails
+              }
+              nonsidereal {
+                ...NonsiderealTargetDetails
+              }
+            }
+
+            fragment TargetProgramSummary on Target {
+              program(includeDeleted: $includeDeleted) {
+                ...ProgramCore
+              }
+            }
+            """)
+        variables: dict[str, object] = {
+            "programId": program_id,
+            "properties": properties,
+            "includeDeleted": include_deleted,
+        }
+        response = await self.execute(
+            query=query,
+            operation_name="createTargetByProgramId",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return CreateTargetByProgramId.model_validate(data)
+
+    async def create_target_by_proposal_reference(
+        self,
+        proposal_reference: Any,
+        properties: TargetPropertiesInput,
+        include_deleted: bool,
+        **kwargs: Any,
+    ) -> CreateTargetByProposalReference:
+        query = gql("""
+            mutation createTargetByProposalReference($proposalReference: ProposalReferenceLabel!, $properties: TargetPropertiesInput!, $includeDeleted: Boolean! = false) {
+              createTarget(input: {proposalReference: $proposalReference, SET: $properties}) {
+                target {
+                  ...TargetDetails
+                  ...TargetProgramSummary
+                }
+              }
+            }
+
+            fragment NonsiderealTargetDetails on Nonsidereal {
+              des
+              keyType
+              key
+            }
+
+            fragment OpportunityTargetDetails on Opportunity {
+              region {
+                rightAscensionArc {
+                  start {
+                    degrees
+                  }
+                  end {
+                    degrees
+                  }
+                }
+                declinationArc {
+                  start {
+                    degrees
+                  }
+                  end {
+                    degrees
+                  }
+                }
+              }
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment SiderealTargetDetails on Sidereal {
+              ra {
+                hours
+                hms
+                degrees
+              }
+              dec {
+                degrees
+                dms
+              }
+              epoch
+            }
+
+            fragment TargetCore on Target {
+              id
+              existence
+              name
+              calibrationRole
+            }
+
+            fragment TargetDetails on Target {
+              ...TargetCore
+              opportunity {
+                ...OpportunityTargetDetails
+              }
+              sidereal {
+                ...SiderealTargetDetails
+              }
+              nonsidereal {
+                ...NonsiderealTargetDetails
+              }
+            }
+
+            fragment TargetProgramSummary on Target {
+              program(includeDeleted: $includeDeleted) {
+                ...ProgramCore
+              }
+            }
+            """)
+        variables: dict[str, object] = {
+            "proposalReference": proposal_reference,
+            "properties": properties,
+            "includeDeleted": include_deleted,
+        }
+        response = await self.execute(
+            query=query,
+            operation_name="createTargetByProposalReference",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return CreateTargetByProposalReference.model_validate(data)
+
+    async def create_target_by_program_reference(
+        self,
+        program_reference: Any,
+        properties: TargetPropertiesInput,
+        include_deleted: bool,
+        **kwargs: Any,
+    ) -> CreateTargetByProgramReference:
+        query = gql("""
+            mutation createTargetByProgramReference($programReference: ProgramReferenceLabel!, $properties: TargetPropertiesInput!, $includeDeleted: Boolean! = false) {
+              createTarget(input: {programReference: $programReference, SET: $properties}) {
+                target {
+                  ...TargetDetails
+                  ...TargetProgramSummary
+                }
+              }
+            }
+
+            fragment NonsiderealTargetDetails on Nonsidereal {
+              des
+              keyType
+              key
+            }
+
+            fragment OpportunityTargetDetails on Opportunity {
+              region {
+                rightAscensionArc {
+                  start {
+                    degrees
+                  }
+                  end {
+                    degrees
+                  }
+                }
+                declinationArc {
+                  start {
+                    degrees
+                  }
+                  end {
+                    degrees
+                  }
+                }
+              }
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment SiderealTargetDetails on Sidereal {
+              ra {
+                hours
+                hms
+                degrees
+              }
+              dec {
+                degrees
+                dms
+              }
+              epoch
+            }
+
+            fragment TargetCore on Target {
+              id
+              existence
+              name
+              calibrationRole
+            }
+
+            fragment TargetDetails on Target {
+              ...TargetCore
+              opportunity {
+                ...OpportunityTargetDetails
+              }
+              sidereal {
+                ...SiderealTargetDetails
+              }
+              nonsidereal {
+                ...NonsiderealTargetDetails
+              }
+            }
+
+            fragment TargetProgramSummary on Target {
+              program(includeDeleted: $includeDeleted) {
+                ...ProgramCore
+              }
+            }
+            """)
+        variables: dict[str, object] = {
+            "programReference": program_reference,
+            "properties": properties,
+            "includeDeleted": include_deleted,
+        }
+        response = await self.execute(
+            query=query,
+            operation_name="createTargetByProgramReference",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return CreateTargetByProgramReference.model_validate(data)
+
+    async def update_targets(
+        self,
+        properties: TargetPropertiesInput,
+        include_deleted: bool,
+        where: Union[Optional[WhereTarget], UnsetType] = UNSET,
+        limit: Union[Optional[Any], UnsetType] = UNSET,
+        **kwargs: Any,
+    ) -> UpdateTargets:
+        query = gql("""
+            mutation updateTargets($properties: TargetPropertiesInput!, $where: WhereTarget, $limit: NonNegInt, $includeDeleted: Boolean! = false) {
+              updateTargets(
+                input: {SET: $properties, WHERE: $where, LIMIT: $limit, includeDeleted: $includeDeleted}
+              ) {
+                hasMore
+                targets {
+                  ...TargetDetails
+                  ...TargetProgramSummary
+                }
+              }
+            }
+
+            fragment NonsiderealTargetDetails on Nonsidereal {
+              des
+              keyType
+              key
+            }
+
+            fragment OpportunityTargetDetails on Opportunity {
+              region {
+                rightAscensionArc {
+                  start {
+                    degrees
+                  }
+                  end {
+                    degrees
+                  }
+                }
+                declinationArc {
+                  start {
+                    degrees
+                  }
+                  end {
+                    degrees
+                  }
+                }
+              }
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment SiderealTargetDetails on Sidereal {
+              ra {
+                hours
+                hms
+                degrees
+              }
+              dec {
+                degrees
+                dms
+              }
+              epoch
+            }
+
+            fragment TargetCore on Target {
+              id
+              existence
+              name
+              calibrationRole
+            }
+
+            fragment TargetDetails on Target {
+              ...TargetCore
+              opportunity {
+                ...OpportunityTargetDetails
+              }
+              sidereal {
+                ...SiderealTargetDetails
+              }
+              nonsidereal {
+                ...NonsiderealTargetDetails
+              }
+            }
+
+            fragment TargetProgramSummary on Target {
+              program(includeDeleted: $includeDeleted) {
+                ...ProgramCore
+              }
+            }
+            """)
+        variables: dict[str, object] = {
+            "properties": properties,
+            "where": where,
+            "limit": limit,
+            "includeDeleted": include_deleted,
+        }
+        response = await self.execute(
+            query=query, operation_name="updateTargets", variables=variables, **kwargs
+        )
+        data = self.get_data(response)
+        return UpdateTargets.model_validate(data)
+
+    async def update_target_by_id(
+        self,
+        target_id: Any,
+        properties: TargetPropertiesInput,
+        include_deleted: bool,
+        **kwargs: Any,
+    ) -> UpdateTargetById:
+        query = gql("""
+            mutation updateTargetById($targetId: TargetId!, $properties: TargetPropertiesInput!, $includeDeleted: Boolean! = false) {
+              updateTargets(
+                input: {SET: $properties, WHERE: {id: {EQ: $targetId}}, LIMIT: 1, includeDeleted: $includeDeleted}
+              ) {
+                hasMore
+                targets {
+                  ...TargetDetails
+                  ...TargetProgramSummary
+                }
+              }
+            }
+
+            fragment NonsiderealTargetDetails on Nonsidereal {
+              des
+              keyType
+              key
+            }
+
+            fragment OpportunityTargetDetails on Opportunity {
+              region {
+                rightAscensionArc {
+                  start {
+                    degrees
+                  }
+                  end {
+                    degrees
+                  }
+                }
+                declinationArc {
+                  start {
+                    degrees
+                  }
+                  end {
+                    degrees
+                  }
+                }
+              }
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment SiderealTargetDetails on Sidereal {
+              ra {
+                hours
+                hms
+                degrees
+              }
+              dec {
+                degrees
+                dms
+              }
+              epoch
+            }
+
+            fragment TargetCore on Target {
+              id
+              existence
+              name
+              calibrationRole
+            }
+
+            fragment TargetDetails on Target {
+              ...TargetCore
+              opportunity {
+                ...OpportunityTargetDetails
+              }
+              sidereal {
+                ...SiderealTargetDetails
+              }
+              nonsidereal {
+                ...NonsiderealTargetDetails
+              }
+            }
+
+            fragment TargetProgramSummary on Target {
+              program(includeDeleted: $includeDeleted) {
+                ...ProgramCore
+              }
+            }
+            """)
+        variables: dict[str, object] = {
+            "targetId": target_id,
+            "properties": properties,
+            "includeDeleted": include_deleted,
+        }
+        response = await self.execute(
+            query=query,
+            operation_name="updateTargetById",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return UpdateTargetById.model_validate(data)
+
+    async def restore_target_by_id(
+        self, target_id: Any, **kwargs: Any
+    ) -> RestoreTargetById:
+        query = gql("""
+            mutation restoreTargetById($targetId: TargetId!) {
+              updateTargets(
+                input: {SET: {existence: PRESENT}, WHERE: {id: {EQ: $targetId}}, LIMIT: 1, includeDeleted: true}
+              ) {
+                hasMore
+                targets {
+                  ...TargetDetails
+                  program(includeDeleted: true) {
+                    id
+                    name
+                    description
+                    existence
+                  }
+                }
+              }
+            }
+
+            fragment NonsiderealTargetDetails on Nonsidereal {
+              des
+              keyType
+              key
+            }
+
+            fragment OpportunityTargetDetails on Opportunity {
+              region {
+                rightAscensionArc {
+                  start {
+                    degrees
+                  }
+                  end {
+                    degrees
+                  }
+                }
+                declinationArc {
+                  start {
+                    degrees
+                  }
+                  end {
+                    degrees
+                  }
+                }
+              }
+            }
+
+            fragment SiderealTargetDetails on Sidereal {
+              ra {
+                hours
+                hms
+                degrees
+              }
+              dec {
+                degrees
+                dms
+              }
+              epoch
+            }
+
+            fragment TargetCore on Target {
+              id
+              existence
+              name
+              calibrationRole
+            }
+
+            fragment TargetDetails on Target {
+              ...TargetCore
+              opportunity {
+                ...OpportunityTargetDetails
+              }
+              sidereal {
+                ...SiderealTargetDetails
+              }
+              nonsidereal {
+                ...NonsiderealTargetDetails
+              }
+            }
+            """)
+        variables: dict[str, object] = {"targetId": target_id}
+        response = await self.execute(
+            query=query,
+            operation_name="restoreTargetById",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return RestoreTargetById.model_validate(data)
+
+    async def delete_target_by_id(
+        self, target_id: Any, **kwargs: Any
+    ) -> DeleteTargetById:
+        query = gql("""
+            mutation deleteTargetById($targetId: TargetId!) {
+              updateTargets(
+                input: {SET: {existence: DELETED}, WHERE: {id: {EQ: $targetId}}, LIMIT: 1, includeDeleted: false}
+              ) {
+                hasMore
+                targets {
+                  ...TargetDetails
+                  program(includeDeleted: false) {
+                    id
+                    name
+                    description
+                    existence
+                  }
+                }
+              }
+            }
+
+            fragment NonsiderealTargetDetails on Nonsidereal {
+              des
+              keyType
+              key
+            }
+
+            fragment OpportunityTargetDetails on Opportunity {
+              region {
+                rightAscensionArc {
+                  start {
+                    degrees
+                  }
+                  end {
+                    degrees
+                  }
+                }
+                declinationArc {
+                  start {
+                    degrees
+                  }
+                  end {
+                    degrees
+                  }
+                }
+              }
+            }
+
+            fragment SiderealTargetDetails on Sidereal {
+              ra {
+                hours
+                hms
+                degrees
+              }
+              dec {
+                degrees
+                dms
+              }
+              epoch
+            }
+
+            fragment TargetCore on Target {
+              id
+              existence
+              name
+              calibrationRole
+            }
+
+            fragment TargetDetails on Target {
+              ...TargetCore
+              opportunity {
+                ...OpportunityTargetDetails
+              }
+              sidereal {
+                ...SiderealTargetDetails
+              }
+              nonsidereal {
+                ...NonsiderealTargetDetails
+              }
+            }
+            """)
+        variables: dict[str, object] = {"targetId": target_id}
+        response = await self.execute(
+            query=query,
+            operation_name="deleteTargetById",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return DeleteTargetById.model_validate(data)
+
+    async def get_target_by_id(
+        self, target_id: Any, include_deleted: bool, **kwargs: Any
+    ) -> GetTargetById:
+        query = gql("""
+            query getTargetById($targetId: TargetId!, $includeDeleted: Boolean! = false) {
+              target(targetId: $targetId) {
+                ...TargetDetails
+                ...TargetProgramSummary
+              }
+            }
+
+            fragment NonsiderealTargetDetails on Nonsidereal {
+              des
+              keyType
+              key
+            }
+
+            fragment OpportunityTargetDetails on Opportunity {
+              region {
+                rightAscensionArc {
+                  start {
+                    degrees
+                  }
+                  end {
+                    degrees
+                  }
+                }
+                declinationArc {
+                  start {
+                    degrees
+                  }
+                  end {
+                    degrees
+                  }
+                }
+              }
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment SiderealTargetDetails on Sidereal {
+              ra {
+                hours
+                hms
+                degrees
+              }
+              dec {
+                degrees
+                dms
+              }
+              epoch
+            }
+
+            fragment TargetCore on Target {
+              id
+              existence
+              name
+              calibrationRole
+            }
+
+            fragment TargetDetails on Target {
+              ...TargetCore
+              opportunity {
+                ...OpportunityTargetDetails
+              }
+              sidereal {
+                ...SiderealTargetDetails
+              }
+              nonsidereal {
+                ...NonsiderealTargetDetails
+              }
+            }
+
+            fragment TargetProgramSummary on Target {
+              program(includeDeleted: $includeDeleted) {
+                ...ProgramCore
+              }
+            }
+            """)
+        variables: dict[str, object] = {
+            "targetId": target_id,
+            "includeDeleted": include_deleted,
+        }
+        response = await self.execute(
+            query=query, operation_name="getTargetById", variables=variables, **kwargs
+        )
+        data = self.get_data(response)
+        return GetTargetById.model_validate(data)
+
+    async def get_targets(
+        self,
+        include_deleted: bool,
+        where: Union[Optional[WhereTarget], UnsetType] = UNSET,
+        offset: Union[Optional[Any], UnsetType] = UNSET,
+        limit: Union[Optional[Any], UnsetType] = UNSET,
+        **kwargs: Any,
+    ) -> GetTargets:
+        query = gql("""
+            query getTargets($where: WhereTarget, $offset: TargetId, $limit: NonNegInt, $includeDeleted: Boolean! = false) {
+              targets(
+                WHERE: $where
+                OFFSET: $offset
+                LIMIT: $limit
+                includeDeleted: $includeDeleted
+              ) {
+                hasMore
+                matches {
+                  ...TargetDetails
+                  ...TargetProgramSummary
+                }
+              }
+            }
+
+            fragment NonsiderealTargetDetails on Nonsidereal {
+              des
+              keyType
+              key
+            }
+
+            fragment OpportunityTargetDetails on Opportunity {
+              region {
+                rightAscensionArc {
+                  start {
+                    degrees
+                  }
+                  end {
+                    degrees
+                  }
+                }
+                declinationArc {
+                  start {
+                    degrees
+                  }
+                  end {
+                    degrees
+                  }
+                }
+              }
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment SiderealTargetDetails on Sidereal {
+              ra {
+                hours
+                hms
+                degrees
+              }
+              dec {
+                degrees
+                dms
+              }
+              epoch
+            }
+
+            fragment TargetCore on Target {
+              id
+              existence
+              name
+              calibrationRole
+            }
+
+            fragment TargetDetails on Target {
+              ...TargetCore
+              opportunity {
+                ...OpportunityTargetDetails
+              }
+              sidereal {
+                ...SiderealTargetDetails
+              }
+              nonsidereal {
+                ...NonsiderealTargetDetails
+              }
+            }
+
+            fragment TargetProgramSummary on Target {
+              program(includeDeleted: $includeDeleted) {
+                ...ProgramCore
+              }
+            }
+            """)
+        variables: dict[str, object] = {
+            "where": where,
+            "offset": offset,
+            "limit": limit,
+            "includeDeleted": include_deleted,
+        }
+        response = await self.execute(
+            query=query, operation_name="getTargets", variables=variables, **kwargs
+        )
+        data = self.get_data(response)
+        return GetTargets.model_validate(data)
+
+    async def get_target_summaries(
+        self,
+        include_deleted: bool,
+        where: Union[Optional[WhereTarget], UnsetType] = UNSET,
+        offset: Union[Optional[Any], UnsetType] = UNSET,
+        limit: Union[Optional[Any], UnsetType] = UNSET,
+        **kwargs: Any,
+    ) -> GetTargetSummaries:
+        query = gql("""
+            query getTargetSummaries($where: WhereTarget, $offset: TargetId, $limit: NonNegInt, $includeDeleted: Boolean! = false) {
+              targets(
+                WHERE: $where
+                OFFSET: $offset
+                LIMIT: $limit
+                includeDeleted: $includeDeleted
+              ) {
+                hasMore
+                matches {
+                  ...TargetSummary
+                }
+              }
+            }
+
+            fragment TargetCore on Target {
+              id
+              existence
+              name
+              calibrationRole
+            }
+
+            fragment TargetSummary on Target {
+              ...TargetCore
+              program(includeDeleted: $includeDeleted) {
+                id
+              }
+            }
+            """)
+        variables: dict[str, object] = {
+            "where": where,
+            "offset": offset,
+            "limit": limit,
+            "includeDeleted": include_deleted,
+        }
+        response = await self.execute(
+            query=query,
+            operation_name="getTargetSummaries",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return GetTargetSummaries.model_validate(data)
+
+    async def target_edit(
+        self, target_edit: Union[Optional[Any], UnsetType] = UNSET, **kwargs: Any
+    ) -> AsyncIterator[TargetEdit]:
+        query = gql("""
+            subscription TargetEdit($targetEdit: TargetId) {
+              targetEdit(input: {targetId: $targetEdit}) {
+                editType
+                targetId
+                value {
+                  id
+                  name
+                  nonsidereal {
+                    des
+                    key
+                  }
+                  sidereal {
+                    ra {
+                      degrees
+                    }
+                    dec {
+                      degrees
+                    }
+                  }
+                }
+              }
+            }
+            """)
+        variables: dict[str, object] = {"targetEdit": target_edit}
+        async for data in self.execute_ws(
+            query=query, operation_name="TargetEdit", variables=variables, **kwargs
+        ):
+            yield TargetEdit.model_validate(data)
@@ -0,0 +1,27 @@
+from typing import Any
+
+from ..async_base_client import AsyncBaseClient
+from ..ping import Ping
+
+
+def gql(q: str) -> str:
+    return q
+
+
+class UtilsOperations(AsyncBaseClient):
+    async def ping(self, **kwargs: Any) -> Ping:
+        query = gql("""
+            query ping {
+              programs(LIMIT: 1) {
+                matches {
+                  id
+                }
+              }
+            }
+            """)
+        variables: dict[str, object] = {}
+        response = await self.execute(
+            query=query, operation_name="ping", variables=variables, **kwargs
+        )
+        data = self.get_data(response)
+        return Ping.model_validate(data)
@@ -0,0 +1,170 @@
+from typing import Any
+
+from ..async_base_client import AsyncBaseClient
+from ..enums import ObservationWorkflowState
+from ..get_observation_workflow_state_by_id import GetObservationWorkflowStateById
+from ..get_observation_workflow_state_by_reference import (
+    GetObservationWorkflowStateByReference,
+)
+from ..set_observation_workflow_state import SetObservationWorkflowState
+
+
+def gql(q: str) -> str:
+    return q
+
+
+class WorkflowStateOperations(AsyncBaseClient):
+    async def set_observation_workflow_state(
+        self, observation_id: Any, state: ObservationWorkflowState, **kwargs: Any
+    ) -> SetObservationWorkflowState:
+        query = gql("""
+            mutation setObservationWorkflowState($observationId: ObservationId!, $state: ObservationWorkflowState!) {
+              setObservationWorkflowState(
+                input: {observationId: $observationId, state: $state}
+              ) {
+                ...ObservationWorkflowDetails
+              }
+            }
+
+            fragment ObservationWorkflowCore on ObservationWorkflow {
+              state
+            }
+
+            fragment ObservationWorkflowDetails on ObservationWorkflow {
+              ...ObservationWorkflowCore
+              validTransitions
+              validationErrors {
+                code
+                messages
+              }
+            }
+            """)
+        variables: dict[str, object] = {"observationId": observation_id, "state": state}
+        response = await self.execute(
+            query=query,
+            operation_name="setObservationWorkflowState",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return SetObservationWorkflowState.model_validate(data)
+
+    async def get_observation_workflow_state_by_id(
+        self, observation_id: Any, **kwargs: Any
+    ) -> GetObservationWorkflowStateById:
+        query = gql("""
+            query getObservationWorkflowStateById($observationId: ObservationId!) {
+              observation(observationId: $observationId) {
+                ...ObservationCore
+                program {
+                  ...ProgramCore
+                }
+                workflow {
+                  ...WorkflowDetails
+                }
+              }
+            }
+
+            fragment ObservationCore on Observation {
+              id
+              existence
+              reference {
+                label
+              }
+              title
+              instrument
+              calibrationRole
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment WorkflowCore on CalculatedObservationWorkflow {
+              state
+            }
+
+            fragment WorkflowDetails on CalculatedObservationWorkflow {
+              ...WorkflowCore
+              value {
+                state
+                validTransitions
+                validationErrors {
+                  code
+                  messages
+                }
+              }
+            }
+            """)
+        variables: dict[str, object] = {"observationId": observation_id}
+        response = await self.execute(
+            query=query,
+            operation_name="getObservationWorkflowStateById",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return GetObservationWorkflowStateById.model_validate(data)
+
+    async def get_observation_workflow_state_by_reference(
+        self, observation_reference: Any, **kwargs: Any
+    ) -> GetObservationWorkflowStateByReference:
+        query = gql("""
+            query getObservationWorkflowStateByReference($observationReference: ObservationReferenceLabel!) {
+              observation(observationReference: $observationReference) {
+                ...ObservationCore
+                program {
+                  ...ProgramCore
+                }
+                workflow {
+                  ...WorkflowDetails
+                }
+              }
+            }
+
+            fragment ObservationCore on Observation {
+              id
+              existence
+              reference {
+                label
+              }
+              title
+              instrument
+              calibrationRole
+            }
+
+            fragment ProgramCore on Program {
+              id
+              name
+              existence
+              description
+            }
+
+            fragment WorkflowCore on CalculatedObservationWorkflow {
+              state
+            }
+
+            fragment WorkflowDetails on CalculatedObservationWorkflow {
+              ...WorkflowCore
+              value {
+                state
+                validTransitions
+                validationErrors {
+                  code
+                  messages
+                }
+              }
+            }
+            """)
+        variables: dict[str, object] = {"observationReference": observation_reference}
+        response = await self.execute(
+            query=query,
+            operation_name="getObservationWorkflowStateByReference",
+            variables=variables,
+            **kwargs,
+        )
+        data = self.get_data(response)
+        return GetObservationWorkflowStateByReference.model_validate(data)
@@ -0,0 +1,2563 @@
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base_struct import BaseStruct, TaggedStruct
+    from .client import StructGraphQLClient
+    from .clone_observation import (
+        CloneObservation,
+        CloneObservationCloneObservation,
+        CloneObservationCloneObservationNewObservation,
+    )
+    from .clone_target import (
+        CloneTarget,
+        CloneTargetCloneTarget,
+        CloneTargetCloneTargetNewTarget,
+    )
+    from .create_call_for_proposals import (
+        CreateCallForProposals,
+        CreateCallForProposalsCreateCallForProposals,
+        CreateCallForProposalsCreateCallForProposalsCallForProposals,
+    )
+    from .create_observation import (
+        CreateObservation,
+        CreateObservationCreateObservation,
+        CreateObservationCreateObservationObservation,
+    )
+    from .create_program import (
+        CreateProgram,
+        CreateProgramCreateProgram,
+        CreateProgramCreateProgramProgram,
+    )
+    from .create_target_by_program_id import (
+        CreateTargetByProgramId,
+        CreateTargetByProgramIdCreateTarget,
+        CreateTargetByProgramIdCreateTargetTarget,
+    )
+    from .create_target_by_program_reference import (
+        CreateTargetByProgramReference,
+        CreateTargetByProgramReferenceCreateTarget,
+        CreateTargetByProgramReferenceCreateTargetTarget,
+    )
+    from .create_target_by_proposal_reference import (
+        CreateTargetByProposalReference,
+        CreateTargetByProposalReferenceCreateTarget,
+        CreateTargetByProposalReferenceCreateTargetTarget,
+    )
+    from .delete_call_for_proposals_by_id import (
+        DeleteCallForProposalsById,
+        DeleteCallForProposalsByIdUpdateCallsForProposals,
+        DeleteCallForProposalsByIdUpdateCallsForProposalsCallsForProposals,
+    )
+    from .delete_observation_by_id import (
+        DeleteObservationById,
+        DeleteObservationByIdUpdateObservations,
+        DeleteObservationByIdUpdateObservationsObservations,
+    )
+    from .delete_observation_by_reference import (
+        DeleteObservationByReference,
+        DeleteObservationByReferenceUpdateObservations,
+        DeleteObservationByReferenceUpdateObservationsObservations,
+    )
+    from .delete_program_by_id import (
+        DeleteProgramById,
+        DeleteProgramByIdUpdatePrograms,
+        DeleteProgramByIdUpdateProgramsPrograms,
+        DeleteProgramByIdUpdateProgramsProgramsAllGroupElements,
+        DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsGroup,
+        DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMaximumInterval,
+        DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMinimumInterval,
+        DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsObservation,
+    )
+    from .delete_target_by_id import (
+        DeleteTargetById,
+        DeleteTargetByIdUpdateTargets,
+        DeleteTargetByIdUpdateTargetsTargets,
+        DeleteTargetByIdUpdateTargetsTargetsProgram,
+    )
+    from .fragments import (
+        AttachmentDetails,
+        CallForProposalsCore,
+        CallForProposalsCoreGemini,
+        CallForProposalsCoreKeck,
+        CallForProposalsCoreSubaru,
+        CallForProposalsDetails,
+        CallForProposalsDetailsActive,
+        ConstraintSetDetails,
+        ConstraintSetDetailsElevationRange,
+        ConstraintSetDetailsElevationRangeAirMass,
+        ConstraintSetDetailsElevationRangeHourAngle,
+        Flamingos2ImagingDetails,
+        Flamingos2ImagingDetailsFilters,
+        Flamingos2ImagingDetailsFiltersExposureTimeMode,
+        Flamingos2ImagingDetailsFiltersExposureTimeModeSignalToNoise,
+        Flamingos2ImagingDetailsFiltersExposureTimeModeSignalToNoiseAt,
+        Flamingos2ImagingDetailsFiltersExposureTimeModeTimeAndCount,
+        Flamingos2ImagingDetailsFiltersExposureTimeModeTimeAndCountTime,
+        Flamingos2ImagingDetailsInitialFilters,
+        Flamingos2ImagingDetailsInitialFiltersExposureTimeMode,
+        Flamingos2ImagingDetailsInitialFiltersExposureTimeModeSignalToNoise,
+        Flamingos2ImagingDetailsInitialFiltersExposureTimeModeSignalToNoiseAt,
+        Flamingos2ImagingDetailsInitialFiltersExposureTimeModeTimeAndCount,
+        Flamingos2ImagingDetailsInitialFiltersExposureTimeModeTimeAndCountAt,
+        Flamingos2ImagingDetailsInitialFiltersExposureTimeModeTimeAndCountTime,
+        Flamingos2LongSlitDetails,
+        Flamingos2LongSlitDetailsAcquisition,
+        Flamingos2LongSlitDetailsAcquisitionExposureTimeMode,
+        Flamingos2LongSlitDetailsAcquisitionExposureTimeModeSignalToNoise,
+        Flamingos2LongSlitDetailsAcquisitionExposureTimeModeSignalToNoiseAt,
+        Flamingos2LongSlitDetailsAcquisitionExposureTimeModeTimeAndCount,
+        Flamingos2LongSlitDetailsAcquisitionExposureTimeModeTimeAndCountAt,
+        Flamingos2LongSlitDetailsAcquisitionExposureTimeModeTimeAndCountTime,
+        Flamingos2LongSlitDetailsExposureTimeMode,
+        Flamingos2LongSlitDetailsExposureTimeModeSignalToNoise,
+        Flamingos2LongSlitDetailsExposureTimeModeSignalToNoiseAt,
+        Flamingos2LongSlitDetailsExposureTimeModeTimeAndCount,
+        Flamingos2LongSlitDetailsExposureTimeModeTimeAndCountAt,
+        Flamingos2LongSlitDetailsExposureTimeModeTimeAndCountTime,
+        Flamingos2LongSlitDetailsTelluricType,
+        GhostDetectorConfigDetails,
+        GhostDetectorConfigDetailsExposureTimeMode,
+        GhostDetectorConfigDetailsExposureTimeModeSignalToNoise,
+        GhostDetectorConfigDetailsExposureTimeModeSignalToNoiseAt,
+        GhostDetectorConfigDetailsExposureTimeModeTimeAndCount,
+        GhostDetectorConfigDetailsExposureTimeModeTimeAndCountAt,
+        GhostDetectorConfigDetailsExposureTimeModeTimeAndCountTime,
+        GhostIfuDetails,
+        GhostIfuDetailsBlue,
+        GhostIfuDetailsRed,
+        GhostIfuDetailsSkyPosition,
+        GhostIfuDetailsSkyPositionDec,
+        GhostIfuDetailsSkyPositionRa,
+        GhostIfuDetailsSlitViewingCameraExposureTime,
+        GmosNorthImagingDetails,
+        GmosNorthImagingDetailsFilters,
+        GmosNorthLongSlitDetails,
+        GmosNorthLongSlitDetailsCentralWavelength,
+        GmosNorthLongSlitDetailsOffsets,
+        GmosSouthImagingDetails,
+        GmosSouthImagingDetailsFilters,
+        GmosSouthLongSlitDetails,
+        GmosSouthLongSlitDetailsCentralWavelength,
+        GmosSouthLongSlitDetailsOffsets,
+        GnirsDetails,
+        GnirsDetailsGnirsImaging,
+        GnirsDetailsGnirsSpectroscopy,
+        GnirsImagingDetails,
+        GnirsImagingDetailsFilters,
+        GnirsImagingDetailsFiltersExposureTimeMode,
+        GnirsImagingDetailsFiltersExposureTimeModeSignalToNoise,
+        GnirsImagingDetailsFiltersExposureTimeModeSignalToNoiseAt,
+        GnirsImagingDetailsFiltersExposureTimeModeTimeAndCount,
+        GnirsImagingDetailsFiltersExposureTimeModeTimeAndCountAt,
+        GnirsImagingDetailsFiltersExposureTimeModeTimeAndCountTime,
+        GnirsImagingDetailsInitialFilters,
+        GnirsImagingDetailsInitialFiltersExposureTimeMode,
+        GnirsImagingDetailsInitialFiltersExposureTimeModeSignalToNoise,
+        GnirsImagingDetailsInitialFiltersExposureTimeModeSignalToNoiseAt,
+        GnirsImagingDetailsInitialFiltersExposureTimeModeTimeAndCount,
+        GnirsImagingDetailsInitialFiltersExposureTimeModeTimeAndCountAt,
+        GnirsImagingDetailsInitialFiltersExposureTimeModeTimeAndCountTime,
+        GnirsSpectroscopyDetails,
+        GnirsSpectroscopyDetailsAcquisition,
+        GnirsSpectroscopyDetailsAcquisitionExposureTimeMode,
+        GnirsSpectroscopyDetailsAcquisitionExposureTimeModeSignalToNoise,
+        GnirsSpectroscopyDetailsAcquisitionExposureTimeModeSignalToNoiseAt,
+        GnirsSpectroscopyDetailsAcquisitionExposureTimeModeTimeAndCount,
+        GnirsSpectroscopyDetailsAcquisitionExposureTimeModeTimeAndCountAt,
+        GnirsSpectroscopyDetailsAcquisitionExposureTimeModeTimeAndCountTime,
+        GnirsSpectroscopyDetailsAcquisitionSkyOffset,
+        GnirsSpectroscopyDetailsAcquisitionSkyOffsetP,
+        GnirsSpectroscopyDetailsAcquisitionSkyOffsetQ,
+        GnirsSpectroscopyDetailsCentralWavelengths,
+        GnirsSpectroscopyDetailsCentralWavelengthsCentralWavelength,
+        GnirsSpectroscopyDetailsIfu,
+        GnirsSpectroscopyDetailsIfuTelescopeConfigs,
+        GnirsSpectroscopyDetailsIfuTelescopeConfigsOffset,
+        GnirsSpectroscopyDetailsIfuTelescopeConfigsOffsetP,
+        GnirsSpectroscopyDetailsIfuTelescopeConfigsOffsetQ,
+        GnirsSpectroscopyDetailsSlit,
+        GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigs,
+        GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsAlongSlit,
+        GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsAlongSlitQ,
+        GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSky,
+        GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSkyOffset,
+        GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSkyOffsetP,
+        GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSkyOffsetQ,
+        GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigs,
+        GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsAlongSlit,
+        GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsAlongSlitQ,
+        GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSky,
+        GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSkyOffset,
+        GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSkyOffsetP,
+        GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSkyOffsetQ,
+        GnirsSpectroscopyDetailsSlitTelescopeConfigs,
+        GnirsSpectroscopyDetailsSlitTelescopeConfigsAlongSlit,
+        GnirsSpectroscopyDetailsSlitTelescopeConfigsAlongSlitQ,
+        GnirsSpectroscopyDetailsSlitTelescopeConfigsToSky,
+        GnirsSpectroscopyDetailsSlitTelescopeConfigsToSkyOffset,
+        GnirsSpectroscopyDetailsSlitTelescopeConfigsToSkyOffsetP,
+        GnirsSpectroscopyDetailsSlitTelescopeConfigsToSkyOffsetQ,
+        GnirsSpectroscopyDetailsTelluricType,
+        Igrins2LongSlitDetails,
+        Igrins2LongSlitDetailsExposureTimeMode,
+        Igrins2LongSlitDetailsExposureTimeModeSignalToNoise,
+        Igrins2LongSlitDetailsExposureTimeModeSignalToNoiseAt,
+        Igrins2LongSlitDetailsExposureTimeModeTimeAndCount,
+        Igrins2LongSlitDetailsExposureTimeModeTimeAndCountAt,
+        Igrins2LongSlitDetailsExposureTimeModeTimeAndCountTime,
+        Igrins2LongSlitDetailsTelluricType,
+        NonsiderealTargetDetails,
+        ObservationCore,
+        ObservationCoreReference,
+        ObservationDetails,
+        ObservationDetailsConstraintSet,
+        ObservationDetailsExecution,
+        ObservationDetailsExecutionDigest,
+        ObservationDetailsExecutionDigestValue,
+        ObservationDetailsExecutionDigestValueAcquisition,
+        ObservationDetailsExecutionDigestValueAcquisitionTimeEstimate,
+        ObservationDetailsExecutionDigestValueAcquisitionTimeEstimateNonCharged,
+        ObservationDetailsExecutionDigestValueAcquisitionTimeEstimateProgram,
+        ObservationDetailsExecutionDigestValueAcquisitionTimeEstimateTotal,
+        ObservationDetailsExecutionDigestValueSetup,
+        ObservationDetailsExecutionDigestValueSetupFull,
+        ObservationDetailsExecutionDigestValueSetupReacquisition,
+        ObservationDetailsObservingMode,
+        ObservationDetailsProgram,
+        ObservationDetailsScienceRequirements,
+        ObservationDetailsTargetEnvironment,
+        ObservationDetailsTimingWindows,
+        ObservationDetailsWorkflow,
+        ObservationSummary,
+        ObservationSummaryProgram,
+        ObservationSummaryWorkflow,
+        ObservationWorkflowCore,
+        ObservationWorkflowDetails,
+        ObservationWorkflowDetailsValidationErrors,
+        ObservingModeDetails,
+        ObservingModeDetailsFlamingos2Imaging,
+        ObservingModeDetailsFlamingos2LongSlit,
+        ObservingModeDetailsGhostIfu,
+        ObservingModeDetailsGmosNorthImaging,
+        ObservingModeDetailsGmosNorthLongSlit,
+        ObservingModeDetailsGmosSouthImaging,
+        ObservingModeDetailsGmosSouthLongSlit,
+        ObservingModeDetailsGnirsImaging,
+        ObservingModeDetailsGnirsSpectroscopy,
+        ObservingModeDetailsIgrins2LongSlit,
+        ObservingModeDetailsVisitor,
+        OpportunityTargetDetails,
+        OpportunityTargetDetailsRegion,
+        OpportunityTargetDetailsRegionDeclinationArc,
+        OpportunityTargetDetailsRegionDeclinationArcEnd,
+        OpportunityTargetDetailsRegionDeclinationArcStart,
+        OpportunityTargetDetailsRegionRightAscensionArc,
+        OpportunityTargetDetailsRegionRightAscensionArcEnd,
+        OpportunityTargetDetailsRegionRightAscensionArcStart,
+        ProgramCore,
+        ProgramDetail,
+        ProgramDetailActive,
+        ProgramDetailPi,
+        ProgramDetailProposal,
+        ProgramDetailProposalCall,
+        ProgramDetailProposalCallActive,
+        ProgramDetailProposalCallGemini,
+        ProgramDetailProposalCallKeck,
+        ProgramDetailProposalCallSubaru,
+        ProgramDetailProposalGemini,
+        ProgramGroupElements,
+        ProgramGroupElementsAllGroupElements,
+        ProgramGroupElementsAllGroupElementsGroup,
+        ProgramGroupElementsAllGroupElementsGroupMaximumInterval,
+        ProgramGroupElementsAllGroupElementsGroupMinimumInterval,
+        ProgramGroupElementsAllGroupElementsObservation,
+        ProgramSummary,
+        ProgramSummaryReference,
+        SchedulerProposal,
+        SchedulerProposalCall,
+        SchedulerProposalCallActive,
+        SchedulerProposalCallGemini,
+        SchedulerProposalCallKeck,
+        SchedulerProposalCallSubaru,
+        SchedulerProposalGemini,
+        ScienceRequirementsDetails,
+        SiderealTargetDetails,
+        SiderealTargetDetailsDec,
+        SiderealTargetDetailsRa,
+        TargetCore,
+        TargetDetails,
+        TargetDetailsNonsidereal,
+        TargetDetailsOpportunity,
+        TargetDetailsSidereal,
+        TargetEnvironmentDetails,
+        TargetEnvironmentDetailsAsterism,
+        TargetEnvironmentDetailsAsterismNonsidereal,
+        TargetEnvironmentDetailsAsterismSidereal,
+        TargetEnvironmentDetailsExplicitBase,
+        TargetEnvironmentDetailsExplicitBaseDec,
+        TargetEnvironmentDetailsExplicitBaseRa,
+        TargetProgramSummary,
+        TargetProgramSummaryProgram,
+        TargetSummary,
+        TargetSummaryProgram,
+        TimingWindowDetails,
+        TimingWindowDetailsEndTimingWindowEndAfter,
+        TimingWindowDetailsEndTimingWindowEndAfterAfter,
+        TimingWindowDetailsEndTimingWindowEndAfterRepeat,
+        TimingWindowDetailsEndTimingWindowEndAfterRepeatPeriod,
+        TimingWindowDetailsEndTimingWindowEndAt,
+        VisitorDetails,
+        VisitorDetailsAgsDiameter,
+        VisitorDetailsCentralWavelength,
+        VisitorDetailsTotalRequestTime,
+        WorkflowCore,
+        WorkflowDetails,
+        WorkflowDetailsValue,
+        WorkflowDetailsValueValidationErrors,
+    )
+    from .get_call_for_proposals import (
+        GetCallForProposals,
+        GetCallForProposalsCallForProposals,
+    )
+    from .get_calls_for_proposals import (
+        GetCallsForProposals,
+        GetCallsForProposalsCallsForProposals,
+        GetCallsForProposalsCallsForProposalsMatches,
+    )
+    from .get_goats_observations import (
+        GetGOATSObservations,
+        GetGOATSObservationsObservations,
+        GetGOATSObservationsObservationsMatches,
+        GetGOATSObservationsObservationsMatchesAttachments,
+        GetGOATSObservationsObservationsMatchesConstraintSet,
+        GetGOATSObservationsObservationsMatchesConstraintSetElevationRange,
+        GetGOATSObservationsObservationsMatchesConstraintSetElevationRangeAirMass,
+        GetGOATSObservationsObservationsMatchesConstraintSetElevationRangeHourAngle,
+        GetGOATSObservationsObservationsMatchesObservationDuration,
+        GetGOATSObservationsObservationsMatchesObservingMode,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImaging,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFilters,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeMode,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeSignalToNoise,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeSignalToNoiseAt,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeTimeAndCount,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeTimeAndCountAt,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeTimeAndCountTime,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariant,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGrouped,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsets,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumerated,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValues,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValuesOffset,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValuesOffsetP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValuesOffsetQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandom,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiral,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniform,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerA,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerAP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerAQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerB,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerBP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerBQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsets,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumerated,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValues,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffset,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandom,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiral,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniform,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerA,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerAP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerAQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerB,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerBP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerBQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleaved,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsets,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumerated,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValues,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValuesOffset,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandom,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiral,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniform,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerA,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerAP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerAQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerB,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerBP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerBQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsets,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumerated,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValues,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffset,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandom,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiral,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniform,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerA,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerAP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerAQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerB,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerBP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerBQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImaging,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset1,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset1P,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset1Q,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset2,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset2P,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset2Q,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset3,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset3P,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset3Q,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset4,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset4P,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset4Q,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlit,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitCentralWavelength,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeMode,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeSignalToNoise,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeSignalToNoiseAt,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeTimeAndCount,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeTimeAndCountAt,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeTimeAndCountTime,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitOffsets,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitWavelengthDithers,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImaging,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFilters,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeMode,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeSignalToNoise,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeSignalToNoiseAt,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeTimeAndCount,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeTimeAndCountAt,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeTimeAndCountTime,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariant,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGrouped,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsets,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumerated,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValues,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValuesOffset,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValuesOffsetP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValuesOffsetQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandom,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiral,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniform,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerA,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerAP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerAQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerB,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerBP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerBQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsets,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumerated,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValues,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffset,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandom,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiral,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniform,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerA,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerAP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerAQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerB,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerBP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerBQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleaved,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsets,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumerated,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValues,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValuesOffset,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandom,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiral,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniform,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerA,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerAP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerAQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerB,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerBP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerBQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsets,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumerated,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValues,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffset,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandom,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiral,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralCenter,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralCenterP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralCenterQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralSize,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniform,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerA,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerAP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerAQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerB,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerBP,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerBQ,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImaging,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset1,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset1P,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset1Q,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset2,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset2P,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset2Q,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset3,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset3P,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset3Q,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset4,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset4P,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset4Q,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlit,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitCentralWavelength,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeMode,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeSignalToNoise,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeSignalToNoiseAt,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeTimeAndCount,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeTimeAndCountAt,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeTimeAndCountTime,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitOffsets,
+        GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitWavelengthDithers,
+        GetGOATSObservationsObservationsMatchesPosAngleConstraint,
+        GetGOATSObservationsObservationsMatchesPosAngleConstraintAngle,
+        GetGOATSObservationsObservationsMatchesProgram,
+        GetGOATSObservationsObservationsMatchesProgramAllocations,
+        GetGOATSObservationsObservationsMatchesProgramAllocationsDuration,
+        GetGOATSObservationsObservationsMatchesProgramTimeCharge,
+        GetGOATSObservationsObservationsMatchesProgramTimeChargeTime,
+        GetGOATSObservationsObservationsMatchesProgramTimeChargeTimeProgram,
+        GetGOATSObservationsObservationsMatchesReference,
+        GetGOATSObservationsObservationsMatchesScienceRequirements,
+        GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeMode,
+        GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeSignalToNoise,
+        GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeSignalToNoiseAt,
+        GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeTimeAndCount,
+        GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeTimeAndCountAt,
+        GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeTimeAndCountTime,
+        GetGOATSObservationsObservationsMatchesScienceRequirementsSpectroscopy,
+        GetGOATSObservationsObservationsMatchesScienceRequirementsSpectroscopyWavelength,
+        GetGOATSObservationsObservationsMatchesTargetEnvironment,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentAsterism,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentAsterismOpportunity,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTarget,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetOpportunity,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSidereal,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealDec,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealParallax,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealProperMotion,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealProperMotionDec,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealProperMotionRa,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealRa,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealRadialVelocity,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfile,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePoint,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalized,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedBrightnesses,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedSed,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedSedFluxDensities,
+        GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedSedFluxDensitiesWavelength,
+        GetGOATSObservationsObservationsMatchesTimingWindows,
+        GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfter,
+        GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfterAfter,
+        GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfterRepeat,
+        GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfterRepeatPeriod,
+        GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAt,
+        GetGOATSObservationsObservationsMatchesWorkflow,
+        GetGOATSObservationsObservationsMatchesWorkflowValue,
+        GetGOATSObservationsObservationsMatchesWorkflowValueValidationErrors,
+    )
+    from .get_goats_programs import (
+        GetGOATSPrograms,
+        GetGOATSProgramsPrograms,
+        GetGOATSProgramsProgramsMatches,
+        GetGOATSProgramsProgramsMatchesReference,
+    )
+    from .get_observation import GetObservation, GetObservationObservation
+    from .get_observation_attachments_by_id import (
+        GetObservationAttachmentsById,
+        GetObservationAttachmentsByIdObservation,
+        GetObservationAttachmentsByIdObservationAttachments,
+    )
+    from .get_observation_attachments_by_reference import (
+        GetObservationAttachmentsByReference,
+        GetObservationAttachmentsByReferenceObservation,
+        GetObservationAttachmentsByReferenceObservationAttachments,
+    )
+    from .get_observation_summaries import (
+        GetObservationSummaries,
+        GetObservationSummariesObservations,
+        GetObservationSummariesObservationsMatches,
+    )
+    from .get_observation_workflow_state_by_id import (
+        GetObservationWorkflowStateById,
+        GetObservationWorkflowStateByIdObservation,
+        GetObservationWorkflowStateByIdObservationProgram,
+        GetObservationWorkflowStateByIdObservationWorkflow,
+    )
+    from .get_observation_workflow_state_by_reference import (
+        GetObservationWorkflowStateByReference,
+        GetObservationWorkflowStateByReferenceObservation,
+        GetObservationWorkflowStateByReferenceObservationProgram,
+        GetObservationWorkflowStateByReferenceObservationWorkflow,
+    )
+    from .get_observations import (
+        GetObservations,
+        GetObservationsObservations,
+        GetObservationsObservationsMatches,
+    )
+    from .get_program_attachments_by_id import (
+        GetProgramAttachmentsById,
+        GetProgramAttachmentsByIdProgram,
+        GetProgramAttachmentsByIdProgramAttachments,
+    )
+    from .get_program_attachments_by_proposal_reference import (
+        GetProgramAttachmentsByProposalReference,
+        GetProgramAttachmentsByProposalReferenceProgram,
+        GetProgramAttachmentsByProposalReferenceProgramAttachments,
+    )
+    from .get_program_attachments_by_reference import (
+        GetProgramAttachmentsByReference,
+        GetProgramAttachmentsByReferenceProgram,
+        GetProgramAttachmentsByReferenceProgramAttachments,
+    )
+    from .get_program_by_id import GetProgramById, GetProgramByIdProgram
+    from .get_program_by_proposal_reference import (
+        GetProgramByProposalReference,
+        GetProgramByProposalReferenceProgram,
+    )
+    from .get_program_by_reference import (
+        GetProgramByReference,
+        GetProgramByReferenceProgram,
+    )
+    from .get_program_summaries import (
+        GetProgramSummaries,
+        GetProgramSummariesPrograms,
+        GetProgramSummariesProgramsMatches,
+    )
+    from .get_programs import (
+        GetPrograms,
+        GetProgramsPrograms,
+        GetProgramsProgramsMatches,
+    )
+    from .get_scheduler_all_programs_id import (
+        GetSchedulerAllProgramsId,
+        GetSchedulerAllProgramsIdPrograms,
+        GetSchedulerAllProgramsIdProgramsMatches,
+        GetSchedulerAllProgramsIdProgramsMatchesReference,
+    )
+    from .get_scheduler_programs import (
+        GetSchedulerPrograms,
+        GetSchedulerProgramsPrograms,
+        GetSchedulerProgramsProgramsMatches,
+        GetSchedulerProgramsProgramsMatchesActive,
+        GetSchedulerProgramsProgramsMatchesAllGroupElements,
+        GetSchedulerProgramsProgramsMatchesAllGroupElementsGroup,
+        GetSchedulerProgramsProgramsMatchesAllGroupElementsGroupMaximumInterval,
+        GetSchedulerProgramsProgramsMatchesAllGroupElementsGroupMinimumInterval,
+        GetSchedulerProgramsProgramsMatchesAllGroupElementsObservation,
+        GetSchedulerProgramsProgramsMatchesAllocations,
+        GetSchedulerProgramsProgramsMatchesAllocationsDuration,
+        GetSchedulerProgramsProgramsMatchesProposal,
+        GetSchedulerProgramsProgramsMatchesReference,
+        GetSchedulerProgramsProgramsMatchesTimeCharge,
+        GetSchedulerProgramsProgramsMatchesTimeChargeTime,
+        GetSchedulerProgramsProgramsMatchesTimeChargeTimeNonCharged,
+        GetSchedulerProgramsProgramsMatchesTimeChargeTimeProgram,
+        GetSchedulerProgramsProgramsMatchesTimeChargeTimeTotal,
+    )
+    from .get_target_by_id import GetTargetById, GetTargetByIdTarget
+    from .get_target_summaries import (
+        GetTargetSummaries,
+        GetTargetSummariesTargets,
+        GetTargetSummariesTargetsMatches,
+    )
+    from .get_targets import GetTargets, GetTargetsTargets, GetTargetsTargetsMatches
+    from .obs_calculation_update import (
+        ObsCalculationUpdate,
+        ObsCalculationUpdateObscalcUpdate,
+        ObsCalculationUpdateObscalcUpdateValue,
+        ObsCalculationUpdateObscalcUpdateValueExecution,
+        ObsCalculationUpdateObscalcUpdateValueExecutionVisits,
+        ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatches,
+        ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatchesAtomRecords,
+        ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatchesAtomRecordsMatches,
+        ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatchesObservation,
+    )
+    from .observation_edit import (
+        ObservationEdit,
+        ObservationEditObservationEdit,
+        ObservationEditObservationEditValue,
+        ObservationEditObservationEditValueConstraintSet,
+        ObservationEditObservationEditValueConstraintSetElevationRange,
+        ObservationEditObservationEditValueConstraintSetElevationRangeAirMass,
+        ObservationEditObservationEditValueConstraintSetElevationRangeHourAngle,
+        ObservationEditObservationEditValueObservingMode,
+        ObservationEditObservationEditValueObservingModeGmosNorthLongSlit,
+        ObservationEditObservationEditValueObservingModeGmosNorthLongSlitCentralWavelength,
+        ObservationEditObservationEditValueObservingModeGmosSouthLongSlit,
+        ObservationEditObservationEditValueObservingModeGmosSouthLongSlitCentralWavelength,
+        ObservationEditObservationEditValueReference,
+        ObservationEditObservationEditValueScienceRequirements,
+        ObservationEditObservationEditValueTargetEnvironment,
+        ObservationEditObservationEditValueTargetEnvironmentAsterism,
+        ObservationEditObservationEditValueTargetEnvironmentAsterismNonsidereal,
+        ObservationEditObservationEditValueTargetEnvironmentAsterismSidereal,
+        ObservationEditObservationEditValueTargetEnvironmentAsterismSiderealDec,
+        ObservationEditObservationEditValueTargetEnvironmentAsterismSiderealRa,
+        ObservationEditObservationEditValueTargetEnvironmentExplicitBase,
+        ObservationEditObservationEditValueTargetEnvironmentExplicitBaseDec,
+        ObservationEditObservationEditValueTargetEnvironmentExplicitBaseRa,
+        ObservationEditObservationEditValueTimingWindows,
+        ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfter,
+        ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfterAfter,
+        ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfterRepeat,
+        ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfterRepeatPeriod,
+        ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAt,
+    )
+    from .ping import Ping, PingPrograms, PingProgramsMatches
+    from .program_edit import (
+        ProgramEdit,
+        ProgramEditProgramEdit,
+        ProgramEditProgramEditValue,
+        ProgramEditProgramEditValueAllGroupElements,
+        ProgramEditProgramEditValueAllGroupElementsGroup,
+        ProgramEditProgramEditValueAllGroupElementsObservation,
+    )
+    from .restore_call_for_proposals_by_id import (
+        RestoreCallForProposalsById,
+        RestoreCallForProposalsByIdUpdateCallsForProposals,
+        RestoreCallForProposalsByIdUpdateCallsForProposalsCallsForProposals,
+    )
+    from .restore_observation_by_id import (
+        RestoreObservationById,
+        RestoreObservationByIdUpdateObservations,
+        RestoreObservationByIdUpdateObservationsObservations,
+    )
+    from .restore_observation_by_reference import (
+        RestoreObservationByReference,
+        RestoreObservationByReferenceUpdateObservations,
+        RestoreObservationByReferenceUpdateObservationsObservations,
+    )
+    from .restore_program_by_id import (
+        RestoreProgramById,
+        RestoreProgramByIdUpdatePrograms,
+        RestoreProgramByIdUpdateProgramsPrograms,
+        RestoreProgramByIdUpdateProgramsProgramsAllGroupElements,
+        RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsGroup,
+        RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMaximumInterval,
+        RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMinimumInterval,
+        RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsObservation,
+    )
+    from .restore_target_by_id import (
+        RestoreTargetById,
+        RestoreTargetByIdUpdateTargets,
+        RestoreTargetByIdUpdateTargetsTargets,
+        RestoreTargetByIdUpdateTargetsTargetsProgram,
+    )
+    from .scheduler_observations_updates import (
+        SchedulerObservationsUpdates,
+        SchedulerObservationsUpdatesObscalcUpdate,
+        SchedulerObservationsUpdatesObscalcUpdateValue,
+        SchedulerObservationsUpdatesObscalcUpdateValueConstraintSet,
+        SchedulerObservationsUpdatesObscalcUpdateValueConstraintSetElevationRange,
+        SchedulerObservationsUpdatesObscalcUpdateValueConstraintSetElevationRangeAirMass,
+        SchedulerObservationsUpdatesObscalcUpdateValueConstraintSetElevationRangeHourAngle,
+        SchedulerObservationsUpdatesObscalcUpdateValueExecution,
+        SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisits,
+        SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatches,
+        SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatchesAtomRecords,
+        SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatchesAtomRecordsMatches,
+        SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatchesObservation,
+        SchedulerObservationsUpdatesObscalcUpdateValueProgram,
+        SchedulerObservationsUpdatesObscalcUpdateValueProgramActive,
+        SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironment,
+        SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterism,
+        SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismNonsidereal,
+        SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismSidereal,
+        SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismSiderealDec,
+        SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismSiderealRa,
+        SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentExplicitBase,
+        SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentExplicitBaseDec,
+        SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentExplicitBaseRa,
+        SchedulerObservationsUpdatesObscalcUpdateValueTimingWindows,
+        SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfter,
+        SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfterAfter,
+        SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfterRepeat,
+        SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfterRepeatPeriod,
+        SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAt,
+        SchedulerObservationsUpdatesObscalcUpdateValueWorkflow,
+        SchedulerObservationsUpdatesObscalcUpdateValueWorkflowValue,
+    )
+    from .set_observation_workflow_state import (
+        SetObservationWorkflowState,
+        SetObservationWorkflowStateSetObservationWorkflowState,
+    )
+    from .target_edit import (
+        TargetEdit,
+        TargetEditTargetEdit,
+        TargetEditTargetEditValue,
+        TargetEditTargetEditValueNonsidereal,
+        TargetEditTargetEditValueSidereal,
+        TargetEditTargetEditValueSiderealDec,
+        TargetEditTargetEditValueSiderealRa,
+    )
+    from .update_call_for_proposals_by_id import (
+        UpdateCallForProposalsById,
+        UpdateCallForProposalsByIdUpdateCallsForProposals,
+        UpdateCallForProposalsByIdUpdateCallsForProposalsCallsForProposals,
+    )
+    from .update_calls_for_proposals import (
+        UpdateCallsForProposals,
+        UpdateCallsForProposalsUpdateCallsForProposals,
+        UpdateCallsForProposalsUpdateCallsForProposalsCallsForProposals,
+    )
+    from .update_observation_by_id import (
+        UpdateObservationById,
+        UpdateObservationByIdUpdateObservations,
+        UpdateObservationByIdUpdateObservationsObservations,
+    )
+    from .update_observation_by_reference import (
+        UpdateObservationByReference,
+        UpdateObservationByReferenceUpdateObservations,
+        UpdateObservationByReferenceUpdateObservationsObservations,
+    )
+    from .update_observations import (
+        UpdateObservations,
+        UpdateObservationsUpdateObservations,
+        UpdateObservationsUpdateObservationsObservations,
+    )
+    from .update_program_by_id import (
+        UpdateProgramById,
+        UpdateProgramByIdUpdatePrograms,
+        UpdateProgramByIdUpdateProgramsPrograms,
+    )
+    from .update_programs import (
+        UpdatePrograms,
+        UpdateProgramsUpdatePrograms,
+        UpdateProgramsUpdateProgramsPrograms,
+    )
+    from .update_target_by_id import (
+        UpdateTargetById,
+        UpdateTargetByIdUpdateTargets,
+        UpdateTargetByIdUpdateTargetsTargets,
+    )
+    from .update_targets import (
+        UpdateTargets,
+        UpdateTargetsUpdateTargets,
+        UpdateTargetsUpdateTargetsTargets,
+    )
+__all__ = [
+    "AttachmentDetails",
+    "BaseStruct",
+    "CallForProposalsCore",
+    "CallForProposalsCoreGemini",
+    "CallForProposalsCoreKeck",
+    "CallForProposalsCoreSubaru",
+    "CallForProposalsDetails",
+    "CallForProposalsDetailsActive",
+    "CloneObservation",
+    "CloneObservationCloneObservation",
+    "CloneObservationCloneObservationNewObservation",
+    "CloneTarget",
+    "CloneTargetCloneTarget",
+    "CloneTargetCloneTargetNewTarget",
+    "ConstraintSetDetails",
+    "ConstraintSetDetailsElevationRange",
+    "ConstraintSetDetailsElevationRangeAirMass",
+    "ConstraintSetDetailsElevationRangeHourAngle",
+    "CreateCallForProposals",
+    "CreateCallForProposalsCreateCallForProposals",
+    "CreateCallForProposalsCreateCallForProposalsCallForProposals",
+    "CreateObservation",
+    "CreateObservationCreateObservation",
+    "CreateObservationCreateObservationObservation",
+    "CreateProgram",
+    "CreateProgramCreateProgram",
+    "CreateProgramCreateProgramProgram",
+    "CreateTargetByProgramId",
+    "CreateTargetByProgramIdCreateTarget",
+    "CreateTargetByProgramIdCreateTargetTarget",
+    "CreateTargetByProgramReference",
+    "CreateTargetByProgramReferenceCreateTarget",
+    "CreateTargetByProgramReferenceCreateTargetTarget",
+    "CreateTargetByProposalReference",
+    "CreateTargetByProposalReferenceCreateTarget",
+    "CreateTargetByProposalReferenceCreateTargetTarget",
+    "DeleteCallForProposalsById",
+    "DeleteCallForProposalsByIdUpdateCallsForProposals",
+    "DeleteCallForProposalsByIdUpdateCallsForProposalsCallsForProposals",
+    "DeleteObservationById",
+    "DeleteObservationByIdUpdateObservations",
+    "DeleteObservationByIdUpdateObservationsObservations",
+    "DeleteObservationByReference",
+    "DeleteObservationByReferenceUpdateObservations",
+    "DeleteObservationByReferenceUpdateObservationsObservations",
+    "DeleteProgramById",
+    "DeleteProgramByIdUpdatePrograms",
+    "DeleteProgramByIdUpdateProgramsPrograms",
+    "DeleteProgramByIdUpdateProgramsProgramsAllGroupElements",
+    "DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsGroup",
+    "DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMaximumInterval",
+    "DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMinimumInterval",
+    "DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsObservation",
+    "DeleteTargetById",
+    "DeleteTargetByIdUpdateTargets",
+    "DeleteTargetByIdUpdateTargetsTargets",
+    "DeleteTargetByIdUpdateTargetsTargetsProgram",
+    "Flamingos2ImagingDetails",
+    "Flamingos2ImagingDetailsFilters",
+    "Flamingos2ImagingDetailsFiltersExposureTimeMode",
+    "Flamingos2ImagingDetailsFiltersExposureTimeModeSignalToNoise",
+    "Flamingos2ImagingDetailsFiltersExposureTimeModeSignalToNoiseAt",
+    "Flamingos2ImagingDetailsFiltersExposureTimeModeTimeAndCount",
+    "Flamingos2ImagingDetailsFiltersExposureTimeModeTimeAndCountTime",
+    "Flamingos2ImagingDetailsInitialFilters",
+    "Flamingos2ImagingDetailsInitialFiltersExposureTimeMode",
+    "Flamingos2ImagingDetailsInitialFiltersExposureTimeModeSignalToNoise",
+    "Flamingos2ImagingDetailsInitialFiltersExposureTimeModeSignalToNoiseAt",
+    "Flamingos2ImagingDetailsInitialFiltersExposureTimeModeTimeAndCount",
+    "Flamingos2ImagingDetailsInitialFiltersExposureTimeModeTimeAndCountAt",
+    "Flamingos2ImagingDetailsInitialFiltersExposureTimeModeTimeAndCountTime",
+    "Flamingos2LongSlitDetails",
+    "Flamingos2LongSlitDetailsAcquisition",
+    "Flamingos2LongSlitDetailsAcquisitionExposureTimeMode",
+    "Flamingos2LongSlitDetailsAcquisitionExposureTimeModeSignalToNoise",
+    "Flamingos2LongSlitDetailsAcquisitionExposureTimeModeSignalToNoiseAt",
+    "Flamingos2LongSlitDetailsAcquisitionExposureTimeModeTimeAndCount",
+    "Flamingos2LongSlitDetailsAcquisitionExposureTimeModeTimeAndCountAt",
+    "Flamingos2LongSlitDetailsAcquisitionExposureTimeModeTimeAndCountTime",
+    "Flamingos2LongSlitDetailsExposureTimeMode",
+    "Flamingos2LongSlitDetailsExposureTimeModeSignalToNoise",
+    "Flamingos2LongSlitDetailsExposureTimeModeSignalToNoiseAt",
+    "Flamingos2LongSlitDetailsExposureTimeModeTimeAndCount",
+    "Flamingos2LongSlitDetailsExposureTimeModeTimeAndCountAt",
+    "Flamingos2LongSlitDetailsExposureTimeModeTimeAndCountTime",
+    "Flamingos2LongSlitDetailsTelluricType",
+    "GetCallForProposals",
+    "GetCallForProposalsCallForProposals",
+    "GetCallsForProposals",
+    "GetCallsForProposalsCallsForProposals",
+    "GetCallsForProposalsCallsForProposalsMatches",
+    "GetGOATSObservations",
+    "GetGOATSObservationsObservations",
+    "GetGOATSObservationsObservationsMatches",
+    "GetGOATSObservationsObservationsMatchesAttachments",
+    "GetGOATSObservationsObservationsMatchesConstraintSet",
+    "GetGOATSObservationsObservationsMatchesConstraintSetElevationRange",
+    "GetGOATSObservationsObservationsMatchesConstraintSetElevationRangeAirMass",
+    "GetGOATSObservationsObservationsMatchesConstraintSetElevationRangeHourAngle",
+    "GetGOATSObservationsObservationsMatchesObservationDuration",
+    "GetGOATSObservationsObservationsMatchesObservingMode",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImaging",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFilters",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeMode",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeSignalToNoise",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeSignalToNoiseAt",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeTimeAndCount",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeTimeAndCountAt",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeTimeAndCountTime",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariant",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGrouped",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsets",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumerated",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValues",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValuesOffset",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValuesOffsetP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValuesOffsetQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandom",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomCenter",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomCenterP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomCenterQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomSize",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiral",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralCenter",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralCenterP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralCenterQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralSize",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniform",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerA",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerAP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerAQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerB",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerBP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerBQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsets",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumerated",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValues",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffset",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandom",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomCenter",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomCenterP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomCenterQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomSize",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiral",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralCenter",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralCenterP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralCenterQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralSize",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniform",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerA",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerAP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerAQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerB",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerBP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerBQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleaved",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsets",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumerated",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValues",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValuesOffset",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandom",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomCenter",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomCenterP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomCenterQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomSize",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiral",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralCenter",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralCenterP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralCenterQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralSize",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniform",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerA",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerAP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerAQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerB",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerBP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerBQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsets",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumerated",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValues",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffset",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandom",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomCenter",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomCenterP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomCenterQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomSize",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiral",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralCenter",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralCenterP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralCenterQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralSize",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniform",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerA",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerAP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerAQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerB",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerBP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerBQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImaging",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset1",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset1P",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset1Q",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset2",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset2P",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset2Q",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset3",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset3P",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset3Q",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset4",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset4P",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset4Q",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlit",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitCentralWavelength",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeMode",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeSignalToNoise",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeSignalToNoiseAt",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeTimeAndCount",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeTimeAndCountAt",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeTimeAndCountTime",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitOffsets",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitWavelengthDithers",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImaging",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFilters",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeMode",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeSignalToNoise",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeSignalToNoiseAt",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeTimeAndCount",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeTimeAndCountAt",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeTimeAndCountTime",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariant",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGrouped",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsets",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumerated",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValues",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValuesOffset",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValuesOffsetP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValuesOffsetQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandom",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomCenter",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomCenterP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomCenterQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomSize",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiral",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralCenter",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralCenterP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralCenterQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralSize",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniform",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerA",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerAP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerAQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerB",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerBP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerBQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsets",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumerated",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValues",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffset",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandom",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomCenter",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomCenterP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomCenterQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomSize",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiral",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralCenter",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralCenterP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralCenterQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralSize",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniform",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerA",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerAP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerAQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerB",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerBP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerBQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleaved",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsets",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumerated",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValues",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValuesOffset",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandom",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomCenter",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomCenterP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomCenterQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomSize",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiral",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralCenter",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralCenterP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralCenterQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralSize",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniform",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerA",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerAP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerAQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerB",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerBP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerBQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsets",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumerated",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValues",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffset",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandom",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomCenter",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomCenterP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomCenterQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomSize",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiral",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralCenter",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralCenterP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralCenterQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralSize",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniform",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerA",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerAP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerAQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerB",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerBP",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerBQ",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImaging",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset1",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset1P",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset1Q",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset2",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset2P",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset2Q",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset3",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset3P",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset3Q",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset4",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset4P",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset4Q",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlit",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitCentralWavelength",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeMode",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeSignalToNoise",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeSignalToNoiseAt",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeTimeAndCount",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeTimeAndCountAt",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeTimeAndCountTime",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitOffsets",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitWavelengthDithers",
+    "GetGOATSObservationsObservationsMatchesPosAngleConstraint",
+    "GetGOATSObservationsObservationsMatchesPosAngleConstraintAngle",
+    "GetGOATSObservationsObservationsMatchesProgram",
+    "GetGOATSObservationsObservationsMatchesProgramAllocations",
+    "GetGOATSObservationsObservationsMatchesProgramAllocationsDuration",
+    "GetGOATSObservationsObservationsMatchesProgramTimeCharge",
+    "GetGOATSObservationsObservationsMatchesProgramTimeChargeTime",
+    "GetGOATSObservationsObservationsMatchesProgramTimeChargeTimeProgram",
+    "GetGOATSObservationsObservationsMatchesReference",
+    "GetGOATSObservationsObservationsMatchesScienceRequirements",
+    "GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeMode",
+    "GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeSignalToNoise",
+    "GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeSignalToNoiseAt",
+    "GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeTimeAndCount",
+    "GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeTimeAndCountAt",
+    "GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeTimeAndCountTime",
+    "GetGOATSObservationsObservationsMatchesScienceRequirementsSpectroscopy",
+    "GetGOATSObservationsObservationsMatchesScienceRequirementsSpectroscopyWavelength",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironment",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentAsterism",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentAsterismOpportunity",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTarget",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetOpportunity",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSidereal",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealDec",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealParallax",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealProperMotion",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealProperMotionDec",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealProperMotionRa",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealRa",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealRadialVelocity",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfile",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePoint",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalized",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedBrightnesses",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedSed",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedSedFluxDensities",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedSedFluxDensitiesWavelength",
+    "GetGOATSObservationsObservationsMatchesTimingWindows",
+    "GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfter",
+    "GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfterAfter",
+    "GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfterRepeat",
+    "GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfterRepeatPeriod",
+    "GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAt",
+    "GetGOATSObservationsObservationsMatchesWorkflow",
+    "GetGOATSObservationsObservationsMatchesWorkflowValue",
+    "GetGOATSObservationsObservationsMatchesWorkflowValueValidationErrors",
+    "GetGOATSPrograms",
+    "GetGOATSProgramsPrograms",
+    "GetGOATSProgramsProgramsMatches",
+    "GetGOATSProgramsProgramsMatchesReference",
+    "GetObservation",
+    "GetObservationAttachmentsById",
+    "GetObservationAttachmentsByIdObservation",
+    "GetObservationAttachmentsByIdObservationAttachments",
+    "GetObservationAttachmentsByReference",
+    "GetObservationAttachmentsByReferenceObservation",
+    "GetObservationAttachmentsByReferenceObservationAttachments",
+    "GetObservationObservation",
+    "GetObservationSummaries",
+    "GetObservationSummariesObservations",
+    "GetObservationSummariesObservationsMatches",
+    "GetObservationWorkflowStateById",
+    "GetObservationWorkflowStateByIdObservation",
+    "GetObservationWorkflowStateByIdObservationProgram",
+    "GetObservationWorkflowStateByIdObservationWorkflow",
+    "GetObservationWorkflowStateByReference",
+    "GetObservationWorkflowStateByReferenceObservation",
+    "GetObservationWorkflowStateByReferenceObservationProgram",
+    "GetObservationWorkflowStateByReferenceObservationWorkflow",
+    "GetObservations",
+    "GetObservationsObservations",
+    "GetObservationsObservationsMatches",
+    "GetProgramAttachmentsById",
+    "GetProgramAttachmentsByIdProgram",
+    "GetProgramAttachmentsByIdProgramAttachments",
+    "GetProgramAttachmentsByProposalReference",
+    "GetProgramAttachmentsByProposalReferenceProgram",
+    "GetProgramAttachmentsByProposalReferenceProgramAttachments",
+    "GetProgramAttachmentsByReference",
+    "GetProgramAttachmentsByReferenceProgram",
+    "GetProgramAttachmentsByReferenceProgramAttachments",
+    "GetProgramById",
+    "GetProgramByIdProgram",
+    "GetProgramByProposalReference",
+    "GetProgramByProposalReferenceProgram",
+    "GetProgramByReference",
+    "GetProgramByReferenceProgram",
+    "GetProgramSummaries",
+    "GetProgramSummariesPrograms",
+    "GetProgramSummariesProgramsMatches",
+    "GetPrograms",
+    "GetProgramsPrograms",
+    "GetProgramsProgramsMatches",
+    "GetSchedulerAllProgramsId",
+    "GetSchedulerAllProgramsIdPrograms",
+    "GetSchedulerAllProgramsIdProgramsMatches",
+    "GetSchedulerAllProgramsIdProgramsMatchesReference",
+    "GetSchedulerPrograms",
+    "GetSchedulerProgramsPrograms",
+    "GetSchedulerProgramsProgramsMatches",
+    "GetSchedulerProgramsProgramsMatchesActive",
+    "GetSchedulerProgramsProgramsMatchesAllGroupElements",
+    "GetSchedulerProgramsProgramsMatchesAllGroupElementsGroup",
+    "GetSchedulerProgramsProgramsMatchesAllGroupElementsGroupMaximumInterval",
+    "GetSchedulerProgramsProgramsMatchesAllGroupElementsGroupMinimumInterval",
+    "GetSchedulerProgramsProgramsMatchesAllGroupElementsObservation",
+    "GetSchedulerProgramsProgramsMatchesAllocations",
+    "GetSchedulerProgramsProgramsMatchesAllocationsDuration",
+    "GetSchedulerProgramsProgramsMatchesProposal",
+    "GetSchedulerProgramsProgramsMatchesReference",
+    "GetSchedulerProgramsProgramsMatchesTimeCharge",
+    "GetSchedulerProgramsProgramsMatchesTimeChargeTime",
+    "GetSchedulerProgramsProgramsMatchesTimeChargeTimeNonCharged",
+    "GetSchedulerProgramsProgramsMatchesTimeChargeTimeProgram",
+    "GetSchedulerProgramsProgramsMatchesTimeChargeTimeTotal",
+    "GetTargetById",
+    "GetTargetByIdTarget",
+    "GetTargetSummaries",
+    "GetTargetSummariesTargets",
+    "GetTargetSummariesTargetsMatches",
+    "GetTargets",
+    "GetTargetsTargets",
+    "GetTargetsTargetsMatches",
+    "GhostDetectorConfigDetails",
+    "GhostDetectorConfigDetailsExposureTimeMode",
+    "GhostDetectorConfigDetailsExposureTimeModeSignalToNoise",
+    "GhostDetectorConfigDetailsExposureTimeModeSignalToNoiseAt",
+    "GhostDetectorConfigDetailsExposureTimeModeTimeAndCount",
+    "GhostDetectorConfigDetailsExposureTimeModeTimeAndCountAt",
+    "GhostDetectorConfigDetailsExposureTimeModeTimeAndCountTime",
+    "GhostIfuDetails",
+    "GhostIfuDetailsBlue",
+    "GhostIfuDetailsRed",
+    "GhostIfuDetailsSkyPosition",
+    "GhostIfuDetailsSkyPositionDec",
+    "GhostIfuDetailsSkyPositionRa",
+    "GhostIfuDetailsSlitViewingCameraExposureTime",
+    "GmosNorthImagingDetails",
+    "GmosNorthImagingDetailsFilters",
+    "GmosNorthLongSlitDetails",
+    "GmosNorthLongSlitDetailsCentralWavelength",
+    "GmosNorthLongSlitDetailsOffsets",
+    "GmosSouthImagingDetails",
+    "GmosSouthImagingDetailsFilters",
+    "GmosSouthLongSlitDetails",
+    "GmosSouthLongSlitDetailsCentralWavelength",
+    "GmosSouthLongSlitDetailsOffsets",
+    "GnirsDetails",
+    "GnirsDetailsGnirsImaging",
+    "GnirsDetailsGnirsSpectroscopy",
+    "GnirsImagingDetails",
+    "GnirsImagingDetailsFilters",
+    "GnirsImagingDetailsFiltersExposureTimeMode",
+    "GnirsImagingDetailsFiltersExposureTimeModeSignalToNoise",
+    "GnirsImagingDetailsFiltersExposureTimeModeSignalToNoiseAt",
+    "GnirsImagingDetailsFiltersExposureTimeModeTimeAndCount",
+    "GnirsImagingDetailsFiltersExposureTimeModeTimeAndCountAt",
+    "GnirsImagingDetailsFiltersExposureTimeModeTimeAndCountTime",
+    "GnirsImagingDetailsInitialFilters",
+    "GnirsImagingDetailsInitialFiltersExposureTimeMode",
+    "GnirsImagingDetailsInitialFiltersExposureTimeModeSignalToNoise",
+    "GnirsImagingDetailsInitialFiltersExposureTimeModeSignalToNoiseAt",
+    "GnirsImagingDetailsInitialFiltersExposureTimeModeTimeAndCount",
+    "GnirsImagingDetailsInitialFiltersExposureTimeModeTimeAndCountAt",
+    "GnirsImagingDetailsInitialFiltersExposureTimeModeTimeAndCountTime",
+    "GnirsSpectroscopyDetails",
+    "GnirsSpectroscopyDetailsAcquisition",
+    "GnirsSpectroscopyDetailsAcquisitionExposureTimeMode",
+    "GnirsSpectroscopyDetailsAcquisitionExposureTimeModeSignalToNoise",
+    "GnirsSpectroscopyDetailsAcquisitionExposureTimeModeSignalToNoiseAt",
+    "GnirsSpectroscopyDetailsAcquisitionExposureTimeModeTimeAndCount",
+    "GnirsSpectroscopyDetailsAcquisitionExposureTimeModeTimeAndCountAt",
+    "GnirsSpectroscopyDetailsAcquisitionExposureTimeModeTimeAndCountTime",
+    "GnirsSpectroscopyDetailsAcquisitionSkyOffset",
+    "GnirsSpectroscopyDetailsAcquisitionSkyOffsetP",
+    "GnirsSpectroscopyDetailsAcquisitionSkyOffsetQ",
+    "GnirsSpectroscopyDetailsCentralWavelengths",
+    "GnirsSpectroscopyDetailsCentralWavelengthsCentralWavelength",
+    "GnirsSpectroscopyDetailsIfu",
+    "GnirsSpectroscopyDetailsIfuTelescopeConfigs",
+    "GnirsSpectroscopyDetailsIfuTelescopeConfigsOffset",
+    "GnirsSpectroscopyDetailsIfuTelescopeConfigsOffsetP",
+    "GnirsSpectroscopyDetailsIfuTelescopeConfigsOffsetQ",
+    "GnirsSpectroscopyDetailsSlit",
+    "GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigs",
+    "GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsAlongSlit",
+    "GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsAlongSlitQ",
+    "GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSky",
+    "GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSkyOffset",
+    "GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSkyOffsetP",
+    "GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSkyOffsetQ",
+    "GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigs",
+    "GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsAlongSlit",
+    "GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsAlongSlitQ",
+    "GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSky",
+    "GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSkyOffset",
+    "GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSkyOffsetP",
+    "GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSkyOffsetQ",
+    "GnirsSpectroscopyDetailsSlitTelescopeConfigs",
+    "GnirsSpectroscopyDetailsSlitTelescopeConfigsAlongSlit",
+    "GnirsSpectroscopyDetailsSlitTelescopeConfigsAlongSlitQ",
+    "GnirsSpectroscopyDetailsSlitTelescopeConfigsToSky",
+    "GnirsSpectroscopyDetailsSlitTelescopeConfigsToSkyOffset",
+    "GnirsSpectroscopyDetailsSlitTelescopeConfigsToSkyOffsetP",
+    "GnirsSpectroscopyDetailsSlitTelescopeConfigsToSkyOffsetQ",
+    "GnirsSpectroscopyDetailsTelluricType",
+    "Igrins2LongSlitDetails",
+    "Igrins2LongSlitDetailsExposureTimeMode",
+    "Igrins2LongSlitDetailsExposureTimeModeSignalToNoise",
+    "Igrins2LongSlitDetailsExposureTimeModeSignalToNoiseAt",
+    "Igrins2LongSlitDetailsExposureTimeModeTimeAndCount",
+    "Igrins2LongSlitDetailsExposureTimeModeTimeAndCountAt",
+    "Igrins2LongSlitDetailsExposureTimeModeTimeAndCountTime",
+    "Igrins2LongSlitDetailsTelluricType",
+    "NonsiderealTargetDetails",
+    "ObsCalculationUpdate",
+    "ObsCalculationUpdateObscalcUpdate",
+    "ObsCalculationUpdateObscalcUpdateValue",
+    "ObsCalculationUpdateObscalcUpdateValueExecution",
+    "ObsCalculationUpdateObscalcUpdateValueExecutionVisits",
+    "ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatches",
+    "ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatchesAtomRecords",
+    "ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatchesAtomRecordsMatches",
+    "ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatchesObservation",
+    "ObservationCore",
+    "ObservationCoreReference",
+    "ObservationDetails",
+    "ObservationDetailsConstraintSet",
+    "ObservationDetailsExecution",
+    "ObservationDetailsExecutionDigest",
+    "ObservationDetailsExecutionDigestValue",
+    "ObservationDetailsExecutionDigestValueAcquisition",
+    "ObservationDetailsExecutionDigestValueAcquisitionTimeEstimate",
+    "ObservationDetailsExecutionDigestValueAcquisitionTimeEstimateNonCharged",
+    "ObservationDetailsExecutionDigestValueAcquisitionTimeEstimateProgram",
+    "ObservationDetailsExecutionDigestValueAcquisitionTimeEstimateTotal",
+    "ObservationDetailsExecutionDigestValueSetup",
+    "ObservationDetailsExecutionDigestValueSetupFull",
+    "ObservationDetailsExecutionDigestValueSetupReacquisition",
+    "ObservationDetailsObservingMode",
+    "ObservationDetailsProgram",
+    "ObservationDetailsScienceRequirements",
+    "ObservationDetailsTargetEnvironment",
+    "ObservationDetailsTimingWindows",
+    "ObservationDetailsWorkflow",
+    "ObservationEdit",
+    "ObservationEditObservationEdit",
+    "ObservationEditObservationEditValue",
+    "ObservationEditObservationEditValueConstraintSet",
+    "ObservationEditObservationEditValueConstraintSetElevationRange",
+    "ObservationEditObservationEditValueConstraintSetElevationRangeAirMass",
+    "ObservationEditObservationEditValueConstraintSetElevationRangeHourAngle",
+    "ObservationEditObservationEditValueObservingMode",
+    "ObservationEditObservationEditValueObservingModeGmosNorthLongSlit",
+    "ObservationEditObservationEditValueObservingModeGmosNorthLongSlitCentralWavelength",
+    "ObservationEditObservationEditValueObservingModeGmosSouthLongSlit",
+    "ObservationEditObservationEditValueObservingModeGmosSouthLongSlitCentralWavelength",
+    "ObservationEditObservationEditValueReference",
+    "ObservationEditObservationEditValueScienceRequirements",
+    "ObservationEditObservationEditValueTargetEnvironment",
+    "ObservationEditObservationEditValueTargetEnvironmentAsterism",
+    "ObservationEditObservationEditValueTargetEnvironmentAsterismNonsidereal",
+    "ObservationEditObservationEditValueTargetEnvironmentAsterismSidereal",
+    "ObservationEditObservationEditValueTargetEnvironmentAsterismSiderealDec",
+    "ObservationEditObservationEditValueTargetEnvironmentAsterismSiderealRa",
+    "ObservationEditObservationEditValueTargetEnvironmentExplicitBase",
+    "ObservationEditObservationEditValueTargetEnvironmentExplicitBaseDec",
+    "ObservationEditObservationEditValueTargetEnvironmentExplicitBaseRa",
+    "ObservationEditObservationEditValueTimingWindows",
+    "ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfter",
+    "ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfterAfter",
+    "ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfterRepeat",
+    "ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfterRepeatPeriod",
+    "ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAt",
+    "ObservationSummary",
+    "ObservationSummaryProgram",
+    "ObservationSummaryWorkflow",
+    "ObservationWorkflowCore",
+    "ObservationWorkflowDetails",
+    "ObservationWorkflowDetailsValidationErrors",
+    "ObservingModeDetails",
+    "ObservingModeDetailsFlamingos2Imaging",
+    "ObservingModeDetailsFlamingos2LongSlit",
+    "ObservingModeDetailsGhostIfu",
+    "ObservingModeDetailsGmosNorthImaging",
+    "ObservingModeDetailsGmosNorthLongSlit",
+    "ObservingModeDetailsGmosSouthImaging",
+    "ObservingModeDetailsGmosSouthLongSlit",
+    "ObservingModeDetailsGnirsImaging",
+    "ObservingModeDetailsGnirsSpectroscopy",
+    "ObservingModeDetailsIgrins2LongSlit",
+    "ObservingModeDetailsVisitor",
+    "OpportunityTargetDetails",
+    "OpportunityTargetDetailsRegion",
+    "OpportunityTargetDetailsRegionDeclinationArc",
+    "OpportunityTargetDetailsRegionDeclinationArcEnd",
+    "OpportunityTargetDetailsRegionDeclinationArcStart",
+    "OpportunityTargetDetailsRegionRightAscensionArc",
+    "OpportunityTargetDetailsRegionRightAscensionArcEnd",
+    "OpportunityTargetDetailsRegionRightAscensionArcStart",
+    "Ping",
+    "PingPrograms",
+    "PingProgramsMatches",
+    "ProgramCore",
+    "ProgramDetail",
+    "ProgramDetailActive",
+    "ProgramDetailPi",
+    "ProgramDetailProposal",
+    "ProgramDetailProposalCall",
+    "ProgramDetailProposalCallActive",
+    "ProgramDetailProposalCallGemini",
+    "ProgramDetailProposalCallKeck",
+    "ProgramDetailProposalCallSubaru",
+    "ProgramDetailProposalGemini",
+    "ProgramEdit",
+    "ProgramEditProgramEdit",
+    "ProgramEditProgramEditValue",
+    "ProgramEditProgramEditValueAllGroupElements",
+    "ProgramEditProgramEditValueAllGroupElementsGroup",
+    "ProgramEditProgramEditValueAllGroupElementsObservation",
+    "ProgramGroupElements",
+    "ProgramGroupElementsAllGroupElements",
+    "ProgramGroupElementsAllGroupElementsGroup",
+    "ProgramGroupElementsAllGroupElementsGroupMaximumInterval",
+    "ProgramGroupElementsAllGroupElementsGroupMinimumInterval",
+    "ProgramGroupElementsAllGroupElementsObservation",
+    "ProgramSummary",
+    "ProgramSummaryReference",
+    "RestoreCallForProposalsById",
+    "RestoreCallForProposalsByIdUpdateCallsForProposals",
+    "RestoreCallForProposalsByIdUpdateCallsForProposalsCallsForProposals",
+    "RestoreObservationById",
+    "RestoreObservationByIdUpdateObservations",
+    "RestoreObservationByIdUpdateObservationsObservations",
+    "RestoreObservationByReference",
+    "RestoreObservationByReferenceUpdateObservations",
+    "RestoreObservationByReferenceUpdateObservationsObservations",
+    "RestoreProgramById",
+    "RestoreProgramByIdUpdatePrograms",
+    "RestoreProgramByIdUpdateProgramsPrograms",
+    "RestoreProgramByIdUpdateProgramsProgramsAllGroupElements",
+    "RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsGroup",
+    "RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMaximumInterval",
+    "RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMinimumInterval",
+    "RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsObservation",
+    "RestoreTargetById",
+    "RestoreTargetByIdUpdateTargets",
+    "RestoreTargetByIdUpdateTargetsTargets",
+    "RestoreTargetByIdUpdateTargetsTargetsProgram",
+    "SchedulerObservationsUpdates",
+    "SchedulerObservationsUpdatesObscalcUpdate",
+    "SchedulerObservationsUpdatesObscalcUpdateValue",
+    "SchedulerObservationsUpdatesObscalcUpdateValueConstraintSet",
+    "SchedulerObservationsUpdatesObscalcUpdateValueConstraintSetElevationRange",
+    "SchedulerObservationsUpdatesObscalcUpdateValueConstraintSetElevationRangeAirMass",
+    "SchedulerObservationsUpdatesObscalcUpdateValueConstraintSetElevationRangeHourAngle",
+    "SchedulerObservationsUpdatesObscalcUpdateValueExecution",
+    "SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisits",
+    "SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatches",
+    "SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatchesAtomRecords",
+    "SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatchesAtomRecordsMatches",
+    "SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatchesObservation",
+    "SchedulerObservationsUpdatesObscalcUpdateValueProgram",
+    "SchedulerObservationsUpdatesObscalcUpdateValueProgramActive",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironment",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterism",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismNonsidereal",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismSidereal",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismSiderealDec",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismSiderealRa",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentExplicitBase",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentExplicitBaseDec",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentExplicitBaseRa",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTimingWindows",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfter",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfterAfter",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfterRepeat",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfterRepeatPeriod",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAt",
+    "SchedulerObservationsUpdatesObscalcUpdateValueWorkflow",
+    "SchedulerObservationsUpdatesObscalcUpdateValueWorkflowValue",
+    "SchedulerProposal",
+    "SchedulerProposalCall",
+    "SchedulerProposalCallActive",
+    "SchedulerProposalCallGemini",
+    "SchedulerProposalCallKeck",
+    "SchedulerProposalCallSubaru",
+    "SchedulerProposalGemini",
+    "ScienceRequirementsDetails",
+    "SetObservationWorkflowState",
+    "SetObservationWorkflowStateSetObservationWorkflowState",
+    "SiderealTargetDetails",
+    "SiderealTargetDetailsDec",
+    "SiderealTargetDetailsRa",
+    "StructGraphQLClient",
+    "TaggedStruct",
+    "TargetCore",
+    "TargetDetails",
+    "TargetDetailsNonsidereal",
+    "TargetDetailsOpportunity",
+    "TargetDetailsSidereal",
+    "TargetEdit",
+    "TargetEditTargetEdit",
+    "TargetEditTargetEditValue",
+    "TargetEditTargetEditValueNonsidereal",
+    "TargetEditTargetEditValueSidereal",
+    "TargetEditTargetEditValueSiderealDec",
+    "TargetEditTargetEditValueSiderealRa",
+    "TargetEnvironmentDetails",
+    "TargetEnvironmentDetailsAsterism",
+    "TargetEnvironmentDetailsAsterismNonsidereal",
+    "TargetEnvironmentDetailsAsterismSidereal",
+    "TargetEnvironmentDetailsExplicitBase",
+    "TargetEnvironmentDetailsExplicitBaseDec",
+    "TargetEnvironmentDetailsExplicitBaseRa",
+    "TargetProgramSummary",
+    "TargetProgramSummaryProgram",
+    "TargetSummary",
+    "TargetSummaryProgram",
+    "TimingWindowDetails",
+    "TimingWindowDetailsEndTimingWindowEndAfter",
+    "TimingWindowDetailsEndTimingWindowEndAfterAfter",
+    "TimingWindowDetailsEndTimingWindowEndAfterRepeat",
+    "TimingWindowDetailsEndTimingWindowEndAfterRepeatPeriod",
+    "TimingWindowDetailsEndTimingWindowEndAt",
+    "UpdateCallForProposalsById",
+    "UpdateCallForProposalsByIdUpdateCallsForProposals",
+    "UpdateCallForProposalsByIdUpdateCallsForProposalsCallsForProposals",
+    "UpdateCallsForProposals",
+    "UpdateCallsForProposalsUpdateCallsForProposals",
+    "UpdateCallsForProposalsUpdateCallsForProposalsCallsForProposals",
+    "UpdateObservationById",
+    "UpdateObservationByIdUpdateObservations",
+    "UpdateObservationByIdUpdateObservationsObservations",
+    "UpdateObservationByReference",
+    "UpdateObservationByReferenceUpdateObservations",
+    "UpdateObservationByReferenceUpdateObservationsObservations",
+    "UpdateObservations",
+    "UpdateObservationsUpdateObservations",
+    "UpdateObservationsUpdateObservationsObservations",
+    "UpdateProgramById",
+    "UpdateProgramByIdUpdatePrograms",
+    "UpdateProgramByIdUpdateProgramsPrograms",
+    "UpdatePrograms",
+    "UpdateProgramsUpdatePrograms",
+    "UpdateProgramsUpdateProgramsPrograms",
+    "UpdateTargetById",
+    "UpdateTargetByIdUpdateTargets",
+    "UpdateTargetByIdUpdateTargetsTargets",
+    "UpdateTargets",
+    "UpdateTargetsUpdateTargets",
+    "UpdateTargetsUpdateTargetsTargets",
+    "VisitorDetails",
+    "VisitorDetailsAgsDiameter",
+    "VisitorDetailsCentralWavelength",
+    "VisitorDetailsTotalRequestTime",
+    "WorkflowCore",
+    "WorkflowDetails",
+    "WorkflowDetailsValue",
+    "WorkflowDetailsValueValidationErrors",
+]
+_MODULES = {
+    "BaseStruct": "base_struct",
+    "TaggedStruct": "base_struct",
+    "StructGraphQLClient": "client",
+    "CloneObservation": "clone_observation",
+    "CloneObservationCloneObservation": "clone_observation",
+    "CloneObservationCloneObservationNewObservation": "clone_observation",
+    "CloneTarget": "clone_target",
+    "CloneTargetCloneTarget": "clone_target",
+    "CloneTargetCloneTargetNewTarget": "clone_target",
+    "CreateCallForProposals": "create_call_for_proposals",
+    "CreateCallForProposalsCreateCallForProposals": "create_call_for_proposals",
+    "CreateCallForProposalsCreateCallForProposalsCallForProposals": "create_call_for_proposals",
+    "CreateObservation": "create_observation",
+    "CreateObservationCreateObservation": "create_observation",
+    "CreateObservationCreateObservationObservation": "create_observation",
+    "CreateProgram": "create_program",
+    "CreateProgramCreateProgram": "create_program",
+    "CreateProgramCreateProgramProgram": "create_program",
+    "CreateTargetByProgramId": "create_target_by_program_id",
+    "CreateTargetByProgramIdCreateTarget": "create_target_by_program_id",
+    "CreateTargetByProgramIdCreateTargetTarget": "create_target_by_program_id",
+    "CreateTargetByProgramReference": "create_target_by_program_reference",
+    "CreateTargetByProgramReferenceCreateTarget": "create_target_by_program_reference",
+    "CreateTargetByProgramReferenceCreateTargetTarget": "create_target_by_program_reference",
+    "CreateTargetByProposalReference": "create_target_by_proposal_reference",
+    "CreateTargetByProposalReferenceCreateTarget": "create_target_by_proposal_reference",
+    "CreateTargetByProposalReferenceCreateTargetTarget": "create_target_by_proposal_reference",
+    "DeleteCallForProposalsById": "delete_call_for_proposals_by_id",
+    "DeleteCallForProposalsByIdUpdateCallsForProposals": "delete_call_for_proposals_by_id",
+    "DeleteCallForProposalsByIdUpdateCallsForProposalsCallsForProposals": "delete_call_for_proposals_by_id",
+    "DeleteObservationById": "delete_observation_by_id",
+    "DeleteObservationByIdUpdateObservations": "delete_observation_by_id",
+    "DeleteObservationByIdUpdateObservationsObservations": "delete_observation_by_id",
+    "DeleteObservationByReference": "delete_observation_by_reference",
+    "DeleteObservationByReferenceUpdateObservations": "delete_observation_by_reference",
+    "DeleteObservationByReferenceUpdateObservationsObservations": "delete_observation_by_reference",
+    "DeleteProgramById": "delete_program_by_id",
+    "DeleteProgramByIdUpdatePrograms": "delete_program_by_id",
+    "DeleteProgramByIdUpdateProgramsPrograms": "delete_program_by_id",
+    "DeleteProgramByIdUpdateProgramsProgramsAllGroupElements": "delete_program_by_id",
+    "DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsGroup": "delete_program_by_id",
+    "DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMaximumInterval": "delete_program_by_id",
+    "DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMinimumInterval": "delete_program_by_id",
+    "DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsObservation": "delete_program_by_id",
+    "DeleteTargetById": "delete_target_by_id",
+    "DeleteTargetByIdUpdateTargets": "delete_target_by_id",
+    "DeleteTargetByIdUpdateTargetsTargets": "delete_target_by_id",
+    "DeleteTargetByIdUpdateTargetsTargetsProgram": "delete_target_by_id",
+    "AttachmentDetails": "fragments",
+    "CallForProposalsCore": "fragments",
+    "CallForProposalsCoreGemini": "fragments",
+    "CallForProposalsCoreKeck": "fragments",
+    "CallForProposalsCoreSubaru": "fragments",
+    "CallForProposalsDetails": "fragments",
+    "CallForProposalsDetailsActive": "fragments",
+    "ConstraintSetDetails": "fragments",
+    "ConstraintSetDetailsElevationRange": "fragments",
+    "ConstraintSetDetailsElevationRangeAirMass": "fragments",
+    "ConstraintSetDetailsElevationRangeHourAngle": "fragments",
+    "Flamingos2ImagingDetails": "fragments",
+    "Flamingos2ImagingDetailsFilters": "fragments",
+    "Flamingos2ImagingDetailsFiltersExposureTimeMode": "fragments",
+    "Flamingos2ImagingDetailsFiltersExposureTimeModeSignalToNoise": "fragments",
+    "Flamingos2ImagingDetailsFiltersExposureTimeModeSignalToNoiseAt": "fragments",
+    "Flamingos2ImagingDetailsFiltersExposureTimeModeTimeAndCount": "fragments",
+    "Flamingos2ImagingDetailsFiltersExposureTimeModeTimeAndCountTime": "fragments",
+    "Flamingos2ImagingDetailsInitialFilters": "fragments",
+    "Flamingos2ImagingDetailsInitialFiltersExposureTimeMode": "fragments",
+    "Flamingos2ImagingDetailsInitialFiltersExposureTimeModeSignalToNoise": "fragments",
+    "Flamingos2ImagingDetailsInitialFiltersExposureTimeModeSignalToNoiseAt": "fragments",
+    "Flamingos2ImagingDetailsInitialFiltersExposureTimeModeTimeAndCount": "fragments",
+    "Flamingos2ImagingDetailsInitialFiltersExposureTimeModeTimeAndCountAt": "fragments",
+    "Flamingos2ImagingDetailsInitialFiltersExposureTimeModeTimeAndCountTime": "fragments",
+    "Flamingos2LongSlitDetails": "fragments",
+    "Flamingos2LongSlitDetailsAcquisition": "fragments",
+    "Flamingos2LongSlitDetailsAcquisitionExposureTimeMode": "fragments",
+    "Flamingos2LongSlitDetailsAcquisitionExposureTimeModeSignalToNoise": "fragments",
+    "Flamingos2LongSlitDetailsAcquisitionExposureTimeModeSignalToNoiseAt": "fragments",
+    "Flamingos2LongSlitDetailsAcquisitionExposureTimeModeTimeAndCount": "fragments",
+    "Flamingos2LongSlitDetailsAcquisitionExposureTimeModeTimeAndCountAt": "fragments",
+    "Flamingos2LongSlitDetailsAcquisitionExposureTimeModeTimeAndCountTime": "fragments",
+    "Flamingos2LongSlitDetailsExposureTimeMode": "fragments",
+    "Flamingos2LongSlitDetailsExposureTimeModeSignalToNoise": "fragments",
+    "Flamingos2LongSlitDetailsExposureTimeModeSignalToNoiseAt": "fragments",
+    "Flamingos2LongSlitDetailsExposureTimeModeTimeAndCount": "fragments",
+    "Flamingos2LongSlitDetailsExposureTimeModeTimeAndCountAt": "fragments",
+    "Flamingos2LongSlitDetailsExposureTimeModeTimeAndCountTime": "fragments",
+    "Flamingos2LongSlitDetailsTelluricType": "fragments",
+    "GhostDetectorConfigDetails": "fragments",
+    "GhostDetectorConfigDetailsExposureTimeMode": "fragments",
+    "GhostDetectorConfigDetailsExposureTimeModeSignalToNoise": "fragments",
+    "GhostDetectorConfigDetailsExposureTimeModeSignalToNoiseAt": "fragments",
+    "GhostDetectorConfigDetailsExposureTimeModeTimeAndCount": "fragments",
+    "GhostDetectorConfigDetailsExposureTimeModeTimeAndCountAt": "fragments",
+    "GhostDetectorConfigDetailsExposureTimeModeTimeAndCountTime": "fragments",
+    "GhostIfuDetails": "fragments",
+    "GhostIfuDetailsBlue": "fragments",
+    "GhostIfuDetailsRed": "fragments",
+    "GhostIfuDetailsSkyPosition": "fragments",
+    "GhostIfuDetailsSkyPositionDec": "fragments",
+    "GhostIfuDetailsSkyPositionRa": "fragments",
+    "GhostIfuDetailsSlitViewingCameraExposureTime": "fragments",
+    "GmosNorthImagingDetails": "fragments",
+    "GmosNorthImagingDetailsFilters": "fragments",
+    "GmosNorthLongSlitDetails": "fragments",
+    "GmosNorthLongSlitDetailsCentralWavelength": "fragments",
+    "GmosNorthLongSlitDetailsOffsets": "fragments",
+    "GmosSouthImagingDetails": "fragments",
+    "GmosSouthImagingDetailsFilters": "fragments",
+    "GmosSouthLongSlitDetails": "fragments",
+    "GmosSouthLongSlitDetailsCentralWavelength": "fragments",
+    "GmosSouthLongSlitDetailsOffsets": "fragments",
+    "GnirsDetails": "fragments",
+    "GnirsDetailsGnirsImaging": "fragments",
+    "GnirsDetailsGnirsSpectroscopy": "fragments",
+    "GnirsImagingDetails": "fragments",
+    "GnirsImagingDetailsFilters": "fragments",
+    "GnirsImagingDetailsFiltersExposureTimeMode": "fragments",
+    "GnirsImagingDetailsFiltersExposureTimeModeSignalToNoise": "fragments",
+    "GnirsImagingDetailsFiltersExposureTimeModeSignalToNoiseAt": "fragments",
+    "GnirsImagingDetailsFiltersExposureTimeModeTimeAndCount": "fragments",
+    "GnirsImagingDetailsFiltersExposureTimeModeTimeAndCountAt": "fragments",
+    "GnirsImagingDetailsFiltersExposureTimeModeTimeAndCountTime": "fragments",
+    "GnirsImagingDetailsInitialFilters": "fragments",
+    "GnirsImagingDetailsInitialFiltersExposureTimeMode": "fragments",
+    "GnirsImagingDetailsInitialFiltersExposureTimeModeSignalToNoise": "fragments",
+    "GnirsImagingDetailsInitialFiltersExposureTimeModeSignalToNoiseAt": "fragments",
+    "GnirsImagingDetailsInitialFiltersExposureTimeModeTimeAndCount": "fragments",
+    "GnirsImagingDetailsInitialFiltersExposureTimeModeTimeAndCountAt": "fragments",
+    "GnirsImagingDetailsInitialFiltersExposureTimeModeTimeAndCountTime": "fragments",
+    "GnirsSpectroscopyDetails": "fragments",
+    "GnirsSpectroscopyDetailsAcquisition": "fragments",
+    "GnirsSpectroscopyDetailsAcquisitionExposureTimeMode": "fragments",
+    "GnirsSpectroscopyDetailsAcquisitionExposureTimeModeSignalToNoise": "fragments",
+    "GnirsSpectroscopyDetailsAcquisitionExposureTimeModeSignalToNoiseAt": "fragments",
+    "GnirsSpectroscopyDetailsAcquisitionExposureTimeModeTimeAndCount": "fragments",
+    "GnirsSpectroscopyDetailsAcquisitionExposureTimeModeTimeAndCountAt": "fragments",
+    "GnirsSpectroscopyDetailsAcquisitionExposureTimeModeTimeAndCountTime": "fragments",
+    "GnirsSpectroscopyDetailsAcquisitionSkyOffset": "fragments",
+    "GnirsSpectroscopyDetailsAcquisitionSkyOffsetP": "fragments",
+    "GnirsSpectroscopyDetailsAcquisitionSkyOffsetQ": "fragments",
+    "GnirsSpectroscopyDetailsCentralWavelengths": "fragments",
+    "GnirsSpectroscopyDetailsCentralWavelengthsCentralWavelength": "fragments",
+    "GnirsSpectroscopyDetailsIfu": "fragments",
+    "GnirsSpectroscopyDetailsIfuTelescopeConfigs": "fragments",
+    "GnirsSpectroscopyDetailsIfuTelescopeConfigsOffset": "fragments",
+    "GnirsSpectroscopyDetailsIfuTelescopeConfigsOffsetP": "fragments",
+    "GnirsSpectroscopyDetailsIfuTelescopeConfigsOffsetQ": "fragments",
+    "GnirsSpectroscopyDetailsSlit": "fragments",
+    "GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigs": "fragments",
+    "GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsAlongSlit": "fragments",
+    "GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsAlongSlitQ": "fragments",
+    "GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSky": "fragments",
+    "GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSkyOffset": "fragments",
+    "GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSkyOffsetP": "fragments",
+    "GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSkyOffsetQ": "fragments",
+    "GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigs": "fragments",
+    "GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsAlongSlit": "fragments",
+    "GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsAlongSlitQ": "fragments",
+    "GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSky": "fragments",
+    "GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSkyOffset": "fragments",
+    "GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSkyOffsetP": "fragments",
+    "GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSkyOffsetQ": "fragments",
+    "GnirsSpectroscopyDetailsSlitTelescopeConfigs": "fragments",
+    "GnirsSpectroscopyDetailsSlitTelescopeConfigsAlongSlit": "fragments",
+    "GnirsSpectroscopyDetailsSlitTelescopeConfigsAlongSlitQ": "fragments",
+    "GnirsSpectroscopyDetailsSlitTelescopeConfigsToSky": "fragments",
+    "GnirsSpectroscopyDetailsSlitTelescopeConfigsToSkyOffset": "fragments",
+    "GnirsSpectroscopyDetailsSlitTelescopeConfigsToSkyOffsetP": "fragments",
+    "GnirsSpectroscopyDetailsSlitTelescopeConfigsToSkyOffsetQ": "fragments",
+    "GnirsSpectroscopyDetailsTelluricType": "fragments",
+    "Igrins2LongSlitDetails": "fragments",
+    "Igrins2LongSlitDetailsExposureTimeMode": "fragments",
+    "Igrins2LongSlitDetailsExposureTimeModeSignalToNoise": "fragments",
+    "Igrins2LongSlitDetailsExposureTimeModeSignalToNoiseAt": "fragments",
+    "Igrins2LongSlitDetailsExposureTimeModeTimeAndCount": "fragments",
+    "Igrins2LongSlitDetailsExposureTimeModeTimeAndCountAt": "fragments",
+    "Igrins2LongSlitDetailsExposureTimeModeTimeAndCountTime": "fragments",
+    "Igrins2LongSlitDetailsTelluricType": "fragments",
+    "NonsiderealTargetDetails": "fragments",
+    "ObservationCore": "fragments",
+    "ObservationCoreReference": "fragments",
+    "ObservationDetails": "fragments",
+    "ObservationDetailsConstraintSet": "fragments",
+    "ObservationDetailsExecution": "fragments",
+    "ObservationDetailsExecutionDigest": "fragments",
+    "ObservationDetailsExecutionDigestValue": "fragments",
+    "ObservationDetailsExecutionDigestValueAcquisition": "fragments",
+    "ObservationDetailsExecutionDigestValueAcquisitionTimeEstimate": "fragments",
+    "ObservationDetailsExecutionDigestValueAcquisitionTimeEstimateNonCharged": "fragments",
+    "ObservationDetailsExecutionDigestValueAcquisitionTimeEstimateProgram": "fragments",
+    "ObservationDetailsExecutionDigestValueAcquisitionTimeEstimateTotal": "fragments",
+    "ObservationDetailsExecutionDigestValueSetup": "fragments",
+    "ObservationDetailsExecutionDigestValueSetupFull": "fragments",
+    "ObservationDetailsExecutionDigestValueSetupReacquisition": "fragments",
+    "ObservationDetailsObservingMode": "fragments",
+    "ObservationDetailsProgram": "fragments",
+    "ObservationDetailsScienceRequirements": "fragments",
+    "ObservationDetailsTargetEnvironment": "fragments",
+    "ObservationDetailsTimingWindows": "fragments",
+    "ObservationDetailsWorkflow": "fragments",
+    "ObservationSummary": "fragments",
+    "ObservationSummaryProgram": "fragments",
+    "ObservationSummaryWorkflow": "fragments",
+    "ObservationWorkflowCore": "fragments",
+    "ObservationWorkflowDetails": "fragments",
+    "ObservationWorkflowDetailsValidationErrors": "fragments",
+    "ObservingModeDetails": "fragments",
+    "ObservingModeDetailsFlamingos2Imaging": "fragments",
+    "ObservingModeDetailsFlamingos2LongSlit": "fragments",
+    "ObservingModeDetailsGhostIfu": "fragments",
+    "ObservingModeDetailsGmosNorthImaging": "fragments",
+    "ObservingModeDetailsGmosNorthLongSlit": "fragments",
+    "ObservingModeDetailsGmosSouthImaging": "fragments",
+    "ObservingModeDetailsGmosSouthLongSlit": "fragments",
+    "ObservingModeDetailsGnirsImaging": "fragments",
+    "ObservingModeDetailsGnirsSpectroscopy": "fragments",
+    "ObservingModeDetailsIgrins2LongSlit": "fragments",
+    "ObservingModeDetailsVisitor": "fragments",
+    "OpportunityTargetDetails": "fragments",
+    "OpportunityTargetDetailsRegion": "fragments",
+    "OpportunityTargetDetailsRegionDeclinationArc": "fragments",
+    "OpportunityTargetDetailsRegionDeclinationArcEnd": "fragments",
+    "OpportunityTargetDetailsRegionDeclinationArcStart": "fragments",
+    "OpportunityTargetDetailsRegionRightAscensionArc": "fragments",
+    "OpportunityTargetDetailsRegionRightAscensionArcEnd": "fragments",
+    "OpportunityTargetDetailsRegionRightAscensionArcStart": "fragments",
+    "ProgramCore": "fragments",
+    "ProgramDetail": "fragments",
+    "ProgramDetailActive": "fragments",
+    "ProgramDetailPi": "fragments",
+    "ProgramDetailProposal": "fragments",
+    "ProgramDetailProposalCall": "fragments",
+    "ProgramDetailProposalCallActive": "fragments",
+    "ProgramDetailProposalCallGemini": "fragments",
+    "ProgramDetailProposalCallKeck": "fragments",
+    "ProgramDetailProposalCallSubaru": "fragments",
+    "ProgramDetailProposalGemini": "fragments",
+    "ProgramGroupElements": "fragments",
+    "ProgramGroupElementsAllGroupElements": "fragments",
+    "ProgramGroupElementsAllGroupElementsGroup": "fragments",
+    "ProgramGroupElementsAllGroupElementsGroupMaximumInterval": "fragments",
+    "ProgramGroupElementsAllGroupElementsGroupMinimumInterval": "fragments",
+    "ProgramGroupElementsAllGroupElementsObservation": "fragments",
+    "ProgramSummary": "fragments",
+    "ProgramSummaryReference": "fragments",
+    "SchedulerProposal": "fragments",
+    "SchedulerProposalCall": "fragments",
+    "SchedulerProposalCallActive": "fragments",
+    "SchedulerProposalCallGemini": "fragments",
+    "SchedulerProposalCallKeck": "fragments",
+    "SchedulerProposalCallSubaru": "fragments",
+    "SchedulerProposalGemini": "fragments",
+    "ScienceRequirementsDetails": "fragments",
+    "SiderealTargetDetails": "fragments",
+    "SiderealTargetDetailsDec": "fragments",
+    "SiderealTargetDetailsRa": "fragments",
+    "TargetCore": "fragments",
+    "TargetDetails": "fragments",
+    "TargetDetailsNonsidereal": "fragments",
+    "TargetDetailsOpportunity": "fragments",
+    "TargetDetailsSidereal": "fragments",
+    "TargetEnvironmentDetails": "fragments",
+    "TargetEnvironmentDetailsAsterism": "fragments",
+    "TargetEnvironmentDetailsAsterismNonsidereal": "fragments",
+    "TargetEnvironmentDetailsAsterismSidereal": "fragments",
+    "TargetEnvironmentDetailsExplicitBase": "fragments",
+    "TargetEnvironmentDetailsExplicitBaseDec": "fragments",
+    "TargetEnvironmentDetailsExplicitBaseRa": "fragments",
+    "TargetProgramSummary": "fragments",
+    "TargetProgramSummaryProgram": "fragments",
+    "TargetSummary": "fragments",
+    "TargetSummaryProgram": "fragments",
+    "TimingWindowDetails": "fragments",
+    "TimingWindowDetailsEndTimingWindowEndAfter": "fragments",
+    "TimingWindowDetailsEndTimingWindowEndAfterAfter": "fragments",
+    "TimingWindowDetailsEndTimingWindowEndAfterRepeat": "fragments",
+    "TimingWindowDetailsEndTimingWindowEndAfterRepeatPeriod": "fragments",
+    "TimingWindowDetailsEndTimingWindowEndAt": "fragments",
+    "VisitorDetails": "fragments",
+    "VisitorDetailsAgsDiameter": "fragments",
+    "VisitorDetailsCentralWavelength": "fragments",
+    "VisitorDetailsTotalRequestTime": "fragments",
+    "WorkflowCore": "fragments",
+    "WorkflowDetails": "fragments",
+    "WorkflowDetailsValue": "fragments",
+    "WorkflowDetailsValueValidationErrors": "fragments",
+    "GetCallForProposals": "get_call_for_proposals",
+    "GetCallForProposalsCallForProposals": "get_call_for_proposals",
+    "GetCallsForProposals": "get_calls_for_proposals",
+    "GetCallsForProposalsCallsForProposals": "get_calls_for_proposals",
+    "GetCallsForProposalsCallsForProposalsMatches": "get_calls_for_proposals",
+    "GetGOATSObservations": "get_goats_observations",
+    "GetGOATSObservationsObservations": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatches": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesAttachments": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesConstraintSet": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesConstraintSetElevationRange": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesConstraintSetElevationRangeAirMass": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesConstraintSetElevationRangeHourAngle": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservationDuration": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingMode": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImaging": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFilters": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeMode": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeSignalToNoise": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeSignalToNoiseAt": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeTimeAndCount": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeTimeAndCountAt": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeTimeAndCountTime": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariant": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGrouped": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsets": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumerated": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValues": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValuesOffset": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValuesOffsetP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValuesOffsetQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandom": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiral": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniform": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerA": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerAP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerAQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerB": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerBP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerBQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsets": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumerated": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValues": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffset": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandom": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiral": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniform": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerA": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerAP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerAQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerB": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerBP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerBQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleaved": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsets": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumerated": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValues": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValuesOffset": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandom": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiral": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniform": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerA": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerAP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerAQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerB": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerBP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerBQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsets": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumerated": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValues": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffset": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandom": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiral": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniform": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerA": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerAP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerAQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerB": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerBP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerBQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImaging": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset1": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset1P": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset1Q": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset2": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset2P": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset2Q": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset3": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset3P": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset3Q": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset4": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset4P": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset4Q": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlit": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitCentralWavelength": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeMode": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeSignalToNoise": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeSignalToNoiseAt": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeTimeAndCount": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeTimeAndCountAt": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeTimeAndCountTime": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitOffsets": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitWavelengthDithers": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImaging": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFilters": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeMode": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeSignalToNoise": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeSignalToNoiseAt": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeTimeAndCount": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeTimeAndCountAt": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeTimeAndCountTime": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariant": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGrouped": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsets": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumerated": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValues": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValuesOffset": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValuesOffsetP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValuesOffsetQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandom": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiral": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniform": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerA": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerAP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerAQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerB": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerBP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerBQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsets": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumerated": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValues": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffset": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandom": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiral": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniform": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerA": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerAP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerAQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerB": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerBP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerBQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleaved": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsets": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumerated": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValues": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValuesOffset": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandom": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiral": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniform": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerA": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerAP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerAQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerB": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerBP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerBQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsets": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumerated": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValues": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffset": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandom": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiral": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralCenter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralCenterP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralCenterQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralSize": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniform": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerA": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerAP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerAQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerB": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerBP": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerBQ": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImaging": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset1": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset1P": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset1Q": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset2": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset2P": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset2Q": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset3": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset3P": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset3Q": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset4": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset4P": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset4Q": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlit": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitCentralWavelength": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeMode": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeSignalToNoise": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeSignalToNoiseAt": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeTimeAndCount": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeTimeAndCountAt": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeTimeAndCountTime": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitOffsets": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitWavelengthDithers": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesPosAngleConstraint": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesPosAngleConstraintAngle": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesProgram": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesProgramAllocations": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesProgramAllocationsDuration": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesProgramTimeCharge": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesProgramTimeChargeTime": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesProgramTimeChargeTimeProgram": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesReference": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesScienceRequirements": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeMode": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeSignalToNoise": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeSignalToNoiseAt": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeTimeAndCount": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeTimeAndCountAt": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeTimeAndCountTime": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesScienceRequirementsSpectroscopy": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesScienceRequirementsSpectroscopyWavelength": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironment": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentAsterism": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentAsterismOpportunity": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTarget": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetOpportunity": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSidereal": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealDec": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealParallax": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealProperMotion": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealProperMotionDec": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealProperMotionRa": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealRa": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealRadialVelocity": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfile": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePoint": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalized": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedBrightnesses": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedSed": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedSedFluxDensities": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedSedFluxDensitiesWavelength": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTimingWindows": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfterAfter": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfterRepeat": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfterRepeatPeriod": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAt": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesWorkflow": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesWorkflowValue": "get_goats_observations",
+    "GetGOATSObservationsObservationsMatchesWorkflowValueValidationErrors": "get_goats_observations",
+    "GetGOATSPrograms": "get_goats_programs",
+    "GetGOATSProgramsPrograms": "get_goats_programs",
+    "GetGOATSProgramsProgramsMatches": "get_goats_programs",
+    "GetGOATSProgramsProgramsMatchesReference": "get_goats_programs",
+    "GetObservation": "get_observation",
+    "GetObservationObservation": "get_observation",
+    "GetObservationAttachmentsById": "get_observation_attachments_by_id",
+    "GetObservationAttachmentsByIdObservation": "get_observation_attachments_by_id",
+    "GetObservationAttachmentsByIdObservationAttachments": "get_observation_attachments_by_id",
+    "GetObservationAttachmentsByReference": "get_observation_attachments_by_reference",
+    "GetObservationAttachmentsByReferenceObservation": "get_observation_attachments_by_reference",
+    "GetObservationAttachmentsByReferenceObservationAttachments": "get_observation_attachments_by_reference",
+    "GetObservationSummaries": "get_observation_summaries",
+    "GetObservationSummariesObservations": "get_observation_summaries",
+    "GetObservationSummariesObservationsMatches": "get_observation_summaries",
+    "GetObservationWorkflowStateById": "get_observation_workflow_state_by_id",
+    "GetObservationWorkflowStateByIdObservation": "get_observation_workflow_state_by_id",
+    "GetObservationWorkflowStateByIdObservationProgram": "get_observation_workflow_state_by_id",
+    "GetObservationWorkflowStateByIdObservationWorkflow": "get_observation_workflow_state_by_id",
+    "GetObservationWorkflowStateByReference": "get_observation_workflow_state_by_reference",
+    "GetObservationWorkflowStateByReferenceObservation": "get_observation_workflow_state_by_reference",
+    "GetObservationWorkflowStateByReferenceObservationProgram": "get_observation_workflow_state_by_reference",
+    "GetObservationWorkflowStateByReferenceObservationWorkflow": "get_observation_workflow_state_by_reference",
+    "GetObservations": "get_observations",
+    "GetObservationsObservations": "get_observations",
+    "GetObservationsObservationsMatches": "get_observations",
+    "GetProgramAttachmentsById": "get_program_attachments_by_id",
+    "GetProgramAttachmentsByIdProgram": "get_program_attachments_by_id",
+    "GetProgramAttachmentsByIdProgramAttachments": "get_program_attachments_by_id",
+    "GetProgramAttachmentsByProposalReference": "get_program_attachments_by_proposal_reference",
+    "GetProgramAttachmentsByProposalReferenceProgram": "get_program_attachments_by_proposal_reference",
+    "GetProgramAttachmentsByProposalReferenceProgramAttachments": "get_program_attachments_by_proposal_reference",
+    "GetProgramAttachmentsByReference": "get_program_attachments_by_reference",
+    "GetProgramAttachmentsByReferenceProgram": "get_program_attachments_by_reference",
+    "GetProgramAttachmentsByReferenceProgramAttachments": "get_program_attachments_by_reference",
+    "GetProgramById": "get_program_by_id",
+    "GetProgramByIdProgram": "get_program_by_id",
+    "GetProgramByProposalReference": "get_program_by_proposal_reference",
+    "GetProgramByProposalReferenceProgram": "get_program_by_proposal_reference",
+    "GetProgramByReference": "get_program_by_reference",
+    "GetProgramByReferenceProgram": "get_program_by_reference",
+    "GetProgramSummaries": "get_program_summaries",
+    "GetProgramSummariesPrograms": "get_program_summaries",
+    "GetProgramSummariesProgramsMatches": "get_program_summaries",
+    "GetPrograms": "get_programs",
+    "GetProgramsPrograms": "get_programs",
+    "GetProgramsProgramsMatches": "get_programs",
+    "GetSchedulerAllProgramsId": "get_scheduler_all_programs_id",
+    "GetSchedulerAllProgramsIdPrograms": "get_scheduler_all_programs_id",
+    "GetSchedulerAllProgramsIdProgramsMatches": "get_scheduler_all_programs_id",
+    "GetSchedulerAllProgramsIdProgramsMatchesReference": "get_scheduler_all_programs_id",
+    "GetSchedulerPrograms": "get_scheduler_programs",
+    "GetSchedulerProgramsPrograms": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatches": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesActive": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesAllGroupElements": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesAllGroupElementsGroup": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesAllGroupElementsGroupMaximumInterval": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesAllGroupElementsGroupMinimumInterval": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesAllGroupElementsObservation": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesAllocations": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesAllocationsDuration": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesProposal": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesReference": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesTimeCharge": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesTimeChargeTime": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesTimeChargeTimeNonCharged": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesTimeChargeTimeProgram": "get_scheduler_programs",
+    "GetSchedulerProgramsProgramsMatchesTimeChargeTimeTotal": "get_scheduler_programs",
+    "GetTargetById": "get_target_by_id",
+    "GetTargetByIdTarget": "get_target_by_id",
+    "GetTargetSummaries": "get_target_summaries",
+    "GetTargetSummariesTargets": "get_target_summaries",
+    "GetTargetSummariesTargetsMatches": "get_target_summaries",
+    "GetTargets": "get_targets",
+    "GetTargetsTargets": "get_targets",
+    "GetTargetsTargetsMatches": "get_targets",
+    "ObsCalculationUpdate": "obs_calculation_update",
+    "ObsCalculationUpdateObscalcUpdate": "obs_calculation_update",
+    "ObsCalculationUpdateObscalcUpdateValue": "obs_calculation_update",
+    "ObsCalculationUpdateObscalcUpdateValueExecution": "obs_calculation_update",
+    "ObsCalculationUpdateObscalcUpdateValueExecutionVisits": "obs_calculation_update",
+    "ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatches": "obs_calculation_update",
+    "ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatchesAtomRecords": "obs_calculation_update",
+    "ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatchesAtomRecordsMatches": "obs_calculation_update",
+    "ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatchesObservation": "obs_calculation_update",
+    "ObservationEdit": "observation_edit",
+    "ObservationEditObservationEdit": "observation_edit",
+    "ObservationEditObservationEditValue": "observation_edit",
+    "ObservationEditObservationEditValueConstraintSet": "observation_edit",
+    "ObservationEditObservationEditValueConstraintSetElevationRange": "observation_edit",
+    "ObservationEditObservationEditValueConstraintSetElevationRangeAirMass": "observation_edit",
+    "ObservationEditObservationEditValueConstraintSetElevationRangeHourAngle": "observation_edit",
+    "ObservationEditObservationEditValueObservingMode": "observation_edit",
+    "ObservationEditObservationEditValueObservingModeGmosNorthLongSlit": "observation_edit",
+    "ObservationEditObservationEditValueObservingModeGmosNorthLongSlitCentralWavelength": "observation_edit",
+    "ObservationEditObservationEditValueObservingModeGmosSouthLongSlit": "observation_edit",
+    "ObservationEditObservationEditValueObservingModeGmosSouthLongSlitCentralWavelength": "observation_edit",
+    "ObservationEditObservationEditValueReference": "observation_edit",
+    "ObservationEditObservationEditValueScienceRequirements": "observation_edit",
+    "ObservationEditObservationEditValueTargetEnvironment": "observation_edit",
+    "ObservationEditObservationEditValueTargetEnvironmentAsterism": "observation_edit",
+    "ObservationEditObservationEditValueTargetEnvironmentAsterismNonsidereal": "observation_edit",
+    "ObservationEditObservationEditValueTargetEnvironmentAsterismSidereal": "observation_edit",
+    "ObservationEditObservationEditValueTargetEnvironmentAsterismSiderealDec": "observation_edit",
+    "ObservationEditObservationEditValueTargetEnvironmentAsterismSiderealRa": "observation_edit",
+    "ObservationEditObservationEditValueTargetEnvironmentExplicitBase": "observation_edit",
+    "ObservationEditObservationEditValueTargetEnvironmentExplicitBaseDec": "observation_edit",
+    "ObservationEditObservationEditValueTargetEnvironmentExplicitBaseRa": "observation_edit",
+    "ObservationEditObservationEditValueTimingWindows": "observation_edit",
+    "ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfter": "observation_edit",
+    "ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfterAfter": "observation_edit",
+    "ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfterRepeat": "observation_edit",
+    "ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfterRepeatPeriod": "observation_edit",
+    "ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAt": "observation_edit",
+    "Ping": "ping",
+    "PingPrograms": "ping",
+    "PingProgramsMatches": "ping",
+    "ProgramEdit": "program_edit",
+    "ProgramEditProgramEdit": "program_edit",
+    "ProgramEditProgramEditValue": "program_edit",
+    "ProgramEditProgramEditValueAllGroupElements": "program_edit",
+    "ProgramEditProgramEditValueAllGroupElementsGroup": "program_edit",
+    "ProgramEditProgramEditValueAllGroupElementsObservation": "program_edit",
+    "RestoreCallForProposalsById": "restore_call_for_proposals_by_id",
+    "RestoreCallForProposalsByIdUpdateCallsForProposals": "restore_call_for_proposals_by_id",
+    "RestoreCallForProposalsByIdUpdateCallsForProposalsCallsForProposals": "restore_call_for_proposals_by_id",
+    "RestoreObservationById": "restore_observation_by_id",
+    "RestoreObservationByIdUpdateObservations": "restore_observation_by_id",
+    "RestoreObservationByIdUpdateObservationsObservations": "restore_observation_by_id",
+    "RestoreObservationByReference": "restore_observation_by_reference",
+    "RestoreObservationByReferenceUpdateObservations": "restore_observation_by_reference",
+    "RestoreObservationByReferenceUpdateObservationsObservations": "restore_observation_by_reference",
+    "RestoreProgramById": "restore_program_by_id",
+    "RestoreProgramByIdUpdatePrograms": "restore_program_by_id",
+    "RestoreProgramByIdUpdateProgramsPrograms": "restore_program_by_id",
+    "RestoreProgramByIdUpdateProgramsProgramsAllGroupElements": "restore_program_by_id",
+    "RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsGroup": "restore_program_by_id",
+    "RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMaximumInterval": "restore_program_by_id",
+    "RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMinimumInterval": "restore_program_by_id",
+    "RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsObservation": "restore_program_by_id",
+    "RestoreTargetById": "restore_target_by_id",
+    "RestoreTargetByIdUpdateTargets": "restore_target_by_id",
+    "RestoreTargetByIdUpdateTargetsTargets": "restore_target_by_id",
+    "RestoreTargetByIdUpdateTargetsTargetsProgram": "restore_target_by_id",
+    "SchedulerObservationsUpdates": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdate": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValue": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueConstraintSet": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueConstraintSetElevationRange": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueConstraintSetElevationRangeAirMass": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueConstraintSetElevationRangeHourAngle": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueExecution": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisits": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatches": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatchesAtomRecords": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatchesAtomRecordsMatches": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatchesObservation": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueProgram": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueProgramActive": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironment": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterism": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismNonsidereal": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismSidereal": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismSiderealDec": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismSiderealRa": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentExplicitBase": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentExplicitBaseDec": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentExplicitBaseRa": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTimingWindows": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfter": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfterAfter": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfterRepeat": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfterRepeatPeriod": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAt": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueWorkflow": "scheduler_observations_updates",
+    "SchedulerObservationsUpdatesObscalcUpdateValueWorkflowValue": "scheduler_observations_updates",
+    "SetObservationWorkflowState": "set_observation_workflow_state",
+    "SetObservationWorkflowStateSetObservationWorkflowState": "set_observation_workflow_state",
+    "TargetEdit": "target_edit",
+    "TargetEditTargetEdit": "target_edit",
+    "TargetEditTargetEditValue": "target_edit",
+    "TargetEditTargetEditValueNonsidereal": "target_edit",
+    "TargetEditTargetEditValueSidereal": "target_edit",
+    "TargetEditTargetEditValueSiderealDec": "target_edit",
+    "TargetEditTargetEditValueSiderealRa": "target_edit",
+    "UpdateCallForProposalsById": "update_call_for_proposals_by_id",
+    "UpdateCallForProposalsByIdUpdateCallsForProposals": "update_call_for_proposals_by_id",
+    "UpdateCallForProposalsByIdUpdateCallsForProposalsCallsForProposals": "update_call_for_proposals_by_id",
+    "UpdateCallsForProposals": "update_calls_for_proposals",
+    "UpdateCallsForProposalsUpdateCallsForProposals": "update_calls_for_proposals",
+    "UpdateCallsForProposalsUpdateCallsForProposalsCallsForProposals": "update_calls_for_proposals",
+    "UpdateObservationById": "update_observation_by_id",
+    "UpdateObservationByIdUpdateObservations": "update_observation_by_id",
+    "UpdateObservationByIdUpdateObservationsObservations": "update_observation_by_id",
+    "UpdateObservationByReference": "update_observation_by_reference",
+    "UpdateObservationByReferenceUpdateObservations": "update_observation_by_reference",
+    "UpdateObservationByReferenceUpdateObservationsObservations": "update_observation_by_reference",
+    "UpdateObservations": "update_observations",
+    "UpdateObservationsUpdateObservations": "update_observations",
+    "UpdateObservationsUpdateObservationsObservations": "update_observations",
+    "UpdateProgramById": "update_program_by_id",
+    "UpdateProgramByIdUpdatePrograms": "update_program_by_id",
+    "UpdateProgramByIdUpdateProgramsPrograms": "update_program_by_id",
+    "UpdatePrograms": "update_programs",
+    "UpdateProgramsUpdatePrograms": "update_programs",
+    "UpdateProgramsUpdateProgramsPrograms": "update_programs",
+    "UpdateTargetById": "update_target_by_id",
+    "UpdateTargetByIdUpdateTargets": "update_target_by_id",
+    "UpdateTargetByIdUpdateTargetsTargets": "update_target_by_id",
+    "UpdateTargets": "update_targets",
+    "UpdateTargetsUpdateTargets": "update_targets",
+    "UpdateTargetsUpdateTargetsTargets": "update_targets",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
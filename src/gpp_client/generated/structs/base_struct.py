@@ -0,0 +1,34 @@
+from enum import Enum
+from typing import Any, Literal
+
+import msgspec
+
+
+class BaseStruct(msgspec.Struct, kw_only=True):
+    def model_dump(
+        self, *, mode: Literal["python", "json"] = "python", by_alias: bool = False
+    ) -> dict[str, Any]:
+        return _dump(self, mode, by_alias)
+
+
+class TaggedStruct(BaseStruct, kw_only=True):
+    @property
+    def typename__(self) -> str:
+        return self.__struct_config__.tag
+
+
+def _dump(value: Any, mode: str, by_alias: bool) -> Any:
+    if isinstance(value, msgspec.Struct):
+        data = {}
+        tag = value.__struct_config__.tag
+        if tag is not None:
+            data["__typename" if by_alias else "typename__"] = tag
+        names = value.__struct_encode_fields__ if by_alias else value.__struct_fields__
+        for name, key in zip(value.__struct_fields__, names):
+            data[key] = _dump(getattr(value, name), mode, by_alias)
+        return data
+    if isinstance(value, list):
+        return [_dump(item, mode, by_alias) for item in value]
+    if mode == "json" and isinstance(value, Enum):
+        return value.value
+    return value
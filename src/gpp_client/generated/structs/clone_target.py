@@ -0,0 +1,31 @@
+from typing import Any, Optional
+
+from msgspec import field
+
+from ..enums import CalibrationRole, Existence
+from .base_struct import BaseStruct
+from .fragments import (
+    TargetDetailsNonsidereal,
+    TargetDetailsOpportunity,
+    TargetDetailsSidereal,
+    TargetProgramSummaryProgram,
+)
+
+
+class CloneTarget(BaseStruct):
+    clone_target: "CloneTargetCloneTarget" = field(name="cloneTarget")
+
+
+class CloneTargetCloneTarget(BaseStruct):
+    new_target: "CloneTargetCloneTargetNewTarget" = field(name="newTarget")
+
+
+class CloneTargetCloneTargetNewTarget(BaseStruct):
+    id: Any
+    existence: Existence
+    name: Any
+    calibration_role: Optional[CalibrationRole] = field(name="calibrationRole")
+    opportunity: Optional["TargetDetailsOpportunity"]
+    sidereal: Optional["TargetDetailsSidereal"]
+    nonsidereal: Optional["TargetDetailsNonsidereal"]
+    program: "TargetProgramSummaryProgram"
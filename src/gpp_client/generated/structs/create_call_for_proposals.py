@@ -0,0 +1,37 @@
+from typing import Any, Optional
+
+from msgspec import field
+
+from ..enums import Existence, Observatory
+from .base_struct import BaseStruct
+from .fragments import (
+    CallForProposalsCoreGemini,
+    CallForProposalsCoreKeck,
+    CallForProposalsCoreSubaru,
+    CallForProposalsDetailsActive,
+)
+
+
+class CreateCallForProposals(BaseStruct):
+    create_call_for_proposals: "CreateCallForProposalsCreateCallForProposals" = field(
+        name="createCallForProposals"
+    )
+
+
+class CreateCallForProposalsCreateCallForProposals(BaseStruct):
+    call_for_proposals: "CreateCallForProposalsCreateCallForProposalsCallForProposals" = field(
+        name="callForProposals"
+    )
+
+
+class CreateCallForProposalsCreateCallForProposalsCallForProposals(BaseStruct):
+    id: Any
+    title: Any
+    observatory: Observatory
+    gemini: Optional["CallForProposalsCoreGemini"]
+    keck: Optional["CallForProposalsCoreKeck"]
+    subaru: Optional["CallForProposalsCoreSubaru"]
+    semester: Any
+    active: "CallForProposalsDetailsActive"
+    submission_deadline_default: Optional[Any] = field(name="submissionDeadlineDefault")
+    existence: Existence
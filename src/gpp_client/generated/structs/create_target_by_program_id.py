@@ -0,0 +1,31 @@
+from typing import Any, Optional
+
+from msgspec import field
+
+from ..enums import CalibrationRole, Existence
+from .base_struct import BaseStruct
+from .fragments import (
+    TargetDetailsNonsidereal,
+    TargetDetailsOpportunity,
+    TargetDetailsSidereal,
+    TargetProgramSummaryProgram,
+)
+
+
+class CreateTargetByProgramId(BaseStruct):
+    create_target: "CreateTargetByProgramIdCreateTarget" = field(name="createTarget")
+
+
+class CreateTargetByProgramIdCreateTarget(BaseStruct):
+    target: "CreateTargetByProgramIdCreateTargetTarget"
+
+
+class CreateTargetByProgramIdCreateTargetTarget(BaseStruct):
+    id: Any
+    existence: Existence
+    name: Any
+    calibration_role: Optional[CalibrationRole] = field(name="calibrationRole")
+    opportunity: Optional["TargetDetailsOpportunity"]
+    sidereal: Optional["TargetDetailsSidereal"]
+    nonsidereal: Optional["TargetDetailsNonsidereal"]
+    program: "TargetProgramSummaryProgram"
@@ -0,0 +1,33 @@
+from typing import Any, Optional
+
+from msgspec import field
+
+from ..enums import CalibrationRole, Existence
+from .base_struct import BaseStruct
+from .fragments import (
+    TargetDetailsNonsidereal,
+    TargetDetailsOpportunity,
+    TargetDetailsSidereal,
+    TargetProgramSummaryProgram,
+)
+
+
+class CreateTargetByProgramReference(BaseStruct):
+    create_target: "CreateTargetByProgramReferenceCreateTarget" = field(
+        name="createTarget"
+    )
+
+
+class CreateTargetByProgramReferenceCreateTarget(BaseStruct):
+    target: "CreateTargetByProgramReferenceCreateTargetTarget"
+
+
+class CreateTargetByProgramReferenceCreateTargetTarget(BaseStruct):
+    id: Any
+    existence: Existence
+    name: Any
+    calibration_role: Optional[CalibrationRole] = field(name="calibrationRole")
+    opportunity: Optional["TargetDetailsOpportunity"]
+    sidereal: Optional["TargetDetailsSidereal"]
+    nonsidereal: Optional["TargetDetailsNonsidereal"]
+    program: "TargetProgramSummaryProgram"
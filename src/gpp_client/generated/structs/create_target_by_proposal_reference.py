@@ -0,0 +1,33 @@
+from typing import Any, Optional
+
+from msgspec import field
+
+from ..enums import CalibrationRole, Existence
+from .base_struct import BaseStruct
+from .fragments import (
+    TargetDetailsNonsidereal,
+    TargetDetailsOpportunity,
+    TargetDetailsSidereal,
+    TargetProgramSummaryProgram,
+)
+
+
+class CreateTargetByProposalReference(BaseStruct):
+    create_target: "CreateTargetByProposalReferenceCreateTarget" = field(
+        name="createTarget"
+    )
+
+
+class CreateTargetByProposalReferenceCreateTarget(BaseStruct):
+    target: "CreateTargetByProposalReferenceCreateTargetTarget"
+
+
+class CreateTargetByProposalReferenceCreateTargetTarget(BaseStruct):
+    id: Any
+    existence: Existence
+    name: Any
+    calibration_role: Optional[CalibrationRole] = field(name="calibrationRole")
+    opportunity: Optional["TargetDetailsOpportunity"]
+    sidereal: Optional["TargetDetailsSidereal"]
+    nonsidereal: Optional["TargetDetailsNonsidereal"]
+    program: "TargetProgramSummaryProgram"
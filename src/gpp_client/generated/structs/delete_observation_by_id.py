@@ -0,0 +1,56 @@
+from typing import Any, Optional
+
+from msgspec import field
+
+from ..enums import CalibrationRole, Existence, Instrument, ScienceBand
+from .base_struct import BaseStruct
+from .fragments import (
+    ObservationCoreReference,
+    ObservationDetailsConstraintSet,
+    ObservationDetailsExecution,
+    ObservationDetailsObservingMode,
+    ObservationDetailsProgram,
+    ObservationDetailsScienceRequirements,
+    ObservationDetailsTargetEnvironment,
+    ObservationDetailsTimingWindows,
+    ObservationDetailsWorkflow,
+)
+
+
+class DeleteObservationById(BaseStruct):
+    update_observations: "DeleteObservationByIdUpdateObservations" = field(
+        name="updateObservations"
+    )
+
+
+class DeleteObservationByIdUpdateObservations(BaseStruct):
+    has_more: bool = field(name="hasMore")
+    observations: list["DeleteObservationByIdUpdateObservationsObservations"]
+
+
+class DeleteObservationByIdUpdateObservationsObservations(BaseStruct):
+    id: Any
+    existence: Existence
+    reference: Optional["ObservationCoreReference"]
+    title: Any
+    instrument: Optional[Instrument]
+    calibration_role: Optional[CalibrationRole] = field(name="calibrationRole")
+    observer_notes: Optional[Any] = field(name="observerNotes")
+    subtitle: Optional[Any]
+    program: "ObservationDetailsProgram"
+    science_requirements: "ObservationDetailsScienceRequirements" = field(
+        name="scienceRequirements"
+    )
+    science_band: Optional[ScienceBand] = field(name="scienceBand")
+    workflow: Optional["ObservationDetailsWorkflow"]
+    observing_mode: Optional["ObservationDetailsObservingMode"] = field(
+        name="observingMode"
+    )
+    constraint_set: "ObservationDetailsConstraintSet" = field(name="constraintSet")
+    timing_windows: list["ObservationDetailsTimingWindows"] = field(
+        name="timingWindows"
+    )
+    target_environment: "ObservationDetailsTargetEnvironment" = field(
+        name="targetEnvironment"
+    )
+    execution: "ObservationDetailsExecution"
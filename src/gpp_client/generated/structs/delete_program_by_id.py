@@ -0,0 +1,72 @@
+from typing import Any, Optional
+
+from msgspec import field
+
+from ..enums import Existence, ProgramType, ProposalStatus
+from .base_struct import BaseStruct
+from .fragments import ProgramDetailActive, ProgramDetailPi, ProgramDetailProposal
+
+
+class DeleteProgramById(BaseStruct):
+    update_programs: "DeleteProgramByIdUpdatePrograms" = field(name="updatePrograms")
+
+
+class DeleteProgramByIdUpdatePrograms(BaseStruct):
+    has_more: bool = field(name="hasMore")
+    programs: list["DeleteProgramByIdUpdateProgramsPrograms"]
+
+
+class DeleteProgramByIdUpdateProgramsPrograms(BaseStruct):
+    id: Any
+    name: Optional[Any]
+    existence: Existence
+    description: Optional[Any]
+    type_: ProgramType = field(name="type")
+    active: "ProgramDetailActive"
+    proposal_status: ProposalStatus = field(name="proposalStatus")
+    proposal: Optional["ProgramDetailProposal"]
+    pi: Optional["ProgramDetailPi"]
+    all_group_elements: list[
+        "DeleteProgramByIdUpdateProgramsProgramsAllGroupElements"
+    ] = field(name="allGroupElements")
+
+
+class DeleteProgramByIdUpdateProgramsProgramsAllGroupElements(BaseStruct):
+    parent_group_id: Optional[Any] = field(name="parentGroupId")
+    observation: Optional[
+        "DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsObservation"
+    ]
+    group: Optional["DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsGroup"]
+
+
+class DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsObservation(BaseStruct):
+    id: Any
+    group_id: Optional[Any] = field(name="groupId")
+
+
+class DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsGroup(BaseStruct):
+    id: Any
+    name: Optional[Any]
+    minimum_required: Optional[Any] = field(name="minimumRequired")
+    ordered: bool
+    parent_id: Optional[Any] = field(name="parentId")
+    parent_index: Any = field(name="parentIndex")
+    minimum_interval: Optional[
+        "DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMinimumInterval"
+    ] = field(name="minimumInterval")
+    maximum_interval: Optional[
+        "DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMaximumInterval"
+    ] = field(name="maximumInterval")
+    system: bool
+
+
+class DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMinimumInterval(
+    BaseStruct
+):
+    seconds: Any
+
+
+class DeleteProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMaximumInterval(
+    BaseStruct
+):
+    seconds: Any
@@ -0,0 +1,38 @@
+from typing import Any, Optional
+
+from msgspec import field
+
+from ..enums import CalibrationRole, Existence
+from .base_struct import BaseStruct
+from .fragments import (
+    TargetDetailsNonsidereal,
+    TargetDetailsOpportunity,
+    TargetDetailsSidereal,
+)
+
+
+class DeleteTargetById(BaseStruct):
+    update_targets: "DeleteTargetByIdUpdateTargets" = field(name="updateTargets")
+
+
+class DeleteTargetByIdUpdateTargets(BaseStruct):
+    has_more: bool = field(name="hasMore")
+    targets: list["DeleteTargetByIdUpdateTargetsTargets"]
+
+
+class DeleteTargetByIdUpdateTargetsTargets(BaseStruct):
+    id: Any
+    existence: Existence
+    name: Any
+    calibration_role: Optional[CalibrationRole] = field(name="calibrationRole")
+    opportunity: Optional["TargetDetailsOpportunity"]
+    sidereal: Optional["TargetDetailsSidereal"]
+    nonsidereal: Optional["TargetDetailsNonsidereal"]
+    program: "DeleteTargetByIdUpdateTargetsTargetsProgram"
+
+
+class DeleteTargetByIdUpdateTargetsTargetsProgram(BaseStruct):
+    id: Any
+    name: Optional[Any]
+    description: Optional[Any]
+    existence: Existence
@@ -0,0 +1,1758 @@
+from typing import Any, Literal, Optional, Union
+
+from msgspec import field
+
+from ..enums import (
+    AttachmentType,
+    CalculationState,
+    CalibrationRole,
+    CloudExtinctionPreset,
+    EphemerisKeyType,
+    Existence,
+    Flamingos2Decker,
+    Flamingos2Disperser,
+    Flamingos2Filter,
+    Flamingos2Fpu,
+    Flamingos2ReadMode,
+    Flamingos2ReadoutMode,
+    Flamingos2Reads,
+    GeminiCallForProposalsType,
+    GhostBinning,
+    GhostIfu1FiberAgitator,
+    GhostIfu2FiberAgitator,
+    GhostReadMode,
+    GhostResolutionMode,
+    GmosBinning,
+    GmosNorthBuiltinFpu,
+    GmosNorthFilter,
+    GmosNorthGrating,
+    GmosSouthBuiltinFpu,
+    GmosSouthFilter,
+    GmosSouthGrating,
+    GnirsAcquisitionType,
+    GnirsCamera,
+    GnirsDecker,
+    GnirsFilter,
+    GnirsFpuIfu,
+    GnirsFpuSlit,
+    GnirsGrating,
+    GnirsPrism,
+    GnirsReadMode,
+    GnirsWellDepth,
+    GuideState,
+    ImageQualityPreset,
+    Instrument,
+    KeckInstrument,
+    ObservationValidationCode,
+    ObservationWorkflowState,
+    Observatory,
+    ObservingModeType,
+    ProgramType,
+    ProposalStatus,
+    ScienceBand,
+    ScienceMode,
+    ScienceSubtype,
+    SkyBackground,
+    SlitOffsetMode,
+    SubaruCallForProposalsType,
+    SubaruInstrument,
+    TelluricTag,
+    TimingWindowInclusion,
+    VisitorObservingModeType,
+    WaterVapor,
+)
+from .base_struct import BaseStruct, TaggedStruct
+
+
+class AttachmentDetails(BaseStruct):
+    id: Any
+    file_name: Any = field(name="fileName")
+    attachment_type: AttachmentType = field(name="attachmentType")
+    file_size: Any = field(name="fileSize")
+    checked: bool
+    description: Optional[Any]
+    updated_at: Any = field(name="updatedAt")
+
+
+class CallForProposalsCore(BaseStruct):
+    id: Any
+    title: Any
+    observatory: Observatory
+    gemini: Optional["CallForProposalsCoreGemini"]
+    keck: Optional["CallForProposalsCoreKeck"]
+    subaru: Optional["CallForProposalsCoreSubaru"]
+
+
+class CallForProposalsCoreGemini(BaseStruct):
+    type_: GeminiCallForProposalsType = field(name="type")
+    instruments: list[Instrument]
+
+
+class CallForProposalsCoreKeck(BaseStruct):
+    instruments: list[KeckInstrument]
+
+
+class CallForProposalsCoreSubaru(BaseStruct):
+    type_: SubaruCallForProposalsType = field(name="type")
+    instruments: list[SubaruInstrument]
+
+
+class CallForProposalsDetails(BaseStruct):
+    id: Any
+    title: Any
+    observatory: Observatory
+    gemini: Optional["CallForProposalsCoreGemini"]
+    keck: Optional["CallForProposalsCoreKeck"]
+    subaru: Optional["CallForProposalsCoreSubaru"]
+    semester: Any
+    active: "CallForProposalsDetailsActive"
+    submission_deadline_default: Optional[Any] = field(name="submissionDeadlineDefault")
+    existence: Existence
+
+
+class CallForProposalsDetailsActive(BaseStruct):
+    start: Any
+    end: Any
+
+
+class ConstraintSetDetails(BaseStruct):
+    image_quality: ImageQualityPreset = field(name="imageQuality")
+    cloud_extinction: CloudExtinctionPreset = field(name="cloudExtinction")
+    sky_background: SkyBackground = field(name="skyBackground")
+    water_vapor: WaterVapor = field(name="waterVapor")
+    elevation_range: "ConstraintSetDetailsElevationRange" = field(name="elevationRange")
+
+
+class ConstraintSetDetailsElevationRange(BaseStruct):
+    air_mass: Optional["ConstraintSetDetailsElevationRangeAirMass"] = field(
+        name="airMass"
+    )
+    hour_angle: Optional["ConstraintSetDetailsElevationRangeHourAngle"] = field(
+        name="hourAngle"
+    )
+
+
+class ConstraintSetDetailsElevationRangeAirMass(BaseStruct):
+    min: Any
+    max: Any
+
+
+class ConstraintSetDetailsElevationRangeHourAngle(BaseStruct):
+    min_hours: Any = field(name="minHours")
+    max_hours: Any = field(name="maxHours")
+
+
+class Flamingos2ImagingDetails(BaseStruct):
+    filters: list["Flamingos2ImagingDetailsFilters"]
+    initial_filters: list["Flamingos2ImagingDetailsInitialFilters"] = field(
+        name="initialFilters"
+    )
+    default_read_mode: Flamingos2ReadMode = field(name="defaultReadMode")
+    explicit_read_mode: Optional[Flamingos2ReadMode] = field(name="explicitReadMode")
+    default_reads: Flamingos2Reads = field(name="defaultReads")
+    explicit_reads: Optional[Flamingos2Reads] = field(name="explicitReads")
+    default_decker: Flamingos2Decker = field(name="defaultDecker")
+    explicit_decker: Optional[Flamingos2Decker] = field(name="explicitDecker")
+    readout_mode: Flamingos2ReadoutMode = field(name="readoutMode")
+    default_readout_mode: Flamingos2ReadoutMode = field(name="defaultReadoutMode")
+    explicit_readout_mode: Optional[Flamingos2ReadoutMode] = field(
+        name="explicitReadoutMode"
+    )
+
+
+class Flamingos2ImagingDetailsFilters(BaseStruct):
+    filter_: Flamingos2Filter = field(name="filter")
+    exposure_time_mode: "Flamingos2ImagingDetailsFiltersExposureTimeMode" = field(
+        name="exposureTimeMode"
+    )
+
+
+class Flamingos2ImagingDetailsFiltersExposureTimeMode(BaseStruct):
+    signal_to_noise: Optional[
+        "Flamingos2ImagingDetailsFiltersExposureTimeModeSignalToNoise"
+    ] = field(name="signalToNoise")
+    time_and_count: Optional[
+        "Flamingos2ImagingDetailsFiltersExposureTimeModeTimeAndCount"
+    ] = field(name="timeAndCount")
+
+
+class Flamingos2ImagingDetailsFiltersExposureTimeModeSignalToNoise(BaseStruct):
+    at: "Flamingos2ImagingDetailsFiltersExposureTimeModeSignalToNoiseAt"
+    value: Any
+
+
+class Flamingos2ImagingDetailsFiltersExposureTimeModeSignalToNoiseAt(BaseStruct):
+    nanometers: Any
+
+
+class Flamingos2ImagingDetailsFiltersExposureTimeModeTimeAndCount(BaseStruct):
+    time: "Flamingos2ImagingDetailsFiltersExposureTimeModeTimeAndCountTime"
+    count: Any
+
+
+class Flamingos2ImagingDetailsFiltersExposureTimeModeTimeAndCountTime(BaseStruct):
+    seconds: Any
+
+
+class Flamingos2ImagingDetailsInitialFilters(BaseStruct):
+    filter_: Flamingos2Filter = field(name="filter")
+    exposure_time_mode: "Flamingos2ImagingDetailsInitialFiltersExposureTimeMode" = (
+        field(name="exposureTimeMode")
+    )
+
+
+class Flamingos2ImagingDetailsInitialFiltersExposureTimeMode(BaseStruct):
+    signal_to_noise: Optional[
+        "Flamingos2ImagingDetailsInitialFiltersExposureTimeModeSignalToNoise"
+    ] = field(name="signalToNoise")
+    time_and_count: Optional[
+        "Flamingos2ImagingDetailsInitialFiltersExposureTimeModeTimeAndCount"
+    ] = field(name="timeAndCount")
+
+
+class Flamingos2ImagingDetailsInitialFiltersExposureTimeModeSignalToNoise(BaseStruct):
+    at: "Flamingos2ImagingDetailsInitialFiltersExposureTimeModeSignalToNoiseAt"
+    value: Any
+
+
+class Flamingos2ImagingDetailsInitialFiltersExposureTimeModeSignalToNoiseAt(BaseStruct):
+    nanometers: Any
+
+
+class Flamingos2ImagingDetailsInitialFiltersExposureTimeModeTimeAndCount(BaseStruct):
+    at: "Flamingos2ImagingDetailsInitialFiltersExposureTimeModeTimeAndCountAt"
+    count: Any
+    time: "Flamingos2ImagingDetailsInitialFiltersExposureTimeModeTimeAndCountTime"
+
+
+class Flamingos2ImagingDetailsInitialFiltersExposureTimeModeTimeAndCountAt(BaseStruct):
+    nanometers: Any
+
+
+class Flamingos2ImagingDetailsInitialFiltersExposureTimeModeTimeAndCountTime(
+    BaseStruct
+):
+    seconds: Any
+
+
+class Flamingos2LongSlitDetails(BaseStruct):
+    decker: Flamingos2Decker
+    default_decker: Flamingos2Decker = field(name="defaultDecker")
+    disperser: Flamingos2Disperser
+    filter_: Flamingos2Filter = field(name="filter")
+    fpu: Flamingos2Fpu
+    telluric_type: "Flamingos2LongSlitDetailsTelluricType" = field(name="telluricType")
+    exposure_time_mode: "Flamingos2LongSlitDetailsExposureTimeMode" = field(
+        name="exposureTimeMode"
+    )
+    explicit_read_mode: Optional[Flamingos2ReadMode] = field(name="explicitReadMode")
+    explicit_reads: Optional[Flamingos2Reads] = field(name="explicitReads")
+    explicit_decker: Optional[Flamingos2Decker] = field(name="explicitDecker")
+    readout_mode: Flamingos2ReadoutMode = field(name="readoutMode")
+    default_readout_mode: Flamingos2ReadoutMode = field(name="defaultReadoutMode")
+    acquisition: "Flamingos2LongSlitDetailsAcquisition"
+    initial_disperser: Flamingos2Disperser = field(name="initialDisperser")
+    initial_filter: Flamingos2Filter = field(name="initialFilter")
+    initial_fpu: Flamingos2Fpu = field(name="initialFpu")
+
+
+class Flamingos2LongSlitDetailsTelluricType(BaseStruct):
+    tag: TelluricTag
+    star_types: Optional[list[str]] = field(name="starTypes")
+
+
+class Flamingos2LongSlitDetailsExposureTimeMode(BaseStruct):
+    signal_to_noise: Optional[
+        "Flamingos2LongSlitDetailsExposureTimeModeSignalToNoise"
+    ] = field(name="signalToNoise")
+    time_and_count: Optional[
+        "Flamingos2LongSlitDetailsExposureTimeModeTimeAndCount"
+    ] = field(name="timeAndCount")
+
+
+class Flamingos2LongSlitDetailsExposureTimeModeSignalToNoise(BaseStruct):
+    value: Any
+    at: "Flamingos2LongSlitDetailsExposureTimeModeSignalToNoiseAt"
+
+
+class Flamingos2LongSlitDetailsExposureTimeModeSignalToNoiseAt(BaseStruct):
+    nanometers: Any
+
+
+class Flamingos2LongSlitDetailsExposureTimeModeTimeAndCount(BaseStruct):
+    time: "Flamingos2LongSlitDetailsExposureTimeModeTimeAndCountTime"
+    count: Any
+    at: "Flamingos2LongSlitDetailsExposureTimeModeTimeAndCountAt"
+
+
+class Flamingos2LongSlitDetailsExposureTimeModeTimeAndCountTime(BaseStruct):
+    seconds: Any
+
+
+class Flamingos2LongSlitDetailsExposureTimeModeTimeAndCountAt(BaseStruct):
+    nanometers: Any
+
+
+class Flamingos2LongSlitDetailsAcquisition(BaseStruct):
+    exposure_time_mode: "Flamingos2LongSlitDetailsAcquisitionExposureTimeMode" = field(
+        name="exposureTimeMode"
+    )
+
+
+class Flamingos2LongSlitDetailsAcquisitionExposureTimeMode(BaseStruct):
+    signal_to_noise: Optional[
+        "Flamingos2LongSlitDetailsAcquisitionExposureTimeModeSignalToNoise"
+    ] = field(name="signalToNoise")
+    time_and_count: Optional[
+        "Flamingos2LongSlitDetailsAcquisitionExposureTimeModeTimeAndCount"
+    ] = field(name="timeAndCount")
+
+
+class Flamingos2LongSlitDetailsAcquisitionExposureTimeModeSignalToNoise(BaseStruct):
+    value: Any
+    at: "Flamingos2LongSlitDetailsAcquisitionExposureTimeModeSignalToNoiseAt"
+
+
+class Flamingos2LongSlitDetailsAcquisitionExposureTimeModeSignalToNoiseAt(BaseStruct):
+    nanometers: Any
+
+
+class Flamingos2LongSlitDetailsAcquisitionExposureTimeModeTimeAndCount(BaseStruct):
+    time: "Flamingos2LongSlitDetailsAcquisitionExposureTimeModeTimeAndCountTime"
+    count: Any
+    at: "Flamingos2LongSlitDetailsAcquisitionExposureTimeModeTimeAndCountAt"
+
+
+class Flamingos2LongSlitDetailsAcquisitionExposureTimeModeTimeAndCountTime(BaseStruct):
+    seconds: Any
+
+
+class Flamingos2LongSlitDetailsAcquisitionExposureTimeModeTimeAndCountAt(BaseStruct):
+    nanometers: Any
+
+
+class GmosNorthImagingDetails(BaseStruct):
+    filters: list["GmosNorthImagingDetailsFilters"]
+    bin: GmosBinning
+
+
+class GmosNorthImagingDetailsFilters(BaseStruct):
+    filter_: GmosNorthFilter = field(name="filter")
+
+
+class GmosNorthLongSlitDetails(BaseStruct):
+    grating: GmosNorthGrating
+    filter_: Optional[GmosNorthFilter] = field(name="filter")
+    fpu: GmosNorthBuiltinFpu
+    central_wavelength: "GmosNorthLongSlitDetailsCentralWavelength" = field(
+        name="centralWavelength"
+    )
+    offsets: list["GmosNorthLongSlitDetailsOffsets"]
+    x_bin: GmosBinning = field(name="xBin")
+    y_bin: GmosBinning = field(name="yBin")
+
+
+class GmosNorthLongSlitDetailsCentralWavelength(BaseStruct):
+    nanometers: Any
+
+
+class GmosNorthLongSlitDetailsOffsets(BaseStruct):
+    arcseconds: Any
+
+
+class GmosSouthImagingDetails(BaseStruct):
+    filters: list["GmosSouthImagingDetailsFilters"]
+    bin: GmosBinning
+
+
+class GmosSouthImagingDetailsFilters(BaseStruct):
+    filter_: GmosSouthFilter = field(name="filter")
+
+
+class GmosSouthLongSlitDetails(BaseStruct):
+    grating: GmosSouthGrating
+    filter_: Optional[GmosSouthFilter] = field(name="filter")
+    fpu: GmosSouthBuiltinFpu
+    central_wavelength: "GmosSouthLongSlitDetailsCentralWavelength" = field(
+        name="centralWavelength"
+    )
+    offsets: list["GmosSouthLongSlitDetailsOffsets"]
+    x_bin: GmosBinning = field(name="xBin")
+    y_bin: GmosBinning = field(name="yBin")
+
+
+class GmosSouthLongSlitDetailsCentralWavelength(BaseStruct):
+    nanometers: Any
+
+
+class GmosSouthLongSlitDetailsOffsets(BaseStruct):
+    arcseconds: Any
+
+
+class GnirsImagingDetails(BaseStruct):
+    camera: GnirsCamera
+    default_well_depth: GnirsWellDepth = field(name="defaultWellDepth")
+    explicit_read_mode: Optional[GnirsReadMode] = field(name="explicitReadMode")
+    explicit_well_depth: Optional[GnirsWellDepth] = field(name="explicitWellDepth")
+    filters: list["GnirsImagingDetailsFilters"]
+    initial_filters: list["GnirsImagingDetailsInitialFilters"] = field(
+        name="initialFilters"
+    )
+    well_depth: GnirsWellDepth = field(name="wellDepth")
+
+
+class GnirsImagingDetailsFilters(BaseStruct):
+    exposure_time_mode: "GnirsImagingDetailsFiltersExposureTimeMode" = field(
+        name="exposureTimeMode"
+    )
+    filter_: GnirsFilter = field(name="filter")
+
+
+class GnirsImagingDetailsFiltersExposureTimeMode(BaseStruct):
+    signal_to_noise: Optional[
+        "GnirsImagingDetailsFiltersExposureTimeModeSignalToNoise"
+    ] = field(name="signalToNoise")
+    time_and_count: Optional[
+        "GnirsImagingDetailsFiltersExposureTimeModeTimeAndCount"
+    ] = field(name="timeAndCount")
+
+
+class GnirsImagingDetailsFiltersExposureTimeModeSignalToNoise(BaseStruct):
+    at: "GnirsImagingDetailsFiltersExposureTimeModeSignalToNoiseAt"
+    value: Any
+
+
+class GnirsImagingDetailsFiltersExposureTimeModeSignalToNoiseAt(BaseStruct):
+    nanometers: Any
+
+
+class GnirsImagingDetailsFiltersExposureTimeModeTimeAndCount(BaseStruct):
+    at: "GnirsImagingDetailsFiltersExposureTimeModeTimeAndCountAt"
+    count: Any
+    time: "GnirsImagingDetailsFiltersExposureTimeModeTimeAndCountTime"
+
+
+class GnirsImagingDetailsFiltersExposureTimeModeTimeAndCountAt(BaseStruct):
+    nanometers: Any
+
+
+class GnirsImagingDetailsFiltersExposureTimeModeTimeAndCountTime(BaseStruct):
+    seconds: Any
+
+
+class GnirsImagingDetailsInitialFilters(BaseStruct):
+    exposure_time_mode: "GnirsImagingDetailsInitialFiltersExposureTimeMode" = field(
+        name="exposureTimeMode"
+    )
+    filter_: GnirsFilter = field(name="filter")
+
+
+class GnirsImagingDetailsInitialFiltersExposureTimeMode(BaseStruct):
+    signal_to_noise: Optional[
+        "GnirsImagingDetailsInitialFiltersExposureTimeModeSignalToNoise"
+    ] = field(name="signalToNoise")
+    time_and_count: Optional[
+        "GnirsImagingDetailsInitialFiltersExposureTimeModeTimeAndCount"
+    ] = field(name="timeAndCount")
+
+
+class GnirsImagingDetailsInitialFiltersExposureTimeModeSignalToNoise(BaseStruct):
+    at: "GnirsImagingDetailsInitialFiltersExposureTimeModeSignalToNoiseAt"
+    value: Any
+
+
+class GnirsImagingDetailsInitialFiltersExposureTimeModeSignalToNoiseAt(BaseStruct):
+    nanometers: Any
+
+
+class GnirsImagingDetailsInitialFiltersExposureTimeModeTimeAndCount(BaseStruct):
+    at: "GnirsImagingDetailsInitialFiltersExposureTimeModeTimeAndCountAt"
+    count: Any
+    time: "GnirsImagingDetailsInitialFiltersExposureTimeModeTimeAndCountTime"
+
+
+class GnirsImagingDetailsInitialFiltersExposureTimeModeTimeAndCountAt(BaseStruct):
+    nanometers: Any
+
+
+class GnirsImagingDetailsInitialFiltersExposureTimeModeTimeAndCountTime(BaseStruct):
+    seconds: Any
+
+
+class GnirsSpectroscopyDetails(BaseStruct):
+    acquisition: "GnirsSpectroscopyDetailsAcquisition"
+    camera: GnirsCamera
+    central_wavelengths: list["GnirsSpectroscopyDetailsCentralWavelengths"] = field(
+        name="centralWavelengths"
+    )
+    decker: GnirsDecker
+    default_decker: GnirsDecker = field(name="defaultDecker")
+    default_well_depth: GnirsWellDepth = field(name="defaultWellDepth")
+    explicit_decker: Optional[GnirsDecker] = field(name="explicitDecker")
+    explicit_focus_motor_steps: Optional[int] = field(name="explicitFocusMotorSteps")
+    explicit_grating: Optional[GnirsGrating] = field(name="explicitGrating")
+    explicit_prism: Optional[GnirsPrism] = field(name="explicitPrism")
+    explicit_read_mode: Optional[GnirsReadMode] = field(name="explicitReadMode")
+    explicit_well_depth: Optional[GnirsWellDepth] = field(name="explicitWellDepth")
+    filter_: GnirsFilter = field(name="filter")
+    grating: GnirsGrating
+    ifu: Optional["GnirsSpectroscopyDetailsIfu"]
+    initial_camera: GnirsCamera = field(name="initialCamera")
+    initial_filter: GnirsFilter = field(name="initialFilter")
+    initial_grating: GnirsGrating = field(name="initialGrating")
+    initial_prism: GnirsPrism = field(name="initialPrism")
+    prism: GnirsPrism
+    telluric_type: "GnirsSpectroscopyDetailsTelluricType" = field(name="telluricType")
+    well_depth: GnirsWellDepth = field(name="wellDepth")
+    slit: Optional["GnirsSpectroscopyDetailsSlit"]
+
+
+class GnirsSpectroscopyDetailsAcquisition(BaseStruct):
+    explicit_acquisition_type: Optional[GnirsAcquisitionType] = field(
+        name="explicitAcquisitionType"
+    )
+    explicit_filter: Optional[GnirsFilter] = field(name="explicitFilter")
+    exposure_time_mode: "GnirsSpectroscopyDetailsAcquisitionExposureTimeMode" = field(
+        name="exposureTimeMode"
+    )
+    sky_offset: Optional["GnirsSpectroscopyDetailsAcquisitionSkyOffset"] = field(
+        name="skyOffset"
+    )
+
+
+class GnirsSpectroscopyDetailsAcquisitionExposureTimeMode(BaseStruct):
+    signal_to_noise: Optional[
+        "GnirsSpectroscopyDetailsAcquisitionExposureTimeModeSignalToNoise"
+    ] = field(name="signalToNoise")
+    time_and_count: Optional[
+        "GnirsSpectroscopyDetailsAcquisitionExposureTimeModeTimeAndCount"
+    ] = field(name="timeAndCount")
+
+
+class GnirsSpectroscopyDetailsAcquisitionExposureTimeModeSignalToNoise(BaseStruct):
+    at: "GnirsSpectroscopyDetailsAcquisitionExposureTimeModeSignalToNoiseAt"
+    value: Any
+
+
+class GnirsSpectroscopyDetailsAcquisitionExposureTimeModeSignalToNoiseAt(BaseStruct):
+    nanometers: Any
+
+
+class GnirsSpectroscopyDetailsAcquisitionExposureTimeModeTimeAndCount(BaseStruct):
+    at: "GnirsSpectroscopyDetailsAcquisitionExposureTimeModeTimeAndCountAt"
+    count: Any
+    time: "GnirsSpectroscopyDetailsAcquisitionExposureTimeModeTimeAndCountTime"
+
+
+class GnirsSpectroscopyDetailsAcquisitionExposureTimeModeTimeAndCountAt(BaseStruct):
+    nanometers: Any
+
+
+class GnirsSpectroscopyDetailsAcquisitionExposureTimeModeTimeAndCountTime(BaseStruct):
+    seconds: Any
+
+
+class GnirsSpectroscopyDetailsAcquisitionSkyOffset(BaseStruct):
+    p: "GnirsSpectroscopyDetailsAcquisitionSkyOffsetP"
+    q: "GnirsSpectroscopyDetailsAcquisitionSkyOffsetQ"
+
+
+class GnirsSpectroscopyDetailsAcquisitionSkyOffsetP(BaseStruct):
+    arcseconds: Any
+
+
+class GnirsSpectroscopyDetailsAcquisitionSkyOffsetQ(BaseStruct):
+    arcseconds: Any
+
+
+class GnirsSpectroscopyDetailsCentralWavelengths(BaseStruct):
+    central_wavelength: "GnirsSpectroscopyDetailsCentralWavelengthsCentralWavelength" = field(
+        name="centralWavelength"
+    )
+
+
+class GnirsSpectroscopyDetailsCentralWavelengthsCentralWavelength(BaseStruct):
+    nanometers: Any
+
+
+class GnirsSpectroscopyDetailsIfu(BaseStruct):
+    fpu: GnirsFpuIfu
+    initial_fpu: GnirsFpuIfu = field(name="initialFpu")
+    telescope_configs: list["GnirsSpectroscopyDetailsIfuTelescopeConfigs"] = field(
+        name="telescopeConfigs"
+    )
+
+
+class GnirsSpectroscopyDetailsIfuTelescopeConfigs(BaseStruct):
+    guiding: GuideState
+    offset: "GnirsSpectroscopyDetailsIfuTelescopeConfigsOffset"
+
+
+class GnirsSpectroscopyDetailsIfuTelescopeConfigsOffset(BaseStruct):
+    p: "GnirsSpectroscopyDetailsIfuTelescopeConfigsOffsetP"
+    q: "GnirsSpectroscopyDetailsIfuTelescopeConfigsOffsetQ"
+
+
+class GnirsSpectroscopyDetailsIfuTelescopeConfigsOffsetP(BaseStruct):
+    arcseconds: Any
+
+
+class GnirsSpectroscopyDetailsIfuTelescopeConfigsOffsetQ(BaseStruct):
+    arcseconds: Any
+
+
+class GnirsSpectroscopyDetailsTelluricType(BaseStruct):
+    star_types: Optional[list[str]] = field(name="starTypes")
+    tag: TelluricTag
+
+
+class GnirsSpectroscopyDetailsSlit(BaseStruct):
+    fpu: GnirsFpuSlit
+    initial_fpu: GnirsFpuSlit = field(name="initialFpu")
+    default_telescope_configs: "GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigs" = (
+        field(name="defaultTelescopeConfigs")
+    )
+    explicit_telescope_configs: Optional[
+        "GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigs"
+    ] = field(name="explicitTelescopeConfigs")
+    telescope_configs: "GnirsSpectroscopyDetailsSlitTelescopeConfigs" = field(
+        name="telescopeConfigs"
+    )
+
+
+class GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigs(BaseStruct):
+    along_slit: Optional[
+        list["GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsAlongSlit"]
+    ] = field(name="alongSlit")
+    offset_mode: SlitOffsetMode = field(name="offsetMode")
+    to_sky: Optional[
+        list["GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSky"]
+    ] = field(name="toSky")
+
+
+class GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsAlongSlit(BaseStruct):
+    guiding: GuideState
+    q: "GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsAlongSlitQ"
+
+
+class GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsAlongSlitQ(BaseStruct):
+    arcseconds: Any
+
+
+class GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSky(BaseStruct):
+    guiding: GuideState
+    offset: "GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSkyOffset"
+
+
+class GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSkyOffset(BaseStruct):
+    p: "GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSkyOffsetP"
+    q: "GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSkyOffsetQ"
+
+
+class GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSkyOffsetP(BaseStruct):
+    arcseconds: Any
+
+
+class GnirsSpectroscopyDetailsSlitDefaultTelescopeConfigsToSkyOffsetQ(BaseStruct):
+    arcseconds: Any
+
+
+class GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigs(BaseStruct):
+    along_slit: Optional[
+        list["GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsAlongSlit"]
+    ] = field(name="alongSlit")
+    offset_mode: SlitOffsetMode = field(name="offsetMode")
+    to_sky: Optional[
+        list["GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSky"]
+    ] = field(name="toSky")
+
+
+class GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsAlongSlit(BaseStruct):
+    guiding: GuideState
+    q: "GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsAlongSlitQ"
+
+
+class GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsAlongSlitQ(BaseStruct):
+    arcseconds: Any
+
+
+class GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSky(BaseStruct):
+    guiding: GuideState
+    offset: "GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSkyOffset"
+
+
+class GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSkyOffset(BaseStruct):
+    p: "GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSkyOffsetP"
+    q: "GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSkyOffsetQ"
+
+
+class GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSkyOffsetP(BaseStruct):
+    arcseconds: Any
+
+
+class GnirsSpectroscopyDetailsSlitExplicitTelescopeConfigsToSkyOffsetQ(BaseStruct):
+    arcseconds: Any
+
+
+class GnirsSpectroscopyDetailsSlitTelescopeConfigs(BaseStruct):
+    along_slit: Optional[
+        list["GnirsSpectroscopyDetailsSlitTelescopeConfigsAlongSlit"]
+    ] = field(name="alongSlit")
+    offset_mode: SlitOffsetMode = field(name="offsetMode")
+    to_sky: Optional[list["GnirsSpectroscopyDetailsSlitTelescopeConfigsToSky"]] = field(
+        name="toSky"
+    )
+
+
+class GnirsSpectroscopyDetailsSlitTelescopeConfigsAlongSlit(BaseStruct):
+    guiding: GuideState
+    q: "GnirsSpectroscopyDetailsSlitTelescopeConfigsAlongSlitQ"
+
+
+class GnirsSpectroscopyDetailsSlitTelescopeConfigsAlongSlitQ(BaseStruct):
+    arcseconds: Any
+
+
+class GnirsSpectroscopyDetailsSlitTelescopeConfigsToSky(BaseStruct):
+    guiding: GuideState
+    offset: "GnirsSpectroscopyDetailsSlitTelescopeConfigsToSkyOffset"
+
+
+class GnirsSpectroscopyDetailsSlitTelescopeConfigsToSkyOffset(BaseStruct):
+    p: "GnirsSpectroscopyDetailsSlitTelescopeConfigsToSkyOffsetP"
+    q: "GnirsSpectroscopyDetailsSlitTelescopeConfigsToSkyOffsetQ"
+
+
+class GnirsSpectroscopyDetailsSlitTelescopeConfigsToSkyOffsetP(BaseStruct):
+    arcseconds: Any
+
+
+class GnirsSpectroscopyDetailsSlitTelescopeConfigsToSkyOffsetQ(BaseStruct):
+    arcseconds: Any
+
+
+class GnirsDetails(BaseStruct):
+    gnirs_spectroscopy: Optional["GnirsDetailsGnirsSpectroscopy"] = field(
+        name="gnirsSpectroscopy"
+    )
+    gnirs_imaging: Optional["GnirsDetailsGnirsImaging"] = field(name="gnirsImaging")
+
+
+class GnirsDetailsGnirsSpectroscopy(BaseStruct):
+    acquisition: "GnirsSpectroscopyDetailsAcquisition"
+    camera: GnirsCamera
+    central_wavelengths: list["GnirsSpectroscopyDetailsCentralWavelengths"] = field(
+        name="centralWavelengths"
+    )
+    decker: GnirsDecker
+    default_decker: GnirsDecker = field(name="defaultDecker")
+    default_well_depth: GnirsWellDepth = field(name="defaultWellDepth")
+    explicit_decker: Optional[GnirsDecker] = field(name="explicitDecker")
+    explicit_focus_motor_steps: Optional[int] = field(name="explicitFocusMotorSteps")
+    explicit_grating: Optional[GnirsGrating] = field(name="explicitGrating")
+    explicit_prism: Optional[GnirsPrism] = field(name="explicitPrism")
+    explicit_read_mode: Optional[GnirsReadMode] = field(name="explicitReadMode")
+    explicit_well_depth: Optional[GnirsWellDepth] = field(name="explicitWellDepth")
+    filter_: GnirsFilter = field(name="filter")
+    grating: GnirsGrating
+    ifu: Optional["GnirsSpectroscopyDetailsIfu"]
+    initial_camera: GnirsCamera = field(name="initialCamera")
+    initial_filter: GnirsFilter = field(name="initialFilter")
+    initial_grating: GnirsGrating = field(name="initialGrating")
+    initial_prism: GnirsPrism = field(name="initialPrism")
+    prism: GnirsPrism
+    telluric_type: "GnirsSpectroscopyDetailsTelluricType" = field(name="telluricType")
+    well_depth: GnirsWellDepth = field(name="wellDepth")
+    slit: Optional["GnirsSpectroscopyDetailsSlit"]
+
+
+class GnirsDetailsGnirsImaging(BaseStruct):
+    camera: GnirsCamera
+    default_well_depth: GnirsWellDepth = field(name="defaultWellDepth")
+    explicit_read_mode: Optional[GnirsReadMode] = field(name="explicitReadMode")
+    explicit_well_depth: Optional[GnirsWellDepth] = field(name="explicitWellDepth")
+    filters: list["GnirsImagingDetailsFilters"]
+    initial_filters: list["GnirsImagingDetailsInitialFilters"] = field(
+        name="initialFilters"
+    )
+    well_depth: GnirsWellDepth = field(name="wellDepth")
+
+
+class Igrins2LongSlitDetails(BaseStruct):
+    exposure_time_mode: "Igrins2LongSlitDetailsExposureTimeMode" = field(
+        name="exposureTimeMode"
+    )
+    telluric_type: "Igrins2LongSlitDetailsTelluricType" = field(name="telluricType")
+
+
+class Igrins2LongSlitDetailsExposureTimeMode(BaseStruct):
+    signal_to_noise: Optional["Igrins2LongSlitDetailsExposureTimeModeSignalToNoise"] = (
+        field(name="signalToNoise")
+    )
+    time_and_count: Optional["Igrins2LongSlitDetailsExposureTimeModeTimeAndCount"] = (
+        field(name="timeAndCount")
+    )
+
+
+class Igrins2LongSlitDetailsExposureTimeModeSignalToNoise(BaseStruct):
+    value: Any
+    at: "Igrins2LongSlitDetailsExposureTimeModeSignalToNoiseAt"
+
+
+class Igrins2LongSlitDetailsExposureTimeModeSignalToNoiseAt(BaseStruct):
+    nanometers: Any
+
+
+class Igrins2LongSlitDetailsExposureTimeModeTimeAndCount(BaseStruct):
+    time: "Igrins2LongSlitDetailsExposureTimeModeTimeAndCountTime"
+    count: Any
+    at: "Igrins2LongSlitDetailsExposureTimeModeTimeAndCountAt"
+
+
+class Igrins2LongSlitDetailsExposureTimeModeTimeAndCountTime(BaseStruct):
+    seconds: Any
+
+
+class Igrins2LongSlitDetailsExposureTimeModeTimeAndCountAt(BaseStruct):
+    nanometers: Any
+
+
+class Igrins2LongSlitDetailsTelluricType(BaseStruct):
+    tag: TelluricTag
+    star_types: Optional[list[str]] = field(name="starTypes")
+
+
+class NonsiderealTargetDetails(BaseStruct):
+    des: str
+    key_type: EphemerisKeyType = field(name="keyType")
+    key: str
+
+
+class ObservationCore(BaseStruct):
+    id: Any
+    existence: Existence
+    reference: Optional["ObservationCoreReference"]
+    title: Any
+    instrument: Optional[Instrument]
+    calibration_role: Optional[CalibrationRole] = field(name="calibrationRole")
+
+
+class ObservationCoreReference(BaseStruct):
+    label: Any
+
+
+class VisitorDetails(BaseStruct):
+    mode: VisitorObservingModeType
+    name: Optional[Any]
+    central_wavelength: "VisitorDetailsCentralWavelength" = field(
+        name="centralWavelength"
+    )
+    total_request_time: Optional["VisitorDetailsTotalRequestTime"] = field(
+        name="totalRequestTime"
+    )
+    ags_diameter: "VisitorDetailsAgsDiameter" = field(name="agsDiameter")
+
+
+class VisitorDetailsCentralWavelength(BaseStruct):
+    nanometers: Any
+
+
+class VisitorDetailsTotalRequestTime(BaseStruct):
+    seconds: Any
+
+
+class VisitorDetailsAgsDiameter(BaseStruct):
+    dms: str
+    hms: str
+
+
+class GhostDetectorConfigDetails(BaseStruct):
+    binning: GhostBinning
+    default_binning: GhostBinning = field(name="defaultBinning")
+    default_read_mode: GhostReadMode = field(name="defaultReadMode")
+    explicit_binning: Optional[GhostBinning] = field(name="explicitBinning")
+    explicit_read_mode: Optional[GhostReadMode] = field(name="explicitReadMode")
+    read_mode: GhostReadMode = field(name="readMode")
+    exposure_time_mode: "GhostDetectorConfigDetailsExposureTimeMode" = field(
+        name="exposureTimeMode"
+    )
+
+
+class GhostDetectorConfigDetailsExposureTimeMode(BaseStruct):
+    signal_to_noise: Optional[
+        "GhostDetectorConfigDetailsExposureTimeModeSignalToNoise"
+    ] = field(name="signalToNoise")
+    time_and_count: Optional[
+        "GhostDetectorConfigDetailsExposureTimeModeTimeAndCount"
+    ] = field(name="timeAndCount")
+
+
+class GhostDetectorConfigDetailsExposureTimeModeSignalToNoise(BaseStruct):
+    value: Any
+    at: "GhostDetectorConfigDetailsExposureTimeModeSignalToNoiseAt"
+
+
+class GhostDetectorConfigDetailsExposureTimeModeSignalToNoiseAt(BaseStruct):
+    nanometers: Any
+
+
+class GhostDetectorConfigDetailsExposureTimeModeTimeAndCount(BaseStruct):
+    at: "GhostDetectorConfigDetailsExposureTimeModeTimeAndCountAt"
+    time: "GhostDetectorConfigDetailsExposureTimeModeTimeAndCountTime"
+    count: Any
+
+
+class GhostDetectorConfigDetailsExposureTimeModeTimeAndCountAt(BaseStruct):
+    nanometers: Any
+
+
+class GhostDetectorConfigDetailsExposureTimeModeTimeAndCountTime(BaseStruct):
+    seconds: Any
+
+
+class GhostIfuDetails(BaseStruct):
+    default_ifu_1_agitator: GhostIfu1FiberAgitator = field(name="defaultIfu1Agitator")
+    default_ifu_2_agitator: GhostIfu2FiberAgitator = field(name="defaultIfu2Agitator")
+    explicit_ifu_1_agitator: Optional[GhostIfu1FiberAgitator] = field(
+        name="explicitIfu1Agitator"
+    )
+    explicit_ifu_2_agitator: Optional[GhostIfu2FiberAgitator] = field(
+        name="explicitIfu2Agitator"
+    )
+    ifu_1_agitator: GhostIfu1FiberAgitator = field(name="ifu1Agitator")
+    ifu_2_agitator: GhostIfu2FiberAgitator = field(name="ifu2Agitator")
+    resolution_mode: GhostResolutionMode = field(name="resolutionMode")
+    step_count: Any = field(name="stepCount")
+    blue: "GhostIfuDetailsBlue"
+    red: "GhostIfuDetailsRed"
+    sky_position: Optional["GhostIfuDetailsSkyPosition"] = field(name="skyPosition")
+    slit_viewing_camera_exposure_time: Optional[
+        "GhostIfuDetailsSlitViewingCameraExposureTime"
+    ] = field(name="slitViewingCameraExposureTime")
+
+
+class GhostIfuDetailsBlue(BaseStruct):
+    binning: GhostBinning
+    default_binning: GhostBinning = field(name="defaultBinning")
+    default_read_mode: GhostReadMode = field(name="defaultReadMode")
+    explicit_binning: Optional[GhostBinning] = field(name="explicitBinning")
+    explicit_read_mode: Optional[GhostReadMode] = field(name="explicitReadMode")
+    read_mode: GhostReadMode = field(name="readMode")
+    exposure_time_mode: "GhostDetectorConfigDetailsExposureTimeMode" = field(
+        name="exposureTimeMode"
+    )
+
+
+class GhostIfuDetailsRed(BaseStruct):
+    binning: GhostBinning
+    default_binning: GhostBinning = field(name="defaultBinning")
+    default_read_mode: GhostReadMode = field(name="defaultReadMode")
+    explicit_binning: Optional[GhostBinning] = field(name="explicitBinning")
+    explicit_read_mode: Optional[GhostReadMode] = field(name="explicitReadMode")
+    read_mode: GhostReadMode = field(name="readMode")
+    exposure_time_mode: "GhostDetectorConfigDetailsExposureTimeMode" = field(
+        name="exposureTimeMode"
+    )
+
+
+class GhostIfuDetailsSkyPosition(BaseStruct):
+    dec: "GhostIfuDetailsSkyPositionDec"
+    ra: "GhostIfuDetailsSkyPositionRa"
+
+
+class GhostIfuDetailsSkyPositionDec(BaseStruct):
+    degrees: Any
+
+
+class GhostIfuDetailsSkyPositionRa(BaseStruct):
+    degrees: Any
+
+
+class GhostIfuDetailsSlitViewingCameraExposureTime(BaseStruct):
+    seconds: Any
+
+
+class ObservingModeDetails(BaseStruct):
+    instrument: Optional[Instrument]
+    mode: ObservingModeType
+    gmos_north_long_slit: Optional["ObservingModeDetailsGmosNorthLongSlit"] = field(
+        name="gmosNorthLongSlit"
+    )
+    gmos_south_long_slit: Optional["ObservingModeDetailsGmosSouthLongSlit"] = field(
+        name="gmosSouthLongSlit"
+    )
+    gmos_north_imaging: Optional["ObservingModeDetailsGmosNorthImaging"] = field(
+        name="gmosNorthImaging"
+    )
+    gmos_south_imaging: Optional["ObservingModeDetailsGmosSouthImaging"] = field(
+        name="gmosSouthImaging"
+    )
+    flamingos_2_long_slit: Optional["ObservingModeDetailsFlamingos2LongSlit"] = field(
+        name="flamingos2LongSlit"
+    )
+    flamingos_2_imaging: Optional["ObservingModeDetailsFlamingos2Imaging"] = field(
+        name="flamingos2Imaging"
+    )
+    igrins_2_long_slit: Optional["ObservingModeDetailsIgrins2LongSlit"] = field(
+        name="igrins2LongSlit"
+    )
+    visitor: Optional["ObservingModeDetailsVisitor"]
+    ghost_ifu: Optional["ObservingModeDetailsGhostIfu"] = field(name="ghostIfu")
+    gnirs_spectroscopy: Optional["ObservingModeDetailsGnirsSpectroscopy"] = field(
+        name="gnirsSpectroscopy"
+    )
+    gnirs_imaging: Optional["ObservingModeDetailsGnirsImaging"] = field(
+        name="gnirsImaging"
+    )
+
+
+class ObservingModeDetailsGmosNorthLongSlit(BaseStruct):
+    grating: GmosNorthGrating
+    filter_: Optional[GmosNorthFilter] = field(name="filter")
+    fpu: GmosNorthBuiltinFpu
+    central_wavelength: "GmosNorthLongSlitDetailsCentralWavelength" = field(
+        name="centralWavelength"
+    )
+    offsets: list["GmosNorthLongSlitDetailsOffsets"]
+    x_bin: GmosBinning = field(name="xBin")
+    y_bin: GmosBinning = field(name="yBin")
+
+
+class ObservingModeDetailsGmosSouthLongSlit(BaseStruct):
+    grating: GmosSouthGrating
+    filter_: Optional[GmosSouthFilter] = field(name="filter")
+    fpu: GmosSouthBuiltinFpu
+    central_wavelength: "GmosSouthLongSlitDetailsCentralWavelength" = field(
+        name="centralWavelength"
+    )
+    offsets: list["GmosSouthLongSlitDetailsOffsets"]
+    x_bin: GmosBinning = field(name="xBin")
+    y_bin: GmosBinning = field(name="yBin")
+
+
+class ObservingModeDetailsGmosNorthImaging(BaseStruct):
+    filters: list["GmosNorthImagingDetailsFilters"]
+    bin: GmosBinning
+
+
+class ObservingModeDetailsGmosSouthImaging(BaseStruct):
+    filters: list["GmosSouthImagingDetailsFilters"]
+    bin: GmosBinning
+
+
+class ObservingModeDetailsFlamingos2LongSlit(BaseStruct):
+    decker: Flamingos2Decker
+    default_decker: Flamingos2Decker = field(name="defaultDecker")
+    disperser: Flamingos2Disperser
+    filter_: Flamingos2Filter = field(name="filter")
+    fpu: Flamingos2Fpu
+    telluric_type: "Flamingos2LongSlitDetailsTelluricType" = field(name="telluricType")
+    exposure_time_mode: "Flamingos2LongSlitDetailsExposureTimeMode" = field(
+        name="exposureTimeMode"
+    )
+    explicit_read_mode: Optional[Flamingos2ReadMode] = field(name="explicitReadMode")
+    explicit_reads: Optional[Flamingos2Reads] = field(name="explicitReads")
+    explicit_decker: Optional[Flamingos2Decker] = field(name="explicitDecker")
+    readout_mode: Flamingos2ReadoutMode = field(name="readoutMode")
+    default_readout_mode: Flamingos2ReadoutMode = field(name="defaultReadoutMode")
+    acquisition: "Flamingos2LongSlitDetailsAcquisition"
+    initial_disperser: Flamingos2Disperser = field(name="initialDisperser")
+    initial_filter: Flamingos2Filter = field(name="initialFilter")
+    initial_fpu: Flamingos2Fpu = field(name="initialFpu")
+
+
+class ObservingModeDetailsFlamingos2Imaging(BaseStruct):
+    filters: list["Flamingos2ImagingDetailsFilters"]
+    initial_filters: list["Flamingos2ImagingDetailsInitialFilters"] = field(
+        name="initialFilters"
+    )
+    default_read_mode: Flamingos2ReadMode = field(name="defaultReadMode")
+    explicit_read_mode: Optional[Flamingos2ReadMode] = field(name="explicitReadMode")
+    default_reads: Flamingos2Reads = field(name="defaultReads")
+    explicit_reads: Optional[Flamingos2Reads] = field(name="explicitReads")
+    default_decker: Flamingos2Decker = field(name="defaultDecker")
+    explicit_decker: Optional[Flamingos2Decker] = field(name="explicitDecker")
+    readout_mode: Flamingos2ReadoutMode = field(name="readoutMode")
+    default_readout_mode: Flamingos2ReadoutMode = field(name="defaultReadoutMode")
+    explicit_readout_mode: Optional[Flamingos2ReadoutMode] = field(
+        name="explicitReadoutMode"
+    )
+
+
+class ObservingModeDetailsIgrins2LongSlit(BaseStruct):
+    exposure_time_mode: "Igrins2LongSlitDetailsExposureTimeMode" = field(
+        name="exposureTimeMode"
+    )
+    telluric_type: "Igrins2LongSlitDetailsTelluricType" = field(name="telluricType")
+
+
+class ObservingModeDetailsVisitor(BaseStruct):
+    mode: VisitorObservingModeType
+    name: Optional[Any]
+    central_wavelength: "VisitorDetailsCentralWavelength" = field(
+        name="centralWavelength"
+    )
+    total_request_time: Optional["VisitorDetailsTotalRequestTime"] = field(
+        name="totalRequestTime"
+    )
+    ags_diameter: "VisitorDetailsAgsDiameter" = field(name="agsDiameter")
+
+
+class ObservingModeDetailsGhostIfu(BaseStruct):
+    default_ifu_1_agitator: GhostIfu1FiberAgitator = field(name="defaultIfu1Agitator")
+    default_ifu_2_agitator: GhostIfu2FiberAgitator = field(name="defaultIfu2Agitator")
+    explicit_ifu_1_agitator: Optional[GhostIfu1FiberAgitator] = field(
+        name="explicitIfu1Agitator"
+    )
+    explicit_ifu_2_agitator: Optional[GhostIfu2FiberAgitator] = field(
+        name="explicitIfu2Agitator"
+    )
+    ifu_1_agitator: GhostIfu1FiberAgitator = field(name="ifu1Agitator")
+    ifu_2_agitator: GhostIfu2FiberAgitator = field(name="ifu2Agitator")
+    resolution_mode: GhostResolutionMode = field(name="resolutionMode")
+    step_count: Any = field(name="stepCount")
+    blue: "GhostIfuDetailsBlue"
+    red: "GhostIfuDetailsRed"
+    sky_position: Optional["GhostIfuDetailsSkyPosition"] = field(name="skyPosition")
+    slit_viewing_camera_exposure_time: Optional[
+        "GhostIfuDetailsSlitViewingCameraExposureTime"
+    ] = field(name="slitViewingCameraExposureTime")
+
+
+class ObservingModeDetailsGnirsSpectroscopy(BaseStruct):
+    acquisition: "GnirsSpectroscopyDetailsAcquisition"
+    camera: GnirsCamera
+    central_wavelengths: list["GnirsSpectroscopyDetailsCentralWavelengths"] = field(
+        name="centralWavelengths"
+    )
+    decker: GnirsDecker
+    default_decker: GnirsDecker = field(name="defaultDecker")
+    default_well_depth: GnirsWellDepth = field(name="defaultWellDepth")
+    explicit_decker: Optional[GnirsDecker] = field(name="explicitDecker")
+    explicit_focus_motor_steps: Optional[int] = field(name="explicitFocusMotorSteps")
+    explicit_grating: Optional[GnirsGrating] = field(name="explicitGrating")
+    explicit_prism: Optional[GnirsPrism] = field(name="explicitPrism")
+    explicit_read_mode: Optional[GnirsReadMode] = field(name="explicitReadMode")
+    explicit_well_depth: Optional[GnirsWellDepth] = field(name="explicitWellDepth")
+    filter_: GnirsFilter = field(name="filter")
+    grating: GnirsGrating
+    ifu: Optional["GnirsSpectroscopyDetailsIfu"]
+    initial_camera: GnirsCamera = field(name="initialCamera")
+    initial_filter: GnirsFilter = field(name="initialFilter")
+    initial_grating: GnirsGrating = field(name="initialGrating")
+    initial_prism: GnirsPrism = field(name="initialPrism")
+    prism: GnirsPrism
+    telluric_type: "GnirsSpectroscopyDetailsTelluricType" = field(name="telluricType")
+    well_depth: GnirsWellDepth = field(name="wellDepth")
+    slit: Optional["GnirsSpectroscopyDetailsSlit"]
+
+
+class ObservingModeDetailsGnirsImaging(BaseStruct):
+    camera: GnirsCamera
+    default_well_depth: GnirsWellDepth = field(name="defaultWellDepth")
+    explicit_read_mode: Optional[GnirsReadMode] = field(name="explicitReadMode")
+    explicit_well_depth: Optional[GnirsWellDepth] = field(name="explicitWellDepth")
+    filters: list["GnirsImagingDetailsFilters"]
+    initial_filters: list["GnirsImagingDetailsInitialFilters"] = field(
+        name="initialFilters"
+    )
+    well_depth: GnirsWellDepth = field(name="wellDepth")
+
+
+class ProgramCore(BaseStruct):
+    id: Any
+    name: Optional[Any]
+    existence: Existence
+    description: Optional[Any]
+
+
+class ScienceRequirementsDetails(BaseStruct):
+    mode: Optional[ScienceMode]
+
+
+class SiderealTargetDetails(BaseStruct):
+    ra: "SiderealTargetDetailsRa"
+    dec: "SiderealTargetDetailsDec"
+    epoch: Any
+
+
+class SiderealTargetDetailsRa(BaseStruct):
+    hours: Any
+    hms: Any
+    degrees: Any
+
+
+class SiderealTargetDetailsDec(BaseStruct):
+    degrees: Any
+    dms: Any
+
+
+class TargetEnvironmentDetails(BaseStruct):
+    asterism: list["TargetEnvironmentDetailsAsterism"]
+    explicit_base: Optional["TargetEnvironmentDetailsExplicitBase"] = field(
+        name="explicitBase"
+    )
+
+
+class TargetEnvironmentDetailsAsterism(BaseStruct):
+    name: Any
+    sidereal: Optional["TargetEnvironmentDetailsAsterismSidereal"]
+    nonsidereal: Optional["TargetEnvironmentDetailsAsterismNonsidereal"]
+
+
+class TargetEnvironmentDetailsAsterismSidereal(BaseStruct):
+    ra: "SiderealTargetDetailsRa"
+    dec: "SiderealTargetDetailsDec"
+    epoch: Any
+
+
+class TargetEnvironmentDetailsAsterismNonsidereal(BaseStruct):
+    des: str
+    key_type: EphemerisKeyType = field(name="keyType")
+    key: str
+
+
+class TargetEnvironmentDetailsExplicitBase(BaseStruct):
+    ra: "TargetEnvironmentDetailsExplicitBaseRa"
+    dec: "TargetEnvironmentDetailsExplicitBaseDec"
+
+
+class TargetEnvironmentDetailsExplicitBaseRa(BaseStruct):
+    hms: Any
+
+
+class TargetEnvironmentDetailsExplicitBaseDec(BaseStruct):
+    dms: Any
+
+
+class TimingWindowDetails(BaseStruct):
+    inclusion: TimingWindowInclusion
+    start_utc: Any = field(name="startUtc")
+    end: Optional[
+        Union[
+            "TimingWindowDetailsEndTimingWindowEndAt",
+            "TimingWindowDetailsEndTimingWindowEndAfter",
+        ]
+    ]
+
+
+class TimingWindowDetailsEndTimingWindowEndAt(
+    TaggedStruct, tag_field="__typename", tag="TimingWindowEndAt"
+):
+    at_utc: Any = field(name="atUtc")
+
+
+class TimingWindowDetailsEndTimingWindowEndAfter(
+    TaggedStruct, tag_field="__typename", tag="TimingWindowEndAfter"
+):
+    after: "TimingWindowDetailsEndTimingWindowEndAfterAfter"
+    repeat: Optional["TimingWindowDetailsEndTimingWindowEndAfterRepeat"]
+
+
+class TimingWindowDetailsEndTimingWindowEndAfterAfter(BaseStruct):
+    seconds: Any
+
+
+class TimingWindowDetailsEndTimingWindowEndAfterRepeat(BaseStruct):
+    period: "TimingWindowDetailsEndTimingWindowEndAfterRepeatPeriod"
+    times: Optional[Any]
+
+
+class TimingWindowDetailsEndTimingWindowEndAfterRepeatPeriod(BaseStruct):
+    seconds: Any
+
+
+class WorkflowCore(BaseStruct):
+    state: CalculationState
+
+
+class WorkflowDetails(BaseStruct):
+    state: CalculationState
+    value: "WorkflowDetailsValue"
+
+
+class WorkflowDetailsValue(BaseStruct):
+    state: ObservationWorkflowState
+    valid_transitions: list[ObservationWorkflowState] = field(name="validTransitions")
+    validation_errors: list["WorkflowDetailsValueValidationErrors"] = field(
+        name="validationErrors"
+    )
+
+
+class WorkflowDetailsValueValidationErrors(BaseStruct):
+    code: ObservationValidationCode
+    messages: list[str]
+
+
+class ObservationDetails(BaseStruct):
+    id: Any
+    existence: Existence
+    reference: Optional["ObservationCoreReference"]
+    title: Any
+    instrument: Optional[Instrument]
+    calibration_role: Optional[CalibrationRole] = field(name="calibrationRole")
+    observer_notes: Optional[Any] = field(name="observerNotes")
+    subtitle: Optional[Any]
+    program: "ObservationDetailsProgram"
+    science_requirements: "ObservationDetailsScienceRequirements" = field(
+        name="scienceRequirements"
+    )
+    science_band: Optional[ScienceBand] = field(name="scienceBand")
+    workflow: Optional["ObservationDetailsWorkflow"]
+    observing_mode: Optional["ObservationDetailsObservingMode"] = field(
+        name="observingMode"
+    )
+    constraint_set: "ObservationDetailsConstraintSet" = field(name="constraintSet")
+    timing_windows: list["ObservationDetailsTimingWindows"] = field(
+        name="timingWindows"
+    )
+    target_environment: "ObservationDetailsTargetEnvironment" = field(
+        name="targetEnvironment"
+    )
+    execution: "ObservationDetailsExecution"
+
+
+class ObservationDetailsProgram(BaseStruct):
+    id: Any
+    name: Optional[Any]
+    existence: Existence
+    description: Optional[Any]
+
+
+class ObservationDetailsScienceRequirements(BaseStruct):
+    mode: Optional[ScienceMode]
+
+
+class ObservationDetailsWorkflow(BaseStruct):
+    state: CalculationState
+    value: "WorkflowDetailsValue"
+
+
+class ObservationDetailsObservingMode(BaseStruct):
+    instrument: Optional[Instrument]
+    mode: ObservingModeType
+    gmos_north_long_slit: Optional["ObservingModeDetailsGmosNorthLongSlit"] = field(
+        name="gmosNorthLongSlit"
+    )
+    gmos_south_long_slit: Optional["ObservingModeDetailsGmosSouthLongSlit"] = field(
+        name="gmosSouthLongSlit"
+    )
+    gmos_north_imaging: Optional["ObservingModeDetailsGmosNorthImaging"] = field(
+        name="gmosNorthImaging"
+    )
+    gmos_south_imaging: Optional["ObservingModeDetailsGmosSouthImaging"] = field(
+        name="gmosSouthImaging"
+    )
+    flamingos_2_long_slit: Optional["ObservingModeDetailsFlamingos2LongSlit"] = field(
+        name="flamingos2LongSlit"
+    )
+    flamingos_2_imaging: Optional["ObservingModeDetailsFlamingos2Imaging"] = field(
+        name="flamingos2Imaging"
+    )
+    igrins_2_long_slit: Optional["ObservingModeDetailsIgrins2LongSlit"] = field(
+        name="igrins2LongSlit"
+    )
+    visitor: Optional["ObservingModeDetailsVisitor"]
+    ghost_ifu: Optional["ObservingModeDetailsGhostIfu"] = field(name="ghostIfu")
+    gnirs_spectroscopy: Optional["ObservingModeDetailsGnirsSpectroscopy"] = field(
+        name="gnirsSpectroscopy"
+    )
+    gnirs_imaging: Optional["ObservingModeDetailsGnirsImaging"] = field(
+        name="gnirsImaging"
+    )
+
+
+class ObservationDetailsConstraintSet(BaseStruct):
+    image_quality: ImageQualityPreset = field(name="imageQuality")
+    cloud_extinction: CloudExtinctionPreset = field(name="cloudExtinction")
+    sky_background: SkyBackground = field(name="skyBackground")
+    water_vapor: WaterVapor = field(name="waterVapor")
+    elevation_range: "ConstraintSetDetailsElevationRange" = field(name="elevationRange")
+
+
+class ObservationDetailsTimingWindows(BaseStruct):
+    inclusion: TimingWindowInclusion
+    start_utc: Any = field(name="startUtc")
+    end: Optional[
+        Union[
+            "TimingWindowDetailsEndTimingWindowEndAt",
+            "TimingWindowDetailsEndTimingWindowEndAfter",
+        ]
+    ]
+
+
+class ObservationDetailsTargetEnvironment(BaseStruct):
+    asterism: list["TargetEnvironmentDetailsAsterism"]
+    explicit_base: Optional["TargetEnvironmentDetailsExplicitBase"] = field(
+        name="explicitBase"
+    )
+
+
+class ObservationDetailsExecution(BaseStruct):
+    digest: Optional["ObservationDetailsExecutionDigest"]
+
+
+class ObservationDetailsExecutionDigest(BaseStruct):
+    value: Optional["ObservationDetailsExecutionDigestValue"]
+
+
+class ObservationDetailsExecutionDigestValue(BaseStruct):
+    acquisition: Optional["ObservationDetailsExecutionDigestValueAcquisition"]
+    setup: "ObservationDetailsExecutionDigestValueSetup"
+
+
+class ObservationDetailsExecutionDigestValueAcquisition(BaseStruct):
+    time_estimate: "ObservationDetailsExecutionDigestValueAcquisitionTimeEstimate" = (
+        field(name="timeEstimate")
+    )
+
+
+class ObservationDetailsExecutionDigestValueAcquisitionTimeEstimate(BaseStruct):
+    total: "ObservationDetailsExecutionDigestValueAcquisitionTimeEstimateTotal"
+    program: "ObservationDetailsExecutionDigestValueAcquisitionTimeEstimateProgram"
+    non_charged: "ObservationDetailsExecutionDigestValueAcquisitionTimeEstimateNonCharged" = field(
+        name="nonCharged"
+    )
+
+
+class ObservationDetailsExecutionDigestValueAcquisitionTimeEstimateTotal(BaseStruct):
+    seconds: Any
+
+
+class ObservationDetailsExecutionDigestValueAcquisitionTimeEstimateProgram(BaseStruct):
+    seconds: Any
+
+
+class ObservationDetailsExecutionDigestValueAcquisitionTimeEstimateNonCharged(
+    BaseStruct
+):
+    seconds: Any
+
+
+class ObservationDetailsExecutionDigestValueSetup(BaseStruct):
+    full: "ObservationDetailsExecutionDigestValueSetupFull"
+    reacquisition: "ObservationDetailsExecutionDigestValueSetupReacquisition"
+
+
+class ObservationDetailsExecutionDigestValueSetupFull(BaseStruct):
+    seconds: Any
+
+
+class ObservationDetailsExecutionDigestValueSetupReacquisition(BaseStruct):
+    seconds: Any
+
+
+class ObservationSummary(BaseStruct):
+    id: Any
+    existence: Existence
+    reference: Optional["ObservationCoreReference"]
+    title: Any
+    instrument: Optional[Instrument]
+    calibration_role: Optional[CalibrationRole] = field(name="calibrationRole")
+    program: "ObservationSummaryProgram"
+    workflow: Optional["ObservationSummaryWorkflow"]
+
+
+class ObservationSummaryProgram(BaseStruct):
+    id: Any
+
+
+class ObservationSummaryWorkflow(BaseStruct):
+    state: CalculationState
+
+
+class ObservationWorkflowCore(BaseStruct):
+    state: ObservationWorkflowState
+
+
+class ObservationWorkflowDetails(BaseStruct):
+    state: ObservationWorkflowState
+    valid_transitions: list[ObservationWorkflowState] = field(name="validTransitions")
+    validation_errors: list["ObservationWorkflowDetailsValidationErrors"] = field(
+        name="validationErrors"
+    )
+
+
+class ObservationWorkflowDetailsValidationErrors(BaseStruct):
+    code: ObservationValidationCode
+    messages: list[str]
+
+
+class OpportunityTargetDetails(BaseStruct):
+    region: "OpportunityTargetDetailsRegion"
+
+
+class OpportunityTargetDetailsRegion(BaseStruct):
+    right_ascension_arc: "OpportunityTargetDetailsRegionRightAscensionArc" = field(
+        name="rightAscensionArc"
+    )
+    declination_arc: "OpportunityTargetDetailsRegionDeclinationArc" = field(
+        name="declinationArc"
+    )
+
+
+class OpportunityTargetDetailsRegionRightAscensionArc(BaseStruct):
+    start: Optional["OpportunityTargetDetailsRegionRightAscensionArcStart"]
+    end: Optional["OpportunityTargetDetailsRegionRightAscensionArcEnd"]
+
+
+class OpportunityTargetDetailsRegionRightAscensionArcStart(BaseStruct):
+    degrees: Any
+
+
+class OpportunityTargetDetailsRegionRightAscensionArcEnd(BaseStruct):
+    degrees: Any
+
+
+class OpportunityTargetDetailsRegionDeclinationArc(BaseStruct):
+    start: Optional["OpportunityTargetDetailsRegionDeclinationArcStart"]
+    end: Optional["OpportunityTargetDetailsRegionDeclinationArcEnd"]
+
+
+class OpportunityTargetDetailsRegionDeclinationArcStart(BaseStruct):
+    degrees: Any
+
+
+class OpportunityTargetDetailsRegionDeclinationArcEnd(BaseStruct):
+    degrees: Any
+
+
+class ProgramDetail(BaseStruct):
+    id: Any
+    name: Optional[Any]
+    existence: Existence
+    description: Optional[Any]
+    type_: ProgramType = field(name="type")
+    active: "ProgramDetailActive"
+    proposal_status: ProposalStatus = field(name="proposalStatus")
+    proposal: Optional["ProgramDetailProposal"]
+    pi: Optional["ProgramDetailPi"]
+
+
+class ProgramDetailActive(BaseStruct):
+    start: Any
+    end: Any
+
+
+class ProgramDetailProposal(BaseStruct):
+    call: Optional["ProgramDetailProposalCall"]
+    gemini: Optional["ProgramDetailProposalGemini"]
+
+
+class ProgramDetailProposalCall(BaseStruct):
+    semester: Any
+    active: "ProgramDetailProposalCallActive"
+    observatory: Observatory
+    gemini: Optional["ProgramDetailProposalCallGemini"]
+    keck: Optional["ProgramDetailProposalCallKeck"]
+    subaru: Optional["ProgramDetailProposalCallSubaru"]
+
+
+class ProgramDetailProposalCallActive(BaseStruct):
+    start: Any
+    end: Any
+
+
+class ProgramDetailProposalCallGemini(BaseStruct):
+    type_: GeminiCallForProposalsType = field(name="type")
+    instruments: list[Instrument]
+
+
+class ProgramDetailProposalCallKeck(BaseStruct):
+    instruments: list[KeckInstrument]
+
+
+class ProgramDetailProposalCallSubaru(BaseStruct):
+    type_: SubaruCallForProposalsType = field(name="type")
+    instruments: list[SubaruInstrument]
+
+
+class ProgramDetailProposalGemini(BaseStruct):
+    typename__: Literal[
+        "Classical",
+        "DemoScience",
+        "DirectorsTime",
+        "FastTurnaround",
+        "GeminiProposalType",
+        "LargeProgram",
+        "PoorWeather",
+        "Queue",
+        "SystemVerification",
+    ] = field(name="__typename")
+    science_subtype: ScienceSubtype = field(name="scienceSubtype")
+
+
+class ProgramDetailPi(BaseStruct):
+    id: Any
+
+
+class ProgramGroupElements(BaseStruct):
+    all_group_elements: list["ProgramGroupElementsAllGroupElements"] = field(
+        name="allGroupElements"
+    )
+
+
+class ProgramGroupElementsAllGroupElements(BaseStruct):
+    parent_group_id: Optional[Any] = field(name="parentGroupId")
+    observation: Optional["ProgramGroupElementsAllGroupElementsObservation"]
+    group: Optional["ProgramGroupElementsAllGroupElementsGroup"]
+
+
+class ProgramGroupElementsAllGroupElementsObservation(BaseStruct):
+    id: Any
+    group_id: Optional[Any] = field(name="groupId")
+
+
+class ProgramGroupElementsAllGroupElementsGroup(BaseStruct):
+    id: Any
+    name: Optional[Any]
+    minimum_required: Optional[Any] = field(name="minimumRequired")
+    ordered: bool
+    parent_id: Optional[Any] = field(name="parentId")
+    parent_index: Any = field(name="parentIndex")
+    minimum_interval: Optional[
+        "ProgramGroupElementsAllGroupElementsGroupMinimumInterval"
+    ] = field(name="minimumInterval")
+    maximum_interval: Optional[
+        "ProgramGroupElementsAllGroupElementsGroupMaximumInterval"
+    ] = field(name="maximumInterval")
+    system: bool
+
+
+class ProgramGroupElementsAllGroupElementsGroupMinimumInterval(BaseStruct):
+    seconds: Any
+
+
+class ProgramGroupElementsAllGroupElementsGroupMaximumInterval(BaseStruct):
+    seconds: Any
+
+
+class ProgramSummary(BaseStruct):
+    id: Any
+    name: Optional[Any]
+    existence: Existence
+    description: Optional[Any]
+    type_: ProgramType = field(name="type")
+    reference: Optional["ProgramSummaryReference"]
+    proposal_status: ProposalStatus = field(name="proposalStatus")
+
+
+class ProgramSummaryReference(BaseStruct):
+    typename__: Literal[
+        "CalibrationProgramReference",
+        "CommissioningProgramReference",
+        "EngineeringProgramReference",
+        "ExampleProgramReference",
+        "KeckProgramReference",
+        "LibraryProgramReference",
+        "MonitoringProgramReference",
+        "ProgramReference",
+        "ScienceProgramReference",
+        "SubaruProgramReference",
+        "SystemProgramReference",
+    ] = field(name="__typename")
+    label: Any
+
+
+class SchedulerProposal(BaseStruct):
+    call: Optional["SchedulerProposalCall"]
+    gemini: Optional["SchedulerProposalGemini"]
+
+
+class SchedulerProposalCall(BaseStruct):
+    semester: Any
+    active: "SchedulerProposalCallActive"
+    observatory: Observatory
+    gemini: Optional["SchedulerProposalCallGemini"]
+    keck: Optional["SchedulerProposalCallKeck"]
+    subaru: Optional["SchedulerProposalCallSubaru"]
+
+
+class SchedulerProposalCallActive(BaseStruct):
+    start: Any
+    end: Any
+
+
+class SchedulerProposalCallGemini(BaseStruct):
+    type_: GeminiCallForProposalsType = field(name="type")
+    instruments: list[Instrument]
+
+
+class SchedulerProposalCallKeck(BaseStruct):
+    instruments: list[KeckInstrument]
+
+
+class SchedulerProposalCallSubaru(BaseStruct):
+    type_: SubaruCallForProposalsType = field(name="type")
+    instruments: list[SubaruInstrument]
+
+
+class SchedulerProposalGemini(BaseStruct):
+    typename__: Literal[
+        "Classical",
+        "DemoScience",
+        "DirectorsTime",
+        "FastTurnaround",
+        "GeminiProposalType",
+        "LargeProgram",
+        "PoorWeather",
+        "Queue",
+        "SystemVerification",
+    ] = field(name="__typename")
+    science_subtype: ScienceSubtype = field(name="scienceSubtype")
+
+
+class TargetCore(BaseStruct):
+    id: Any
+    existence: Existence
+    name: Any
+    calibration_role: Optional[CalibrationRole] = field(name="calibrationRole")
+
+
+class TargetDetails(BaseStruct):
+    id: Any
+    existence: Existence
+    name: Any
+    calibration_role: Optional[CalibrationRole] = field(name="calibrationRole")
+    opportunity: Optional["TargetDetailsOpportunity"]
+    sidereal: Optional["TargetDetailsSidereal"]
+    nonsidereal: Optional["TargetDetailsNonsidereal"]
+
+
+class TargetDetailsOpportunity(BaseStruct):
+    region: "OpportunityTargetDetailsRegion"
+
+
+class TargetDetailsSidereal(BaseStruct):
+    ra: "SiderealTargetDetailsRa"
+    dec: "SiderealTargetDetailsDec"
+    epoch: Any
+
+
+class TargetDetailsNonsidereal(BaseStruct):
+    des: str
+    key_type: EphemerisKeyType = field(name="keyType")
+    key: str
+
+
+class TargetProgramSummary(BaseStruct):
+    program: "TargetProgramSummaryProgram"
+
+
+class TargetProgramSummaryProgram(BaseStruct):
+    id: Any
+    name: Optional[Any]
+    existence: Existence
+    description: Optional[Any]
+
+
+class TargetSummary(BaseStruct):
+    id: Any
+    existence: Existence
+    name: Any
+    calibration_role: Optional[CalibrationRole] = field(name="calibrationRole")
+    program: "TargetSummaryProgram"
+
+
+class TargetSummaryProgram(BaseStruct):
+    id: Any
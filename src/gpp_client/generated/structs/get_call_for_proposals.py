@@ -0,0 +1,31 @@
+from typing import Any, Optional
+
+from msgspec import field
+
+from ..enums import Existence, Observatory
+from .base_struct import BaseStruct
+from .fragments import (
+    CallForProposalsCoreGemini,
+    CallForProposalsCoreKeck,
+    CallForProposalsCoreSubaru,
+    CallForProposalsDetailsActive,
+)
+
+
+class GetCallForProposals(BaseStruct):
+    call_for_proposals: Optional["GetCallForProposalsCallForProposals"] = field(
+        name="callForProposals"
+    )
+
+
+class GetCallForProposalsCallForProposals(BaseStruct):
+    id: Any
+    title: Any
+    observatory: Observatory
+    gemini: Optional["CallForProposalsCoreGemini"]
+    keck: Optional["CallForProposalsCoreKeck"]
+    subaru: Optional["CallForProposalsCoreSubaru"]
+    semester: Any
+    active: "CallForProposalsDetailsActive"
+    submission_deadline_default: Optional[Any] = field(name="submissionDeadlineDefault")
+    existence: Existence
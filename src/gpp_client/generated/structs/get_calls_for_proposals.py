@@ -0,0 +1,36 @@
+from typing import Any, Optional
+
+from msgspec import field
+
+from ..enums import Existence, Observatory
+from .base_struct import BaseStruct
+from .fragments import (
+    CallForProposalsCoreGemini,
+    CallForProposalsCoreKeck,
+    CallForProposalsCoreSubaru,
+    CallForProposalsDetailsActive,
+)
+
+
+class GetCallsForProposals(BaseStruct):
+    calls_for_proposals: "GetCallsForProposalsCallsForProposals" = field(
+        name="callsForProposals"
+    )
+
+
+class GetCallsForProposalsCallsForProposals(BaseStruct):
+    has_more: bool = field(name="hasMore")
+    matches: list["GetCallsForProposalsCallsForProposalsMatches"]
+
+
+class GetCallsForProposalsCallsForProposalsMatches(BaseStruct):
+    id: Any
+    title: Any
+    observatory: Observatory
+    gemini: Optional["CallForProposalsCoreGemini"]
+    keck: Optional["CallForProposalsCoreKeck"]
+    subaru: Optional["CallForProposalsCoreSubaru"]
+    semester: Any
+    active: "CallForProposalsDetailsActive"
+    submission_deadline_default: Optional[Any] = field(name="submissionDeadlineDefault")
+    existence: Existence
@@ -0,0 +1,2387 @@
+from typing import Any, Literal, Optional, Union
+
+from msgspec import field
+
+from ..enums import (
+    AttachmentType,
+    Band,
+    BrightnessIntegratedUnits,
+    CalculationState,
+    CloudExtinctionPreset,
+    CoolStarTemperature,
+    GalaxySpectrum,
+    GmosAmpReadMode,
+    GmosBinning,
+    GmosNorthBuiltinFpu,
+    GmosNorthFilter,
+    GmosNorthGrating,
+    GmosRoi,
+    GmosSouthBuiltinFpu,
+    GmosSouthFilter,
+    GmosSouthGrating,
+    GuideState,
+    HiiRegionSpectrum,
+    ImageQualityPreset,
+    ImagingVariantType,
+    Instrument,
+    ObservationValidationCode,
+    ObservationWorkflowState,
+    ObservingModeType,
+    PlanetaryNebulaSpectrum,
+    PlanetSpectrum,
+    PosAngleConstraintMode,
+    QuasarSpectrum,
+    ScienceBand,
+    ScienceMode,
+    SkyBackground,
+    StellarLibrarySpectrum,
+    TelescopeConfigGeneratorType,
+    TimingWindowInclusion,
+    WaterVapor,
+    WavelengthOrder,
+)
+from .base_struct import BaseStruct, TaggedStruct
+
+
+class GetGOATSObservations(BaseStruct):
+    observations: "GetGOATSObservationsObservations"
+
+
+class GetGOATSObservationsObservations(BaseStruct):
+    matches: list["GetGOATSObservationsObservationsMatches"]
+    has_more: bool = field(name="hasMore")
+
+
+class GetGOATSObservationsObservationsMatches(BaseStruct):
+    id: Any
+    reference: Optional["GetGOATSObservationsObservationsMatchesReference"]
+    instrument: Optional[Instrument]
+    title: Any
+    constraint_set: "GetGOATSObservationsObservationsMatchesConstraintSet" = field(
+        name="constraintSet"
+    )
+    workflow: Optional["GetGOATSObservationsObservationsMatchesWorkflow"]
+    attachments: list["GetGOATSObservationsObservationsMatchesAttachments"]
+    timing_windows: list["GetGOATSObservationsObservationsMatchesTimingWindows"] = (
+        field(name="timingWindows")
+    )
+    target_environment: "GetGOATSObservationsObservationsMatchesTargetEnvironment" = (
+        field(name="targetEnvironment")
+    )
+    pos_angle_constraint: "GetGOATSObservationsObservationsMatchesPosAngleConstraint" = field(
+        name="posAngleConstraint"
+    )
+    science_band: Optional[ScienceBand] = field(name="scienceBand")
+    observation_duration: Optional[
+        "GetGOATSObservationsObservationsMatchesObservationDuration"
+    ] = field(name="observationDuration")
+    observer_notes: Optional[Any] = field(name="observerNotes")
+    science_requirements: "GetGOATSObservationsObservationsMatchesScienceRequirements" = field(
+        name="scienceRequirements"
+    )
+    observing_mode: Optional["GetGOATSObservationsObservationsMatchesObservingMode"] = (
+        field(name="observingMode")
+    )
+    program: "GetGOATSObservationsObservationsMatchesProgram"
+
+
+class GetGOATSObservationsObservationsMatchesReference(BaseStruct):
+    label: Any
+
+
+class GetGOATSObservationsObservationsMatchesConstraintSet(BaseStruct):
+    image_quality: ImageQualityPreset = field(name="imageQuality")
+    cloud_extinction: CloudExtinctionPreset = field(name="cloudExtinction")
+    sky_background: SkyBackground = field(name="skyBackground")
+    water_vapor: WaterVapor = field(name="waterVapor")
+    elevation_range: "GetGOATSObservationsObservationsMatchesConstraintSetElevationRange" = field(
+        name="elevationRange"
+    )
+
+
+class GetGOATSObservationsObservationsMatchesConstraintSetElevationRange(BaseStruct):
+    air_mass: Optional[
+        "GetGOATSObservationsObservationsMatchesConstraintSetElevationRangeAirMass"
+    ] = field(name="airMass")
+    hour_angle: Optional[
+        "GetGOATSObservationsObservationsMatchesConstraintSetElevationRangeHourAngle"
+    ] = field(name="hourAngle")
+
+
+class GetGOATSObservationsObservationsMatchesConstraintSetElevationRangeAirMass(
+    BaseStruct
+):
+    min: Any
+    max: Any
+
+
+class GetGOATSObservationsObservationsMatchesConstraintSetElevationRangeHourAngle(
+    BaseStruct
+):
+    min_hours: Any = field(name="minHours")
+    max_hours: Any = field(name="maxHours")
+
+
+class GetGOATSObservationsObservationsMatchesWorkflow(BaseStruct):
+    calculation_state: CalculationState = field(name="calculationState")
+    value: "GetGOATSObservationsObservationsMatchesWorkflowValue"
+
+
+class GetGOATSObservationsObservationsMatchesWorkflowValue(BaseStruct):
+    state: ObservationWorkflowState
+    valid_transitions: list[ObservationWorkflowState] = field(name="validTransitions")
+    validation_errors: list[
+        "GetGOATSObservationsObservationsMatchesWorkflowValueValidationErrors"
+    ] = field(name="validationErrors")
+
+
+class GetGOATSObservationsObservationsMatchesWorkflowValueValidationErrors(BaseStruct):
+    code: ObservationValidationCode
+
+
+class GetGOATSObservationsObservationsMatchesAttachments(BaseStruct):
+    id: Any
+    attachment_type: AttachmentType = field(name="attachmentType")
+    file_name: Any = field(name="fileName")
+    description: Optional[Any]
+    updated_at: Any = field(name="updatedAt")
+
+
+class GetGOATSObservationsObservationsMatchesTimingWindows(BaseStruct):
+    inclusion: TimingWindowInclusion
+    start_utc: Any = field(name="startUtc")
+    end: Optional[
+        Union[
+            "GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAt",
+            "GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfter",
+        ]
+    ]
+
+
+class GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAt(
+    TaggedStruct, tag_field="__typename", tag="TimingWindowEndAt"
+):
+    at_utc: Any = field(name="atUtc")
+
+
+class GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfter(
+    TaggedStruct, tag_field="__typename", tag="TimingWindowEndAfter"
+):
+    after: "GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfterAfter"
+    repeat: Optional[
+        "GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfterRepeat"
+    ]
+
+
+class GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfterAfter(
+    BaseStruct
+):
+    seconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfterRepeat(
+    BaseStruct
+):
+    period: "GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfterRepeatPeriod"
+    times: Optional[Any]
+
+
+class GetGOATSObservationsObservationsMatchesTimingWindowsEndTimingWindowEndAfterRepeatPeriod(
+    BaseStruct
+):
+    seconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesTargetEnvironment(BaseStruct):
+    asterism: list["GetGOATSObservationsObservationsMatchesTargetEnvironmentAsterism"]
+    first_science_target: Optional[
+        "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTarget"
+    ] = field(name="firstScienceTarget")
+
+
+class GetGOATSObservationsObservationsMatchesTargetEnvironmentAsterism(BaseStruct):
+    id: Any
+    name: Any
+    opportunity: Optional[
+        "GetGOATSObservationsObservationsMatchesTargetEnvironmentAsterismOpportunity"
+    ]
+
+
+class GetGOATSObservationsObservationsMatchesTargetEnvironmentAsterismOpportunity(
+    BaseStruct
+):
+    typename__: Literal["Opportunity"] = field(name="__typename")
+
+
+class GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTarget(
+    BaseStruct
+):
+    id: Any
+    name: Any
+    opportunity: Optional[
+        "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetOpportunity"
+    ]
+    sidereal: Optional[
+        "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSidereal"
+    ]
+    source_profile: "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfile" = field(
+        name="sourceProfile"
+    )
+
+
+class GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetOpportunity(
+    BaseStruct
+):
+    typename__: Literal["Opportunity"] = field(name="__typename")
+
+
+class GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSidereal(
+    BaseStruct
+):
+    ra: "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealRa"
+    dec: "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealDec"
+    proper_motion: Optional[
+        "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealProperMotion"
+    ] = field(name="properMotion")
+    parallax: Optional[
+        "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealParallax"
+    ]
+    radial_velocity: Optional[
+        "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealRadialVelocity"
+    ] = field(name="radialVelocity")
+
+
+class GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealRa(
+    BaseStruct
+):
+    hms: Any
+    hours: Any
+    degrees: Any
+
+
+class GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealDec(
+    BaseStruct
+):
+    dms: Any
+    degrees: Any
+
+
+class GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealProperMotion(
+    BaseStruct
+):
+    ra: "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealProperMotionRa"
+    dec: "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealProperMotionDec"
+
+
+class GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealProperMotionRa(
+    BaseStruct
+):
+    milliarcseconds_per_year: Any = field(name="milliarcsecondsPerYear")
+
+
+class GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealProperMotionDec(
+    BaseStruct
+):
+    milliarcseconds_per_year: Any = field(name="milliarcsecondsPerYear")
+
+
+class GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealParallax(
+    BaseStruct
+):
+    milliarcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSiderealRadialVelocity(
+    BaseStruct
+):
+    kilometers_per_second: Any = field(name="kilometersPerSecond")
+
+
+class GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfile(
+    BaseStruct
+):
+    point: Optional[
+        "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePoint"
+    ]
+
+
+class GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePoint(
+    BaseStruct
+):
+    band_normalized: Optional[
+        "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalized"
+    ] = field(name="bandNormalized")
+
+
+class GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalized(
+    BaseStruct
+):
+    brightnesses: list[
+        "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedBrightnesses"
+    ]
+    sed: Optional[
+        "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedSed"
+    ]
+
+
+class GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedBrightnesses(
+    BaseStruct
+):
+    band: Band
+    value: Any
+    units: BrightnessIntegratedUnits
+
+
+class GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedSed(
+    BaseStruct
+):
+    black_body_temp_k: Optional[Any] = field(name="blackBodyTempK")
+    cool_star: Optional[CoolStarTemperature] = field(name="coolStar")
+    flux_densities: Optional[
+        list[
+            "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedSedFluxDensities"
+        ]
+    ] = field(name="fluxDensities")
+    flux_densities_attachment: Optional[Any] = field(name="fluxDensitiesAttachment")
+    galaxy: Optional[GalaxySpectrum]
+    hii_region: Optional[HiiRegionSpectrum] = field(name="hiiRegion")
+    planet: Optional[PlanetSpectrum]
+    planetary_nebula: Optional[PlanetaryNebulaSpectrum] = field(name="planetaryNebula")
+    power_law: Optional[Any] = field(name="powerLaw")
+    quasar: Optional[QuasarSpectrum]
+    stellar_library: Optional[StellarLibrarySpectrum] = field(name="stellarLibrary")
+
+
+class GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedSedFluxDensities(
+    BaseStruct
+):
+    wavelength: "GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedSedFluxDensitiesWavelength"
+    density: Any
+
+
+class GetGOATSObservationsObservationsMatchesTargetEnvironmentFirstScienceTargetSourceProfilePointBandNormalizedSedFluxDensitiesWavelength(
+    BaseStruct
+):
+    nanometers: Any
+
+
+class GetGOATSObservationsObservationsMatchesPosAngleConstraint(BaseStruct):
+    mode: PosAngleConstraintMode
+    angle: "GetGOATSObservationsObservationsMatchesPosAngleConstraintAngle"
+
+
+class GetGOATSObservationsObservationsMatchesPosAngleConstraintAngle(BaseStruct):
+    degrees: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservationDuration(BaseStruct):
+    seconds: Any
+    minutes: Any
+    hours: Any
+    iso: str
+
+
+class GetGOATSObservationsObservationsMatchesScienceRequirements(BaseStruct):
+    mode: Optional[ScienceMode]
+    spectroscopy: Optional[
+        "GetGOATSObservationsObservationsMatchesScienceRequirementsSpectroscopy"
+    ]
+    exposure_time_mode: Optional[
+        "GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeMode"
+    ] = field(name="exposureTimeMode")
+
+
+class GetGOATSObservationsObservationsMatchesScienceRequirementsSpectroscopy(
+    BaseStruct
+):
+    wavelength: Optional[
+        "GetGOATSObservationsObservationsMatchesScienceRequirementsSpectroscopyWavelength"
+    ]
+
+
+class GetGOATSObservationsObservationsMatchesScienceRequirementsSpectroscopyWavelength(
+    BaseStruct
+):
+    nanometers: Any
+
+
+class GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeMode(
+    BaseStruct
+):
+    signal_to_noise: Optional[
+        "GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeSignalToNoise"
+    ] = field(name="signalToNoise")
+    time_and_count: Optional[
+        "GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeTimeAndCount"
+    ] = field(name="timeAndCount")
+
+
+class GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeSignalToNoise(
+    BaseStruct
+):
+    value: Any
+    at: "GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeSignalToNoiseAt"
+
+
+class GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeSignalToNoiseAt(
+    BaseStruct
+):
+    nanometers: Any
+
+
+class GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeTimeAndCount(
+    BaseStruct
+):
+    time: "GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeTimeAndCountTime"
+    count: Any
+    at: "GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeTimeAndCountAt"
+
+
+class GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeTimeAndCountTime(
+    BaseStruct
+):
+    seconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesScienceRequirementsExposureTimeModeTimeAndCountAt(
+    BaseStruct
+):
+    nanometers: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingMode(BaseStruct):
+    instrument: Optional[Instrument]
+    mode: ObservingModeType
+    gmos_north_long_slit: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlit"
+    ] = field(name="gmosNorthLongSlit")
+    gmos_south_long_slit: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlit"
+    ] = field(name="gmosSouthLongSlit")
+    gmos_north_imaging: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImaging"
+    ] = field(name="gmosNorthImaging")
+    gmos_south_imaging: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImaging"
+    ] = field(name="gmosSouthImaging")
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlit(BaseStruct):
+    grating: GmosNorthGrating
+    filter_: Optional[GmosNorthFilter] = field(name="filter")
+    fpu: GmosNorthBuiltinFpu
+    central_wavelength: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitCentralWavelength" = field(
+        name="centralWavelength"
+    )
+    wavelength_dithers: list[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitWavelengthDithers"
+    ] = field(name="wavelengthDithers")
+    x_bin: GmosBinning = field(name="xBin")
+    y_bin: GmosBinning = field(name="yBin")
+    amp_read_mode: GmosAmpReadMode = field(name="ampReadMode")
+    roi: GmosRoi
+    exposure_time_mode: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeMode" = field(
+        name="exposureTimeMode"
+    )
+    offsets: list[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitOffsets"
+    ]
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitCentralWavelength(
+    BaseStruct
+):
+    nanometers: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitWavelengthDithers(
+    BaseStruct
+):
+    nanometers: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeMode(
+    BaseStruct
+):
+    signal_to_noise: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeSignalToNoise"
+    ] = field(name="signalToNoise")
+    time_and_count: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeTimeAndCount"
+    ] = field(name="timeAndCount")
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeSignalToNoise(
+    BaseStruct
+):
+    value: Any
+    at: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeSignalToNoiseAt"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeSignalToNoiseAt(
+    BaseStruct
+):
+    nanometers: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeTimeAndCount(
+    BaseStruct
+):
+    time: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeTimeAndCountTime"
+    count: Any
+    at: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeTimeAndCountAt"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeTimeAndCountTime(
+    BaseStruct
+):
+    seconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitExposureTimeModeTimeAndCountAt(
+    BaseStruct
+):
+    nanometers: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthLongSlitOffsets(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlit(BaseStruct):
+    grating: GmosSouthGrating
+    filter_: Optional[GmosSouthFilter] = field(name="filter")
+    fpu: GmosSouthBuiltinFpu
+    central_wavelength: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitCentralWavelength" = field(
+        name="centralWavelength"
+    )
+    wavelength_dithers: list[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitWavelengthDithers"
+    ] = field(name="wavelengthDithers")
+    x_bin: GmosBinning = field(name="xBin")
+    y_bin: GmosBinning = field(name="yBin")
+    amp_read_mode: GmosAmpReadMode = field(name="ampReadMode")
+    roi: GmosRoi
+    exposure_time_mode: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeMode" = field(
+        name="exposureTimeMode"
+    )
+    offsets: list[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitOffsets"
+    ]
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitCentralWavelength(
+    BaseStruct
+):
+    nanometers: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitWavelengthDithers(
+    BaseStruct
+):
+    nanometers: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeMode(
+    BaseStruct
+):
+    signal_to_noise: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeSignalToNoise"
+    ] = field(name="signalToNoise")
+    time_and_count: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeTimeAndCount"
+    ] = field(name="timeAndCount")
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeSignalToNoise(
+    BaseStruct
+):
+    value: Any
+    at: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeSignalToNoiseAt"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeSignalToNoiseAt(
+    BaseStruct
+):
+    nanometers: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeTimeAndCount(
+    BaseStruct
+):
+    time: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeTimeAndCountTime"
+    count: Any
+    at: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeTimeAndCountAt"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeTimeAndCountTime(
+    BaseStruct
+):
+    seconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitExposureTimeModeTimeAndCountAt(
+    BaseStruct
+):
+    nanometers: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthLongSlitOffsets(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImaging(BaseStruct):
+    filters: list[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFilters"
+    ]
+    amp_read_mode: GmosAmpReadMode = field(name="ampReadMode")
+    bin: GmosBinning
+    roi: GmosRoi
+    variant: (
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariant"
+    )
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFilters(
+    BaseStruct
+):
+    filter_: GmosNorthFilter = field(name="filter")
+    exposure_time_mode: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeMode" = field(
+        name="exposureTimeMode"
+    )
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeMode(
+    BaseStruct
+):
+    signal_to_noise: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeSignalToNoise"
+    ] = field(name="signalToNoise")
+    time_and_count: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeTimeAndCount"
+    ] = field(name="timeAndCount")
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeSignalToNoise(
+    BaseStruct
+):
+    value: Any
+    at: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeSignalToNoiseAt"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeSignalToNoiseAt(
+    BaseStruct
+):
+    nanometers: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeTimeAndCount(
+    BaseStruct
+):
+    time: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeTimeAndCountTime"
+    count: Any
+    at: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeTimeAndCountAt"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeTimeAndCountTime(
+    BaseStruct
+):
+    seconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingFiltersExposureTimeModeTimeAndCountAt(
+    BaseStruct
+):
+    nanometers: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariant(
+    BaseStruct
+):
+    variant_type: ImagingVariantType = field(name="variantType")
+    grouped: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGrouped"
+    ]
+    interleaved: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleaved"
+    ]
+    pre_imaging: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImaging"
+    ] = field(name="preImaging")
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGrouped(
+    BaseStruct
+):
+    sky_count: Any = field(name="skyCount")
+    sky_offsets: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsets" = field(
+        name="skyOffsets"
+    )
+    order: WavelengthOrder
+    offsets: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsets"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsets(
+    BaseStruct
+):
+    generator_type: TelescopeConfigGeneratorType = field(name="generatorType")
+    enumerated: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumerated"
+    ]
+    random: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandom"
+    ]
+    spiral: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiral"
+    ]
+    uniform: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniform"
+    ]
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumerated(
+    BaseStruct
+):
+    values: list[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValues"
+    ]
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValues(
+    BaseStruct
+):
+    guiding: GuideState
+    offset: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffset"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffset(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandom(
+    BaseStruct
+):
+    seed: Any
+    size: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomSize"
+    center: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomCenter"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomSize(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomCenter(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomCenterP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomCenterQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomCenterP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsRandomCenterQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiral(
+    BaseStruct
+):
+    seed: Any
+    size: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralSize"
+    center: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralCenter"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralSize(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralCenter(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralCenterP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralCenterQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralCenterP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsSpiralCenterQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniform(
+    BaseStruct
+):
+    corner_a: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerA" = field(
+        name="cornerA"
+    )
+    corner_b: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerB" = field(
+        name="cornerB"
+    )
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerA(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerAP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerAQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerAP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerAQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerB(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerBP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerBQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerBP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedSkyOffsetsUniformCornerBQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsets(
+    BaseStruct
+):
+    generator_type: TelescopeConfigGeneratorType = field(name="generatorType")
+    random: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandom"
+    ]
+    spiral: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiral"
+    ]
+    uniform: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniform"
+    ]
+    enumerated: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumerated"
+    ]
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandom(
+    BaseStruct
+):
+    seed: Any
+    size: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomSize"
+    center: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomCenter"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomSize(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomCenter(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomCenterP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomCenterQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomCenterP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsRandomCenterQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiral(
+    BaseStruct
+):
+    seed: Any
+    size: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralSize"
+    center: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralCenter"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralSize(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralCenter(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralCenterP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralCenterQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralCenterP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsSpiralCenterQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniform(
+    BaseStruct
+):
+    corner_a: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerA" = field(
+        name="cornerA"
+    )
+    corner_b: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerB" = field(
+        name="cornerB"
+    )
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerA(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerAP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerAQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerAP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerAQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerB(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerBP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerBQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerBP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsUniformCornerBQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumerated(
+    BaseStruct
+):
+    values: list[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValues"
+    ]
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValues(
+    BaseStruct
+):
+    guiding: GuideState
+    offset: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValuesOffset"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValuesOffset(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValuesOffsetP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValuesOffsetQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValuesOffsetP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantGroupedOffsetsEnumeratedValuesOffsetQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleaved(
+    BaseStruct
+):
+    offsets: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsets"
+    sky_count: Any = field(name="skyCount")
+    sky_offsets: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsets" = field(
+        name="skyOffsets"
+    )
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsets(
+    BaseStruct
+):
+    generator_type: TelescopeConfigGeneratorType = field(name="generatorType")
+    enumerated: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumerated"
+    ]
+    random: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandom"
+    ]
+    spiral: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiral"
+    ]
+    uniform: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniform"
+    ]
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumerated(
+    BaseStruct
+):
+    values: list[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValues"
+    ]
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValues(
+    BaseStruct
+):
+    guiding: GuideState
+    offset: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValuesOffset"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValuesOffset(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandom(
+    BaseStruct
+):
+    seed: Any
+    size: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomSize"
+    center: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomCenter"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomSize(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomCenter(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomCenterP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomCenterQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomCenterP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsRandomCenterQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiral(
+    BaseStruct
+):
+    seed: Any
+    size: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralSize"
+    center: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralCenter"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralSize(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralCenter(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralCenterP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralCenterQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralCenterP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsSpiralCenterQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniform(
+    BaseStruct
+):
+    corner_a: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerA" = field(
+        name="cornerA"
+    )
+    corner_b: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerB" = field(
+        name="cornerB"
+    )
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerA(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerAP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerAQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerAP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerAQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerB(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerBP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerBQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerBP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedOffsetsUniformCornerBQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsets(
+    BaseStruct
+):
+    generator_type: TelescopeConfigGeneratorType = field(name="generatorType")
+    enumerated: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumerated"
+    ]
+    random: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandom"
+    ]
+    spiral: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiral"
+    ]
+    uniform: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniform"
+    ]
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumerated(
+    BaseStruct
+):
+    values: list[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValues"
+    ]
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValues(
+    BaseStruct
+):
+    guiding: GuideState
+    offset: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffset"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffset(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandom(
+    BaseStruct
+):
+    seed: Any
+    size: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomSize"
+    center: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomCenter"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomSize(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomCenter(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomCenterP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomCenterQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomCenterP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsRandomCenterQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiral(
+    BaseStruct
+):
+    seed: Any
+    size: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralSize"
+    center: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralCenter"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralSize(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralCenter(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralCenterP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralCenterQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralCenterP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsSpiralCenterQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniform(
+    BaseStruct
+):
+    corner_a: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerA" = field(
+        name="cornerA"
+    )
+    corner_b: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerB" = field(
+        name="cornerB"
+    )
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerA(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerAP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerAQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerAP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerAQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerB(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerBP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerBQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerBP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantInterleavedSkyOffsetsUniformCornerBQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImaging(
+    BaseStruct
+):
+    offset_1: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset1" = field(
+        name="offset1"
+    )
+    offset_2: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset2" = field(
+        name="offset2"
+    )
+    offset_3: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset3" = field(
+        name="offset3"
+    )
+    offset_4: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset4" = field(
+        name="offset4"
+    )
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset1(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset1P"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset1Q"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset1P(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset1Q(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset2(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset2P"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset2Q"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset2P(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset2Q(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset3(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset3P"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset3Q"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset3P(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset3Q(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset4(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset4P"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset4Q"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset4P(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosNorthImagingVariantPreImagingOffset4Q(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImaging(BaseStruct):
+    filters: list[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFilters"
+    ]
+    amp_read_mode: GmosAmpReadMode = field(name="ampReadMode")
+    bin: GmosBinning
+    roi: GmosRoi
+    variant: (
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariant"
+    )
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFilters(
+    BaseStruct
+):
+    filter_: GmosSouthFilter = field(name="filter")
+    exposure_time_mode: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeMode" = field(
+        name="exposureTimeMode"
+    )
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeMode(
+    BaseStruct
+):
+    signal_to_noise: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeSignalToNoise"
+    ] = field(name="signalToNoise")
+    time_and_count: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeTimeAndCount"
+    ] = field(name="timeAndCount")
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeSignalToNoise(
+    BaseStruct
+):
+    value: Any
+    at: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeSignalToNoiseAt"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeSignalToNoiseAt(
+    BaseStruct
+):
+    nanometers: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeTimeAndCount(
+    BaseStruct
+):
+    time: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeTimeAndCountTime"
+    count: Any
+    at: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeTimeAndCountAt"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeTimeAndCountTime(
+    BaseStruct
+):
+    seconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingFiltersExposureTimeModeTimeAndCountAt(
+    BaseStruct
+):
+    nanometers: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariant(
+    BaseStruct
+):
+    variant_type: ImagingVariantType = field(name="variantType")
+    grouped: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGrouped"
+    ]
+    interleaved: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleaved"
+    ]
+    pre_imaging: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImaging"
+    ] = field(name="preImaging")
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGrouped(
+    BaseStruct
+):
+    sky_count: Any = field(name="skyCount")
+    sky_offsets: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsets" = field(
+        name="skyOffsets"
+    )
+    order: WavelengthOrder
+    offsets: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsets"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsets(
+    BaseStruct
+):
+    generator_type: TelescopeConfigGeneratorType = field(name="generatorType")
+    enumerated: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumerated"
+    ]
+    random: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandom"
+    ]
+    spiral: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiral"
+    ]
+    uniform: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniform"
+    ]
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumerated(
+    BaseStruct
+):
+    values: list[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValues"
+    ]
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValues(
+    BaseStruct
+):
+    guiding: GuideState
+    offset: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffset"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffset(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsEnumeratedValuesOffsetQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandom(
+    BaseStruct
+):
+    seed: Any
+    size: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomSize"
+    center: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomCenter"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomSize(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomCenter(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomCenterP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomCenterQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomCenterP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsRandomCenterQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiral(
+    BaseStruct
+):
+    seed: Any
+    size: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralSize"
+    center: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralCenter"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralSize(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralCenter(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralCenterP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralCenterQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralCenterP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsSpiralCenterQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniform(
+    BaseStruct
+):
+    corner_a: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerA" = field(
+        name="cornerA"
+    )
+    corner_b: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerB" = field(
+        name="cornerB"
+    )
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerA(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerAP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerAQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerAP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerAQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerB(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerBP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerBQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerBP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedSkyOffsetsUniformCornerBQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsets(
+    BaseStruct
+):
+    generator_type: TelescopeConfigGeneratorType = field(name="generatorType")
+    random: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandom"
+    ]
+    spiral: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiral"
+    ]
+    uniform: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniform"
+    ]
+    enumerated: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumerated"
+    ]
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandom(
+    BaseStruct
+):
+    seed: Any
+    size: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomSize"
+    center: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomCenter"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomSize(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomCenter(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomCenterP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomCenterQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomCenterP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsRandomCenterQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiral(
+    BaseStruct
+):
+    seed: Any
+    size: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralSize"
+    center: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralCenter"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralSize(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralCenter(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralCenterP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralCenterQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralCenterP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsSpiralCenterQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniform(
+    BaseStruct
+):
+    corner_a: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerA" = field(
+        name="cornerA"
+    )
+    corner_b: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerB" = field(
+        name="cornerB"
+    )
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerA(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerAP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerAQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerAP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerAQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerB(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerBP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerBQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerBP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsUniformCornerBQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumerated(
+    BaseStruct
+):
+    values: list[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValues"
+    ]
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValues(
+    BaseStruct
+):
+    guiding: GuideState
+    offset: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValuesOffset"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValuesOffset(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValuesOffsetP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValuesOffsetQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValuesOffsetP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantGroupedOffsetsEnumeratedValuesOffsetQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleaved(
+    BaseStruct
+):
+    offsets: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsets"
+    sky_count: Any = field(name="skyCount")
+    sky_offsets: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsets" = field(
+        name="skyOffsets"
+    )
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsets(
+    BaseStruct
+):
+    generator_type: TelescopeConfigGeneratorType = field(name="generatorType")
+    enumerated: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumerated"
+    ]
+    random: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandom"
+    ]
+    spiral: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiral"
+    ]
+    uniform: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniform"
+    ]
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumerated(
+    BaseStruct
+):
+    values: list[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValues"
+    ]
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValues(
+    BaseStruct
+):
+    guiding: GuideState
+    offset: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValuesOffset"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValuesOffset(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsEnumeratedValuesOffsetQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandom(
+    BaseStruct
+):
+    seed: Any
+    size: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomSize"
+    center: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomCenter"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomSize(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomCenter(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomCenterP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomCenterQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomCenterP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsRandomCenterQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiral(
+    BaseStruct
+):
+    seed: Any
+    size: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralSize"
+    center: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralCenter"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralSize(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralCenter(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralCenterP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralCenterQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralCenterP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsSpiralCenterQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniform(
+    BaseStruct
+):
+    corner_a: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerA" = field(
+        name="cornerA"
+    )
+    corner_b: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerB" = field(
+        name="cornerB"
+    )
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerA(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerAP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerAQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerAP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerAQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerB(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerBP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerBQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerBP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedOffsetsUniformCornerBQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsets(
+    BaseStruct
+):
+    generator_type: TelescopeConfigGeneratorType = field(name="generatorType")
+    enumerated: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumerated"
+    ]
+    random: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandom"
+    ]
+    spiral: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiral"
+    ]
+    uniform: Optional[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniform"
+    ]
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumerated(
+    BaseStruct
+):
+    values: list[
+        "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValues"
+    ]
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValues(
+    BaseStruct
+):
+    guiding: GuideState
+    offset: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffset"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffset(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsEnumeratedValuesOffsetQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandom(
+    BaseStruct
+):
+    seed: Any
+    size: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomSize"
+    center: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomCenter"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomSize(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomCenter(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomCenterP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomCenterQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomCenterP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsRandomCenterQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiral(
+    BaseStruct
+):
+    seed: Any
+    size: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralSize"
+    center: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralCenter"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralSize(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralCenter(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralCenterP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralCenterQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralCenterP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsSpiralCenterQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniform(
+    BaseStruct
+):
+    corner_a: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerA" = field(
+        name="cornerA"
+    )
+    corner_b: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerB" = field(
+        name="cornerB"
+    )
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerA(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerAP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerAQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerAP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerAQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerB(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerBP"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerBQ"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerBP(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantInterleavedSkyOffsetsUniformCornerBQ(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImaging(
+    BaseStruct
+):
+    offset_1: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset1" = field(
+        name="offset1"
+    )
+    offset_2: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset2" = field(
+        name="offset2"
+    )
+    offset_3: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset3" = field(
+        name="offset3"
+    )
+    offset_4: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset4" = field(
+        name="offset4"
+    )
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset1(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset1P"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset1Q"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset1P(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset1Q(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset2(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset2P"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset2Q"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset2P(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset2Q(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset3(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset3P"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset3Q"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset3P(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset3Q(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset4(
+    BaseStruct
+):
+    p: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset4P"
+    q: "GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset4Q"
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset4P(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesObservingModeGmosSouthImagingVariantPreImagingOffset4Q(
+    BaseStruct
+):
+    arcseconds: Any
+
+
+class GetGOATSObservationsObservationsMatchesProgram(BaseStruct):
+    allocations: list["GetGOATSObservationsObservationsMatchesProgramAllocations"]
+    time_charge: list["GetGOATSObservationsObservationsMatchesProgramTimeCharge"] = (
+        field(name="timeCharge")
+    )
+
+
+class GetGOATSObservationsObservationsMatchesProgramAllocations(BaseStruct):
+    science_band: ScienceBand = field(name="scienceBand")
+    duration: "GetGOATSObservationsObservationsMatchesProgramAllocationsDuration"
+
+
+class GetGOATSObservationsObservationsMatchesProgramAllocationsDuration(BaseStruct):
+    hours: Any
+
+
+class GetGOATSObservationsObservationsMatchesProgramTimeCharge(BaseStruct):
+    band: Optional[ScienceBand]
+    time: "GetGOATSObservationsObservationsMatchesProgramTimeChargeTime"
+
+
+class GetGOATSObservationsObservationsMatchesProgramTimeChargeTime(BaseStruct):
+    program: "GetGOATSObservationsObservationsMatchesProgramTimeChargeTimeProgram"
+
+
+class GetGOATSObservationsObservationsMatchesProgramTimeChargeTimeProgram(BaseStruct):
+    hours: Any
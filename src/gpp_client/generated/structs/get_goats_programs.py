@@ -0,0 +1,41 @@
+from typing import Any, Literal, Optional
+
+from msgspec import field
+
+from ..enums import ProgramType, ProposalStatus
+from .base_struct import BaseStruct
+
+
+class GetGOATSPrograms(BaseStruct):
+    programs: "GetGOATSProgramsPrograms"
+
+
+class GetGOATSProgramsPrograms(BaseStruct):
+    matches: list["GetGOATSProgramsProgramsMatches"]
+    has_more: bool = field(name="hasMore")
+
+
+class GetGOATSProgramsProgramsMatches(BaseStruct):
+    id: Any
+    name: Optional[Any]
+    description: Optional[Any]
+    reference: Optional["GetGOATSProgramsProgramsMatchesReference"]
+    proposal_status: ProposalStatus = field(name="proposalStatus")
+    type_: ProgramType = field(name="type")
+
+
+class GetGOATSProgramsProgramsMatchesReference(BaseStruct):
+    typename__: Literal[
+        "CalibrationProgramReference",
+        "CommissioningProgramReference",
+        "EngineeringProgramReference",
+        "ExampleProgramReference",
+        "KeckProgramReference",
+        "LibraryProgramReference",
+        "MonitoringProgramReference",
+        "ProgramReference",
+        "ScienceProgramReference",
+        "SubaruProgramReference",
+        "SystemProgramReference",
+    ] = field(name="__typename")
+    label: Any
@@ -0,0 +1,49 @@
+from typing import Any, Optional
+
+from msgspec import field
+
+from ..enums import CalibrationRole, Existence, Instrument, ScienceBand
+from .base_struct import BaseStruct
+from .fragments import (
+    ObservationCoreReference,
+    ObservationDetailsConstraintSet,
+    ObservationDetailsExecution,
+    ObservationDetailsObservingMode,
+    ObservationDetailsProgram,
+    ObservationDetailsScienceRequirements,
+    ObservationDetailsTargetEnvironment,
+    ObservationDetailsTimingWindows,
+    ObservationDetailsWorkflow,
+)
+
+
+class GetObservation(BaseStruct):
+    observation: Optional["GetObservationObservation"]
+
+
+class GetObservationObservation(BaseStruct):
+    id: Any
+    existence: Existence
+    reference: Optional["ObservationCoreReference"]
+    title: Any
+    instrument: Optional[Instrument]
+    calibration_role: Optional[CalibrationRole] = field(name="calibrationRole")
+    observer_notes: Optional[Any] = field(name="observerNotes")
+    subtitle: Optional[Any]
+    program: "ObservationDetailsProgram"
+    science_requirements: "ObservationDetailsScienceRequirements" = field(
+        name="scienceRequirements"
+    )
+    science_band: Optional[ScienceBand] = field(name="scienceBand")
+    workflow: Optional["ObservationDetailsWorkflow"]
+    observing_mode: Optional["ObservationDetailsObservingMode"] = field(
+        name="observingMode"
+    )
+    constraint_set: "ObservationDetailsConstraintSet" = field(name="constraintSet")
+    timing_windows: list["ObservationDetailsTimingWindows"] = field(
+        name="timingWindows"
+    )
+    target_environment: "ObservationDetailsTargetEnvironment" = field(
+        name="targetEnvironment"
+    )
+    execution: "ObservationDetailsExecution"
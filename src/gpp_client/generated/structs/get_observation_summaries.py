@@ -0,0 +1,31 @@
+from typing import Any, Optional
+
+from msgspec import field
+
+from ..enums import CalibrationRole, Existence, Instrument
+from .base_struct import BaseStruct
+from .fragments import (
+    ObservationCoreReference,
+    ObservationSummaryProgram,
+    ObservationSummaryWorkflow,
+)
+
+
+class GetObservationSummaries(BaseStruct):
+    observations: "GetObservationSummariesObservations"
+
+
+class GetObservationSummariesObservations(BaseStruct):
+    has_more: bool = field(name="hasMore")
+    matches: list["GetObservationSummariesObservationsMatches"]
+
+
+class GetObservationSummariesObservationsMatches(BaseStruct):
+    id: Any
+    existence: Existence
+    reference: Optional["ObservationCoreReference"]
+    title: Any
+    instrument: Optional[Instrument]
+    calibration_role: Optional[CalibrationRole] = field(name="calibrationRole")
+    program: "ObservationSummaryProgram"
+    workflow: Optional["ObservationSummaryWorkflow"]
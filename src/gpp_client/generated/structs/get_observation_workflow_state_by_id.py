@@ -0,0 +1,34 @@
+from typing import Any, Optional
+
+from msgspec import field
+
+from ..enums import CalculationState, CalibrationRole, Existence, Instrument
+from .base_struct import BaseStruct
+from .fragments import ObservationCoreReference, WorkflowDetailsValue
+
+
+class GetObservationWorkflowStateById(BaseStruct):
+    observation: Optional["GetObservationWorkflowStateByIdObservation"]
+
+
+class GetObservationWorkflowStateByIdObservation(BaseStruct):
+    id: Any
+    existence: Existence
+    reference: Optional["ObservationCoreReference"]
+    title: Any
+    instrument: Optional[Instrument]
+    calibration_role: Optional[CalibrationRole] = field(name="calibrationRole")
+    program: "GetObservationWorkflowStateByIdObservationProgram"
+    workflow: Optional["GetObservationWorkflowStateByIdObservationWorkflow"]
+
+
+class GetObservationWorkflowStateByIdObservationProgram(BaseStruct):
+    id: Any
+    name: Optional[Any]
+    existence: Existence
+    description: Optional[Any]
+
+
+class GetObservationWorkflowStateByIdObservationWorkflow(BaseStruct):
+    state: CalculationState
+    value: "WorkflowDetailsValue"
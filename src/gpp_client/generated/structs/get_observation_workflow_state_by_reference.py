@@ -0,0 +1,34 @@
+from typing import Any, Optional
+
+from msgspec import field
+
+from ..enums import CalculationState, CalibrationRole, Existence, Instrument
+from .base_struct import BaseStruct
+from .fragments import ObservationCoreReference, WorkflowDetailsValue
+
+
+class GetObservationWorkflowStateByReference(BaseStruct):
+    observation: Optional["GetObservationWorkflowStateByReferenceObservation"]
+
+
+class GetObservationWorkflowStateByReferenceObservation(BaseStruct):
+    id: Any
+    existence: Existence
+    reference: Optional["ObservationCoreReference"]
+    title: Any
+    instrument: Optional[Instrument]
+    calibration_role: Optional[CalibrationRole] = field(name="calibrationRole")
+    program: "GetObservationWorkflowStateByReferenceObservationProgram"
+    workflow: Optional["GetObservationWorkflowStateByReferenceObservationWorkflow"]
+
+
+class GetObservationWorkflowStateByReferenceObservationProgram(BaseStruct):
+    id: Any
+    name: Optional[Any]
+    existence: Existence
+    description: Optional[Any]
+
+
+class GetObservationWorkflowStateByReferenceObservationWorkflow(BaseStruct):
+    state: CalculationState
+    value: "WorkflowDetailsValue"
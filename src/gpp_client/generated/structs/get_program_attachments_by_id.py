@@ -0,0 +1,24 @@
+from typing import Any, Optional
+
+from msgspec import field
+
+from ..enums import AttachmentType
+from .base_struct import BaseStruct
+
+
+class GetProgramAttachmentsById(BaseStruct):
+    program: Optional["GetProgramAttachmentsByIdProgram"]
+
+
+class GetProgramAttachmentsByIdProgram(BaseStruct):
+    attachments: list["GetProgramAttachmentsByIdProgramAttachments"]
+
+
+class GetProgramAttachmentsByIdProgramAttachments(BaseStruct):
+    id: Any
+    file_name: Any = field(name="fileName")
+    attachment_type: AttachmentType = field(name="attachmentType")
+    file_size: Any = field(name="fileSize")
+    checked: bool
+    description: Optional[Any]
+    updated_at: Any = field(name="updatedAt")
@@ -0,0 +1,24 @@
+from typing import Any, Optional
+
+from msgspec import field
+
+from ..enums import AttachmentType
+from .base_struct import BaseStruct
+
+
+class GetProgramAttachmentsByProposalReference(BaseStruct):
+    program: Optional["GetProgramAttachmentsByProposalReferenceProgram"]
+
+
+class GetProgramAttachmentsByProposalReferenceProgram(BaseStruct):
+    attachments: list["GetProgramAttachmentsByProposalReferenceProgramAttachments"]
+
+
+class GetProgramAttachmentsByProposalReferenceProgramAttachments(BaseStruct):
+    id: Any
+    file_name: Any = field(name="fileName")
+    attachment_type: AttachmentType = field(name="attachmentType")
+    file_size: Any = field(name="fileSize")
+    checked: bool
+    description: Optional[Any]
+    updated_at: Any = field(name="updatedAt")
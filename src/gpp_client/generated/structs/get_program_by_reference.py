@@ -0,0 +1,31 @@
+from typing import Any, Optional
+
+from msgspec import field
+
+from ..enums import Existence, ProgramType, ProposalStatus
+from .base_struct import BaseStruct
+from .fragments import (
+    ProgramDetailActive,
+    ProgramDetailPi,
+    ProgramDetailProposal,
+    ProgramGroupElementsAllGroupElements,
+)
+
+
+class GetProgramByReference(BaseStruct):
+    program: Optional["GetProgramByReferenceProgram"]
+
+
+class GetProgramByReferenceProgram(BaseStruct):
+    id: Any
+    name: Optional[Any]
+    existence: Existence
+    description: Optional[Any]
+    type_: ProgramType = field(name="type")
+    active: "ProgramDetailActive"
+    proposal_status: ProposalStatus = field(name="proposalStatus")
+    proposal: Optional["ProgramDetailProposal"]
+    pi: Optional["ProgramDetailPi"]
+    all_group_elements: list["ProgramGroupElementsAllGroupElements"] = field(
+        name="allGroupElements"
+    )
@@ -0,0 +1,26 @@
+from typing import Any, Optional
+
+from msgspec import field
+
+from ..enums import Existence, ProgramType, ProposalStatus
+from .base_struct import BaseStruct
+from .fragments import ProgramSummaryReference
+
+
+class GetProgramSummaries(BaseStruct):
+    programs: "GetProgramSummariesPrograms"
+
+
+class GetProgramSummariesPrograms(BaseStruct):
+    has_more: bool = field(name="hasMore")
+    matches: list["GetProgramSummariesProgramsMatches"]
+
+
+class GetProgramSummariesProgramsMatches(BaseStruct):
+    id: Any
+    name: Optional[Any]
+    existence: Existence
+    description: Optional[Any]
+    type_: ProgramType = field(name="type")
+    reference: Optional["ProgramSummaryReference"]
+    proposal_status: ProposalStatus = field(name="proposalStatus")
@@ -0,0 +1,35 @@
+from typing import Any, Literal, Optional
+
+from msgspec import field
+
+from .base_struct import BaseStruct
+
+
+class GetSchedulerAllProgramsId(BaseStruct):
+    programs: "GetSchedulerAllProgramsIdPrograms"
+
+
+class GetSchedulerAllProgramsIdPrograms(BaseStruct):
+    matches: list["GetSchedulerAllProgramsIdProgramsMatches"]
+
+
+class GetSchedulerAllProgramsIdProgramsMatches(BaseStruct):
+    reference: Optional["GetSchedulerAllProgramsIdProgramsMatchesReference"]
+    id: Any
+
+
+class GetSchedulerAllProgramsIdProgramsMatchesReference(BaseStruct):
+    typename__: Literal[
+        "CalibrationProgramReference",
+        "CommissioningProgramReference",
+        "EngineeringProgramReference",
+        "ExampleProgramReference",
+        "KeckProgramReference",
+        "LibraryProgramReference",
+        "MonitoringProgramReference",
+        "ProgramReference",
+        "ScienceProgramReference",
+        "SubaruProgramReference",
+        "SystemProgramReference",
+    ] = field(name="__typename")
+    label: Any
@@ -0,0 +1,144 @@
+from typing import Any, Literal, Optional
+
+from msgspec import field
+
+from ..enums import (
+    Existence,
+    ProgramType,
+    ProposalStatus,
+    ScienceBand,
+    TimeAccountingCategory,
+)
+from .base_struct import BaseStruct
+from .fragments import SchedulerProposalCall, SchedulerProposalGemini
+
+
+class GetSchedulerPrograms(BaseStruct):
+    programs: "GetSchedulerProgramsPrograms"
+
+
+class GetSchedulerProgramsPrograms(BaseStruct):
+    matches: list["GetSchedulerProgramsProgramsMatches"]
+
+
+class GetSchedulerProgramsProgramsMatches(BaseStruct):
+    id: Any
+    name: Optional[Any]
+    description: Optional[Any]
+    existence: Existence
+    type_: ProgramType = field(name="type")
+    reference: Optional["GetSchedulerProgramsProgramsMatchesReference"]
+    active: "GetSchedulerProgramsProgramsMatchesActive"
+    proposal_status: ProposalStatus = field(name="proposalStatus")
+    proposal: Optional["GetSchedulerProgramsProgramsMatchesProposal"]
+    allocations: list["GetSchedulerProgramsProgramsMatchesAllocations"]
+    time_charge: list["GetSchedulerProgramsProgramsMatchesTimeCharge"] = field(
+        name="timeCharge"
+    )
+    all_group_elements: list["GetSchedulerProgramsProgramsMatchesAllGroupElements"] = (
+        field(name="allGroupElements")
+    )
+
+
+class GetSchedulerProgramsProgramsMatchesReference(BaseStruct):
+    typename__: Literal[
+        "CalibrationProgramReference",
+        "CommissioningProgramReference",
+        "EngineeringProgramReference",
+        "ExampleProgramReference",
+        "KeckProgramReference",
+        "LibraryProgramReference",
+        "MonitoringProgramReference",
+        "ProgramReference",
+        "ScienceProgramReference",
+        "SubaruProgramReference",
+        "SystemProgramReference",
+    ] = field(name="__typename")
+    label: Any
+    type_: ProgramType = field(name="type")
+
+
+class GetSchedulerProgramsProgramsMatchesActive(BaseStruct):
+    start: Any
+    end: Any
+
+
+class GetSchedulerProgramsProgramsMatchesProposal(BaseStruct):
+    call: Optional["SchedulerProposalCall"]
+    gemini: Optional["SchedulerProposalGemini"]
+
+
+class GetSchedulerProgramsProgramsMatchesAllocations(BaseStruct):
+    category: TimeAccountingCategory
+    duration: "GetSchedulerProgramsProgramsMatchesAllocationsDuration"
+    science_band: ScienceBand = field(name="scienceBand")
+
+
+class GetSchedulerProgramsProgramsMatchesAllocationsDuration(BaseStruct):
+    hours: Any
+
+
+class GetSchedulerProgramsProgramsMatchesTimeCharge(BaseStruct):
+    band: Optional[ScienceBand]
+    time: "GetSchedulerProgramsProgramsMatchesTimeChargeTime"
+
+
+class GetSchedulerProgramsProgramsMatchesTimeChargeTime(BaseStruct):
+    program: "GetSchedulerProgramsProgramsMatchesTimeChargeTimeProgram"
+    total: "GetSchedulerProgramsProgramsMatchesTimeChargeTimeTotal"
+    non_charged: "GetSchedulerProgramsProgramsMatchesTimeChargeTimeNonCharged" = field(
+        name="nonCharged"
+    )
+
+
+class GetSchedulerProgramsProgramsMatchesTimeChargeTimeProgram(BaseStruct):
+    hours: Any
+
+
+class GetSchedulerProgramsProgramsMatchesTimeChargeTimeTotal(BaseStruct):
+    hours: Any
+
+
+class GetSchedulerProgramsProgramsMatchesTimeChargeTimeNonCharged(BaseStruct):
+    hours: Any
+
+
+class GetSchedulerProgramsProgramsMatchesAllGroupElements(BaseStruct):
+    parent_group_id: Optional[Any] = field(name="parentGroupId")
+    group: Optional["GetSchedulerProgramsProgramsMatchesAllGroupElementsGroup"]
+    observation: Optional[
+        "GetSchedulerProgramsProgramsMatchesAllGroupElementsObservation"
+    ]
+
+
+class GetSchedulerProgramsProgramsMatchesAllGroupElementsGroup(BaseStruct):
+    id: Any
+    name: Optional[Any]
+    minimum_required: Optional[Any] = field(name="minimumRequired")
+    ordered: bool
+    parent_id: Optional[Any] = field(name="parentId")
+    parent_index: Any = field(name="parentIndex")
+    minimum_interval: Optional[
+        "GetSchedulerProgramsProgramsMatchesAllGroupElementsGroupMinimumInterval"
+    ] = field(name="minimumInterval")
+    maximum_interval: Optional[
+        "GetSchedulerProgramsProgramsMatchesAllGroupElementsGroupMaximumInterval"
+    ] = field(name="maximumInterval")
+    system: bool
+
+
+class GetSchedulerProgramsProgramsMatchesAllGroupElementsGroupMinimumInterval(
+    BaseStruct
+):
+    seconds: Any
+
+
+class GetSchedulerProgramsProgramsMatchesAllGroupElementsGroupMaximumInterval(
+    BaseStruct
+):
+    seconds: Any
+
+
+class GetSchedulerProgramsProgramsMatchesAllGroupElementsObservation(BaseStruct):
+    id: Any
+    group_id: Optional[Any] = field(name="groupId")
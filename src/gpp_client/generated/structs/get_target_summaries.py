@@ -0,0 +1,24 @@
+from typing import Any, Optional
+
+from msgspec import field
+
+from ..enums import CalibrationRole, Existence
+from .base_struct import BaseStruct
+from .fragments import TargetSummaryProgram
+
+
+class GetTargetSummaries(BaseStruct):
+    targets: "GetTargetSummariesTargets"
+
+
+class GetTargetSummariesTargets(BaseStruct):
+    has_more: bool = field(name="hasMore")
+    matches: list["GetTargetSummariesTargetsMatches"]
+
+
+class GetTargetSummariesTargetsMatches(BaseStruct):
+    id: Any
+    existence: Existence
+    name: Any
+    calibration_role: Optional[CalibrationRole] = field(name="calibrationRole")
+    program: "TargetSummaryProgram"
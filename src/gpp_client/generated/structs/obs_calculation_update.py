@@ -0,0 +1,66 @@
+from typing import Any, Optional
+
+from msgspec import field
+
+from ..enums import AtomExecutionState, CalculationState, EditType
+from .base_struct import BaseStruct
+
+
+class ObsCalculationUpdate(BaseStruct):
+    obscalc_update: "ObsCalculationUpdateObscalcUpdate" = field(name="obscalcUpdate")
+
+
+class ObsCalculationUpdateObscalcUpdate(BaseStruct):
+    edit_type: EditType = field(name="editType")
+    new_calculation_state: Optional[CalculationState] = field(
+        name="newCalculationState"
+    )
+    observation_id: Any = field(name="observationId")
+    old_calculation_state: Optional[CalculationState] = field(
+        name="oldCalculationState"
+    )
+    value: Optional["ObsCalculationUpdateObscalcUpdateValue"]
+
+
+class ObsCalculationUpdateObscalcUpdateValue(BaseStruct):
+    id: Any
+    observation_time: Optional[Any] = field(name="observationTime")
+    execution: "ObsCalculationUpdateObscalcUpdateValueExecution"
+
+
+class ObsCalculationUpdateObscalcUpdateValueExecution(BaseStruct):
+    visits: "ObsCalculationUpdateObscalcUpdateValueExecutionVisits"
+
+
+class ObsCalculationUpdateObscalcUpdateValueExecutionVisits(BaseStruct):
+    matches: list["ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatches"]
+
+
+class ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatches(BaseStruct):
+    observation: (
+        "ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatchesObservation"
+    )
+    atom_records: "ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatchesAtomRecords" = field(
+        name="atomRecords"
+    )
+
+
+class ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatchesObservation(
+    BaseStruct
+):
+    id: Any
+
+
+class ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatchesAtomRecords(
+    BaseStruct
+):
+    matches: list[
+        "ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatchesAtomRecordsMatches"
+    ]
+
+
+class ObsCalculationUpdateObscalcUpdateValueExecutionVisitsMatchesAtomRecordsMatches(
+    BaseStruct
+):
+    execution_state: AtomExecutionState = field(name="executionState")
+    id: Any
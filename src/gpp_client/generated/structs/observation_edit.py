@@ -0,0 +1,243 @@
+from typing import Any, Optional, Union
+
+from msgspec import field
+
+from ..enums import (
+    CalibrationRole,
+    CloudExtinctionPreset,
+    EditType,
+    Existence,
+    GmosNorthBuiltinFpu,
+    GmosNorthFilter,
+    GmosNorthGrating,
+    GmosSouthBuiltinFpu,
+    GmosSouthFilter,
+    GmosSouthGrating,
+    ImageQualityPreset,
+    Instrument,
+    ObservingModeType,
+    ScienceBand,
+    ScienceMode,
+    SkyBackground,
+    TimingWindowInclusion,
+    WaterVapor,
+)
+from .base_struct import BaseStruct, TaggedStruct
+
+
+class ObservationEdit(BaseStruct):
+    observation_edit: "ObservationEditObservationEdit" = field(name="observationEdit")
+
+
+class ObservationEditObservationEdit(BaseStruct):
+    edit_type: EditType = field(name="editType")
+    observation_id: Any = field(name="observationId")
+    value: Optional["ObservationEditObservationEditValue"]
+
+
+class ObservationEditObservationEditValue(BaseStruct):
+    id: Any
+    existence: Existence
+    reference: Optional["ObservationEditObservationEditValueReference"]
+    calibration_role: Optional[CalibrationRole] = field(name="calibrationRole")
+    instrument: Optional[Instrument]
+    index: Any
+    title: Any
+    subtitle: Optional[Any]
+    science_requirements: "ObservationEditObservationEditValueScienceRequirements" = (
+        field(name="scienceRequirements")
+    )
+    science_band: Optional[ScienceBand] = field(name="scienceBand")
+    observing_mode: Optional["ObservationEditObservationEditValueObservingMode"] = (
+        field(name="observingMode")
+    )
+    constraint_set: "ObservationEditObservationEditValueConstraintSet" = field(
+        name="constraintSet"
+    )
+    timing_windows: list["ObservationEditObservationEditValueTimingWindows"] = field(
+        name="timingWindows"
+    )
+    target_environment: "ObservationEditObservationEditValueTargetEnvironment" = field(
+        name="targetEnvironment"
+    )
+
+
+class ObservationEditObservationEditValueReference(BaseStruct):
+    label: Any
+
+
+class ObservationEditObservationEditValueScienceRequirements(BaseStruct):
+    mode: Optional[ScienceMode]
+
+
+class ObservationEditObservationEditValueObservingMode(BaseStruct):
+    instrument: Optional[Instrument]
+    mode: ObservingModeType
+    gmos_north_long_slit: Optional[
+        "ObservationEditObservationEditValueObservingModeGmosNorthLongSlit"
+    ] = field(name="gmosNorthLongSlit")
+    gmos_south_long_slit: Optional[
+        "ObservationEditObservationEditValueObservingModeGmosSouthLongSlit"
+    ] = field(name="gmosSouthLongSlit")
+
+
+class ObservationEditObservationEditValueObservingModeGmosNorthLongSlit(BaseStruct):
+    grating: GmosNorthGrating
+    filter_: Optional[GmosNorthFilter] = field(name="filter")
+    fpu: GmosNorthBuiltinFpu
+    central_wavelength: "ObservationEditObservationEditValueObservingModeGmosNorthLongSlitCentralWavelength" = field(
+        name="centralWavelength"
+    )
+
+
+class ObservationEditObservationEditValueObservingModeGmosNorthLongSlitCentralWavelength(
+    BaseStruct
+):
+    nanometers: Any
+
+
+class ObservationEditObservationEditValueObservingModeGmosSouthLongSlit(BaseStruct):
+    grating: GmosSouthGrating
+    filter_: Optional[GmosSouthFilter] = field(name="filter")
+    fpu: GmosSouthBuiltinFpu
+    central_wavelength: "ObservationEditObservationEditValueObservingModeGmosSouthLongSlitCentralWavelength" = field(
+        name="centralWavelength"
+    )
+
+
+class ObservationEditObservationEditValueObservingModeGmosSouthLongSlitCentralWavelength(
+    BaseStruct
+):
+    nanometers: Any
+
+
+class ObservationEditObservationEditValueConstraintSet(BaseStruct):
+    image_quality: ImageQualityPreset = field(name="imageQuality")
+    cloud_extinction: CloudExtinctionPreset = field(name="cloudExtinction")
+    sky_background: SkyBackground = field(name="skyBackground")
+    water_vapor: WaterVapor = field(name="waterVapor")
+    elevation_range: "ObservationEditObservationEditValueConstraintSetElevationRange" = field(
+        name="elevationRange"
+    )
+
+
+class ObservationEditObservationEditValueConstraintSetElevationRange(BaseStruct):
+    air_mass: Optional[
+        "ObservationEditObservationEditValueConstraintSetElevationRangeAirMass"
+    ] = field(name="airMass")
+    hour_angle: Optional[
+        "ObservationEditObservationEditValueConstraintSetElevationRangeHourAngle"
+    ] = field(name="hourAngle")
+
+
+class ObservationEditObservationEditValueConstraintSetElevationRangeAirMass(BaseStruct):
+    min: Any
+    max: Any
+
+
+class ObservationEditObservationEditValueConstraintSetElevationRangeHourAngle(
+    BaseStruct
+):
+    min_hours: Any = field(name="minHours")
+    max_hours: Any = field(name="maxHours")
+
+
+class ObservationEditObservationEditValueTimingWindows(BaseStruct):
+    inclusion: TimingWindowInclusion
+    start_utc: Any = field(name="startUtc")
+    end: Optional[
+        Union[
+            "ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAt",
+            "ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfter",
+        ]
+    ]
+
+
+class ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAt(
+    TaggedStruct, tag_field="__typename", tag="TimingWindowEndAt"
+):
+    at_utc: Any = field(name="atUtc")
+
+
+class ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfter(
+    TaggedStruct, tag_field="__typename", tag="TimingWindowEndAfter"
+):
+    after: (
+        "ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfterAfter"
+    )
+    repeat: Optional[
+        "ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfterRepeat"
+    ]
+
+
+class ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfterAfter(
+    BaseStruct
+):
+    seconds: Any
+
+
+class ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfterRepeat(
+    BaseStruct
+):
+    period: "ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfterRepeatPeriod"
+    times: Optional[Any]
+
+
+class ObservationEditObservationEditValueTimingWindowsEndTimingWindowEndAfterRepeatPeriod(
+    BaseStruct
+):
+    seconds: Any
+
+
+class ObservationEditObservationEditValueTargetEnvironment(BaseStruct):
+    asterism: list["ObservationEditObservationEditValueTargetEnvironmentAsterism"]
+    explicit_base: Optional[
+        "ObservationEditObservationEditValueTargetEnvironmentExplicitBase"
+    ] = field(name="explicitBase")
+
+
+class ObservationEditObservationEditValueTargetEnvironmentAsterism(BaseStruct):
+    sidereal: Optional[
+        "ObservationEditObservationEditValueTargetEnvironmentAsterismSidereal"
+    ]
+    nonsidereal: Optional[
+        "ObservationEditObservationEditValueTargetEnvironmentAsterismNonsidereal"
+    ]
+    name: Any
+
+
+class ObservationEditObservationEditValueTargetEnvironmentAsterismSidereal(BaseStruct):
+    ra: "ObservationEditObservationEditValueTargetEnvironmentAsterismSiderealRa"
+    dec: "ObservationEditObservationEditValueTargetEnvironmentAsterismSiderealDec"
+    epoch: Any
+
+
+class ObservationEditObservationEditValueTargetEnvironmentAsterismSiderealRa(
+    BaseStruct
+):
+    hms: Any
+
+
+class ObservationEditObservationEditValueTargetEnvironmentAsterismSiderealDec(
+    BaseStruct
+):
+    dms: Any
+
+
+class ObservationEditObservationEditValueTargetEnvironmentAsterismNonsidereal(
+    BaseStruct
+):
+    des: str
+
+
+class ObservationEditObservationEditValueTargetEnvironmentExplicitBase(BaseStruct):
+    ra: "ObservationEditObservationEditValueTargetEnvironmentExplicitBaseRa"
+    dec: "ObservationEditObservationEditValueTargetEnvironmentExplicitBaseDec"
+
+
+class ObservationEditObservationEditValueTargetEnvironmentExplicitBaseRa(BaseStruct):
+    hms: Any
+
+
+class ObservationEditObservationEditValueTargetEnvironmentExplicitBaseDec(BaseStruct):
+    dms: Any
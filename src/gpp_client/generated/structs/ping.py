@@ -0,0 +1,15 @@
+from typing import Any
+
+from .base_struct import BaseStruct
+
+
+class Ping(BaseStruct):
+    programs: "PingPrograms"
+
+
+class PingPrograms(BaseStruct):
+    matches: list["PingProgramsMatches"]
+
+
+class PingProgramsMatches(BaseStruct):
+    id: Any
@@ -0,0 +1,38 @@
+from typing import Any, Optional
+
+from msgspec import field
+
+from ..enums import EditType, Existence
+from .base_struct import BaseStruct
+
+
+class ProgramEdit(BaseStruct):
+    program_edit: "ProgramEditProgramEdit" = field(name="programEdit")
+
+
+class ProgramEditProgramEdit(BaseStruct):
+    edit_type: EditType = field(name="editType")
+    value: "ProgramEditProgramEditValue"
+
+
+class ProgramEditProgramEditValue(BaseStruct):
+    description: Optional[Any]
+    existence: Existence
+    name: Optional[Any]
+    id: Any
+    all_group_elements: list["ProgramEditProgramEditValueAllGroupElements"] = field(
+        name="allGroupElements"
+    )
+
+
+class ProgramEditProgramEditValueAllGroupElements(BaseStruct):
+    observation: Optional["ProgramEditProgramEditValueAllGroupElementsObservation"]
+    group: Optional["ProgramEditProgramEditValueAllGroupElementsGroup"]
+
+
+class ProgramEditProgramEditValueAllGroupElementsObservation(BaseStruct):
+    id: Any
+
+
+class ProgramEditProgramEditValueAllGroupElementsGroup(BaseStruct):
+    id: Any
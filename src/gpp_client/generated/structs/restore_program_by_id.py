@@ -0,0 +1,72 @@
+from typing import Any, Optional
+
+from msgspec import field
+
+from ..enums import Existence, ProgramType, ProposalStatus
+from .base_struct import BaseStruct
+from .fragments import ProgramDetailActive, ProgramDetailPi, ProgramDetailProposal
+
+
+class RestoreProgramById(BaseStruct):
+    update_programs: "RestoreProgramByIdUpdatePrograms" = field(name="updatePrograms")
+
+
+class RestoreProgramByIdUpdatePrograms(BaseStruct):
+    has_more: bool = field(name="hasMore")
+    programs: list["RestoreProgramByIdUpdateProgramsPrograms"]
+
+
+class RestoreProgramByIdUpdateProgramsPrograms(BaseStruct):
+    id: Any
+    name: Optional[Any]
+    existence: Existence
+    description: Optional[Any]
+    type_: ProgramType = field(name="type")
+    active: "ProgramDetailActive"
+    proposal_status: ProposalStatus = field(name="proposalStatus")
+    proposal: Optional["ProgramDetailProposal"]
+    pi: Optional["ProgramDetailPi"]
+    all_group_elements: list[
+        "RestoreProgramByIdUpdateProgramsProgramsAllGroupElements"
+    ] = field(name="allGroupElements")
+
+
+class RestoreProgramByIdUpdateProgramsProgramsAllGroupElements(BaseStruct):
+    parent_group_id: Optional[Any] = field(name="parentGroupId")
+    observation: Optional[
+        "RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsObservation"
+    ]
+    group: Optional["RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsGroup"]
+
+
+class RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsObservation(BaseStruct):
+    id: Any
+    group_id: Optional[Any] = field(name="groupId")
+
+
+class RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsGroup(BaseStruct):
+    id: Any
+    name: Optional[Any]
+    minimum_required: Optional[Any] = field(name="minimumRequired")
+    ordered: bool
+    parent_id: Optional[Any] = field(name="parentId")
+    parent_index: Any = field(name="parentIndex")
+    minimum_interval: Optional[
+        "RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMinimumInterval"
+    ] = field(name="minimumInterval")
+    maximum_interval: Optional[
+        "RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMaximumInterval"
+    ] = field(name="maximumInterval")
+    system: bool
+
+
+class RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMinimumInterval(
+    BaseStruct
+):
+    seconds: Any
+
+
+class RestoreProgramByIdUpdateProgramsProgramsAllGroupElementsGroupMaximumInterval(
+    BaseStruct
+):
+    seconds: Any
@@ -0,0 +1,38 @@
+from typing import Any, Optional
+
+from msgspec import field
+
+from ..enums import CalibrationRole, Existence
+from .base_struct import BaseStruct
+from .fragments import (
+    TargetDetailsNonsidereal,
+    TargetDetailsOpportunity,
+    TargetDetailsSidereal,
+)
+
+
+class RestoreTargetById(BaseStruct):
+    update_targets: "RestoreTargetByIdUpdateTargets" = field(name="updateTargets")
+
+
+class RestoreTargetByIdUpdateTargets(BaseStruct):
+    has_more: bool = field(name="hasMore")
+    targets: list["RestoreTargetByIdUpdateTargetsTargets"]
+
+
+class RestoreTargetByIdUpdateTargetsTargets(BaseStruct):
+    id: Any
+    existence: Existence
+    name: Any
+    calibration_role: Optional[CalibrationRole] = field(name="calibrationRole")
+    opportunity: Optional["TargetDetailsOpportunity"]
+    sidereal: Optional["TargetDetailsSidereal"]
+    nonsidereal: Optional["TargetDetailsNonsidereal"]
+    program: "RestoreTargetByIdUpdateTargetsTargetsProgram"
+
+
+class RestoreTargetByIdUpdateTargetsTargetsProgram(BaseStruct):
+    id: Any
+    name: Optional[Any]
+    description: Optional[Any]
+    existence: Existence
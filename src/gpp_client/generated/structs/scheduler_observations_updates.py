@@ -0,0 +1,261 @@
+from typing import Any, Optional, Union
+
+from msgspec import field
+
+from ..enums import (
+    AtomExecutionState,
+    CalculationState,
+    CloudExtinctionPreset,
+    EditType,
+    EphemerisKeyType,
+    ImageQualityPreset,
+    Instrument,
+    ObservationWorkflowState,
+    SkyBackground,
+    TimingWindowInclusion,
+    WaterVapor,
+)
+from .base_struct import BaseStruct, TaggedStruct
+
+
+class SchedulerObservationsUpdates(BaseStruct):
+    obscalc_update: "SchedulerObservationsUpdatesObscalcUpdate" = field(
+        name="obscalcUpdate"
+    )
+
+
+class SchedulerObservationsUpdatesObscalcUpdate(BaseStruct):
+    old_calculation_state: Optional[CalculationState] = field(
+        name="oldCalculationState"
+    )
+    new_calculation_state: Optional[CalculationState] = field(
+        name="newCalculationState"
+    )
+    edit_type: EditType = field(name="editType")
+    value: Optional["SchedulerObservationsUpdatesObscalcUpdateValue"]
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValue(BaseStruct):
+    id: Any
+    observation_time: Optional[Any] = field(name="observationTime")
+    program: "SchedulerObservationsUpdatesObscalcUpdateValueProgram"
+    workflow: Optional["SchedulerObservationsUpdatesObscalcUpdateValueWorkflow"]
+    execution: "SchedulerObservationsUpdatesObscalcUpdateValueExecution"
+    target_environment: "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironment" = field(
+        name="targetEnvironment"
+    )
+    constraint_set: "SchedulerObservationsUpdatesObscalcUpdateValueConstraintSet" = (
+        field(name="constraintSet")
+    )
+    timing_windows: list[
+        "SchedulerObservationsUpdatesObscalcUpdateValueTimingWindows"
+    ] = field(name="timingWindows")
+    instrument: Optional[Instrument]
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValueProgram(BaseStruct):
+    active: "SchedulerObservationsUpdatesObscalcUpdateValueProgramActive"
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValueProgramActive(BaseStruct):
+    end: Any
+    start: Any
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValueWorkflow(BaseStruct):
+    value: "SchedulerObservationsUpdatesObscalcUpdateValueWorkflowValue"
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValueWorkflowValue(BaseStruct):
+    state: ObservationWorkflowState
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValueExecution(BaseStruct):
+    visits: "SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisits"
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisits(BaseStruct):
+    matches: list[
+        "SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatches"
+    ]
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatches(BaseStruct):
+    observation: "SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatchesObservation"
+    atom_records: "SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatchesAtomRecords" = field(
+        name="atomRecords"
+    )
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatchesObservation(
+    BaseStruct
+):
+    id: Any
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatchesAtomRecords(
+    BaseStruct
+):
+    matches: list[
+        "SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatchesAtomRecordsMatches"
+    ]
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValueExecutionVisitsMatchesAtomRecordsMatches(
+    BaseStruct
+):
+    execution_state: AtomExecutionState = field(name="executionState")
+    id: Any
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironment(BaseStruct):
+    asterism: list[
+        "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterism"
+    ]
+    explicit_base: Optional[
+        "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentExplicitBase"
+    ] = field(name="explicitBase")
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterism(
+    BaseStruct
+):
+    name: Any
+    sidereal: Optional[
+        "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismSidereal"
+    ]
+    nonsidereal: Optional[
+        "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismNonsidereal"
+    ]
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismSidereal(
+    BaseStruct
+):
+    ra: "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismSiderealRa"
+    dec: "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismSiderealDec"
+    epoch: Any
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismSiderealRa(
+    BaseStruct
+):
+    hours: Any
+    hms: Any
+    degrees: Any
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismSiderealDec(
+    BaseStruct
+):
+    degrees: Any
+    dms: Any
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentAsterismNonsidereal(
+    BaseStruct
+):
+    des: str
+    key_type: EphemerisKeyType = field(name="keyType")
+    key: str
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentExplicitBase(
+    BaseStruct
+):
+    ra: "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentExplicitBaseRa"
+    dec: (
+        "SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentExplicitBaseDec"
+    )
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentExplicitBaseRa(
+    BaseStruct
+):
+    hms: Any
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValueTargetEnvironmentExplicitBaseDec(
+    BaseStruct
+):
+    dms: Any
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValueConstraintSet(BaseStruct):
+    image_quality: ImageQualityPreset = field(name="imageQuality")
+    cloud_extinction: CloudExtinctionPreset = field(name="cloudExtinction")
+    sky_background: SkyBackground = field(name="skyBackground")
+    water_vapor: WaterVapor = field(name="waterVapor")
+    elevation_range: "SchedulerObservationsUpdatesObscalcUpdateValueConstraintSetElevationRange" = field(
+        name="elevationRange"
+    )
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValueConstraintSetElevationRange(
+    BaseStruct
+):
+    air_mass: Optional[
+        "SchedulerObservationsUpdatesObscalcUpdateValueConstraintSetElevationRangeAirMass"
+    ] = field(name="airMass")
+    hour_angle: Optional[
+        "SchedulerObservationsUpdatesObscalcUpdateValueConstraintSetElevationRangeHourAngle"
+    ] = field(name="hourAngle")
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValueConstraintSetElevationRangeAirMass(
+    BaseStruct
+):
+    min: Any
+    max: Any
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValueConstraintSetElevationRangeHourAngle(
+    BaseStruct
+):
+    min_hours: Any = field(name="minHours")
+    max_hours: Any = field(name="maxHours")
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValueTimingWindows(BaseStruct):
+    inclusion: TimingWindowInclusion
+    start_utc: Any = field(name="startUtc")
+    end: Optional[
+        Union[
+            "SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAt",
+            "SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfter",
+        ]
+    ]
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAt(
+    TaggedStruct, tag_field="__typename", tag="TimingWindowEndAt"
+):
+    at_utc: Any = field(name="atUtc")
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfter(
+    TaggedStruct, tag_field="__typename", tag="TimingWindowEndAfter"
+):
+    after: "SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfterAfter"
+    repeat: Optional[
+        "SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfterRepeat"
+    ]
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfterAfter(
+    BaseStruct
+):
+    seconds: Any
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfterRepeat(
+    BaseStruct
+):
+    period: "SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfterRepeatPeriod"
+    times: Optional[Any]
+
+
+class SchedulerObservationsUpdatesObscalcUpdateValueTimingWindowsEndTimingWindowEndAfterRepeatPeriod(
+    BaseStruct
+):
+    seconds: Any
@@ -0,0 +1,21 @@
+from typing import Optional
+
+from msgspec import field
+
+from ..enums import ObservationWorkflowState
+from .base_struct import BaseStruct
+from .fragments import ObservationWorkflowDetailsValidationErrors
+
+
+class SetObservationWorkflowState(BaseStruct):
+    set_observation_workflow_state: Optional[
+        "SetObservationWorkflowStateSetObservationWorkflowState"
+    ] = field(name="setObservationWorkflowState")
+
+
+class SetObservationWorkflowStateSetObservationWorkflowState(BaseStruct):
+    state: ObservationWorkflowState
+    valid_transitions: list[ObservationWorkflowState] = field(name="validTransitions")
+    validation_errors: list["ObservationWorkflowDetailsValidationErrors"] = field(
+        name="validationErrors"
+    )
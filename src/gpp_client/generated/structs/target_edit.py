@@ -0,0 +1,41 @@
+from typing import Any, Optional
+
+from msgspec import field
+
+from ..enums import EditType
+from .base_struct import BaseStruct
+
+
+class TargetEdit(BaseStruct):
+    target_edit: "TargetEditTargetEdit" = field(name="targetEdit")
+
+
+class TargetEditTargetEdit(BaseStruct):
+    edit_type: EditType = field(name="editType")
+    target_id: Any = field(name="targetId")
+    value: Optional["TargetEditTargetEditValue"]
+
+
+class TargetEditTargetEditValue(BaseStruct):
+    id: Any
+    name: Any
+    nonsidereal: Optional["TargetEditTargetEditValueNonsidereal"]
+    sidereal: Optional["TargetEditTargetEditValueSidereal"]
+
+
+class TargetEditTargetEditValueNonsidereal(BaseStruct):
+    des: str
+    key: str
+
+
+class TargetEditTargetEditValueSidereal(BaseStruct):
+    ra: "TargetEditTargetEditValueSiderealRa"
+    dec: "TargetEditTargetEditValueSiderealDec"
+
+
+class TargetEditTargetEditValueSiderealRa(BaseStruct):
+    degrees: Any
+
+
+class TargetEditTargetEditValueSiderealDec(BaseStruct):
+    degrees: Any
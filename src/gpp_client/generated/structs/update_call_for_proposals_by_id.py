@@ -0,0 +1,38 @@
+from typing import Any, Optional
+
+from msgspec import field
+
+from ..enums import Existence, Observatory
+from .base_struct import BaseStruct
+from .fragments import (
+    CallForProposalsCoreGemini,
+    CallForProposalsCoreKeck,
+    CallForProposalsCoreSubaru,
+    CallForProposalsDetailsActive,
+)
+
+
+class UpdateCallForProposalsById(BaseStruct):
+    update_calls_for_proposals: "UpdateCallForProposalsByIdUpdateCallsForProposals" = (
+        field(name="updateCallsForProposals")
+    )
+
+
+class UpdateCallForProposalsByIdUpdateCallsForProposals(BaseStruct):
+    has_more: bool = field(name="hasMore")
+    calls_for_proposals: list[
+        "UpdateCallForProposalsByIdUpdateCallsForProposalsCallsForProposals"
+    ] = field(name="callsForProposals")
+
+
+class UpdateCallForProposalsByIdUpdateCallsForProposalsCallsForProposals(BaseStruct):
+    id: Any
+    title: Any
+    observatory: Observatory
+    gemini: Optional["CallForProposalsCoreGemini"]
+    keck: Optional["CallForProposalsCoreKeck"]
+    subaru: Optional["CallForProposalsCoreSubaru"]
+    semester: Any
+    active: "CallForProposalsDetailsActive"
+    submission_deadline_default: Optional[Any] = field(name="submissionDeadlineDefault")
+    existence: Existence
@@ -0,0 +1,36 @@
+from typing import Any, Optional
+
+from msgspec import field
+
+from ..enums import Existence, ProgramType, ProposalStatus
+from .base_struct import BaseStruct
+from .fragments import (
+    ProgramDetailActive,
+    ProgramDetailPi,
+    ProgramDetailProposal,
+    ProgramGroupElementsAllGroupElements,
+)
+
+
+class UpdatePrograms(BaseStruct):
+    update_programs: "UpdateProgramsUpdatePrograms" = field(name="updatePrograms")
+
+
+class UpdateProgramsUpdatePrograms(BaseStruct):
+    has_more: bool = field(name="hasMore")
+    programs: list["UpdateProgramsUpdateProgramsPrograms"]
+
+
+class UpdateProgramsUpdateProgramsPrograms(BaseStruct):
+    id: Any
+    name: Optional[Any]
+    existence: Existence
+    description: Optional[Any]
+    type_: ProgramType = field(name="type")
+    active: "ProgramDetailActive"
+    proposal_status: ProposalStatus = field(name="proposalStatus")
+    proposal: Optional["ProgramDetailProposal"]
+    pi: Optional["ProgramDetailPi"]
+    all_group_elements: list["ProgramGroupElementsAllGroupElements"] = field(
+        name="allGroupElements"
+    )
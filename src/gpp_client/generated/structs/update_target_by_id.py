@@ -0,0 +1,32 @@
+from typing import Any, Optional
+
+from msgspec import field
+
+from ..enums import CalibrationRole, Existence
+from .base_struct import BaseStruct
+from .fragments import (
+    TargetDetailsNonsidereal,
+    TargetDetailsOpportunity,
+    TargetDetailsSidereal,
+    TargetProgramSummaryProgram,
+)
+
+
+class UpdateTargetById(BaseStruct):
+    update_targets: "UpdateTargetByIdUpdateTargets" = field(name="updateTargets")
+
+
+class UpdateTargetByIdUpdateTargets(BaseStruct):
+    has_more: bool = field(name="hasMore")
+    targets: list["UpdateTargetByIdUpdateTargetsTargets"]
+
+
+class UpdateTargetByIdUpdateTargetsTargets(BaseStruct):
+    id: Any
+    existence: Existence
+    name: Any
+    calibration_role: Optional[CalibrationRole] = field(name="calibrationRole")
+    opportunity: Optional["TargetDetailsOpportunity"]
+    sidereal: Optional["TargetDetailsSidereal"]
+    nonsidereal: Optional["TargetDetailsNonsidereal"]
+    program: "TargetProgramSummaryProgram"
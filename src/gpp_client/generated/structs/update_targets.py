@@ -0,0 +1,32 @@
+from typing import Any, Optional
+
+from msgspec import field
+
+from ..enums import CalibrationRole, Existence
+from .base_struct import BaseStruct
+from .fragments import (
+    TargetDetailsNonsidereal,
+    TargetDetailsOpportunity,
+    TargetDetailsSidereal,
+    TargetProgramSummaryProgram,
+)
+
+
+class UpdateTargets(BaseStruct):
+    update_targets: "UpdateTargetsUpdateTargets" = field(name="updateTargets")
+
+
+class UpdateTargetsUpdateTargets(BaseStruct):
+    has_more: bool = field(name="hasMore")
+    targets: list["UpdateTargetsUpdateTargetsTargets"]
+
+
+class UpdateTargetsUpdateTargetsTargets(BaseStruct):
+    id: Any
+    existence: Existence
+    name: Any
+    calibration_role: Optional[CalibrationRole] = field(name="calibrationRole")
+    opportunity: Optional["TargetDetailsOpportunity"]
+    sidereal: Optional["TargetDetailsSidereal"]
+    nonsidereal: Optional["TargetDetailsNonsidereal"]
+    program: "TargetProgramSummaryProgram"
@@ -0,0 +1,529 @@
+"""
+Client-wide performance metrics.
+
+:class:`MetricsCollector` is a tracing hook that aggregates finished spans into
+per-operation counters and latency percentiles. ``GPPClient.metrics()`` combines
+them with the cache, connection pool and transport counters into one
+:class:`ClientMetrics` snapshot, which can be saved as JSON and rendered in the
+Prometheus text exposition format. No external service is involved, so snapshots
+of two runs can be compared offline.
+"""
+
+__all__ = [
+    "CacheMetrics",
+    "ClientMetrics",
+    "MetricsCollector",
+    "OperationMetrics",
+    "SubscriptionMetrics",
+]
+
+import math
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from gpp_client.tracing import ClientHooks, Span, SpanAttribute
+from gpp_client.transport import HostStats, TransportStats
+
+_SUBSCRIPTION_KIND = "graphql.subscription"
+_QUANTILES = (("p50", 0.5), ("p95", 0.95), ("p99", 0.99))
+
+
+@dataclass(frozen=True)
+class OperationMetrics:
+    """
+    Counters and latency percentiles of one operation.
+
+    Attributes
+    ----------
+    kind : str
+        ``"graphql"``, ``"graphql.subscription"`` or ``"rest"``.
+    calls : int
+        Finished calls.
+    errors : int
+        Calls that raised.
+    total_time : float
+        Summed duration of all calls, in seconds.
+    p50, p95, p99 : float
+        Latency percentiles over the most recent calls, in seconds.
+    bytes_sent : int
+        Request bytes across all calls.
+    bytes_received : int
+        Response bytes across all calls.
+    retries : int
+        Retries across all calls.
+    """
+
+    kind: str
+    calls: int = 0
+    errors: int = 0
+    total_time: float = 0.0
+    p50: float = 0.0
+    p95: float = 0.0
+    p99: float = 0.0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    retries: int = 0
+
+
+@dataclass(frozen=True)
+class SubscriptionMetrics:
+    """
+    Event counters of one subscription operation.
+
+    Attributes
+    ----------
+    events : int
+        Events received across all streams, including running ones.
+    active : int
+        Streams currently open.
+    elapsed : float
+        Seconds the streams have been open, summed.
+    """
+
+    events: int = 0
+    active: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def events_per_second(self) -> float:
+        """
+        Average event rate while the streams were open.
+
+        Returns
+        -------
+        float
+            Events per second, or 0 before any time has elapsed.
+        """
+        return self.events / self.elapsed if self.elapsed else 0.0
+
+
+@dataclass(frozen=True)
+class CacheMetrics:
+    """
+    Hit and miss counters of one cache.
+
+    Attributes
+    ----------
+    hits : int
+        Lookups answered from the cache.
+    misses : int
+        Lookups that had to go to the service.
+    size : int
+        Entries currently cached.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Fraction of lookups answered from the cache.
+
+        Returns
+        -------
+        float
+            Hit rate between 0 and 1, or 0 when nothing was looked up yet.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass(frozen=True)
+class ClientMetrics:
+    """
+    Snapshot of the client's performance counters.
+
+    Attributes
+    ----------
+    operations : dict[str, OperationMetrics]
+        Counters keyed by operation name.
+    subscriptions : dict[str, SubscriptionMetrics]
+        Event counters keyed by subscription operation name.
+    caches : dict[str, CacheMetrics]
+        Counters keyed by cache name.
+    connections : dict[str, int]
+        Open sockets keyed by pool: ``"graphql"``, ``"rest"`` and
+        ``"websocket"``.
+    transport : TransportStats
+        Requests, connections and TLS handshakes per host.
+    """
+
+    operations: dict[str, OperationMetrics] = field(default_factory=dict)
+    subscriptions: dict[str, SubscriptionMetrics] = field(default_factory=dict)
+    caches: dict[str, CacheMetrics] = field(default_factory=dict)
+    connections: dict[str, int] = field(default_factory=dict)
+    transport: TransportStats = field(default_factory=TransportStats)
+
+    @property
+    def bytes_sent(self) -> int:
+        """
+        Request bytes across all operations.
+
+        Returns
+        -------
+        int
+            Bytes sent.
+        """
+        return sum(op.bytes_sent for op in self.operations.values())
+
+    @property
+    def bytes_received(self) -> int:
+        """
+        Response bytes across all operations.
+
+        Returns
+        -------
+        int
+            Bytes received.
+        """
+        return sum(op.bytes_received for op in self.operations.values())
+
+    @property
+    def retries(self) -> int:
+        """
+        Retries across all operations.
+
+        Returns
+        -------
+        int
+            Number of retries.
+        """
+        return sum(op.retries for op in self.operations.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the snapshot to JSON-serializable data.
+
+        Returns
+        -------
+        dict[str, Any]
+            The counters, including the derived totals and rates.
+        """
+        return {
+            "operations": {
+                name: asdict(op) for name, op in sorted(self.operations.items())
+            },
+            "subscriptions": {
+                name: {**asdict(sub), "events_per_second": sub.events_per_second}
+                for name, sub in sorted(self.subscriptions.items())
+            },
+            "caches": {
+                name: {**asdict(cache), "hit_rate": cache.hit_rate}
+                for name, cache in sorted(self.caches.items())
+            },
+            "connections": dict(self.connections),
+            "transport": {
+                host: asdict(stats)
+                for host, stats in sorted(self.transport.hosts.items())
+            },
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "retries": self.retries,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ClientMetrics":
+        """
+        Rebuild a snapshot saved with :meth:`to_dict`.
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The saved data. Derived totals and rates are ignored.
+
+        Returns
+        -------
+        ClientMetrics
+            The snapshot.
+        """
+
+        def fields_of(kind: type, values: dict[str, Any]) -> dict[str, Any]:
+            return {
+                key: values[key] for key in kind.__dataclass_fields__ if key in values
+            }
+
+        return cls(
+            operations={
+                name: OperationMetrics(**fields_of(OperationMetrics, values))
+                for name, values in data.get("operations", {}).items()
+            },
+            subscriptions={
+                name: SubscriptionMetrics(**fields_of(SubscriptionMetrics, values))
+                for name, values in data.get("subscriptions", {}).items()
+            },
+            caches={
+                name: CacheMetrics(**fields_of(CacheMetrics, values))
+                for name, values in data.get("caches", {}).items()
+            },
+            connections=dict(data.get("connections", {})),
+            transport=TransportStats(
+                hosts={
+                    host: HostStats(**fields_of(HostStats, values))
+                    for host, values in data.get("transport", {}).items()
+                }
+            ),
+        )
+
+    def to_prometheus(self) -> str:
+        """
+        Render the snapshot in the Prometheus text exposition format.
+
+        Latencies are exported as a summary with the 0.5, 0.95 and 0.99
+        quantiles; everything else as counters and gauges.
+
+        Returns
+        -------
+        str
+            The metrics text, ending with a newline.
+        """
+        out = _PrometheusWriter()
+
+        out.family(
+            "gpp_operation_duration_seconds",
+            "summary",
+            "Latency of client operations.",
+        )
+        for name, op in sorted(self.operations.items()):
+            labels = {"operation": name, "kind": op.kind}
+            for label, quantile in _QUANTILES:
+                value = getattr(op, label)
+                out.sample(
+                    "gpp_operation_duration_seconds",
+                    {**labels, "quantile": str(quantile)},
+                    value,
+                )
+            out.sample("gpp_operation_duration_seconds_sum", labels, op.total_time)
+            out.sample("gpp_operation_duration_seconds_count", labels, op.calls)
+
+        for metric, attribute, help_text in (
+            ("gpp_operation_errors_total", "errors", "Operations that raised."),
+            ("gpp_operation_sent_bytes_total", "bytes_sent", "Request bytes sent."),
+            (
+                "gpp_operation_received_bytes_total",
+                "bytes_received",
+                "Response bytes received.",
+            ),
+            ("gpp_operation_retries_total", "retries", "Requests retried."),
+        ):
+            out.family(metric, "counter", help_text)
+            for name, op in sorted(self.operations.items()):
+                labels = {"operation": name, "kind": op.kind}
+                out.sample(metric, labels, getattr(op, attribute))
+
+        out.family(
+            "gpp_subscription_events_total", "counter", "Subscription events received."
+        )
+        for name, sub in sorted(self.subscriptions.items()):
+            out.sample(
+                "gpp_subscription_events_total", {"subscription": name}, sub.events
+            )
+        out.family(
+            "gpp_subscription_events_per_second",
+            "gauge",
+            "Average subscription event rate while open.",
+        )
+        for name, sub in sorted(self.subscriptions.items()):
+            out.sample(
+                "gpp_subscription_events_per_second",
+                {"subscription": name},
+                sub.events_per_second,
+            )
+
+        out.family("gpp_cache_hits_total", "counter", "Cache lookups answered.")
+        for name, cache in sorted(self.caches.items()):
+            out.sample("gpp_cache_hits_total", {"cache": name}, cache.hits)
+        out.family("gpp_cache_misses_total", "counter", "Cache lookups missed.")
+        for name, cache in sorted(self.caches.items()):
+            out.sample("gpp_cache_misses_total", {"cache": name}, cache.misses)
+
+        out.family("gpp_open_connections", "gauge", "Open sockets per pool.")
+        for pool, count in sorted(self.connections.items()):
+            out.sample("gpp_open_connections", {"pool": pool}, count)
+
+        for metric, attribute, help_text in (
+            ("gpp_host_requests_total", "requests", "Requests sent per host."),
+            ("gpp_host_connections_total", "connections", "TCP connections opened."),
+            (
+                "gpp_host_tls_handshakes_total",
+                "tls_handshakes",
+                "TLS handshakes completed.",
+            ),
+        ):
+            out.family(metric, "counter", help_text)
+            for host, stats in sorted(self.transport.hosts.items()):
+                out.sample(metric, {"host": host}, getattr(stats, attribute))
+
+        return out.text()
+
+
+class MetricsCollector(ClientHooks):
+    """
+    Aggregate finished spans into per-operation metrics.
+
+    Parameters
+    ----------
+    max_samples : int, default=2048
+        Number of most recent durations per operation kept for percentiles.
+    """
+
+    def __init__(self, max_samples: int = 2048) -> None:
+        if max_samples < 1:
+            raise ValueError("max_samples must be a positive integer.")
+        self.max_samples = max_samples
+        self._operations: dict[str, _OperationStats] = {}
+        self._subscriptions: dict[str, _SubscriptionStats] = {}
+
+    def on_span_start(self, span: Span) -> None:
+        if span.kind == _SUBSCRIPTION_KIND:
+            stats = self._subscriptions.setdefault(span.name, _SubscriptionStats())
+            stats.active[span.span_id] = span
+
+    def on_span_end(self, span: Span) -> None:
+        stats = self._operations.get(span.name)
+        if stats is None:
+            stats = self._operations[span.name] = _OperationStats(
+                kind=span.kind, durations=deque(maxlen=self.max_samples)
+            )
+        stats.record(span)
+
+        if span.kind == _SUBSCRIPTION_KIND:
+            sub = self._subscriptions.setdefault(span.name, _SubscriptionStats())
+            sub.active.pop(span.span_id, None)
+            sub.events += span.attributes.get(SpanAttribute.EVENTS, 0)
+            sub.elapsed += span.duration or 0.0
+
+    def snapshot(
+        self,
+    ) -> tuple[dict[str, OperationMetrics], dict[str, SubscriptionMetrics]]:
+        """
+        Summarise the spans seen so far.
+
+        Returns
+        -------
+        dict[str, OperationMetrics]
+            Counters keyed by operation name.
+        dict[str, SubscriptionMetrics]
+            Event counters keyed by subscription name, including open streams.
+        """
+        operations = {name: stats.summary() for name, stats in self._operations.items()}
+        subscriptions = {}
+        for name, stats in self._subscriptions.items():
+            running = list(stats.active.values())
+            subscriptions[name] = SubscriptionMetrics(
+                events=stats.events
+                + sum(span.attributes.get(SpanAttribute.EVENTS, 0) for span in running),
+                active=len(running),
+                elapsed=stats.elapsed + sum(span.elapsed() for span in running),
+            )
+        return operations, subscriptions
+
+    def reset(self) -> None:
+        """
+        Forget all finished spans. Open subscription streams are kept.
+        """
+        self._operations.clear()
+        for stats in self._subscriptions.values():
+            stats.events = 0
+            stats.elapsed = 0.0
+
+
+@dataclass
+class _OperationStats:
+    """
+    Running totals of one operation.
+    """
+
+    kind: str
+    durations: deque[float]
+    calls: int = 0
+    errors: int = 0
+    total_time: float = 0.0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    retries: int = 0
+
+    def record(self, span: Span) -> None:
+        duration = span.duration or 0.0
+        attributes = span.attributes
+        self.calls += 1
+        self.errors += span.error is not None
+        self.total_time += duration
+        self.durations.append(duration)
+        self.bytes_sent += attributes.get(SpanAttribute.REQUEST_BYTES, 0)
+        self.bytes_received += attributes.get(SpanAttribute.RESPONSE_BYTES, 0)
+        self.retries += attributes.get(SpanAttribute.RETRIES, 0)
+
+    def summary(self) -> OperationMetrics:
+        ordered = sorted(self.durations)
+        return OperationMetrics(
+            kind=self.kind,
+            calls=self.calls,
+            errors=self.errors,
+            total_time=self.total_time,
+            **{label: _quantile(ordered, q) for label, q in _QUANTILES},
+            bytes_sent=self.bytes_sent,
+            bytes_received=self.bytes_received,
+            retries=self.retries,
+        )
+
+
+@dataclass
+class _SubscriptionStats:
+    """
+    Running totals of one subscription operation.
+    """
+
+    events: int = 0
+    elapsed: float = 0.0
+    active: dict[int, Span] = field(default_factory=dict)
+
+
+def _quantile(ordered: list[float], q: float) -> float:
+    """
+    Return the nearest-rank quantile of sorted values, or 0 if there are none.
+    """
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(q * len(ordered)))
+    return ordered[rank - 1]
+
+
+class _PrometheusWriter:
+    """
+    Accumulate lines of the Prometheus text exposition format.
+    """
+
+    def __init__(self) -> None:
+        self._lines: list[str] = []
+
+    def family(self, name: str, kind: str, help_text: str) -> None:
+        self._lines.append(f"# HELP {name} {help_text}")
+        self._lines.append(f"# TYPE {name} {kind}")
+
+    def sample(self, name: str, labels: dict[str, str], value: float) -> None:
+        rendered = ",".join(
+            f'{key}="{_escape_label(str(val))}"' for key, val in labels.items()
+        )
+        self._lines.append(f"{name}{{{rendered}}} {_format_value(value)}")
+
+    def text(self) -> str:
+        return "\n".join(self._lines) + "\n"
+
+
+def _escape_label(value: str) -> str:
+    """
+    Escape a label value for the Prometheus text format.
+    """
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _format_value(value: float) -> str:
+    """
+    Format a sample value, keeping integers free of a decimal point.
+    """
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
@@ -0,0 +1,484 @@
+"""
+Response-size and field-cost profiling of GraphQL operations.
+
+:class:`ResponseProfiler` is a tracing hook that receives the decoded data of
+every GraphQL response and subscription event and breaks its size and its
+Pydantic validation time down by field path. Each field is also attributed to
+the fragment that selected it, e.g. ``ObservationDetails.observingMode`` for the
+observing mode of ``getObservations``, so the report shows which parts of which
+fragments are worth projecting away or replacing with slimmer ones.
+
+Sizes are the bytes of the field's key and value as compact JSON. Validation
+times are measured by validating each field's value again on its own, so they
+include the time of the fields nested in it, and those of the first responses
+include warming up the validators. Profiling costs several times the validation
+of every response; enable it for analysis, not in production.
+"""
+
+__all__ = ["FieldCost", "OperationProfile", "ProfileReport", "ResponseProfiler"]
+
+import functools
+import json
+import time
+import typing
+from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from graphql import (
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    parse,
+)
+from pydantic import BaseModel, TypeAdapter
+
+from gpp_client.generated.client import GraphQLClient
+from gpp_client.tracing import ClientHooks, Span
+
+
+@dataclass(frozen=True)
+class FieldCost:
+    """
+    Size and validation time of one field path of an operation's responses.
+
+    Attributes
+    ----------
+    fragment_path : str | None
+        The field's path within the innermost fragment that selects it, starting
+        with the fragment name, or ``None`` if no fragment does.
+    count : int
+        Occurrences across all responses; each item of a list counts.
+    bytes : int
+        Bytes of the field's key and value as compact JSON, summed.
+    validation_time : float
+        Seconds validating the field's values, including nested fields, summed.
+        0 where no result model is known, e.g. for ``execute`` calls.
+    """
+
+    fragment_path: str | None = None
+    count: int = 0
+    bytes: int = 0
+    validation_time: float = 0.0
+
+
+@dataclass(frozen=True)
+class OperationProfile:
+    """
+    Field costs of one GraphQL operation.
+
+    Attributes
+    ----------
+    responses : int
+        Responses and subscription events profiled.
+    bytes : int
+        Bytes of the response data as compact JSON, summed.
+    validation_time : float
+        Seconds validating the whole result models, summed.
+    fields : dict[str, FieldCost]
+        Costs keyed by field path of response keys, e.g.
+        ``"observations.matches.observingMode"``. List items share the path of
+        their list.
+    """
+
+    responses: int = 0
+    bytes: int = 0
+    validation_time: float = 0.0
+    fields: dict[str, FieldCost] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class ProfileReport:
+    """
+    Field costs of every profiled operation.
+
+    Attributes
+    ----------
+    operations : dict[str, OperationProfile]
+        Profiles keyed by GraphQL operation name, e.g. ``"getObservations"``.
+    """
+
+    operations: dict[str, OperationProfile] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the report to JSON-serializable data.
+
+        Returns
+        -------
+        dict[str, Any]
+            The profiles, with fields ordered by bytes, largest first.
+        """
+        return {
+            "operations": {
+                name: {
+                    **asdict(profile),
+                    "fields": {
+                        path: asdict(cost)
+                        for path, cost in sorted(
+                            profile.fields.items(), key=lambda item: -item[1].bytes
+                        )
+                    },
+                }
+                for name, profile in sorted(self.operations.items())
+            }
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ProfileReport":
+        """
+        Rebuild a report saved with :meth:`to_dict`.
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+            The saved data.
+
+        Returns
+        -------
+        ProfileReport
+            The report.
+        """
+        return cls(
+            operations={
+                name: OperationProfile(
+                    responses=values["responses"],
+                    bytes=values["bytes"],
+                    validation_time=values["validation_time"],
+                    fields={
+                        path: FieldCost(**cost)
+                        for path, cost in values.get("fields", {}).items()
+                    },
+                )
+                for name, values in data.get("operations", {}).items()
+            }
+        )
+
+    def to_text(self, *, top: int = 20) -> str:
+        """
+        Render the most expensive fields of each operation as a table.
+
+        Parameters
+        ----------
+        top : int, default=20
+            Fields shown per operation, largest first.
+
+        Returns
+        -------
+        str
+            The table, ending with a newline.
+        """
+        lines = []
+        for name, profile in sorted(self.operations.items()):
+            lines.append(
+                f"{name}: {profile.responses} responses, {profile.bytes} bytes,"
+                f" {profile.validation_time * 1000:.1f} ms validation"
+            )
+            lines.append(f"  {'bytes':>10} {'share':>6} {'ms':>9}  field")
+            ranked = sorted(profile.fields.items(), key=lambda item: -item[1].bytes)
+            for path, cost in ranked[:top]:
+                share = cost.bytes / profile.bytes if profile.bytes else 0.0
+                label = cost.fragment_path or path
+                lines.append(
+                    f"  {cost.bytes:>10} {share:>6.1%}"
+                    f" {cost.validation_time * 1000:>9.2f}  {label}"
+                )
+        return "\n".join(lines) + "\n"
+
+
+class ResponseProfiler(ClientHooks):
+    """
+    Profile the size and validation time of GraphQL responses by field.
+
+    Register it on ``GPPClient.tracer``, or set the ``profile_file`` setting to
+    have the client register one and save its report on close.
+    """
+
+    def __init__(self) -> None:
+        self._operations: dict[str, _OperationStats] = {}
+
+    def on_response(self, span: Span, query: str, data: dict[str, Any]) -> None:
+        document = _parse_document(query)
+        name = document.operation_name or span.name
+        stats = self._operations.setdefault(name, _OperationStats())
+        model = _result_model(span.name)
+
+        stats.responses += 1
+        if model is not None:
+            started = time.perf_counter()
+            model.model_validate(data)
+            stats.validation_time += time.perf_counter() - started
+        stats.bytes += _Walker(document, stats).walk(data, model)
+
+    def report(self) -> ProfileReport:
+        """
+        Summarise the responses profiled so far.
+
+        Returns
+        -------
+        ProfileReport
+            Field costs per operation.
+        """
+        return ProfileReport(
+            operations={
+                name: stats.summary() for name, stats in self._operations.items()
+            }
+        )
+
+    def reset(self) -> None:
+        """
+        Forget the responses profiled so far.
+        """
+        self._operations.clear()
+
+
+@dataclass
+class _FieldStats:
+    """
+    Running totals of one field path.
+    """
+
+    fragment_path: str | None
+    count: int = 0
+    bytes: int = 0
+    validation_time: float = 0.0
+
+
+@dataclass
+class _OperationStats:
+    """
+    Running totals of one operation.
+    """
+
+    responses: int = 0
+    bytes: int = 0
+    validation_time: float = 0.0
+    fields: dict[str, _FieldStats] = field(default_factory=dict)
+
+    def summary(self) -> OperationProfile:
+        return OperationProfile(
+            responses=self.responses,
+            bytes=self.bytes,
+            validation_time=self.validation_time,
+            fields={
+                path: FieldCost(**asdict(stats)) for path, stats in self.fields.items()
+            },
+        )
+
+
+@dataclass
+class _Selection:
+    """
+    A selected response key, the fragment path it was selected at and the keys
+    selected below it.
+    """
+
+    fragment_path: str | None
+    children: dict[str, "_Selection"] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class _Document:
+    """
+    The selections of a parsed operation, by response key.
+    """
+
+    operation_name: str | None
+    selections: dict[str, _Selection]
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_document(query: str) -> _Document:
+    """
+    Parse a query once; generated operations send the same text every time.
+    """
+    document = parse(query)
+    fragments = {
+        definition.name.value: definition
+        for definition in document.definitions
+        if isinstance(definition, FragmentDefinitionNode)
+    }
+    operation = next(
+        definition
+        for definition in document.definitions
+        if isinstance(definition, OperationDefinitionNode)
+    )
+    selections: dict[str, _Selection] = {}
+    _collect(operation.selection_set, fragments, None, selections)
+    return _Document(
+        operation_name=operation.name.value if operation.name else None,
+        selections=selections,
+    )
+
+
+def _collect(
+    selection_set: SelectionSetNode,
+    fragments: dict[str, FragmentDefinitionNode],
+    fragment_path: str | None,
+    into: dict[str, _Selection],
+) -> None:
+    """
+    Merge the fields of a selection set into ``into``, following fragments.
+    """
+    for node in selection_set.selections:
+        if isinstance(node, FieldNode):
+            key = (node.alias or node.name).value
+            path = f"{fragment_path}.{key}" if fragment_path else None
+            selection = into.setdefault(key, _Selection(path))
+            if node.selection_set is not None:
+                _collect(node.selection_set, fragments, path, selection.children)
+        elif isinstance(node, FragmentSpreadNode):
+            name = node.name.value
+            _collect(fragments[name].selection_set, fragments, name, into)
+        elif isinstance(node, InlineFragmentNode):
+            _collect(node.selection_set, fragments, fragment_path, into)
+
+
+class _Walker:
+    """
+    Walk response data along its selections, adding field costs to ``stats``.
+    """
+
+    def __init__(self, document: _Document, stats: _OperationStats) -> None:
+        self._document = document
+        self._stats = stats
+
+    def walk(self, data: dict[str, Any], model: type[BaseModel] | None) -> int:
+        """
+        Profile one response and return its size.
+        """
+        return self._object(data, self._document.selections, "", model)
+
+    def _object(
+        self,
+        value: dict[str, Any],
+        selections: dict[str, _Selection],
+        path: str,
+        model: type[BaseModel] | None,
+    ) -> int:
+        fields = _model_fields(model) if model is not None else {}
+        size = 2 + max(len(value) - 1, 0)
+        for key, item in value.items():
+            field_path = f"{path}.{key}" if path else key
+            selection = selections.get(key) or _Selection(None)
+            stats = self._stats.fields.get(field_path)
+            if stats is None:
+                stats = self._stats.fields[field_path] = _FieldStats(
+                    selection.fragment_path
+                )
+
+            adapter, item_models = fields.get(key, (None, ()))
+            if adapter is not None:
+                started = time.perf_counter()
+                adapter.validate_python(item)
+                stats.validation_time += time.perf_counter() - started
+
+            item_size = (
+                len(json.dumps(key))
+                + 1
+                + self._value(item, selection, field_path, item_models, stats)
+            )
+            stats.bytes += item_size
+            size += item_size
+        return size
+
+    def _value(
+        self,
+        value: Any,
+        selection: _Selection,
+        path: str,
+        models: tuple[type[BaseModel], ...],
+        stats: _FieldStats,
+    ) -> int:
+        if isinstance(value, list):
+            stats.count += len(value)
+            sizes = [self._item(item, selection, path, models) for item in value]
+            return 2 + sum(sizes) + max(len(sizes) - 1, 0)
+        stats.count += 1
+        return self._item(value, selection, path, models)
+
+    def _item(
+        self,
+        value: Any,
+        selection: _Selection,
+        path: str,
+        models: tuple[type[BaseModel], ...],
+    ) -> int:
+        if isinstance(value, dict):
+            model = _pick_model(models, value)
+            return self._object(value, selection.children, path, model)
+        if isinstance(value, list):
+            sizes = [self._item(item, selection, path, models) for item in value]
+            return 2 + sum(sizes) + max(len(sizes) - 1, 0)
+        return len(json.dumps(value))
+
+
+@functools.lru_cache(maxsize=None)
+def _result_model(method_name: str) -> type[BaseModel] | None:
+    """
+    Return the result model of a generated operation method, if there is one.
+    """
+    method = getattr(GraphQLClient, method_name, None)
+    if method is None:
+        return None
+    result = typing.get_type_hints(method).get("return")
+    if typing.get_origin(result) is AsyncIterator:
+        result = typing.get_args(result)[0]
+    if isinstance(result, type) and issubclass(result, BaseModel):
+        return result
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _model_fields(
+    model: type[BaseModel],
+) -> dict[str, tuple[TypeAdapter, tuple[type[BaseModel], ...]]]:
+    """
+    Return a validator and the nested models of each field, by response key.
+    """
+    # Annotations on the fields can hold forward references the generated
+    # modules resolve only at class level.
+    hints = typing.get_type_hints(model, include_extras=True)
+    fields = {}
+    for name, info in model.model_fields.items():
+        annotation = hints.get(name, info.annotation)
+        fields[info.alias or name] = (
+            TypeAdapter(annotation),
+            _nested_models(annotation),
+        )
+    return fields
+
+
+def _nested_models(annotation: Any) -> tuple[type[BaseModel], ...]:
+    """
+    Return the models an annotation can hold, through lists, unions and
+    ``Annotated``.
+    """
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return (annotation,)
+    models: tuple[type[BaseModel], ...] = ()
+    for arg in typing.get_args(annotation):
+        models += _nested_models(arg)
+    return models
+
+
+def _pick_model(
+    models: tuple[type[BaseModel], ...], value: dict[str, Any]
+) -> type[BaseModel] | None:
+    """
+    Choose the model of an object: the only candidate, or the union member
+    whose ``__typename`` matches.
+    """
+    if len(models) == 1:
+        return models[0]
+    typename = value.get("__typename")
+    for model in models:
+        typename_field = model.model_fields.get("typename__")
+        if typename_field is not None and typename in typing.get_args(
+            typename_field.annotation
+        ):
+            return model
+    return None
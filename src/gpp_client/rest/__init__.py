@@ -2,7 +2,26 @@
 REST API client for non-GraphQL requests.
 """
 
-from .client import RESTClient
-from .models import VisibilityChanges, parse_visibility_changes
+from .cache import (
+    AtomDigestCache,
+    AtomDigestCacheStats,
+    PresignedURLCache,
+    PresignedURLCacheStats,
+)
+from .client import ConnectionPoolStats, RESTClient, RESTConnectorOptions
+from .models import VisibilityChanges, iter_visibility_changes, parse_visibility_changes
+from .tracker import VisibilityChangeTracker
 
-__all__ = ["RESTClient", "VisibilityChanges", "parse_visibility_changes"]
+__all__ = [
+    "AtomDigestCache",
+    "AtomDigestCacheStats",
+    "ConnectionPoolStats",
+    "PresignedURLCache",
+    "PresignedURLCacheStats",
+    "RESTClient",
+    "RESTConnectorOptions",
+    "VisibilityChangeTracker",
+    "VisibilityChanges",
+    "iter_visibility_changes",
+    "parse_visibility_changes",
+]
@@ -0,0 +1,378 @@
+"""
+In-memory caches for REST responses.
+"""
+
+__all__ = [
+    "AtomDigestCache",
+    "AtomDigestCacheStats",
+    "PresignedURLCache",
+    "PresignedURLCacheStats",
+]
+
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from urllib.parse import parse_qsl, urlsplit
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class AtomDigestCacheStats:
+    """
+    Snapshot of the atom digest cache counters.
+
+    Attributes
+    ----------
+    hits : int
+        Observation lookups answered from the cache.
+    misses : int
+        Observation lookups that had to be requested from the endpoint.
+    evictions : int
+        Entries dropped to stay within ``max_entries``.
+    invalidations : int
+        Entries dropped because their observation changed.
+    size : int
+        Number of observations currently cached.
+    max_entries : int
+        Maximum number of observations the cache holds.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    size: int = 0
+    max_entries: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Fraction of lookups answered from the cache.
+
+        Returns
+        -------
+        float
+            Hit rate between 0 and 1, or 0 when nothing was looked up yet.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class AtomDigestCache:
+    """
+    Least-recently-used cache of atom digest rows keyed by observation ID.
+
+    Atom digests only change when an observation's calculation changes, so the
+    entries have no expiry: they are dropped by :meth:`invalidate` when an
+    ``obscalcUpdate`` event or a visibility change names the observation, or
+    evicted once the cache is full.
+
+    A fetch that was already in flight when an observation was invalidated must
+    not put the stale rows back. Callers bracket a fetch with :meth:`begin_fetch`
+    and :meth:`end_fetch` and pass the returned generation to :meth:`store`, which
+    skips any observation invalidated after the fetch started. :meth:`store` must
+    be called before :meth:`end_fetch`, which forgets those invalidations once no
+    fetch is in flight.
+
+    Parameters
+    ----------
+    max_entries : int
+        Maximum number of observations to keep.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be a positive integer.")
+        self.max_entries = max_entries
+
+        self._entries: OrderedDict[str, tuple[str, ...]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+        self._generation = 0
+        self._fetches_in_flight = 0
+        self._invalidated_at: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, observation_id: object) -> bool:
+        return observation_id in self._entries
+
+    def lookup(
+        self, observation_ids: Iterable[str]
+    ) -> tuple[dict[str, tuple[str, ...]], list[str]]:
+        """
+        Split observation IDs into cached rows and IDs that must be fetched.
+
+        Parameters
+        ----------
+        observation_ids : Iterable[str]
+            Observation IDs to look up. Duplicates are counted once.
+
+        Returns
+        -------
+        dict[str, tuple[str, ...]]
+            Cached TSV rows keyed by observation ID.
+        list[str]
+            Missing observation IDs, in input order.
+        """
+        cached: dict[str, tuple[str, ...]] = {}
+        missing: list[str] = []
+        for obs_id in dict.fromkeys(observation_ids):
+            rows = self._entries.get(obs_id)
+            if rows is None:
+                missing.append(obs_id)
+                continue
+            self._entries.move_to_end(obs_id)
+            cached[obs_id] = rows
+
+        self._hits += len(cached)
+        self._misses += len(missing)
+        return cached, missing
+
+    def begin_fetch(self) -> int:
+        """
+        Mark the start of a fetch for missing entries.
+
+        Returns
+        -------
+        int
+            Generation to pass to :meth:`store` once the fetch completes.
+        """
+        self._fetches_in_flight += 1
+        return self._generation
+
+    def end_fetch(self) -> None:
+        """
+        Mark the end of a fetch started with :meth:`begin_fetch`.
+        """
+        self._fetches_in_flight -= 1
+        if self._fetches_in_flight == 0:
+            # No fetch can still race with an old invalidation.
+            self._invalidated_at.clear()
+
+    def store(self, entries: dict[str, tuple[str, ...]], *, generation: int) -> None:
+        """
+        Store freshly fetched rows.
+
+        Parameters
+        ----------
+        entries : dict[str, tuple[str, ...]]
+            TSV rows keyed by observation ID. An empty tuple records an
+            observation without atoms.
+        generation : int
+            Value returned by :meth:`begin_fetch` for the fetch that produced
+            ``entries``.
+        """
+        for obs_id, rows in entries.items():
+            if self._invalidated_at.get(obs_id, -1) > generation:
+                logger.debug("Discarding stale atom digest for %s", obs_id)
+                continue
+            self._entries[obs_id] = rows
+            self._entries.move_to_end(obs_id)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, observation_ids: Iterable[str]) -> None:
+        """
+        Drop cached rows for observations whose calculation changed.
+
+        Parameters
+        ----------
+        observation_ids : Iterable[str]
+            Observation IDs to drop. Unknown IDs are ignored.
+        """
+        self._generation += 1
+        for obs_id in observation_ids:
+            if self._fetches_in_flight:
+                self._invalidated_at[obs_id] = self._generation
+            if self._entries.pop(obs_id, None) is not None:
+                self._invalidations += 1
+
+    def clear(self) -> None:
+        """
+        Drop every cached entry, keeping the counters.
+        """
+        self.invalidate(list(self._entries))
+
+    @property
+    def stats(self) -> AtomDigestCacheStats:
+        """
+        Current cache counters.
+
+        Returns
+        -------
+        AtomDigestCacheStats
+            Snapshot of hits, misses, evictions, invalidations and size.
+        """
+        return AtomDigestCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            invalidations=self._invalidations,
+            size=len(self._entries),
+            max_entries=self.max_entries,
+        )
+
+
+@dataclass(frozen=True)
+class PresignedURLCacheStats:
+    """
+    Snapshot of the presigned URL cache counters.
+
+    Attributes
+    ----------
+    hits : int
+        Lookups answered with a URL that was still valid.
+    misses : int
+        Lookups that found no URL or an expiring one.
+    size : int
+        Number of URLs currently cached.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    size: int = 0
+
+
+class PresignedURLCache:
+    """
+    Cache of presigned download URLs keyed by attachment ID.
+
+    Each URL is kept until ``margin`` seconds before the expiry encoded in its
+    signature: ``X-Amz-Date`` plus ``X-Amz-Expires`` (AWS SigV4),
+    ``X-Goog-Date`` plus ``X-Goog-Expires`` (GCS V4) or ``Expires`` (AWS SigV2).
+    URLs without a recognisable expiry are not cached.
+
+    Parameters
+    ----------
+    margin : float, default=60.0
+        Seconds before expiry at which a URL is no longer handed out, leaving
+        time for the download to start.
+    """
+
+    def __init__(self, margin: float = 60.0) -> None:
+        if margin < 0:
+            raise ValueError("margin must not be negative.")
+        self.margin = margin
+
+        self._entries: dict[str, tuple[str, float]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, attachment_id: str) -> str | None:
+        """
+        Return a cached URL that is valid for at least ``margin`` seconds.
+
+        Parameters
+        ----------
+        attachment_id : str
+            The attachment ID.
+
+        Returns
+        -------
+        str | None
+            The URL, or ``None`` if none is cached or it expires too soon.
+        """
+        entry = self._entries.get(attachment_id)
+        if entry is not None and time.time() < entry[1] - self.margin:
+            self._hits += 1
+            return entry[0]
+
+        if entry is not None:
+            del self._entries[attachment_id]
+        self._misses += 1
+        return None
+
+    def store(self, attachment_id: str, url: str) -> None:
+        """
+        Cache a URL until shortly before its signature expires.
+
+        Parameters
+        ----------
+        attachment_id : str
+            The attachment ID.
+        url : str
+            The presigned URL.
+        """
+        expires_at = presigned_url_expiry(url)
+        if expires_at is None:
+            logger.debug("Not caching URL for %s: unknown expiry", attachment_id)
+            return
+        self._entries[attachment_id] = (url, expires_at)
+
+    def invalidate(self, attachment_ids: Iterable[str]) -> None:
+        """
+        Drop the URLs of attachments that changed or were deleted.
+
+        Parameters
+        ----------
+        attachment_ids : Iterable[str]
+            Attachment IDs to drop. Unknown IDs are ignored.
+        """
+        for attachment_id in attachment_ids:
+            self._entries.pop(attachment_id, None)
+
+    def clear(self) -> None:
+        """
+        Drop every cached URL, keeping the counters.
+        """
+        self._entries.clear()
+
+    @property
+    def stats(self) -> PresignedURLCacheStats:
+        """
+        Current cache counters.
+
+        Returns
+        -------
+        PresignedURLCacheStats
+            Snapshot of hits, misses and size.
+        """
+        return PresignedURLCacheStats(
+            hits=self._hits, misses=self._misses, size=len(self._entries)
+        )
+
+
+def presigned_url_expiry(url: str) -> float | None:
+    """
+    Read the expiry time from a presigned URL's signature parameters.
+
+    Parameters
+    ----------
+    url : str
+        The presigned URL.
+
+    Returns
+    -------
+    float | None
+        Expiry as a POSIX timestamp, or ``None`` if the URL carries none.
+    """
+    params = {key.lower(): value for key, value in parse_qsl(urlsplit(url).query)}
+
+    for prefix in ("x-amz-", "x-goog-"):
+        signed_at = params.get(f"{prefix}date")
+        lifetime = params.get(f"{prefix}expires")
+        if signed_at and lifetime:
+            try:
+                start = datetime.strptime(signed_at, "%Y%m%dT%H%M%SZ")
+                return start.replace(tzinfo=timezone.utc).timestamp() + int(lifetime)
+            except ValueError:
+                return None
+
+    expires = params.get("expires")
+    if expires and expires.isdigit():
+        return float(expires)
+    return None
@@ -2,19 +2,116 @@
 REST API client for non-GraphQL requests.
 """
 
-__all__ = ["RESTClient"]
+__all__ = ["ConnectionPoolStats", "RESTClient", "RESTConnectorOptions"]
 
 import asyncio
+import functools
 import gzip
+import inspect
 import logging
 import ssl
+from collections.abc import AsyncIterator, Callable, Iterable
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from typing import Any
 
 import aiohttp
 import certifi
 
+from gpp_client.rest.cache import AtomDigestCache
+from gpp_client.tracing import SpanAttribute, Tracer, current_span
+
 logger = logging.getLogger(__name__)
 
+_ATOM_RETRY_BACKOFF = 0.5  # Seconds, doubled on each retry.
+
+
+@dataclass(frozen=True)
+class RESTConnectorOptions:
+    """
+    Connection pool options for the REST client's ``aiohttp.TCPConnector``.
+
+    The defaults match ``aiohttp``'s own.
+
+    Attributes
+    ----------
+    limit : int
+        Maximum number of simultaneous connections. 0 means no limit.
+    limit_per_host : int
+        Maximum number of simultaneous connections to one host. 0 means no limit.
+    ttl_dns_cache : int | None
+        Seconds to cache DNS lookups. ``None`` caches them forever.
+    keepalive_timeout : float
+        Seconds an idle connection is kept open for reuse.
+    """
+
+    limit: int = 100
+    limit_per_host: int = 0
+    ttl_dns_cache: int | None = 10
+    keepalive_timeout: float = 15.0
+
+
+@dataclass(frozen=True)
+class ConnectionPoolStats:
+    """
+    Snapshot of the REST client's connection pool usage.
+
+    Attributes
+    ----------
+    limit : int
+        Configured maximum number of simultaneous connections.
+    limit_per_host : int
+        Configured maximum number of simultaneous connections per host.
+    acquired : int
+        Connections currently serving a request.
+    idle : int
+        Open connections waiting to be reused.
+    waiting : int
+        Requests queued for a free connection.
+    sessions_created : int
+        Sessions built since the client was created, including recreations
+        after :meth:`RESTClient.close`.
+    """
+
+    limit: int = 0
+    limit_per_host: int = 0
+    acquired: int = 0
+    idle: int = 0
+    waiting: int = 0
+    sessions_created: int = 0
+
+
+@functools.cache
+def _get_ssl_context() -> ssl.SSLContext:
+    """
+    Return the process-wide SSL context, loading the CA bundle once.
+    """
+    return ssl.create_default_context(cafile=certifi.where())
+
+
+def _traced(method: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Run a request method inside a span named after it.
+    """
+    if inspect.isasyncgenfunction(method):
+
+        @functools.wraps(method)
+        async def traced_stream(
+            self: "RESTClient", *args: Any, **kwargs: Any
+        ) -> AsyncIterator[Any]:
+            span = self.tracer.start_span(method.__name__, kind="rest")
+            async for item in self.tracer.stream(span, method(self, *args, **kwargs)):
+                yield item
+
+        return traced_stream
+
+    @functools.wraps(method)
+    async def traced(self: "RESTClient", *args: Any, **kwargs: Any) -> Any:
+        with self.tracer.span(method.__name__, kind="rest"):
+            return await method(self, *args, **kwargs)
+
+    return traced
+
 
 class RESTClient:
     """
@@ -36,19 +133,49 @@ class RESTClient:
         GPP token to authenticate against the REST API. Same as GPPClient.
     timeout : float
         Timeout for REST API requests in seconds.
+    atom_digest_cache : AtomDigestCache | None, optional
+        Cache consulted by :meth:`get_atom_digests` so only stale or missing
+        observations are requested. ``None`` disables caching.
+    connector_options : RESTConnectorOptions | None, optional
+        Connection pool options. Defaults to ``aiohttp``'s defaults.
+    connect_timeout : float | None, optional
+        Timeout in seconds for establishing a connection. ``None`` leaves only
+        the total ``timeout``.
+    trace_configs : list[aiohttp.TraceConfig] | None, optional
+        Trace configs attached to every session, used for instrumentation.
+    tracer : Tracer | None, optional
+        Tracer receiving a span for each public request method. Defaults to a
+        tracer without hooks.
     """
 
     _DEFAULT_TIMEOUT = 30.0  # Seconds.
+    _DEFAULT_ATOM_CHUNK_SIZE = 500
+    _DEFAULT_ATOM_MAX_CONCURRENCY = 4
+    _DEFAULT_ATOM_CHUNK_RETRIES = 2
 
     def __init__(
-        self, base_url: str, gpp_token: str, timeout: float = _DEFAULT_TIMEOUT
+        self,
+        base_url: str,
+        gpp_token: str,
+        timeout: float = _DEFAULT_TIMEOUT,
+        atom_digest_cache: AtomDigestCache | None = None,
+        connector_options: RESTConnectorOptions | None = None,
+        connect_timeout: float | None = None,
+        trace_configs: list[aiohttp.TraceConfig] | None = None,
+        tracer: Tracer | None = None,
     ) -> None:
         self.base_url = base_url
         self.gpp_token = gpp_token
         self._timeout = timeout
+        self._connect_timeout = connect_timeout
+        self._trace_configs = list(trace_configs or [])
+        self.tracer = tracer or Tracer()
+        self.atom_digest_cache = atom_digest_cache
+        self.connector_options = connector_options or RESTConnectorOptions()
 
         self._session: aiohttp.ClientSession | None = None
         self._lock = asyncio.Lock()
+        self._sessions_created = 0
 
     def _resolve_headers(self) -> dict[str, str]:
         """
@@ -74,13 +201,25 @@ class RESTClient:
         aiohttp.ClientSession
             Configured aiohttp client session.
         """
-        ssl_context = ssl.create_default_context(cafile=certifi.where())
-        connector = aiohttp.TCPConnector(ssl=ssl_context)
+        options = self.connector_options
+        # The SSL context is shared across sessions and clients: loading the CA
+        # bundle is the expensive part of building a session.
+        connector = aiohttp.TCPConnector(
+            ssl=_get_ssl_context(),
+            limit=options.limit,
+            limit_per_host=options.limit_per_host,
+            ttl_dns_cache=options.ttl_dns_cache,
+            keepalive_timeout=options.keepalive_timeout,
+        )
+        self._sessions_created += 1
         return aiohttp.ClientSession(
             base_url=self.base_url,
-            timeout=aiohttp.ClientTimeout(total=self._timeout),
+            timeout=aiohttp.ClientTimeout(
+                total=self._timeout, sock_connect=self._connect_timeout
+            ),
             connector=connector,
             headers=self._resolve_headers(),
+            trace_configs=[*self._trace_configs, self.tracer.trace_config()],
         )
 
     async def get_session(self) -> aiohttp.ClientSession:
@@ -97,6 +236,38 @@ class RESTClient:
                 self._session = self._create_session()
             return self._session
 
+    def pool_stats(self) -> ConnectionPoolStats:
+        """
+        Report the current connection pool usage.
+
+        Returns
+        -------
+        ConnectionPoolStats
+            Pool limits and connection counts. Counts are zero when no session
+            is open.
+        """
+        options = self.connector_options
+        session = self._session
+        if session is None or session.closed:
+            return ConnectionPoolStats(
+                limit=options.limit,
+                limit_per_host=options.limit_per_host,
+                sessions_created=self._sessions_created,
+            )
+
+        # aiohttp has no public accessors for these counters.
+        connector = session.connector
+        idle = getattr(connector, "_conns", {})
+        waiting = getattr(connector, "_waiters", {})
+        return ConnectionPoolStats(
+            limit=options.limit,
+            limit_per_host=options.limit_per_host,
+            acquired=len(getattr(connector, "_acquired", ())),
+            idle=sum(len(conns) for conns in idle.values()),
+            waiting=sum(len(waiters) for waiters in waiting.values()),
+            sessions_created=self._sessions_created,
+        )
+
     async def close(self) -> None:
         """
         Close the session if it exists and is not already closed.
@@ -116,20 +287,42 @@ class RESTClient:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close()
 
+    @_traced
     async def get_atom_digests(
-        self, observation_ids: list[str], accept_gzip: bool = True
+        self,
+        observation_ids: list[str],
+        accept_gzip: bool = True,
+        *,
+        chunk_size: int = _DEFAULT_ATOM_CHUNK_SIZE,
+        max_concurrency: int = _DEFAULT_ATOM_MAX_CONCURRENCY,
+        retries: int = _DEFAULT_ATOM_CHUNK_RETRIES,
     ) -> str:
         """
         Request atom digests for the given observation IDs.
 
+        The IDs are split into chunks of at most ``chunk_size`` that are posted
+        concurrently, with at most ``max_concurrency`` requests in flight. The
+        chunk bodies are merged back in input order. A chunk that fails with a
+        transient error (connection failure, timeout or 5xx) is retried on its own
+        up to ``retries`` times; the other chunks are not re-requested.
+
+        When an :class:`AtomDigestCache` is configured, only observations missing
+        from it are requested and the rows are returned in ``observation_ids``
+        order, one block per observation.
+
         Parameters
         ----------
         observation_ids : list[str]
             (internal) IDs of the observation to request.
-
         accept_gzip : bool
             Endpoint allows to return a gzip-compressed representation of the
             complete atoms digest in the case of being too big.
+        chunk_size : int, default=500
+            Maximum number of observation IDs per request.
+        max_concurrency : int, default=4
+            Maximum number of chunk requests in flight at once.
+        retries : int, default=2
+            Number of extra attempts for a chunk that fails with a transient error.
 
         Returns
         -------
@@ -138,11 +331,185 @@ class RESTClient:
 
         Raises
         ------
+        ValueError
+            If ``chunk_size`` or ``max_concurrency`` is not positive, or the
+            endpoint rejects the observation IDs.
         aiohttp.ClientResponseError
             For HTTP error responses.
         aiohttp.ClientError
             For connection or timeout failures.
         """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer.")
+
+        options = {
+            "accept_gzip": accept_gzip,
+            "chunk_size": chunk_size,
+            "max_concurrency": max_concurrency,
+            "retries": retries,
+        }
+        cache = self.atom_digest_cache
+        if cache is None:
+            return await self._fetch_atom_digests(observation_ids, **options)
+
+        rows_by_obs, missing = cache.lookup(observation_ids)
+        if missing:
+            logger.debug(
+                "Atom digest cache: %d hits, %d to fetch",
+                len(rows_by_obs),
+                len(missing),
+            )
+            generation = cache.begin_fetch()
+            try:
+                body = await self._fetch_atom_digests(missing, **options)
+                fetched = _group_atom_rows(body)
+                # Observations without atoms are cached too, as an empty entry.
+                fetched = {obs_id: fetched.get(obs_id, ()) for obs_id in missing}
+                # Store before ending the fetch, which forgets the invalidations
+                # made while it was in flight.
+                cache.store(fetched, generation=generation)
+            finally:
+                cache.end_fetch()
+            rows_by_obs.update(fetched)
+
+        return "\n".join(
+            row
+            for obs_id in dict.fromkeys(observation_ids)
+            for row in rows_by_obs[obs_id]
+        )
+
+    def invalidate_atom_digests(self, observation_ids: Iterable[str]) -> None:
+        """
+        Drop cached atom digests for observations whose calculation changed.
+
+        Does nothing when no :class:`AtomDigestCache` is configured.
+
+        Parameters
+        ----------
+        observation_ids : Iterable[str]
+            IDs of the observations to invalidate.
+        """
+        if self.atom_digest_cache is not None:
+            self.atom_digest_cache.invalidate(observation_ids)
+
+    async def _fetch_atom_digests(
+        self,
+        observation_ids: list[str],
+        *,
+        accept_gzip: bool,
+        chunk_size: int,
+        max_concurrency: int,
+        retries: int,
+    ) -> str:
+        """
+        Request atom digests from the endpoint in concurrent chunks.
+
+        Parameters
+        ----------
+        observation_ids : list[str]
+            IDs of the observations to request.
+        accept_gzip : bool
+            Whether to accept a gzip-compressed response.
+        chunk_size : int
+            Maximum number of observation IDs per request.
+        max_concurrency : int
+            Maximum number of chunk requests in flight at once.
+        retries : int
+            Number of extra attempts for a chunk that fails with a transient error.
+
+        Returns
+        -------
+        str
+            TSV data as string, one row per line.
+        """
+        chunks = _chunked(observation_ids, chunk_size)
+        if len(chunks) <= 1:
+            # Single request; keep the body exactly as the endpoint returned it.
+            return await self._post_atom_digests_with_retry(
+                chunks[0] if chunks else [], accept_gzip=accept_gzip, retries=retries
+            )
+
+        logger.debug(
+            "Requesting atom digests for %d observations in %d chunks",
+            len(observation_ids),
+            len(chunks),
+        )
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(chunk: list[str]) -> str:
+            async with semaphore:
+                return await self._post_atom_digests_with_retry(
+                    chunk, accept_gzip=accept_gzip, retries=retries
+                )
+
+        # ``gather`` keeps results in submission order, so the merged TSV follows
+        # the order of ``observation_ids``.
+        parts = await asyncio.gather(*(fetch(chunk) for chunk in chunks))
+        return "\n".join(part.rstrip("\n") for part in parts if part.strip())
+
+    async def _post_atom_digests_with_retry(
+        self, observation_ids: list[str], *, accept_gzip: bool, retries: int
+    ) -> str:
+        """
+        Post one chunk of observation IDs, retrying transient failures.
+
+        Parameters
+        ----------
+        observation_ids : list[str]
+            IDs of the observations in this chunk.
+        accept_gzip : bool
+            Whether to accept a gzip-compressed response.
+        retries : int
+            Number of extra attempts after the first failure.
+
+        Returns
+        -------
+        str
+            TSV data for this chunk.
+        """
+        attempt = 0
+        while True:
+            try:
+                return await self._post_atom_digests(
+                    observation_ids, accept_gzip=accept_gzip
+                )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                if attempt >= retries or not _is_transient(exc):
+                    raise
+                attempt += 1
+                if (span := current_span()) is not None:
+                    span.add(SpanAttribute.RETRIES, 1)
+                delay = _ATOM_RETRY_BACKOFF * 2 ** (attempt - 1)
+                logger.warning(
+                    "Atom digest chunk of %d IDs failed (%s), retry %d/%d in %.1fs",
+                    len(observation_ids),
+                    exc,
+                    attempt,
+                    retries,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+
+    async def _post_atom_digests(
+        self, observation_ids: list[str], *, accept_gzip: bool
+    ) -> str:
+        """
+        Post a single request to ``/scheduler/atoms``.
+
+        Parameters
+        ----------
+        observation_ids : list[str]
+            IDs of the observations to request.
+        accept_gzip : bool
+            Whether to accept a gzip-compressed response.
+
+        Returns
+        -------
+        str
+            TSV data as string, one row per line.
+        """
         headers = {}
         if accept_gzip:
             headers["Accept-Encoding"] = "gzip"
@@ -181,6 +548,7 @@ class RESTClient:
             else:
                 return await response.text()
 
+    @_traced
     async def get_visibility_changes(self, since: datetime) -> str:
         """
         Request observations and targets with visibility changes since a time.
@@ -214,3 +582,75 @@ class RESTClient:
         ) as response:
             response.raise_for_status()
             return await response.text()
+
+    @_traced
+    async def stream_visibility_changes(self, since: datetime) -> AsyncIterator[str]:
+        """
+        Stream ``/scheduler/visibility-changes`` lines as they arrive.
+
+        Unlike :meth:`get_visibility_changes`, the body is never held in memory
+        as a whole; lines are decoded and yielded one at a time.
+
+        Parameters
+        ----------
+        since : datetime
+            Return entities whose visibility-relevant inputs changed at or
+            after this time. Naive datetimes are assumed to be UTC.
+
+        Yields
+        ------
+        str
+            One ``<gid>\\t<iso8601-timestamp>`` line, without the newline.
+
+        Raises
+        ------
+        aiohttp.ClientResponseError
+            For HTTP error responses.
+        aiohttp.ClientError
+            For connection or timeout failures.
+        """
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+
+        session = await self.get_session()
+
+        async with session.get(
+            "/scheduler/visibility-changes",
+            params={"since": since.astimezone(timezone.utc).isoformat()},
+        ) as response:
+            response.raise_for_status()
+            span = current_span()
+            async for raw_line in response.content:
+                # Streamed reads bypass the trace config's body counters.
+                if span is not None:
+                    span.add(SpanAttribute.RESPONSE_BYTES, len(raw_line))
+                yield raw_line.decode("utf-8").rstrip("\r\n")
+
+
+def _chunked(items: list[str], size: int) -> list[list[str]]:
+    """
+    Split a list into consecutive chunks of at most ``size`` items.
+    """
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def _group_atom_rows(body: str) -> dict[str, tuple[str, ...]]:
+    """
+    Group atom digest TSV rows by their observation ID column.
+    """
+    grouped: dict[str, list[str]] = {}
+    for row in body.split("\n"):
+        if not row.strip():
+            continue
+        obs_id, _, _ = row.partition("\t")
+        grouped.setdefault(obs_id, []).append(row)
+    return {obs_id: tuple(rows) for obs_id, rows in grouped.items()}
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """
+    Return whether a request failure is worth retrying.
+    """
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status >= 500
+    return isinstance(exc, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
@@ -2,9 +2,10 @@
 Models and parsers for REST API responses.
 """
 
-__all__ = ["VisibilityChanges", "parse_visibility_changes"]
+__all__ = ["VisibilityChanges", "iter_visibility_changes", "parse_visibility_changes"]
 
 import logging
+from collections.abc import AsyncIterable, AsyncIterator
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -51,39 +52,111 @@ def parse_visibility_changes(body: str) -> VisibilityChanges:
     VisibilityChanges
         Parsed observation/target GIDs and the latest change timestamp.
     """
-    observation_ids: set[str] = set()
-    target_ids: set[str] = set()
-    max_timestamp: datetime | None = None
-
+    accumulator = _VisibilityChangesAccumulator()
     for line in body.splitlines():
+        accumulator.add_line(line)
+    return accumulator.build()
+
+
+async def iter_visibility_changes(
+    lines: AsyncIterable[str], *, batch_size: int = 1000
+) -> AsyncIterator[VisibilityChanges]:
+    """
+    Parse a stream of ``/scheduler/visibility-changes`` lines in batches.
+
+    Lines are parsed with the same rules as :func:`parse_visibility_changes`,
+    but a :class:`VisibilityChanges` is yielded every ``batch_size`` accepted
+    lines, so a long catch-up window never has to be held in memory at once.
+    Each batch's ``max_timestamp`` covers only the lines in that batch.
+
+    Parameters
+    ----------
+    lines : AsyncIterable[str]
+        Response lines, with or without trailing newlines.
+    batch_size : int, default=1000
+        Maximum number of accepted lines per yielded batch.
+
+    Yields
+    ------
+    VisibilityChanges
+        Changes parsed from the next run of lines. Empty batches are not yielded.
+
+    Raises
+    ------
+    ValueError
+        If ``batch_size`` is not positive.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be a positive integer.")
+
+    accumulator = _VisibilityChangesAccumulator()
+    async for line in lines:
+        if accumulator.add_line(line) and accumulator.count >= batch_size:
+            yield accumulator.build()
+            accumulator = _VisibilityChangesAccumulator()
+
+    if accumulator.count:
+        yield accumulator.build()
+
+
+class _VisibilityChangesAccumulator:
+    """
+    Collect parsed visibility-change lines into a ``VisibilityChanges``.
+    """
+
+    def __init__(self) -> None:
+        self.observation_ids: set[str] = set()
+        self.target_ids: set[str] = set()
+        self.max_timestamp: datetime | None = None
+        self.count = 0
+
+    def add_line(self, line: str) -> bool:
+        """
+        Parse one line, returning whether a GID was accepted.
+        """
         line = line.strip()
         if not line:
-            continue
-        gid, _, raw_timestamp = line.partition("\t")
-        gid = gid.strip()
+            return False
+        gid, timestamp = _split_line(line)
 
         if gid.startswith("o-"):
-            observation_ids.add(gid)
+            self.observation_ids.add(gid)
         elif gid.startswith("t-"):
-            target_ids.add(gid)
+            self.target_ids.add(gid)
         else:
             logger.warning(
                 "Skipping visibility-changes line with unknown GID: %r", line
             )
-            continue
+            return False
+        self.count += 1
 
-        try:
-            timestamp = datetime.fromisoformat(
-                raw_timestamp.strip().replace("Z", "+00:00")
-            )
-        except ValueError:
+        if timestamp is None:
             logger.warning("Unparseable timestamp in visibility-changes line: %r", line)
-            continue
-        if max_timestamp is None or timestamp > max_timestamp:
-            max_timestamp = timestamp
-
-    return VisibilityChanges(
-        observation_ids=frozenset(observation_ids),
-        target_ids=frozenset(target_ids),
-        max_timestamp=max_timestamp,
-    )
+            return True
+        if self.max_timestamp is None or timestamp > self.max_timestamp:
+            self.max_timestamp = timestamp
+        return True
+
+    def build(self) -> VisibilityChanges:
+        """
+        Freeze the collected GIDs into a ``VisibilityChanges``.
+        """
+        return VisibilityChanges(
+            observation_ids=frozenset(self.observation_ids),
+            target_ids=frozenset(self.target_ids),
+            max_timestamp=self.max_timestamp,
+        )
+
+
+def _split_line(line: str) -> tuple[str, datetime | None]:
+    """
+    Split a stripped visibility-changes line into its GID and timestamp.
+
+    The timestamp is ``None`` if it cannot be parsed.
+    """
+    gid, _, raw_timestamp = line.partition("\t")
+    try:
+        timestamp = datetime.fromisoformat(raw_timestamp.strip().replace("Z", "+00:00"))
+    except ValueError:
+        timestamp = None
+    return gid.strip(), timestamp
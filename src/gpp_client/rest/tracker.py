@@ -0,0 +1,207 @@
+"""
+Durable polling of the visibility-changes REST endpoint.
+"""
+
+__all__ = ["VisibilityChangeTracker"]
+
+import asyncio
+import json
+import logging
+import os
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+from pathlib import Path
+
+from gpp_client.exceptions import GPPClientError
+from gpp_client.rest.client import RESTClient
+from gpp_client.rest.models import (
+    VisibilityChanges,
+    _split_line,
+    iter_visibility_changes,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class VisibilityChangeTracker:
+    """
+    Poll ``/scheduler/visibility-changes`` and remember where the last poll ended.
+
+    The cursor (the ``since`` of the next request) is stored in a JSON checkpoint
+    file so a restarted worker resumes where it stopped instead of replaying or
+    missing changes. The response is parsed as a stream and handed out in
+    batches of :class:`VisibilityChanges`.
+
+    The cursor only advances after every batch of a response has been consumed,
+    so an abandoned poll is repeated in full: delivery is at-least-once. The
+    endpoint reports changes *at or after* ``since``, so the checkpoint also
+    records the GIDs already delivered at exactly the cursor, and later polls
+    skip them instead of reporting them again.
+
+    Parameters
+    ----------
+    rest : RESTClient
+        The REST client used for requests. It is not closed by the tracker.
+    checkpoint_path : str | Path
+        File holding the cursor. Created on the first advance.
+    interval : float, default=60.0
+        Seconds to wait between polls in :meth:`watch`.
+    start : datetime | None, optional
+        Cursor to use when no checkpoint exists yet. Defaults to the current time,
+        so only changes from now on are reported. Naive datetimes are assumed to
+        be UTC.
+    batch_size : int, default=1000
+        Maximum number of response lines per yielded batch.
+    """
+
+    def __init__(
+        self,
+        rest: RESTClient,
+        checkpoint_path: str | Path,
+        *,
+        interval: float = 60.0,
+        start: datetime | None = None,
+        batch_size: int = 1000,
+    ) -> None:
+        if interval <= 0:
+            raise ValueError("interval must be positive.")
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer.")
+
+        self._rest = rest
+        self.checkpoint_path = Path(checkpoint_path).expanduser()
+        self.interval = interval
+        self.batch_size = batch_size
+
+        cursor, delivered = self._load_checkpoint()
+        if cursor is None:
+            cursor = start if start is not None else datetime.now(timezone.utc)
+        self._cursor = _as_utc(cursor)
+        self._delivered = delivered
+
+    @property
+    def cursor(self) -> datetime:
+        """
+        The ``since`` value the next poll will request.
+
+        Returns
+        -------
+        datetime
+            Timezone-aware UTC cursor.
+        """
+        return self._cursor
+
+    async def poll(self) -> AsyncIterator[VisibilityChanges]:
+        """
+        Request changes since the cursor once and yield them in batches.
+
+        Changes stamped exactly at the cursor that an earlier poll delivered are
+        skipped. The cursor is advanced and checkpointed once the last batch has
+        been consumed; abandoning the iteration early leaves it untouched.
+
+        Yields
+        ------
+        VisibilityChanges
+            The next batch of changed observations and targets.
+
+        Raises
+        ------
+        aiohttp.ClientError
+            For HTTP errors, connection failures, or timeouts.
+        GPPClientError
+            If the checkpoint file cannot be written.
+        """
+        cursor = self._cursor
+        # The latest timestamp seen and the GIDs delivered at it.
+        latest, at_latest = cursor, set(self._delivered)
+
+        async def new_lines() -> AsyncIterator[str]:
+            nonlocal latest, at_latest
+            async for line in self._rest.stream_visibility_changes(cursor):
+                gid, timestamp = _split_line(line.strip())
+                if timestamp is not None:
+                    timestamp = _as_utc(timestamp)
+                    if timestamp == cursor and gid in self._delivered:
+                        continue
+                    if timestamp > latest:
+                        latest, at_latest = timestamp, set()
+                    if timestamp == latest:
+                        at_latest.add(gid)
+                yield line
+
+        lines = new_lines()
+        async for batch in iter_visibility_changes(lines, batch_size=self.batch_size):
+            # Keep atom digest caches coherent with what the caller is told.
+            self._rest.invalidate_atom_digests(batch.observation_ids)
+            yield batch
+
+        if latest > cursor or at_latest != self._delivered:
+            self._advance(latest, at_latest)
+
+    async def watch(self) -> AsyncIterator[VisibilityChanges]:
+        """
+        Poll forever at ``interval`` and yield every batch.
+
+        Yields
+        ------
+        VisibilityChanges
+            The next batch of changed observations and targets.
+
+        Raises
+        ------
+        aiohttp.ClientError
+            For HTTP errors, connection failures, or timeouts.
+        GPPClientError
+            If the checkpoint file cannot be written.
+        """
+        while True:
+            async for batch in self.poll():
+                yield batch
+            await asyncio.sleep(self.interval)
+
+    def _advance(self, cursor: datetime, delivered: set[str]) -> None:
+        """
+        Move the cursor and persist it atomically with the GIDs delivered at it.
+        """
+        cursor = _as_utc(cursor)
+        tmp_path = self.checkpoint_path.with_name(self.checkpoint_path.name + ".tmp")
+        state = {"since": cursor.isoformat(), "delivered": sorted(delivered)}
+        try:
+            self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(state))
+            os.replace(tmp_path, self.checkpoint_path)
+        except OSError as exc:
+            raise GPPClientError(
+                f"Failed to write visibility checkpoint {self.checkpoint_path}: {exc}"
+            ) from exc
+        logger.debug("Visibility cursor advanced to %s", cursor.isoformat())
+        self._cursor = cursor
+        self._delivered = set(delivered)
+
+    def _load_checkpoint(self) -> tuple[datetime | None, set[str]]:
+        """
+        Read the cursor and the GIDs delivered at it from the checkpoint file.
+
+        Without a checkpoint, the cursor is ``None``.
+        """
+        if not self.checkpoint_path.is_file():
+            return None, set()
+        try:
+            data = json.loads(self.checkpoint_path.read_text())
+            delivered = data.get("delivered", [])
+            if not isinstance(delivered, list):
+                raise TypeError("'delivered' must be a list")
+            return datetime.fromisoformat(data["since"]), set(delivered)
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            raise GPPClientError(
+                f"Invalid visibility checkpoint {self.checkpoint_path}: {exc}"
+            ) from exc
+
+
+def _as_utc(value: datetime) -> datetime:
+    """
+    Return a timezone-aware UTC datetime, treating naive values as UTC.
+    """
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
@@ -0,0 +1,153 @@
+"""
+Helpers for streaming request and response bodies to and from disk.
+
+Disk reads and writes run in worker threads so a slow or network filesystem
+does not stall the event loop, and with it every other request, subscription
+heartbeat and timer of the client.
+"""
+
+__all__ = ["AsyncFileWriter", "DEFAULT_CHUNK_SIZE", "ProgressCallback", "iter_file"]
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
+from types import TracebackType
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+ProgressCallback = Callable[[int, int | None], None]
+"""
+Called as ``progress(transferred, total)`` after each chunk, with the bytes
+transferred so far and the total size if it is known.
+"""
+
+
+async def iter_file(
+    path: Path,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress: ProgressCallback | None = None,
+) -> AsyncIterator[bytes]:
+    """
+    Read a file in chunks so it never has to be held in memory at once.
+
+    Each read runs in a worker thread.
+
+    Parameters
+    ----------
+    path : Path
+        The file to read.
+    chunk_size : int, default=1 MB
+        Maximum number of bytes per chunk.
+    progress : ProgressCallback | None, optional
+        Called after each chunk with the bytes read so far and the file size.
+
+    Yields
+    ------
+    bytes
+        The next chunk of the file.
+    """
+    fh = await asyncio.to_thread(path.open, "rb")
+    try:
+        total = (await asyncio.to_thread(path.stat)).st_size
+        sent = 0
+        while chunk := await asyncio.to_thread(fh.read, chunk_size):
+            sent += len(chunk)
+            yield chunk
+            if progress is not None:
+                progress(sent, total)
+    finally:
+        await asyncio.to_thread(fh.close)
+
+
+class AsyncFileWriter:
+    """
+    Write chunks to a file from a worker thread behind a bounded queue.
+
+    :meth:`write` returns as soon as the chunk is queued, so receiving the next
+    chunk overlaps with writing the previous one. Once ``max_pending`` chunks are
+    waiting, :meth:`write` blocks until the disk catches up, which bounds the
+    memory held in the queue.
+
+    Use it as an async context manager; leaving the block flushes the queue and
+    closes the file.
+
+    Parameters
+    ----------
+    path : Path
+        The file to write.
+    mode : str, default="wb"
+        Binary mode to open the file with, ``"wb"`` or ``"ab"``.
+    max_pending : int, default=4
+        Maximum number of chunks queued for writing.
+    """
+
+    def __init__(self, path: Path, mode: str = "wb", *, max_pending: int = 4) -> None:
+        if mode not in ("wb", "ab"):
+            raise ValueError("mode must be 'wb' or 'ab'.")
+        if max_pending < 1:
+            raise ValueError("max_pending must be a positive integer.")
+        self.path = path
+        self.mode = mode
+        self.bytes_written = 0
+
+        self._queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=max_pending)
+        self._error: OSError | None = None
+        self._fh = None
+        self._drain_task: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> "AsyncFileWriter":
+        self._fh = await asyncio.to_thread(self.path.open, self.mode)
+        self._drain_task = asyncio.create_task(self._drain())
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        try:
+            await self._queue.put(None)
+            await self._drain_task
+        finally:
+            if not self._drain_task.done():
+                self._drain_task.cancel()
+            await asyncio.to_thread(self._fh.close)
+
+        if self._error is not None and exc_type is None:
+            raise self._error
+
+    async def write(self, data: bytes) -> None:
+        """
+        Queue a chunk for writing.
+
+        Parameters
+        ----------
+        data : bytes
+            The chunk to append to the file.
+
+        Raises
+        ------
+        OSError
+            If an earlier chunk could not be written.
+        """
+        if self._error is not None:
+            raise self._error
+        await self._queue.put(data)
+
+    async def _drain(self) -> None:
+        """
+        Write queued chunks until the end marker.
+
+        After a failed write the remaining chunks are discarded so producers are
+        never left blocked on a full queue; the error is raised to them instead.
+        """
+        while (chunk := await self._queue.get()) is not None:
+            if self._error is not None:
+                continue
+            try:
+                await asyncio.to_thread(self._fh.write, chunk)
+                self.bytes_written += len(chunk)
+            except OSError as exc:
+                self._error = exc
@@ -3,6 +3,7 @@ Runtime settings for the installed GPP client package.
 """
 
 from pathlib import Path
+from typing import Literal
 
 import typer
 from pydantic import Field, SecretStr
@@ -28,6 +29,16 @@ class GPPSettings(BaseSettings):
       - ``GPP_TOKEN``
       - ``GPP_DEVELOPMENT_TOKEN``
       - ``GPP_DEBUG``
+      - ``GPP_ATOM_DIGEST_CACHE_SIZE``
+      - ``GPP_REST_CONNECTION_LIMIT``
+      - ``GPP_REST_CONNECTION_LIMIT_PER_HOST``
+      - ``GPP_REST_DNS_CACHE_TTL``
+      - ``GPP_REST_KEEPALIVE_TIMEOUT``
+      - ``GPP_COLLECT_METRICS``
+      - ``GPP_METRICS_FILE``
+      - ``GPP_PROFILE_FILE``
+      - ``GPP_MODEL_BACKEND``
+      - ``GPP_BASE_URL_OVERRIDE``
 
     Token resolution behavior:
       - Production package uses ``token``.
@@ -50,12 +61,90 @@ class GPPSettings(BaseSettings):
     debug: bool = Field(
         default=False, description="Whether to enable debug logging for the client."
     )
+    atom_digest_cache_size: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Maximum number of observations whose atom digests are cached between"
+            " requests. 0 disables the cache."
+        ),
+    )
+    rest_connection_limit: int = Field(
+        default=100,
+        ge=0,
+        description="Maximum simultaneous REST connections. 0 means no limit.",
+    )
+    rest_connection_limit_per_host: int = Field(
+        default=0,
+        ge=0,
+        description="Maximum simultaneous REST connections per host. 0 means no limit.",
+    )
+    rest_dns_cache_ttl: int | None = Field(
+        default=10,
+        ge=0,
+        description="Seconds to cache REST DNS lookups. Unset caches them forever.",
+    )
+    rest_keepalive_timeout: float = Field(
+        default=15.0,
+        gt=0,
+        description="Seconds an idle REST connection is kept open for reuse.",
+    )
+    collect_metrics: bool = Field(
+        default=False,
+        description=(
+            "Whether to aggregate operation metrics for 'GPPClient.metrics()'."
+            " Implied by 'metrics_file'. Measuring adds work to every request."
+        ),
+    )
+    metrics_file: Path | None = Field(
+        default=None,
+        description=(
+            "JSON file the client writes its metrics snapshot to when closed,"
+            " for 'gpp stats'."
+        ),
+    )
+    profile_file: Path | None = Field(
+        default=None,
+        description=(
+            "JSON file the client writes a field-cost profile of its GraphQL"
+            " responses to when closed, for 'gpp profile'. Profiling slows"
+            " every response down."
+        ),
+    )
+    model_backend: Literal["pydantic", "msgspec"] = Field(
+        default="pydantic",
+        description=(
+            "Models GraphQL responses are decoded into. 'msgspec' decodes into the"
+            " generated msgspec structs, which is much faster for large responses"
+            " and requires the 'msgspec' extra."
+        ),
+    )
     environment_override: GPPEnvironment | None = Field(
         default=None,
         exclude=True,
         description="Explicit environment override for tooling and codegen.",
     )
 
+    base_url_override: str | None = Field(
+        default=None,
+        exclude=True,
+        description="Explicit service URL for local stand-in servers and benchmarks.",
+    )
+
+    @property
+    def base_url(self) -> str:
+        """
+        Return the URL of the service the client talks to.
+
+        Returns
+        -------
+        str
+            The override if set, otherwise the base URL of the environment.
+        """
+        if self.base_url_override is not None:
+            return self.base_url_override
+        return self.environment.base_url
+
     @property
     def resolved_token(self) -> str:
         """
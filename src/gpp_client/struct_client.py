@@ -0,0 +1,87 @@
+"""
+Traced GraphQL client that decodes responses into msgspec structs.
+
+The codegen writes msgspec equivalents of the generated result models, with the
+same class names, field names and aliases, to ``gpp_client.generated.structs``
+together with :class:`~gpp_client.generated.structs.StructGraphQLClient`, whose
+operation methods decode the response body straight into them instead of
+validating a decoded ``dict`` with Pydantic.
+
+:class:`TracedStructGraphQLClient` adds the spans of
+:class:`~gpp_client.traced_client.TracedGraphQLClient`. msgspec validates while
+it decodes, so the whole decode is recorded as JSON decode time and the
+validation time is close to zero.
+
+This module needs the optional ``msgspec`` dependency.
+"""
+
+__all__ = ["TracedStructGraphQLClient"]
+
+import inspect
+import time
+from typing import TypeVar
+
+import httpx
+import msgspec
+
+from gpp_client.generated.async_base_client import AsyncBaseClient
+from gpp_client.generated.structs import StructGraphQLClient
+from gpp_client.traced_client import (
+    _GRAPHQL_KINDS,
+    TracedGraphQLClient,
+    _trace_operation,
+    _trace_subscription,
+)
+from gpp_client.tracing import ClientHooks, SpanAttribute, current_span
+
+T = TypeVar("T")
+
+
+class TracedStructGraphQLClient(StructGraphQLClient, TracedGraphQLClient):
+    """
+    Struct-decoding GraphQL client with a tracing span around every operation.
+
+    Parameters
+    ----------
+    *args : Any
+        Positional arguments for :class:`TracedGraphQLClient`.
+    **kwargs : Any
+        Keyword arguments for :class:`TracedGraphQLClient`, including ``tracer``.
+    """
+
+    def get_struct(self, response: httpx.Response, type_: type[T]) -> T:
+        span = current_span()
+        if span is None or not span.recording or span.kind not in _GRAPHQL_KINDS:
+            return super().get_struct(response, type_)
+
+        started = time.perf_counter()
+        try:
+            result = super().get_struct(response, type_)
+        finally:
+            span._decoded_at = time.perf_counter()
+            span.add(SpanAttribute.JSON_DECODE_TIME, span._decoded_at - started)
+        if self._wants_responses():
+            # Builtins use the encoded names, so hooks get the response's data.
+            self._dispatch_response(span, msgspec.to_builtins(result))
+        return result
+
+    def _wants_responses(self) -> bool:
+        """
+        Return whether a hook overrides :meth:`ClientHooks.on_response`.
+
+        Structs are only converted back to builtins for such hooks.
+        """
+        return any(
+            type(hook).on_response is not ClientHooks.on_response
+            for hook in self.tracer.hooks
+        )
+
+
+# Wrap the struct client's operations like those of the traced client.
+for _name, _member in vars(StructGraphQLClient).items():
+    if _name.startswith("_") or hasattr(AsyncBaseClient, _name):
+        continue
+    if inspect.isasyncgenfunction(_member):
+        setattr(TracedStructGraphQLClient, _name, _trace_subscription(_member))
+    elif inspect.iscoroutinefunction(_member):
+        setattr(TracedStructGraphQLClient, _name, _trace_operation(_member))
@@ -0,0 +1,25 @@
+"""
+Local stand-ins for the GPP services, for tests and benchmarks.
+"""
+
+from .catalog import SyntheticCatalog, generate_catalog
+from .cassette import Cassette, HTTPExchange, WebSocketFrame, WebSocketSession
+from .mock_server import MockGPPServer, Resolver
+from .payloads import build_payload
+from .replay import RecordingProxy, ReplayServer
+from .stub_server import StubGPPServer
+
+__all__ = [
+    "Cassette",
+    "HTTPExchange",
+    "MockGPPServer",
+    "RecordingProxy",
+    "ReplayServer",
+    "Resolver",
+    "StubGPPServer",
+    "SyntheticCatalog",
+    "WebSocketFrame",
+    "WebSocketSession",
+    "build_payload",
+    "generate_catalog",
+]
@@ -0,0 +1,78 @@
+"""
+Lifecycle shared by the local servers in :mod:`gpp_client.testing`.
+"""
+
+from typing_extensions import Self
+
+from aiohttp import web
+
+
+class _LocalServer:
+    """
+    An ``aiohttp`` application listening on localhost.
+
+    Subclasses add their routes in :meth:`_add_routes`.
+
+    Parameters
+    ----------
+    host : str
+        Interface to listen on.
+    port : int
+        Port to listen on. 0 picks a free port.
+    """
+
+    _name = "server"
+
+    def __init__(self, *, host: str, port: int) -> None:
+        self.host = host
+        self.port = port
+        self._runner: web.AppRunner | None = None
+
+    @property
+    def base_url(self) -> str:
+        """
+        URL of the running server.
+
+        Returns
+        -------
+        str
+            Base URL to pass to ``GPPClient(base_url=...)``.
+
+        Raises
+        ------
+        RuntimeError
+            If the server has not been started.
+        """
+        if self._runner is None:
+            raise RuntimeError(f"The {self._name} is not running.")
+        return f"http://{self.host}:{self.port}"
+
+    def _add_routes(self, app: web.Application) -> None:
+        raise NotImplementedError
+
+    async def start(self) -> None:
+        """
+        Start listening. The port is assigned if it was 0.
+        """
+        app = web.Application(client_max_size=1024**3)
+        self._add_routes(app)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """
+        Stop the server and drop open connections.
+        """
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
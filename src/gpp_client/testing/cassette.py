@@ -0,0 +1,248 @@
+"""
+Recorded GPP traffic for offline replay.
+
+A :class:`Cassette` holds the HTTP exchanges and WebSocket sessions seen by a
+:class:`~gpp_client.testing.RecordingProxy`, byte for byte as they went over the
+wire, with their timings. It is stored as JSON lines, one exchange or session
+per line, and gzip-compressed when the file name ends in ``.gz``. Request
+headers are not recorded and the ``connection_init`` payload, which carries the
+token, is dropped, so cassettes hold no credentials.
+"""
+
+__all__ = ["Cassette", "HTTPExchange", "WebSocketFrame", "WebSocketSession"]
+
+import base64
+import gzip
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class HTTPExchange:
+    """
+    One HTTP request and its response.
+
+    Attributes
+    ----------
+    method : str
+        Request method.
+    path : str
+        Request path with its query string, as sent.
+    request_body : bytes
+        Request body.
+    status : int
+        Response status code.
+    headers : tuple[tuple[str, str], ...]
+        Response headers, without hop-by-hop and length headers.
+    body : bytes
+        Response body as received, still compressed if it was sent compressed.
+    elapsed : float
+        Seconds from sending the request to receiving the whole response.
+    """
+
+    method: str
+    path: str
+    request_body: bytes
+    status: int
+    headers: tuple[tuple[str, str], ...] = ()
+    body: bytes = b""
+    elapsed: float = 0.0
+
+
+@dataclass(frozen=True)
+class WebSocketFrame:
+    """
+    One WebSocket message.
+
+    Attributes
+    ----------
+    from_client : bool
+        Whether the client sent the message; otherwise the server did.
+    offset : float
+        Seconds since the connection was opened.
+    data : str | bytes
+        Message content: ``str`` for text frames, ``bytes`` for binary frames.
+    """
+
+    from_client: bool
+    offset: float
+    data: str | bytes
+
+
+@dataclass(frozen=True)
+class WebSocketSession:
+    """
+    The messages of one WebSocket connection.
+
+    Attributes
+    ----------
+    path : str
+        Request path of the connection.
+    protocol : str | None
+        Negotiated subprotocol, e.g. ``"graphql-transport-ws"``.
+    frames : tuple[WebSocketFrame, ...]
+        Messages in the order they were seen.
+    """
+
+    path: str
+    protocol: str | None = None
+    frames: tuple[WebSocketFrame, ...] = ()
+
+
+@dataclass
+class Cassette:
+    """
+    HTTP exchanges and WebSocket sessions recorded from the GPP services.
+
+    Attributes
+    ----------
+    exchanges : list[HTTPExchange]
+        HTTP exchanges in the order they completed.
+    sessions : list[WebSocketSession]
+        WebSocket sessions in the order they closed.
+    """
+
+    exchanges: list[HTTPExchange] = field(default_factory=list)
+    sessions: list[WebSocketSession] = field(default_factory=list)
+
+    def save(self, path: str | Path) -> None:
+        """
+        Write the cassette to a file.
+
+        Parameters
+        ----------
+        path : str | Path
+            Destination. Compressed with gzip if the name ends in ``.gz``.
+        """
+        lines = [json.dumps({"version": _FORMAT_VERSION})]
+        lines.extend(json.dumps(_dump_exchange(item)) for item in self.exchanges)
+        lines.extend(json.dumps(_dump_session(item)) for item in self.sessions)
+        content = ("\n".join(lines) + "\n").encode("utf-8")
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == ".gz":
+            content = gzip.compress(content)
+        path.write_bytes(content)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Cassette":
+        """
+        Read a cassette written by :meth:`save`.
+
+        Parameters
+        ----------
+        path : str | Path
+            Cassette file. Decompressed with gzip if the name ends in ``.gz``.
+
+        Returns
+        -------
+        Cassette
+            The recorded exchanges and sessions.
+
+        Raises
+        ------
+        ValueError
+            If the file is not a cassette of a supported version.
+        """
+        path = Path(path)
+        content = path.read_bytes()
+        if path.suffix == ".gz":
+            content = gzip.decompress(content)
+
+        header, *records = (
+            json.loads(line) for line in content.decode("utf-8").splitlines() if line
+        )
+        if header.get("version") != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported cassette version in {path}.")
+
+        cassette = cls()
+        for record in records:
+            if record["type"] == "http":
+                cassette.exchanges.append(_load_exchange(record))
+            elif record["type"] == "ws":
+                cassette.sessions.append(_load_session(record))
+            else:
+                raise ValueError(f"Unknown cassette record type {record['type']!r}.")
+        return cassette
+
+
+def _dump_bytes(data: bytes) -> dict[str, str]:
+    """
+    Store bytes as text when they are UTF-8, which keeps cassettes readable.
+    """
+    try:
+        return {"text": data.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"base64": base64.b64encode(data).decode("ascii")}
+
+
+def _load_bytes(stored: dict[str, str]) -> bytes:
+    """
+    Restore bytes stored by :func:`_dump_bytes`.
+    """
+    if "base64" in stored:
+        return base64.b64decode(stored["base64"])
+    return stored["text"].encode("utf-8")
+
+
+def _dump_exchange(exchange: HTTPExchange) -> dict[str, Any]:
+    return {
+        "type": "http",
+        "method": exchange.method,
+        "path": exchange.path,
+        "request_body": _dump_bytes(exchange.request_body),
+        "status": exchange.status,
+        "headers": [list(header) for header in exchange.headers],
+        "body": _dump_bytes(exchange.body),
+        "elapsed": exchange.elapsed,
+    }
+
+
+def _load_exchange(record: dict[str, Any]) -> HTTPExchange:
+    return HTTPExchange(
+        method=record["method"],
+        path=record["path"],
+        request_body=_load_bytes(record["request_body"]),
+        status=record["status"],
+        headers=tuple((name, value) for name, value in record["headers"]),
+        body=_load_bytes(record["body"]),
+        elapsed=record["elapsed"],
+    )
+
+
+def _dump_session(session: WebSocketSession) -> dict[str, Any]:
+    frames = []
+    for frame in session.frames:
+        data = (
+            {"text": frame.data}
+            if isinstance(frame.data, str)
+            else {"base64": base64.b64encode(frame.data).decode("ascii")}
+        )
+        frames.append({"from_client": frame.from_client, "at": frame.offset, **data})
+    return {
+        "type": "ws",
+        "path": session.path,
+        "protocol": session.protocol,
+        "frames": frames,
+    }
+
+
+def _load_session(record: dict[str, Any]) -> WebSocketSession:
+    frames = tuple(
+        WebSocketFrame(
+            from_client=frame["from_client"],
+            offset=frame["at"],
+            data=(
+                frame["text"] if "text" in frame else base64.b64decode(frame["base64"])
+            ),
+        )
+        for frame in record["frames"]
+    )
+    return WebSocketSession(
+        path=record["path"], protocol=record["protocol"], frames=frames
+    )
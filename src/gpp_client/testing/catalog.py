@@ -0,0 +1,370 @@
+"""
+Synthetic GPP catalogs for scale testing.
+
+:func:`generate_catalog` builds programs with nested group trees, their
+observations, targets, atom digests and visibility changes at any scale, from
+templates of the generated models. The payloads are in the wire format the
+services return and validate against the generated models. Load a catalog into
+a :class:`~gpp_client.testing.StubGPPServer` with :meth:`SyntheticCatalog.serve`.
+"""
+
+__all__ = ["SyntheticCatalog", "generate_catalog"]
+
+import random
+import re
+from dataclasses import dataclass
+from typing import Any
+
+from gpp_client.generated import (
+    GetObservations,
+    GetSchedulerAllProgramsId,
+    GetSchedulerPrograms,
+    ObservingModeType,
+)
+from gpp_client.testing.payloads import build_payload
+from gpp_client.testing.stub_server import StubGPPServer
+
+# Observing mode details whose name does not spell out their mode type.
+_MODE_TYPES = {
+    "gnirsSpectroscopy": ObservingModeType.GNIRS_LONG_SLIT,
+    "visitor": ObservingModeType.VISITOR_NORTH,
+}
+_OBSERVE_CLASSES = ("SCIENCE", "PROGRAM_CAL", "PARTNER_CAL", "NIGHT_CAL")
+
+
+@dataclass(frozen=True)
+class SyntheticCatalog:
+    """
+    Generated programs and everything the scheduler fetches for them.
+
+    Payloads are plain JSON-compatible values in the services' wire format.
+    Observations share their nested values, such as observing mode details, so
+    treat the payloads as read-only.
+
+    Attributes
+    ----------
+    programs : list[dict[str, Any]]
+        ``GetSchedulerPrograms`` matches, with their flat ``allGroupElements``.
+    observations : dict[str, dict[str, Any]]
+        ``getObservations`` matches, keyed by observation ID.
+    targets : dict[str, dict[str, Any]]
+        Sidereal targets as they appear in observation asterisms, keyed by
+        target ID.
+    atom_digests : dict[str, list[str]]
+        Tab-separated ``/scheduler/atoms`` rows, keyed by observation ID.
+    visibility_changes : str
+        Body of ``/scheduler/visibility-changes``.
+    """
+
+    programs: list[dict[str, Any]]
+    observations: dict[str, dict[str, Any]]
+    targets: dict[str, dict[str, Any]]
+    atom_digests: dict[str, list[str]]
+    visibility_changes: str
+
+    @property
+    def program_ids(self) -> list[str]:
+        """
+        IDs of the programs, in order.
+
+        Returns
+        -------
+        list[str]
+            Program IDs.
+        """
+        return [program["id"] for program in self.programs]
+
+    def serve(self, server: StubGPPServer) -> None:
+        """
+        Answer the scheduler's queries and REST calls from this catalog.
+
+        Installs responses for ``GetSchedulerAllProgramsId``,
+        ``GetSchedulerPrograms`` and ``getObservations`` filtered by their ID
+        variables, and the atom digests and visibility changes.
+
+        Parameters
+        ----------
+        server : StubGPPServer
+            Server to load the catalog into.
+        """
+        programs = {program["id"]: program for program in self.programs}
+        id_template = build_payload(GetSchedulerAllProgramsId, fill_optional=False)
+        id_match = id_template["programs"]["matches"][0]
+
+        def get_programs(variables: dict[str, Any]) -> dict[str, Any]:
+            wanted = variables.get("programsList") or programs
+            return {"programs": {"matches": [programs[pid] for pid in wanted]}}
+
+        def get_observations(variables: dict[str, Any]) -> dict[str, Any]:
+            wanted = variables["WHERE"]["id"]["IN"]
+            return {
+                "observations": {
+                    "hasMore": False,
+                    "matches": [
+                        self.observations[oid]
+                        for oid in wanted
+                        if oid in self.observations
+                    ],
+                }
+            }
+
+        server.graphql["GetSchedulerAllProgramsId"] = {
+            "programs": {
+                "matches": [{**id_match, "id": pid} for pid in self.program_ids]
+            }
+        }
+        server.graphql["GetSchedulerPrograms"] = get_programs
+        server.graphql["getObservations"] = get_observations
+        server.atom_digests.update(self.atom_digests)
+        server.visibility_changes = self.visibility_changes
+
+
+def generate_catalog(
+    *,
+    programs: int = 100,
+    observations_per_program: int = 20,
+    group_depth: int = 3,
+    group_fanout: int = 2,
+    atoms_per_observation: int = 3,
+    changed_fraction: float = 0.1,
+    seed: int = 0,
+) -> SyntheticCatalog:
+    """
+    Generate a synthetic catalog.
+
+    Each program holds a tree of groups ``group_depth`` levels deep with
+    ``group_fanout`` subgroups per group, and its observations are spread over
+    the leaf groups. Observations cycle through every observing mode the
+    generated models know and each has its own sidereal target.
+
+    Parameters
+    ----------
+    programs : int, default=100
+        Number of programs.
+    observations_per_program : int, default=20
+        Observations in each program.
+    group_depth : int, default=3
+        Levels of nested groups. 0 places observations at the program root.
+    group_fanout : int, default=2
+        Subgroups per group.
+    atoms_per_observation : int, default=3
+        Atom digest rows per observation.
+    changed_fraction : float, default=0.1
+        Fraction of observations and targets listed in the visibility changes.
+    seed : int, default=0
+        Seed for coordinates, atom durations and visibility changes, so equal
+        arguments give equal catalogs.
+
+    Returns
+    -------
+    SyntheticCatalog
+        The generated catalog. 10,000 programs of 20 observations take a few
+        gigabytes of memory.
+
+    Raises
+    ------
+    ValueError
+        If a count is negative, ``group_fanout`` is below 1 or
+        ``changed_fraction`` is outside ``[0, 1]``.
+    """
+    counts = (programs, observations_per_program, group_depth, atoms_per_observation)
+    if min(counts) < 0 or group_fanout < 1:
+        raise ValueError("Counts must not be negative and group_fanout must be >= 1.")
+    if not 0 <= changed_fraction <= 1:
+        raise ValueError("changed_fraction must be between 0 and 1.")
+
+    rng = random.Random(seed)
+    templates = _Templates()
+    modes = templates.observing_modes()
+
+    program_payloads = []
+    observations: dict[str, dict[str, Any]] = {}
+    targets: dict[str, dict[str, Any]] = {}
+    atom_digests: dict[str, list[str]] = {}
+    for program_index in range(programs):
+        program_id = f"p-{program_index:x}"
+        elements, leaves = templates.group_tree(program_id, group_depth, group_fanout)
+        for index in range(observations_per_program):
+            serial = program_index * observations_per_program + index
+            obs_id, target_id = f"o-{serial:x}", f"t-{serial:x}"
+            parent_id = leaves[index % len(leaves)]
+            elements.append(templates.observation_element(obs_id, parent_id))
+            targets[target_id] = templates.target(target_id, rng)
+            observations[obs_id] = templates.observation(
+                obs_id, program_id, modes[serial % len(modes)], targets[target_id]
+            )
+            atom_digests[obs_id] = _atom_rows(obs_id, atoms_per_observation, rng)
+        program_payloads.append(templates.program(program_id, elements))
+
+    return SyntheticCatalog(
+        programs=program_payloads,
+        observations=observations,
+        targets=targets,
+        atom_digests=atom_digests,
+        visibility_changes=_visibility_changes(
+            [*observations, *targets], changed_fraction, rng
+        ),
+    )
+
+
+class _Templates:
+    """
+    Minimal payloads of the generated models, copied and filled per item.
+    """
+
+    def __init__(self) -> None:
+        program = build_payload(GetSchedulerPrograms, fill_optional=False)
+        self._program = program["programs"]["matches"][0]
+        full_program = build_payload(GetSchedulerPrograms)["programs"]["matches"][0]
+        element = full_program["allGroupElements"][0]
+        self._group = {**element["group"], "minimumInterval": None}
+        self._group["maximumInterval"] = None
+        self._observation_ref = element["observation"]
+
+        observation = build_payload(GetObservations, fill_optional=False)
+        self._observation = observation["observations"]["matches"][0]
+        self._full_observation = build_payload(GetObservations)["observations"][
+            "matches"
+        ][0]
+
+    def observing_modes(self) -> list[dict[str, Any]]:
+        """
+        One observing mode per details field, with only that field set.
+        """
+        full_mode = self._full_observation["observingMode"]
+        details = [key for key, value in full_mode.items() if isinstance(value, dict)]
+        modes = []
+        for key in details:
+            mode = dict.fromkeys(details)
+            mode[key] = full_mode[key]
+            mode_type = _MODE_TYPES.get(key) or ObservingModeType(_snake_upper(key))
+            modes.append({**full_mode, **mode, "mode": mode_type.value})
+        return modes
+
+    def group_tree(
+        self, program_id: str, depth: int, fanout: int
+    ) -> tuple[list[dict[str, Any]], list[str | None]]:
+        """
+        Group elements of a full tree and the IDs of its leaf groups.
+        """
+        elements = []
+        level: list[str | None] = [None]
+        for depth_index in range(depth):
+            next_level = []
+            for parent_id in level:
+                for index in range(fanout):
+                    group_id = f"g-{program_id[2:]}-{len(elements):x}"
+                    group = {
+                        **self._group,
+                        "id": group_id,
+                        "name": f"Group {depth_index}.{index}",
+                        "parentId": parent_id,
+                        "parentIndex": index,
+                    }
+                    elements.append(
+                        {
+                            "parentGroupId": parent_id,
+                            "group": group,
+                            "observation": None,
+                        }
+                    )
+                    next_level.append(group_id)
+            level = next_level
+        return elements, level
+
+    def observation_element(self, obs_id: str, parent_id: str | None) -> dict:
+        return {
+            "parentGroupId": parent_id,
+            "group": None,
+            "observation": {
+                **self._observation_ref,
+                "id": obs_id,
+                "groupId": parent_id,
+            },
+        }
+
+    def program(self, program_id: str, elements: list[dict]) -> dict[str, Any]:
+        return {
+            **self._program,
+            "id": program_id,
+            "name": f"Synthetic program {program_id}",
+            "type": "SCIENCE",
+            "proposalStatus": "ACCEPTED",
+            "active": {"start": "2000-01-01", "end": "2099-12-31"},
+            "allGroupElements": elements,
+        }
+
+    def target(self, target_id: str, rng: random.Random) -> dict[str, Any]:
+        ra, dec = rng.uniform(0, 360), rng.uniform(-90, 90)
+        sidereal = self._full_observation["targetEnvironment"]["asterism"][0]
+        return {
+            **sidereal,
+            "name": target_id,
+            "sidereal": {
+                "ra": {"hours": ra / 15, "hms": _sexagesimal(ra / 15), "degrees": ra},
+                "dec": {"degrees": dec, "dms": _sexagesimal(dec, signed=True)},
+                "epoch": "J2000.000",
+            },
+            "nonsidereal": None,
+        }
+
+    def observation(
+        self,
+        obs_id: str,
+        program_id: str,
+        mode: dict[str, Any],
+        target: dict[str, Any],
+    ) -> dict[str, Any]:
+        return {
+            **self._observation,
+            "id": obs_id,
+            "title": f"Synthetic observation {obs_id}",
+            "program": {**self._observation["program"], "id": program_id},
+            "observingMode": mode,
+            "targetEnvironment": {"asterism": [target], "explicitBase": None},
+        }
+
+
+def _snake_upper(name: str) -> str:
+    """
+    Convert a camel-case field name such as ``flamingos2LongSlit`` to
+    ``FLAMINGOS_2_LONG_SLIT``.
+    """
+    return re.sub(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[a-z])(?=[0-9])", "_", name).upper()
+
+
+def _sexagesimal(value: float, *, signed: bool = False) -> str:
+    """
+    Format degrees or hours as ``[+-]DD:MM:SS.SSS``.
+    """
+    sign = "-" if value < 0 else "+"
+    value = abs(value)
+    whole, minutes = int(value), (value % 1) * 60
+    text = f"{whole:02d}:{int(minutes):02d}:{(minutes % 1) * 60:06.3f}"
+    return sign + text if signed else text
+
+
+def _atom_rows(obs_id: str, count: int, rng: random.Random) -> list[str]:
+    """
+    ``/scheduler/atoms`` rows for one observation.
+    """
+    rows = []
+    for index in range(count):
+        observe_class = _OBSERVE_CLASSES[index % len(_OBSERVE_CLASSES)]
+        seconds = rng.randint(30, 1800)
+        rows.append(
+            f"{obs_id}\t{index}\t{obs_id}-a{index:x}\t{observe_class}\t{seconds}"
+            f"\tSCIENCE\tNONE\t{index}\t{count}"
+        )
+    return rows
+
+
+def _visibility_changes(ids: list[str], fraction: float, rng: random.Random) -> str:
+    """
+    A visibility changes body listing a random share of ``ids``.
+    """
+    lines = []
+    for gid in sorted(rng.sample(ids, round(len(ids) * fraction))):
+        minute = rng.randrange(24 * 60)
+        lines.append(f"{gid}\t2026-01-01T{minute // 60:02d}:{minute % 60:02d}:00Z")
+    return "\n".join(lines)
@@ -0,0 +1,597 @@
+"""
+Schema-backed local stand-in for the GPP services.
+
+:class:`MockGPPServer` executes GraphQL operations with ``graphql-core`` against
+a checked-in schema, such as ``graphql/schemas/development.graphql``, instead of
+answering them from canned responses. Programs, observations and targets live in
+memory and the default resolvers select, create, update and clone them. Edits are
+published to the matching subscriptions. Any field can be given its own resolver.
+"""
+
+__all__ = ["MockGPPServer", "Resolver"]
+
+import asyncio
+import functools
+import itertools
+import re
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from aiohttp import web
+from graphql import (
+    GraphQLEnumType,
+    GraphQLError,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLResolveInfo,
+    GraphQLScalarType,
+    build_ast_schema,
+    default_field_resolver,
+    graphql,
+    parse,
+    subscribe,
+    validate,
+)
+from graphql.language import DocumentNode
+
+from gpp_client.testing.catalog import SyntheticCatalog
+from gpp_client.testing.stub_server import StubGPPServer
+
+Resolver = Callable[..., Any]
+"""
+A ``graphql-core`` resolver, called as ``resolver(source, info, **arguments)``.
+
+Subscription resolvers return an async iterator of events. ``info.context`` is the
+:class:`MockGPPServer`.
+"""
+
+_PLACEHOLDERS = {"Boolean": False, "Int": 0, "Float": 0.0}
+_CLOSE_TIMEOUT = 1.0
+# WHERE keys filtering on a nested value rather than a field of the same name.
+_WHERE_PATHS = {"activeStart": ("active", "start"), "activeEnd": ("active", "end")}
+
+
+@dataclass(frozen=True)
+class _Collection:
+    """
+    Names of the schema fields serving one kind of record.
+    """
+
+    plural: str
+    singular: str
+    prefix: str
+
+    @property
+    def id_key(self) -> str:
+        return f"{self.singular}Id"
+
+    @property
+    def title(self) -> str:
+        return self.singular[0].upper() + self.singular[1:]
+
+
+_COLLECTIONS = (
+    _Collection("programs", "program", "p"),
+    _Collection("observations", "observation", "o"),
+    _Collection("targets", "target", "t"),
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_schema(path: Path) -> DocumentNode:
+    """
+    Parse a schema file once; schemas are built from it per server.
+    """
+    return parse(path.read_text())
+
+
+class MockGPPServer(StubGPPServer):
+    """
+    Execute GPP GraphQL operations against a schema and in-memory records.
+
+    Queries, mutations and ``graphql-transport-ws`` subscriptions are validated
+    and executed against the schema. The REST endpoints and any canned
+    responses work as in :class:`StubGPPServer`; canned responses take
+    precedence over execution for their operation names.
+
+    Fields of a record that are not stored resolve to a placeholder valid for
+    their type: ``null`` when nullable, otherwise an empty value or the first
+    enum value. Closing the server completes open subscriptions.
+
+    Parameters
+    ----------
+    schema : str | Path
+        Path of the GraphQL schema to serve.
+    catalog : SyntheticCatalog | None, optional
+        Records, atom digests and visibility changes to start with.
+    resolvers : dict[str, Resolver] | None, optional
+        Resolvers keyed by ``"Type.field"``, e.g. ``"Mutation.createProgram"``.
+        They replace the default resolvers.
+    latency : float, default=0.0
+        Seconds each response is delayed.
+    host : str, default="127.0.0.1"
+        Interface to listen on.
+    port : int, default=0
+        Port to listen on. 0 picks a free port.
+
+    Attributes
+    ----------
+    programs : dict[str, dict[str, Any]]
+        Programs in wire format, keyed by ID.
+    observations : dict[str, dict[str, Any]]
+        Observations in wire format, keyed by ID.
+    targets : dict[str, dict[str, Any]]
+        Targets in wire format, keyed by ID.
+    schema : GraphQLSchema
+        The executable schema.
+    """
+
+    _name = "mock server"
+
+    def __init__(
+        self,
+        schema: str | Path,
+        *,
+        catalog: SyntheticCatalog | None = None,
+        resolvers: dict[str, Resolver] | None = None,
+        latency: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        super().__init__(latency=latency, host=host, port=port)
+        self.programs: dict[str, dict[str, Any]] = {}
+        self.observations: dict[str, dict[str, Any]] = {}
+        self.targets: dict[str, dict[str, Any]] = {}
+        self._ids = itertools.count(1)
+        self._subscribers: dict[str, set[asyncio.Queue]] = {}
+        self._connections: set[asyncio.Task] = set()
+
+        if catalog is not None:
+            self.programs.update(
+                (program["id"], program) for program in catalog.programs
+            )
+            self.observations.update(catalog.observations)
+            self.targets.update(
+                (target_id, {**target, "id": target_id})
+                for target_id, target in catalog.targets.items()
+            )
+            self.atom_digests.update(catalog.atom_digests)
+            self.visibility_changes = catalog.visibility_changes
+
+        self.schema = build_ast_schema(_parse_schema(Path(schema).resolve()))
+        for name, resolver in {
+            **self._default_resolvers(),
+            **(resolvers or {}),
+        }.items():
+            self._install(name, resolver)
+
+    def publish(self, field: str, event: dict[str, Any]) -> None:
+        """
+        Send an event to the open subscriptions of a field.
+
+        Parameters
+        ----------
+        field : str
+            Subscription field, e.g. ``"obscalcUpdate"``.
+        event : dict[str, Any]
+            The event in wire format, e.g. ``{"editType": "UPDATED",
+            "observationId": "o-1", "value": {...}}``.
+        """
+        for queue in self._subscribers.get(field, ()):
+            queue.put_nowait(event)
+
+    async def close(self) -> None:
+        # Complete open subscriptions and let clients close their connections.
+        for queues in self._subscribers.values():
+            for queue in queues:
+                queue.put_nowait(None)
+        if self._connections:
+            await asyncio.wait(self._connections, timeout=_CLOSE_TIMEOUT)
+        await super().close()
+
+    async def _handle_ws(self, request: web.Request) -> web.WebSocketResponse:
+        task = asyncio.current_task()
+        self._connections.add(task)
+        try:
+            return await super()._handle_ws(request)
+        finally:
+            self._connections.discard(task)
+
+    async def _handle_graphql(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        name = body.get("operationName")
+        if name in self.graphql:
+            return await super()._handle_graphql(request)
+
+        await self._delay("graphql")
+        result = await graphql(
+            self.schema,
+            body["query"],
+            variable_values=body.get("variables"),
+            operation_name=name,
+            context_value=self,
+            field_resolver=_resolve_field,
+        )
+        return web.json_response(result.formatted)
+
+    async def _stream(
+        self, websocket: web.WebSocketResponse, frame: dict[str, Any]
+    ) -> None:
+        payload = frame.get("payload", {})
+        if payload.get("operationName") in self.subscriptions:
+            return await super()._stream(websocket, frame)
+
+        operation_id = frame["id"]
+        try:
+            document = parse(payload["query"])
+        except GraphQLError as exc:
+            errors = [exc.formatted]
+        else:
+            errors = [error.formatted for error in validate(self.schema, document)]
+        if errors:
+            await websocket.send_json(
+                {"type": "error", "id": operation_id, "payload": errors}
+            )
+            return
+
+        results = await subscribe(
+            self.schema,
+            document,
+            variable_values=payload.get("variables"),
+            operation_name=payload.get("operationName"),
+            context_value=self,
+            field_resolver=_resolve_field,
+        )
+        if not isinstance(results, AsyncIterator):
+            await websocket.send_json(
+                {
+                    "type": "error",
+                    "id": operation_id,
+                    "payload": results.formatted.get("errors", []),
+                }
+            )
+            return
+        try:
+            async for result in results:
+                await websocket.send_json(
+                    {"type": "next", "id": operation_id, "payload": result.formatted}
+                )
+        finally:
+            await results.aclose()
+        await websocket.send_json({"type": "complete", "id": operation_id})
+
+    def _install(self, name: str, resolver: Resolver) -> None:
+        """
+        Set the resolver of a ``"Type.field"``.
+        """
+        field = self._field(name)
+        if field is None:
+            raise ValueError(f"The schema has no field {name!r}.")
+        if name.startswith("Subscription."):
+            field.subscribe = resolver
+            field.resolve = lambda event, info, **arguments: event
+        else:
+            field.resolve = resolver
+
+    def _default_resolvers(self) -> dict[str, Resolver]:
+        """
+        Resolvers over the in-memory records, for the fields the schema has.
+        """
+        resolvers: dict[str, Resolver] = {}
+        for collection in _COLLECTIONS:
+            title = collection.title
+            for name, method in (
+                (f"Query.{collection.plural}", self._select),
+                (f"Query.{collection.singular}", self._get),
+                (f"Mutation.update{title}s", self._update),
+                (f"Mutation.create{title}", self._create),
+                (f"Mutation.clone{title}", self._clone),
+            ):
+                resolvers[name] = functools.partial(method, collection)
+        for field in ("programEdit", "observationEdit", "targetEdit", "obscalcUpdate"):
+            resolvers[f"Subscription.{field}"] = functools.partial(self._events, field)
+        return {
+            name: resolver
+            for name, resolver in resolvers.items()
+            if self._field(name) is not None
+        }
+
+    def _field(self, name: str) -> Any:
+        """
+        Return the schema field of a ``"Type.field"``, if it exists.
+        """
+        type_name, _, field_name = name.partition(".")
+        parent = self.schema.get_type(type_name)
+        if isinstance(parent, GraphQLObjectType):
+            return parent.fields.get(field_name)
+        return None
+
+    def _records(self, collection: _Collection) -> dict[str, dict[str, Any]]:
+        return getattr(self, collection.plural)
+
+    def _select(
+        self,
+        collection: _Collection,
+        source: Any,
+        info: GraphQLResolveInfo,
+        *,
+        WHERE: dict | None = None,  # noqa: N803
+        OFFSET: str | None = None,  # noqa: N803
+        LIMIT: int | None = None,  # noqa: N803
+        includeDeleted: bool = False,  # noqa: N803
+    ) -> dict[str, Any]:
+        matches = self._where(collection, WHERE, includeDeleted)
+        if OFFSET is not None:
+            matches = [record for record in matches if record["id"] >= OFFSET]
+        has_more = LIMIT is not None and len(matches) > LIMIT
+        return {"matches": matches[:LIMIT], "hasMore": has_more}
+
+    def _get(
+        self,
+        collection: _Collection,
+        source: Any,
+        info: GraphQLResolveInfo,
+        **arguments: Any,
+    ) -> dict[str, Any] | None:
+        return self._find(collection, arguments)
+
+    def _update(
+        self,
+        collection: _Collection,
+        source: Any,
+        info: GraphQLResolveInfo,
+        *,
+        input: dict[str, Any],  # noqa: A002
+    ) -> dict[str, Any]:
+        matches = self._where(
+            collection, input.get("WHERE"), input.get("includeDeleted", False)
+        )
+        limit = input.get("LIMIT")
+        updated = [
+            self._save(collection, record, input["SET"]) for record in matches[:limit]
+        ]
+        has_more = limit is not None and len(matches) > limit
+        return {collection.plural: updated, "hasMore": has_more}
+
+    def _create(
+        self,
+        collection: _Collection,
+        source: Any,
+        info: GraphQLResolveInfo,
+        *,
+        input: dict[str, Any],  # noqa: A002
+    ) -> dict[str, Any]:
+        record = {
+            "id": f"{collection.prefix}-mock-{next(self._ids):x}",
+            "existence": "PRESENT",
+        }
+        if input.get("programId") is not None:
+            record["program"] = {"id": input["programId"]}
+        record = self._save(collection, record, input.get("SET") or {}, "CREATED")
+        return {collection.singular: record}
+
+    def _clone(
+        self,
+        collection: _Collection,
+        source: Any,
+        info: GraphQLResolveInfo,
+        *,
+        input: dict[str, Any],  # noqa: A002
+    ) -> dict[str, Any]:
+        original = self._find(collection, input)
+        if original is None:
+            raise ValueError(f"No such {collection.singular}.")
+        record = {**original, "id": f"{collection.prefix}-mock-{next(self._ids):x}"}
+        record = self._save(collection, record, input.get("SET") or {}, "CREATED")
+        return {
+            f"original{collection.title}": original,
+            f"new{collection.title}": record,
+        }
+
+    async def _events(
+        self,
+        field: str,
+        source: Any,
+        info: GraphQLResolveInfo,
+        *,
+        input: dict[str, Any] | None = None,  # noqa: A002
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Yield the events published to ``field`` that match the input filter,
+        until the server closes.
+        """
+        queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+        self._subscribers.setdefault(field, set()).add(queue)
+        try:
+            while (event := await queue.get()) is not None:
+                if _event_matches(event, input or {}):
+                    yield event
+        finally:
+            self._subscribers[field].discard(queue)
+
+    def _where(
+        self, collection: _Collection, where: dict | None, include_deleted: bool
+    ) -> list[dict[str, Any]]:
+        return [
+            record
+            for record in self._records(collection).values()
+            if (include_deleted or record.get("existence") != "DELETED")
+            and _matches(record, where or {})
+        ]
+
+    def _find(
+        self, collection: _Collection, arguments: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """
+        Find a record by its ID or reference label argument.
+        """
+        records = self._records(collection)
+        if arguments.get(collection.id_key) is not None:
+            return records.get(arguments[collection.id_key])
+        for key, label in arguments.items():
+            if key.endswith("Reference") and label is not None:
+                for record in records.values():
+                    if (record.get("reference") or {}).get("label") == label:
+                        return record
+        return None
+
+    def _save(
+        self,
+        collection: _Collection,
+        record: dict[str, Any],
+        changes: dict[str, Any],
+        edit_type: str = "UPDATED",
+    ) -> dict[str, Any]:
+        """
+        Store a record with ``changes`` applied and publish the edit.
+        """
+        record = _merged(record, changes)
+        self._records(collection)[record["id"]] = record
+        self.publish(
+            f"{collection.singular}Edit",
+            {"editType": edit_type, collection.id_key: record["id"], "value": record},
+        )
+        return record
+
+
+def _resolve_field(source: Any, info: GraphQLResolveInfo, **arguments: Any) -> Any:
+    """
+    Resolve stored keys and fill in fields that are not stored.
+    """
+    if isinstance(source, dict) and info.field_name not in source:
+        return _placeholder(info.return_type)
+    return default_field_resolver(source, info, **arguments)
+
+
+def _placeholder(field_type: Any) -> Any:
+    """
+    A value valid for a field without stored data.
+    """
+    if not isinstance(field_type, GraphQLNonNull):
+        return None
+    inner = field_type.of_type
+    if isinstance(inner, GraphQLList):
+        return []
+    if isinstance(inner, GraphQLEnumType):
+        return next(iter(inner.values))
+    if isinstance(inner, GraphQLScalarType):
+        return _PLACEHOLDERS.get(inner.name, "")
+    return {}
+
+
+def _merged(record: dict[str, Any], changes: dict[str, Any]) -> dict[str, Any]:
+    """
+    Return a copy of a record with input properties applied.
+
+    Nested inputs are merged into nested records. Lists of IDs where the record
+    holds objects, such as an asterism given as target IDs, are not resolved
+    and leave the record unchanged.
+    """
+    result = dict(record)
+    for key, value in changes.items():
+        current = result.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            result[key] = _merged(current, value)
+        elif (
+            isinstance(value, list)
+            and isinstance(current, list)
+            and any(isinstance(item, dict) for item in current)
+            and not all(isinstance(item, dict) for item in value)
+        ):
+            continue
+        else:
+            result[key] = value
+    return result
+
+
+def _matches(record: Any, where: dict[str, Any]) -> bool:
+    """
+    Evaluate a ``WHERE`` input against a record.
+    """
+    for key, condition in where.items():
+        if condition is None:
+            continue
+        if key == "AND":
+            if not all(_matches(record, item) for item in condition):
+                return False
+        elif key == "OR":
+            if not any(_matches(record, item) for item in condition):
+                return False
+        elif key == "NOT":
+            if _matches(record, condition):
+                return False
+        elif key in _OPERATORS:
+            if not _OPERATORS[key](record, condition, where):
+                return False
+        elif key == "MATCH_CASE":
+            continue
+        else:
+            value = record
+            for part in _WHERE_PATHS.get(key, (key,)):
+                value = value.get(part) if isinstance(value, dict) else None
+            if isinstance(value, list):
+                if not any(_matches(item, condition) for item in value):
+                    return False
+            elif isinstance(condition, dict):
+                if not _matches(value, condition):
+                    return False
+            elif value != condition:
+                return False
+    return True
+
+
+def _like(value: Any, pattern: str, where: dict[str, Any]) -> bool:
+    """
+    SQL ``LIKE`` with ``%`` and ``_`` wildcards.
+    """
+    if value is None:
+        return False
+    regex = "".join(
+        ".*" if char == "%" else "." if char == "_" else re.escape(char)
+        for char in pattern
+    )
+    flags = 0 if where.get("MATCH_CASE", True) else re.IGNORECASE
+    return re.fullmatch(regex, str(value), flags) is not None
+
+
+_OPERATORS: dict[str, Callable[[Any, Any, dict[str, Any]], bool]] = {
+    "EQ": lambda value, operand, where: value == operand,
+    "NEQ": lambda value, operand, where: value != operand,
+    "IN": lambda value, operand, where: value in operand,
+    "NIN": lambda value, operand, where: value not in operand,
+    "GT": lambda value, operand, where: value is not None and value > operand,
+    "GTE": lambda value, operand, where: value is not None and value >= operand,
+    "LT": lambda value, operand, where: value is not None and value < operand,
+    "LTE": lambda value, operand, where: value is not None and value <= operand,
+    "IS_NULL": lambda value, operand, where: (value is None) == operand,
+    "LIKE": _like,
+    "NLIKE": lambda value, operand, where: not _like(value, operand, where),
+}
+
+
+def _event_matches(event: dict[str, Any], subscription_input: dict[str, Any]) -> bool:
+    """
+    Check an event against a subscription's input filter.
+
+    ID inputs such as ``programId`` match the event's ID or its value's program;
+    other object inputs, e.g. ``newCalculationState: {EQ: READY}``, are applied
+    as ``WHERE`` conditions on the event.
+    """
+    value = event.get("value") or {}
+    for key, condition in subscription_input.items():
+        if condition is None:
+            continue
+        if key == "programId":
+            program_id = (value.get("program") or {}).get("id", value.get("id"))
+            if program_id != condition:
+                return False
+        elif key.endswith("Id"):
+            if event.get(key, value.get("id")) != condition:
+                return False
+        elif isinstance(condition, dict):
+            if not _matches(event.get(key), condition):
+                return False
+    return True
@@ -0,0 +1,134 @@
+"""
+Build schema-valid response payloads from the generated result models.
+"""
+
+__all__ = ["build_payload"]
+
+import sys
+import types
+import typing
+from enum import Enum
+from typing import Annotated, Any, ForwardRef, Literal, Union
+
+from pydantic import BaseModel
+
+_SCALARS: dict[Any, Any] = {bool: False, int: 0, float: 0.0, str: ""}
+
+
+def build_payload(
+    model: type[BaseModel], *, fill_optional: bool = True, list_size: int = 1
+) -> dict[str, Any]:
+    """
+    Build a response payload that validates against a generated model.
+
+    The payload uses the GraphQL field names, so it can be served as the
+    ``data`` of a response. Enums take their first member, literals their
+    first value and untyped scalars an empty string.
+
+    Parameters
+    ----------
+    model : type[BaseModel]
+        Generated result model or fragment, e.g. ``GetObservations``.
+    fill_optional : bool, default=True
+        Whether nullable objects are built rather than set to ``null``. Building
+        them makes payloads closer in size to real responses.
+    list_size : int, default=1
+        Number of items built for every list field.
+
+    Returns
+    -------
+    dict[str, Any]
+        The payload.
+    """
+    return _build_model(model, fill_optional, list_size, ())
+
+
+def _build_model(
+    model: type[BaseModel],
+    fill_optional: bool,
+    list_size: int,
+    parents: tuple[type[BaseModel], ...],
+) -> dict[str, Any]:
+    """
+    Build one object, stopping at models already being built above it.
+    """
+    parents = (*parents, model)
+    # Generated models reference classes defined later in their module by name,
+    # and inherit fields from fragments defined in another module.
+    namespace: dict[str, Any] = {}
+    for base in reversed(model.__mro__):
+        if base.__module__ in sys.modules:
+            namespace.update(vars(sys.modules[base.__module__]))
+    return {
+        field.alias or name: _build_value(
+            _resolve(field.annotation, namespace), fill_optional, list_size, parents
+        )
+        for name, field in model.model_fields.items()
+    }
+
+
+def _resolve(annotation: Any, namespace: dict[str, Any]) -> Any:
+    """
+    Replace forward references in an annotation with the classes they name.
+    """
+    if isinstance(annotation, ForwardRef):
+        annotation = annotation.__forward_arg__
+    if isinstance(annotation, str):
+        return namespace[annotation]
+    origin = typing.get_origin(annotation)
+    if origin is Annotated:
+        # Discriminated unions; every member is valid on its own.
+        return _resolve(typing.get_args(annotation)[0], namespace)
+    if origin in (Union, types.UnionType):
+        return Union[
+            tuple(_resolve(arg, namespace) for arg in typing.get_args(annotation))
+        ]
+    if origin is list:
+        return list[_resolve(typing.get_args(annotation)[0], namespace)]
+    return annotation
+
+
+def _build_value(
+    annotation: Any,
+    fill_optional: bool,
+    list_size: int,
+    parents: tuple[type[BaseModel], ...],
+) -> Any:
+    """
+    Build a value for one field annotation.
+    """
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+
+    if origin in (Union, types.UnionType):
+        options = [arg for arg in args if arg is not type(None)]
+        nullable = len(options) < len(args)
+        # Nullable objects are left out on request and where they would recurse.
+        if nullable and (not fill_optional or _recurses(options[0], parents)):
+            return None
+        return _build_value(options[0], fill_optional, list_size, parents)
+    if origin is Literal:
+        return args[0]
+    if origin is list:
+        if _recurses(args[0], parents):
+            return []
+        return [
+            _build_value(args[0], fill_optional, list_size, parents)
+            for _ in range(list_size)
+        ]
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return _build_model(annotation, fill_optional, list_size, parents)
+        if issubclass(annotation, Enum):
+            return next(iter(annotation)).value
+    return _SCALARS.get(annotation, "")
+
+
+def _recurses(annotation: Any, parents: tuple[type[BaseModel], ...]) -> bool:
+    """
+    Return whether ``annotation`` names a model already being built.
+    """
+    for arg in (annotation, *typing.get_args(annotation)):
+        if isinstance(arg, type) and arg in parents:
+            return True
+    return False
@@ -0,0 +1,362 @@
+"""
+Record GPP traffic to a cassette and replay it without the network.
+
+:class:`RecordingProxy` forwards every request and WebSocket message from a
+client to the real service and records the exchange into a
+:class:`~gpp_client.testing.Cassette`. :class:`ReplayServer` then serves the
+recorded responses and subscription frames byte for byte, optionally with the
+recorded timing scaled. Both are pointed at with ``GPPClient(base_url=...)``.
+
+Attachment downloads go to presigned storage URLs on another host, so they are
+neither recorded nor replayed.
+"""
+
+__all__ = ["RecordingProxy", "ReplayServer"]
+
+import asyncio
+import logging
+import time
+from collections import defaultdict, deque
+
+import aiohttp
+from aiohttp import WSMsgType, web
+
+from gpp_client.rest.client import _get_ssl_context
+from gpp_client.testing._server import _LocalServer
+from gpp_client.testing.cassette import (
+    Cassette,
+    HTTPExchange,
+    WebSocketFrame,
+    WebSocketSession,
+)
+
+logger = logging.getLogger(__name__)
+
+# Headers describing one hop of the connection rather than the exchange.
+_HOP_HEADERS = frozenset(
+    {
+        "connection",
+        "content-length",
+        "date",
+        "host",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "sec-websocket-accept",
+        "sec-websocket-extensions",
+        "sec-websocket-key",
+        "sec-websocket-protocol",
+        "sec-websocket-version",
+        "server",
+        "te",
+        "trailer",
+        "transfer-encoding",
+        "upgrade",
+    }
+)
+
+_ExchangeKey = tuple[str, str, bytes]
+
+
+def _is_websocket(request: web.Request) -> bool:
+    return request.headers.get("Upgrade", "").lower() == "websocket"
+
+
+def _end_to_end(headers) -> list[tuple[str, str]]:
+    return [
+        (name, value)
+        for name, value in headers.items()
+        if name.lower() not in _HOP_HEADERS
+    ]
+
+
+def _record_data(message: aiohttp.WSMessage, from_client: bool) -> str | bytes:
+    """
+    Return the content of a message as recorded, without the client's token.
+    """
+    if message.type == WSMsgType.BINARY:
+        return message.data
+    if from_client and '"connection_init"' in message.data:
+        return '{"type":"connection_init"}'
+    return message.data
+
+
+class RecordingProxy(_LocalServer):
+    """
+    Forward client traffic to a GPP service and record it.
+
+    Parameters
+    ----------
+    upstream : str
+        Base URL of the service to record, e.g. ``GPPEnvironment.PRODUCTION.base_url``.
+    cassette : Cassette | None, optional
+        Cassette to record into. Defaults to a new, empty one.
+    host : str, default="127.0.0.1"
+        Interface to listen on.
+    port : int, default=0
+        Port to listen on. 0 picks a free port.
+
+    Attributes
+    ----------
+    cassette : Cassette
+        The recorded traffic. Save it once the client is done.
+    """
+
+    _name = "recording proxy"
+
+    def __init__(
+        self,
+        upstream: str,
+        *,
+        cassette: Cassette | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        super().__init__(host=host, port=port)
+        self.upstream = upstream.rstrip("/")
+        self.cassette = cassette if cassette is not None else Cassette()
+        self._session: aiohttp.ClientSession | None = None
+
+    def _add_routes(self, app: web.Application) -> None:
+        app.router.add_route("*", "/{path:.*}", self._handle)
+
+    async def start(self) -> None:
+        # Compressed bodies are forwarded and recorded as they arrive.
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(ssl=_get_ssl_context()),
+            auto_decompress=False,
+        )
+        await super().start()
+
+    async def close(self) -> None:
+        await super().close()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        if _is_websocket(request):
+            return await self._relay_websocket(request)
+
+        body = await request.read()
+        started = time.perf_counter()
+        try:
+            async with self._session.request(
+                request.method,
+                self.upstream + request.raw_path,
+                headers=_end_to_end(request.headers),
+                data=body,
+                allow_redirects=False,
+            ) as upstream:
+                content = await upstream.read()
+                headers = _end_to_end(upstream.headers)
+                status = upstream.status
+        except aiohttp.ClientError as exc:
+            logger.warning("Could not reach %s: %s", self.upstream, exc)
+            raise web.HTTPBadGateway(text=str(exc)) from exc
+
+        self.cassette.exchanges.append(
+            HTTPExchange(
+                method=request.method,
+                path=request.raw_path,
+                request_body=body,
+                status=status,
+                headers=tuple(headers),
+                body=content,
+                elapsed=time.perf_counter() - started,
+            )
+        )
+        return web.Response(status=status, headers=headers, body=content)
+
+    async def _relay_websocket(self, request: web.Request) -> web.WebSocketResponse:
+        """
+        Relay messages both ways between the client and the service.
+        """
+        protocols = [
+            protocol.strip()
+            for protocol in request.headers.get("Sec-WebSocket-Protocol", "").split(",")
+            if protocol.strip()
+        ]
+        url = self.upstream.replace("http", "ws", 1) + request.raw_path
+        authorization = request.headers.get("Authorization")
+        try:
+            upstream = await self._session.ws_connect(
+                url,
+                protocols=protocols,
+                headers={"Authorization": authorization} if authorization else None,
+            )
+        except aiohttp.ClientError as exc:
+            logger.warning("Could not reach %s: %s", self.upstream, exc)
+            raise web.HTTPBadGateway(text=str(exc)) from exc
+        client = web.WebSocketResponse(
+            protocols=(upstream.protocol,) if upstream.protocol else ()
+        )
+        await client.prepare(request)
+
+        opened = time.perf_counter()
+        frames: list[WebSocketFrame] = []
+
+        async def pump(source, target, from_client: bool) -> None:
+            async for message in source:
+                if message.type not in (WSMsgType.TEXT, WSMsgType.BINARY):
+                    break
+                frames.append(
+                    WebSocketFrame(
+                        from_client=from_client,
+                        offset=time.perf_counter() - opened,
+                        data=_record_data(message, from_client),
+                    )
+                )
+                if message.type == WSMsgType.TEXT:
+                    await target.send_str(message.data)
+                else:
+                    await target.send_bytes(message.data)
+            await target.close()
+
+        await asyncio.gather(
+            pump(client, upstream, from_client=True),
+            pump(upstream, client, from_client=False),
+            return_exceptions=True,
+        )
+        self.cassette.sessions.append(
+            WebSocketSession(
+                path=request.raw_path,
+                protocol=upstream.protocol,
+                frames=tuple(frames),
+            )
+        )
+        return client
+
+
+class ReplayServer(_LocalServer):
+    """
+    Serve the traffic recorded in a cassette.
+
+    HTTP requests are matched to recorded exchanges by method, path with query
+    string and body. Identical requests get the recorded responses in order; once
+    those run out, the last one is repeated. Each WebSocket connection replays
+    the next recorded session for its path: server messages are sent as recorded,
+    after the client has sent as many messages as it did when recording.
+
+    Parameters
+    ----------
+    cassette : Cassette
+        The traffic to serve.
+    time_scale : float, default=1.0
+        Multiplier for the recorded response times and the gaps between
+        WebSocket messages. ``0`` replays without waiting, ``0.5`` at double speed.
+    host : str, default="127.0.0.1"
+        Interface to listen on.
+    port : int, default=0
+        Port to listen on. 0 picks a free port.
+
+    Attributes
+    ----------
+    misses : list[str]
+        Requests without a recorded response, as ``"<METHOD> <path>"``. They
+        are answered with status 404.
+    """
+
+    _name = "replay server"
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        *,
+        time_scale: float = 1.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        if time_scale < 0:
+            raise ValueError("time_scale must not be negative.")
+        super().__init__(host=host, port=port)
+        self.cassette = cassette
+        self.time_scale = time_scale
+        self.misses: list[str] = []
+        self._exchanges: dict[_ExchangeKey, deque[HTTPExchange]] = {}
+        self._sessions: dict[str, deque[WebSocketSession]] = {}
+
+    def _add_routes(self, app: web.Application) -> None:
+        app.router.add_route("*", "/{path:.*}", self._handle)
+
+    async def start(self) -> None:
+        exchanges: dict[_ExchangeKey, deque[HTTPExchange]] = defaultdict(deque)
+        for exchange in self.cassette.exchanges:
+            key = (exchange.method, exchange.path, exchange.request_body)
+            exchanges[key].append(exchange)
+        sessions: dict[str, deque[WebSocketSession]] = defaultdict(deque)
+        for session in self.cassette.sessions:
+            sessions[session.path].append(session)
+        self._exchanges, self._sessions = dict(exchanges), dict(sessions)
+        await super().start()
+
+    async def _wait(self, seconds: float) -> None:
+        if seconds > 0 and self.time_scale:
+            await asyncio.sleep(seconds * self.time_scale)
+
+    @staticmethod
+    def _next(recorded: deque):
+        """
+        Take the next recorded item, keeping the last one for repeats.
+        """
+        return recorded.popleft() if len(recorded) > 1 else recorded[0]
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        if _is_websocket(request):
+            return await self._replay_websocket(request)
+
+        key = (request.method, request.raw_path, await request.read())
+        recorded = self._exchanges.get(key)
+        if not recorded:
+            self.misses.append(f"{request.method} {request.raw_path}")
+            raise web.HTTPNotFound(text="No recorded response for this request.")
+
+        exchange = self._next(recorded)
+        await self._wait(exchange.elapsed)
+        return web.Response(
+            status=exchange.status, headers=exchange.headers, body=exchange.body
+        )
+
+    async def _replay_websocket(self, request: web.Request) -> web.WebSocketResponse:
+        recorded = self._sessions.get(request.raw_path)
+        if not recorded:
+            self.misses.append(f"{request.method} {request.raw_path}")
+            raise web.HTTPNotFound(text="No recorded session for this connection.")
+
+        session = self._next(recorded)
+        websocket = web.WebSocketResponse(
+            protocols=(session.protocol,) if session.protocol else ()
+        )
+        await websocket.prepare(request)
+
+        # Read on a separate task so a client closing early is noticed while
+        # the replay waits between messages.
+        received: asyncio.Queue[bool] = asyncio.Queue()
+
+        async def read() -> None:
+            async for message in websocket:
+                if message.type not in (WSMsgType.TEXT, WSMsgType.BINARY):
+                    break
+                received.put_nowait(True)
+            received.put_nowait(False)
+
+        reader = asyncio.create_task(read())
+        previous = 0.0
+        try:
+            for frame in session.frames:
+                if frame.from_client:
+                    if not await received.get():
+                        break
+                else:
+                    await self._wait(frame.offset - previous)
+                    if websocket.closed:
+                        break
+                    if isinstance(frame.data, str):
+                        await websocket.send_str(frame.data)
+                    else:
+                        await websocket.send_bytes(frame.data)
+                previous = frame.offset
+            await reader
+        finally:
+            reader.cancel()
+        return websocket
@@ -0,0 +1,224 @@
+"""
+Local stand-in for the GPP services.
+
+:class:`StubGPPServer` serves canned GraphQL responses, the scheduler REST
+endpoints, attachments and ``graphql-transport-ws`` subscriptions from an
+``aiohttp`` application on localhost, with optional injected latency. Point a
+client at it with ``GPPClient(base_url=server.base_url)``.
+"""
+
+__all__ = ["StubGPPServer"]
+
+import asyncio
+import json
+from collections import Counter
+from collections.abc import Callable
+from datetime import datetime, timezone
+from typing import Any
+
+from aiohttp import WSMsgType, web
+
+from gpp_client.testing._server import _LocalServer
+
+GraphQLResponder = dict[str, Any] | Callable[[dict[str, Any]], dict[str, Any]]
+"""Response ``data`` of an operation, or a function of its variables returning it."""
+
+_URL_LIFETIME = 3600
+
+
+class StubGPPServer(_LocalServer):
+    """
+    Serve canned GPP responses from a local ``aiohttp`` server.
+
+    Fill the public attributes with the data to serve, then start the server
+    with ``async with``.
+
+    Parameters
+    ----------
+    latency : float, default=0.0
+        Seconds each response is delayed, emulating the network round trip.
+    host : str, default="127.0.0.1"
+        Interface to listen on.
+    port : int, default=0
+        Port to listen on. 0 picks a free port.
+
+    Attributes
+    ----------
+    graphql : dict[str, GraphQLResponder]
+        Response data of queries and mutations, keyed by operation name.
+    subscriptions : dict[str, list[dict[str, Any]]]
+        Events of each subscription, keyed by operation name. The stream
+        completes after the last event.
+    event_interval : float
+        Seconds between subscription events.
+    atom_digests : dict[str, list[str]]
+        Tab-separated ``/scheduler/atoms`` rows, keyed by observation ID.
+    visibility_changes : str
+        Body of ``/scheduler/visibility-changes``.
+    attachments : dict[str, tuple[str, bytes]]
+        File name and content of each attachment, keyed by attachment ID.
+        Uploads are added here.
+    route_latency : dict[str, float]
+        Latency overrides keyed by route name: ``"graphql"``, ``"ws"``,
+        ``"atoms"``, ``"visibility-changes"``, ``"attachment"`` or ``"files"``.
+    requests : Counter[str]
+        Requests received, keyed by route name.
+    """
+
+    _name = "stub server"
+
+    def __init__(
+        self, *, latency: float = 0.0, host: str = "127.0.0.1", port: int = 0
+    ) -> None:
+        super().__init__(host=host, port=port)
+        self.latency = latency
+        self.graphql: dict[str, GraphQLResponder] = {}
+        self.subscriptions: dict[str, list[dict[str, Any]]] = {}
+        self.event_interval = 0.0
+        self.atom_digests: dict[str, list[str]] = {}
+        self.visibility_changes = ""
+        self.attachments: dict[str, tuple[str, bytes]] = {}
+        self.route_latency: dict[str, float] = {}
+        self.requests: Counter[str] = Counter()
+        self._uploads = 0
+
+    def _add_routes(self, app: web.Application) -> None:
+        app.router.add_post("/odb", self._handle_graphql)
+        app.router.add_get("/ws", self._handle_ws)
+        app.router.add_post("/scheduler/atoms", self._handle_atoms)
+        app.router.add_get(
+            "/scheduler/visibility-changes", self._handle_visibility_changes
+        )
+        app.router.add_post("/attachment", self._handle_upload)
+        app.router.add_get("/attachment/url/{attachment_id}", self._handle_url)
+        app.router.add_delete("/attachment/{attachment_id}", self._handle_delete)
+        app.router.add_get("/files/{attachment_id}/{file_name}", self._handle_file)
+
+    async def _delay(self, route: str) -> None:
+        """
+        Count a request and wait for the latency of its route.
+        """
+        self.requests[route] += 1
+        latency = self.route_latency.get(route, self.latency)
+        if latency:
+            await asyncio.sleep(latency)
+
+    def _resolve(self, operation_name: str, variables: dict[str, Any]) -> Any:
+        """
+        Return the response data of an operation.
+        """
+        responder = self.graphql[operation_name]
+        return responder(variables) if callable(responder) else responder
+
+    async def _handle_graphql(self, request: web.Request) -> web.Response:
+        await self._delay("graphql")
+        body = await request.json()
+        name = body.get("operationName")
+        if name not in self.graphql:
+            return web.json_response(
+                {"errors": [{"message": f"No stub response for operation {name!r}."}]}
+            )
+        data = self._resolve(name, body.get("variables") or {})
+        return web.json_response({"data": data})
+
+    async def _handle_ws(self, request: web.Request) -> web.WebSocketResponse:
+        await self._delay("ws")
+        websocket = web.WebSocketResponse(protocols=("graphql-transport-ws",))
+        await websocket.prepare(request)
+        streams: set[asyncio.Task[None]] = set()
+
+        async for message in websocket:
+            if message.type != WSMsgType.TEXT:
+                break
+            frame = json.loads(message.data)
+            kind = frame.get("type")
+            if kind == "connection_init":
+                await websocket.send_json({"type": "connection_ack"})
+            elif kind == "ping":
+                await websocket.send_json({"type": "pong"})
+            elif kind == "subscribe":
+                task = asyncio.create_task(self._stream(websocket, frame))
+                streams.add(task)
+                task.add_done_callback(streams.discard)
+            elif kind == "complete":
+                for task in list(streams):
+                    task.cancel()
+
+        for task in list(streams):
+            task.cancel()
+        return websocket
+
+    async def _stream(
+        self, websocket: web.WebSocketResponse, frame: dict[str, Any]
+    ) -> None:
+        """
+        Send the events of one subscription, then complete it.
+        """
+        operation_id = frame["id"]
+        name = frame.get("payload", {}).get("operationName")
+        if name not in self.subscriptions:
+            await websocket.send_json(
+                {
+                    "type": "error",
+                    "id": operation_id,
+                    "payload": [{"message": f"No stub events for {name!r}."}],
+                }
+            )
+            return
+        for index, event in enumerate(self.subscriptions[name]):
+            if index and self.event_interval:
+                await asyncio.sleep(self.event_interval)
+            await websocket.send_json(
+                {"type": "next", "id": operation_id, "payload": {"data": event}}
+            )
+        await websocket.send_json({"type": "complete", "id": operation_id})
+
+    async def _handle_atoms(self, request: web.Request) -> web.Response:
+        await self._delay("atoms")
+        observation_ids = (await request.text()).split("\n")
+        rows = [
+            row
+            for obs_id in dict.fromkeys(observation_ids)
+            for row in self.atom_digests.get(obs_id.strip(), ())
+        ]
+        return web.Response(text="\n".join(rows), content_type="text/plain")
+
+    async def _handle_visibility_changes(self, request: web.Request) -> web.Response:
+        await self._delay("visibility-changes")
+        return web.Response(text=self.visibility_changes, content_type="text/plain")
+
+    async def _handle_upload(self, request: web.Request) -> web.Response:
+        await self._delay("attachment")
+        self._uploads += 1
+        attachment_id = f"a-upload-{self._uploads}"
+        file_name = request.query.get("fileName", attachment_id)
+        self.attachments[attachment_id] = (file_name, await request.read())
+        return web.Response(text=attachment_id)
+
+    async def _handle_url(self, request: web.Request) -> web.Response:
+        await self._delay("attachment")
+        attachment_id = request.match_info["attachment_id"]
+        if attachment_id not in self.attachments:
+            raise web.HTTPNotFound()
+        file_name, _ = self.attachments[attachment_id]
+        # Signed like an S3 URL so the client's presigned URL cache applies.
+        signed_at = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        return web.Response(
+            text=(
+                f"{self.base_url}/files/{attachment_id}/{file_name}"
+                f"?X-Amz-Date={signed_at}&X-Amz-Expires={_URL_LIFETIME}"
+            )
+        )
+
+    async def _handle_delete(self, request: web.Request) -> web.Response:
+        await self._delay("attachment")
+        if self.attachments.pop(request.match_info["attachment_id"], None) is None:
+            raise web.HTTPNotFound()
+        return web.Response()
+
+    async def _handle_file(self, request: web.Request) -> web.Response:
+        await self._delay("files")
+        attachment = self.attachments.get(request.match_info["attachment_id"])
+        if attachment is None:
+            raise web.HTTPNotFound()
+        return web.Response(body=attachment[1], content_type="application/octet-stream")
@@ -0,0 +1,278 @@
+"""
+GraphQL client that reports every operation to a :class:`~gpp_client.tracing.Tracer`.
+
+The generated client is not edited: :class:`TracedGraphQLClient` subclasses it,
+wraps each generated operation method in a span and overrides the base client's
+``execute``, ``execute_ws`` and ``get_data`` to fill that span in. The operation
+method validates the decoded response right after ``get_data`` returns, so the
+time between the two is recorded as Pydantic validation time.
+"""
+
+__all__ = ["TracedGraphQLClient"]
+
+import functools
+import inspect
+import json
+import time
+from collections.abc import AsyncIterator, Callable
+from typing import Any, Optional
+
+import httpx
+from pydantic_core import to_jsonable_python
+
+from gpp_client.generated.async_base_client import AsyncBaseClient
+from gpp_client.generated.client import GraphQLClient
+from gpp_client.generated.operations import LazyOperation
+from gpp_client.tracing import Span, SpanAttribute, Tracer, current_span
+
+_GRAPHQL_KINDS = frozenset({"graphql", "graphql.subscription"})
+
+
+class TracedGraphQLClient(GraphQLClient):
+    """
+    Generated GraphQL client with a tracing span around every operation.
+
+    Parameters
+    ----------
+    *args : Any
+        Positional arguments for :class:`GraphQLClient`.
+    tracer : Tracer | None, optional
+        Tracer receiving the spans. Defaults to a tracer without hooks.
+    **kwargs : Any
+        Keyword arguments for :class:`GraphQLClient`.
+    """
+
+    def __init__(self, *args: Any, tracer: Tracer | None = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.tracer = tracer or Tracer()
+
+    async def execute(
+        self,
+        query: str,
+        operation_name: Optional[str] = None,
+        variables: Optional[dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        span = current_span()
+        if span is not None and span.kind in _GRAPHQL_KINDS:
+            return await self._execute_in_span(
+                span, query, operation_name, variables, **kwargs
+            )
+        # Called directly rather than through an operation method.
+        with self.tracer.span(operation_name or "execute", kind="graphql") as span:
+            return await self._execute_in_span(
+                span, query, operation_name, variables, **kwargs
+            )
+
+    def get_data(self, response: httpx.Response) -> dict[str, Any]:
+        span = current_span()
+        if span is None or not span.recording or span.kind not in _GRAPHQL_KINDS:
+            return super().get_data(response)
+
+        started = time.perf_counter()
+        try:
+            data = super().get_data(response)
+        finally:
+            span._decoded_at = time.perf_counter()
+            span.add(SpanAttribute.JSON_DECODE_TIME, span._decoded_at - started)
+        self._dispatch_response(span, data)
+        return data
+
+    async def execute_ws(
+        self,
+        query: str,
+        operation_name: Optional[str] = None,
+        variables: Optional[dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        stream = self._execute_ws_in_span(query, operation_name, variables, **kwargs)
+        span = current_span()
+        if span is not None and span.kind in _GRAPHQL_KINDS:
+            async for data in stream:
+                yield data
+            return
+        # Called directly rather than through a subscription method.
+        span = self.tracer.start_span(
+            operation_name or "execute_ws", kind="graphql.subscription"
+        )
+        async for data in self.tracer.stream(span, stream):
+            yield data
+
+    async def _execute_in_span(
+        self,
+        span: Span,
+        query: str,
+        operation_name: Optional[str],
+        variables: Optional[dict[str, Any]],
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Send a query or mutation and record the exchange on ``span``.
+        """
+        if not span.recording:
+            return await super().execute(query, operation_name, variables, **kwargs)
+
+        span.set_attribute(SpanAttribute.OPERATION_NAME, operation_name)
+        span.set_attribute(
+            SpanAttribute.VARIABLES_BYTES, self._variables_size(variables)
+        )
+        span.add(SpanAttribute.REQUESTS, 1)
+        span._query = query
+
+        started = time.perf_counter()
+        extensions = dict(kwargs.pop("extensions", None) or {})
+        downstream = extensions.get("trace")
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            if event_name.endswith(".receive_response_headers.complete"):
+                span.set_attribute(
+                    SpanAttribute.TIME_TO_FIRST_BYTE, time.perf_counter() - started
+                )
+            if downstream is not None:
+                await downstream(event_name, info)
+
+        extensions["trace"] = trace
+        response = await super().execute(
+            query, operation_name, variables, extensions=extensions, **kwargs
+        )
+
+        span.set_attribute(SpanAttribute.HTTP_STATUS, response.status_code)
+        span.add(
+            SpanAttribute.REQUEST_BYTES,
+            int(response.request.headers.get("content-length", 0)),
+        )
+        # Bytes on the wire; bodies handed over in memory are never "downloaded".
+        span.add(
+            SpanAttribute.RESPONSE_BYTES,
+            response.num_bytes_downloaded or len(response.content),
+        )
+        return response
+
+    async def _execute_ws_in_span(
+        self,
+        query: str,
+        operation_name: Optional[str],
+        variables: Optional[dict[str, Any]],
+        **kwargs: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Run a subscription and record its events on the current span.
+
+        Frame sizes and decode times are added by :meth:`_handle_ws_message`.
+        """
+        span = current_span()
+        started = time.perf_counter()
+        if span is not None and span.recording:
+            span.set_attribute(SpanAttribute.OPERATION_NAME, operation_name)
+            span.set_attribute(
+                SpanAttribute.VARIABLES_BYTES, self._variables_size(variables)
+            )
+            span._query = query
+
+        async for data in super().execute_ws(
+            query, operation_name, variables, **kwargs
+        ):
+            if span is not None and span.recording:
+                if SpanAttribute.EVENTS not in span.attributes:
+                    span.set_attribute(
+                        SpanAttribute.TIME_TO_FIRST_BYTE, time.perf_counter() - started
+                    )
+                span.add(SpanAttribute.EVENTS, 1)
+                self._dispatch_response(span, data)
+            yield data
+
+    async def _handle_ws_message(
+        self, message: Any, websocket: Any, expected_type: Any = None
+    ) -> Optional[dict[str, Any]]:
+        span = current_span()
+        if span is None or not span.recording or span.kind not in _GRAPHQL_KINDS:
+            return await super()._handle_ws_message(message, websocket, expected_type)
+
+        span.add(SpanAttribute.RESPONSE_BYTES, len(message))
+        started = time.perf_counter()
+        try:
+            return await super()._handle_ws_message(message, websocket, expected_type)
+        finally:
+            span._decoded_at = time.perf_counter()
+            span.add(SpanAttribute.JSON_DECODE_TIME, span._decoded_at - started)
+
+    def _dispatch_response(self, span: Span, data: dict[str, Any]) -> None:
+        """
+        Hand decoded response data to the hooks.
+
+        Time spent in the hooks is not counted as validation time.
+        """
+        if span._query is None:
+            return
+        self.tracer._dispatch("on_response", span, span._query, data)
+        if span._decoded_at is not None:
+            span._decoded_at = time.perf_counter()
+
+    def _variables_size(self, variables: Optional[dict[str, Any]]) -> int:
+        """
+        Return the size of the variables as sent, in bytes.
+        """
+        if not variables:
+            return 0
+        serializable = self._convert_dict_to_json_serializable(variables)
+        return len(json.dumps(serializable, default=to_jsonable_python))
+
+
+def _trace_operation(method: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wrap a generated query or mutation method in a span.
+    """
+
+    @functools.wraps(method)
+    async def traced(self: TracedGraphQLClient, *args: Any, **kwargs: Any) -> Any:
+        span = current_span()
+        if span is not None and span.kind in _GRAPHQL_KINDS:
+            # Nested call, e.g. ``query`` -> ``execute_custom_operation``.
+            return await method(self, *args, **kwargs)
+
+        with self.tracer.span(method.__name__, kind="graphql") as span:
+            result = await method(self, *args, **kwargs)
+            if span.recording and span._decoded_at is not None:
+                span.set_attribute(
+                    SpanAttribute.VALIDATION_TIME,
+                    time.perf_counter() - span._decoded_at,
+                )
+            return result
+
+    return traced
+
+
+def _trace_subscription(method: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wrap a generated subscription method in a span that lasts for the stream.
+    """
+
+    @functools.wraps(method)
+    async def traced(
+        self: TracedGraphQLClient, *args: Any, **kwargs: Any
+    ) -> AsyncIterator[Any]:
+        span = self.tracer.start_span(method.__name__, kind="graphql.subscription")
+        async for event in self.tracer.stream(span, method(self, *args, **kwargs)):
+            if span.recording and span._decoded_at is not None:
+                span.add(
+                    SpanAttribute.VALIDATION_TIME,
+                    time.perf_counter() - span._decoded_at,
+                )
+            yield event
+
+    return traced
+
+
+# Wrap every public operation of the generated client; the methods inherited
+# from the base client are instrumented by the overrides above. Operations not
+# imported yet are wrapped when they are.
+for _name, _member in vars(GraphQLClient).items():
+    if _name.startswith("_") or hasattr(AsyncBaseClient, _name):
+        continue
+    if isinstance(_member, LazyOperation):
+        _wrapper = _trace_subscription if _member.subscription else _trace_operation
+        setattr(TracedGraphQLClient, _name, _member.wrap(TracedGraphQLClient, _wrapper))
+    elif inspect.isasyncgenfunction(_member):
+        setattr(TracedGraphQLClient, _name, _trace_subscription(_member))
+    elif inspect.iscoroutinefunction(_member):
+        setattr(TracedGraphQLClient, _name, _trace_operation(_member))
@@ -0,0 +1,620 @@
+"""
+Lifecycle hooks and tracing spans for client operations.
+
+Every GraphQL operation, subscription and REST call of :class:`~gpp_client.GPPClient`
+runs inside a :class:`Span` that records how long it took and where the time went:
+bytes sent and received, time to first byte, JSON decode time and Pydantic
+validation time. Spans are handed to the :class:`ClientHooks` registered on the
+client's :class:`Tracer`. Without hooks, spans are not recorded and the overhead is
+a few attribute lookups per call.
+
+Two hooks are provided: :class:`InMemoryCollector`, which keeps finished spans in
+memory without any dependency, and :class:`OpenTelemetryHooks`, which forwards
+them to an OpenTelemetry tracer.
+"""
+
+__all__ = [
+    "ClientHooks",
+    "InMemoryCollector",
+    "OpenTelemetryHooks",
+    "Span",
+    "SpanAttribute",
+    "Tracer",
+    "current_span",
+]
+
+import itertools
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import StrEnum
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:  # pragma: no cover - depends on the environment.
+    otel_trace = None
+
+logger = logging.getLogger(__name__)
+
+_current_span: ContextVar["Span | None"] = ContextVar("gpp_current_span", default=None)
+_span_ids = itertools.count(1)
+
+
+class SpanAttribute(StrEnum):
+    """
+    Attribute names recorded on spans.
+
+    Names follow the OpenTelemetry semantic conventions where one exists; the
+    others use the ``gpp.`` prefix. Durations are in seconds and sizes in bytes.
+    """
+
+    OPERATION_NAME = "graphql.operation.name"
+    HTTP_METHOD = "http.request.method"
+    HTTP_STATUS = "http.response.status_code"
+    URL = "url.full"
+    REQUEST_BYTES = "http.request.body.size"
+    RESPONSE_BYTES = "http.response.body.size"
+    VARIABLES_BYTES = "gpp.variables.size"
+    REQUESTS = "gpp.requests"
+    RETRIES = "gpp.retries"
+    TIME_TO_FIRST_BYTE = "gpp.time_to_first_byte"
+    JSON_DECODE_TIME = "gpp.json_decode_time"
+    VALIDATION_TIME = "gpp.validation_time"
+    EVENTS = "gpp.events"
+    ERROR_TYPE = "error.type"
+
+
+@dataclass
+class Span:
+    """
+    One timed client operation.
+
+    Attributes
+    ----------
+    name : str
+        Operation name, e.g. the client method called.
+    kind : str
+        ``"graphql"``, ``"graphql.subscription"`` or ``"rest"``.
+    span_id : int
+        Identifier unique within the process.
+    parent_id : int | None
+        ID of the span this one was started in, if any.
+    start_time_ns : int
+        Start as nanoseconds since the epoch.
+    end_time_ns : int | None
+        End as nanoseconds since the epoch, or ``None`` while running.
+    attributes : dict[str, Any]
+        Measurements keyed by :class:`SpanAttribute` values.
+    error : str | None
+        The error that ended the operation, if any.
+    recording : bool
+        Whether measurements are collected; ``False`` when no hook was
+        registered as the span started.
+    """
+
+    name: str
+    kind: str
+    span_id: int = field(default_factory=lambda: next(_span_ids))
+    parent_id: int | None = None
+    start_time_ns: int = field(default_factory=time.time_ns)
+    end_time_ns: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+    recording: bool = True
+
+    _started: float = field(default_factory=time.perf_counter, repr=False)
+    # When the last response was decoded; validation time is measured from here.
+    _decoded_at: float | None = field(default=None, repr=False)
+    # The GraphQL document sent, for hooks receiving the responses.
+    _query: str | None = field(default=None, repr=False)
+    _tracer: "Tracer | None" = field(default=None, repr=False, compare=False)
+
+    @property
+    def duration(self) -> float | None:
+        """
+        Seconds between start and end.
+
+        Returns
+        -------
+        float | None
+            The duration, or ``None`` while the span is running.
+        """
+        if self.end_time_ns is None:
+            return None
+        return (self.end_time_ns - self.start_time_ns) / 1e9
+
+    def elapsed(self) -> float:
+        """
+        Seconds since the span started, by the monotonic clock.
+
+        Returns
+        -------
+        float
+            Elapsed time.
+        """
+        return time.perf_counter() - self._started
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """
+        Set an attribute if the span is recording.
+
+        Parameters
+        ----------
+        key : str
+            Attribute name.
+        value : Any
+            Attribute value.
+        """
+        if self.recording:
+            self.attributes[str(key)] = value
+
+    def add(self, key: str, amount: float) -> None:
+        """
+        Add to a numeric attribute if the span is recording.
+
+        Parameters
+        ----------
+        key : str
+            Attribute name.
+        amount : float
+            Amount to add; a missing attribute counts as zero.
+        """
+        if self.recording:
+            key = str(key)
+            self.attributes[key] = self.attributes.get(key, 0) + amount
+
+    def record_error(self, exc: BaseException) -> None:
+        """
+        Mark the span as failed.
+
+        Parameters
+        ----------
+        exc : BaseException
+            The error that ended the operation.
+        """
+        self.error = str(exc) or type(exc).__name__
+        self.set_attribute(SpanAttribute.ERROR_TYPE, type(exc).__name__)
+
+    def end(self) -> None:
+        """
+        End the span and pass it to the hooks. Ending twice has no effect.
+        """
+        if self.end_time_ns is not None:
+            return
+        self.end_time_ns = self.start_time_ns + int(self.elapsed() * 1e9)
+        if self._tracer is not None:
+            self._tracer._dispatch("on_span_end", self)
+
+
+class ClientHooks:
+    """
+    Receive spans as client operations start and end.
+
+    Subclass and override either method. Hooks run on the event loop inside
+    the operation, so they should return quickly; an exception raised by a
+    hook is logged and does not affect the operation.
+    """
+
+    def on_span_start(self, span: Span) -> None:
+        """
+        Called when an operation starts.
+
+        Parameters
+        ----------
+        span : Span
+            The new span; its attributes are filled in as the operation runs.
+        """
+
+    def on_span_end(self, span: Span) -> None:
+        """
+        Called when an operation finished, successfully or not.
+
+        Parameters
+        ----------
+        span : Span
+            The finished span.
+        """
+
+    def on_response(self, span: Span, query: str, data: dict[str, Any]) -> None:
+        """
+        Called with the data of each GraphQL response or subscription event,
+        after decoding and before validation.
+
+        Parameters
+        ----------
+        span : Span
+            The span of the operation.
+        query : str
+            The GraphQL document sent.
+        data : dict[str, Any]
+            The decoded ``data`` of the response. Do not modify it.
+        """
+
+
+class InMemoryCollector(ClientHooks):
+    """
+    Keep finished spans in memory.
+
+    Parameters
+    ----------
+    max_spans : int | None, default=10_000
+        Number of most recent spans kept. ``None`` keeps every span.
+    """
+
+    def __init__(self, max_spans: int | None = 10_000) -> None:
+        self._spans: deque[Span] = deque(maxlen=max_spans)
+
+    def on_span_end(self, span: Span) -> None:
+        self._spans.append(span)
+
+    @property
+    def spans(self) -> list[Span]:
+        """
+        Finished spans, oldest first.
+
+        Returns
+        -------
+        list[Span]
+            A copy of the collected spans.
+        """
+        return list(self._spans)
+
+    def by_name(self, name: str) -> list[Span]:
+        """
+        Finished spans of one operation.
+
+        Parameters
+        ----------
+        name : str
+            The span name.
+
+        Returns
+        -------
+        list[Span]
+            Matching spans, oldest first.
+        """
+        return [span for span in self._spans if span.name == name]
+
+    def clear(self) -> None:
+        """
+        Drop all collected spans.
+        """
+        self._spans.clear()
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+
+class OpenTelemetryHooks(ClientHooks):
+    """
+    Export spans to an OpenTelemetry tracer.
+
+    Each client span becomes an OpenTelemetry span with the same name, start and
+    end time and attributes, nested under its parent client span. Any object with
+    the ``opentelemetry.trace.Tracer`` interface works.
+
+    Parameters
+    ----------
+    tracer : Any | None, optional
+        The OpenTelemetry tracer. Defaults to ``trace.get_tracer("gpp_client")``,
+        which requires the ``opentelemetry-api`` package.
+
+    Raises
+    ------
+    ImportError
+        If no tracer is given and ``opentelemetry-api`` is not installed.
+    """
+
+    def __init__(self, tracer: Any | None = None) -> None:
+        if tracer is None:
+            if otel_trace is None:
+                raise ImportError(
+                    "OpenTelemetryHooks requires the 'opentelemetry-api' package "
+                    "or an explicit tracer."
+                )
+            tracer = otel_trace.get_tracer("gpp_client")
+        self._tracer = tracer
+        self._open: dict[int, Any] = {}
+
+    def on_span_start(self, span: Span) -> None:
+        kwargs: dict[str, Any] = {"start_time": span.start_time_ns}
+        parent = self._open.get(span.parent_id) if span.parent_id else None
+        if parent is not None and otel_trace is not None:
+            kwargs["context"] = otel_trace.set_span_in_context(parent)
+        self._open[span.span_id] = self._tracer.start_span(
+            span.name, attributes={"gpp.span.kind": span.kind}, **kwargs
+        )
+
+    def on_span_end(self, span: Span) -> None:
+        otel_span = self._open.pop(span.span_id, None)
+        if otel_span is None:
+            return
+        for key, value in span.attributes.items():
+            otel_span.set_attribute(key, value)
+        if span.error is not None and otel_trace is not None:
+            otel_span.set_status(
+                otel_trace.Status(otel_trace.StatusCode.ERROR, span.error)
+            )
+        otel_span.end(end_time=span.end_time_ns)
+
+
+class Tracer:
+    """
+    Start spans for client operations and dispatch them to hooks.
+
+    One tracer is shared by the GraphQL and REST clients of a
+    :class:`~gpp_client.GPPClient`. The span of the running operation is tracked
+    in a context variable, so requests made while it runs, including from tasks
+    it spawns, are attributed to it.
+
+    Parameters
+    ----------
+    hooks : list[ClientHooks] | None, optional
+        Hooks to register.
+    """
+
+    def __init__(self, hooks: list[ClientHooks] | None = None) -> None:
+        self._hooks: list[ClientHooks] = list(hooks or [])
+
+    @property
+    def hooks(self) -> tuple[ClientHooks, ...]:
+        """
+        The registered hooks.
+
+        Returns
+        -------
+        tuple[ClientHooks, ...]
+            Hooks in registration order.
+        """
+        return tuple(self._hooks)
+
+    def add_hook(self, hook: ClientHooks) -> None:
+        """
+        Register a hook for spans started from now on.
+
+        Parameters
+        ----------
+        hook : ClientHooks
+            The hook to add.
+        """
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: ClientHooks) -> None:
+        """
+        Unregister a hook.
+
+        Parameters
+        ----------
+        hook : ClientHooks
+            The hook to remove.
+
+        Raises
+        ------
+        ValueError
+            If the hook is not registered.
+        """
+        self._hooks.remove(hook)
+
+    def start_span(self, name: str, *, kind: str) -> Span:
+        """
+        Start a span without making it current.
+
+        Parameters
+        ----------
+        name : str
+            Operation name.
+        kind : str
+            Operation kind.
+
+        Returns
+        -------
+        Span
+            The running span; call :meth:`Span.end` when the operation is done.
+        """
+        parent = _current_span.get()
+        span = Span(
+            name=name,
+            kind=kind,
+            parent_id=parent.span_id if parent is not None else None,
+            recording=bool(self._hooks),
+            _tracer=self,
+        )
+        self._dispatch("on_span_start", span)
+        return span
+
+    @contextmanager
+    def activate(self, span: Span) -> Iterator[Span]:
+        """
+        Make a span current for the duration of the block.
+
+        Parameters
+        ----------
+        span : Span
+            The span to activate.
+
+        Yields
+        ------
+        Span
+            The activated span.
+        """
+        token = _current_span.set(span)
+        try:
+            yield span
+        finally:
+            _current_span.reset(token)
+
+    @contextmanager
+    def span(self, name: str, *, kind: str) -> Iterator[Span]:
+        """
+        Run the block inside a new current span.
+
+        Parameters
+        ----------
+        name : str
+            Operation name.
+        kind : str
+            Operation kind.
+
+        Yields
+        ------
+        Span
+            The running span. It ends when the block exits, recording any error
+            raised in it.
+        """
+        span = self.start_span(name, kind=kind)
+        try:
+            with self.activate(span):
+                yield span
+        except Exception as exc:
+            span.record_error(exc)
+            raise
+        finally:
+            span.end()
+
+    async def stream(
+        self, span: Span, stream: AsyncIterator[Any]
+    ) -> AsyncIterator[Any]:
+        """
+        Iterate a stream inside a span that ends with the stream.
+
+        The span is current only while the next item is produced, never while
+        the consumer handles it.
+
+        Parameters
+        ----------
+        span : Span
+            The span of the stream.
+        stream : AsyncIterator[Any]
+            The stream to iterate.
+
+        Yields
+        ------
+        Any
+            The items of ``stream``.
+        """
+        try:
+            while True:
+                with self.activate(span):
+                    try:
+                        item = await anext(stream)
+                    except StopAsyncIteration:
+                        return
+                yield item
+        except Exception as exc:
+            span.record_error(exc)
+            raise
+        finally:
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                with self.activate(span):
+                    await aclose()
+            span.end()
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """
+        Build an ``aiohttp`` trace config that reports into the current span.
+
+        Requests made outside a span are not recorded.
+
+        Returns
+        -------
+        aiohttp.TraceConfig
+            Trace config to pass to an ``aiohttp.ClientSession``.
+        """
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_request_chunk_sent.append(self._on_request_chunk_sent)
+        trace_config.on_request_end.append(self._on_request_end)
+        trace_config.on_response_chunk_received.append(self._on_response_chunk)
+        return trace_config
+
+    def _dispatch(self, method: str, span: Span, *args: Any) -> None:
+        """
+        Call one method on every hook, logging their errors.
+        """
+        if not span.recording:
+            return
+        for hook in self._hooks:
+            try:
+                getattr(hook, method)(span, *args)
+            except Exception:
+                logger.warning(
+                    "Tracing hook %r failed in %s", hook, method, exc_info=True
+                )
+
+    async def _on_request_start(
+        self,
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceRequestStartParams,
+    ) -> None:
+        """
+        Attach the current span to the request and count the request.
+        """
+        span = _current_span.get()
+        context.gpp_span = span if span is not None and span.recording else None
+        if context.gpp_span is None:
+            return
+        span.add(SpanAttribute.REQUESTS, 1)
+        span.set_attribute(SpanAttribute.HTTP_METHOD, params.method)
+        # Drop the query string; presigned URLs carry credentials in it.
+        span.set_attribute(SpanAttribute.URL, str(params.url.with_query(None)))
+
+    async def _on_request_chunk_sent(
+        self,
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceRequestChunkSentParams,
+    ) -> None:
+        """
+        Count bytes of the request body.
+        """
+        if (span := getattr(context, "gpp_span", None)) is not None:
+            span.add(SpanAttribute.REQUEST_BYTES, len(params.chunk))
+
+    async def _on_request_end(
+        self,
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceRequestEndParams,
+    ) -> None:
+        """
+        Record the status and, for the first response, the time to first byte.
+        """
+        if (span := getattr(context, "gpp_span", None)) is None:
+            return
+        span.set_attribute(SpanAttribute.HTTP_STATUS, params.response.status)
+        if SpanAttribute.TIME_TO_FIRST_BYTE not in span.attributes:
+            span.set_attribute(SpanAttribute.TIME_TO_FIRST_BYTE, span.elapsed())
+
+    async def _on_response_chunk(
+        self,
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceResponseChunkReceivedParams,
+    ) -> None:
+        """
+        Count bytes of a response body read in full.
+        """
+        if (span := getattr(context, "gpp_span", None)) is not None:
+            span.add(SpanAttribute.RESPONSE_BYTES, len(params.chunk))
+
+
+def current_span() -> Span | None:
+    """
+    Return the span of the running operation.
+
+    Returns
+    -------
+    Span | None
+        The current span, or ``None`` outside an operation.
+    """
+    return _current_span.get()
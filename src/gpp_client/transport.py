@@ -0,0 +1,268 @@
+"""
+Shared HTTP transport for the GPP client.
+
+GraphQL requests and the external site status pages go through one
+``httpx.AsyncClient``, which keeps one connection pool per host. The REST client
+keeps its own ``aiohttp`` pool but reports into the same counters through
+:meth:`HTTPTransport.trace_config`, so the client's socket and TLS handshake
+usage can be read from a single place.
+"""
+
+__all__ = ["HTTPTransport", "HostStats", "TransportStats"]
+
+import logging
+from collections import Counter
+from collections.abc import Generator
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class HostStats:
+    """
+    Request and connection counters for one host.
+
+    Attributes
+    ----------
+    requests : int
+        Requests sent to the host.
+    connections : int
+        TCP connections opened to the host.
+    tls_handshakes : int
+        TLS handshakes completed with the host.
+    """
+
+    requests: int = 0
+    connections: int = 0
+    tls_handshakes: int = 0
+
+
+@dataclass(frozen=True)
+class TransportStats:
+    """
+    Snapshot of the transport counters.
+
+    Attributes
+    ----------
+    hosts : dict[str, HostStats]
+        Counters keyed by host name.
+    """
+
+    hosts: dict[str, HostStats] = field(default_factory=dict)
+
+    @property
+    def requests(self) -> int:
+        """
+        Total requests across all hosts.
+
+        Returns
+        -------
+        int
+            Number of requests sent.
+        """
+        return sum(host.requests for host in self.hosts.values())
+
+    @property
+    def connections(self) -> int:
+        """
+        Total TCP connections opened across all hosts.
+
+        Returns
+        -------
+        int
+            Number of connections opened.
+        """
+        return sum(host.connections for host in self.hosts.values())
+
+    @property
+    def tls_handshakes(self) -> int:
+        """
+        Total TLS handshakes across all hosts.
+
+        Returns
+        -------
+        int
+            Number of TLS handshakes completed.
+        """
+        return sum(host.tls_handshakes for host in self.hosts.values())
+
+
+class _HostBearerAuth(httpx.Auth):
+    """
+    Bearer token auth applied only to requests for one host.
+
+    The shared client also fetches public pages from other hosts, which must
+    never receive the GPP token.
+    """
+
+    def __init__(self, token: str, host: str) -> None:
+        self._token = token
+        self._host = host
+
+    def auth_flow(
+        self, request: httpx.Request
+    ) -> Generator[httpx.Request, httpx.Response, None]:
+        if request.url.host == self._host:
+            request.headers["Authorization"] = f"Bearer {self._token}"
+        yield request
+
+
+class HTTPTransport:
+    """
+    HTTP connection pool and instrumentation shared by every domain.
+
+    GraphQL and the site status pages share the ``httpx.AsyncClient`` pool. The
+    REST client does not: it keeps its own ``aiohttp`` pool, so ``GPPClient``
+    still holds two pools -- and two sets of TLS sessions -- to the GPP host. Its
+    requests and connections are only counted here, through
+    :meth:`trace_config`.
+
+    The transport owns its ``httpx.AsyncClient``; closing it is the job of whoever
+    built it -- normally ``GPPClient.close()``.
+
+    Parameters
+    ----------
+    timeout : httpx.Timeout
+        Timeouts for requests made through :attr:`http_client`.
+    auth_token : str | None, optional
+        Bearer token sent to ``auth_host``.
+    auth_host : str | None, optional
+        Host that receives ``auth_token``. Requests to other hosts are sent
+        without credentials.
+    transport : httpx.AsyncBaseTransport | None, optional
+        Lower-level ``httpx`` transport to send requests through, for example an
+        ``httpx.MockTransport`` in tests. Defaults to ``httpx``'s pooled transport.
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: httpx.Timeout,
+        auth_token: str | None = None,
+        auth_host: str | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.timeout = timeout
+        self._counts: Counter[tuple[str, str]] = Counter()
+
+        auth = None
+        if auth_token is not None and auth_host is not None:
+            auth = _HostBearerAuth(auth_token, auth_host)
+
+        self.http_client = httpx.AsyncClient(
+            timeout=timeout,
+            auth=auth,
+            transport=transport,
+            event_hooks={"request": [self._on_httpx_request]},
+        )
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """
+        Build an ``aiohttp`` trace config that reports into this transport.
+
+        Returns
+        -------
+        aiohttp.TraceConfig
+            Trace config to pass to an ``aiohttp.ClientSession``.
+        """
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self._on_aiohttp_request_start)
+        trace_config.on_connection_create_end.append(
+            self._on_aiohttp_connection_create_end
+        )
+        return trace_config
+
+    def stats(self) -> TransportStats:
+        """
+        Report the request and connection counters.
+
+        Returns
+        -------
+        TransportStats
+            Counters keyed by host.
+        """
+        hosts: dict[str, dict[str, int]] = {}
+        for (host, metric), count in self._counts.items():
+            hosts.setdefault(host, {})[metric] = count
+        return TransportStats(
+            hosts={host: HostStats(**metrics) for host, metrics in hosts.items()}
+        )
+
+    def open_connections(self) -> int:
+        """
+        Count the connections currently held by the ``httpx`` pool.
+
+        Returns
+        -------
+        int
+            Open connections, or 0 when a custom transport exposes no pool.
+        """
+        pool = getattr(self.http_client._transport, "_pool", None)
+        connections = getattr(pool, "connections", None) or []
+        return sum(1 for connection in connections if not connection.is_closed())
+
+    async def close(self) -> None:
+        """
+        Close the shared ``httpx`` client and its connections.
+        """
+        await self.http_client.aclose()
+
+    async def __aenter__(self) -> "HTTPTransport":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def _on_httpx_request(self, request: httpx.Request) -> None:
+        """
+        Count an ``httpx`` request and trace its connection setup.
+        """
+        host = request.url.host
+        self._counts[host, "requests"] += 1
+
+        downstream = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                self._counts[host, "connections"] += 1
+            elif event_name == "connection.start_tls.complete":
+                self._counts[host, "tls_handshakes"] += 1
+            if downstream is not None:
+                await downstream(event_name, info)
+
+        request.extensions["trace"] = trace
+
+    async def _on_aiohttp_request_start(
+        self,
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceRequestStartParams,
+    ) -> None:
+        """
+        Count an ``aiohttp`` request and remember its host for the connection.
+        """
+        context.host = params.url.host
+        context.secure = params.url.scheme == "https"
+        self._counts[context.host, "requests"] += 1
+
+    async def _on_aiohttp_connection_create_end(
+        self,
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceConnectionCreateEndParams,
+    ) -> None:
+        """
+        Count a new ``aiohttp`` connection, including its TLS handshake.
+        """
+        host = getattr(context, "host", None)
+        if host is None:
+            return
+        self._counts[host, "connections"] += 1
+        if context.secure:
+            self._counts[host, "tls_handshakes"] += 1
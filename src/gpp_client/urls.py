@@ -19,39 +19,50 @@ class Endpoint(str, Enum):
     WEBSOCKET = "/ws"
 
 
-def get_graphql_url(environment: GPPEnvironment) -> str:
+def get_graphql_url(environment: GPPEnvironment | str) -> str:
     """
     Return the GraphQL URL for an environment.
 
     Parameters
     ----------
-    environment : GPPEnvironment
-        The environment for which to construct the GraphQL URL.
+    environment : GPPEnvironment | str
+        The environment, or the base URL of a service, for which to construct
+        the GraphQL URL.
 
     Returns
     -------
     str
         The GraphQL URL for the given environment.
     """
-    return urljoin(environment.base_url, Endpoint.GRAPHQL.value)
+    return urljoin(_base_url(environment), Endpoint.GRAPHQL.value)
 
 
-def get_ws_url(environment: GPPEnvironment) -> str:
+def get_ws_url(environment: GPPEnvironment | str) -> str:
     """
     Return the WebSocket URL for an environment.
 
     Parameters
     ----------
-    environment : GPPEnvironment
-        The environment for which to construct the WebSocket URL.
+    environment : GPPEnvironment | str
+        The environment, or the base URL of a service, for which to construct
+        the WebSocket URL.
 
     Returns
     -------
     str
         The WebSocket URL for the given environment.
     """
-    parsed = urlsplit(environment.base_url)
+    parsed = urlsplit(_base_url(environment))
     ws_scheme = "wss" if parsed.scheme == "https" else "ws"
     return urlunsplit(
         (ws_scheme, parsed.netloc, Endpoint.WEBSOCKET.value, "", ""),
     )
+
+
+def _base_url(environment: GPPEnvironment | str) -> str:
+    """
+    Return the base URL of an environment, or a base URL given as is.
+    """
+    if isinstance(environment, GPPEnvironment):
+        return environment.base_url
+    return environment
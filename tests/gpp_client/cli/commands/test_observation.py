@@ -87,19 +87,26 @@ def test_get_observation_fails_with_multiple_selectors(runner, cli_app) -> None:
     assert "Selectors are mutually exclusive" in result.output
 
 
+@pytest.mark.parametrize(
+    ("extra_args", "method_name"),
+    [([], "list_summaries"), (["--full"], "get_all")],
+)
 def test_list_observations_dispatches_correctly(
     runner,
     cli_app,
     mocker,
     dummy_async_client_factory,
+    extra_args: list[str],
+    method_name: str,
 ) -> None:
     """
-    Ensure observation list dispatches correctly.
+    Ensure observation list fetches summaries unless full details are requested.
     """
     result_model = {"items": []}
 
     observation = SimpleNamespace(
         get_all=mocker.AsyncMock(return_value=result_model),
+        list_summaries=mocker.AsyncMock(return_value=result_model),
     )
 
     mocker.patch(
@@ -120,11 +127,12 @@ def test_list_observations_dispatches_correctly(
             "abc",
             "--limit",
             "10",
+            *extra_args,
         ],
     )
 
     assert result.exit_code == 0
-    observation.get_all.assert_called_once_with(
+    getattr(observation, method_name).assert_called_once_with(
         include_deleted=True,
         offset="abc",
         limit=10,
@@ -4,6 +4,8 @@ Tests for target CLI commands.
 
 from types import SimpleNamespace
 
+import pytest
+
 
 def test_get_target_dispatches_correctly(
     runner,
@@ -82,19 +84,26 @@ def test_get_target_fails_with_no_selector(runner, cli_app) -> None:
     assert "Exactly one selector is required" in result.output
 
 
+@pytest.mark.parametrize(
+    ("extra_args", "method_name"),
+    [([], "list_summaries"), (["--full"], "get_all")],
+)
 def test_list_targets_dispatches_correctly(
     runner,
     cli_app,
     mocker,
     dummy_async_client_factory,
+    extra_args: list[str],
+    method_name: str,
 ) -> None:
     """
-    Ensure target list dispatches correctly.
+    Ensure target list fetches summaries unless full details are requested.
     """
     result_model = {"items": []}
 
     target = SimpleNamespace(
         get_all=mocker.AsyncMock(return_value=result_model),
+        list_summaries=mocker.AsyncMock(return_value=result_model),
     )
 
     mocker.patch(
@@ -115,11 +124,12 @@ def test_list_targets_dispatches_correctly(
             "abc",
             "--limit",
             "10",
+            *extra_args,
         ],
     )
 
     assert result.exit_code == 0
-    target.get_all.assert_called_once_with(
+    getattr(target, method_name).assert_called_once_with(
         include_deleted=True,
         offset="abc",
         limit=10,
@@ -2,9 +2,12 @@
 Tests for the CLI entry point and core commands.
 """
 
+import json
 from types import SimpleNamespace
 
 from gpp_client.cli.cli import CLIState, main_callback
+from gpp_client.metrics import CacheMetrics, ClientMetrics, OperationMetrics
+from gpp_client.profiling import FieldCost, OperationProfile, ProfileReport
 
 
 def test_cli_help(runner, cli_app):
@@ -108,6 +111,7 @@ def test_registered_commands_exist(runner, cli_app) -> None:
 
     assert result.exit_code == 0
     assert "ping" in result.output
+    assert "stats" in result.output
     assert "observation" in result.output
     assert "program" in result.output
     assert "attachment" in result.output
@@ -125,3 +129,105 @@ def test_no_args_does_error(runner, cli_app) -> None:
     result = runner.invoke(cli_app, [])
 
     assert result.exit_code != 0
+
+
+def _write_metrics(tmp_path):
+    """
+    Save a small metrics snapshot and return its path.
+    """
+    metrics = ClientMetrics(
+        operations={"ping": OperationMetrics(kind="graphql", calls=2, p50=0.5)},
+        caches={"download_urls": CacheMetrics(hits=3, misses=1, size=1)},
+    )
+    path = tmp_path / "metrics.json"
+    path.write_text(json.dumps(metrics.to_dict()))
+    return path
+
+
+def test_stats_prints_json(runner, cli_app, mocker, tmp_path) -> None:
+    """
+    Ensure stats prints a saved snapshot as JSON.
+    """
+    json_mock = mocker.patch("gpp_client.cli.cli.output.json")
+
+    result = runner.invoke(cli_app, ["stats", str(_write_metrics(tmp_path))])
+
+    assert result.exit_code == 0
+    (data,), _ = json_mock.call_args
+    assert data["operations"]["ping"]["calls"] == 2
+    assert data["caches"]["download_urls"]["hit_rate"] == 0.75
+
+
+def test_stats_prints_prometheus(runner, cli_app, tmp_path) -> None:
+    """
+    Ensure stats renders the Prometheus text format.
+    """
+    path = _write_metrics(tmp_path)
+
+    result = runner.invoke(cli_app, ["stats", str(path), "--format", "prometheus"])
+
+    assert result.exit_code == 0
+    assert (
+        'gpp_operation_duration_seconds_count{operation="ping",kind="graphql"} 2'
+        in result.output
+    )
+
+
+def test_stats_defaults_to_metrics_file_setting(
+    runner, cli_app, monkeypatch, tmp_path
+) -> None:
+    """
+    Ensure stats reads the file named by GPP_METRICS_FILE.
+    """
+    monkeypatch.setenv("GPP_METRICS_FILE", str(_write_metrics(tmp_path)))
+
+    result = runner.invoke(cli_app, ["stats", "--format", "prometheus"])
+
+    assert result.exit_code == 0
+    assert "gpp_cache_hits_total" in result.output
+
+
+def test_stats_missing_file_fails(runner, cli_app, tmp_path) -> None:
+    """
+    Ensure stats exits with an error when there is no snapshot.
+    """
+    result = runner.invoke(cli_app, ["stats", str(tmp_path / "missing.json")])
+
+    assert result.exit_code == 1
+
+
+def test_profile_prints_largest_fields(runner, cli_app, tmp_path) -> None:
+    """
+    Ensure profile renders the largest fields of a saved report.
+    """
+    report = ProfileReport(
+        operations={
+            "getObservations": OperationProfile(
+                responses=1,
+                bytes=100,
+                fields={
+                    "observations": FieldCost(bytes=98),
+                    "observations.matches.observingMode": FieldCost(
+                        fragment_path="ObservationDetails.observingMode", bytes=60
+                    ),
+                },
+            )
+        }
+    )
+    path = tmp_path / "profile.json"
+    path.write_text(json.dumps(report.to_dict()))
+
+    result = runner.invoke(cli_app, ["profile", str(path), "--top", "1"])
+
+    assert result.exit_code == 0
+    assert "observations" in result.output
+    assert "ObservationDetails.observingMode" not in result.output
+
+
+def test_profile_missing_file_fails(runner, cli_app, tmp_path) -> None:
+    """
+    Ensure profile exits with an error when there is no report.
+    """
+    result = runner.invoke(cli_app, ["profile", str(tmp_path / "missing.json")])
+
+    assert result.exit_code == 1
@@ -1,5 +1,8 @@
 """Tests for the main GPP client."""
 
+import json
+import subprocess
+import sys
 from types import SimpleNamespace
 
 import httpx
@@ -7,6 +10,16 @@ import pytest
 
 from gpp_client.client import _HTTP_TIMEOUT, GPPClient
 from gpp_client.environment import GPPEnvironment
+from gpp_client.domains import SiteStatusDomain
+from gpp_client.metrics import ClientMetrics, MetricsCollector
+from gpp_client.rest import (
+    AtomDigestCache,
+    PresignedURLCache,
+    RESTClient,
+    RESTConnectorOptions,
+)
+from gpp_client.tracing import SpanAttribute, Tracer
+from gpp_client.transport import HTTPTransport
 
 
 @pytest.fixture()
@@ -19,6 +32,16 @@ def mock_settings() -> SimpleNamespace:
         resolved_token="resolved-token",
         token="raw-token",
         environment=SimpleNamespace(base_url="https://example.test"),
+        base_url="https://example.test",
+        atom_digest_cache_size=0,
+        rest_connection_limit=50,
+        rest_connection_limit_per_host=10,
+        rest_dns_cache_ttl=300,
+        rest_keepalive_timeout=30.0,
+        collect_metrics=True,
+        metrics_file=None,
+        profile_file=None,
+        model_backend="pydantic",
     )
 
 
@@ -59,7 +82,7 @@ def test_init_builds_settings_and_core_clients(
 
     client = GPPClient(token="abc", debug=True)
 
-    build_settings.assert_called_once_with(token="abc", debug=True)
+    build_settings.assert_called_once_with(token="abc", debug=True, base_url=None)
     build_graphql.assert_called_once_with()
     build_rest.assert_called_once_with()
     init_domains.assert_called_once_with()
@@ -67,6 +90,8 @@ def test_init_builds_settings_and_core_clients(
     assert client.settings is mock_settings
     assert client.graphql is graphql_client
     assert client.rest is rest_client
+    assert isinstance(client.tracer, Tracer)
+    assert client._metrics in client.tracer.hooks
 
 
 def test_init_enables_dev_logging_when_debug_true(
@@ -109,7 +134,7 @@ def test_build_graphql_client_uses_expected_settings(
     """
     Ensure the GraphQL client is constructed from settings.
     """
-    graphql_cls = mocker.patch("gpp_client.client.GraphQLClient")
+    graphql_cls = mocker.patch("gpp_client.client.TracedGraphQLClient")
     get_ws_url = mocker.patch(
         "gpp_client.client.get_ws_url",
         return_value="wss://ws.example.test",
@@ -120,11 +145,13 @@ def test_build_graphql_client_uses_expected_settings(
     )
 
     bare_client._settings = mock_settings
+    bare_client._transport = HTTPTransport(timeout=_HTTP_TIMEOUT)
+    bare_client._tracer = Tracer()
 
     bare_client._build_graphql_client()
 
-    get_ws_url.assert_called_once_with(mock_settings.environment)
-    get_graphql_url.assert_called_once_with(mock_settings.environment)
+    get_ws_url.assert_called_once_with(mock_settings.base_url)
+    get_graphql_url.assert_called_once_with(mock_settings.base_url)
     graphql_cls.assert_called_once_with(
         url="https://graphql.example.test",
         headers={"Authorization": "Bearer resolved-token"},
@@ -132,14 +159,63 @@ def test_build_graphql_client_uses_expected_settings(
         ws_url="wss://ws.example.test",
         ws_headers={"Authorization": "Bearer resolved-token"},
         ws_connection_init_payload={"Authorization": "Bearer resolved-token"},
+        tracer=bare_client._tracer,
     )
 
-    # The custom http client must carry the auth headers and a timeout longer
-    # than the 5 second httpx default.
+    # GraphQL goes through the shared transport's pool.
     http_client = graphql_cls.call_args.kwargs["http_client"]
+    assert http_client is bare_client._transport.http_client
+
+
+def test_build_graphql_client_uses_struct_client_for_msgspec_backend(
+    bare_client,
+    mock_settings,
+) -> None:
+    """
+    Ensure the msgspec model backend builds the struct-decoding client.
+    """
+    struct_client = pytest.importorskip("gpp_client.struct_client")
+    mock_settings.model_backend = "msgspec"
+    bare_client._settings = mock_settings
+    bare_client._transport = HTTPTransport(timeout=_HTTP_TIMEOUT)
+    bare_client._tracer = Tracer()
+
+    graphql = bare_client._build_graphql_client()
+
+    assert isinstance(graphql, struct_client.TracedStructGraphQLClient)
+    assert graphql.tracer is bare_client._tracer
+
+
+def test_build_transport_scopes_token_to_graphql_host(
+    mocker,
+    bare_client,
+    mock_settings,
+) -> None:
+    """
+    Ensure the shared transport authenticates only requests to the GPP host.
+    """
+    mocker.patch(
+        "gpp_client.client.get_graphql_url",
+        return_value="https://graphql.example.test/odb",
+    )
+    bare_client._settings = mock_settings
+
+    transport = bare_client._build_transport()
+
+    # The timeout must be longer than the 5 second httpx default.
+    http_client = transport.http_client
     assert isinstance(http_client, httpx.AsyncClient)
-    assert http_client.headers["Authorization"] == "Bearer resolved-token"
     assert http_client.timeout == _HTTP_TIMEOUT
+    assert "Authorization" not in http_client.headers
+
+    flow = http_client.auth.auth_flow(
+        httpx.Request("POST", "https://graphql.example.test/odb")
+    )
+    assert next(flow).headers["Authorization"] == "Bearer resolved-token"
+    flow = http_client.auth.auth_flow(
+        httpx.Request("GET", "https://www.gemini.edu/status.html")
+    )
+    assert "Authorization" not in next(flow).headers
 
 
 def test_build_rest_client_uses_expected_settings(
@@ -151,17 +227,54 @@ def test_build_rest_client_uses_expected_settings(
     Ensure the REST client is constructed from settings.
     """
     rest_cls = mocker.patch("gpp_client.client.RESTClient")
+    trace_config = object()
 
     bare_client._settings = mock_settings
+    bare_client._transport = SimpleNamespace(
+        trace_config=mocker.Mock(return_value=trace_config)
+    )
+    bare_client._tracer = Tracer()
 
     bare_client._build_rest_client()
 
     rest_cls.assert_called_once_with(
         base_url="https://example.test",
         gpp_token="resolved-token",
+        atom_digest_cache=None,
+        connector_options=RESTConnectorOptions(
+            limit=50,
+            limit_per_host=10,
+            ttl_dns_cache=300,
+            keepalive_timeout=30.0,
+        ),
+        connect_timeout=_HTTP_TIMEOUT.connect,
+        trace_configs=[trace_config],
+        tracer=bare_client._tracer,
     )
 
 
+def test_build_rest_client_enables_atom_digest_cache(
+    mocker,
+    bare_client,
+    mock_settings,
+) -> None:
+    """
+    Ensure a positive cache size attaches an atom digest cache.
+    """
+    rest_cls = mocker.patch("gpp_client.client.RESTClient")
+    mock_settings.atom_digest_cache_size = 50
+
+    bare_client._settings = mock_settings
+    bare_client._transport = SimpleNamespace(trace_config=mocker.Mock())
+    bare_client._tracer = Tracer()
+
+    bare_client._build_rest_client()
+
+    cache = rest_cls.call_args.kwargs["atom_digest_cache"]
+    assert isinstance(cache, AtomDigestCache)
+    assert cache.max_entries == 50
+
+
 def test_init_domains_uses_shared_domain_kwargs(
     mocker,
     bare_client,
@@ -219,6 +332,7 @@ def test_init_domains_uses_shared_domain_kwargs(
 
     bare_client._graphql = object()
     bare_client._rest = object()
+    bare_client._transport = object()
     bare_client._settings = mock_settings
 
     bare_client._init_domains()
@@ -237,7 +351,7 @@ def test_init_domains_uses_shared_domain_kwargs(
     goats_cls.assert_called_once_with(**expected_domain_kwargs)
     atom_cls.assert_called_once_with(**expected_domain_kwargs)
     attachment_cls.assert_called_once_with(**expected_domain_kwargs)
-    site_status_cls.assert_called_once_with()
+    site_status_cls.assert_called_once_with(transport=bare_client._transport)
 
     assert bare_client.scheduler is scheduler_domain
     assert bare_client.target is target_domain
@@ -256,14 +370,98 @@ async def test_close_delegates_to_rest_client(
     bare_client,
 ) -> None:
     """
-    Ensure close delegates to the REST client.
+    Ensure close delegates to site status, the REST client and the transport.
     """
+    site_status = SimpleNamespace(close=mocker.AsyncMock())
     rest_client = SimpleNamespace(close=mocker.AsyncMock())
+    transport = SimpleNamespace(close=mocker.AsyncMock())
+    bare_client.site_status = site_status
     bare_client._rest = rest_client
+    bare_client._transport = transport
+    bare_client._settings = SimpleNamespace(metrics_file=None, profile_file=None)
 
     await bare_client.close()
 
+    site_status.close.assert_called_once_with()
     rest_client.close.assert_called_once_with()
+    transport.close.assert_called_once_with()
+
+
+def _metrics_client(bare_client: GPPClient) -> GPPClient:
+    """
+    Wire ``bare_client`` with real metrics sources and no network.
+    """
+    bare_client._tracer = Tracer()
+    bare_client._metrics = MetricsCollector()
+    bare_client._tracer.add_hook(bare_client._metrics)
+    bare_client._transport = HTTPTransport(timeout=_HTTP_TIMEOUT)
+    bare_client._rest = RESTClient(
+        base_url="https://example.test",
+        gpp_token="token",
+        atom_digest_cache=AtomDigestCache(4),
+    )
+    bare_client.attachment = SimpleNamespace(download_urls=PresignedURLCache())
+    return bare_client
+
+
+def test_metrics_combines_spans_caches_and_connections(bare_client) -> None:
+    """
+    Ensure metrics reports operations, caches and open connections together.
+    """
+    client = _metrics_client(bare_client)
+    with client.tracer.span("get_atom_digests", kind="rest") as span:
+        span.add(SpanAttribute.RETRIES, 1)
+    client.rest.atom_digest_cache.lookup(["o-1"])
+
+    metrics = client.metrics()
+
+    assert metrics.operations["get_atom_digests"].calls == 1
+    assert metrics.retries == 1
+    assert metrics.caches["atom_digests"].misses == 1
+    assert metrics.caches["download_urls"].hit_rate == 0.0
+    assert metrics.connections == {"graphql": 0, "rest": 0, "websocket": 0}
+
+    client.reset_metrics()
+    assert client.metrics().operations == {}
+
+
+@pytest.mark.parametrize(
+    ("env", "collecting"),
+    [
+        ({}, False),
+        ({"GPP_COLLECT_METRICS": "1"}, True),
+        ({"GPP_METRICS_FILE": "metrics.json"}, True),
+    ],
+)
+def test_metrics_are_collected_only_on_request(monkeypatch, env, collecting) -> None:
+    """
+    Ensure no hook is registered, and spans do not measure, unless asked.
+    """
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+
+    client = GPPClient(token="token")
+
+    assert (client._metrics is not None) is collecting
+    assert bool(client.tracer.hooks) is collecting
+
+
+@pytest.mark.asyncio
+async def test_close_writes_metrics_file(bare_client, tmp_path) -> None:
+    """
+    Ensure close saves the metrics snapshot when a metrics file is configured.
+    """
+    client = _metrics_client(bare_client)
+    client.site_status = SiteStatusDomain(transport=client.transport)
+    path = tmp_path / "out" / "metrics.json"
+    client._settings = SimpleNamespace(metrics_file=path, profile_file=None)
+    with client.tracer.span("ping", kind="graphql"):
+        pass
+
+    await client.close()
+
+    saved = ClientMetrics.from_dict(json.loads(path.read_text()))
+    assert saved.operations["ping"].calls == 1
 
 
 @pytest.mark.asyncio
@@ -384,3 +582,22 @@ def test_build_settings_without_explicit_token_uses_default_sources(
     packaged_environment.assert_not_called()
     settings_cls.assert_called_once_with(debug=True)
     assert result is settings_instance
+
+
+def test_importing_client_defers_generated_models() -> None:
+    """
+    Ensure importing the client leaves the result models and inputs unimported.
+    """
+    code = (
+        "import sys, gpp_client.client; "
+        "print(sorted(name for name in sys.modules "
+        "if name.startswith('gpp_client.generated.')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert "gpp_client.generated.client" in result.stdout
+    assert "gpp_client.generated.get_observations'" not in result.stdout
+    assert "gpp_client.generated.input_types" not in result.stdout
+    assert "gpp_client.generated.operations.observation" not in result.stdout
@@ -0,0 +1,154 @@
+"""Tests for client metrics aggregation and export."""
+
+import pytest
+
+from gpp_client.metrics import (
+    CacheMetrics,
+    ClientMetrics,
+    MetricsCollector,
+    OperationMetrics,
+    SubscriptionMetrics,
+)
+from gpp_client.tracing import SpanAttribute, Tracer
+from gpp_client.transport import HostStats, TransportStats
+
+
+@pytest.fixture()
+def collector() -> MetricsCollector:
+    """
+    Return an empty metrics collector.
+    """
+    return MetricsCollector()
+
+
+@pytest.fixture()
+def tracer(collector: MetricsCollector) -> Tracer:
+    """
+    Return a tracer reporting to ``collector``.
+    """
+    return Tracer([collector])
+
+
+def test_collector_aggregates_counters_and_percentiles(tracer, collector) -> None:
+    """
+    Ensure finished spans are summed and their durations ranked.
+    """
+    for index in range(100):
+        span = tracer.start_span("get_atom_digests", kind="rest")
+        span.set_attribute(SpanAttribute.REQUEST_BYTES, 10)
+        span.set_attribute(SpanAttribute.RESPONSE_BYTES, 100)
+        if index % 10 == 0:
+            span.set_attribute(SpanAttribute.RETRIES, 1)
+        span.start_time_ns, span.end_time_ns = 0, (index + 1) * 1_000_000
+        collector.on_span_end(span)
+    with pytest.raises(ValueError):
+        with tracer.span("get_atom_digests", kind="rest"):
+            raise ValueError("boom")
+
+    operations, subscriptions = collector.snapshot()
+
+    op = operations["get_atom_digests"]
+    assert (op.kind, op.calls, op.errors) == ("rest", 101, 1)
+    assert (op.bytes_sent, op.bytes_received, op.retries) == (1000, 10000, 10)
+    assert op.p50 == pytest.approx(0.050)
+    assert op.p95 == pytest.approx(0.095)
+    assert op.p99 == pytest.approx(0.099)
+    assert op.total_time >= sum(range(1, 101)) / 1000
+    assert subscriptions == {}
+
+    collector.reset()
+    assert collector.snapshot() == ({}, {})
+
+
+def test_collector_bounds_samples() -> None:
+    """
+    Ensure percentiles only use the most recent durations.
+    """
+    collector = MetricsCollector(max_samples=2)
+    tracer = Tracer([collector])
+    for duration_ms in (900, 1, 2):
+        span = tracer.start_span("op", kind="graphql")
+        span.start_time_ns, span.end_time_ns = 0, duration_ms * 1_000_000
+        collector.on_span_end(span)
+
+    (op,) = collector.snapshot()[0].values()
+    assert op.calls == 3
+    assert op.p99 == pytest.approx(0.002)
+
+    with pytest.raises(ValueError):
+        MetricsCollector(max_samples=0)
+
+
+def test_collector_counts_running_subscriptions(tracer, collector) -> None:
+    """
+    Ensure open subscription streams are reported as active with their events.
+    """
+    running = tracer.start_span("obs_calculation_update", kind="graphql.subscription")
+    running.add(SpanAttribute.EVENTS, 3)
+    finished = tracer.start_span("obs_calculation_update", kind="graphql.subscription")
+    finished.add(SpanAttribute.EVENTS, 2)
+    finished.end()
+
+    _, subscriptions = collector.snapshot()
+
+    sub = subscriptions["obs_calculation_update"]
+    assert (sub.events, sub.active) == (5, 1)
+    assert sub.elapsed > 0
+    assert sub.events_per_second > 0
+
+    running.end()
+    _, subscriptions = collector.snapshot()
+    assert subscriptions["obs_calculation_update"].active == 0
+
+
+def test_client_metrics_round_trips_through_dict() -> None:
+    """
+    Ensure a saved snapshot rebuilds to an equal one.
+    """
+    metrics = ClientMetrics(
+        operations={
+            "ping": OperationMetrics(kind="graphql", calls=2, bytes_sent=5, retries=1)
+        },
+        subscriptions={"updates": SubscriptionMetrics(events=4, elapsed=2.0)},
+        caches={"download_urls": CacheMetrics(hits=1, misses=1, size=1)},
+        connections={"graphql": 1, "rest": 0, "websocket": 0},
+        transport=TransportStats(hosts={"gpp.test": HostStats(requests=2)}),
+    )
+
+    data = metrics.to_dict()
+
+    assert data["subscriptions"]["updates"]["events_per_second"] == 2.0
+    assert data["caches"]["download_urls"]["hit_rate"] == 0.5
+    assert (data["bytes_sent"], data["retries"]) == (5, 1)
+    assert ClientMetrics.from_dict(data) == metrics
+
+
+def test_client_metrics_to_prometheus() -> None:
+    """
+    Ensure the snapshot renders as Prometheus text with escaped labels.
+    """
+    metrics = ClientMetrics(
+        operations={
+            'we"ird': OperationMetrics(kind="rest", calls=4, total_time=1.5, p50=0.25)
+        },
+        connections={"rest": 2},
+        transport=TransportStats(hosts={"gpp.test": HostStats(tls_handshakes=1)}),
+    )
+
+    lines = metrics.to_prometheus().splitlines()
+
+    assert "# TYPE gpp_operation_duration_seconds summary" in lines
+    assert (
+        'gpp_operation_duration_seconds{operation="we\\"ird",kind="rest",'
+        'quantile="0.5"} 0.25'
+    ) in lines
+    assert (
+        'gpp_operation_duration_seconds_sum{operation="we\\"ird",kind="rest"} 1.5'
+        in lines
+    )
+    assert (
+        'gpp_operation_duration_seconds_count{operation="we\\"ird",kind="rest"} 4'
+        in lines
+    )
+    assert 'gpp_open_connections{pool="rest"} 2' in lines
+    assert 'gpp_host_tls_handshakes_total{host="gpp.test"} 1' in lines
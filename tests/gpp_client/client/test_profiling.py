@@ -0,0 +1,121 @@
+"""Tests for response-size and field-cost profiling."""
+
+import json
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from gpp_client import GPPClient
+from gpp_client.generated import GetObservations
+from gpp_client.profiling import ProfileReport, ResponseProfiler
+from gpp_client.testing import build_payload
+from gpp_client.traced_client import TracedGraphQLClient
+from gpp_client.tracing import Tracer
+
+
+def _profiled_client(profiler: ResponseProfiler, data: dict) -> TracedGraphQLClient:
+    """
+    Build a traced client reporting to ``profiler`` that always answers ``data``.
+    """
+    content = json.dumps({"data": data}).encode()
+    return TracedGraphQLClient(
+        url="https://graphql.example.test/odb",
+        http_client=httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, content=content)
+            )
+        ),
+        tracer=Tracer([profiler]),
+    )
+
+
+@pytest.mark.asyncio
+async def test_profile_breaks_response_down_by_field_and_fragment() -> None:
+    """
+    Ensure sizes add up by path and fields are attributed to their fragments.
+    """
+    data = build_payload(GetObservations)
+    profiler = ResponseProfiler()
+    client = _profiled_client(profiler, data)
+
+    for _ in range(2):
+        await client.get_observations(include_deleted=False)
+
+    profile = profiler.report().operations["getObservations"]
+    size = len(json.dumps(data, separators=(",", ":")))
+    assert profile.responses == 2
+    assert profile.bytes == 2 * size
+    assert profile.validation_time > 0
+
+    fields = profile.fields
+    assert fields["observations"].bytes == profile.bytes - 2 * 2
+    assert fields["observations"].fragment_path is None
+    mode = fields["observations.matches.observingMode"]
+    assert mode.fragment_path == "ObservationDetails.observingMode"
+    assert mode.count == 2
+    assert mode.validation_time > 0
+    long_slit = "observations.matches.observingMode.gmosNorthLongSlit"
+    assert fields[long_slit].fragment_path == "ObservingModeDetails.gmosNorthLongSlit"
+    grating = fields[f"{long_slit}.grating"]
+    assert grating.fragment_path == "GmosNorthLongSlitDetails.grating"
+    children = [
+        cost.bytes
+        for path, cost in fields.items()
+        if path.startswith("observations.matches.observingMode.")
+        and path.count(".") == 3
+    ]
+    assert mode.bytes > sum(children)
+
+
+@pytest.mark.asyncio
+async def test_profile_without_result_model_records_sizes_only() -> None:
+    """
+    Ensure custom operations are profiled by size under their operation name.
+    """
+    profiler = ResponseProfiler()
+    client = _profiled_client(profiler, {"a": [1, 2, 3]})
+
+    with client.tracer.span("custom", kind="graphql"):
+        response = await client.execute("query q { a }", operation_name="q")
+        client.get_data(response)
+
+    profile = profiler.report().operations["q"]
+    assert profile.fields["a"].bytes == len('"a":[1,2,3]')
+    assert profile.fields["a"].count == 3
+    assert profile.validation_time == 0
+
+
+def test_report_round_trips_and_renders() -> None:
+    """
+    Ensure a saved report loads back and lists the largest fields first.
+    """
+    profiler = ResponseProfiler()
+    span = SimpleNamespace(name="q")
+    profiler.on_response(span, "query q { a b { c } }", {"a": "x", "b": {"c": 1}})
+
+    report = profiler.report()
+    loaded = ProfileReport.from_dict(json.loads(json.dumps(report.to_dict())))
+    text = loaded.to_text(top=1)
+
+    assert loaded == report
+    assert text.splitlines()[0] == "q: 1 responses, 21 bytes, 0.0 ms validation"
+    assert text.splitlines()[-1].endswith("  b")
+    assert len(text.splitlines()) == 3
+
+    profiler.reset()
+    assert profiler.report().operations == {}
+
+
+@pytest.mark.asyncio
+async def test_client_writes_profile_file(monkeypatch, tmp_path) -> None:
+    """
+    Ensure the profile_file setting enables profiling and saves the report.
+    """
+    path = tmp_path / "profile.json"
+    monkeypatch.setenv("GPP_PROFILE_FILE", str(path))
+
+    async with GPPClient(token="token") as client:
+        assert any(isinstance(hook, ResponseProfiler) for hook in client.tracer.hooks)
+
+    assert ProfileReport.from_dict(json.loads(path.read_text())).operations == {}
@@ -122,6 +122,20 @@ def test_environment_uses_override() -> None:
     assert settings.environment is GPPEnvironment.DEVELOPMENT
 
 
+def test_base_url_uses_override() -> None:
+    """
+    Ensure base_url_override replaces the environment's URL.
+    """
+    settings = GPPSettings(environment_override=GPPEnvironment.DEVELOPMENT)
+    assert settings.base_url == GPPEnvironment.DEVELOPMENT.base_url
+
+    settings = GPPSettings(
+        environment_override=GPPEnvironment.DEVELOPMENT,
+        base_url_override="http://127.0.0.1:8080",
+    )
+    assert settings.base_url == "http://127.0.0.1:8080"
+
+
 def test_environment_uses_packaged_environment(mocker) -> None:
     """
     Ensure packaged environment is used when no override.
@@ -232,3 +246,20 @@ def test_settings_source_order_with_app_toml(
     assert sources[:3] == ("init", "env", "dotenv")
     assert isinstance(sources[3], TomlConfigSettingsSource)
     assert sources[4] == "secrets"
+
+
+def test_rest_connection_settings_read_from_environment(monkeypatch) -> None:
+    """
+    Ensure REST connection pool settings can be set through the environment.
+    """
+    monkeypatch.setenv("GPP_REST_CONNECTION_LIMIT", "20")
+    monkeypatch.setenv("GPP_REST_CONNECTION_LIMIT_PER_HOST", "5")
+    monkeypatch.setenv("GPP_REST_DNS_CACHE_TTL", "600")
+    monkeypatch.setenv("GPP_REST_KEEPALIVE_TIMEOUT", "45")
+
+    settings = GPPSettings()
+
+    assert settings.rest_connection_limit == 20
+    assert settings.rest_connection_limit_per_host == 5
+    assert settings.rest_dns_cache_ttl == 600
+    assert settings.rest_keepalive_timeout == 45.0
@@ -0,0 +1,149 @@
+"""Tests for the msgspec struct backend."""
+
+import inspect
+import json
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+pytest.importorskip("msgspec")
+
+from gpp_client import generated  # noqa: E402
+from gpp_client.domains import WorkflowStateDomain  # noqa: E402
+from gpp_client.generated import structs  # noqa: E402
+from gpp_client.generated.enums import ObservationWorkflowState  # noqa: E402
+from gpp_client.generated.exceptions import GraphQLClientGraphQLMultiError  # noqa: E402
+from gpp_client.struct_client import TracedStructGraphQLClient  # noqa: E402
+from gpp_client.testing import build_payload  # noqa: E402
+from gpp_client.tracing import (  # noqa: E402
+    ClientHooks,
+    InMemoryCollector,
+    SpanAttribute,
+    Tracer,
+)
+
+RESULT_NAMES = sorted(
+    {
+        result.__name__
+        for name in list(vars(generated.GraphQLClient))
+        if not name.startswith("_")
+        and inspect.iscoroutinefunction(
+            method := getattr(generated.GraphQLClient, name)
+        )
+        and issubclass(result := inspect.signature(method).return_annotation, BaseModel)
+    }
+)
+
+
+def _struct_client(tracer: Tracer, handler) -> TracedStructGraphQLClient:
+    """
+    Build a struct client answering requests with ``handler``.
+    """
+    return TracedStructGraphQLClient(
+        url="https://graphql.example.test/odb",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        tracer=tracer,
+    )
+
+
+@pytest.mark.parametrize("name", RESULT_NAMES)
+def test_structs_dump_like_models(name: str) -> None:
+    """
+    Ensure every result struct decodes the data its model validates the same way.
+    """
+    model = getattr(generated, name)
+    data = build_payload(model)
+    struct = structs.StructGraphQLClient.convert_struct(
+        None, data, getattr(structs, name)
+    )
+    result = model.model_validate(data)
+
+    assert struct.model_dump() == result.model_dump()
+    assert struct.model_dump(mode="json") == result.model_dump(mode="json")
+    assert struct.model_dump(by_alias=True) == result.model_dump(by_alias=True)
+
+
+@pytest.mark.asyncio
+async def test_operation_decodes_into_structs() -> None:
+    """
+    Ensure operations return structs and record the decode on their span.
+    """
+    collector = InMemoryCollector()
+    data = build_payload(generated.GetObservations, list_size=2)
+    content = json.dumps({"data": data}).encode()
+    client = _struct_client(
+        Tracer([collector]), lambda request: httpx.Response(200, content=content)
+    )
+
+    result = await client.get_observations(include_deleted=False)
+
+    assert isinstance(result, structs.GetObservations)
+    assert len(result.observations.matches) == 2
+    assert result.observations.has_more == data["observations"]["hasMore"]
+    (span,) = collector.spans
+    assert span.name == "get_observations"
+    assert span.attributes[SpanAttribute.RESPONSE_BYTES] == len(content)
+    assert span.attributes[SpanAttribute.JSON_DECODE_TIME] > 0
+    assert span.attributes[SpanAttribute.VALIDATION_TIME] >= 0
+
+
+@pytest.mark.asyncio
+async def test_graphql_errors_are_raised() -> None:
+    """
+    Ensure responses with errors raise like the Pydantic client.
+    """
+    body = {"data": None, "errors": [{"message": "Not allowed."}]}
+    client = _struct_client(Tracer(), lambda request: httpx.Response(200, json=body))
+
+    with pytest.raises(GraphQLClientGraphQLMultiError, match="Not allowed."):
+        await client.ping()
+
+
+@pytest.mark.asyncio
+async def test_hooks_receive_response_data() -> None:
+    """
+    Ensure response hooks get the data under its GraphQL field names.
+    """
+
+    class Responses(ClientHooks):
+        def __init__(self) -> None:
+            self.seen: list[dict] = []
+
+        def on_response(self, span, query, data) -> None:
+            self.seen.append(data)
+
+    hook = Responses()
+    body = {"data": {"programs": {"matches": [{"id": "p-1"}]}}}
+    client = _struct_client(
+        Tracer([hook]), lambda request: httpx.Response(200, json=body)
+    )
+
+    result = await client.ping()
+
+    assert result.programs.matches[0].id == "p-1"
+    assert hook.seen == [body["data"]]
+
+
+@pytest.mark.asyncio
+async def test_workflow_state_already_set_returns_struct() -> None:
+    """
+    Ensure an unchanged workflow is returned as the mutation's struct.
+    """
+    data = build_payload(generated.GetObservationWorkflowStateById)
+    workflow = data["observation"]["workflow"]
+    workflow["state"] = "READY"
+    workflow["value"]["state"] = "DEFINED"
+    client = _struct_client(
+        Tracer(), lambda request: httpx.Response(200, json={"data": data})
+    )
+    domain = WorkflowStateDomain(graphql=client, rest=None, settings=None)
+
+    result = await domain.update_by_id(
+        "o-1", workflow_state=ObservationWorkflowState.DEFINED
+    )
+
+    assert isinstance(
+        result, structs.SetObservationWorkflowStateSetObservationWorkflowState
+    )
+    assert result.model_dump(by_alias=True) == workflow["value"]
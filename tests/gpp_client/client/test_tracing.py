@@ -0,0 +1,398 @@
+"""Tests for tracing spans and hooks."""
+
+import asyncio
+import json
+
+import aiohttp
+import httpx
+import pytest
+from aiohttp import web
+
+from gpp_client.traced_client import TracedGraphQLClient
+from gpp_client.tracing import (
+    ClientHooks,
+    InMemoryCollector,
+    OpenTelemetryHooks,
+    SpanAttribute,
+    Tracer,
+    current_span,
+)
+
+
+@pytest.fixture()
+def collector() -> InMemoryCollector:
+    """
+    Return an empty in-memory collector.
+    """
+    return InMemoryCollector()
+
+
+@pytest.fixture()
+def tracer(collector: InMemoryCollector) -> Tracer:
+    """
+    Return a tracer reporting to ``collector``.
+    """
+    return Tracer([collector])
+
+
+def test_span_records_nesting_and_errors(tracer, collector) -> None:
+    """
+    Ensure spans nest through the context and record errors.
+    """
+    with tracer.span("outer", kind="rest") as outer:
+        assert current_span() is outer
+        with pytest.raises(ValueError):
+            with tracer.span("inner", kind="rest"):
+                raise ValueError("bad id")
+    assert current_span() is None
+
+    inner, outer = collector.spans
+    assert inner.parent_id == outer.span_id
+    assert inner.error == "bad id"
+    assert inner.attributes[SpanAttribute.ERROR_TYPE] == "ValueError"
+    assert outer.error is None
+    assert outer.duration >= inner.duration >= 0
+
+
+def test_spans_without_hooks_are_not_recorded() -> None:
+    """
+    Ensure a tracer without hooks skips measurements.
+    """
+    with Tracer().span("op", kind="rest") as span:
+        span.add(SpanAttribute.REQUESTS, 1)
+
+    assert not span.recording
+    assert span.attributes == {}
+
+
+def test_failing_hook_does_not_break_operation(tracer, collector) -> None:
+    """
+    Ensure an exception from a hook is logged and ignored.
+    """
+
+    class Broken(ClientHooks):
+        def on_span_start(self, span) -> None:
+            raise RuntimeError("hook bug")
+
+    tracer.add_hook(Broken())
+    with tracer.span("op", kind="rest"):
+        pass
+
+    assert [span.name for span in collector.spans] == ["op"]
+
+
+def test_in_memory_collector_keeps_most_recent_spans() -> None:
+    """
+    Ensure the collector is bounded and can be cleared.
+    """
+    collector = InMemoryCollector(max_spans=2)
+    tracer = Tracer([collector])
+    for name in ("a", "b", "c"):
+        with tracer.span(name, kind="rest"):
+            pass
+
+    assert [span.name for span in collector.spans] == ["b", "c"]
+    assert len(collector.by_name("c")) == 1
+    collector.clear()
+    assert len(collector) == 0
+
+
+def test_opentelemetry_hooks_export_spans() -> None:
+    """
+    Ensure spans are forwarded to an OpenTelemetry-style tracer.
+    """
+    started = []
+
+    class FakeSpan:
+        def __init__(self, name, attributes, start_time) -> None:
+            self.name = name
+            self.attributes = dict(attributes)
+            self.start_time = start_time
+            self.end_time = None
+
+        def set_attribute(self, key, value) -> None:
+            self.attributes[key] = value
+
+        def set_status(self, status) -> None:
+            self.status = status
+
+        def end(self, end_time=None) -> None:
+            self.end_time = end_time
+
+    class FakeTracer:
+        def start_span(self, name, attributes=None, start_time=None, **kwargs):
+            started.append(FakeSpan(name, attributes, start_time))
+            return started[-1]
+
+    tracer = Tracer([OpenTelemetryHooks(FakeTracer())])
+    with tracer.span("get_atom_digests", kind="rest") as span:
+        span.add(SpanAttribute.REQUESTS, 2)
+
+    (exported,) = started
+    assert exported.name == "get_atom_digests"
+    assert exported.start_time == span.start_time_ns
+    assert exported.end_time == span.end_time_ns
+    assert exported.attributes["gpp.span.kind"] == "rest"
+    assert exported.attributes["gpp.requests"] == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_activates_span_only_while_producing(tracer, collector) -> None:
+    """
+    Ensure a stream's span is current inside the stream but not in the consumer.
+    """
+    seen = []
+
+    async def numbers():
+        for number in range(2):
+            seen.append(current_span())
+            yield number
+
+    span = tracer.start_span("stream", kind="rest")
+    consumer_spans = []
+    async for _ in tracer.stream(span, numbers()):
+        consumer_spans.append(current_span())
+
+    assert seen == [span, span]
+    assert consumer_spans == [None, None]
+    assert collector.spans == [span]
+
+
+@pytest.mark.asyncio
+async def test_trace_config_records_into_current_span(tracer, collector) -> None:
+    """
+    Ensure aiohttp requests made in a span add their bytes and status.
+    """
+
+    async def handler(request: web.Request) -> web.Response:
+        await request.read()
+        return web.Response(text="x" * 300)
+
+    app = web.Application()
+    app.router.add_post("/atoms", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    try:
+        async with aiohttp.ClientSession(
+            trace_configs=[tracer.trace_config()]
+        ) as session:
+            with tracer.span("get_atom_digests", kind="rest"):
+                async with session.post(
+                    f"http://127.0.0.1:{port}/atoms?token=secret", data=b"o-1\no-2"
+                ) as response:
+                    await response.text()
+            # Outside a span nothing is recorded.
+            async with session.post(f"http://127.0.0.1:{port}/atoms") as response:
+                await response.text()
+    finally:
+        await runner.cleanup()
+
+    (span,) = collector.spans
+    assert span.attributes[SpanAttribute.REQUESTS] == 1
+    assert span.attributes[SpanAttribute.REQUEST_BYTES] == 7
+    assert span.attributes[SpanAttribute.RESPONSE_BYTES] == 300
+    assert span.attributes[SpanAttribute.HTTP_STATUS] == 200
+    assert span.attributes[SpanAttribute.URL] == f"http://127.0.0.1:{port}/atoms"
+    assert span.attributes[SpanAttribute.TIME_TO_FIRST_BYTE] >= 0
+
+
+def _graphql_client(tracer: Tracer, handler) -> TracedGraphQLClient:
+    """
+    Build a traced client answering requests with ``handler``.
+    """
+    return TracedGraphQLClient(
+        url="https://graphql.example.test/odb",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        tracer=tracer,
+    )
+
+
+@pytest.mark.asyncio
+async def test_graphql_operation_span(tracer, collector) -> None:
+    """
+    Ensure a generated operation reports request, decode and validation data.
+    """
+    body = {"data": {"programs": {"matches": [{"id": "p-1"}]}}}
+    content = json.dumps(body).encode()
+    client = _graphql_client(
+        tracer, lambda request: httpx.Response(200, content=content)
+    )
+
+    result = await client.ping()
+
+    assert result.programs.matches[0].id == "p-1"
+    (span,) = collector.spans
+    assert (span.name, span.kind) == ("ping", "graphql")
+    attributes = span.attributes
+    assert attributes[SpanAttribute.OPERATION_NAME] == "ping"
+    assert attributes[SpanAttribute.HTTP_STATUS] == 200
+    assert attributes[SpanAttribute.REQUEST_BYTES] > 0
+    assert attributes[SpanAttribute.RESPONSE_BYTES] == len(content)
+    assert attributes[SpanAttribute.JSON_DECODE_TIME] >= 0
+    assert attributes[SpanAttribute.VALIDATION_TIME] >= 0
+    assert attributes[SpanAttribute.VARIABLES_BYTES] == 0
+
+
+@pytest.mark.asyncio
+async def test_graphql_error_is_recorded(tracer, collector) -> None:
+    """
+    Ensure a failing operation ends its span with the error.
+    """
+    client = _graphql_client(tracer, lambda request: httpx.Response(500, text="down"))
+
+    with pytest.raises(Exception):
+        await client.ping()
+
+    (span,) = collector.spans
+    assert span.attributes[SpanAttribute.HTTP_STATUS] == 500
+    assert span.attributes[SpanAttribute.ERROR_TYPE] == "GraphQLClientHttpError"
+
+
+@pytest.mark.asyncio
+async def test_graphql_direct_execute_gets_own_span(tracer, collector) -> None:
+    """
+    Ensure ``execute`` called directly is traced under the operation name.
+    """
+    client = _graphql_client(
+        tracer, lambda request: httpx.Response(200, json={"data": {}})
+    )
+
+    await client.execute("query q { a }", operation_name="q", variables={"x": 1})
+
+    (span,) = collector.spans
+    assert span.name == "q"
+    assert span.attributes[SpanAttribute.VARIABLES_BYTES] == len('{"x": 1}')
+
+
+class _FakeWebSocket:
+    """
+    Websocket stub replaying graphql-transport-ws frames.
+    """
+
+    def __init__(self, frames: list[dict]) -> None:
+        self._frames = [json.dumps(frame) for frame in frames]
+        self.sent: list[str] = []
+
+    async def send(self, message: str) -> None:
+        self.sent.append(message)
+
+    async def close(self) -> None:
+        self._frames.clear()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> str:
+        await asyncio.sleep(0)
+        if not self._frames:
+            raise StopAsyncIteration
+        return self._frames.pop(0)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_graphql_subscription_span(tracer, collector, mocker) -> None:
+    """
+    Ensure a subscription span lasts for the stream and counts its events.
+    """
+    update = {
+        "obscalcUpdate": {
+            "editType": "UPDATED",
+            "newCalculationState": None,
+            "observationId": "o-1",
+            "oldCalculationState": None,
+            "value": None,
+        }
+    }
+    frames = [
+        {"type": "connection_ack"},
+        {"type": "next", "id": "1", "payload": {"data": update}},
+        {"type": "next", "id": "1", "payload": {"data": update}},
+        {"type": "complete", "id": "1"},
+    ]
+    websocket = _FakeWebSocket(frames)
+    mocker.patch(
+        "gpp_client.generated.async_base_client.ws_connect",
+        return_value=websocket,
+    )
+    client = TracedGraphQLClient(ws_url="wss://example.test/ws", tracer=tracer)
+
+    events = [event async for event in client.obs_calculation_update(program_id="p-1")]
+
+    assert len(events) == 2
+    (span,) = collector.spans
+    assert (span.name, span.kind) == ("obs_calculation_update", "graphql.subscription")
+    assert span.attributes[SpanAttribute.EVENTS] == 2
+    assert span.attributes[SpanAttribute.OPERATION_NAME] == "ObsCalculationUpdate"
+    assert span.attributes[SpanAttribute.RESPONSE_BYTES] == sum(
+        len(json.dumps(frame)) for frame in frames
+    )
+    assert span.attributes[SpanAttribute.VALIDATION_TIME] >= 0
+    assert current_span() is None
+
+
+@pytest.mark.asyncio
+async def test_hooks_receive_response_data(mocker) -> None:
+    """
+    Ensure hooks get the query and data of responses and subscription events.
+    """
+
+    class Responses(ClientHooks):
+        def __init__(self) -> None:
+            self.seen: list[tuple[str, str, dict]] = []
+
+        def on_response(self, span, query, data) -> None:
+            self.seen.append((span.name, query, data))
+
+    hook = Responses()
+    tracer = Tracer([hook])
+    body = {"data": {"programs": {"matches": [{"id": "p-1"}]}}}
+    client = _graphql_client(tracer, lambda request: httpx.Response(200, json=body))
+    await client.ping()
+
+    update = {
+        "obscalcUpdate": {
+            "editType": "UPDATED",
+            "newCalculationState": None,
+            "observationId": "o-1",
+            "oldCalculationState": None,
+            "value": None,
+        }
+    }
+    mocker.patch(
+        "gpp_client.generated.async_base_client.ws_connect",
+        return_value=_FakeWebSocket(
+            [
+                {"type": "connection_ack"},
+                {"type": "next", "id": "1", "payload": {"data": update}},
+                {"type": "complete", "id": "1"},
+            ]
+        ),
+    )
+    client = TracedGraphQLClient(ws_url="wss://example.test/ws", tracer=tracer)
+    async for _ in client.obs_calculation_update(program_id="p-1"):
+        pass
+
+    (ping, ping_query, ping_data), (sub, sub_query, sub_data) = hook.seen
+    assert (ping, ping_data) == ("ping", body["data"])
+    assert "query ping" in ping_query
+    assert (sub, sub_data) == ("obs_calculation_update", update)
+    assert "subscription ObsCalculationUpdate" in sub_query
+
+
+def test_traced_client_wraps_generated_operations() -> None:
+    """
+    Ensure every public generated operation is wrapped, and only those.
+    """
+    assert TracedGraphQLClient.ping.__wrapped__ is not None
+    assert TracedGraphQLClient.observation_edit.__wrapped__ is not None
+    assert not hasattr(TracedGraphQLClient.get_data, "__wrapped__")
@@ -0,0 +1,124 @@
+"""
+Tests for the shared HTTP transport.
+"""
+
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from yarl import URL
+
+from gpp_client.transport import HostStats, HTTPTransport, TransportStats
+
+_TIMEOUT = httpx.Timeout(5.0)
+
+
+@pytest.mark.asyncio
+async def test_requests_are_counted_per_host() -> None:
+    """
+    Ensure httpx requests are counted by host.
+    """
+    transport = HTTPTransport(
+        timeout=_TIMEOUT,
+        transport=httpx.MockTransport(lambda request: httpx.Response(200)),
+    )
+
+    async with transport:
+        await transport.http_client.get("https://a.example.test/x")
+        await transport.http_client.get("https://a.example.test/y")
+        await transport.http_client.get("https://b.example.test/")
+
+    stats = transport.stats()
+    assert stats.hosts["a.example.test"] == HostStats(requests=2)
+    assert stats.hosts["b.example.test"] == HostStats(requests=1)
+    assert stats.requests == 3
+
+
+@pytest.mark.asyncio
+async def test_token_is_sent_only_to_auth_host() -> None:
+    """
+    Ensure the bearer token never leaks to other hosts.
+    """
+    seen: dict[str, str | None] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen[request.url.host] = request.headers.get("Authorization")
+        return httpx.Response(200)
+
+    transport = HTTPTransport(
+        timeout=_TIMEOUT,
+        auth_token="secret",
+        auth_host="gpp.example.test",
+        transport=httpx.MockTransport(handler),
+    )
+
+    async with transport:
+        await transport.http_client.post("https://gpp.example.test/odb")
+        await transport.http_client.get("https://www.gemini.edu/status.html")
+
+    assert seen == {
+        "gpp.example.test": "Bearer secret",
+        "www.gemini.edu": None,
+    }
+
+
+@pytest.mark.asyncio
+async def test_httpx_trace_counts_connections_and_chains() -> None:
+    """
+    Ensure connection trace events are counted and passed to a caller's trace.
+    """
+    transport = HTTPTransport(timeout=_TIMEOUT)
+    events: list[str] = []
+
+    async def caller_trace(event_name, info) -> None:
+        events.append(event_name)
+
+    request = httpx.Request(
+        "GET", "https://a.example.test/", extensions={"trace": caller_trace}
+    )
+    await transport._on_httpx_request(request)
+    trace = request.extensions["trace"]
+    await trace("connection.connect_tcp.complete", {})
+    await trace("connection.start_tls.complete", {})
+    await transport.close()
+
+    assert transport.stats().hosts["a.example.test"] == HostStats(
+        requests=1, connections=1, tls_handshakes=1
+    )
+    assert events == [
+        "connection.connect_tcp.complete",
+        "connection.start_tls.complete",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_trace_counts_requests_and_connections() -> None:
+    """
+    Ensure the aiohttp trace hooks report into the same counters.
+    """
+    transport = HTTPTransport(timeout=_TIMEOUT)
+    trace_config = transport.trace_config()
+    context = SimpleNamespace()
+    params = SimpleNamespace(url=URL("https://rest.example.test/scheduler/atoms"))
+
+    await trace_config.on_request_start[0](None, context, params)
+    await trace_config.on_connection_create_end[0](None, context, None)
+    await transport.close()
+
+    assert transport.stats().hosts["rest.example.test"] == HostStats(
+        requests=1, connections=1, tls_handshakes=1
+    )
+
+
+def test_transport_stats_totals() -> None:
+    """
+    Ensure totals sum across hosts.
+    """
+    stats = TransportStats(
+        hosts={
+            "a": HostStats(requests=2, connections=1, tls_handshakes=1),
+            "b": HostStats(requests=3, connections=2, tls_handshakes=0),
+        }
+    )
+
+    assert (stats.requests, stats.connections, stats.tls_handshakes) == (5, 3, 1)
@@ -40,3 +40,11 @@ def test_get_ws_url(env: GPPEnvironment, expected_scheme: str) -> None:
     assert url.startswith(f"{expected_scheme}://")
     assert url.endswith("/ws")
     assert env.base_url.split("://")[1] in url
+
+
+def test_urls_accept_base_url() -> None:
+    """
+    Ensure a plain base URL is used as given, e.g. for a local server.
+    """
+    assert get_graphql_url("http://127.0.0.1:8080") == "http://127.0.0.1:8080/odb"
+    assert get_ws_url("http://127.0.0.1:8080") == "ws://127.0.0.1:8080/ws"
@@ -6,6 +6,8 @@ from types import SimpleNamespace
 
 import pytest
 
+from gpp_client.tracing import Tracer
+
 
 @pytest.fixture()
 def graphql(mocker):
@@ -20,7 +22,7 @@ def rest(mocker):
     """
     Return a reusable mocked REST client.
     """
-    return mocker.Mock()
+    return mocker.Mock(tracer=Tracer())
 
 
 @pytest.fixture()
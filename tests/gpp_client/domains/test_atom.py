@@ -0,0 +1,82 @@
+"""
+Tests for the atom domain.
+"""
+
+import pytest
+
+from gpp_client.domains.atom import AtomDomain
+from gpp_client.rest.cache import AtomDigestCache, AtomDigestCacheStats
+
+
+@pytest.fixture()
+def atom_domain(domain_kwargs) -> AtomDomain:
+    """
+    Return an atom domain instance.
+    """
+    return AtomDomain(**domain_kwargs)
+
+
+@pytest.mark.asyncio
+async def test_get_digests_delegates_to_rest(
+    atom_domain: AtomDomain,
+    rest,
+    mocker,
+) -> None:
+    """
+    Ensure digests are requested through the REST client.
+    """
+    rest.get_atom_digests = mocker.AsyncMock(return_value="o-1\trow")
+
+    result = await atom_domain.get_digests(observation_ids=["o-1"])
+
+    assert result == "o-1\trow"
+    rest.get_atom_digests.assert_awaited_once_with(["o-1"], accept_gzip=True)
+
+
+@pytest.mark.asyncio
+async def test_get_digests_forwards_chunking_options(
+    atom_domain: AtomDomain,
+    rest,
+    mocker,
+) -> None:
+    """
+    Ensure explicit chunking options reach the REST client.
+    """
+    rest.get_atom_digests = mocker.AsyncMock(return_value="")
+
+    await atom_domain.get_digests(
+        observation_ids=["o-1"], accept_gzip=False, chunk_size=10, max_concurrency=2
+    )
+
+    rest.get_atom_digests.assert_awaited_once_with(
+        ["o-1"], accept_gzip=False, chunk_size=10, max_concurrency=2
+    )
+
+
+def test_invalidate_digests_delegates_to_rest(atom_domain: AtomDomain, rest) -> None:
+    """
+    Ensure invalidation is forwarded to the REST client.
+    """
+    atom_domain.invalidate_digests(observation_ids=["o-1"])
+
+    rest.invalidate_atom_digests.assert_called_once_with(["o-1"])
+
+
+def test_get_cache_stats_returns_none_without_cache(
+    atom_domain: AtomDomain, rest
+) -> None:
+    """
+    Ensure no stats are reported when caching is disabled.
+    """
+    rest.atom_digest_cache = None
+
+    assert atom_domain.get_cache_stats() is None
+
+
+def test_get_cache_stats_returns_cache_counters(atom_domain: AtomDomain, rest) -> None:
+    """
+    Ensure the stats of the configured cache are returned.
+    """
+    rest.atom_digest_cache = AtomDigestCache(max_entries=5)
+
+    assert atom_domain.get_cache_stats() == AtomDigestCacheStats(max_entries=5)
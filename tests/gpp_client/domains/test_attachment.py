@@ -2,20 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 from pathlib import Path
 from types import SimpleNamespace
 
 import pytest
+from aiohttp import ClientConnectionError
 
 from gpp_client.domains.attachment import (
     AttachmentDomain,
+    DownloadResult,
     _build_update_params,
+    _content_range_resumes,
+    _content_range_total,
     _build_upload_params,
     _filename_from_presigned_url,
     _remove_headers_middleware,
     _resolve_download_dir,
+    _write_partial_state,
 )
-from gpp_client.exceptions import GPPClientError, GPPResponseError
+from gpp_client.exceptions import GPPClientError, GPPResponseError, GPPValidationError
 from gpp_client.generated.enums import AttachmentType
 
 
@@ -180,7 +187,6 @@ async def test_upload_returns_attachment_id(
         post=mocker.Mock(return_value=DummyResponseContext(response)),
     )
     rest.get_session = mocker.AsyncMock(return_value=session)
-    mocker.patch.object(attachment_domain, "resolve_content", return_value=b"data")
     mocker.patch.object(attachment_domain, "raise_for_status", new=mocker.AsyncMock())
 
     result = await attachment_domain.upload(
@@ -210,7 +216,6 @@ async def test_upload_raises_for_empty_attachment_id(
         post=mocker.Mock(return_value=DummyResponseContext(response)),
     )
     rest.get_session = mocker.AsyncMock(return_value=session)
-    mocker.patch.object(attachment_domain, "resolve_content", return_value=b"data")
     mocker.patch.object(attachment_domain, "raise_for_status", new=mocker.AsyncMock())
 
     with pytest.raises(GPPClientError):
@@ -236,7 +241,6 @@ async def test_upload_reraises_response_error(
         post=mocker.Mock(return_value=DummyResponseContext(response)),
     )
     rest.get_session = mocker.AsyncMock(return_value=session)
-    mocker.patch.object(attachment_domain, "resolve_content", return_value=b"data")
     mocker.patch.object(
         attachment_domain,
         "raise_for_status",
@@ -252,6 +256,50 @@ async def test_upload_reraises_response_error(
         )
 
 
+@pytest.mark.asyncio
+async def test_upload_streams_file_from_disk(
+    attachment_domain,
+    rest,
+    mocker,
+    tmp_path: Path,
+) -> None:
+    """
+    Ensure upload streams file_path in chunks with an explicit length.
+    """
+    file_path = tmp_path / "chart.fits"
+    file_path.write_bytes(b"0123456789")
+    sent_chunks: list[bytes] = []
+
+    def post(url, *, params, data, headers):
+        async def consume():
+            async for chunk in data:
+                sent_chunks.append(chunk)
+            return "att-1"
+
+        response = SimpleNamespace(status=201, text=consume)
+        assert headers == {"Content-Length": "10"}
+        return DummyResponseContext(response)
+
+    rest.get_session = mocker.AsyncMock(return_value=SimpleNamespace(post=post))
+    mocker.patch.object(attachment_domain, "raise_for_status", new=mocker.AsyncMock())
+    read_bytes = mocker.spy(Path, "read_bytes")
+    progress = []
+
+    result = await attachment_domain.upload(
+        "p-1",
+        attachment_type=AttachmentType.FINDER,
+        file_name="chart.fits",
+        file_path=file_path,
+        chunk_size=4,
+        progress=lambda sent, total: progress.append((sent, total)),
+    )
+
+    assert result == "att-1"
+    assert sent_chunks == [b"0123", b"4567", b"89"]
+    assert progress == [(4, 10), (8, 10), (10, 10)]
+    read_bytes.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_delete_by_id_dispatches_correctly(
     attachment_domain,
@@ -292,7 +340,6 @@ async def test_update_by_id_dispatches_correctly(
         put=mocker.Mock(return_value=DummyResponseContext(response)),
     )
     rest.get_session = mocker.AsyncMock(return_value=session)
-    mocker.patch.object(attachment_domain, "resolve_content", return_value=b"data")
     raise_for_status = mocker.patch.object(
         attachment_domain,
         "raise_for_status",
@@ -306,7 +353,12 @@ async def test_update_by_id_dispatches_correctly(
         content=b"data",
     )
 
-    session.put.assert_called_once()
+    session.put.assert_called_once_with(
+        "/attachment/att-1",
+        params={"fileName": "file.txt", "description": "hello"},
+        data=b"data",
+        headers={"Content-Length": "4"},
+    )
     raise_for_status.assert_awaited_once_with(response, ok_statuses={200, 201})
 
 
@@ -362,6 +414,7 @@ async def test_download_by_id_downloads_file(
 
     response = SimpleNamespace(
         status=200,
+        headers={},
         content=content,
     )
     session = SimpleNamespace(
@@ -458,3 +511,898 @@ async def test_attachment_graphql_methods_dispatch_correctly(
 
     assert result is result_model
     getattr(graphql, graphql_name).assert_called_once_with(**kwargs)
+
+
+def _download_response(status: int, body: bytes = b"", headers=None):
+    """
+    Build a fake presigned download response streaming ``body``.
+    """
+
+    async def iter_chunked(chunk_size):
+        for start in range(0, len(body), chunk_size):
+            yield body[start : start + chunk_size]
+
+    return SimpleNamespace(
+        status=status,
+        headers=headers or {},
+        content=SimpleNamespace(iter_chunked=iter_chunked),
+    )
+
+
+def test_content_range_total_parses_complete_length() -> None:
+    """
+    Ensure the complete length is read from Content-Range.
+    """
+    assert _content_range_total("bytes */1234") == 1234
+    assert _content_range_total("bytes 0-9/10") == 10
+    assert _content_range_total("bytes 0-9/*") is None
+    assert _content_range_total(None) is None
+
+
+@pytest.mark.asyncio
+async def test_download_by_id_resumes_partial_file(
+    attachment_domain,
+    rest,
+    mocker,
+    tmp_path: Path,
+) -> None:
+    """
+    Ensure a leftover .part file is resumed with a Range request.
+    """
+    (tmp_path / "file.txt.part").write_bytes(b"hello ")
+    _write_partial_state(tmp_path / "file.txt.part", {"validator": '"v1"', "size": 11})
+    mocker.patch.object(
+        attachment_domain,
+        "get_download_url_by_id",
+        new=mocker.AsyncMock(return_value="https://example.test/file.txt"),
+    )
+    session = SimpleNamespace(
+        get=mocker.Mock(
+            return_value=DummyResponseContext(
+                _download_response(
+                    206, b"world", headers={"Content-Range": "bytes 6-10/11"}
+                )
+            )
+        )
+    )
+    rest.get_session = mocker.AsyncMock(return_value=session)
+
+    result = await attachment_domain.download_by_id("att-1", save_to=tmp_path)
+
+    assert result.read_bytes() == b"hello world"
+    assert not (tmp_path / "file.txt.part").exists()
+    assert not (tmp_path / "file.txt.part.json").exists()
+    assert session.get.call_args.kwargs["headers"] == {
+        "Range": "bytes=6-",
+        "If-Range": '"v1"',
+    }
+
+
+@pytest.mark.asyncio
+async def test_download_by_id_restarts_when_range_is_ignored(
+    attachment_domain,
+    rest,
+    mocker,
+    tmp_path: Path,
+) -> None:
+    """
+    Ensure a full 200 response replaces the partial content.
+    """
+    (tmp_path / "file.txt.part").write_bytes(b"stale")
+    mocker.patch.object(
+        attachment_domain,
+        "get_download_url_by_id",
+        new=mocker.AsyncMock(return_value="https://example.test/file.txt"),
+    )
+    session = SimpleNamespace(
+        get=mocker.Mock(
+            return_value=DummyResponseContext(_download_response(200, b"fresh"))
+        )
+    )
+    rest.get_session = mocker.AsyncMock(return_value=session)
+
+    result = await attachment_domain.download_by_id("att-1", save_to=tmp_path)
+
+    assert result.read_bytes() == b"fresh"
+
+
+@pytest.mark.asyncio
+async def test_download_by_id_discards_partial_larger_than_remote(
+    attachment_domain,
+    rest,
+    mocker,
+    tmp_path: Path,
+) -> None:
+    """
+    Ensure a 416 for a changed remote file restarts the download.
+    """
+    (tmp_path / "file.txt.part").write_bytes(b"much too long")
+    _write_partial_state(tmp_path / "file.txt.part", {"validator": '"v1"', "size": 13})
+    mocker.patch.object(
+        attachment_domain,
+        "get_download_url_by_id",
+        new=mocker.AsyncMock(return_value="https://example.test/file.txt"),
+    )
+    session = SimpleNamespace(
+        get=mocker.Mock(
+            side_effect=[
+                DummyResponseContext(
+                    _download_response(416, headers={"Content-Range": "bytes */3"})
+                ),
+                DummyResponseContext(_download_response(200, b"new")),
+            ]
+        )
+    )
+    rest.get_session = mocker.AsyncMock(return_value=session)
+
+    result = await attachment_domain.download_by_id("att-1", save_to=tmp_path)
+
+    assert result.read_bytes() == b"new"
+    assert session.get.call_args.kwargs["headers"] is None
+
+
+@pytest.mark.asyncio
+async def test_download_by_id_restarts_when_attachment_changed(
+    attachment_domain,
+    rest,
+    mocker,
+    tmp_path: Path,
+) -> None:
+    """
+    Ensure a .part file of an older version is never joined with a newer one.
+    """
+    mocker.patch.object(
+        attachment_domain,
+        "get_download_url_by_id",
+        new=mocker.AsyncMock(return_value="https://example.test/file.txt"),
+    )
+
+    async def dropped(chunk_size):
+        yield b"old "
+        raise ConnectionResetError("dropped")
+
+    first = SimpleNamespace(
+        status=200,
+        headers={"ETag": '"v1"', "Content-Length": "11"},
+        content=SimpleNamespace(iter_chunked=dropped),
+    )
+    # The server ignores If-Range and sends the rest of the new version.
+    resumed = _download_response(
+        206, b"version", headers={"ETag": '"v2"', "Content-Range": "bytes 4-10/12"}
+    )
+    fresh = _download_response(
+        200, b"new version!", headers={"ETag": '"v2"', "Content-Length": "12"}
+    )
+    session = SimpleNamespace(
+        get=mocker.Mock(
+            side_effect=[
+                DummyResponseContext(first),
+                DummyResponseContext(resumed),
+                DummyResponseContext(fresh),
+            ]
+        )
+    )
+    rest.get_session = mocker.AsyncMock(return_value=session)
+
+    with pytest.raises(GPPClientError):
+        await attachment_domain.download_by_id("att-1", save_to=tmp_path)
+    assert (tmp_path / "file.txt.part").read_bytes() == b"old "
+
+    result = await attachment_domain.download_by_id("att-1", save_to=tmp_path)
+
+    assert result.read_bytes() == b"new version!"
+    assert not (tmp_path / "file.txt.part.json").exists()
+    requests = [call.kwargs["headers"] for call in session.get.call_args_list]
+    assert requests == [None, {"Range": "bytes=4-", "If-Range": '"v1"'}, None]
+
+
+@pytest.mark.parametrize(
+    ("content_range", "expected"),
+    [
+        ("bytes 6-10/11", True),
+        ("bytes 6-10/*", False),
+        ("bytes 0-10/11", False),
+        ("bytes 6-11/12", False),
+        (None, False),
+    ],
+)
+def test_content_range_resumes_checks_start_and_total(content_range, expected):
+    """
+    Ensure a partial response must continue at the offset with the same length.
+    """
+    assert _content_range_resumes(content_range, 6, 11) is expected
+
+
+@pytest.mark.asyncio
+async def test_download_by_id_keeps_existing_file_until_complete(
+    attachment_domain,
+    rest,
+    mocker,
+    tmp_path: Path,
+) -> None:
+    """
+    Ensure a failed overwrite leaves the existing file untouched.
+    """
+    existing = tmp_path / "file.txt"
+    existing.write_bytes(b"original")
+    mocker.patch.object(
+        attachment_domain,
+        "get_download_url_by_id",
+        new=mocker.AsyncMock(return_value="https://example.test/file.txt"),
+    )
+
+    async def iter_chunked(chunk_size):
+        yield b"partial"
+        raise ConnectionResetError("dropped")
+
+    response = SimpleNamespace(
+        status=200, headers={}, content=SimpleNamespace(iter_chunked=iter_chunked)
+    )
+    session = SimpleNamespace(
+        get=mocker.Mock(return_value=DummyResponseContext(response))
+    )
+    rest.get_session = mocker.AsyncMock(return_value=session)
+
+    with pytest.raises(GPPClientError):
+        await attachment_domain.download_by_id(
+            "att-1", save_to=tmp_path, overwrite=True
+        )
+
+    assert existing.read_bytes() == b"original"
+    assert (tmp_path / "file.txt.part").read_bytes() == b"partial"
+
+
+@pytest.mark.asyncio
+async def test_download_many_reports_each_file(
+    attachment_domain,
+    rest,
+    mocker,
+    tmp_path: Path,
+) -> None:
+    """
+    Ensure download_many reports results in order and isolates failures.
+    """
+    urls = {
+        "att-1": "https://example.test/a.txt",
+        "att-2": "https://example.test/b.txt",
+        "att-3": "https://example.test/a.txt",
+    }
+    mocker.patch.object(
+        attachment_domain,
+        "get_download_url_by_id",
+        new=mocker.AsyncMock(
+            side_effect=lambda attachment_id, **_: urls[attachment_id]
+        ),
+    )
+    in_flight = 0
+    peak = 0
+
+    class Context:
+        def __init__(self, body):
+            self._body = body
+
+        async def __aenter__(self):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            return _download_response(200, self._body)
+
+        async def __aexit__(self, exc_type, exc, tb):
+            nonlocal in_flight
+            in_flight -= 1
+
+    session = SimpleNamespace(
+        get=mocker.Mock(side_effect=lambda url, **kwargs: Context(url[-5:].encode()))
+    )
+    rest.get_session = mocker.AsyncMock(return_value=session)
+
+    results = await attachment_domain.download_many(
+        ["att-1", "att-2", "att-1", "att-3"], tmp_path, concurrency=2
+    )
+
+    assert [result.attachment_id for result in results] == ["att-1", "att-2", "att-3"]
+    assert results[0].ok and results[1].ok
+    assert results[0].path.read_bytes() == b"a.txt"
+    assert results[1].bytes_received == 5
+    assert results[1].elapsed >= 0
+    assert not results[2].ok
+    assert "a.txt" in results[2].error
+    assert peak <= 2
+
+
+@pytest.mark.asyncio
+async def test_download_batch_reports_io_and_connection_errors(
+    attachment_domain,
+    rest,
+    mocker,
+    tmp_path: Path,
+) -> None:
+    """
+    Ensure filesystem and connection errors fail only their own download.
+    """
+    (tmp_path / "blocker").write_bytes(b"")
+    urls = {"att-1": "https://example.test/a.txt", "att-3": "https://example.test/c"}
+
+    async def get_download_url_by_id(attachment_id, **kwargs):
+        if attachment_id == "att-2":
+            raise ClientConnectionError("refused")
+        return urls[attachment_id]
+
+    mocker.patch.object(
+        attachment_domain, "get_download_url_by_id", new=get_download_url_by_id
+    )
+    session = SimpleNamespace(
+        get=mocker.Mock(
+            side_effect=lambda url, **kwargs: DummyResponseContext(
+                _download_response(200, b"data")
+            )
+        )
+    )
+    rest.get_session = mocker.AsyncMock(return_value=session)
+
+    results = await attachment_domain._download_batch(
+        {
+            "att-1": tmp_path,
+            "att-2": tmp_path,
+            "att-3": tmp_path / "blocker" / "sub",
+        },
+        concurrency=3,
+        overwrite=False,
+        chunk_size=4,
+    )
+
+    assert results[0].ok
+    assert results[0].path.read_bytes() == b"data"
+    assert not results[1].ok
+    assert "refused" in results[1].error
+    assert not results[2].ok
+    assert results[2].path is None
+
+
+@pytest.mark.asyncio
+async def test_download_many_rejects_bad_concurrency(attachment_domain) -> None:
+    """
+    Ensure download_many validates the concurrency.
+    """
+    with pytest.raises(GPPValidationError):
+        await attachment_domain.download_many(["att-1"], concurrency=0)
+
+
+SIGNED_URL = (
+    "https://bucket.test/file.txt"
+    "?X-Amz-Date=20990101T000000Z&X-Amz-Expires=3600&X-Amz-Signature=abc"
+)
+
+
+@pytest.mark.asyncio
+async def test_get_download_url_by_id_uses_cache(
+    attachment_domain,
+    rest,
+    mocker,
+) -> None:
+    """
+    Ensure a valid presigned URL is reused without another request.
+    """
+    response = SimpleNamespace(
+        status=200, text=mocker.AsyncMock(return_value=SIGNED_URL)
+    )
+    session = SimpleNamespace(
+        get=mocker.Mock(side_effect=lambda url: DummyResponseContext(response))
+    )
+    rest.get_session = mocker.AsyncMock(return_value=session)
+    mocker.patch.object(attachment_domain, "raise_for_status", new=mocker.AsyncMock())
+
+    first = await attachment_domain.get_download_url_by_id("att-1")
+    second = await attachment_domain.get_download_url_by_id("att-1")
+    await attachment_domain.get_download_url_by_id("att-1", use_cache=False)
+
+    assert first == second == SIGNED_URL
+    assert session.get.call_count == 2
+    assert attachment_domain.download_urls.stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_delete_by_id_invalidates_cached_url(
+    attachment_domain,
+    rest,
+    mocker,
+) -> None:
+    """
+    Ensure deleting an attachment drops its cached URL.
+    """
+    attachment_domain.download_urls.store("att-1", SIGNED_URL)
+    session = SimpleNamespace(
+        delete=mocker.Mock(
+            return_value=DummyResponseContext(SimpleNamespace(status=204))
+        )
+    )
+    rest.get_session = mocker.AsyncMock(return_value=session)
+    mocker.patch.object(attachment_domain, "raise_for_status", new=mocker.AsyncMock())
+
+    await attachment_domain.delete_by_id("att-1")
+
+    assert len(attachment_domain.download_urls) == 0
+
+
+@pytest.mark.asyncio
+async def test_prefetch_download_urls_skips_cached_and_survives_errors(
+    attachment_domain,
+    mocker,
+) -> None:
+    """
+    Ensure prefetch only looks up missing URLs and tolerates failures.
+    """
+    attachment_domain.download_urls.store("att-1", SIGNED_URL)
+    lookup = mocker.patch.object(
+        attachment_domain,
+        "get_download_url_by_id",
+        new=mocker.AsyncMock(side_effect=[SIGNED_URL, GPPResponseError(404, "gone")]),
+    )
+
+    await attachment_domain.prefetch_download_urls(["att-1", "att-2", "att-3"])
+
+    assert [call.args[0] for call in lookup.await_args_list] == ["att-2", "att-3"]
+
+
+@pytest.mark.asyncio
+async def test_download_by_id_refreshes_rejected_url(
+    attachment_domain,
+    rest,
+    mocker,
+    tmp_path: Path,
+) -> None:
+    """
+    Ensure a 403 from the presigned URL triggers one retry with a new URL.
+    """
+    lookup = mocker.patch.object(
+        attachment_domain,
+        "get_download_url_by_id",
+        new=mocker.AsyncMock(return_value="https://example.test/file.txt"),
+    )
+    mocker.patch.object(
+        attachment_domain,
+        "_fetch_to_file",
+        new=mocker.AsyncMock(side_effect=[GPPResponseError(403, "expired"), (4, 0)]),
+    )
+    rest.get_session = mocker.AsyncMock(return_value=object())
+
+    result = await attachment_domain.download_by_id("att-1", save_to=tmp_path)
+
+    assert result == tmp_path / "file.txt"
+    lookup.assert_awaited_with("att-1", use_cache=False)
+
+
+def _listed(
+    attachment_id: str,
+    updated_at: str = "2025-01-01T00:00:00Z",
+    size=4,
+    file_name: str | None = None,
+):
+    """
+    Build an attachment as listed by GraphQL.
+    """
+    return SimpleNamespace(
+        id=attachment_id,
+        file_name=file_name or f"{attachment_id}.txt",
+        updated_at=updated_at,
+        file_size=size,
+    )
+
+
+@pytest.fixture()
+def fake_downloads(attachment_domain, mocker):
+    """
+    Replace single downloads with writes of ``size`` bytes and record them.
+    """
+    sizes: dict[str, int] = {}
+    names: dict[str, str] = {}
+    downloaded: list[str] = []
+
+    async def download(attachment_id, *, save_to, overwrite, chunk_size, claimed):
+        path = Path(save_to) / names.get(attachment_id, f"{attachment_id}.txt")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x" * sizes.get(attachment_id, 4))
+        downloaded.append(attachment_id)
+        return DownloadResult(
+            attachment_id=attachment_id, path=path, bytes_received=path.stat().st_size
+        )
+
+    mocker.patch.object(attachment_domain, "_download", side_effect=download)
+    mocker.patch.object(
+        attachment_domain, "prefetch_download_urls", new=mocker.AsyncMock()
+    )
+    return SimpleNamespace(sizes=sizes, names=names, downloaded=downloaded)
+
+
+def _list_program(attachment_domain, mocker, *attachments) -> None:
+    mocker.patch.object(
+        attachment_domain,
+        "get_all_by_program_id",
+        new=mocker.AsyncMock(
+            return_value=SimpleNamespace(
+                program=SimpleNamespace(attachments=list(attachments))
+            )
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_sync_downloads_only_new_and_changed(
+    attachment_domain,
+    mocker,
+    fake_downloads,
+    tmp_path: Path,
+) -> None:
+    """
+    Ensure a second sync only downloads attachments that changed.
+    """
+    _list_program(attachment_domain, mocker, _listed("a-1"), _listed("a-2"))
+    first = await attachment_domain.sync(tmp_path, program_id="p-1")
+
+    _list_program(
+        attachment_domain,
+        mocker,
+        _listed("a-1"),
+        _listed("a-2", updated_at="2025-02-01T00:00:00Z"),
+        _listed("a-3"),
+    )
+    second = await attachment_domain.sync(tmp_path, program_id="p-1")
+
+    assert [result.attachment_id for result in first.downloaded] == ["a-1", "a-2"]
+    assert [result.attachment_id for result in second.downloaded] == ["a-2", "a-3"]
+    assert second.unchanged == ["a-1"]
+    assert second.ok
+    manifest = json.loads((tmp_path / ".gpp-attachments.json").read_text())
+    assert manifest["attachments"]["a-1"]["path"] == "a-1/a-1.txt"
+    assert manifest["attachments"]["a-1"]["size"] == 4
+    assert len(manifest["attachments"]["a-1"]["sha256"]) == 64
+
+
+@pytest.mark.asyncio
+async def test_sync_prunes_deleted_attachments(
+    attachment_domain,
+    mocker,
+    fake_downloads,
+    tmp_path: Path,
+) -> None:
+    """
+    Ensure attachments removed remotely are deleted from the mirror.
+    """
+    _list_program(attachment_domain, mocker, _listed("a-1"), _listed("a-2"))
+    await attachment_domain.sync(tmp_path, program_id="p-1")
+    _list_program(attachment_domain, mocker, _listed("a-1"))
+
+    report = await attachment_domain.sync(tmp_path, program_id="p-1")
+
+    assert report.pruned == ["a-2"]
+    assert not (tmp_path / "a-2").exists()
+    assert (tmp_path / "a-1" / "a-1.txt").exists()
+
+
+@pytest.mark.asyncio
+async def test_sync_replaces_renamed_attachments(
+    attachment_domain,
+    mocker,
+    fake_downloads,
+    tmp_path: Path,
+) -> None:
+    """
+    Ensure a renamed attachment is downloaded under its new name only.
+    """
+    _list_program(attachment_domain, mocker, _listed("a-1"))
+    await attachment_domain.sync(tmp_path, program_id="p-1")
+    fake_downloads.names["a-1"] = "renamed.txt"
+    _list_program(attachment_domain, mocker, _listed("a-1", file_name="renamed.txt"))
+
+    report = await attachment_domain.sync(tmp_path, program_id="p-1")
+
+    assert [result.attachment_id for result in report.downloaded] == ["a-1"]
+    assert sorted(path.name for path in (tmp_path / "a-1").iterdir()) == ["renamed.txt"]
+    manifest = json.loads((tmp_path / ".gpp-attachments.json").read_text())
+    assert manifest["attachments"]["a-1"]["path"] == "a-1/renamed.txt"
+    assert manifest["attachments"]["a-1"]["file_name"] == "renamed.txt"
+
+
+@pytest.mark.asyncio
+async def test_sync_redownloads_altered_local_files(
+    attachment_domain,
+    mocker,
+    fake_downloads,
+    tmp_path: Path,
+) -> None:
+    """
+    Ensure missing or altered local files are downloaded again.
+    """
+    _list_program(attachment_domain, mocker, _listed("a-1"), _listed("a-2"))
+    await attachment_domain.sync(tmp_path, program_id="p-1")
+    (tmp_path / "a-1" / "a-1.txt").unlink()
+    (tmp_path / "a-2" / "a-2.txt").write_bytes(b"yyyy")
+
+    size_only = await attachment_domain.sync(tmp_path, program_id="p-1")
+    (tmp_path / "a-2" / "a-2.txt").write_bytes(b"yyyy")
+    verified = await attachment_domain.sync(
+        tmp_path, program_id="p-1", verify_checksums=True
+    )
+
+    assert [result.attachment_id for result in size_only.downloaded] == ["a-1"]
+    assert [result.attachment_id for result in verified.downloaded] == ["a-2"]
+
+
+@pytest.mark.asyncio
+async def test_sync_keeps_manifest_entry_for_failed_download(
+    attachment_domain,
+    mocker,
+    tmp_path: Path,
+) -> None:
+    """
+    Ensure failed downloads are reported and retried on the next sync.
+    """
+    _list_program(attachment_domain, mocker, _listed("a-1"))
+    mocker.patch.object(
+        attachment_domain, "prefetch_download_urls", new=mocker.AsyncMock()
+    )
+    mocker.patch.object(
+        attachment_domain,
+        "_download",
+        new=mocker.AsyncMock(side_effect=GPPClientError("boom")),
+    )
+
+    report = await attachment_domain.sync(tmp_path, program_id="p-1")
+
+    assert not report.ok
+    assert report.failed[0].error == "boom"
+    manifest = json.loads((tmp_path / ".gpp-attachments.json").read_text())
+    assert manifest["attachments"] == {}
+
+
+@pytest.mark.asyncio
+async def test_sync_lists_observation_attachments(
+    attachment_domain,
+    mocker,
+    fake_downloads,
+    tmp_path: Path,
+) -> None:
+    """
+    Ensure observation attachments can be mirrored.
+    """
+    mocker.patch.object(
+        attachment_domain,
+        "get_all_by_observation_id",
+        new=mocker.AsyncMock(
+            return_value=SimpleNamespace(
+                observation=SimpleNamespace(attachments=[_listed("a-9")])
+            )
+        ),
+    )
+
+    report = await attachment_domain.sync(tmp_path, observation_id="o-1")
+
+    assert [result.attachment_id for result in report.downloaded] == ["a-9"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "selectors", [{}, {"program_id": "p-1", "observation_id": "o-1"}]
+)
+async def test_sync_requires_exactly_one_selector(
+    attachment_domain, tmp_path: Path, selectors
+) -> None:
+    """
+    Ensure sync needs exactly one of program_id and observation_id.
+    """
+    with pytest.raises(GPPValidationError):
+        await attachment_domain.sync(tmp_path, **selectors)
+
+
+@pytest.mark.asyncio
+async def test_sync_raises_for_unknown_program(
+    attachment_domain, mocker, tmp_path: Path
+) -> None:
+    """
+    Ensure a missing program is reported instead of pruning the mirror.
+    """
+    mocker.patch.object(
+        attachment_domain,
+        "get_all_by_program_id",
+        new=mocker.AsyncMock(return_value=SimpleNamespace(program=None)),
+    )
+
+    with pytest.raises(GPPClientError, match="not found"):
+        await attachment_domain.sync(tmp_path, program_id="p-404")
+
+
+@pytest.fixture()
+def upload_dir(tmp_path: Path) -> Path:
+    """
+    Return a directory holding three small files to upload.
+    """
+    for name in ("b.txt", "a.txt", "c.fits"):
+        (tmp_path / name).write_bytes(name.encode())
+    return tmp_path
+
+
+@pytest.fixture()
+def posted(attachment_domain, mocker) -> list[dict]:
+    """
+    Record the upload parameters posted and return IDs derived from file names.
+    """
+    calls: list[dict] = []
+
+    async def post(params, body, size):
+        async for _ in body:
+            pass
+        calls.append(params)
+        return f"att-{params['fileName']}"
+
+    mocker.patch.object(attachment_domain, "_post_upload", side_effect=post)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_upload_many_uploads_directory_in_order(
+    attachment_domain, posted, upload_dir: Path
+) -> None:
+    """
+    Ensure every file of a directory is uploaded and results keep their order.
+    """
+    results = await attachment_domain.upload_many(
+        "p-1", upload_dir, attachment_type=AttachmentType.SCIENCE, description="d"
+    )
+
+    assert [result.attachment_id for result in results] == [
+        "att-a.txt",
+        "att-b.txt",
+        "att-c.fits",
+    ]
+    assert all(result.ok and result.attempts == 1 for result in results)
+    assert results[0].bytes_sent == 5
+    assert {params["attachmentType"] for params in posted} == {"SCIENCE"}
+    assert {params["description"] for params in posted} == {"d"}
+
+
+@pytest.mark.asyncio
+async def test_upload_many_expands_glob(
+    attachment_domain, posted, upload_dir: Path
+) -> None:
+    """
+    Ensure a glob pattern selects the files to upload.
+    """
+    results = await attachment_domain.upload_many(
+        "p-1", str(upload_dir / "*.txt"), attachment_type=AttachmentType.TEAM
+    )
+
+    assert [result.path.name for result in results] == ["a.txt", "b.txt"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("suffix", [".json", ".txt"])
+async def test_upload_many_reads_manifest(
+    attachment_domain, posted, upload_dir: Path, suffix: str
+) -> None:
+    """
+    Ensure JSON and plain-text manifests list files relative to themselves.
+    """
+    manifest = upload_dir / "sub" / f"uploads{suffix}"
+    manifest.parent.mkdir()
+    if suffix == ".json":
+        manifest.write_text(
+            json.dumps(
+                [
+                    "../a.txt",
+                    {
+                        "path": "../c.fits",
+                        "file_name": "mask.fits",
+                        "attachment_type": "MOS_MASK",
+                    },
+                ]
+            )
+        )
+    else:
+        manifest.write_text("# uploads\n../a.txt\n\n../c.fits\n")
+
+    results = await attachment_domain.upload_many(
+        "p-1", manifest=manifest, attachment_type=AttachmentType.TEAM
+    )
+
+    assert all(result.ok for result in results)
+    types = {params["fileName"]: params["attachmentType"] for params in posted}
+    if suffix == ".json":
+        assert types == {"a.txt": "TEAM", "mask.fits": "MOS_MASK"}
+    else:
+        assert types == {"a.txt": "TEAM", "c.fits": "TEAM"}
+
+
+@pytest.mark.asyncio
+async def test_upload_many_retries_transient_failures(
+    attachment_domain, mocker, upload_dir: Path
+) -> None:
+    """
+    Ensure transient failures are retried and permanent ones are reported.
+    """
+    mocker.patch("gpp_client.domains.attachment._UPLOAD_RETRY_BACKOFF", 0)
+    failures = {
+        "a.txt": [GPPResponseError(503, "busy"), GPPResponseError(429, "slow")],
+        "b.txt": [GPPResponseError(400, "bad")],
+        "c.fits": [GPPResponseError(502, "down")] * 3,
+    }
+
+    async def post(params, body, size):
+        if errors := failures[params["fileName"]]:
+            raise errors.pop(0)
+        return "att-1"
+
+    mocker.patch.object(attachment_domain, "_post_upload", side_effect=post)
+
+    a, b, c = await attachment_domain.upload_many(
+        "p-1", upload_dir, attachment_type=AttachmentType.TEAM, retries=2
+    )
+
+    assert (a.attachment_id, a.attempts) == ("att-1", 3)
+    assert (b.ok, b.attempts) == (False, 1)
+    assert "400" in b.error
+    assert (c.ok, c.attempts) == (False, 3)
+
+
+@pytest.mark.asyncio
+async def test_upload_many_reports_missing_file(
+    attachment_domain, posted, upload_dir: Path
+) -> None:
+    """
+    Ensure a missing file fails only its own upload.
+    """
+    results = await attachment_domain.upload_many(
+        "p-1",
+        [upload_dir / "a.txt", upload_dir / "missing.txt"],
+        attachment_type=AttachmentType.TEAM,
+    )
+
+    assert [result.ok for result in results] == [True, False]
+    assert "File not found" in results[1].error
+
+
+@pytest.mark.asyncio
+async def test_upload_many_limits_concurrency(
+    attachment_domain, mocker, upload_dir: Path
+) -> None:
+    """
+    Ensure no more than ``concurrency`` uploads run at once.
+    """
+    running = peak = 0
+
+    async def post(params, body, size):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return "att-1"
+
+    mocker.patch.object(attachment_domain, "_post_upload", side_effect=post)
+
+    await attachment_domain.upload_many(
+        "p-1", upload_dir, attachment_type=AttachmentType.TEAM, concurrency=2
+    )
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"paths": "x", "manifest": "y"},
+        {"paths": [], "concurrency": 0},
+        {"paths": [], "retries": -1},
+        {"manifest": "missing.json"},
+    ],
+)
+async def test_upload_many_validates_arguments(attachment_domain, kwargs) -> None:
+    """
+    Ensure invalid arguments raise before anything is uploaded.
+    """
+    with pytest.raises(GPPValidationError):
+        await attachment_domain.upload_many(
+            "p-1", attachment_type=AttachmentType.TEAM, **kwargs
+        )
@@ -161,3 +161,52 @@ def test_resolve_content_client_error_falls_back_to_type_name(
         dummy_domain.resolve_content(file_path=file_path, content=None)
 
     assert str(exc_info.value) == "DummyDomain: OSError"
+
+
+@pytest.mark.asyncio
+async def test_resolve_upload_body_returns_content_and_size(dummy_domain) -> None:
+    """Ensure direct content is returned with its size."""
+    body, size = await dummy_domain.resolve_upload_body(file_path=None, content=b"abc")
+
+    assert body == b"abc"
+    assert size == 3
+
+
+@pytest.mark.asyncio
+async def test_resolve_upload_body_streams_file(dummy_domain, tmp_path: Path) -> None:
+    """Ensure files are streamed in chunks with progress reports."""
+    file_path = tmp_path / "data.txt"
+    file_path.write_bytes(b"hello world")
+    progress = []
+
+    body, size = await dummy_domain.resolve_upload_body(
+        file_path=file_path,
+        content=None,
+        chunk_size=4,
+        progress=lambda sent, total: progress.append((sent, total)),
+    )
+    chunks = [chunk async for chunk in body]
+
+    assert size == 11
+    assert chunks == [b"hell", b"o wo", b"rld"]
+    assert progress == [(4, 11), (8, 11), (11, 11)]
+
+
+@pytest.mark.asyncio
+async def test_resolve_upload_body_rejects_bad_chunk_size(dummy_domain) -> None:
+    """Ensure the chunk size must be positive."""
+    with pytest.raises(GPPValidationError):
+        await dummy_domain.resolve_upload_body(
+            file_path=None, content=b"abc", chunk_size=0
+        )
+
+
+@pytest.mark.asyncio
+async def test_resolve_upload_body_requires_existing_file(
+    dummy_domain, tmp_path: Path
+) -> None:
+    """Ensure a missing file is rejected before any request is made."""
+    with pytest.raises(GPPValidationError):
+        await dummy_domain.resolve_upload_body(
+            file_path=tmp_path / "nope", content=None
+        )
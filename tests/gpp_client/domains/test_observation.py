@@ -165,6 +165,35 @@ async def test_get_all_dispatches_correctly(
     )
 
 
+@pytest.mark.asyncio
+async def test_list_summaries_dispatches_correctly(
+    observation_domain,
+    graphql,
+    mocker,
+) -> None:
+    """
+    Ensure list_summaries dispatches to the slim summary query.
+    """
+    result_model = object()
+    where = object()
+    graphql.get_observation_summaries = mocker.AsyncMock(return_value=result_model)
+
+    result = await observation_domain.list_summaries(
+        include_deleted=True,
+        where=where,
+        offset="abc",
+        limit=10,
+    )
+
+    assert result is result_model
+    graphql.get_observation_summaries.assert_called_once_with(
+        include_deleted=True,
+        where=where,
+        offset="abc",
+        limit=10,
+    )
+
+
 @pytest.mark.asyncio
 async def test_subscribe_to_edits_yields_events(
     observation_domain,
@@ -195,7 +224,10 @@ async def test_subscribe_to_calculation_updates_yields_events(
     """
     Ensure subscribe_to_calculation_updates yields GraphQL events.
     """
-    events = [SimpleNamespace(id=1), SimpleNamespace(id=2)]
+    events = [
+        SimpleNamespace(obscalc_update=SimpleNamespace(observation_id="o-1")),
+        SimpleNamespace(obscalc_update=SimpleNamespace(observation_id="o-2")),
+    ]
 
     graphql.obs_calculation_update = mocker.Mock(return_value=_yield_events(events))
 
@@ -208,3 +240,28 @@ async def test_subscribe_to_calculation_updates_yields_events(
 
     assert result == events
     graphql.obs_calculation_update.assert_called_once_with(program_id="p-1")
+
+
+@pytest.mark.asyncio
+async def test_subscribe_to_calculation_updates_invalidates_atom_digests(
+    observation_domain,
+    graphql,
+    rest,
+    mocker,
+) -> None:
+    """
+    Ensure each calculation update invalidates the observation's atom digests.
+    """
+    events = [
+        SimpleNamespace(obscalc_update=SimpleNamespace(observation_id="o-1")),
+        SimpleNamespace(obscalc_update=SimpleNamespace(observation_id="o-2")),
+    ]
+    graphql.obs_calculation_update = mocker.Mock(return_value=_yield_events(events))
+
+    async for _ in observation_domain.subscribe_to_calculation_updates():
+        pass
+
+    assert rest.invalidate_atom_digests.call_args_list == [
+        mocker.call(["o-1"]),
+        mocker.call(["o-2"]),
+    ]
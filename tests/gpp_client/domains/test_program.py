@@ -62,6 +62,16 @@ def program_domain(domain_kwargs) -> ProgramDomain:
                 "limit": None,
             },
         ),
+        (
+            "list_summaries",
+            "get_program_summaries",
+            {
+                "include_deleted": False,
+                "where": None,
+                "offset": "abc",
+                "limit": 10,
+            },
+        ),
     ],
 )
 async def test_program_domain_dispatches_simple_methods(
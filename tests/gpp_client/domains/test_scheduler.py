@@ -3,10 +3,13 @@ Tests for the scheduler domain.
 """
 
 from datetime import datetime, timezone
+from types import SimpleNamespace
 
 import pytest
 
 from gpp_client.domains.scheduler import SchedulerDomain
+from gpp_client.rest.tracker import VisibilityChangeTracker
+from tests.gpp_client.domains.helpers import _yield_events
 
 
 @pytest.fixture()
@@ -37,6 +40,7 @@ async def test_get_visibility_changes_parses_rest_response(
     assert result.observation_ids == frozenset({"o-123"})
     assert result.target_ids == frozenset({"t-456"})
     assert result.max_timestamp == datetime(2026, 7, 15, 11, 30, tzinfo=timezone.utc)
+    rest.invalidate_atom_digests.assert_called_once_with(frozenset({"o-123"}))
 
 
 @pytest.mark.asyncio
@@ -117,3 +121,82 @@ async def test_get_all_leaves_shared_rest_client_open(
 
     rest.get_atom_digests.assert_awaited_once_with(["o-1"])
     rest.close.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_to_calculation_updates_invalidates_atom_digests(
+    scheduler_domain: SchedulerDomain,
+    graphql,
+    rest,
+    mocker,
+) -> None:
+    """
+    Ensure calculation updates invalidate cached atom digests before yielding.
+    """
+    events = [
+        SimpleNamespace(
+            obscalc_update=SimpleNamespace(value=SimpleNamespace(id="o-1"))
+        ),
+        SimpleNamespace(obscalc_update=SimpleNamespace(value=None)),
+    ]
+    graphql.scheduler_observations_updates = mocker.Mock(
+        return_value=_yield_events(events)
+    )
+
+    result = [
+        event async for event in scheduler_domain.subscribe_to_calculation_updates()
+    ]
+
+    assert result == events
+    graphql.scheduler_observations_updates.assert_called_once_with(executable_only=True)
+    rest.invalidate_atom_digests.assert_called_once_with(["o-1"])
+
+
+def test_track_visibility_changes_shares_rest_client(
+    scheduler_domain: SchedulerDomain,
+    rest,
+    tmp_path,
+) -> None:
+    """
+    Ensure the tracker is built on the domain's REST client.
+    """
+    start = datetime(2026, 7, 15, 9, 0, tzinfo=timezone.utc)
+
+    tracker = scheduler_domain.track_visibility_changes(
+        tmp_path / "cursor.json", interval=30.0, start=start
+    )
+
+    assert isinstance(tracker, VisibilityChangeTracker)
+    assert tracker._rest is rest
+    assert tracker.interval == 30.0
+    assert tracker.cursor == start
+
+
+def test_build_group_trees_nests_elements_under_root() -> None:
+    """
+    Ensure flat group elements are nested by parent and observations collected.
+    """
+    group = {"parent_group_id": None, "group": {"id": "g-1"}, "observation": None}
+    child = {"parent_group_id": "g-1", "group": None, "observation": {"id": "o-2"}}
+    top = {"parent_group_id": None, "group": None, "observation": {"id": "o-1"}}
+    programs = [{"all_group_elements": [group, child, top]}]
+
+    observations = SchedulerDomain._build_group_trees(programs)
+
+    assert observations == ["o-2", "o-1"]
+    assert programs[0]["root"]["elements"] == [group, top]
+    assert group["group"]["elements"] == [child]
+
+
+def test_build_group_trees_logs_orphaned_elements(mocker) -> None:
+    """
+    Ensure elements whose parent group is missing are logged and left out.
+    """
+    logger = mocker.patch("gpp_client.domains.scheduler.logger")
+    orphan = {"parent_group_id": "g-9", "group": None, "observation": {"id": "o-1"}}
+    programs = [{"all_group_elements": [orphan]}]
+
+    SchedulerDomain._build_group_trees(programs)
+
+    assert programs[0]["root"]["elements"] == []
+    logger.warning.assert_called_once_with("Parent %s not found in mapping", "g-9")
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
 import pytest
 
 from gpp_client.domains.site_status import (
@@ -12,8 +16,12 @@ from gpp_client.domains.site_status import (
     _parse_gmos_config_page,
     _parse_instruments,
     _parse_shutter,
+    _soup_parse_gemini_north_webpage,
+    _soup_parse_gmos_config_page,
 )
 
+PAGES_DIR = Path(__file__).parents[2] / "data" / "site_status"
+
 
 def test_parse_gemini_north_webpage_extracts_known_ids() -> None:
     """
@@ -72,6 +80,71 @@ def test_parse_gmos_config_page_extracts_timestamp_gratings_and_slits() -> None:
     }
 
 
+@pytest.mark.parametrize(
+    "page, fast, soup",
+    [
+        (
+            "north_status.html",
+            _parse_gemini_north_webpage,
+            _soup_parse_gemini_north_webpage,
+        ),
+        ("gmos_config.html", _parse_gmos_config_page, _soup_parse_gmos_config_page),
+    ],
+)
+def test_scanner_matches_beautifulsoup_on_recorded_pages(page, fast, soup) -> None:
+    """
+    Ensure the targeted scanner and BeautifulSoup agree on recorded pages.
+    """
+    html = (PAGES_DIR / page).read_text(encoding="utf-8")
+
+    assert fast(html) == soup(html)
+
+
+def test_parse_gemini_north_webpage_keeps_first_id_and_nested_text() -> None:
+    """
+    Ensure nested markup is joined and only the first element per id is used.
+    """
+    html = """
+    <div id="inst">GMOS <span>GNIRS<br>NIRI</span></div>
+    <div id="inst">ignored</div>
+    <div id="avail"><script>var x = 1;</script>Closed</div>
+    """
+
+    result = _parse_gemini_north_webpage(html)
+
+    assert result["inst"] == "GMOSGNIRSNIRI"
+    assert result["avail"] == "Closed"
+    assert result["update"] is None
+
+
+def test_parse_gmos_config_page_ignores_nested_headings() -> None:
+    """
+    Ensure only sibling h5 headings are collected, as with BeautifulSoup.
+    """
+    html = """
+    <h3>Gratings</h3><h5>B600</h5><div><h5>nested</h5><h3>inner</h3></div>
+    <h5>R400</h5><h3>Slits</h3><h5>0.5 arcsec</h5>
+    """
+
+    result = _parse_gmos_config_page(html)
+
+    assert result == _soup_parse_gmos_config_page(html)
+    assert result["gratings"] == ["B600", "R400"]
+
+
+def test_parse_falls_back_to_beautifulsoup_when_scan_fails(mocker) -> None:
+    """
+    Ensure BeautifulSoup is used when the targeted scan fails.
+    """
+    mocker.patch(
+        "gpp_client.domains.site_status._scan", side_effect=AssertionError("bad")
+    )
+    html = '<div id="comment">ok</div><h1>GMOS at 12:00</h1>'
+
+    assert _parse_gemini_north_webpage(html)["comment"] == "ok"
+    assert _parse_gmos_config_page(html)["local_timestamp"] == "12:00"
+
+
 def test_parse_shutter_returns_none_for_empty_input() -> None:
     """
     Ensure shutter parser returns None for empty input.
@@ -116,22 +189,31 @@ def test_parse_instruments_splits_available_instruments() -> None:
     }
 
 
+def _response(mocker, text: str, status_code: int = 200, headers=None):
+    response = mocker.Mock()
+    response.text = text
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.raise_for_status = mocker.Mock()
+    return response
+
+
 @pytest.mark.asyncio
 async def test_fetch_json_returns_parsed_payload(mocker) -> None:
     """
     Ensure _fetch_json returns parsed json content.
     """
     domain = SiteStatusDomain()
-    response = mocker.Mock()
-    response.json.return_value = {"ok": True}
-    response.raise_for_status = mocker.Mock()
+    response = _response(mocker, '{"ok": true}')
     client = mocker.Mock()
     client.get = mocker.AsyncMock(return_value=response)
 
     result = await domain._fetch_json(client, "https://example.test")
 
     assert result == {"ok": True}
-    client.get.assert_awaited_once_with("https://example.test")
+    client.get.assert_awaited_once_with(
+        "https://example.test", headers={}, follow_redirects=True
+    )
     response.raise_for_status.assert_called_once_with()
 
 
@@ -141,16 +223,16 @@ async def test_fetch_webpage_returns_text(mocker) -> None:
     Ensure _fetch_webpage returns response text.
     """
     domain = SiteStatusDomain()
-    response = mocker.Mock()
-    response.text = "<html></html>"
-    response.raise_for_status = mocker.Mock()
+    response = _response(mocker, "<html></html>")
     client = mocker.Mock()
     client.get = mocker.AsyncMock(return_value=response)
 
     result = await domain._fetch_webpage(client, "https://example.test")
 
     assert result == "<html></html>"
-    client.get.assert_awaited_once_with("https://example.test")
+    client.get.assert_awaited_once_with(
+        "https://example.test", headers={}, follow_redirects=True
+    )
     response.raise_for_status.assert_called_once_with()
 
 
@@ -246,3 +328,259 @@ def test_site_config_contains_expected_sites() -> None:
     Ensure site config contains both supported sites.
     """
     assert set(SITE_CONFIG.keys()) == {Site.NORTH, Site.SOUTH}
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_reuses_transport_client(mocker) -> None:
+    """
+    Ensure a shared transport's client is used instead of a new one per call.
+    """
+    transport = SimpleNamespace(http_client=object())
+    domain = SiteStatusDomain(transport=transport)
+    fetch_site = mocker.patch.object(
+        domain, "_fetch_site", return_value=({"Site": "Gemini South"}, None)
+    )
+    client_cls = mocker.patch("gpp_client.domains.site_status.AsyncClient")
+
+    await domain.get_by_id("south", refresh=True)
+    await domain.get_by_id("south", refresh=True)
+
+    assert fetch_site.await_count == 2
+    assert fetch_site.await_args.args[0] is transport.http_client
+    client_cls.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_fetch_text_revalidates_with_stored_validators(mocker) -> None:
+    """
+    Ensure a 304 reuses the stored body and the validators are sent back.
+    """
+    domain = SiteStatusDomain()
+    client = mocker.Mock()
+    client.get = mocker.AsyncMock(
+        side_effect=[
+            _response(
+                mocker,
+                "<html>v1</html>",
+                headers={"ETag": '"abc"', "Last-Modified": "Wed, 01 Jan 2025"},
+            ),
+            _response(mocker, "", status_code=304),
+        ]
+    )
+
+    first = await domain._fetch_webpage(client, "https://example.test")
+    second = await domain._fetch_webpage(client, "https://example.test")
+
+    assert first == second == "<html>v1</html>"
+    client.get.assert_awaited_with(
+        "https://example.test",
+        headers={"If-None-Match": '"abc"', "If-Modified-Since": "Wed, 01 Jan 2025"},
+        follow_redirects=True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_fetch_site_requests_pages_concurrently(mocker) -> None:
+    """
+    Ensure the status and GMOS pages are in flight at the same time.
+    """
+    domain = SiteStatusDomain()
+    both_started = asyncio.Event()
+    started = []
+
+    async def fetch_webpage(client, url):
+        started.append(url)
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        return ""
+
+    mocker.patch.object(domain, "_fetch_webpage", side_effect=fetch_webpage)
+    mocker.patch.object(domain, "_fetch_json", side_effect=fetch_webpage)
+
+    await domain._fetch_site(object(), Site.SOUTH)
+
+    assert started == [
+        SITE_CONFIG[Site.SOUTH]["src_url"],
+        SITE_CONFIG[Site.SOUTH]["gmos_url"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_serves_fresh_payload_from_cache(mocker) -> None:
+    """
+    Ensure a fresh payload is served from the cache as an independent copy.
+    """
+    domain = SiteStatusDomain(transport=SimpleNamespace(http_client=object()))
+    fetch_site = mocker.patch.object(
+        domain, "_fetch_site", return_value=({"Site": "Gemini South"}, None)
+    )
+
+    first = await domain.get_by_id("south")
+    first["site"] = "mutated"
+    second = await domain.get_by_id("South")
+
+    assert fetch_site.await_count == 1
+    assert second["site"] == "Gemini South"
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_serves_stale_payload_and_refreshes(mocker) -> None:
+    """
+    Ensure a stale payload is returned at once and refreshed in the background.
+    """
+    domain = SiteStatusDomain(
+        transport=SimpleNamespace(http_client=object()), ttl=10, stale_ttl=100
+    )
+    mocker.patch.object(
+        domain,
+        "_fetch_site",
+        side_effect=[({"comment": "old"}, None), ({"comment": "new"}, None)],
+    )
+    clock = mocker.patch("gpp_client.domains.site_status.time.monotonic")
+    clock.return_value = 0.0
+    await domain.get_by_id("north")
+
+    clock.return_value = 50.0
+    stale = await domain.get_by_id("north")
+    await asyncio.gather(*domain._refreshing.values())
+    fresh = await domain.get_by_id("north")
+
+    assert stale["comment"] == "old"
+    assert fresh["comment"] == "new"
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_refetches_expired_payload(mocker) -> None:
+    """
+    Ensure a payload past the stale window is fetched before returning.
+    """
+    domain = SiteStatusDomain(
+        transport=SimpleNamespace(http_client=object()), ttl=10, stale_ttl=100
+    )
+    mocker.patch.object(
+        domain,
+        "_fetch_site",
+        side_effect=[({"comment": "old"}, None), ({"comment": "new"}, None)],
+    )
+    clock = mocker.patch("gpp_client.domains.site_status.time.monotonic")
+    clock.return_value = 0.0
+    await domain.get_by_id("north")
+
+    clock.return_value = 200.0
+    result = await domain.get_by_id("north")
+
+    assert result["comment"] == "new"
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_shares_in_flight_fetch(mocker) -> None:
+    """
+    Ensure concurrent callers for one site share a single fetch.
+    """
+    domain = SiteStatusDomain(transport=SimpleNamespace(http_client=object()))
+    fetch_site = mocker.patch.object(
+        domain, "_fetch_site", return_value=({"Site": "Gemini South"}, None)
+    )
+
+    await asyncio.gather(domain.get_by_id("south"), domain.get_by_id("south"))
+
+    assert fetch_site.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_all_returns_every_site(mocker) -> None:
+    """
+    Ensure get_all returns a payload per site.
+    """
+    domain = SiteStatusDomain(transport=SimpleNamespace(http_client=object()))
+
+    async def fetch_site(client, site):
+        return {"Site": site.value}, None
+
+    mocker.patch.object(domain, "_fetch_site", side_effect=fetch_site)
+
+    result = await domain.get_all()
+
+    assert set(result) == {"north", "south"}
+    assert result["south"]["site"] == "south"
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_background_refresh(mocker) -> None:
+    """
+    Ensure close cancels refreshes still in flight.
+    """
+    domain = SiteStatusDomain(transport=SimpleNamespace(http_client=object()))
+    blocked = asyncio.Event()
+
+    async def fetch_site(client, site):
+        await blocked.wait()
+
+    mocker.patch.object(domain, "_fetch_site", side_effect=fetch_site)
+    task = domain._refresh(Site.NORTH)
+    await asyncio.sleep(0)
+
+    await domain.close()
+
+    assert task.cancelled()
+
+
+def _status(shutter="open", instruments=("GMOS",), validity="2025-01-01"):
+    return {
+        "site": "Gemini North",
+        "validity": validity,
+        "available": "Available",
+        "instruments": {"available": list(instruments), "raw_string": "x"},
+        "comment": None,
+        "shutter": {"state": shutter, "timestamp": validity, "raw_string": "x"},
+        "gmos_config": {"gratings": ["B600"], "slits": [], "local_timestamp": "t"},
+    }
+
+
+@pytest.mark.asyncio
+async def test_watch_yields_only_real_changes(mocker) -> None:
+    """
+    Ensure watch skips polls whose only difference is a timestamp.
+    """
+    domain = SiteStatusDomain()
+    get_by_id = mocker.patch.object(
+        domain,
+        "get_by_id",
+        side_effect=[
+            _status(),
+            _status(validity="2025-01-02"),
+            _status(shutter="closed", instruments=("GMOS", "GNIRS")),
+        ],
+    )
+    sleep = mocker.patch(
+        "gpp_client.domains.site_status.asyncio.sleep", new=mocker.AsyncMock()
+    )
+
+    watcher = domain.watch("North", interval=30)
+    first = await anext(watcher)
+    second = await anext(watcher)
+    await watcher.aclose()
+
+    assert first.initial is True
+    assert first.changes["shutter"] == (None, "open")
+    assert second.initial is False
+    assert second.changes == {
+        "shutter": ("open", "closed"),
+        "instruments": (["GMOS"], ["GMOS", "GNIRS"]),
+    }
+    assert second.added("instruments") == ["GNIRS"]
+    assert second.removed("instruments") == []
+    assert second.fingerprint != first.fingerprint
+    assert get_by_id.await_count == 3
+    get_by_id.assert_awaited_with("north", refresh=True)
+    sleep.assert_awaited_with(30)
+
+
+@pytest.mark.asyncio
+async def test_watch_rejects_non_positive_interval() -> None:
+    """
+    Ensure watch validates the polling interval.
+    """
+    with pytest.raises(ValueError, match="interval"):
+        await anext(SiteStatusDomain().watch("north", interval=0))
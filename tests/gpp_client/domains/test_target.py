@@ -110,6 +110,16 @@ def target_domain(domain_kwargs) -> TargetDomain:
                 "limit": None,
             },
         ),
+        (
+            "list_summaries",
+            "get_target_summaries",
+            {
+                "include_deleted": True,
+                "where": None,
+                "offset": "abc",
+                "limit": 10,
+            },
+        ),
     ],
 )
 async def test_target_domain_dispatches_methods(
@@ -0,0 +1,164 @@
+"""
+Tests for the REST response caches.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from gpp_client.rest.cache import (
+    AtomDigestCache,
+    AtomDigestCacheStats,
+    PresignedURLCache,
+    PresignedURLCacheStats,
+    presigned_url_expiry,
+)
+
+
+def test_lookup_splits_hits_and_misses() -> None:
+    """
+    Ensure lookup returns cached rows and missing IDs in input order.
+    """
+    cache = AtomDigestCache(max_entries=10)
+    cache.store({"o-1": ("o-1\trow",)}, generation=cache.begin_fetch())
+    cache.end_fetch()
+
+    cached, missing = cache.lookup(["o-2", "o-1", "o-3", "o-2"])
+
+    assert cached == {"o-1": ("o-1\trow",)}
+    assert missing == ["o-2", "o-3"]
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 2
+
+
+def test_store_evicts_least_recently_used() -> None:
+    """
+    Ensure the cache stays within max_entries by evicting the oldest lookup.
+    """
+    cache = AtomDigestCache(max_entries=2)
+    cache.store({"o-1": (), "o-2": ()}, generation=0)
+    cache.lookup(["o-1"])
+
+    cache.store({"o-3": ()}, generation=0)
+
+    assert "o-1" in cache
+    assert "o-2" not in cache
+    assert "o-3" in cache
+    assert cache.stats.evictions == 1
+
+
+def test_invalidate_drops_entries() -> None:
+    """
+    Ensure invalidated observations are removed and counted.
+    """
+    cache = AtomDigestCache(max_entries=10)
+    cache.store({"o-1": (), "o-2": ()}, generation=0)
+
+    cache.invalidate(["o-1", "o-unknown"])
+
+    assert "o-1" not in cache
+    assert "o-2" in cache
+    assert cache.stats.invalidations == 1
+
+
+def test_store_skips_observation_invalidated_during_fetch() -> None:
+    """
+    Ensure rows fetched before an invalidation are not cached.
+    """
+    cache = AtomDigestCache(max_entries=10)
+    generation = cache.begin_fetch()
+    cache.invalidate(["o-1"])
+
+    cache.store({"o-1": ("o-1\tstale",), "o-2": ()}, generation=generation)
+    cache.end_fetch()
+
+    assert "o-1" not in cache
+    assert "o-2" in cache
+
+
+def test_store_accepts_fetch_started_after_invalidation() -> None:
+    """
+    Ensure a fetch that began after the invalidation is cached.
+    """
+    cache = AtomDigestCache(max_entries=10)
+    first = cache.begin_fetch()
+    cache.invalidate(["o-1"])
+    second = cache.begin_fetch()
+
+    cache.store({"o-1": ("o-1\tfresh",)}, generation=second)
+    cache.end_fetch()
+    cache.end_fetch()
+
+    assert first < second
+    assert "o-1" in cache
+
+
+def test_stats_hit_rate() -> None:
+    """
+    Ensure the hit rate is derived from hits and misses.
+    """
+    assert AtomDigestCacheStats().hit_rate == 0.0
+    assert AtomDigestCacheStats(hits=3, misses=1).hit_rate == 0.75
+
+
+def test_rejects_non_positive_size() -> None:
+    """
+    Ensure the cache requires room for at least one entry.
+    """
+    with pytest.raises(ValueError, match="max_entries"):
+        AtomDigestCache(max_entries=0)
+
+
+def test_presigned_url_expiry_reads_signature_parameters() -> None:
+    """
+    Ensure SigV4, GCS V4 and SigV2 expiries are recognised.
+    """
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc).timestamp()
+
+    assert (
+        presigned_url_expiry(
+            "https://s3.test/f?X-Amz-Date=20250101T000000Z&X-Amz-Expires=600"
+        )
+        == start + 600
+    )
+    assert (
+        presigned_url_expiry(
+            "https://gcs.test/f?x-goog-date=20250101T000000Z&x-goog-expires=60"
+        )
+        == start + 60
+    )
+    assert presigned_url_expiry("https://s3.test/f?Expires=1735689600") == start
+    assert presigned_url_expiry("https://s3.test/f") is None
+    assert (
+        presigned_url_expiry("https://s3.test/f?X-Amz-Date=bad&X-Amz-Expires=1") is None
+    )
+
+
+def test_presigned_url_cache_respects_margin(mocker) -> None:
+    """
+    Ensure URLs are dropped once they get within the margin of expiry.
+    """
+    cache = PresignedURLCache(margin=30)
+    clock = mocker.patch("gpp_client.rest.cache.time.time")
+    cache.store("a", "https://s3.test/f?Expires=1000")
+    cache.store("b", "https://s3.test/unsigned")
+
+    clock.return_value = 900.0
+    assert cache.get("a") == "https://s3.test/f?Expires=1000"
+    clock.return_value = 980.0
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert cache.stats == PresignedURLCacheStats(hits=1, misses=2, size=0)
+
+
+def test_presigned_url_cache_invalidate_and_validation() -> None:
+    """
+    Ensure invalidate drops entries and a negative margin is rejected.
+    """
+    cache = PresignedURLCache()
+    cache.store("a", "https://s3.test/f?Expires=99999999999")
+    cache.invalidate(["a", "unknown"])
+
+    assert len(cache) == 0
+    with pytest.raises(ValueError):
+        PresignedURLCache(margin=-1)
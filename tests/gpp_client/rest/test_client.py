@@ -2,12 +2,22 @@
 Tests for the REST client.
 """
 
+import asyncio
+import ssl
 from datetime import datetime, timezone
 from types import SimpleNamespace
 
+import aiohttp
 import pytest
 
-from gpp_client.rest.client import RESTClient
+from gpp_client.rest.cache import AtomDigestCache
+from gpp_client.rest.client import (
+    ConnectionPoolStats,
+    RESTClient,
+    RESTConnectorOptions,
+    _get_ssl_context,
+)
+from gpp_client.tracing import InMemoryCollector, SpanAttribute, Tracer
 
 
 class _FakeResponse:
@@ -57,6 +67,90 @@ def test_resolve_headers(rest_client: RESTClient) -> None:
     }
 
 
+@pytest.mark.asyncio
+async def test_create_session_applies_connector_options() -> None:
+    """
+    Ensure the connector is built from the configured pool options.
+    """
+    rest_client = RESTClient(
+        base_url="https://example.test",
+        gpp_token="secret-token",
+        connector_options=RESTConnectorOptions(
+            limit=7, limit_per_host=3, keepalive_timeout=42.0
+        ),
+    )
+
+    session = rest_client._create_session()
+    try:
+        assert session.connector.limit == 7
+        assert session.connector.limit_per_host == 3
+        assert session.connector._keepalive_timeout == 42.0
+    finally:
+        await session.close()
+
+
+@pytest.mark.asyncio
+async def test_create_session_reuses_process_wide_ssl_context(
+    rest_client: RESTClient,
+    mocker,
+) -> None:
+    """
+    Ensure recreating sessions does not reload the CA bundle.
+    """
+    _get_ssl_context.cache_clear()
+    create_context = mocker.patch(
+        "gpp_client.rest.client.ssl.create_default_context",
+        wraps=ssl.create_default_context,
+    )
+    other_client = RESTClient(base_url="https://other.test", gpp_token="t")
+
+    sessions = [
+        rest_client._create_session(),
+        rest_client._create_session(),
+        other_client._create_session(),
+    ]
+    try:
+        create_context.assert_called_once()
+        assert sessions[0].connector._ssl is sessions[2].connector._ssl
+    finally:
+        for session in sessions:
+            await session.close()
+        _get_ssl_context.cache_clear()
+
+
+def test_pool_stats_without_session(rest_client: RESTClient) -> None:
+    """
+    Ensure pool stats report limits and zero usage before any request.
+    """
+    assert rest_client.pool_stats() == ConnectionPoolStats(limit=100)
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_counts_connections_and_sessions(
+    rest_client: RESTClient,
+) -> None:
+    """
+    Ensure pool stats read the connector's usage and count session rebuilds.
+    """
+    await rest_client.get_session()
+    await rest_client.close()
+    session = await rest_client.get_session()
+    connector = session.connector
+    connector._acquired.update({object(), object()})
+    connector._conns[("host", 443)] = [object()]
+
+    stats = rest_client.pool_stats()
+
+    connector._acquired.clear()
+    connector._conns.clear()
+    await rest_client.close()
+
+    assert stats.acquired == 2
+    assert stats.idle == 1
+    assert stats.waiting == 0
+    assert stats.sessions_created == 2
+
+
 @pytest.mark.asyncio
 async def test_get_session_creates_session_when_missing(
     mocker,
@@ -243,3 +337,341 @@ async def test_get_visibility_changes_raises_on_http_error(
         await rest_client.get_visibility_changes(
             datetime(2026, 7, 15, 9, 0, tzinfo=timezone.utc)
         )
+
+
+@pytest.mark.asyncio
+async def test_get_atom_digests_single_chunk_returns_body_unchanged(
+    rest_client: RESTClient,
+    mocker,
+) -> None:
+    """
+    Ensure a request that fits in one chunk is posted once and returned as-is.
+    """
+    post = mocker.patch.object(
+        rest_client, "_post_atom_digests", return_value="o-1\tbody\n"
+    )
+
+    result = await rest_client.get_atom_digests(["o-1", "o-2"])
+
+    assert result == "o-1\tbody\n"
+    post.assert_awaited_once_with(["o-1", "o-2"], accept_gzip=True)
+
+
+@pytest.mark.asyncio
+async def test_get_atom_digests_merges_chunks_in_order(
+    rest_client: RESTClient,
+    mocker,
+) -> None:
+    """
+    Ensure chunks are merged in input order regardless of completion order.
+    """
+
+    async def post(chunk, *, accept_gzip):
+        # Finish the first chunk last.
+        await asyncio.sleep(0.01 if chunk[0] == "o-1" else 0)
+        return "".join(f"{obs_id}\trow\n" for obs_id in chunk)
+
+    mocker.patch.object(rest_client, "_post_atom_digests", side_effect=post)
+
+    result = await rest_client.get_atom_digests(
+        ["o-1", "o-2", "o-3", "o-4", "o-5"], chunk_size=2
+    )
+
+    assert result.split("\n") == [
+        "o-1\trow",
+        "o-2\trow",
+        "o-3\trow",
+        "o-4\trow",
+        "o-5\trow",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_atom_digests_bounds_concurrency(
+    rest_client: RESTClient,
+    mocker,
+) -> None:
+    """
+    Ensure no more than max_concurrency chunk requests run at once.
+    """
+    in_flight = 0
+    peak = 0
+
+    async def post(chunk, *, accept_gzip):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return f"{chunk[0]}\trow"
+
+    mocker.patch.object(rest_client, "_post_atom_digests", side_effect=post)
+
+    await rest_client.get_atom_digests(
+        [f"o-{i}" for i in range(10)], chunk_size=1, max_concurrency=3
+    )
+
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_get_atom_digests_retries_only_failed_chunk(
+    rest_client: RESTClient,
+    mocker,
+) -> None:
+    """
+    Ensure a transient failure re-requests only the chunk that failed.
+    """
+    mocker.patch("gpp_client.rest.client._ATOM_RETRY_BACKOFF", 0)
+    calls: list[tuple[str, ...]] = []
+
+    async def post(chunk, *, accept_gzip):
+        calls.append(tuple(chunk))
+        if chunk == ["o-3"] and calls.count(("o-3",)) == 1:
+            raise aiohttp.ClientConnectionError("reset")
+        return f"{chunk[0]}\trow"
+
+    mocker.patch.object(rest_client, "_post_atom_digests", side_effect=post)
+
+    result = await rest_client.get_atom_digests(["o-1", "o-2", "o-3"], chunk_size=1)
+
+    assert result == "o-1\trow\no-2\trow\no-3\trow"
+    assert calls.count(("o-1",)) == 1
+    assert calls.count(("o-2",)) == 1
+    assert calls.count(("o-3",)) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_atom_digests_does_not_retry_invalid_ids(
+    rest_client: RESTClient,
+    mocker,
+) -> None:
+    """
+    Ensure rejected observation IDs are raised without retrying.
+    """
+    post = mocker.patch.object(
+        rest_client,
+        "_post_atom_digests",
+        side_effect=ValueError("Invalid observation IDs: o-x"),
+    )
+
+    with pytest.raises(ValueError, match="Invalid observation IDs"):
+        await rest_client.get_atom_digests(["o-x"])
+
+    post.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_atom_digests_raises_after_retries_exhausted(
+    rest_client: RESTClient,
+    mocker,
+) -> None:
+    """
+    Ensure the last transient error propagates once retries are used up.
+    """
+    mocker.patch("gpp_client.rest.client._ATOM_RETRY_BACKOFF", 0)
+    post = mocker.patch.object(
+        rest_client,
+        "_post_atom_digests",
+        side_effect=asyncio.TimeoutError(),
+    )
+
+    with pytest.raises(asyncio.TimeoutError):
+        await rest_client.get_atom_digests(["o-1"], retries=2)
+
+    assert post.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_get_atom_digests_rejects_invalid_chunk_size(
+    rest_client: RESTClient,
+) -> None:
+    """
+    Ensure a non-positive chunk size is rejected.
+    """
+    with pytest.raises(ValueError, match="chunk_size"):
+        await rest_client.get_atom_digests(["o-1"], chunk_size=0)
+
+
+@pytest.mark.asyncio
+async def test_get_atom_digests_requests_only_uncached_observations(
+    mocker,
+) -> None:
+    """
+    Ensure cached observations are served locally and the rest fetched once.
+    """
+    cache = AtomDigestCache(max_entries=10)
+    rest_client = RESTClient(
+        base_url="https://example.test",
+        gpp_token="secret-token",
+        atom_digest_cache=cache,
+    )
+    post = mocker.patch.object(
+        rest_client,
+        "_post_atom_digests",
+        return_value="o-1\ta\no-1\tb\n",
+    )
+
+    first = await rest_client.get_atom_digests(["o-1", "o-2"])
+    second = await rest_client.get_atom_digests(["o-2", "o-1"])
+
+    assert first == "o-1\ta\no-1\tb"
+    assert second == "o-1\ta\no-1\tb"
+    post.assert_awaited_once_with(["o-1", "o-2"], accept_gzip=True)
+    assert cache.stats.hits == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_atom_digests_forces_refetch(mocker) -> None:
+    """
+    Ensure an invalidated observation is requested again.
+    """
+    rest_client = RESTClient(
+        base_url="https://example.test",
+        gpp_token="secret-token",
+        atom_digest_cache=AtomDigestCache(max_entries=10),
+    )
+    post = mocker.patch.object(
+        rest_client, "_post_atom_digests", return_value="o-1\trow"
+    )
+
+    await rest_client.get_atom_digests(["o-1"])
+    rest_client.invalidate_atom_digests(["o-1"])
+    await rest_client.get_atom_digests(["o-1"])
+
+    assert post.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidation_during_fetch_is_not_lost(mocker) -> None:
+    """
+    Ensure rows fetched before an invalidation are not cached.
+    """
+    cache = AtomDigestCache(max_entries=10)
+    rest_client = RESTClient(
+        base_url="https://example.test",
+        gpp_token="secret-token",
+        atom_digest_cache=cache,
+    )
+
+    async def post(observation_ids, *, accept_gzip):
+        if post.calls == 0:
+            rest_client.invalidate_atom_digests(["o-1"])
+        post.calls += 1
+        return f"o-1\trow-{post.calls}"
+
+    post.calls = 0
+    mocker.patch.object(rest_client, "_post_atom_digests", side_effect=post)
+
+    first = await rest_client.get_atom_digests(["o-1"])
+
+    assert first == "o-1\trow-1"
+    assert "o-1" not in cache
+
+    second = await rest_client.get_atom_digests(["o-1"])
+
+    assert second == "o-1\trow-2"
+    assert post.calls == 2
+
+
+def test_invalidate_atom_digests_without_cache_is_noop(
+    rest_client: RESTClient,
+) -> None:
+    """
+    Ensure invalidation is harmless when caching is disabled.
+    """
+    rest_client.invalidate_atom_digests(["o-1"])
+
+    assert rest_client.atom_digest_cache is None
+
+
+class _FakeStreamResponse(_FakeResponse):
+    """
+    Response stub whose content iterates over raw byte lines.
+    """
+
+    def __init__(self, lines: list[bytes], status: int = 200) -> None:
+        super().__init__(status=status)
+        self.content = _AsyncLines(lines)
+
+
+class _AsyncLines:
+    """
+    Async iterator over byte lines, like ``aiohttp.StreamReader``.
+    """
+
+    def __init__(self, lines: list[bytes]) -> None:
+        self._lines = iter(lines)
+
+    def __aiter__(self) -> "_AsyncLines":
+        return self
+
+    async def __anext__(self) -> bytes:
+        try:
+            return next(self._lines)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+@pytest.mark.asyncio
+async def test_stream_visibility_changes_yields_decoded_lines(
+    rest_client: RESTClient,
+    mocker,
+) -> None:
+    """
+    Ensure streamed lines are decoded and stripped of line endings.
+    """
+    response = _FakeStreamResponse(
+        [b"o-1\t2026-07-15T10:00:00Z\r\n", b"t-2\t2026-07-15T11:00:00Z"]
+    )
+    session = SimpleNamespace(get=mocker.Mock(return_value=response))
+    mocker.patch.object(rest_client, "get_session", return_value=session)
+
+    lines = [
+        line
+        async for line in rest_client.stream_visibility_changes(
+            datetime(2026, 7, 15, 9, 0)
+        )
+    ]
+
+    assert lines == ["o-1\t2026-07-15T10:00:00Z", "t-2\t2026-07-15T11:00:00Z"]
+    assert response.raise_for_status_called
+    session.get.assert_called_once_with(
+        "/scheduler/visibility-changes",
+        params={"since": "2026-07-15T09:00:00+00:00"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_request_methods_report_spans(mocker) -> None:
+    """
+    Ensure public request methods run in spans that count retries and bytes.
+    """
+    collector = InMemoryCollector()
+    rest_client = RESTClient(
+        base_url="https://example.test",
+        gpp_token="secret-token",
+        tracer=Tracer([collector]),
+    )
+    mocker.patch("gpp_client.rest.client._ATOM_RETRY_BACKOFF", 0)
+    failures = [aiohttp.ClientConnectionError("reset")]
+
+    async def post(chunk, *, accept_gzip):
+        if failures:
+            raise failures.pop()
+        return "o-1\trow"
+
+    mocker.patch.object(rest_client, "_post_atom_digests", side_effect=post)
+    response = _FakeStreamResponse([b"o-1\tx\n", b"t-2\ty\n"])
+    session = SimpleNamespace(get=mocker.Mock(return_value=response))
+    mocker.patch.object(rest_client, "get_session", return_value=session)
+
+    await rest_client.get_atom_digests(["o-1"])
+    async for _ in rest_client.stream_visibility_changes(datetime(2026, 7, 15)):
+        pass
+
+    atoms, stream = collector.spans
+    assert (atoms.name, atoms.kind) == ("get_atom_digests", "rest")
+    assert atoms.attributes[SpanAttribute.RETRIES] == 1
+    assert stream.name == "stream_visibility_changes"
+    assert stream.attributes[SpanAttribute.RESPONSE_BYTES] == 12
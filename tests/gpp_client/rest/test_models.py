@@ -4,7 +4,13 @@ Tests for REST response models and parsers.
 
 from datetime import datetime, timezone
 
-from gpp_client.rest.models import VisibilityChanges, parse_visibility_changes
+import pytest
+
+from gpp_client.rest.models import (
+    VisibilityChanges,
+    iter_visibility_changes,
+    parse_visibility_changes,
+)
 
 
 def test_parse_mixed_observations_and_targets() -> None:
@@ -79,3 +85,59 @@ def test_parse_handles_offset_timestamps() -> None:
     result = parse_visibility_changes(body)
 
     assert result.max_timestamp == datetime(2026, 7, 15, 10, 0, tzinfo=timezone.utc)
+
+
+async def _lines(*lines: str):
+    """
+    Yield the given lines asynchronously.
+    """
+    for line in lines:
+        yield line
+
+
+@pytest.mark.asyncio
+async def test_iter_visibility_changes_yields_batches() -> None:
+    """
+    Ensure the stream is split into batches with their own max timestamp.
+    """
+    lines = _lines(
+        "o-1\t2026-07-15T10:00:00Z\n",
+        "\n",
+        "x-9\t2026-07-15T23:00:00Z\n",
+        "t-2\t2026-07-15T12:00:00Z\n",
+        "o-3\t2026-07-15T11:00:00Z",
+    )
+
+    batches = [batch async for batch in iter_visibility_changes(lines, batch_size=2)]
+
+    assert batches == [
+        VisibilityChanges(
+            observation_ids=frozenset({"o-1"}),
+            target_ids=frozenset({"t-2"}),
+            max_timestamp=datetime(2026, 7, 15, 12, 0, tzinfo=timezone.utc),
+        ),
+        VisibilityChanges(
+            observation_ids=frozenset({"o-3"}),
+            max_timestamp=datetime(2026, 7, 15, 11, 0, tzinfo=timezone.utc),
+        ),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iter_visibility_changes_empty_stream_yields_nothing() -> None:
+    """
+    Ensure an empty stream produces no batches.
+    """
+    batches = [batch async for batch in iter_visibility_changes(_lines("", "\n"))]
+
+    assert batches == []
+
+
+@pytest.mark.asyncio
+async def test_iter_visibility_changes_rejects_invalid_batch_size() -> None:
+    """
+    Ensure a non-positive batch size is rejected.
+    """
+    with pytest.raises(ValueError, match="batch_size"):
+        async for _ in iter_visibility_changes(_lines(), batch_size=0):
+            pass
@@ -0,0 +1,211 @@
+"""
+Tests for the visibility change tracker.
+"""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from gpp_client.exceptions import GPPClientError
+from gpp_client.rest.tracker import VisibilityChangeTracker
+
+
+def _stream(*lines: str):
+    """
+    Return a stream_visibility_changes replacement yielding the given lines.
+    """
+
+    async def stream(since):
+        for line in lines:
+            yield line
+
+    return stream
+
+
+@pytest.fixture()
+def checkpoint(tmp_path):
+    """
+    Return a checkpoint path inside a temporary directory.
+    """
+    return tmp_path / "state" / "visibility.json"
+
+
+def test_cursor_defaults_to_start_without_checkpoint(mocker, checkpoint) -> None:
+    """
+    Ensure the start time is used when no checkpoint exists.
+    """
+    tracker = VisibilityChangeTracker(
+        mocker.Mock(), checkpoint, start=datetime(2026, 7, 15, 9, 0)
+    )
+
+    assert tracker.cursor == datetime(2026, 7, 15, 9, 0, tzinfo=timezone.utc)
+
+
+def test_cursor_is_loaded_from_checkpoint(mocker, checkpoint) -> None:
+    """
+    Ensure an existing checkpoint wins over the start time.
+    """
+    checkpoint.parent.mkdir()
+    checkpoint.write_text(json.dumps({"since": "2026-07-15T12:00:00+00:00"}))
+
+    tracker = VisibilityChangeTracker(
+        mocker.Mock(), checkpoint, start=datetime(2026, 7, 15, 9, 0)
+    )
+
+    assert tracker.cursor == datetime(2026, 7, 15, 12, 0, tzinfo=timezone.utc)
+
+
+def test_invalid_checkpoint_raises(mocker, checkpoint) -> None:
+    """
+    Ensure a corrupt checkpoint is reported instead of silently reset.
+    """
+    checkpoint.parent.mkdir()
+    checkpoint.write_text("not json")
+
+    with pytest.raises(GPPClientError, match="Invalid visibility checkpoint"):
+        VisibilityChangeTracker(mocker.Mock(), checkpoint)
+
+
+@pytest.mark.asyncio
+async def test_poll_yields_batches_and_persists_cursor(mocker, checkpoint) -> None:
+    """
+    Ensure a completed poll advances and checkpoints the cursor.
+    """
+    rest = mocker.Mock()
+    rest.stream_visibility_changes = mocker.Mock(
+        side_effect=_stream(
+            "o-1\t2026-07-15T10:00:00Z",
+            "t-2\t2026-07-15T11:30:00Z",
+            "o-3\t2026-07-15T10:30:00Z",
+        )
+    )
+    start = datetime(2026, 7, 15, 9, 0, tzinfo=timezone.utc)
+    tracker = VisibilityChangeTracker(rest, checkpoint, start=start, batch_size=2)
+
+    batches = [batch async for batch in tracker.poll()]
+
+    rest.stream_visibility_changes.assert_called_once_with(start)
+    assert [batch.observation_ids for batch in batches] == [
+        frozenset({"o-1"}),
+        frozenset({"o-3"}),
+    ]
+    assert rest.invalidate_atom_digests.call_count == 2
+    expected = datetime(2026, 7, 15, 11, 30, tzinfo=timezone.utc)
+    assert tracker.cursor == expected
+    assert json.loads(checkpoint.read_text()) == {
+        "since": expected.isoformat(),
+        "delivered": ["t-2"],
+    }
+    assert VisibilityChangeTracker(rest, checkpoint).cursor == expected
+
+
+@pytest.mark.asyncio
+async def test_poll_abandoned_early_keeps_cursor(mocker, checkpoint) -> None:
+    """
+    Ensure the cursor does not move unless the whole response was consumed.
+    """
+    rest = mocker.Mock()
+    rest.stream_visibility_changes = mocker.Mock(
+        side_effect=_stream(
+            "o-1\t2026-07-15T10:00:00Z",
+            "o-2\t2026-07-15T11:00:00Z",
+        )
+    )
+    start = datetime(2026, 7, 15, 9, 0, tzinfo=timezone.utc)
+    tracker = VisibilityChangeTracker(rest, checkpoint, start=start, batch_size=1)
+
+    poll = tracker.poll()
+    await anext(poll)
+    await poll.aclose()
+
+    assert tracker.cursor == start
+    assert not checkpoint.exists()
+
+
+@pytest.mark.asyncio
+async def test_poll_without_changes_keeps_cursor(mocker, checkpoint) -> None:
+    """
+    Ensure an empty response leaves the cursor unchanged.
+    """
+    rest = mocker.Mock()
+    rest.stream_visibility_changes = mocker.Mock(side_effect=_stream())
+    start = datetime(2026, 7, 15, 9, 0, tzinfo=timezone.utc)
+    tracker = VisibilityChangeTracker(rest, checkpoint, start=start)
+
+    assert [batch async for batch in tracker.poll()] == []
+    assert tracker.cursor == start
+
+
+@pytest.mark.asyncio
+async def test_poll_skips_changes_delivered_at_cursor(mocker, checkpoint) -> None:
+    """
+    Ensure changes at the cursor are delivered once and later ones still arrive.
+    """
+    rest = mocker.Mock()
+    rest.stream_visibility_changes = mocker.Mock(
+        side_effect=[
+            _stream("o-1\t2026-07-15T10:00:00Z", "o-2\t2026-07-15T10:00:00Z")(None),
+            # The endpoint reports changes at the cursor again, plus a new one
+            # stamped at the same time.
+            _stream(
+                "o-1\t2026-07-15T10:00:00Z",
+                "o-2\t2026-07-15T10:00:00Z",
+                "t-3\t2026-07-15T10:00:00Z",
+            )(None),
+            _stream("o-1\t2026-07-15T10:00:00Z", "t-3\t2026-07-15T10:00:00Z")(None),
+            _stream("o-1\t2026-07-15T10:00:00Z", "o-4\t2026-07-15T10:05:00Z")(None),
+        ]
+    )
+    tracker = VisibilityChangeTracker(
+        rest, checkpoint, start=datetime(2026, 7, 15, 9, 0)
+    )
+
+    polls = [[batch async for batch in tracker.poll()] for _ in range(3)]
+    resumed = VisibilityChangeTracker(rest, checkpoint)
+    last = [batch async for batch in resumed.poll()]
+
+    assert polls[0][0].observation_ids == frozenset({"o-1", "o-2"})
+    assert polls[1][0].target_ids == frozenset({"t-3"})
+    assert polls[1][0].observation_ids == frozenset()
+    assert polls[2] == []
+    assert [batch.observation_ids for batch in last] == [frozenset({"o-4"})]
+    assert json.loads(checkpoint.read_text()) == {
+        "since": "2026-07-15T10:05:00+00:00",
+        "delivered": ["o-4"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_watch_sleeps_between_polls(mocker, checkpoint) -> None:
+    """
+    Ensure watch polls repeatedly with the configured interval.
+    """
+    rest = mocker.Mock()
+    rest.stream_visibility_changes = mocker.Mock(
+        side_effect=[
+            _stream("o-1\t2026-07-15T10:00:00Z")(None),
+            _stream("o-2\t2026-07-15T11:00:00Z")(None),
+        ]
+    )
+    sleep = mocker.patch("gpp_client.rest.tracker.asyncio.sleep")
+    tracker = VisibilityChangeTracker(
+        rest, checkpoint, interval=5.0, start=datetime(2026, 7, 15, 9, 0)
+    )
+
+    watch = tracker.watch()
+    first = await anext(watch)
+    second = await anext(watch)
+    await watch.aclose()
+
+    assert first.observation_ids == frozenset({"o-1"})
+    assert second.observation_ids == frozenset({"o-2"})
+    sleep.assert_awaited_once_with(5.0)
+
+
+def test_rejects_invalid_interval(mocker, checkpoint) -> None:
+    """
+    Ensure a non-positive polling interval is rejected.
+    """
+    with pytest.raises(ValueError, match="interval"):
+        VisibilityChangeTracker(mocker.Mock(), checkpoint, interval=0)
@@ -0,0 +1,97 @@
+"""
+Tests for the streaming transfer helpers.
+"""
+
+import asyncio
+import threading
+from pathlib import Path
+
+import pytest
+
+from gpp_client.rest.transfer import AsyncFileWriter, iter_file
+
+
+@pytest.mark.asyncio
+async def test_iter_file_reads_chunks_with_progress(tmp_path: Path) -> None:
+    """
+    Ensure files are read in chunks and progress is reported per chunk.
+    """
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"abcdefghij")
+    progress = []
+
+    chunks = [
+        chunk
+        async for chunk in iter_file(
+            path, chunk_size=4, progress=lambda sent, total: progress.append(sent)
+        )
+    ]
+
+    assert chunks == [b"abcd", b"efgh", b"ij"]
+    assert progress == [4, 8, 10]
+
+
+@pytest.mark.asyncio
+async def test_async_file_writer_writes_off_the_event_loop(
+    tmp_path: Path, mocker
+) -> None:
+    """
+    Ensure chunks are written in order from a thread other than the loop's.
+    """
+    path = tmp_path / "out.bin"
+    loop_thread = threading.get_ident()
+    write_threads = []
+
+    async with AsyncFileWriter(path, max_pending=2) as writer:
+        original_write = writer._fh.write
+
+        def write(data):
+            write_threads.append(threading.get_ident())
+            return original_write(data)
+
+        mocker.patch.object(writer._fh, "write", side_effect=write)
+        for chunk in (b"one ", b"two ", b"three"):
+            await writer.write(chunk)
+
+    assert path.read_bytes() == b"one two three"
+    assert writer.bytes_written == 13
+    assert write_threads and loop_thread not in write_threads
+
+
+@pytest.mark.asyncio
+async def test_async_file_writer_appends(tmp_path: Path) -> None:
+    """
+    Ensure append mode keeps existing content.
+    """
+    path = tmp_path / "out.bin"
+    path.write_bytes(b"head-")
+
+    async with AsyncFileWriter(path, "ab") as writer:
+        await writer.write(b"tail")
+
+    assert path.read_bytes() == b"head-tail"
+
+
+@pytest.mark.asyncio
+async def test_async_file_writer_surfaces_write_errors(tmp_path: Path, mocker) -> None:
+    """
+    Ensure a failed write is raised without blocking the producer.
+    """
+    path = tmp_path / "out.bin"
+
+    with pytest.raises(OSError, match="disk full"):
+        async with AsyncFileWriter(path, max_pending=1) as writer:
+            mocker.patch.object(writer._fh, "write", side_effect=OSError("disk full"))
+            for _ in range(5):
+                await writer.write(b"x")
+                await asyncio.sleep(0.01)
+
+
+def test_async_file_writer_validates_arguments(tmp_path: Path) -> None:
+    """
+    Ensure the mode and queue size are validated.
+    """
+    with pytest.raises(ValueError):
+        AsyncFileWriter(tmp_path / "x", "w")
+    with pytest.raises(ValueError):
+        AsyncFileWriter(tmp_path / "x", max_pending=0)
@@ -0,0 +1,94 @@
+"""Tests for the synthetic catalog generator."""
+
+import pytest
+
+from gpp_client import GPPClient
+from gpp_client.generated import GetObservations, GetSchedulerPrograms
+from gpp_client.rest.models import parse_visibility_changes
+from gpp_client.testing import StubGPPServer, generate_catalog
+
+
+def test_catalog_validates_against_generated_models() -> None:
+    """
+    Ensure programs and observations are schema-valid and cover every mode.
+    """
+    catalog = generate_catalog(programs=2, observations_per_program=11)
+
+    programs = GetSchedulerPrograms.model_validate(
+        {"programs": {"matches": catalog.programs}}
+    )
+    observations = GetObservations.model_validate(
+        {
+            "observations": {
+                "hasMore": False,
+                "matches": list(catalog.observations.values()),
+            }
+        }
+    )
+
+    assert catalog.program_ids == ["p-0", "p-1"]
+    assert len(programs.programs.matches[0].all_group_elements) == 2 + 4 + 8 + 11
+    modes = {obs.observing_mode.mode for obs in observations.observations.matches}
+    assert len(modes) == 11
+    assert len(catalog.targets) == len(catalog.atom_digests) == 22
+
+
+def test_catalog_is_deterministic_and_scaled() -> None:
+    """
+    Ensure equal seeds give equal catalogs and the options shape the data.
+    """
+    options = {
+        "programs": 3,
+        "observations_per_program": 10,
+        "group_depth": 0,
+        "atoms_per_observation": 4,
+        "changed_fraction": 0.5,
+    }
+
+    catalog = generate_catalog(**options)
+
+    assert catalog == generate_catalog(**options)
+    assert catalog != generate_catalog(**options, seed=1)
+    elements = catalog.programs[0]["allGroupElements"]
+    assert all(element["parentGroupId"] is None for element in elements)
+    assert all(len(rows) == 4 for rows in catalog.atom_digests.values())
+    changes = parse_visibility_changes(catalog.visibility_changes)
+    assert len(changes.observation_ids) + len(changes.target_ids) == 30
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"programs": -1}, {"group_fanout": 0}, {"changed_fraction": 1.5}],
+)
+def test_catalog_rejects_invalid_options(options) -> None:
+    """
+    Ensure impossible catalog shapes are refused.
+    """
+    with pytest.raises(ValueError):
+        generate_catalog(**options)
+
+
+@pytest.mark.asyncio
+async def test_serve_answers_get_all() -> None:
+    """
+    Ensure ``get_all`` runs end to end against a served catalog.
+    """
+    catalog = generate_catalog(programs=2, observations_per_program=5, group_depth=2)
+
+    async with StubGPPServer() as server:
+        catalog.serve(server)
+        async with GPPClient(token="stub", base_url=server.base_url) as client:
+            programs = await client.scheduler.get_all()
+
+    assert [program["id"] for program in programs] == catalog.program_ids
+    groups = programs[0]["root"]["elements"]
+    leaves = [leaf for group in groups for leaf in group["group"]["elements"]]
+    observations = [
+        element["observation"]
+        for leaf in leaves
+        for element in leaf["group"].get("elements", [])
+    ]
+    assert sorted(obs["id"] for obs in observations) == sorted(
+        obs_id for obs_id in catalog.observations if obs_id < "o-5"
+    )
+    assert all(obs["sequence"] for obs in observations)
@@ -0,0 +1,170 @@
+"""Tests for the schema-backed mock GPP server."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import pytest
+
+from gpp_client import GPPClient
+from gpp_client.generated import GetSchedulerAllProgramsId
+from gpp_client.generated.input_types import ProgramPropertiesInput
+from gpp_client.testing import MockGPPServer, generate_catalog
+
+SCHEMA = Path(__file__).parents[3] / "graphql" / "schemas" / "development.graphql"
+
+
+@asynccontextmanager
+async def _running(
+    server: MockGPPServer,
+) -> AsyncIterator[tuple[MockGPPServer, GPPClient]]:
+    """
+    Run a mock server and a client pointed at it.
+    """
+    async with server:
+        async with GPPClient(token="mock", base_url=server.base_url) as client:
+            yield server, client
+
+
+@pytest.mark.asyncio
+async def test_get_all_executes_against_catalog() -> None:
+    """
+    Ensure the scheduler's queries are executed over the catalog's records.
+    """
+    catalog = generate_catalog(programs=2, observations_per_program=4, group_depth=1)
+
+    async with _running(MockGPPServer(SCHEMA, catalog=catalog)) as (server, client):
+        programs = await client.scheduler.get_all()
+
+    assert [program["id"] for program in programs] == catalog.program_ids
+    assert server.requests["graphql"] == 3
+
+
+@pytest.mark.asyncio
+async def test_list_summaries_select_slim_fields() -> None:
+    """
+    Ensure the summary queries validate against the schema and the catalog.
+    """
+    catalog = generate_catalog(programs=1, observations_per_program=3)
+
+    async with _running(MockGPPServer(SCHEMA, catalog=catalog)) as (server, client):
+        observations = await client.observation.list_summaries(limit=2)
+        programs = await client.program.list_summaries()
+
+    assert [obs.id for obs in observations.observations.matches] == ["o-0", "o-1"]
+    assert observations.observations.matches[0].program.id == "p-0"
+    assert programs.programs.matches[0].proposal_status.value == "ACCEPTED"
+
+
+async def _collect(
+    server: MockGPPServer, field: str, events: AsyncIterator, into: list
+) -> asyncio.Task:
+    """
+    Collect subscription events on a task until the server completes them.
+    """
+
+    async def collect() -> None:
+        async for event in events:
+            into.append(event)
+
+    task = asyncio.create_task(collect())
+    while not server._subscribers.get(field):
+        await asyncio.sleep(0.01)
+    return task
+
+
+@pytest.mark.asyncio
+async def test_mutations_update_records_and_publish_edits() -> None:
+    """
+    Ensure created and updated records are stored and their edits streamed.
+    """
+    events = []
+    async with _running(MockGPPServer(SCHEMA)) as (server, client):
+        task = await _collect(
+            server, "programEdit", client.program.subscribe_to_edits(), events
+        )
+        created = await client.program.create(
+            properties=ProgramPropertiesInput(name="First")
+        )
+        program_id = created.create_program.program.id
+        await client.program.update_by_id(
+            program_id, properties=ProgramPropertiesInput(name="Renamed")
+        )
+        fetched = await client.program.get_by_id(program_id)
+    await asyncio.wait_for(task, 5)
+
+    assert fetched.program.name == "Renamed"
+    assert server.programs[program_id]["name"] == "Renamed"
+    assert [event.program_edit.edit_type.value for event in events] == [
+        "CREATED",
+        "UPDATED",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_published_obscalc_updates_reach_scheduler() -> None:
+    """
+    Ensure published events are filtered by the subscription's input.
+    """
+    catalog = generate_catalog(programs=1, observations_per_program=2)
+    obs_id = next(iter(catalog.observations))
+
+    events = []
+    async with _running(MockGPPServer(SCHEMA, catalog=catalog)) as (server, client):
+        task = await _collect(
+            server,
+            "obscalcUpdate",
+            client.scheduler.subscribe_to_calculation_updates(),
+            events,
+        )
+        for state in ("PENDING", "READY"):
+            server.publish(
+                "obscalcUpdate",
+                {
+                    "editType": "UPDATED",
+                    "observationId": obs_id,
+                    "newCalculationState": state,
+                    "value": server.observations[obs_id],
+                },
+            )
+    await asyncio.wait_for(task, 5)
+
+    assert len(events) == 1
+    assert events[0].obscalc_update.new_calculation_state.value == "READY"
+    assert events[0].obscalc_update.value.id == obs_id
+
+
+@pytest.mark.asyncio
+async def test_canned_responses_and_custom_resolvers() -> None:
+    """
+    Ensure canned responses take precedence and resolvers can be replaced.
+    """
+    server = MockGPPServer(
+        SCHEMA,
+        resolvers={
+            "Query.programs": lambda source, info, **arguments: {
+                "matches": [{"id": "p-custom"}],
+                "hasMore": False,
+            }
+        },
+    )
+
+    async with _running(server) as (server, client):
+        ids = await client.scheduler._graphql.get_scheduler_all_programs_id()
+        server.graphql["GetSchedulerAllProgramsId"] = {
+            "programs": {"matches": [{"id": "p-canned", "reference": None}]}
+        }
+        canned = await client.scheduler._graphql.get_scheduler_all_programs_id()
+
+    assert isinstance(ids, GetSchedulerAllProgramsId)
+    assert [match.id for match in ids.programs.matches] == ["p-custom"]
+    assert [match.id for match in canned.programs.matches] == ["p-canned"]
+
+
+def test_unknown_resolver_field_is_rejected() -> None:
+    """
+    Ensure resolvers for fields the schema lacks are refused.
+    """
+    with pytest.raises(ValueError, match="Query.nothing"):
+        MockGPPServer(SCHEMA, resolvers={"Query.nothing": lambda source, info: None})
@@ -0,0 +1,164 @@
+"""Tests for recording GPP traffic to cassettes and replaying it."""
+
+import gzip
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+import aiohttp
+import pytest
+
+from gpp_client import GPPClient
+from gpp_client.generated import GetGOATSObservations, SchedulerObservationsUpdates
+from gpp_client.testing import (
+    Cassette,
+    HTTPExchange,
+    RecordingProxy,
+    ReplayServer,
+    StubGPPServer,
+    WebSocketFrame,
+    WebSocketSession,
+    build_payload,
+)
+
+SINCE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@asynccontextmanager
+async def _recording() -> AsyncIterator[tuple[StubGPPServer, GPPClient, Cassette]]:
+    """
+    Run a client recording its traffic with a stub server through a proxy.
+    """
+    async with StubGPPServer() as server:
+        async with RecordingProxy(server.base_url) as proxy:
+            async with GPPClient(token="secret", base_url=proxy.base_url) as client:
+                yield server, client, proxy.cassette
+
+
+async def _exercise(client: GPPClient) -> tuple:
+    """
+    Run one GraphQL query, one REST call and one subscription.
+    """
+    observations = await client.goats.get_observations_by_program_id(program_id="p-1")
+    changes = await client.rest.get_visibility_changes(SINCE)
+    events = [
+        event async for event in client.scheduler.subscribe_to_calculation_updates()
+    ]
+    return observations, changes, events
+
+
+@pytest.mark.asyncio
+async def test_replay_reproduces_recorded_traffic(tmp_path) -> None:
+    """
+    Ensure a saved recording is served back identically without the service.
+    """
+    path = tmp_path / "session.jsonl.gz"
+    async with _recording() as (server, client, cassette):
+        server.graphql["GetGOATSObservations"] = build_payload(GetGOATSObservations)
+        server.visibility_changes = "o-1\t2026-01-01T00:00:00Z"
+        server.subscriptions["SchedulerObservationsUpdates"] = [
+            build_payload(SchedulerObservationsUpdates) for _ in range(3)
+        ]
+        recorded = await _exercise(client)
+    cassette.save(path)
+
+    assert len(cassette.exchanges) == 2
+    assert len(cassette.sessions) == 1
+    assert b"secret" not in gzip.decompress(path.read_bytes())
+
+    async with ReplayServer(Cassette.load(path), time_scale=0) as replay:
+        async with GPPClient(token="other", base_url=replay.base_url) as client:
+            assert await _exercise(client) == recorded
+    assert replay.misses == []
+
+
+@pytest.mark.asyncio
+async def test_replay_is_byte_exact_and_repeats_last_response() -> None:
+    """
+    Ensure recorded bodies and headers are served unchanged, in order.
+    """
+    compressed = gzip.compress(b"o-1\t2026-01-01T00:00:00Z")
+    cassette = Cassette(
+        exchanges=[
+            HTTPExchange("GET", "/data?x=1", b"", 200, body=b"first"),
+            HTTPExchange(
+                "GET",
+                "/data?x=1",
+                b"",
+                200,
+                headers=(("Content-Encoding", "gzip"),),
+                body=compressed,
+            ),
+        ]
+    )
+
+    async with ReplayServer(cassette, time_scale=0) as replay:
+        async with aiohttp.ClientSession(auto_decompress=False) as session:
+            bodies = []
+            for _ in range(3):
+                async with session.get(f"{replay.base_url}/data?x=1") as response:
+                    bodies.append(await response.read())
+            async with session.get(f"{replay.base_url}/data?x=2") as response:
+                assert response.status == 404
+
+    assert bodies == [b"first", compressed, compressed]
+    assert replay.misses == ["GET /data?x=2"]
+
+
+@pytest.mark.asyncio
+async def test_replay_scales_websocket_timing() -> None:
+    """
+    Ensure gaps between server messages follow the recording times the scale.
+    """
+    frames = (
+        WebSocketFrame(from_client=True, offset=0.0, data="hello"),
+        WebSocketFrame(from_client=False, offset=0.1, data="one"),
+        WebSocketFrame(from_client=False, offset=0.5, data=b"\x00two"),
+    )
+    cassette = Cassette(sessions=[WebSocketSession("/ws", frames=frames)])
+
+    async def receive(time_scale: float) -> tuple[list, float]:
+        async with ReplayServer(cassette, time_scale=time_scale) as replay:
+            async with aiohttp.ClientSession() as session:
+                async with session.ws_connect(f"{replay.base_url}/ws") as websocket:
+                    started = time.perf_counter()
+                    await websocket.send_str("anything")
+                    messages = [(await websocket.receive()).data for _ in range(2)]
+                    return messages, time.perf_counter() - started
+
+    messages, elapsed = await receive(time_scale=0.2)
+    assert messages == ["one", b"\x00two"]
+    assert 0.1 <= elapsed < 0.5
+
+    _, elapsed = await receive(time_scale=0)
+    assert elapsed < 0.1
+
+
+def test_cassette_round_trips(tmp_path) -> None:
+    """
+    Ensure text and binary content survive saving and loading.
+    """
+    cassette = Cassette(
+        exchanges=[
+            HTTPExchange(
+                "POST", "/odb", b'{"a":1}', 200, (("X", "1"),), b"\xff\x00", 0.25
+            )
+        ],
+        sessions=[
+            WebSocketSession(
+                "/ws",
+                "graphql-transport-ws",
+                (WebSocketFrame(False, 0.5, b"\x01"), WebSocketFrame(True, 1.0, "t")),
+            )
+        ],
+    )
+    cassette.save(tmp_path / "plain.jsonl")
+    cassette.save(tmp_path / "compressed.jsonl.gz")
+
+    assert Cassette.load(tmp_path / "plain.jsonl") == cassette
+    assert Cassette.load(tmp_path / "compressed.jsonl.gz") == cassette
+
+    (tmp_path / "old.jsonl").write_text('{"version": 0}\n')
+    with pytest.raises(ValueError, match="Unsupported cassette version"):
+        Cassette.load(tmp_path / "old.jsonl")
@@ -0,0 +1,212 @@
+"""Tests for the local stub GPP server."""
+
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+import pytest
+
+from gpp_client import GPPClient
+from gpp_client.exceptions import GPPError
+from gpp_client.generated import (
+    AttachmentType,
+    GetGOATSObservations,
+    GetObservations,
+    SchedulerObservationsUpdates,
+)
+from gpp_client.testing import StubGPPServer, build_payload
+from gpp_client.tracing import InMemoryCollector, SpanAttribute
+
+
+@asynccontextmanager
+async def _running() -> AsyncIterator[tuple[StubGPPServer, GPPClient]]:
+    """
+    Run a stub server with a client talking to it.
+    """
+    async with StubGPPServer() as server:
+        async with GPPClient(token="stub", base_url=server.base_url) as client:
+            yield server, client
+
+
+@pytest.mark.parametrize(
+    "model", [GetObservations, GetGOATSObservations, SchedulerObservationsUpdates]
+)
+@pytest.mark.parametrize("fill_optional", [True, False])
+def test_build_payload_validates(model, fill_optional) -> None:
+    """
+    Ensure built payloads validate against the generated models.
+    """
+    payload = build_payload(model, fill_optional=fill_optional, list_size=2)
+
+    assert model.model_validate(payload)
+
+
+def test_build_payload_list_size() -> None:
+    """
+    Ensure list fields get the requested number of items.
+    """
+    payload = build_payload(GetObservations, list_size=3)
+
+    assert len(payload["observations"]["matches"]) == 3
+    assert build_payload(GetObservations, list_size=0)["observations"]["matches"] == []
+
+
+@pytest.mark.asyncio
+async def test_graphql_responses() -> None:
+    """
+    Ensure operations are answered from the canned data, by name.
+    """
+    payload = build_payload(GetGOATSObservations)
+    async with _running() as (server, client):
+        server.graphql["GetGOATSObservations"] = payload
+
+        result = await client.goats.get_observations_by_program_id(program_id="p-1")
+
+        assert result == GetGOATSObservations.model_validate(payload)
+        assert server.requests["graphql"] == 1
+        with pytest.raises(Exception, match="No stub response"):
+            await client.goats.get_programs()
+
+
+@pytest.mark.asyncio
+async def test_graphql_responder_receives_variables() -> None:
+    """
+    Ensure a callable responder is called with the operation variables.
+    """
+    seen = []
+
+    def respond(variables):
+        seen.append(variables)
+        return build_payload(GetGOATSObservations)
+
+    async with _running() as (server, client):
+        server.graphql["GetGOATSObservations"] = respond
+        await client.goats.get_observations_by_program_id(program_id="p-7")
+
+    assert seen == [{"programId": "p-7"}]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_rest_endpoints() -> None:
+    """
+    Ensure atom digests and visibility changes are served.
+    """
+    row = "o-1\t0\ta-1\tSCIENCE\t60\tSCIENCE\tNONE\t0\t1"
+    async with _running() as (server, client):
+        server.atom_digests["o-1"] = [row]
+        server.visibility_changes = "o-1\t2026-01-01T00:00:00Z"
+
+        digests = await client.rest.get_atom_digests(["o-1", "o-2"])
+        changes = await client.scheduler.get_visibility_changes(
+            datetime(2026, 1, 1, tzinfo=timezone.utc)
+        )
+
+    assert digests == row
+    assert changes.observation_ids == {"o-1"}
+
+
+@pytest.mark.asyncio
+async def test_attachments_round_trip(tmp_path) -> None:
+    """
+    Ensure uploads are stored and downloads use cacheable presigned URLs.
+    """
+    source = tmp_path / "spectrum.fits"
+    source.write_bytes(b"fits" * 1000)
+
+    async with _running() as (server, client):
+        attachment_id = await client.attachment.upload(
+            "p-1",
+            attachment_type=AttachmentType.SCIENCE,
+            file_name=source.name,
+            file_path=source,
+        )
+        path = await client.attachment.download_by_id(
+            attachment_id, save_to=tmp_path / "out"
+        )
+        await client.attachment.get_download_url_by_id(attachment_id)
+
+        assert path.name == "spectrum.fits"
+        assert path.read_bytes() == source.read_bytes()
+        assert client.attachment.download_urls.stats.hits == 1
+
+        await client.attachment.delete_by_id(attachment_id)
+        assert attachment_id not in server.attachments
+        with pytest.raises(GPPError):
+            await client.attachment.get_download_url_by_id(
+                attachment_id, use_cache=False
+            )
+
+
+@pytest.mark.asyncio
+async def test_attachment_transfers_report_spans(tmp_path) -> None:
+    """
+    Ensure attachment transfers run in REST spans that count their bytes.
+    """
+    source = tmp_path / "spectrum.fits"
+    source.write_bytes(b"fits" * 1000)
+    collector = InMemoryCollector()
+
+    async with _running() as (server, client):
+        client.tracer.add_hook(collector)
+        attachment_id = await client.attachment.upload(
+            "p-1",
+            attachment_type=AttachmentType.SCIENCE,
+            file_name=source.name,
+            file_path=source,
+        )
+        await client.attachment.download_by_id(attachment_id, save_to=tmp_path / "out")
+        await client.attachment.delete_by_id(attachment_id)
+
+    upload, url, download, delete = collector.spans
+    assert [span.name for span in collector.spans] == [
+        "upload_attachment",
+        "get_attachment_download_url",
+        "download_attachment",
+        "delete_attachment",
+    ]
+    assert {span.kind for span in collector.spans} == {"rest"}
+    assert upload.attributes[SpanAttribute.REQUEST_BYTES] == 4000
+    assert download.attributes[SpanAttribute.RESPONSE_BYTES] == 4000
+    assert download.attributes[SpanAttribute.HTTP_STATUS] == 200
+    assert url.parent_id == download.span_id
+    assert delete.error is None
+
+
+@pytest.mark.asyncio
+async def test_subscription_events() -> None:
+    """
+    Ensure subscription events are streamed and the stream completes.
+    """
+    event = build_payload(SchedulerObservationsUpdates)
+    async with _running() as (server, client):
+        server.subscriptions["SchedulerObservationsUpdates"] = [event, event, event]
+
+        events = [
+            event async for event in client.scheduler.subscribe_to_calculation_updates()
+        ]
+
+        assert len(events) == 3
+        assert server.requests["ws"] == 1
+
+
+@pytest.mark.asyncio
+async def test_injected_latency() -> None:
+    """
+    Ensure responses are delayed by the configured latency.
+    """
+    async with _running() as (server, client):
+        server.route_latency["visibility-changes"] = 0.05
+
+        start = time.perf_counter()
+        await client.rest.get_visibility_changes(datetime(2026, 1, 1))
+
+        assert time.perf_counter() - start >= 0.05
+
+
+def test_base_url_requires_running_server() -> None:
+    """
+    Ensure the URL is only available once the server listens.
+    """
+    with pytest.raises(RuntimeError):
+        StubGPPServer().base_url
@@ -0,0 +1,30 @@
+"""
+Tests for the end-to-end client benchmark script.
+"""
+
+from scripts.benchmark_client import SCENARIOS, benchmark, compare
+
+
+def test_benchmark_runs_every_scenario() -> None:
+    """
+    Ensure each scenario runs against the stub server and is timed.
+    """
+    results = benchmark(scale=0.01, repeat=1)
+
+    assert set(results) == set(SCENARIOS)
+    for result in results.values():
+        assert result["median_s"] >= result["min_s"] >= 0
+
+
+def test_compare_reports_regressions_beyond_tolerance() -> None:
+    """
+    Ensure only scenarios slower than the tolerance allows are reported.
+    """
+    baseline = {"a": {"median_s": 1.0}, "b": {"median_s": 1.0}}
+    results = {
+        "a": {"median_s": 1.2},
+        "b": {"median_s": 1.5},
+        "new": {"median_s": 9.0},
+    }
+
+    assert compare(results, baseline, tolerance=0.25) == {"b": 1.5}
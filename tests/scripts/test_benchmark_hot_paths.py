@@ -0,0 +1,56 @@
+"""
+Tests for the hot path microbenchmark script.
+"""
+
+import json
+
+from scripts.benchmark_hot_paths import (
+    BENCHMARKS,
+    THRESHOLDS_PATH,
+    benchmark,
+    check,
+)
+
+
+def test_benchmark_runs_every_hot_path() -> None:
+    """
+    Ensure each hot path is timed at every size.
+    """
+    results = benchmark(sizes=(200, 20), repeat=1)
+
+    assert set(results) == set(BENCHMARKS)
+    for result in results.values():
+        assert list(result["seconds"]) == ["20", "200"]
+        assert result["us_per_item"] >= 0
+        assert isinstance(result["exponent"], float)
+
+
+def test_thresholds_cover_every_hot_path() -> None:
+    """
+    Ensure the checked-in thresholds bound each benchmark.
+    """
+    thresholds = json.loads(THRESHOLDS_PATH.read_text())
+
+    assert set(thresholds) == set(BENCHMARKS)
+    for limits in thresholds.values():
+        assert set(limits) == {"max_exponent", "max_us_per_item"}
+
+
+def test_check_reports_exceeded_thresholds() -> None:
+    """
+    Ensure only limits that are set and exceeded are reported.
+    """
+    results = {
+        "fast": {"exponent": 1.0, "us_per_item": 1.0},
+        "quadratic": {"exponent": 2.0, "us_per_item": 1.0},
+        "slow": {"exponent": 1.0, "us_per_item": 9.0},
+        "unbounded": {"exponent": 3.0, "us_per_item": 99.0},
+    }
+    limits = {"max_exponent": 1.3, "max_us_per_item": 2.0}
+    thresholds = {"fast": limits, "quadratic": limits, "slow": limits}
+
+    failures = check(results, thresholds)
+
+    assert len(failures) == 2
+    assert failures[0].startswith("quadratic: scales with exponent 2.0")
+    assert failures[1].startswith("slow: 9.0 us per item")
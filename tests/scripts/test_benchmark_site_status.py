@@ -0,0 +1,18 @@
+"""
+Tests for the site status parser benchmark script.
+"""
+
+from scripts.benchmark_site_status import benchmark
+
+
+def test_benchmark_reports_every_recorded_page() -> None:
+    """
+    Ensure every recorded page is timed and both parsers agree on it.
+    """
+    results = benchmark(number=1)
+
+    assert set(results) == {"north_status.html", "gmos_config.html"}
+    for result in results.values():
+        assert result["same_result"] is True
+        assert result["scanner_us"] > 0
+        assert result["soup_us"] > 0
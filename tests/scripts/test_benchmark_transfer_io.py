@@ -0,0 +1,23 @@
+"""
+Tests for the transfer I/O benchmark script.
+"""
+
+from scripts.benchmark_transfer_io import benchmark
+
+
+def test_benchmark_reports_every_strategy() -> None:
+    """
+    Ensure writes and metadata checks are measured both ways.
+    """
+    results = benchmark(
+        megabytes=1, chunk_kb=256, write_latency=0.0, checks=2, stat_latency=0.0
+    )
+
+    assert set(results) == {
+        "blocking",
+        "threaded",
+        "blocking_checks",
+        "threaded_checks",
+    }
+    for result in results.values():
+        assert set(result) == {"elapsed_s", "max_lag_ms", "p95_lag_ms"}
@@ -2,7 +2,9 @@
 Tests for the codegen runner script.
 """
 
+import importlib
 import subprocess
+import sys
 from subprocess import CompletedProcess
 
 import pytest
@@ -20,13 +22,19 @@ from scripts.run_codegen import (
     _get_target_package_dir,
     _inject_dev_only_fragments,
     _iter_graphql_files,
+    _lazy_loading_enabled,
     _load_codegen_config,
+    _operation_domains,
     _parse_graphql_file,
     _remove_dir,
     _run,
     _run_codegen,
+    _split_client,
+    _structs_enabled,
     _validate_development_only_is_additive,
+    _write_lazy_init,
     _write_package_environment,
+    _write_struct_package,
 )
 
 
@@ -465,6 +473,235 @@ def test_write_package_environment_raises_for_missing_dir(paths):
         _write_package_environment(package_dir, GPPEnvironment.DEVELOPMENT)
 
 
+@pytest.mark.parametrize(
+    ("config", "expected"),
+    [
+        ({}, False),
+        ({"tool": {"gpp-codegen": {"msgspec_structs": False}}}, False),
+        ({"tool": {"gpp-codegen": {"msgspec_structs": True}}}, True),
+    ],
+)
+def test_structs_enabled(config, expected):
+    """
+    The msgspec_structs flag enables struct generation.
+    """
+    assert _structs_enabled(config) is expected
+
+
+_GENERATED_MODULES = {
+    "__init__.py": "",
+    "async_base_client.py": (
+        "from gpp_client.generated.async_base_client import AsyncBaseClient\n"
+    ),
+    "base_model.py": "from pydantic import BaseModel\n",
+    "enums.py": """
+from enum import Enum
+
+
+class EditType(str, Enum):
+    CREATED = "CREATED"
+""",
+    "fragments.py": """
+from typing import Any, Optional
+
+from pydantic import Field
+
+from .base_model import BaseModel
+
+
+class ProgramCore(BaseModel):
+    id: Any
+    name: Optional[str]
+""",
+    "get_edits.py": """
+from typing import Annotated, Any, Literal, Union
+
+from pydantic import Field
+
+from .base_model import BaseModel
+from .enums import EditType
+from .fragments import ProgramCore
+
+
+class GetEdits(BaseModel):
+    edits: list[
+        Annotated[
+            Union["GetEditsEditsProgram", "GetEditsEditsTarget"],
+            Field(discriminator="typename__"),
+        ]
+    ]
+
+
+class GetEditsEditsProgram(ProgramCore):
+    typename__: Literal["Program"] = Field(alias="__typename")
+    edit_type: EditType = Field(alias="editType")
+
+
+class GetEditsEditsTarget(BaseModel):
+    typename__: Literal["Target"] = Field(alias="__typename")
+    id: Any
+""",
+    "client.py": """
+from typing import Any
+
+from .async_base_client import AsyncBaseClient
+from .get_edits import GetEdits
+
+
+def gql(q: str) -> str:
+    return q
+
+
+class GraphQLClient(AsyncBaseClient):
+    async def get_edits(self, **kwargs: Any) -> GetEdits:
+        query = gql(
+            \"\"\"
+            query getEdits {
+              edits {
+                __typename
+              }
+            }
+            \"\"\"
+        )
+        variables: dict[str, object] = {}
+        response = await self.execute(
+            query=query, operation_name="getEdits", variables=variables, **kwargs
+        )
+        data = self.get_data(response)
+        return GetEdits.model_validate(data)
+""",
+}
+
+
+def test_write_struct_package_mirrors_result_models(tmp_path, monkeypatch):
+    """
+    Result models get struct equivalents and a client decoding into them.
+    """
+    pytest.importorskip("msgspec")
+    package_dir = tmp_path / "mini_generated"
+    for name, content in _GENERATED_MODULES.items():
+        _write_file(package_dir / name, content)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    _write_struct_package(package_dir)
+
+    structs = importlib.import_module("mini_generated.structs")
+    client = (package_dir / "structs/client.py").read_text(encoding="utf-8")
+    data = {
+        "edits": [
+            {"__typename": "Program", "id": "p-1", "name": None, "editType": "CREATED"},
+            {"__typename": "Target", "id": "t-1"},
+        ]
+    }
+    result = structs.StructGraphQLClient.convert_struct(None, data, structs.GetEdits)
+    program, target = result.edits
+
+    assert isinstance(program, structs.GetEditsEditsProgram)
+    assert (program.typename__, program.edit_type.value) == ("Program", "CREATED")
+    assert (target.typename__, target.id) == ("Target", "t-1")
+    assert result.model_dump(by_alias=True, mode="json") == data
+    assert "return self.get_struct(response, GetEdits)" in client
+    assert "data = self.get_data(response)" not in client
+
+
+def test_write_struct_package_raises_for_missing_client(tmp_path):
+    """
+    Missing generated client raises.
+    """
+    with pytest.raises(CodegenError, match="Generated client not found"):
+        _write_struct_package(tmp_path)
+
+
+@pytest.mark.parametrize(
+    ("config", "expected"),
+    [
+        ({}, False),
+        ({"tool": {"gpp-codegen": {"lazy_loading": False}}}, False),
+        ({"tool": {"gpp-codegen": {"lazy_loading": True}}}, True),
+    ],
+)
+def test_lazy_loading_enabled(config, expected):
+    """
+    The lazy_loading flag enables the lazy package layout.
+    """
+    assert _lazy_loading_enabled(config) is expected
+
+
+def test_operation_domains_uses_domain_directories(tmp_path):
+    """
+    Operations map to their domain directory, or else to their file.
+    """
+    _write_file(
+        tmp_path / "domains/edits/queries.graphql",
+        "query getEdits { edits { __typename } }\nfragment F on Edit { id }\n",
+    )
+    _write_file(tmp_path / "utils.graphql", "query ping { ping }\n")
+
+    assert _operation_domains(tmp_path) == {"getEdits": "edits", "ping": "utils"}
+
+
+def test_split_client_loads_operations_on_first_use(tmp_path, monkeypatch):
+    """
+    Operations move to domain modules that are imported when first used.
+    """
+    package_dir = tmp_path / "split_generated"
+    for name, content in _GENERATED_MODULES.items():
+        _write_file(package_dir / name, content)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    _split_client(package_dir, {"getEdits": "edits"})
+
+    client = importlib.import_module("split_generated.client")
+    operations = importlib.import_module("split_generated.operations")
+    lazy = vars(client.GraphQLClient)["get_edits"]
+
+    assert isinstance(lazy, operations.LazyOperation)
+    assert lazy.domain == "edits"
+    assert not lazy.subscription
+    assert "split_generated.get_edits" not in sys.modules
+
+    method = client.GraphQLClient.get_edits
+
+    assert vars(client.GraphQLClient)["get_edits"] is method
+    assert method.__module__ == "split_generated.operations.edits"
+    assert "split_generated.get_edits" in sys.modules
+
+
+def test_split_client_raises_for_missing_client(tmp_path):
+    """
+    Missing generated client raises.
+    """
+    with pytest.raises(CodegenError, match="Generated client not found"):
+        _split_client(tmp_path, {})
+
+
+def test_write_lazy_init_imports_names_on_first_access(tmp_path, monkeypatch):
+    """
+    The package exports its names without importing their modules up front.
+    """
+    package_dir = tmp_path / "lazy_generated"
+    for name, content in _GENERATED_MODULES.items():
+        _write_file(package_dir / name, content)
+    _write_file(
+        package_dir / "__init__.py",
+        "from .enums import EditType\n"
+        "from .get_edits import GetEdits\n\n"
+        '__all__ = ["EditType", "GetEdits"]\n',
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    _write_lazy_init(package_dir)
+
+    package = importlib.import_module("lazy_generated")
+
+    assert package.__all__ == ["EditType", "GetEdits"]
+    assert "lazy_generated.get_edits" not in sys.modules
+    assert package.GetEdits.__module__ == "lazy_generated.get_edits"
+    assert "GetEdits" in dir(package)
+    with pytest.raises(AttributeError, match="Missing"):
+        package.Missing
+
+
 def test_run_codegen_calls_subprocess(repo_root, development_config_text, mocker):
     """
     Codegen subprocess is called.